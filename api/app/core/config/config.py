@@ -24,7 +24,7 @@ class FileUploadConfig(BaseSettings):
     model_config = SettingsConfigDict(env_file=f'{base_dir}/files.conf')
 
     max_mega_bytes: int = 50
-    accepted_file_types: List[str] = ['.csv']
+    accepted_file_types: List[str] = ['.csv', '.parquet', '.orc']
 
     @property
     def max_bytes(self):
@@ -60,6 +60,20 @@ class SparkConfig(BaseSettings):
     spark_service_account: str = 'spark'
 
 
+class LocalMetricsConfig(BaseSettings):
+    """Metrics of small csv datasets computed in process instead of by the Spark jobs"""
+
+    model_config = SettingsConfigDict(env_file=f'{base_dir}/local_metrics.conf')
+
+    # datasets smaller than max_kilo_bytes, 0 submits all of them to Spark
+    max_kilo_bytes: int = 1024
+    workers: int = 2
+
+    @property
+    def max_bytes(self):
+        return self.max_kilo_bytes * 1024
+
+
 class HealthCheckFilter(logging.Filter):
     def filter(self, record):
         return record.getMessage().find('/healthcheck') == -1
@@ -138,6 +152,7 @@ class AppConfig(BaseSettings):
     kubernetes_config: KubernetesConfig = KubernetesConfig()
     s3_config: S3Config = S3Config()
     spark_config: SparkConfig = SparkConfig()
+    local_metrics_config: LocalMetricsConfig = LocalMetricsConfig()
 
 
 @lru_cache
@@ -4,12 +4,14 @@ from uuid import UUID
 
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate
+import sqlalchemy
 from sqlalchemy import asc, desc
 from sqlalchemy.future import select as future_select
 
 from app.db.database import Database
 from app.db.tables.current_dataset_table import CurrentDataset
 from app.models.dataset_dto import OrderType
+from app.models.job_status import JobStatus
 
 
 class CurrentDatasetDAO:
@@ -22,6 +24,17 @@ class CurrentDatasetDAO:
             session.flush()
             return current_dataset
 
+    def update_current_dataset_status(
+        self, current_uuid: UUID, status: JobStatus
+    ) -> int:
+        with self.db.begin_session() as session:
+            query = (
+                sqlalchemy.update(CurrentDataset)
+                .where(CurrentDataset.uuid == current_uuid)
+                .values(status=status)
+            )
+            return session.execute(query).rowcount
+
     def get_current_dataset_by_model_uuid(
         self, model_uuid: UUID, current_uuid: UUID
     ) -> Optional[CurrentDataset]:
@@ -4,12 +4,14 @@ from uuid import UUID
 
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate
+import sqlalchemy
 from sqlalchemy import asc, desc
 from sqlalchemy.future import select as future_select
 
 from app.db.database import Database
 from app.db.tables.reference_dataset_table import ReferenceDataset
 from app.models.dataset_dto import OrderType
+from app.models.job_status import JobStatus
 
 
 class ReferenceDatasetDAO:
@@ -24,6 +26,17 @@ class ReferenceDatasetDAO:
             session.flush()
             return reference_dataset
 
+    def update_reference_dataset_status(
+        self, reference_uuid: UUID, status: JobStatus
+    ) -> int:
+        with self.db.begin_session() as session:
+            query = (
+                sqlalchemy.update(ReferenceDataset)
+                .where(ReferenceDataset.uuid == reference_uuid)
+                .values(status=status)
+            )
+            return session.execute(query).rowcount
+
     def get_reference_dataset_by_model_uuid(
         self, model_uuid: UUID
     ) -> Optional[ReferenceDataset]:
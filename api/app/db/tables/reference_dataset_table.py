@@ -4,6 +4,7 @@ from sqlalchemy import TIMESTAMP, UUID, VARCHAR, Column, ForeignKey
 
 from app.db.dao.base_dao import BaseDAO
 from app.db.database import BaseTable, Reflected
+from app.models.dataset_format import DatasetFormat
 from app.models.job_status import JobStatus
 
 
@@ -24,3 +25,11 @@ class ReferenceDataset(Reflected, BaseTable, BaseDAO):
     path = Column('PATH', VARCHAR, nullable=False)
     date = Column('DATE', TIMESTAMP(timezone=True), nullable=False)
     status = Column('STATUS', VARCHAR, nullable=False, default=JobStatus.IMPORTING)
+    # persisted because a bound file can have no extension to detect it from
+    format = Column(
+        'FORMAT',
+        VARCHAR,
+        nullable=False,
+        default=DatasetFormat.CSV,
+        server_default=DatasetFormat.CSV.value,
+    )
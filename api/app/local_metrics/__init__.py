@@ -0,0 +1,4 @@
+from app.local_metrics.dataset import LocalDataset
+from app.local_metrics.jobs import compute_current_metrics, compute_reference_metrics
+
+__all__ = ['LocalDataset', 'compute_current_metrics', 'compute_reference_metrics']
@@ -0,0 +1,589 @@
+import math
+import struct
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# Aggregations of the Spark jobs, computed with the same operations in the same order,
+# so that the local metrics are rounded as the results of the jobs. Datasets of the
+# local metrics are small, read by Spark in a single partition in the order of the file.
+
+# relative error of percentile_approx with its default accuracy
+PERCENTILE_APPROX_ERROR = 1 / 10_000
+# size of the buffer and compression threshold of QuantileSummaries
+QUANTILE_HEAD_SIZE = 50_000
+QUANTILE_COMPRESS_THRESHOLD = 10_000
+XXHASH_SEED = 42
+MURMUR3_SEED = 42
+# partitions of the shuffles, spark.sql.shuffle.partitions
+SHUFFLE_PARTITIONS = 200
+PG_SUM_RELATIVE_ERROR = 1.0e-10
+PG_MAXIMUM_PARTIAL_SUM_COUNT = 100_000
+KS_ROUNDED_MAX_SIZE = 140
+MATRIX_DENSE_MAX_SIZE = 4096
+MATRIX_BLOCK_SIZE = 52
+
+_MASK = (1 << 64) - 1
+_MASK32 = (1 << 32) - 1
+_MURMUR3_C1 = 0xCC9E2D51
+_MURMUR3_C2 = 0x1B873593
+_PRIME64_1 = 0x9E3779B185EBCA87
+_PRIME64_2 = 0xC2B2AE3D27D4EB4F
+_PRIME64_3 = 0x165667B19E3779F9
+_PRIME64_4 = 0x85EBCA77C2B2AE63
+_PRIME64_5 = 0x27D4EB2F165667C5
+
+
+def spark_sum(values: np.ndarray) -> float:
+    """Sum the values one after the other, as the Sum of Spark, 0 without values."""
+    if len(values) == 0:
+        return 0.0
+    return float(np.add.accumulate(np.asarray(values, dtype=float))[-1])
+
+
+def spark_mean(values: np.ndarray) -> float:
+    """Average of the values as the Spark avg, NaN without values."""
+    return spark_sum(values) / len(values) if len(values) else float('nan')
+
+
+def spark_stddev(values: np.ndarray) -> float:
+    """Sample standard deviation with the online update of the Spark stddev.
+
+    NaN with less than two values, where Spark returns null.
+    """
+    n, avg, m2 = 0.0, 0.0, 0.0
+    for value in np.asarray(values, dtype=float).tolist():
+        n += 1.0
+        delta = value - avg
+        delta_n = delta / n
+        avg += delta_n
+        m2 += delta * (delta - delta_n)
+    return math.sqrt(m2 / (n - 1.0)) if n > 1 else float('nan')
+
+
+def spark_percentile(values: np.ndarray, percentage: float) -> float:
+    """Exact percentile as the Spark percentile, interpolated between two values."""
+    if len(values) == 0:
+        return float('nan')
+    sorted_values = np.sort(np.asarray(values, dtype=float))
+    position = (len(sorted_values) - 1) * percentage
+    lower, higher = math.floor(position), math.ceil(position)
+    lower_value = float(sorted_values[lower])
+    higher_value = float(sorted_values[higher])
+    if higher == lower or higher_value == lower_value:
+        return lower_value
+    return (higher - position) * lower_value + (position - lower) * higher_value
+
+
+def _from_bits(bits: int) -> float:
+    return struct.unpack('<d', struct.pack('<Q', bits))[0]
+
+
+def _to_bits(value: float) -> int:
+    return struct.unpack('<Q', struct.pack('<d', value))[0]
+
+
+_LN2_HI = _from_bits(0x3FE62E42FEE00000)
+_LN2_LO = _from_bits(0x3DEA39EF35793C76)
+_TWO54 = _from_bits(0x4350000000000000)
+_LG = [
+    _from_bits(bits)
+    for bits in (
+        0x3FE5555555555593,
+        0x3FD999999997FA04,
+        0x3FD2492494229359,
+        0x3FCC71C51D8E78AF,
+        0x3FC7466496CB03DE,
+        0x3FC39A09D078C69F,
+        0x3FC2F112DF3E5244,
+    )
+]
+
+
+def strict_log(x: float) -> float:
+    """Natural logarithm of fdlibm, as StrictMath.log of the Spark log function.
+
+    The logarithm of the C library differs in the last bit for some values.
+    """
+    if math.isnan(x) or x < 0:
+        return float('nan')
+    if x == 0:
+        return -math.inf
+    if math.isinf(x):
+        return x
+    k = 0
+    hx = _to_bits(x) >> 32
+    if hx < 0x00100000:
+        # subnormal number, scaled up
+        k -= 54
+        x *= _TWO54
+        hx = _to_bits(x) >> 32
+    k += (hx >> 20) - 1023
+    hx &= 0x000FFFFF
+    i = (hx + 0x95F64) & 0x100000
+    # x normalized in [sqrt(2)/2, sqrt(2)]
+    x = _from_bits(((hx | (i ^ 0x3FF00000)) << 32) | (_to_bits(x) & _MASK32))
+    k += i >> 20
+    f = x - 1.0
+    dk = float(k)
+    if (0x000FFFFF & (2 + hx)) < 3:
+        # |f| < 2**-20
+        if f == 0.0:
+            return 0.0 if k == 0 else dk * _LN2_HI + dk * _LN2_LO
+        r = f * f * (0.5 - 0.33333333333333333 * f)
+        return f - r if k == 0 else dk * _LN2_HI - ((r - dk * _LN2_LO) - f)
+    s = f / (2.0 + f)
+    z = s * s
+    w = z * z
+    t1 = w * (_LG[1] + w * (_LG[3] + w * _LG[5]))
+    t2 = z * (_LG[0] + w * (_LG[2] + w * (_LG[4] + w * _LG[6])))
+    r = t2 + t1
+    if ((hx - 0x6147A) | (0x6B851 - hx)) > 0:
+        hfsq = 0.5 * f * f
+        if k == 0:
+            return f - (hfsq - s * (hfsq + r))
+        return dk * _LN2_HI - ((hfsq - (s * (hfsq + r) + dk * _LN2_LO)) - f)
+    if k == 0:
+        return f - s * (f - r)
+    return dk * _LN2_HI - ((s * (f - r) - dk * _LN2_LO) - f)
+
+
+class _Stats(NamedTuple):
+    value: float
+    g: int
+    delta: int
+
+
+class QuantileSummaries:
+    """Greenwald-Khanna summary of the values, as the one of Spark.
+
+    It gives the same quantiles of approxQuantile and percentile_approx of the jobs.
+    """
+
+    def __init__(self, relative_error: float) -> None:
+        self.relative_error = relative_error
+        self.sampled: List[_Stats] = []
+        self.count = 0
+        self.head: List[float] = []
+
+    def insert(self, value: float) -> None:
+        self.head.append(value)
+        if len(self.head) >= QUANTILE_HEAD_SIZE:
+            self.__insert_head()
+            if len(self.sampled) >= QUANTILE_COMPRESS_THRESHOLD:
+                self.compress()
+
+    def __insert_head(self) -> None:
+        if not self.head:
+            return
+        # NaN are sorted after the other values, as in Java
+        values = np.sort(np.asarray(self.head, dtype=float)).tolist()
+        samples: List[_Stats] = []
+        i = 0
+        for j, value in enumerate(values):
+            while i < len(self.sampled) and self.sampled[i].value <= value:
+                samples.append(self.sampled[i])
+                i += 1
+            self.count += 1
+            # first and last values are exact
+            if not samples or (i == len(self.sampled) and j == len(values) - 1):
+                delta = 0
+            else:
+                delta = math.floor(2 * self.relative_error * self.count)
+            samples.append(_Stats(value, 1, delta))
+        samples.extend(self.sampled[i:])
+        self.sampled = samples
+        self.head = []
+
+    def compress(self) -> None:
+        self.__insert_head()
+        if not self.sampled:
+            return
+        threshold = 2 * self.relative_error * self.count
+        compressed: List[_Stats] = []
+        head = self.sampled[-1]
+        # first and last samples are never merged
+        for sample in reversed(self.sampled[1:-1]):
+            if sample.g + head.g + head.delta < threshold:
+                head = head._replace(g=head.g + sample.g)
+            else:
+                compressed.append(head)
+                head = sample
+        compressed.append(head)
+        first = self.sampled[0]
+        if first.value <= head.value and len(self.sampled) > 1:
+            compressed.append(first)
+        self.sampled = compressed[::-1]
+
+    def query(self, probabilities: Sequence[float]) -> Optional[List[float]]:
+        """Quantiles of the given probabilities of a compressed summary, None if empty."""
+        if not self.sampled:
+            return None
+        target_error = max(s.delta + s.g for s in self.sampled) // 2
+        result = [0.0] * len(probabilities)
+        # minimum rank of the sample at index, that counts the sample itself
+        index, min_rank = 0, self.sampled[0].g
+        for probability, position in sorted(
+            (p, i) for i, p in enumerate(probabilities)
+        ):
+            if probability <= self.relative_error:
+                result[position] = self.sampled[0].value
+            elif probability >= 1 - self.relative_error:
+                result[position] = self.sampled[-1].value
+            else:
+                rank = math.ceil(probability * self.count)
+                index, min_rank, result[position] = self.__find(
+                    index, min_rank, target_error, rank
+                )
+        return result
+
+    def __find(self, index: int, min_rank: int, target_error: int, rank: int):
+        while index < len(self.sampled) - 1:
+            sample = self.sampled[index]
+            if (
+                min_rank + sample.delta - target_error <= rank
+                and rank <= min_rank + target_error
+            ):
+                return index, min_rank, sample.value
+            index += 1
+            min_rank += self.sampled[index].g
+        return len(self.sampled) - 1, 0, self.sampled[-1].value
+
+
+def approx_quantiles(
+    values: np.ndarray, probabilities: Sequence[float], relative_error: float
+) -> List[float]:
+    """Quantiles of the not NaN values as the Spark approxQuantile, empty without values."""
+    summaries = QuantileSummaries(relative_error)
+    for value in np.asarray(values, dtype=float).tolist():
+        if not math.isnan(value):
+            summaries.insert(value)
+    summaries.compress()
+    return summaries.query(probabilities) or []
+
+
+def percentile_approx(
+    values: np.ndarray,
+    probabilities: Sequence[float],
+    relative_error: float = PERCENTILE_APPROX_ERROR,
+) -> List[float]:
+    """Quantiles of the values as the Spark percentile_approx, that keeps NaN."""
+    summaries = QuantileSummaries(relative_error)
+    for value in np.asarray(values, dtype=float).tolist():
+        summaries.insert(value)
+    summaries.compress()
+    return summaries.query(probabilities) or []
+
+
+def _rotate_left(value: int, bits: int) -> int:
+    return ((value << bits) | (value >> (64 - bits))) & _MASK
+
+
+def _fmix(value: int) -> int:
+    value ^= value >> 33
+    value = (value * _PRIME64_2) & _MASK
+    value ^= value >> 29
+    value = (value * _PRIME64_3) & _MASK
+    return value ^ (value >> 32)
+
+
+def _hash_int(value: int, seed: int) -> int:
+    result = (seed + _PRIME64_5 + 4) & _MASK
+    result ^= ((value & _MASK32) * _PRIME64_1) & _MASK
+    result = (_rotate_left(result, 23) * _PRIME64_2 + _PRIME64_3) & _MASK
+    return _fmix(result)
+
+
+def _hash_long(value: int, seed: int) -> int:
+    result = (seed + _PRIME64_5 + 8) & _MASK
+    result ^= (_rotate_left((value * _PRIME64_2) & _MASK, 31) * _PRIME64_1) & _MASK
+    result = (_rotate_left(result, 27) * _PRIME64_1 + _PRIME64_4) & _MASK
+    return _fmix(result)
+
+
+def xxhash64(*values: Optional[int | float]) -> int:
+    """Hash of the values as the Spark xxhash64, ints hashed as int and floats as double.
+
+    Null values are skipped, -0.0 is hashed as 0.0 and NaN values as the same NaN.
+    """
+    seed = XXHASH_SEED
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, float):
+            value = 0.0 if value == 0 else value
+            bits = int(np.array([value], dtype=float).view(np.int64)[0])
+            if math.isnan(value):
+                bits = 0x7FF8000000000000
+            seed = _hash_long(bits, seed)
+        else:
+            seed = _hash_int(int(value), seed)
+    # signed as the long of the JVM
+    return seed - (1 << 64) if seed >= 1 << 63 else seed
+
+
+def _int32(value: int) -> int:
+    value &= _MASK32
+    return value - (1 << 32) if value >= 1 << 31 else value
+
+
+def _rotate_left32(value: int, bits: int) -> int:
+    return ((value << bits) | (value >> (32 - bits))) & _MASK32
+
+
+def _murmur3_mix_k1(k1: int) -> int:
+    return (_rotate_left32((k1 * _MURMUR3_C1) & _MASK32, 15) * _MURMUR3_C2) & _MASK32
+
+
+def _murmur3_mix_h1(h1: int, k1: int) -> int:
+    return (_rotate_left32(h1 ^ k1, 13) * 5 + 0xE6546B64) & _MASK32
+
+
+def _murmur3_bytes(data: bytes, seed: int) -> int:
+    # hashUnsafeBytes of Spark, that mixes the trailing bytes one at a time
+    h1 = seed & _MASK32
+    aligned = len(data) - len(data) % 4
+    for i in range(0, aligned, 4):
+        h1 = _murmur3_mix_h1(
+            h1, _murmur3_mix_k1(int.from_bytes(data[i : i + 4], 'little'))
+        )
+    for byte in data[aligned:]:
+        h1 = _murmur3_mix_h1(
+            h1, _murmur3_mix_k1((byte - 256 if byte >= 128 else byte) & _MASK32)
+        )
+    h1 ^= len(data)
+    h1 ^= h1 >> 16
+    h1 = (h1 * 0x85EBCA6B) & _MASK32
+    h1 ^= h1 >> 13
+    h1 = (h1 * 0xC2B2AE35) & _MASK32
+    h1 ^= h1 >> 16
+    return _int32(h1)
+
+
+def murmur3_hash(*values: str) -> int:
+    """Murmur3 hash of the strings as the Spark hash function, a signed int."""
+    result = MURMUR3_SEED
+    for value in values:
+        result = _murmur3_bytes(value.encode('utf-8'), result)
+    return result
+
+
+def shuffle_partition(*values: str) -> int:
+    """Partition of the rows with the given string keys in the shuffles of Spark."""
+    return murmur3_hash(*values) % SHUFFLE_PARTITIONS
+
+
+def _pelz_good(d: float, n: int) -> float:
+    # series of Pelz and Good, the asymptotic distribution of commons-math
+    sqrt_n = math.sqrt(n)
+    z = d * sqrt_n
+    z2 = d * d * n
+    z4 = z2 * z2
+    z6 = z4 * z2
+    z8 = z4 * z4
+    pi2 = math.pi * math.pi
+    pi4 = pi2 * pi2
+    pi6 = pi4 * pi2
+    two_z2 = 2 * z2
+    sqrt_half_pi = math.sqrt(math.pi / 2)
+
+    def series(term, start: int, relative: bool = True) -> float:
+        total = 0.0
+        for k in range(start, PG_MAXIMUM_PARTIAL_SUM_COUNT):
+            increment = term(k)
+            total += increment
+            if (
+                increment <= PG_SUM_RELATIVE_ERROR * total
+                if not relative
+                else abs(increment) < PG_SUM_RELATIVE_ERROR * abs(total)
+            ):
+                break
+        return total
+
+    z2_term = pi2 / (8 * z2)
+    result = (
+        series(
+            lambda k: math.exp(-z2_term * (2 * k - 1) * (2 * k - 1)), 1, relative=False
+        )
+        * math.sqrt(2 * math.pi)
+        / z
+    )
+
+    def half(k: int) -> float:
+        return (k + 0.5) * (k + 0.5)
+
+    result += (
+        series(lambda k: (pi2 * half(k) - z2) * math.exp(-pi2 * half(k) / two_z2), 0)
+        * sqrt_half_pi
+        / (3 * z4 * sqrt_n)
+    )
+
+    z4_term = 2 * z4
+    z6_term = 6 * z6
+    z2_term = 5 * z2
+    total = series(
+        lambda k: (
+            z6_term
+            + z4_term
+            + pi2 * (z4_term - z2_term) * half(k)
+            + pi4 * (1 - two_z2) * half(k) * half(k)
+        )
+        * math.exp(-pi2 * half(k) / two_z2),
+        0,
+    )
+    total2 = series(lambda k: pi2 * (k * k) * math.exp(-pi2 * (k * k) / two_z2), 1)
+    result += (sqrt_half_pi / n) * (
+        total / (36 * z2 * z2 * z2 * z) - total2 / (18 * z2 * z)
+    )
+
+    total = series(
+        lambda k: (
+            pi6 * (half(k) * half(k) * half(k)) * (5 - 30 * z2)
+            + pi4 * (half(k) * half(k)) * (-60 * z2 + 212 * z4)
+            + pi2 * half(k) * (135 * z4 - 96 * z6)
+            - 30 * z6
+            - 90 * z8
+        )
+        * math.exp(-pi2 * half(k) / two_z2),
+        0,
+    )
+    total2 = series(
+        lambda k: (-pi4 * float(k * k * k * k) + 3 * pi2 * (k * k) * z2)
+        * math.exp(-pi2 * (k * k) / two_z2),
+        1,
+    )
+    return result + (sqrt_half_pi / (sqrt_n * n)) * (
+        total / (3240 * z6 * z4) + total2 / (108 * z6)
+    )
+
+
+def _multiply(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # products of RealMatrix, summed in the order of its dense or block implementation
+    size = len(a)
+    result = np.zeros((size, size))
+    if size * size <= MATRIX_DENSE_MAX_SIZE:
+        for i in range(size):
+            result += np.outer(a[:, i], b[i, :])
+        return result
+    for start in range(0, size, MATRIX_BLOCK_SIZE):
+        end = min(start + MATRIX_BLOCK_SIZE, size)
+        block = np.zeros((size, size))
+        i = start
+        while i < end - 3:
+            block += (
+                np.outer(a[:, i], b[i, :])
+                + np.outer(a[:, i + 1], b[i + 1, :])
+                + np.outer(a[:, i + 2], b[i + 2, :])
+                + np.outer(a[:, i + 3], b[i + 3, :])
+            )
+            i += 4
+        while i < end:
+            block += np.outer(a[:, i], b[i, :])
+            i += 1
+        result += block
+    return result
+
+
+def _power(matrix: np.ndarray, exponent: int) -> np.ndarray:
+    # powers of two of the matrix multiplied as RealMatrix.power
+    if exponent == 1:
+        return matrix.copy()
+    bits = bin(exponent - 1)[2:]
+    squares = [matrix]
+    for _ in range(1, len(bits)):
+        squares.append(_multiply(squares[-1], squares[-1]))
+    result = matrix.copy()
+    for i, bit in enumerate(bits):
+        if bit == '1':
+            result = _multiply(result, squares[len(bits) - i - 1])
+    return result
+
+
+def _rounded_k(d: float, n: int) -> float:
+    # distribution of Marsaglia, Tsang and Wang with the rounded matrix of commons-math
+    k = math.ceil(n * d)
+    m = 2 * k - 1
+    h = k - n * d
+    matrix = np.tril(np.ones((m, m)), 1)
+    h_powers = [h]
+    for _ in range(1, m):
+        h_powers.append(h * h_powers[-1])
+    for i in range(m):
+        matrix[i][0] = matrix[i][0] - h_powers[i]
+        matrix[m - 1][i] -= h_powers[m - i - 1]
+    if h > 0.5:
+        matrix[m - 1][0] += math.pow(2 * h - 1, m)
+    for i in range(m):
+        for j in range(i + 1):
+            for g in range(2, i - j + 2):
+                matrix[i][j] /= g
+    p = float(_power(matrix, n)[k - 1][k - 1])
+    for i in range(1, n + 1):
+        p *= i / n
+    return p
+
+
+def ks_p_value(statistic: float, n: int) -> float:
+    """P-value of the one sample KS test of n values, as the Spark KolmogorovSmirnovTest.
+
+    It is 1 - cdf of the statistic, with the approximations of commons-math.
+    """
+    if math.isnan(statistic):
+        return float('nan')
+    n_inv = 1 / n
+    if statistic <= 0.5 * n_inv:
+        cdf = 0.0
+    elif statistic <= n_inv:
+        cdf = 1.0
+        f = 2 * statistic - n_inv
+        for i in range(1, n + 1):
+            cdf *= i * f
+    elif 1 - n_inv <= statistic < 1:
+        cdf = 1 - 2 * math.pow(1 - statistic, n)
+    elif statistic >= 1:
+        cdf = 1.0
+    elif n <= KS_ROUNDED_MAX_SIZE:
+        cdf = _rounded_k(statistic, n)
+    else:
+        cdf = _pelz_good(statistic, n)
+    return 1 - cdf
+
+
+def _scala_hash(value: float) -> int:
+    # ## of a Double, the hash of the Int of whole numbers
+    if value.is_integer() and -(2**31) <= value < 2**31:
+        return int(value)
+    bits = int(np.array([value], dtype=float).view(np.int64)[0]) & _MASK
+    return _int32(bits ^ (bits >> 32))
+
+
+def _mutable_map_bucket(value: float) -> int:
+    # bucket of the key in the 16 buckets of an empty mutable HashMap
+    swapped = _int32(_scala_hash(value) * 0x9E3775CD)
+    swapped = int.from_bytes((swapped & _MASK32).to_bytes(4, 'big'), 'little')
+    swapped = (swapped * 0x9E3775CD) & _MASK32
+    rotated = ((swapped >> 4) | (swapped << 28)) & _MASK32
+    return rotated >> 28
+
+
+def _immutable_map_hash(value: float) -> int:
+    h = _scala_hash(value)
+    h = _int32(h + ~(h << 9))
+    h = h ^ ((h & _MASK32) >> 14)
+    h = _int32(h + (h << 4))
+    return (h ^ ((h & _MASK32) >> 10)) & _MASK32
+
+
+def scala_map_order(keys: Sequence[float]) -> List[float]:
+    """Order of the keys of a Map[Double, Double] of Spark, as its sums are computed.
+
+    Maps of MulticlassMetrics are filled as a mutable HashMap, iterated from its last
+    bucket, and copied in an immutable Map, that keeps that order up to 4 keys and
+    orders a hash trie otherwise.
+    """
+    if len(keys) <= 4:
+        return sorted(keys, key=lambda key: -_mutable_map_bucket(key))
+    return sorted(
+        keys,
+        key=lambda key: [(_immutable_map_hash(key) >> (5 * i)) & 31 for i in range(7)],
+    )
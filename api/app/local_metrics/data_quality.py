@@ -0,0 +1,302 @@
+import math
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from app.local_metrics.aggregates import (
+    percentile_approx,
+    spark_mean,
+    spark_percentile,
+    spark_stddev,
+)
+from app.local_metrics.dataset import LocalDataset
+
+# categories of a feature over the top CATEGORIES_TOP_K are summed in the one without
+# name, as by the Spark jobs
+CATEGORIES_TOP_K = 10_000
+BUCKETS_NUMBER = 10
+
+
+def _missing_value(count: int, dataframe_count: int) -> Dict:
+    return {'count': int(count), 'percentage': count / dataframe_count * 100}
+
+
+def _median_metrics(perc_25: float, median: float, perc_75: float) -> Dict:
+    return {
+        'perc_25': float(perc_25),
+        'median': float(median),
+        'perc_75': float(perc_75),
+        'quantile_mode': 'EXACT',
+        'relative_error': None,
+    }
+
+
+def _moments(values: np.ndarray) -> Dict:
+    if len(values) == 0:
+        return dict.fromkeys(['mean', 'std', 'min', 'max'], float('nan'))
+    return {
+        'mean': spark_mean(values),
+        'std': spark_stddev(values),
+        'min': float(np.min(values)),
+        'max': float(np.max(values)),
+    }
+
+
+def numerical_histogram(values: np.ndarray) -> Dict:
+    """Compute the equal width histogram of the valid values as RDD.histogram.
+
+    Buckets are open to the right except the last one, a single bucket if min == max.
+    """
+    if len(values) == 0:
+        return {'buckets': [], 'reference_values': [], 'current_values': None}
+    min_value, max_value = float(np.min(values)), float(np.max(values))
+    if min_value == max_value:
+        return {
+            'buckets': [min_value, max_value],
+            'reference_values': [len(values)],
+            'current_values': None,
+        }
+    # same increment of RDD.histogram, kept as integer if possible
+    inc = (max_value - min_value) / BUCKETS_NUMBER
+    if int(inc) * BUCKETS_NUMBER == max_value - min_value:
+        inc = int(inc)
+    edges = [float(i * inc + min_value) for i in range(BUCKETS_NUMBER)] + [max_value]
+    indexes = np.minimum(
+        np.floor((values - min_value) / inc), BUCKETS_NUMBER - 1
+    ).astype(int)
+    return {
+        'buckets': edges,
+        'reference_values': np.bincount(indexes, minlength=BUCKETS_NUMBER).tolist(),
+        'current_values': None,
+    }
+
+
+def bucketize(
+    values: np.ndarray, is_null: np.ndarray, splits: List[float]
+) -> np.ndarray:
+    """Bucket every value as Bucketizer with invalid values kept.
+
+    NaN values fall in the bucket after the last one and nulls in no bucket, as -1.
+    """
+    buckets = np.minimum(
+        np.searchsorted(splits, values, side='right') - 1, len(splits) - 2
+    )
+    buckets = np.where(np.isnan(values), len(splits) - 1, buckets)
+    return np.where(is_null, -1, buckets)
+
+
+def histogram_splits(values: np.ndarray) -> Optional[tuple]:
+    """Return buckets, splits and bucket numbers of the shared histograms.
+
+    Buckets are ten between min and max of the values, a single one if all the values
+    are the same. None without values.
+    """
+    if len(values) == 0:
+        return None
+    buckets_spacing = np.linspace(np.min(values), np.max(values), 11).tolist()
+    generated_buckets = list(dict.fromkeys(buckets_spacing))
+    # workaround if all values are the same to not have errors
+    if len(generated_buckets) == 1:
+        return (
+            [generated_buckets[0], generated_buckets[0]],
+            [-math.inf, generated_buckets[0], math.inf],
+            [1],
+        )
+    return buckets_spacing, generated_buckets, list(range(BUCKETS_NUMBER))
+
+
+def combined_histogram(
+    current: LocalDataset, reference: LocalDataset, column: str
+) -> Dict:
+    """Compute the histogram of current and reference with the same buckets."""
+    current_values = current.values(column)
+    reference_values = reference.values(column)
+    valid_values = np.concatenate(
+        [
+            current_values[~np.isnan(current_values)],
+            reference_values[~np.isnan(reference_values)],
+        ]
+    )
+    buckets_spacing, splits, buckets_number = histogram_splits(valid_values)
+
+    def counts(dataset: LocalDataset, values: np.ndarray) -> List[int]:
+        buckets = bucketize(values, dataset.is_null(column), splits)
+        return [int(np.sum(buckets == bucket)) for bucket in buckets_number]
+
+    return {
+        'buckets': buckets_spacing,
+        'reference_values': counts(reference, reference_values),
+        'current_values': counts(current, current_values),
+    }
+
+
+def numerical_metrics(
+    dataset: LocalDataset, reference: Optional[LocalDataset] = None
+) -> List[Dict]:
+    """Compute the data quality of the numerical features.
+
+    Histograms of a current dataset are combined with the given reference.
+    """
+    metrics = []
+    for feature in dataset.numerical_features():
+        name = feature.name
+        values = dataset.values(name)
+        valid_values = values[~np.isnan(values)]
+        quantiles = [
+            spark_percentile(valid_values, percentage)
+            for percentage in (0.25, 0.5, 0.75)
+        ]
+        metrics.append(
+            {
+                'feature_name': name,
+                'type': 'numerical',
+                'missing_value': _missing_value(
+                    dataset.missing(name).sum(), dataset.count
+                ),
+                **_moments(valid_values),
+                'median_metrics': _median_metrics(*quantiles),
+                'class_median_metrics': [],
+                'histogram': combined_histogram(dataset, reference, name)
+                if reference is not None
+                else numerical_histogram(valid_values),
+            }
+        )
+    return metrics
+
+
+def categorical_metrics(
+    dataset: LocalDataset, top_k: int = CATEGORIES_TOP_K
+) -> List[Dict]:
+    """Compute the data quality of the categorical features, values cast to string.
+
+    Only the top_k most frequent categories are kept, the remaining ones are summed
+    in a category with None name.
+    """
+    metrics = []
+    for feature in dataset.categorical_features():
+        name = feature.name
+        strings = dataset.strings(name).dropna()
+        counts = sorted(strings.value_counts().items(), key=lambda x: (-x[1], x[0]))
+        categories = [
+            {
+                'name': str(value),
+                'count': int(count),
+                'frequency': count / dataset.count,
+            }
+            for value, count in counts[:top_k]
+        ]
+        other_count = int(sum(count for _, count in counts[top_k:]))
+        if other_count > 0:
+            categories.append(
+                {
+                    'name': None,
+                    'count': other_count,
+                    'frequency': other_count / dataset.count,
+                }
+            )
+        metrics.append(
+            {
+                'feature_name': name,
+                'type': 'categorical',
+                'missing_value': _missing_value(
+                    dataset.is_null(name).sum(), dataset.count
+                ),
+                'category_frequency': categories,
+                'distinct_value': len(counts),
+            }
+        )
+    return metrics
+
+
+def feature_metrics(
+    dataset: LocalDataset, reference: Optional[LocalDataset] = None
+) -> List[Dict]:
+    return numerical_metrics(dataset, reference) + categorical_metrics(dataset)
+
+
+def class_metrics(dataset: LocalDataset, column: str) -> List[Dict]:
+    """Count the rows of every class of the column, ordered by class with NaN last.
+
+    NaN classes are kept with no rows, as in the Spark jobs.
+    """
+    labels = dataset.labels(column)
+    not_null = labels.notna().to_numpy()
+    frame = pd.DataFrame(
+        {'label': labels[not_null], 'valid': dataset.is_valid(column)[not_null]}
+    )
+    counts = frame.groupby('label', dropna=False, sort=False)['valid'].sum()
+
+    def is_nan(label) -> bool:
+        return isinstance(label, float) and math.isnan(label)
+
+    return [
+        {
+            'name': str(label),
+            'count': int(count),
+            'percentage': count / dataset.count * 100,
+        }
+        for label, count in sorted(counts.items(), key=lambda x: (is_nan(x[0]), x[0]))
+    ]
+
+
+def binary_class_metrics(dataset: LocalDataset, column: str) -> List[Dict]:
+    """Compute class_metrics with the missing class, 0.0 or 1.0, added with no rows."""
+    metrics = class_metrics(dataset, column)
+    if len(metrics) == 1:
+        missing_class = '0.0' if metrics[0]['name'] == '1.0' else '1.0'
+        return [*metrics, {'name': missing_class, 'count': 0, 'percentage': 0.0}]
+    return metrics
+
+
+def target_metrics(
+    dataset: LocalDataset, reference: Optional[LocalDataset] = None
+) -> Dict:
+    """Compute the data quality of the target of a regression on its not null rows.
+
+    Quartiles are the ones of percentile_approx. The histogram of a current dataset
+    is combined with the given reference.
+    """
+    name = dataset.model.target.name
+    values = dataset.values(name)[~dataset.is_null(name)]
+    valid_values = values[~np.isnan(values)]
+    perc_25, perc_75 = percentile_approx(values, [0.25, 0.75]) or [float('nan')] * 2
+    return {
+        'feature_name': name,
+        'type': 'numerical',
+        'missing_value': {
+            'count': 0,
+            'percentage': float(np.isnan(values).sum()) / dataset.count * 100,
+        },
+        **_moments(values),
+        'median_metrics': _median_metrics(
+            perc_25, spark_percentile(values, 0.5), perc_75
+        ),
+        'histogram': combined_histogram(dataset, reference, name)
+        if reference is not None
+        else numerical_histogram(valid_values),
+    }
+
+
+def classification_data_quality(
+    dataset: LocalDataset, binary: bool, reference: Optional[LocalDataset] = None
+) -> Dict:
+    calculate_class_metrics = binary_class_metrics if binary else class_metrics
+    return {
+        'n_observations': dataset.count,
+        'class_metrics': calculate_class_metrics(dataset, dataset.model.target.name),
+        'class_metrics_prediction': calculate_class_metrics(
+            dataset, dataset.model.outputs.prediction.name
+        ),
+        'feature_metrics': feature_metrics(dataset, reference),
+    }
+
+
+def regression_data_quality(
+    dataset: LocalDataset, reference: Optional[LocalDataset] = None
+) -> Dict:
+    return {
+        'n_observations': dataset.count,
+        'target_metrics': target_metrics(dataset, reference),
+        'feature_metrics': feature_metrics(dataset, reference),
+    }
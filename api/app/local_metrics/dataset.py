@@ -0,0 +1,222 @@
+from enum import Enum
+import math
+import re
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from app.models.inferred_schema_dto import FieldType, SupportedTypes
+from app.models.model_dto import ColumnDefinition, Granularity, ModelOut, ModelType
+
+INT_MIN, INT_MAX = -(2**31), 2**31 - 1
+INT_PATTERN = re.compile(r'^[+-]?(\d+\.?\d*|\.\d+)$')
+
+
+class ColumnType(str, Enum):
+    """Types of the columns of the Spark jobs schema"""
+
+    STRING = 'string'
+    DOUBLE = 'double'
+    INT = 'int'
+    TIMESTAMP = 'timestamp'
+
+    @staticmethod
+    def from_supported_type(value: SupportedTypes) -> 'ColumnType':
+        match value:
+            case SupportedTypes.float:
+                return ColumnType.DOUBLE
+            case SupportedTypes.int:
+                return ColumnType.INT
+            case SupportedTypes.datetime:
+                return ColumnType.TIMESTAMP
+            case _:
+                return ColumnType.STRING
+
+
+def all_variables(model: ModelOut) -> List[ColumnDefinition]:
+    return [*model.features, model.target, model.timestamp, *model.outputs.output]
+
+
+def column_types(model: ModelOut) -> Dict[str, ColumnType]:
+    """Return the column types of the Spark jobs schema.
+
+    Target, prediction and probability of binary models are always doubles.
+    """
+    enforce_float = (
+        [model.target.name, model.outputs.prediction.name]
+        + (
+            [model.outputs.prediction_proba.name]
+            if model.outputs.prediction_proba
+            else []
+        )
+        if model.model_type == ModelType.BINARY
+        else []
+    )
+    types = {}
+    for column in all_variables(model):
+        types.setdefault(
+            column.name,
+            ColumnType.DOUBLE
+            if column.name in enforce_float
+            else ColumnType.from_supported_type(column.type),
+        )
+    return types
+
+
+def java_double_string(value: float) -> str:
+    """Format a double like Double.toString, as Spark does when casting to string."""
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return 'Infinity' if value > 0 else '-Infinity'
+    if value == 0:
+        return '-0.0' if math.copysign(1, value) < 0 else '0.0'
+    if 1e-3 <= abs(value) < 1e7:
+        return repr(float(value))
+    mantissa, exponent = np.format_float_scientific(value, unique=True, trim='0').split(
+        'e'
+    )
+    return f'{mantissa}E{int(exponent)}'
+
+
+def cast_column(
+    values: pd.Series, column_type: ColumnType
+) -> Tuple[pd.Series, np.ndarray]:
+    """Cast a column of CSV strings like Spark, values that cannot be parsed are null.
+
+    Returns the column and its nulls, because float columns keep null and NaN apart.
+    """
+    is_null = values.isna().to_numpy()
+    text = values.str.strip()
+    match column_type:
+        case ColumnType.STRING:
+            return values.astype(object).where(~is_null, None), is_null
+        case ColumnType.DOUBLE:
+            parsed = pd.to_numeric(text, errors='coerce').astype(float)
+            is_nan_literal = (text.str.lower() == 'nan').fillna(False).to_numpy()
+            return parsed, parsed.isna().to_numpy() & ~is_nan_literal
+        case ColumnType.INT:
+            parsed = pd.to_numeric(text, errors='coerce').astype(float)
+            # digits with an optional fraction, which is truncated
+            valid = (
+                text.str.match(INT_PATTERN).fillna(False).to_numpy()
+                & np.isfinite(parsed.to_numpy())
+                & (parsed.to_numpy() >= INT_MIN)
+                & (parsed.to_numpy() < INT_MAX + 1)
+            )
+            cast = pd.Series(np.trunc(parsed), index=values.index).where(valid)
+            return cast.astype('Int64'), ~valid
+        case ColumnType.TIMESTAMP:
+            parsed = pd.to_datetime(
+                text, errors='coerce', format='ISO8601', utc=True
+            ).dt.tz_localize(None)
+            return parsed, parsed.isna().to_numpy()
+
+
+class LocalDataset:
+    """A dataset of a model in memory, columns cast as the Spark jobs schema."""
+
+    def __init__(self, model: ModelOut, raw_dataframe: pd.DataFrame):
+        self.model = model
+        self.types = {
+            name: column_type
+            for name, column_type in column_types(model).items()
+            if name in raw_dataframe.columns
+        }
+        self.nulls: Dict[str, np.ndarray] = {}
+        columns = {}
+        for name, column_type in self.types.items():
+            columns[name], self.nulls[name] = cast_column(
+                raw_dataframe[name].reset_index(drop=True), column_type
+            )
+        self.dataframe = pd.DataFrame(columns, index=pd.RangeIndex(len(raw_dataframe)))
+        self.count = len(self.dataframe)
+
+    @staticmethod
+    def read_csv(model: ModelOut, source: BinaryIO | str) -> 'LocalDataset':
+        # read as strings, as the Spark jobs do before casting them
+        return LocalDataset(
+            model,
+            pd.read_csv(source, dtype=str, keep_default_na=False, na_values=['']),
+        )
+
+    def values(self, column: str) -> np.ndarray:
+        """Return the values of a numerical column as floats, NaN if null or NaN."""
+        return self.dataframe[column].to_numpy(dtype=float, na_value=np.nan)
+
+    def is_null(self, column: str) -> np.ndarray:
+        return self.nulls[column]
+
+    def is_valid(self, column: str) -> np.ndarray:
+        """Rows where the column is neither null nor NaN, as is_not_null of the jobs."""
+        match self.types[column]:
+            case ColumnType.DOUBLE | ColumnType.INT:
+                return ~np.isnan(self.values(column))
+            case ColumnType.STRING:
+                return (
+                    ~self.nulls[column]
+                    & ~(self.dataframe[column].str.strip().str.lower() == 'nan')
+                    .fillna(False)
+                    .to_numpy()
+                )
+            case _:
+                return ~self.nulls[column]
+
+    def missing(self, column: str) -> np.ndarray:
+        """Rows where the column is missing, null or NaN unless it is a timestamp."""
+        if self.types[column] == ColumnType.TIMESTAMP:
+            return self.nulls[column]
+        return ~self.is_valid(column)
+
+    def strings(self, column: str) -> pd.Series:
+        """Cast the column to string like Spark, None if null."""
+        values = self.dataframe[column]
+        match self.types[column]:
+            case ColumnType.DOUBLE:
+                strings = values.map(java_double_string)
+            case ColumnType.INT:
+                strings = values.astype(object).map(str)
+            case ColumnType.TIMESTAMP:
+                strings = values.dt.strftime('%Y-%m-%d %H:%M:%S')
+            case _:
+                strings = values
+        return strings.astype(object).where(~self.nulls[column], None)
+
+    def labels(self, column: str) -> pd.Series:
+        """Return the values of the column as python objects, None if null."""
+        values = self.dataframe[column]
+        if self.types[column] == ColumnType.DOUBLE:
+            return values.astype(object).where(~self.nulls[column], None)
+        return (
+            values.astype(object)
+            .where(~self.nulls[column], None)
+            .map(lambda x: int(x) if isinstance(x, np.integer) else x)
+        )
+
+    def time_groups(self) -> List[Optional[str]]:
+        """Truncate the timestamps to the model granularity, weeks start on sunday.
+
+        Groups are formatted as yyyy-MM-dd HH:mm:ss, None if the timestamp is null.
+        """
+        timestamps = self.dataframe[self.model.timestamp.name]
+        days = timestamps.dt.normalize()
+        match self.model.granularity:
+            case Granularity.HOUR:
+                truncated = timestamps.dt.floor('h')
+            case Granularity.DAY:
+                truncated = days
+            case Granularity.WEEK:
+                truncated = days - pd.to_timedelta(
+                    (days.dt.dayofweek + 1) % 7, unit='D'
+                )
+            case Granularity.MONTH:
+                truncated = days - pd.to_timedelta(days.dt.day - 1, unit='D')
+        formatted = truncated.dt.strftime('%Y-%m-%d %H:%M:%S')
+        return formatted.astype(object).where(formatted.notna(), None).tolist()
+
+    def numerical_features(self) -> List[ColumnDefinition]:
+        return [f for f in self.model.features if f.field_type == FieldType.numerical]
+
+    def categorical_features(self) -> List[ColumnDefinition]:
+        return [f for f in self.model.features if f.field_type == FieldType.categorical]
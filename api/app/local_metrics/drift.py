@@ -0,0 +1,176 @@
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+from scipy.stats import chisquare
+
+from app.local_metrics.aggregates import approx_quantiles, shuffle_partition
+from app.local_metrics.dataset import LocalDataset
+from app.models.inferred_schema_dto import FieldType, SupportedTypes
+
+# KS test parameters of the Spark jobs
+KS_ALPHA = 0.05
+KS_PHI = 0.004
+
+
+def chi2_p_value(reference: LocalDataset, current: LocalDataset, column: str) -> float:
+    """Compute the p-value of the chi-square test of the current frequencies.
+
+    Values are cast to string, reference frequencies are scaled to the current size.
+    Values are in the order of the frequencies collected by the Spark jobs, by shuffle
+    partition and first appearance in current and reference.
+    """
+    reference_strings = reference.strings(column).dropna()
+    current_strings = current.strings(column).dropna()
+    reference_counts = reference_strings.value_counts()
+    current_counts = current_strings.value_counts()
+    values = list(dict.fromkeys([*current_strings, *reference_strings]))
+    values.sort(key=lambda value: shuffle_partition(column, value))
+    if not values:
+        return float('nan')
+    ref_fr = reference_counts.reindex(values, fill_value=0).to_numpy()
+    cur_fr = current_counts.reindex(values, fill_value=0).to_numpy()
+    ref_fr = ref_fr * (sum(cur_fr) / sum(ref_fr))
+    return float(chisquare(cur_fr, ref_fr)[1])
+
+
+def _ks_probabilities(n: int) -> Tuple[np.ndarray, float]:
+    delta = KS_PHI / 2
+    eps45 = max(0.0, delta - math.sqrt(delta / n))
+    probabilities = np.linspace(1 / n, 1, min(math.ceil(1 / (delta - eps45) + 1), n))
+    return probabilities, eps45
+
+
+def ks_test(reference: LocalDataset, current: LocalDataset, column: str) -> Dict:
+    """Approximate the two sample KS distance with precision KS_PHI.
+
+    Distances are computed from the quantiles of approxQuantile of both datasets, as
+    the Spark jobs do.
+    """
+    pxi, eps45x = _ks_probabilities(reference.count)
+    pyj, eps45y = _ks_probabilities(current.count)
+    reference_values = reference.values(column)
+    current_values = current.values(column)
+    reference_values = reference_values[~np.isnan(reference_values)]
+    current_values = current_values[~np.isnan(current_values)]
+    if len(reference_values) and len(current_values):
+        xi = np.array(approx_quantiles(reference_values, pxi, eps45x))
+        yj = np.array(approx_quantiles(current_values, pyj, eps45y))
+        distance = max(
+            *abs(pxi - np.interp(xi, yj, pyj)), *abs(np.interp(yj, xi, pxi) - pyj)
+        )
+    else:
+        distance = float('nan')
+    critical_value = np.sqrt(-0.5 * np.log(KS_ALPHA / 2)) * np.sqrt(
+        (reference.count + current.count) / (reference.count * current.count)
+    )
+    return {'critical_value': critical_value, 'ks_statistic': round(distance, 10)}
+
+
+def psi_value(reference: LocalDataset, current: LocalDataset, column: str) -> float:
+    """Compute the population stability index of reference and current.
+
+    Buckets are ten between min and max of both, or their distinct values if less.
+    """
+    reference_values = reference.values(column)
+    current_values = current.values(column)
+    reference_values = reference_values[~np.isnan(reference_values)]
+    current_values = current_values[~np.isnan(current_values)]
+    values = np.concatenate([reference_values, current_values])
+    if len(values) == 0:
+        return float('nan')
+    distinct_values = np.unique(values)
+    if len(distinct_values) < 10:
+        buckets_spacing = [*distinct_values.tolist(), float(distinct_values[-1]) + 1]
+    else:
+        buckets_spacing = np.linspace(np.min(values), np.max(values), 11).tolist()
+    splits = list(dict.fromkeys(buckets_spacing))
+    # workaround if all values are the same to not have errors
+    if len(splits) == 1:
+        splits = [-math.inf, splits[0], math.inf]
+        buckets_number = [1]
+    else:
+        buckets_number = list(range(10))
+
+    def fractions(bucket_values: np.ndarray) -> List[float]:
+        buckets = np.minimum(
+            np.searchsorted(splits, bucket_values, side='right') - 1, len(splits) - 2
+        )
+        counts = [int(np.sum(buckets == bucket)) for bucket in buckets_number]
+        return [count / sum(counts) for count in counts]
+
+    def sub_psi(e_perc: float, a_perc: float) -> float:
+        # empty buckets are replaced with a very small fraction
+        a_perc = a_perc or 0.0001
+        e_perc = e_perc or 0.0001
+        return (e_perc - a_perc) * np.log(e_perc / a_perc)
+
+    return float(
+        sum(
+            sub_psi(e_perc, a_perc)
+            for e_perc, a_perc in zip(
+                fractions(reference_values), fractions(current_values)
+            )
+        )
+    )
+
+
+def calculate_drift(reference: LocalDataset, current: LocalDataset) -> Dict:
+    """Compute the drift of every feature as the Spark jobs.
+
+    Chi-square test of categorical features, KS test of float ones and PSI of int
+    ones, in this order.
+    """
+    model = reference.model
+    feature_metrics = []
+    for feature in model.features:
+        if feature.field_type == FieldType.categorical:
+            p_value = chi2_p_value(reference, current, feature.name)
+            feature_metrics.append(
+                {
+                    'feature_name': feature.name,
+                    'field_type': FieldType.categorical.value,
+                    'drift_calc': {
+                        'type': 'CHI2',
+                        'value': p_value,
+                        'has_drift': bool(p_value <= 0.05),
+                    },
+                }
+            )
+    for feature in model.features:
+        if (
+            feature.field_type == FieldType.numerical
+            and feature.type == SupportedTypes.float
+        ):
+            result = ks_test(reference, current, feature.name)
+            feature_metrics.append(
+                {
+                    'feature_name': feature.name,
+                    'field_type': FieldType.numerical.value,
+                    'drift_calc': {
+                        'type': 'KS',
+                        'value': float(result['ks_statistic']),
+                        'has_drift': bool(
+                            result['ks_statistic'] > result['critical_value']
+                        ),
+                    },
+                }
+            )
+    for feature in model.features:
+        if (
+            feature.field_type == FieldType.numerical
+            and feature.type == SupportedTypes.int
+        ):
+            value = psi_value(reference, current, feature.name)
+            feature_metrics.append(
+                {
+                    'feature_name': feature.name,
+                    'field_type': FieldType.numerical.value,
+                    'drift_calc': {
+                        'type': 'PSI',
+                        'value': value,
+                        'has_drift': bool(value >= 0.1),
+                    },
+                }
+            )
+    return {'feature_metrics': feature_metrics}
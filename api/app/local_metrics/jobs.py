@@ -0,0 +1,76 @@
+from typing import Any, Dict
+
+from pydantic_core import to_json
+
+from app.local_metrics.data_quality import (
+    classification_data_quality,
+    regression_data_quality,
+)
+from app.local_metrics.dataset import LocalDataset
+from app.local_metrics.drift import calculate_drift
+from app.local_metrics.model_quality import (
+    binary_current_model_quality,
+    binary_reference_model_quality,
+    multiclass_current_model_quality,
+    multiclass_reference_model_quality,
+    regression_current_model_quality,
+    regression_reference_model_quality,
+)
+from app.local_metrics.statistics import calculate_statistics
+from app.models.model_dto import ModelType
+
+
+def to_json_string(metrics: Any) -> str:
+    # compact json with NaN and infinite values as null, as written by the Spark jobs
+    return to_json(metrics, inf_nan_mode='null').decode('utf-8')
+
+
+def compute_reference_metrics(reference_dataset: LocalDataset) -> Dict[str, str]:
+    """Compute the metrics of a reference dataset, as the Spark reference_job."""
+    model = reference_dataset.model
+    match model.model_type:
+        case ModelType.BINARY:
+            model_quality = binary_reference_model_quality(reference_dataset)
+            data_quality = classification_data_quality(reference_dataset, binary=True)
+        case ModelType.MULTI_CLASS:
+            model_quality = multiclass_reference_model_quality(reference_dataset)
+            data_quality = classification_data_quality(reference_dataset, binary=False)
+        case ModelType.REGRESSION:
+            model_quality = regression_reference_model_quality(reference_dataset)
+            data_quality = regression_data_quality(reference_dataset)
+    return {
+        'STATISTICS': to_json_string(calculate_statistics(reference_dataset)),
+        'DATA_QUALITY': to_json_string(data_quality),
+        'MODEL_QUALITY': to_json_string(model_quality),
+    }
+
+
+def compute_current_metrics(
+    current_dataset: LocalDataset, reference_dataset: LocalDataset
+) -> Dict[str, str]:
+    """Compute the metrics of a current dataset, as the Spark current_job."""
+    model = current_dataset.model
+    match model.model_type:
+        case ModelType.BINARY:
+            model_quality = binary_current_model_quality(current_dataset)
+            data_quality = classification_data_quality(
+                current_dataset, binary=True, reference=reference_dataset
+            )
+        case ModelType.MULTI_CLASS:
+            model_quality = multiclass_current_model_quality(
+                current_dataset, reference_dataset
+            )
+            data_quality = classification_data_quality(
+                current_dataset, binary=False, reference=reference_dataset
+            )
+        case ModelType.REGRESSION:
+            model_quality = regression_current_model_quality(current_dataset)
+            data_quality = regression_data_quality(
+                current_dataset, reference=reference_dataset
+            )
+    return {
+        'STATISTICS': to_json_string(calculate_statistics(current_dataset)),
+        'DATA_QUALITY': to_json_string(data_quality),
+        'MODEL_QUALITY': to_json_string(model_quality),
+        'DRIFT': to_json_string(calculate_drift(reference_dataset, current_dataset)),
+    }
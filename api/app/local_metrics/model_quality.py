@@ -0,0 +1,729 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from app.local_metrics.aggregates import (
+    ks_p_value,
+    scala_map_order,
+    spark_mean,
+    spark_sum,
+    strict_log,
+    xxhash64,
+)
+from app.local_metrics.data_quality import bucketize, histogram_splits
+from app.local_metrics.dataset import ColumnType, LocalDataset
+
+# names of the metrics of MulticlassClassificationEvaluator and of the model quality
+GLOBAL_METRICS = {
+    'f1': 'f1',
+    'accuracy': 'accuracy',
+    'weightedPrecision': 'weighted_precision',
+    'weightedRecall': 'weighted_recall',
+    'weightedTruePositiveRate': 'weighted_true_positive_rate',
+    'weightedFalsePositiveRate': 'weighted_false_positive_rate',
+    'weightedFMeasure': 'weighted_f_measure',
+}
+BY_LABEL_METRICS = {
+    'truePositiveRateByLabel': 'true_positive_rate',
+    'falsePositiveRateByLabel': 'false_positive_rate',
+    'precisionByLabel': 'precision',
+    'recallByLabel': 'recall',
+    'fMeasureByLabel': 'f_measure',
+}
+REGRESSION_METRICS = ['mae', 'mape', 'mse', 'rmse', 'r2', 'adj_r2', 'variance']
+# same clipping of MulticlassMetrics.logLoss
+LOG_LOSS_EPS = 1e-15
+# number of bins of the down-sampling of BinaryClassificationEvaluator
+NUM_BINS = 1000
+# maximum number of points of the residual scatter plots
+RESIDUAL_POINTS_BUDGET = 10_000
+
+
+class ConfusionMatrixMetrics:
+    """Metrics of MulticlassClassificationEvaluator from label, prediction counts.
+
+    Weighted metrics are summed by ascending label as the ConfusionMatrixMetrics of the
+    jobs, or in the order of MulticlassClassificationEvaluator with evaluator_order.
+    """
+
+    def __init__(
+        self,
+        confusions: Dict[Tuple[float, float], int],
+        evaluator_order: bool = False,
+    ) -> None:
+        self.classes = sorted(
+            {label for label, _ in confusions} | {pred for _, pred in confusions}
+        )
+        self.index = {c: i for i, c in enumerate(self.classes)}
+        self.matrix = np.zeros((len(self.classes), len(self.classes)))
+        for (label, prediction), count in confusions.items():
+            self.matrix[self.index[label], self.index[prediction]] += count
+        self.label_count_by_class = self.matrix.sum(axis=1)
+        self.label_count = self.matrix.sum()
+        self.tp_by_class = np.diag(self.matrix)
+        self.fp_by_class = self.matrix.sum(axis=0) - self.tp_by_class
+        # classes that are present as label, the only ones MulticlassMetrics knows about
+        self.label_classes = [
+            i for i in range(len(self.classes)) if self.label_count_by_class[i] > 0
+        ]
+        self.weighted_classes = (
+            [
+                self.index[label]
+                for label in scala_map_order(
+                    [self.classes[i] for i in self.label_classes]
+                )
+            ]
+            if evaluator_order
+            else self.label_classes
+        )
+
+    @staticmethod
+    def from_columns(
+        labels: pd.Series, predictions: pd.Series, evaluator_order: bool = False
+    ) -> 'ConfusionMatrixMetrics':
+        counts = pd.DataFrame(
+            {'label': labels, 'prediction': predictions}
+        ).value_counts()
+        return ConfusionMatrixMetrics(
+            {
+                (label, prediction): int(count)
+                for (label, prediction), count in counts.items()
+            },
+            evaluator_order,
+        )
+
+    def __label_index(self, label: float) -> int:
+        i = self.index.get(label)
+        if i is None or self.label_count_by_class[i] == 0:
+            raise KeyError(f'Label {label} not found')
+        return i
+
+    def __precision(self, i: int) -> float:
+        tp = self.tp_by_class[i]
+        fp = self.fp_by_class[i]
+        return 0.0 if tp + fp == 0 else tp / (tp + fp)
+
+    def __recall(self, i: int) -> float:
+        return self.tp_by_class[i] / self.label_count_by_class[i]
+
+    def __false_positive_rate(self, i: int) -> float:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.float64(self.fp_by_class[i]) / (
+                self.label_count - self.label_count_by_class[i]
+            )
+
+    def __f_measure(self, i: int, beta: float = 1.0) -> float:
+        p = self.__precision(i)
+        r = self.__recall(i)
+        beta_sqrd = beta * beta
+        return 0.0 if p + r == 0 else (1 + beta_sqrd) * p * r / (beta_sqrd * p + r)
+
+    def __weighted(self, metric) -> float:
+        return sum(
+            metric(i) * self.label_count_by_class[i] / self.label_count
+            for i in self.weighted_classes
+        )
+
+    def accuracy(self) -> float:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.float64(self.tp_by_class.sum()) / self.label_count
+
+    def evaluate(self, metric_name: str, metric_label: float = 0.0) -> float:
+        """Evaluate a metric of MulticlassClassificationEvaluator, NaN if it fails."""
+        try:
+            match metric_name:
+                case 'f1' | 'weightedFMeasure':
+                    value = self.__weighted(self.__f_measure)
+                case 'accuracy':
+                    value = self.accuracy()
+                case 'weightedPrecision':
+                    value = self.__weighted(self.__precision)
+                case 'weightedRecall' | 'weightedTruePositiveRate':
+                    value = self.__weighted(self.__recall)
+                case 'weightedFalsePositiveRate':
+                    value = self.__weighted(self.__false_positive_rate)
+                case 'truePositiveRateByLabel' | 'recallByLabel':
+                    value = self.__recall(self.__label_index(metric_label))
+                case 'falsePositiveRateByLabel':
+                    value = self.__false_positive_rate(self.__label_index(metric_label))
+                case 'precisionByLabel':
+                    value = self.__precision(self.__label_index(metric_label))
+                case 'fMeasureByLabel':
+                    value = self.__f_measure(self.__label_index(metric_label))
+                case _:
+                    value = float('nan')
+            return float(value)
+        except Exception:
+            return float('nan')
+
+    def label_confusion_matrix(self) -> List[List[float]]:
+        """Return the confusion matrix of the label classes, as MulticlassMetrics."""
+        return [
+            [float(self.matrix[i, j]) for j in self.label_classes]
+            for i in self.label_classes
+        ]
+
+
+def _sorted_groups(groups) -> list:
+    return sorted(groups, key=lambda x: (x is not None, x))
+
+
+def _time_series(values_by_group: Dict[Optional[str], float]) -> List[Dict]:
+    return [
+        {'timestamp': group, 'value': values_by_group[group]}
+        for group in _sorted_groups(values_by_group)
+    ]
+
+
+def area_under_curves(score_counts: List[Tuple[float, int, int]]) -> Dict[str, float]:
+    """Compute the area under ROC and PR curves as BinaryClassificationMetrics.
+
+    Input is the count of positive and negative labels of every distinct score, or
+    score bin, with NaN scores greater than any other.
+    """
+    sorted_counts = sorted(
+        score_counts, key=lambda x: (math.isnan(x[0]), x[0]), reverse=True
+    )
+    positives = sum(p for _, p, _ in sorted_counts)
+    negatives = sum(n for _, _, n in sorted_counts)
+
+    roc_curve = [(0.0, 0.0)]
+    pr_curve = []
+    tp, fp = 0, 0
+    for _, p, n in sorted_counts:
+        tp += p
+        fp += n
+        recall = 0.0 if positives == 0 else tp / positives
+        false_positive_rate = 0.0 if negatives == 0 else fp / negatives
+        precision = 1.0 if tp + fp == 0 else tp / (tp + fp)
+        roc_curve.append((false_positive_rate, recall))
+        pr_curve.append((recall, precision))
+    roc_curve.append((1.0, 1.0))
+
+    def area_under_curve(curve: List[Tuple[float, float]]) -> float:
+        return sum(
+            (x2 - x1) * (y2 + y1) / 2.0 for (x1, y1), (x2, y2) in zip(curve, curve[1:])
+        )
+
+    return {
+        'area_under_roc': area_under_curve(roc_curve),
+        # the PR curve starts from the precision of the first threshold
+        'area_under_pr': area_under_curve([(0.0, pr_curve[0][1]), *pr_curve])
+        if pr_curve
+        else float('nan'),
+    }
+
+
+def _score_counts(
+    scores: np.ndarray, labels: np.ndarray
+) -> List[Tuple[float, int, int]]:
+    # NaN scores are grouped together, labels over 0.5 are positives
+    frame = pd.DataFrame({'score': scores, 'positive': labels > 0.5})
+    grouped = frame.groupby('score', dropna=False)['positive'].agg(['sum', 'count'])
+    return [
+        (float(score), int(positives), int(count - positives))
+        for score, (positives, count) in grouped.iterrows()
+    ]
+
+
+def binary_area_under_curves(
+    dataset: LocalDataset, rows: np.ndarray
+) -> Dict[str, float]:
+    """Compute the area under ROC and PR curves as BinaryClassificationEvaluator.
+
+    Scores are down-sampled as its default bins. Null scores or labels make the
+    evaluator fail, so that the areas are NaN.
+    """
+    score = dataset.model.outputs.prediction_proba.name
+    label = dataset.model.target.name
+    if (dataset.is_null(score) | dataset.is_null(label))[rows].any() or not rows.any():
+        return {'area_under_roc': float('nan'), 'area_under_pr': float('nan')}
+    score_counts = sorted(
+        _score_counts(dataset.values(score)[rows], dataset.values(label)[rows]),
+        key=lambda x: (math.isnan(x[0]), x[0]),
+        reverse=True,
+    )
+    grouping = len(score_counts) // NUM_BINS
+    if grouping >= 2:
+        score_counts = [
+            (
+                chunk[0][0],
+                sum(p for _, p, _ in chunk),
+                sum(n for _, _, n in chunk),
+            )
+            for chunk in (
+                score_counts[i : i + grouping]
+                for i in range(0, len(score_counts), grouping)
+            )
+        ]
+    return area_under_curves(score_counts)
+
+
+def _log_losses(dataset: LocalDataset) -> np.ndarray:
+    """Compute the clipped -log(p) of every row, NaN for the rows that are not counted.
+
+    p is the probability of the target class from prediction and prediction_proba.
+    """
+    model = dataset.model
+    prediction = dataset.values(model.outputs.prediction.name)
+    proba = dataset.values(model.outputs.prediction_proba.name)
+    target = np.trunc(dataset.values(model.target.name))
+    proba_class0 = np.where(prediction == 0, proba, 1 - proba)
+    proba_class1 = np.where(prediction == 1, proba, 1 - proba)
+    proba_target = np.select(
+        [target == 0, target == 1], [proba_class0, proba_class1], np.nan
+    )
+    valid = (
+        dataset.is_valid(model.outputs.prediction.name)
+        & dataset.is_valid(model.target.name)
+        & dataset.is_valid(model.outputs.prediction_proba.name)
+    )
+    clipped = np.clip(proba_target, LOG_LOSS_EPS, 1 - LOG_LOSS_EPS)
+    losses = np.array([-strict_log(p) for p in clipped.tolist()], dtype=float)
+    return np.where(valid, losses, np.nan)
+
+
+def _mean(values: np.ndarray) -> float:
+    # average of F.avg, that ignores the rows that are not counted
+    return spark_mean(values[~np.isnan(values)])
+
+
+def _binary_valid_rows(dataset: LocalDataset) -> np.ndarray:
+    model = dataset.model
+    return dataset.is_valid(model.outputs.prediction.name) & dataset.is_valid(
+        model.target.name
+    )
+
+
+def _binary_confusion_metrics(
+    dataset: LocalDataset, rows: np.ndarray, evaluator_order: bool = False
+) -> ConfusionMatrixMetrics:
+    model = dataset.model
+    return ConfusionMatrixMetrics.from_columns(
+        pd.Series(dataset.values(model.target.name)[rows]),
+        pd.Series(dataset.values(model.outputs.prediction.name)[rows]),
+        evaluator_order,
+    )
+
+
+def _binary_metrics(confusion_metrics: ConfusionMatrixMetrics) -> Dict[str, float]:
+    # metricLabel=1 as the services, the positive class is 1
+    return {
+        label: confusion_metrics.evaluate(name, metric_label=1.0)
+        for name, label in {**GLOBAL_METRICS, **BY_LABEL_METRICS}.items()
+    }
+
+
+def _confusion_counts(confusion_metrics: ConfusionMatrixMetrics) -> Dict[str, int]:
+    def count_pairs(target: float, prediction: float) -> int:
+        index = confusion_metrics.index
+        if target not in index or prediction not in index:
+            return 0
+        return int(confusion_metrics.matrix[index[target], index[prediction]])
+
+    return {
+        'true_positive_count': count_pairs(1.0, 1.0),
+        'false_positive_count': count_pairs(0.0, 1.0),
+        'true_negative_count': count_pairs(0.0, 0.0),
+        'false_negative_count': count_pairs(1.0, 0.0),
+    }
+
+
+def binary_reference_model_quality(dataset: LocalDataset) -> Dict:
+    valid = _binary_valid_rows(dataset)
+    confusion_metrics = _binary_confusion_metrics(dataset, valid, evaluator_order=True)
+    metrics = _binary_metrics(confusion_metrics)
+    metrics.update(_confusion_counts(confusion_metrics))
+    if dataset.model.outputs.prediction_proba is not None:
+        metrics.update(binary_area_under_curves(dataset, valid))
+        metrics['log_loss'] = _mean(_log_losses(dataset))
+    return metrics
+
+
+def binary_current_model_quality(dataset: LocalDataset) -> Dict:
+    model = dataset.model
+    valid = _binary_valid_rows(dataset)
+    time_groups = np.array(dataset.time_groups(), dtype=object)
+    confusion_metrics = _binary_confusion_metrics(dataset, valid, evaluator_order=True)
+    metrics_by_group = {
+        group: _binary_metrics(
+            _binary_confusion_metrics(dataset, valid & (time_groups == group))
+        )
+        for group in set(time_groups[valid])
+    }
+    global_metrics = _binary_metrics(confusion_metrics)
+    grouped_metrics = {
+        label: _time_series(
+            {group: metrics[label] for group, metrics in metrics_by_group.items()}
+        )
+        for label in global_metrics
+    }
+    global_metrics.update(_confusion_counts(confusion_metrics))
+    if model.outputs.prediction_proba is not None:
+        # the global areas are evaluated on the whole dataset
+        global_metrics.update(
+            binary_area_under_curves(dataset, np.ones(dataset.count, dtype=bool))
+        )
+        scored = dataset.is_valid(
+            model.outputs.prediction_proba.name
+        ) & dataset.is_valid(model.target.name)
+        grouped_metrics.update(
+            _area_under_curves_by_group(dataset, scored, time_groups)
+        )
+        log_losses = _log_losses(dataset)
+        global_metrics['log_loss'] = _mean(log_losses[scored])
+        grouped_metrics['log_loss'] = _time_series(
+            {
+                group: _mean(log_losses[scored & (time_groups == group)])
+                for group in set(time_groups[scored])
+            }
+        )
+    return {'global_metrics': global_metrics, 'grouped_metrics': grouped_metrics}
+
+
+def _area_under_curves_by_group(
+    dataset: LocalDataset, rows: np.ndarray, time_groups: np.ndarray
+) -> Dict[str, List[Dict]]:
+    """Compute the area under ROC and PR curves of every time group.
+
+    Scores are bucketed in NUM_BINS equal width bins between min and max of all groups.
+    """
+    scores = dataset.values(dataset.model.outputs.prediction_proba.name)[rows]
+    labels = dataset.values(dataset.model.target.name)[rows]
+    groups = time_groups[rows]
+    if len(scores) == 0:
+        return {'area_under_roc': [], 'area_under_pr': []}
+    min_score, max_score = np.min(scores), np.max(scores)
+    if min_score == max_score:
+        score_bins = np.zeros(len(scores))
+    else:
+        score_bins = np.minimum(
+            np.floor((scores - min_score) / (max_score - min_score) * NUM_BINS),
+            NUM_BINS - 1,
+        )
+    areas_by_group = {
+        group: area_under_curves(
+            _score_counts(score_bins[groups == group], labels[groups == group])
+        )
+        for group in set(groups)
+    }
+    return {
+        name: _time_series(
+            {group: areas[name] for group, areas in areas_by_group.items()}
+        )
+        for name in ('area_under_roc', 'area_under_pr')
+    }
+
+
+def _class_indexes(
+    dataset: LocalDataset, reference: Optional[LocalDataset] = None
+) -> Dict:
+    """Index the classes of prediction and target in ascending order, as doubles.
+
+    Classes of the reference are indexed too, if given.
+    """
+    model = dataset.model
+    classes = set()
+    for indexed in [dataset] + ([reference] if reference is not None else []):
+        for column in (model.outputs.prediction.name, model.target.name):
+            labels = indexed.labels(column)
+            classes.update(
+                label
+                for label in labels[labels.notna()]
+                if not (isinstance(label, float) and math.isnan(label))
+            )
+    return {label: float(index) for index, label in enumerate(sorted(classes))}
+
+
+def _indexed(dataset: LocalDataset, column: str, class_indexes: Dict) -> pd.Series:
+    return dataset.labels(column).map(
+        lambda x: None if x is None else class_indexes.get(x)
+    )
+
+
+def _multiclass_model_quality(
+    class_indexes: Dict,
+    confusion_metrics: ConfusionMatrixMetrics,
+    by_label_confusion_metrics: ConfusionMatrixMetrics,
+    metrics_by_group: Optional[Dict[Optional[str], ConfusionMatrixMetrics]] = None,
+) -> Dict:
+    class_metrics = []
+    for label, index in class_indexes.items():
+        metrics = {
+            'class_name': str(label),
+            'metrics': {
+                metric_label: by_label_confusion_metrics.evaluate(name, index)
+                for name, metric_label in BY_LABEL_METRICS.items()
+            },
+        }
+        if metrics_by_group is not None:
+            metrics['grouped_metrics'] = {
+                metric_label: _time_series(
+                    {
+                        group: group_metrics.evaluate(name, index)
+                        for group, group_metrics in metrics_by_group.items()
+                    }
+                )
+                for name, metric_label in BY_LABEL_METRICS.items()
+            }
+        class_metrics.append(metrics)
+    global_metrics = {
+        metric_label: confusion_metrics.evaluate(name)
+        for name, metric_label in GLOBAL_METRICS.items()
+    }
+    global_metrics['confusion_matrix'] = (
+        by_label_confusion_metrics.label_confusion_matrix()
+    )
+    return {
+        'classes': [str(label) for label in class_indexes],
+        'class_metrics': class_metrics,
+        'global_metrics': global_metrics,
+    }
+
+
+def multiclass_reference_model_quality(dataset: LocalDataset) -> Dict:
+    model = dataset.model
+    class_indexes = _class_indexes(dataset)
+    targets = _indexed(dataset, model.target.name, class_indexes)
+    predictions = _indexed(dataset, model.outputs.prediction.name, class_indexes)
+    indexed = (targets.notna() & predictions.notna()).to_numpy()
+    # metrics by label and confusion matrix ignore NaN values of string columns too
+    valid = (
+        indexed
+        & dataset.is_valid(model.target.name)
+        & dataset.is_valid(model.outputs.prediction.name)
+    )
+    return _multiclass_model_quality(
+        class_indexes,
+        ConfusionMatrixMetrics.from_columns(
+            targets[indexed], predictions[indexed], evaluator_order=True
+        ),
+        ConfusionMatrixMetrics.from_columns(targets[valid], predictions[valid]),
+    )
+
+
+def multiclass_current_model_quality(
+    dataset: LocalDataset, reference: LocalDataset
+) -> Dict:
+    model = dataset.model
+    class_indexes = _class_indexes(dataset, reference)
+    targets = _indexed(dataset, model.target.name, class_indexes)
+    predictions = _indexed(dataset, model.outputs.prediction.name, class_indexes)
+    indexed = (targets.notna() & predictions.notna()).to_numpy()
+    time_groups = np.array(dataset.time_groups(), dtype=object)
+    confusion_metrics = ConfusionMatrixMetrics.from_columns(
+        targets[indexed], predictions[indexed]
+    )
+    metrics_by_group = {}
+    for group in set(time_groups[indexed]):
+        rows = indexed & (time_groups == group)
+        metrics_by_group[group] = ConfusionMatrixMetrics.from_columns(
+            targets[rows], predictions[rows]
+        )
+    return _multiclass_model_quality(
+        class_indexes, confusion_metrics, confusion_metrics, metrics_by_group
+    )
+
+
+def _regression_rows(dataset: LocalDataset) -> Tuple[np.ndarray, np.ndarray]:
+    """Target and prediction of the rows where both are valid."""
+    model = dataset.model
+    valid = dataset.is_valid(model.target.name) & dataset.is_valid(
+        model.outputs.prediction.name
+    )
+    return (
+        dataset.values(model.target.name)[valid],
+        dataset.values(model.outputs.prediction.name)[valid],
+    )
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    # same results of the JVM division, with infinite and NaN values instead of errors
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(np.divide(np.float64(numerator), np.float64(denominator)))
+
+
+def regression_statistics(y: np.ndarray, y_hat: np.ndarray) -> Dict[str, float]:
+    """Compute the sums of the regression metrics, in the order of the rows as Spark."""
+    y = y.astype(float)
+    y_hat = y_hat.astype(float)
+    # null when target is 0, ignored as by the mean of the percentage errors
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ape = np.abs((y_hat - y) / y)[y != 0]
+    return {
+        'n': len(y),
+        'sum_y': spark_sum(y),
+        'sum_y_hat': spark_sum(y_hat),
+        'sum_y2': spark_sum(y * y),
+        'sum_y_hat2': spark_sum(y_hat * y_hat),
+        'sum_y_y_hat': spark_sum(y * y_hat),
+        'sum_abs_error': spark_sum(np.abs(y - y_hat)),
+        'sum_squared_error': spark_sum((y - y_hat) * (y - y_hat)),
+        'sum_ape': spark_sum(ape),
+        'n_ape': len(ape),
+    }
+
+
+def regression_metrics(
+    dataset: LocalDataset, statistics: Dict[str, float]
+) -> Dict[str, float]:
+    """Compute the metrics of RegressionEvaluator, with MAPE and adjusted R2."""
+    n = statistics['n']
+    if n == 0:
+        return dict.fromkeys(REGRESSION_METRICS, float('nan'))
+    mean_y = statistics['sum_y'] / n
+    ss_err = statistics['sum_squared_error']
+    ss_tot = max(statistics['sum_y2'] - n * mean_y * mean_y, 0.0)
+    ss_reg = max(
+        statistics['sum_y_hat2']
+        - 2 * mean_y * statistics['sum_y_hat']
+        + n * mean_y * mean_y,
+        0.0,
+    )
+    mse = ss_err / n
+    r2 = 1 - _divide(ss_err, ss_tot)
+    p = len(dataset.model.features)
+    adj_r2 = 1 - (1 - r2) * ((n - 1) / (n - p - 1)) if n - p - 1 != 0 else float('nan')
+    return {
+        'mae': statistics['sum_abs_error'] / n,
+        'mape': statistics['sum_ape'] / statistics['n_ape'] * 100
+        if statistics['n_ape']
+        else float('nan'),
+        'mse': mse,
+        'rmse': math.sqrt(mse),
+        'r2': r2,
+        'adj_r2': adj_r2,
+        'variance': ss_reg / n,
+    }
+
+
+def _residual_histogram(residuals: np.ndarray) -> Dict:
+    # only the buckets with residuals are counted, as the groupBy of the Spark jobs
+    buckets_spacing, splits, buckets_number = histogram_splits(residuals)
+    buckets = bucketize(residuals, np.zeros(len(residuals), dtype=bool), splits)
+    if len(buckets_number) == 1:
+        values = [int(np.sum(buckets == 1))] if np.any(buckets == 1) else []
+    else:
+        values = [int(count) for count in np.bincount(buckets) if count > 0]
+    return {'buckets': [float(b) for b in buckets_spacing], 'values': values}
+
+
+def _column_values(dataset: LocalDataset, column: str, values: np.ndarray) -> List:
+    # values keep the type of their column, as collected by Spark
+    if dataset.types[column] == ColumnType.INT:
+        return [int(x) for x in values]
+    return [float(x) for x in values]
+
+
+def _points(
+    standardized: List[float], predictions: List, targets: List
+) -> Dict[str, List]:
+    """Keep RESIDUAL_POINTS_BUDGET points ordered by the hash of their values.
+
+    Same order of the xxhash64 of the Spark jobs, ties are ordered by the values.
+    """
+    points = sorted(
+        zip(standardized, predictions, targets),
+        key=lambda point: (xxhash64(*point), *point),
+    )[:RESIDUAL_POINTS_BUDGET]
+    return {
+        'standardized_residuals': [point[0] for point in points],
+        'predictions': [point[1] for point in points],
+        'targets': [point[2] for point in points],
+    }
+
+
+def residual_metrics(
+    dataset: LocalDataset,
+    y: np.ndarray,
+    y_hat: np.ndarray,
+    statistics: Dict[str, float],
+) -> Dict:
+    model = dataset.model
+    n = statistics['n']
+    residuals = y - y_hat
+    # moments derived from the sums as StandardScaler, 0 with less than two rows
+    mean = (statistics['sum_y'] - statistics['sum_y_hat']) / n if n > 0 else 0.0
+    variance = (
+        max(statistics['sum_squared_error'] - n * mean * mean, 0.0) / (n - 1)
+        if n > 1
+        else 0.0
+    )
+    std = math.sqrt(variance)
+    standardized = (
+        ((residuals - mean) / std).tolist() if std > 0 else [0.0] * len(residuals)
+    )
+    # one sample test of the residuals against the standard normal, as Spark
+    statistic = float(stats.kstest(residuals, 'norm').statistic)
+    if n > 0:
+        mean_y = statistics['sum_y'] / n
+        mean_y_hat = statistics['sum_y_hat'] / n
+        covariance = statistics['sum_y_y_hat'] - n * mean_y * mean_y_hat
+        variance_y = max(statistics['sum_y2'] - n * mean_y * mean_y, 0.0)
+        variance_y_hat = max(
+            statistics['sum_y_hat2'] - n * mean_y_hat * mean_y_hat, 0.0
+        )
+        correlation = _divide(covariance, math.sqrt(variance_y * variance_y_hat))
+        coefficient = covariance / variance_y if variance_y > 0 else 0.0
+        regression_line = {
+            'coefficient': coefficient,
+            'intercept': mean_y_hat - coefficient * mean_y,
+        }
+    else:
+        correlation = float('nan')
+        regression_line = {'coefficient': float('nan'), 'intercept': float('nan')}
+    return {
+        'ks': {'p_value': ks_p_value(statistic, n), 'statistic': statistic},
+        'correlation_coefficient': correlation,
+        'histogram': _residual_histogram(residuals),
+        **_points(
+            standardized,
+            _column_values(dataset, model.outputs.prediction.name, y_hat),
+            _column_values(dataset, model.target.name, y),
+        ),
+        'regression_line': regression_line,
+    }
+
+
+def regression_reference_model_quality(dataset: LocalDataset) -> Dict:
+    y, y_hat = _regression_rows(dataset)
+    statistics = regression_statistics(y, y_hat)
+    metrics = regression_metrics(dataset, statistics)
+    metrics['residuals'] = residual_metrics(dataset, y, y_hat, statistics)
+    return metrics
+
+
+def regression_current_model_quality(dataset: LocalDataset) -> Dict:
+    model = dataset.model
+    y, y_hat = _regression_rows(dataset)
+    time_groups = np.array(dataset.time_groups(), dtype=object)
+    valid = dataset.is_valid(model.target.name) & dataset.is_valid(
+        model.outputs.prediction.name
+    )
+    metrics_by_group = {
+        group: regression_metrics(
+            dataset,
+            regression_statistics(
+                dataset.values(model.target.name)[valid & (time_groups == group)],
+                dataset.values(model.outputs.prediction.name)[
+                    valid & (time_groups == group)
+                ],
+            ),
+        )
+        for group in set(time_groups)
+    }
+    statistics = regression_statistics(y, y_hat)
+    global_metrics = regression_metrics(dataset, statistics)
+    global_metrics['residuals'] = residual_metrics(dataset, y, y_hat, statistics)
+    return {
+        'global_metrics': global_metrics,
+        'grouped_metrics': {
+            metric: _time_series(
+                {group: metrics[metric] for group, metrics in metrics_by_group.items()}
+            )
+            for metric in REGRESSION_METRICS
+        },
+    }
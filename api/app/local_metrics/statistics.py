@@ -0,0 +1,32 @@
+from typing import Dict
+
+from app.local_metrics.dataset import LocalDataset, all_variables
+from app.models.inferred_schema_dto import FieldType
+
+
+def calculate_statistics(dataset: LocalDataset) -> Dict:
+    """Compute the statistics of a dataset, duplicate rows ignore the timestamp."""
+    variables = all_variables(dataset.model)
+    count = dataset.count
+    missing_cells = int(sum(dataset.missing(c).sum() for c in dataset.types))
+    columns = [c for c in dataset.types if c != dataset.model.timestamp.name]
+    duplicate_rows = (
+        count - len(dataset.dataframe[columns].drop_duplicates()) if columns else 0
+    )
+
+    # percentages of an empty dataset are null, as a division by zero in Spark
+    return {
+        'n_variables': len(variables),
+        'n_observations': count,
+        'missing_cells': missing_cells,
+        'missing_cells_perc': missing_cells / (len(variables) * count) * 100
+        if count
+        else None,
+        'duplicate_rows': duplicate_rows,
+        'duplicate_rows_perc': duplicate_rows / count * 100 if count else None,
+        'numeric': len([v for v in variables if v.field_type == FieldType.numerical]),
+        'categorical': len(
+            [v for v in variables if v.field_type == FieldType.categorical]
+        ),
+        'datetime': len([v for v in variables if v.field_type == FieldType.datetime]),
+    }
@@ -32,6 +32,7 @@ from app.routes.model_route import ModelRoute
 from app.routes.spark_job_route import SparkJobRoute
 from app.routes.upload_dataset_route import UploadDatasetRoute
 from app.services.file_service import FileService
+from app.services.local_metrics_service import LocalMetricsService
 from app.services.metrics_service import MetricsService
 from app.services.model_service import ModelService
 from app.services.spark_k8s_service import SparkK8SService
@@ -79,12 +80,20 @@ else:
         region_name=s3_config.aws_region,
     )
 
+local_metrics_service = LocalMetricsService(
+    reference_dataset_dao,
+    reference_dataset_metrics_dao,
+    current_dataset_dao,
+    current_dataset_metrics_dao,
+    s3_client,
+)
 file_service = FileService(
     reference_dataset_dao,
     current_dataset_dao,
     model_service,
     s3_client,
     spark_k8s_client,
+    local_metrics_service,
 )
 metrics_service = MetricsService(
     reference_dataset_metrics_dao=reference_dataset_metrics_dao,
@@ -103,6 +112,7 @@ async def lifespan(fastapi: FastAPI):
     database.init_mappings()
     yield
     logger.info('Stopping service ...')
+    local_metrics_service.shutdown()
 
 
 app = FastAPI(title='Radicalbit Platform', lifespan=lifespan)
@@ -7,6 +7,7 @@ from pydantic.alias_generators import to_camel
 
 from app.db.tables.current_dataset_table import CurrentDataset
 from app.db.tables.reference_dataset_table import ReferenceDataset
+from app.models.dataset_format import DatasetFormat
 
 
 class ReferenceDatasetDTO(BaseModel):
@@ -59,6 +60,11 @@ class FileReference(BaseModel):
     file_url: str
     separator: str = ','
     correlation_id_column: Optional[str] = None
+    # detected from the file extension if not given
+    file_format: Optional[DatasetFormat] = None
+
+    def get_file_format(self) -> DatasetFormat:
+        return self.file_format or DatasetFormat.from_file_name(self.file_url)
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -0,0 +1,18 @@
+from enum import Enum
+import pathlib
+
+
+class DatasetFormat(str, Enum):
+    CSV = 'csv'
+    PARQUET = 'parquet'
+    ORC = 'orc'
+
+    @staticmethod
+    def from_file_name(file_name: str) -> 'DatasetFormat':
+        match pathlib.Path(file_name).suffix.lower():
+            case '.parquet':
+                return DatasetFormat.PARQUET
+            case '.orc':
+                return DatasetFormat.ORC
+            case _:
+                return DatasetFormat.CSV
@@ -12,6 +12,8 @@ class MedianMetrics(BaseModel):
     perc_25: Optional[float] = None
     median: Optional[float] = None
     perc_75: Optional[float] = None
+    quantile_mode: Optional[str] = None
+    relative_error: Optional[float] = None
 
     model_config = ConfigDict(
         populate_by_name=True, alias_generator=to_camel, protected_namespaces=()
@@ -87,7 +89,8 @@ class NumericalTargetMetrics(FeatureMetrics):
 
 
 class CategoryFrequency(BaseModel):
-    name: str
+    # None for the sum of the categories over the top k
+    name: Optional[str] = None
     count: int
     frequency: Optional[float] = None
 
@@ -30,8 +30,17 @@ class FeatureMetrics(BaseModel):
     model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
 
 
+class DriftSampling(BaseModel):
+    reference_size: int
+    current_size: int
+    stratified: bool
+
+    model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
+
+
 class Drift(BaseModel):
     feature_metrics: List[FeatureMetrics]
+    sampling: Optional[DriftSampling] = None
 
     model_config = ConfigDict(populate_by_name=True, alias_generator=to_camel)
 
@@ -21,6 +21,7 @@ from app.db.tables.reference_dataset_metrics_table import ReferenceDatasetMetric
 from app.db.tables.reference_dataset_table import ReferenceDataset
 from app.models.dataset_dto import (
     CurrentDatasetDTO,
+    DatasetFormat,
     FileReference,
     OrderType,
     ReferenceDatasetDTO,
@@ -37,6 +38,7 @@ from app.models.inferred_schema_dto import (
     SupportedTypes,
 )
 from app.models.job_status import JobStatus
+from app.services.local_metrics_service import LocalMetricsService
 from app.services.model_service import ModelService
 
 logger = logging.getLogger(get_config().log_config.logger_name)
@@ -50,6 +52,7 @@ class FileService:
         model_service: ModelService,
         s3_client: boto3.client,
         spark_k8s_client: SparkOnK8S,
+        local_metrics_service: Optional[LocalMetricsService] = None,
     ) -> 'FileService':
         self.rd_dao = reference_dataset_dao
         self.cd_dao = current_dataset_dao
@@ -58,6 +61,7 @@ class FileService:
         s3_config = get_config().s3_config
         self.bucket_name = s3_config.s3_bucket_name
         self.spark_k8s_client = spark_k8s_client
+        self.local_metrics_service = local_metrics_service
         logger.info('File Service Initialized.')
 
     def upload_reference_file(
@@ -102,28 +106,38 @@ class FileService:
                     path=path,
                     date=datetime.datetime.now(tz=datetime.UTC),
                     status=JobStatus.IMPORTING,
+                    format=DatasetFormat.from_file_name(_f_name),
                 )
             )
 
             logger.debug('File %s has been correctly stored in the db', inserted_file)
 
-            spark_config = get_config().spark_config
-            self.spark_k8s_client.submit_app(
-                image=spark_config.spark_image,
-                app_path=spark_config.spark_reference_app_path,
-                app_arguments=[
-                    model_out.model_dump_json(),
-                    path.replace('s3://', 's3a://'),
-                    str(inserted_file.uuid),
-                    ReferenceDatasetMetrics.__tablename__,
-                ],
-                app_name=str(model_out.uuid),
-                namespace=spark_config.spark_namespace,
-                service_account=spark_config.spark_service_account,
-                image_pull_policy=spark_config.spark_image_pull_policy,
-                app_waiter='no_wait',
-                secret_values=create_secrets(),
-            )
+            if self._computes_locally(
+                csv_file.size, DatasetFormat.from_file_name(_f_name)
+            ):
+                self.local_metrics_service.submit_reference_metrics(
+                    model_out, path, inserted_file.uuid
+                )
+            else:
+                spark_config = get_config().spark_config
+                self.spark_k8s_client.submit_app(
+                    image=spark_config.spark_image,
+                    app_path=spark_config.spark_reference_app_path,
+                    app_arguments=[
+                        model_out.model_dump_json(),
+                        path.replace('s3://', 's3a://'),
+                        str(inserted_file.uuid),
+                        ReferenceDatasetMetrics.__tablename__,
+                        '--dataset-format',
+                        DatasetFormat.from_file_name(_f_name).value,
+                    ],
+                    app_name=str(model_out.uuid),
+                    namespace=spark_config.spark_namespace,
+                    service_account=spark_config.spark_service_account,
+                    image_pull_policy=spark_config.spark_image_pull_policy,
+                    app_waiter='no_wait',
+                    secret_values=create_secrets(),
+                )
 
             return ReferenceDatasetDTO.from_reference_dataset(inserted_file)
 
@@ -149,7 +163,9 @@ class FileService:
             url_parts = file_ref.file_url.replace('s3://', '').split('/')
             # check if file exists in S3 with a HEAD operation.
             # if exists then we could update DB otherwise an exception will be raised
-            self.s3_client.head_object(Bucket=url_parts[0], Key='/'.join(url_parts[1:]))
+            s3_object = self.s3_client.head_object(
+                Bucket=url_parts[0], Key='/'.join(url_parts[1:])
+            )
 
             inserted_file = self.rd_dao.insert_reference_dataset(
                 ReferenceDataset(
@@ -158,27 +174,37 @@ class FileService:
                     path=file_ref.file_url,
                     date=datetime.datetime.now(tz=datetime.UTC),
                     status=JobStatus.IMPORTING,
+                    format=file_ref.get_file_format(),
                 )
             )
             logger.debug('File %s has been correctly stored in the db', inserted_file)
 
-            spark_config = get_config().spark_config
-            self.spark_k8s_client.submit_app(
-                image=spark_config.spark_image,
-                app_path=spark_config.spark_reference_app_path,
-                app_arguments=[
-                    model_out.model_dump_json(),
-                    file_ref.file_url.replace('s3://', 's3a://'),
-                    str(inserted_file.uuid),
-                    ReferenceDatasetMetrics.__tablename__,
-                ],
-                app_name=str(model_out.uuid),
-                namespace=spark_config.spark_namespace,
-                service_account=spark_config.spark_service_account,
-                image_pull_policy=spark_config.spark_image_pull_policy,
-                app_waiter='no_wait',
-                secret_values=create_secrets(),
-            )
+            if self._computes_locally(
+                s3_object.get('ContentLength'), file_ref.get_file_format()
+            ):
+                self.local_metrics_service.submit_reference_metrics(
+                    model_out, file_ref.file_url, inserted_file.uuid
+                )
+            else:
+                spark_config = get_config().spark_config
+                self.spark_k8s_client.submit_app(
+                    image=spark_config.spark_image,
+                    app_path=spark_config.spark_reference_app_path,
+                    app_arguments=[
+                        model_out.model_dump_json(),
+                        file_ref.file_url.replace('s3://', 's3a://'),
+                        str(inserted_file.uuid),
+                        ReferenceDatasetMetrics.__tablename__,
+                        '--dataset-format',
+                        file_ref.get_file_format().value,
+                    ],
+                    app_name=str(model_out.uuid),
+                    namespace=spark_config.spark_namespace,
+                    service_account=spark_config.spark_service_account,
+                    image_pull_policy=spark_config.spark_image_pull_policy,
+                    app_waiter='no_wait',
+                    secret_values=create_secrets(),
+                )
 
             return ReferenceDatasetDTO.from_reference_dataset(inserted_file)
 
@@ -251,24 +277,37 @@ class FileService:
 
             logger.debug('File %s has been correctly stored in the db', inserted_file)
 
-            spark_config = get_config().spark_config
-            self.spark_k8s_client.submit_app(
-                image=spark_config.spark_image,
-                app_path=spark_config.spark_current_app_path,
-                app_arguments=[
-                    model_out.model_dump_json(),
-                    path.replace('s3://', 's3a://'),
-                    str(inserted_file.uuid),
-                    reference_dataset.path.replace('s3://', 's3a://'),
-                    CurrentDatasetMetrics.__tablename__,
-                ],
-                app_name=str(model_out.uuid),
-                namespace=spark_config.spark_namespace,
-                service_account=spark_config.spark_service_account,
-                image_pull_policy=spark_config.spark_image_pull_policy,
-                app_waiter='no_wait',
-                secret_values=create_secrets(),
-            )
+            if self._computes_locally(
+                csv_file.size,
+                DatasetFormat.from_file_name(_f_name),
+                reference_dataset,
+            ):
+                self.local_metrics_service.submit_current_metrics(
+                    model_out, path, inserted_file.uuid, reference_dataset.path
+                )
+            else:
+                spark_config = get_config().spark_config
+                self.spark_k8s_client.submit_app(
+                    image=spark_config.spark_image,
+                    app_path=spark_config.spark_current_app_path,
+                    app_arguments=[
+                        model_out.model_dump_json(),
+                        path.replace('s3://', 's3a://'),
+                        str(inserted_file.uuid),
+                        reference_dataset.path.replace('s3://', 's3a://'),
+                        CurrentDatasetMetrics.__tablename__,
+                        '--current-dataset-format',
+                        DatasetFormat.from_file_name(_f_name).value,
+                        '--reference-dataset-format',
+                        DatasetFormat(reference_dataset.format).value,
+                    ],
+                    app_name=str(model_out.uuid),
+                    namespace=spark_config.spark_namespace,
+                    service_account=spark_config.spark_service_account,
+                    image_pull_policy=spark_config.spark_image_pull_policy,
+                    app_waiter='no_wait',
+                    secret_values=create_secrets(),
+                )
 
             return CurrentDatasetDTO.from_current_dataset(inserted_file)
 
@@ -296,7 +335,9 @@ class FileService:
             url_parts = file_ref.file_url.replace('s3://', '').split('/')
             # check if file exists in S3 with a HEAD operation.
             # if exists then we could update DB otherwise an exception will be raised
-            self.s3_client.head_object(Bucket=url_parts[0], Key='/'.join(url_parts[1:]))
+            s3_object = self.s3_client.head_object(
+                Bucket=url_parts[0], Key='/'.join(url_parts[1:])
+            )
 
             inserted_file = self.cd_dao.insert_current_dataset(
                 CurrentDataset(
@@ -310,24 +351,40 @@ class FileService:
             )
             logger.debug('File %s has been correctly stored in the db', inserted_file)
 
-            spark_config = get_config().spark_config
-            self.spark_k8s_client.submit_app(
-                image=spark_config.spark_image,
-                app_path=spark_config.spark_current_app_path,
-                app_arguments=[
-                    model_out.model_dump_json(),
-                    file_ref.file_url.replace('s3://', 's3a://'),
-                    str(inserted_file.uuid),
-                    reference_dataset.path.replace('s3://', 's3a://'),
-                    CurrentDatasetMetrics.__tablename__,
-                ],
-                app_name=str(model_out.uuid),
-                namespace=spark_config.spark_namespace,
-                service_account=spark_config.spark_service_account,
-                image_pull_policy=spark_config.spark_image_pull_policy,
-                app_waiter='no_wait',
-                secret_values=create_secrets(),
-            )
+            if self._computes_locally(
+                s3_object.get('ContentLength'),
+                file_ref.get_file_format(),
+                reference_dataset,
+            ):
+                self.local_metrics_service.submit_current_metrics(
+                    model_out,
+                    file_ref.file_url,
+                    inserted_file.uuid,
+                    reference_dataset.path,
+                )
+            else:
+                spark_config = get_config().spark_config
+                self.spark_k8s_client.submit_app(
+                    image=spark_config.spark_image,
+                    app_path=spark_config.spark_current_app_path,
+                    app_arguments=[
+                        model_out.model_dump_json(),
+                        file_ref.file_url.replace('s3://', 's3a://'),
+                        str(inserted_file.uuid),
+                        reference_dataset.path.replace('s3://', 's3a://'),
+                        CurrentDatasetMetrics.__tablename__,
+                        '--current-dataset-format',
+                        file_ref.get_file_format().value,
+                        '--reference-dataset-format',
+                        DatasetFormat(reference_dataset.format).value,
+                    ],
+                    app_name=str(model_out.uuid),
+                    namespace=spark_config.spark_namespace,
+                    service_account=spark_config.spark_service_account,
+                    image_pull_policy=spark_config.spark_image_pull_policy,
+                    app_waiter='no_wait',
+                    secret_values=create_secrets(),
+                )
 
             return CurrentDatasetDTO.from_current_dataset(inserted_file)
 
@@ -344,6 +401,32 @@ class FileService:
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e)) from e
 
+    def _computes_locally(
+        self,
+        size: Optional[int],
+        dataset_format: DatasetFormat,
+        reference_dataset: Optional[ReferenceDataset] = None,
+    ) -> bool:
+        """Check if the metrics of a dataset are computed in process instead of by Spark.
+
+        The reference of a current dataset must be small enough too, because both are
+        read in memory.
+        """
+        if self.local_metrics_service is None:
+            return False
+        if not self.local_metrics_service.accepts(size, dataset_format):
+            return False
+        if reference_dataset is None:
+            return True
+        url_parts = reference_dataset.path.replace('s3://', '').split('/')
+        reference_object = self.s3_client.head_object(
+            Bucket=url_parts[0], Key='/'.join(url_parts[1:])
+        )
+        return self.local_metrics_service.accepts(
+            reference_object.get('ContentLength'),
+            DatasetFormat(reference_dataset.format),
+        )
+
     def get_all_reference_datasets_by_model_uuid_paginated(
         self,
         model_uuid: UUID,
@@ -408,6 +491,8 @@ class FileService:
     @staticmethod
     def infer_schema(csv_file: UploadFile, sep: str = ',') -> InferredSchemaDTO:
         FileService.validate_file(csv_file, sep)
+        if DatasetFormat.from_file_name(csv_file.filename) != DatasetFormat.CSV:
+            raise InvalidFileException('Schema can be inferred only from csv files')
         with csv_file.file as f:
             df = pd.read_csv(f, sep=sep)
 
@@ -462,12 +547,27 @@ class FileService:
                 f'File has not a valid extension. Valid extensions are: {*file_upload_config.accepted_file_types,}'
             )
 
-        df = pd.read_csv(csv_file.file, sep=sep)
-        col_errors = [col for col in columns if col not in df.columns]
-        if len(col_errors) > 0:
-            raise InvalidFileException(
-                f'Columns {*col_errors,} not found in file {_f_name}'
-            )
+        match DatasetFormat.from_file_name(_f_name):
+            case DatasetFormat.CSV:
+                df = pd.read_csv(csv_file.file, sep=sep)
+                col_errors = [col for col in columns if col not in df.columns]
+                if len(col_errors) > 0:
+                    raise InvalidFileException(
+                        f'Columns {*col_errors,} not found in file {_f_name}'
+                    )
+            # columnar files are only checked by their magic number,
+            # columns are read by the Spark jobs that select the model ones
+            case DatasetFormat.PARQUET:
+                FileService.validate_magic_number(csv_file, b'PAR1')
+            case DatasetFormat.ORC:
+                FileService.validate_magic_number(csv_file, b'ORC')
 
         csv_file.file.flush()
         csv_file.file.seek(0)
+
+    @staticmethod
+    def validate_magic_number(data_file: UploadFile, magic_number: bytes) -> None:
+        if data_file.file.read(len(magic_number)) != magic_number:
+            raise InvalidFileException(
+                f'File {data_file.filename} is not a valid {pathlib.Path(data_file.filename).suffix} file'
+            )
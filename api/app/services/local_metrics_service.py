@@ -0,0 +1,140 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
+import logging
+from typing import Optional
+from uuid import UUID
+
+import boto3
+
+from app.core.config.config import get_config
+from app.db.dao.current_dataset_dao import CurrentDatasetDAO
+from app.db.dao.current_dataset_metrics_dao import CurrentDatasetMetricsDAO
+from app.db.dao.reference_dataset_dao import ReferenceDatasetDAO
+from app.db.dao.reference_dataset_metrics_dao import ReferenceDatasetMetricsDAO
+from app.db.tables.current_dataset_metrics_table import CurrentDatasetMetrics
+from app.db.tables.reference_dataset_metrics_table import ReferenceDatasetMetrics
+from app.local_metrics import (
+    LocalDataset,
+    compute_current_metrics,
+    compute_reference_metrics,
+)
+from app.models.dataset_dto import DatasetFormat
+from app.models.job_status import JobStatus
+from app.models.model_dto import ModelOut
+
+logger = logging.getLogger(get_config().log_config.logger_name)
+
+
+class LocalMetricsService:
+    """Compute the metrics of small csv datasets in process, without the Spark jobs."""
+
+    def __init__(
+        self,
+        reference_dataset_dao: ReferenceDatasetDAO,
+        reference_dataset_metrics_dao: ReferenceDatasetMetricsDAO,
+        current_dataset_dao: CurrentDatasetDAO,
+        current_dataset_metrics_dao: CurrentDatasetMetricsDAO,
+        s3_client: boto3.client,
+    ) -> 'LocalMetricsService':
+        self.rd_dao = reference_dataset_dao
+        self.rdm_dao = reference_dataset_metrics_dao
+        self.cd_dao = current_dataset_dao
+        self.cdm_dao = current_dataset_metrics_dao
+        self.s3_client = s3_client
+        local_metrics_config = get_config().local_metrics_config
+        self.max_bytes = local_metrics_config.max_bytes
+        self.executor = ThreadPoolExecutor(
+            max_workers=local_metrics_config.workers,
+            thread_name_prefix='local-metrics',
+        )
+        logger.info('Local Metrics Service Initialized.')
+
+    def accepts(self, size: Optional[int], dataset_format: DatasetFormat) -> bool:
+        """Check if a dataset is small enough to have its metrics computed in process."""
+        return (
+            dataset_format == DatasetFormat.CSV
+            and size is not None
+            and size < self.max_bytes
+        )
+
+    def submit_reference_metrics(
+        self, model: ModelOut, reference_path: str, reference_uuid: UUID
+    ) -> Future:
+        return self.executor.submit(
+            self.calculate_reference_metrics, model, reference_path, reference_uuid
+        )
+
+    def submit_current_metrics(
+        self,
+        model: ModelOut,
+        current_path: str,
+        current_uuid: UUID,
+        reference_path: str,
+    ) -> Future:
+        return self.executor.submit(
+            self.calculate_current_metrics,
+            model,
+            current_path,
+            current_uuid,
+            reference_path,
+        )
+
+    def calculate_reference_metrics(
+        self, model: ModelOut, reference_path: str, reference_uuid: UUID
+    ) -> None:
+        try:
+            metrics = compute_reference_metrics(
+                self.read_dataset(model, reference_path)
+            )
+            self.rdm_dao.insert_reference_metrics(
+                ReferenceDatasetMetrics(
+                    reference_uuid=reference_uuid,
+                    model_quality=json.loads(metrics['MODEL_QUALITY']),
+                    data_quality=json.loads(metrics['DATA_QUALITY']),
+                    statistics=json.loads(metrics['STATISTICS']),
+                )
+            )
+            self.rd_dao.update_reference_dataset_status(
+                reference_uuid, JobStatus.SUCCEEDED
+            )
+            logger.debug('Reference metrics of %s computed in process', reference_uuid)
+        except Exception:
+            logger.exception('Reference metrics of %s not computed', reference_uuid)
+            self.rd_dao.update_reference_dataset_status(reference_uuid, JobStatus.ERROR)
+
+    def calculate_current_metrics(
+        self,
+        model: ModelOut,
+        current_path: str,
+        current_uuid: UUID,
+        reference_path: str,
+    ) -> None:
+        try:
+            metrics = compute_current_metrics(
+                self.read_dataset(model, current_path),
+                self.read_dataset(model, reference_path),
+            )
+            self.cdm_dao.insert_current_dataset_metrics(
+                CurrentDatasetMetrics(
+                    current_uuid=current_uuid,
+                    model_quality=json.loads(metrics['MODEL_QUALITY']),
+                    data_quality=json.loads(metrics['DATA_QUALITY']),
+                    drift=json.loads(metrics['DRIFT']),
+                    statistics=json.loads(metrics['STATISTICS']),
+                )
+            )
+            self.cd_dao.update_current_dataset_status(current_uuid, JobStatus.SUCCEEDED)
+            logger.debug('Current metrics of %s computed in process', current_uuid)
+        except Exception:
+            logger.exception('Current metrics of %s not computed', current_uuid)
+            self.cd_dao.update_current_dataset_status(current_uuid, JobStatus.ERROR)
+
+    def read_dataset(self, model: ModelOut, path: str) -> LocalDataset:
+        url_parts = path.replace('s3://', '').split('/')
+        s3_object = self.s3_client.get_object(
+            Bucket=url_parts[0], Key='/'.join(url_parts[1:])
+        )
+        return LocalDataset.read_csv(model, s3_object['Body'])
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=True)
@@ -112,3 +112,7 @@ def get_current_sample_csv_file() -> UploadFile:
     )
     df = pd.read_csv(data, sep=',')
     return UploadFile(BytesIO(df.to_csv(index=False).encode()), filename='sample.csv')
+
+
+def get_sample_columnar_file(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(BytesIO(content), filename=filename)
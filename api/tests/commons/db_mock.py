@@ -7,6 +7,7 @@ from app.db.tables.current_dataset_table import CurrentDataset
 from app.db.tables.model_table import Model
 from app.db.tables.reference_dataset_metrics_table import ReferenceDatasetMetrics
 from app.db.tables.reference_dataset_table import ReferenceDataset
+from app.models.dataset_format import DatasetFormat
 from app.models.job_status import JobStatus
 from app.models.model_dto import (
     ColumnDefinition,
@@ -142,6 +143,7 @@ def get_sample_reference_dataset(
     model_uuid: uuid.UUID = MODEL_UUID,
     path: str = 'reference/test.csv',
     status: str = JobStatus.IMPORTING.value,
+    dataset_format: str = DatasetFormat.CSV.value,
 ) -> ReferenceDataset:
     return ReferenceDataset(
         uuid=uuid,
@@ -149,6 +151,7 @@ def get_sample_reference_dataset(
         path=path,
         date=datetime.datetime.now(tz=datetime.UTC),
         status=status,
+        format=dataset_format,
     )
 
 
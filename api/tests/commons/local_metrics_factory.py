@@ -0,0 +1,160 @@
+import datetime
+import importlib.util
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import uuid
+
+import deepdiff
+
+from app.local_metrics.dataset import LocalDataset
+from app.local_metrics.jobs import to_json_string
+from app.models.inferred_schema_dto import FieldType, SupportedTypes
+from app.models.job_status import JobStatus
+from app.models.model_dto import (
+    ColumnDefinition,
+    DataType,
+    Granularity,
+    ModelOut,
+    ModelType,
+    OutputType,
+)
+
+# datasets and expected results of the Spark jobs tests, matched by the local metrics
+SPARK_TESTS_DIR = Path(__file__).parents[3] / 'spark' / 'tests'
+# results of the Spark services tests are dumped with exclude_none, so that these
+# fields, null in the metrics, are missing from them
+SPARK_TESTS_DROPPED_NULLS = {
+    r"\['relative_error'\]$": 'null with the EXACT quantile mode',
+    r"\['histogram'\]\['current_values'\]$": 'null in the histograms of a reference',
+}
+
+DEFAULT_FEATURES = (
+    ('cat1', SupportedTypes.string),
+    ('cat2', SupportedTypes.string),
+    ('num1', SupportedTypes.float),
+    ('num2', SupportedTypes.float),
+)
+
+
+def spark_results(name: str):
+    spec = importlib.util.spec_from_file_location(
+        name, SPARK_TESTS_DIR / 'results' / f'{name}.py'
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def read_dataset(model: ModelOut, path: str) -> LocalDataset:
+    return LocalDataset.read_csv(model, str(SPARK_TESTS_DIR / 'resources' / path))
+
+
+def column(
+    name: str, column_type: SupportedTypes, field_type: Optional[FieldType] = None
+) -> ColumnDefinition:
+    match column_type:
+        case _ if field_type:
+            pass
+        case SupportedTypes.datetime:
+            field_type = FieldType.datetime
+        case SupportedTypes.string | SupportedTypes.bool:
+            field_type = FieldType.categorical
+        case _:
+            field_type = FieldType.numerical
+    return ColumnDefinition(name=name, type=column_type, field_type=field_type)
+
+
+def get_model(
+    model_type: ModelType,
+    features: List[ColumnDefinition],
+    target: ColumnDefinition,
+    prediction: ColumnDefinition,
+    prediction_proba: Optional[ColumnDefinition] = None,
+    timestamp: ColumnDefinition = column('datetime', SupportedTypes.datetime),
+    granularity: Granularity = Granularity.HOUR,
+) -> ModelOut:
+    output = [prediction] + ([prediction_proba] if prediction_proba else [])
+    return ModelOut(
+        uuid=uuid.uuid4(),
+        name='model',
+        description='description',
+        model_type=model_type,
+        data_type=DataType.TABULAR,
+        granularity=granularity,
+        features=features,
+        outputs=OutputType(
+            prediction=prediction, prediction_proba=prediction_proba, output=output
+        ),
+        target=target,
+        timestamp=timestamp,
+        frameworks='framework',
+        algorithm='algorithm',
+        created_at=str(datetime.datetime.now()),
+        updated_at=str(datetime.datetime.now()),
+        latest_reference_uuid=None,
+        latest_current_uuid=None,
+        latest_reference_job_status=JobStatus.IMPORTING,
+        latest_current_job_status=JobStatus.MISSING_CURRENT,
+    )
+
+
+def get_binary_model(
+    features: Tuple[Tuple[str, SupportedTypes], ...] = DEFAULT_FEATURES,
+    granularity: Granularity = Granularity.HOUR,
+    target_type: SupportedTypes = SupportedTypes.float,
+) -> ModelOut:
+    return get_model(
+        ModelType.BINARY,
+        features=[column(name, column_type) for name, column_type in features],
+        target=column('target', target_type),
+        prediction=column('prediction', SupportedTypes.float),
+        prediction_proba=column('prediction_proba', SupportedTypes.float),
+        granularity=granularity,
+    )
+
+
+def get_multiclass_model(label_type: SupportedTypes) -> ModelOut:
+    return get_model(
+        ModelType.MULTI_CLASS,
+        features=[column(name, column_type) for name, column_type in DEFAULT_FEATURES],
+        target=column('target', label_type),
+        prediction=column('prediction', label_type),
+    )
+
+
+def get_bike_model(granularity: Granularity) -> ModelOut:
+    return get_model(
+        ModelType.REGRESSION,
+        features=[
+            *(
+                column(name, SupportedTypes.int, FieldType.categorical)
+                for name in ['season', 'yr', 'mnth', 'holiday', 'weekday', 'workingday']
+            ),
+            *(
+                column(name, SupportedTypes.float)
+                for name in ['weathersit', 'temp', 'atemp', 'hum', 'windspeed']
+            ),
+        ],
+        target=column('ground_truth', SupportedTypes.int),
+        prediction=column('predictions', SupportedTypes.float),
+        timestamp=column('dteday', SupportedTypes.datetime),
+        granularity=granularity,
+    )
+
+
+def assert_parity(
+    metrics: Dict,
+    expected: Dict,
+    exclude_paths: Dict[str, str] = SPARK_TESTS_DROPPED_NULLS,
+):
+    """Assert that the JSON of the metrics matches the Spark jobs expected results.
+
+    exclude_paths maps the regex of every path that is not compared to its reason.
+    """
+    diff = deepdiff.DeepDiff(
+        json.loads(to_json_string(metrics)),
+        json.loads(to_json_string(expected)),
+        exclude_regex_paths=list(exclude_paths),
+    )
+    assert not diff, diff
@@ -6,6 +6,7 @@ from fastapi_pagination import Params
 from app.db.dao.current_dataset_dao import CurrentDatasetDAO
 from app.db.dao.model_dao import ModelDAO
 from app.db.tables.current_dataset_table import CurrentDataset
+from app.models.job_status import JobStatus
 from tests.commons import db_mock
 from tests.commons.db_integration import DatabaseIntegration
 
@@ -30,6 +31,22 @@ class CurrentDatasetDAOTest(DatabaseIntegration):
         inserted = self.current_dataset_dao.insert_current_dataset(to_insert)
         assert inserted == to_insert
 
+    def test_update_current_dataset_status(self):
+        model = self.model_dao.insert(db_mock.get_sample_model())
+        to_insert = CurrentDataset(
+            uuid=uuid4(),
+            model_uuid=model.uuid,
+            path='frank_file.csv',
+            correlation_id_column='some_column',
+            date=datetime.datetime.now(tz=datetime.UTC),
+        )
+
+        inserted = self.current_dataset_dao.insert_current_dataset(to_insert)
+        rows = self.current_dataset_dao.update_current_dataset_status(
+            inserted.uuid, JobStatus.SUCCEEDED
+        )
+        assert rows == 1
+
     def test_get_current_dataset_by_model_uuid(self):
         model = self.model_dao.insert(db_mock.get_sample_model())
         to_insert = CurrentDataset(
@@ -6,6 +6,7 @@ from fastapi_pagination import Params
 from app.db.dao.model_dao import ModelDAO
 from app.db.dao.reference_dataset_dao import ReferenceDatasetDAO
 from app.db.tables.reference_dataset_table import ReferenceDataset
+from app.models.job_status import JobStatus
 from tests.commons import db_mock
 from tests.commons.db_integration import DatabaseIntegration
 
@@ -29,6 +30,21 @@ class ReferenceDatasetDAOTest(DatabaseIntegration):
         inserted = self.reference_dataset_dao.insert_reference_dataset(to_insert)
         assert inserted == to_insert
 
+    def test_update_reference_dataset_status(self):
+        model = self.model_dao.insert(db_mock.get_sample_model())
+        to_insert = ReferenceDataset(
+            uuid=uuid4(),
+            model_uuid=model.uuid,
+            path='frank_file.csv',
+            date=datetime.datetime.now(tz=datetime.UTC),
+        )
+
+        inserted = self.reference_dataset_dao.insert_reference_dataset(to_insert)
+        rows = self.reference_dataset_dao.update_reference_dataset_status(
+            inserted.uuid, JobStatus.SUCCEEDED
+        )
+        assert rows == 1
+
     def test_get_reference_dataset_by_model_uuid(self):
         model = self.model_dao.insert(db_mock.get_sample_model())
         to_insert = ReferenceDataset(
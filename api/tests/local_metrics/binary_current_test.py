@@ -0,0 +1,117 @@
+import pytest
+
+from app.local_metrics.data_quality import classification_data_quality
+from app.local_metrics.model_quality import binary_current_model_quality
+from app.local_metrics.statistics import calculate_statistics
+from app.models.inferred_schema_dto import SupportedTypes
+from app.models.model_dto import Granularity
+from tests.commons.local_metrics_factory import (
+    assert_parity,
+    get_binary_model,
+    read_dataset,
+    spark_results,
+)
+
+res = spark_results('binary_current_results')
+
+heart_features = (
+    ('age', SupportedTypes.int),
+    ('sex', SupportedTypes.string),
+    ('chest_pain_type', SupportedTypes.int),
+    ('resting_blood_pressure', SupportedTypes.int),
+    ('cholesterol', SupportedTypes.int),
+    ('fasting_blood_sugar', SupportedTypes.int),
+    ('resting_ecg', SupportedTypes.int),
+    ('max_heart_rate_achieved', SupportedTypes.int),
+    ('exercise_induced_angina', SupportedTypes.int),
+    ('st_depression', SupportedTypes.float),
+    ('st_slope', SupportedTypes.int),
+)
+
+
+@pytest.mark.parametrize(
+    ('current_file', 'reference_file', 'model_args', 'results'),
+    [
+        ('dataset.csv', 'dataset.csv', {}, 'test_calculation'),
+        (
+            'current_joined.csv',
+            'reference_joined.csv',
+            {'features': heart_features},
+            'test_calculation_current_joined',
+        ),
+        (
+            'complete_dataset.csv',
+            'complete_dataset.csv',
+            {'target_type': SupportedTypes.bool},
+            'test_calculation_complete',
+        ),
+        ('easy_dataset.csv', 'easy_dataset.csv', {}, 'test_calculation_easy_dataset'),
+        (
+            'dataset_cat_missing.csv',
+            'dataset_cat_missing.csv',
+            {},
+            'test_calculation_dataset_cat_missing',
+        ),
+        (
+            'dataset_with_datetime.csv',
+            'dataset_with_datetime.csv',
+            {},
+            'test_calculation_dataset_with_datetime',
+        ),
+        (
+            'easy_dataset_bucket_test.csv',
+            'easy_dataset.csv',
+            {},
+            'test_calculation_easy_dataset_bucket_test',
+        ),
+        ('dataset_for_hour.csv', 'dataset.csv', {}, 'test_calculation_for_hour'),
+        (
+            'dataset_for_day.csv',
+            'dataset.csv',
+            {'granularity': Granularity.DAY},
+            'test_calculation_for_day',
+        ),
+        (
+            'dataset_for_week.csv',
+            'dataset.csv',
+            {'granularity': Granularity.WEEK},
+            'test_calculation_for_week',
+        ),
+        (
+            'dataset_for_month.csv',
+            'dataset.csv',
+            {'granularity': Granularity.MONTH},
+            'test_calculation_for_month',
+        ),
+    ],
+)
+def test_calculation(current_file, reference_file, model_args, results):
+    """Tests that the metrics of a current dataset match the Spark jobs."""
+    model = get_binary_model(**model_args)
+    current_dataset = read_dataset(model, f'current/{current_file}')
+    reference_dataset = read_dataset(model, f'reference/{reference_file}')
+
+    assert_parity(
+        calculate_statistics(current_dataset), getattr(res, f'{results}_stats_res')
+    )
+    assert_parity(
+        classification_data_quality(
+            current_dataset, binary=True, reference=reference_dataset
+        ),
+        getattr(res, f'{results}_dq_res'),
+    )
+    if hasattr(res, f'{results}_mq_res'):
+        assert_parity(
+            binary_current_model_quality(current_dataset),
+            getattr(res, f'{results}_mq_res'),
+        )
+
+
+def test_model_quality_nulls():
+    """Tests the model quality of a current dataset with null and NaN values."""
+    model = get_binary_model(granularity=Granularity.MONTH)
+    current_dataset = read_dataset(model, 'current/dataset_nulls.csv')
+
+    assert_parity(
+        binary_current_model_quality(current_dataset), res.test_model_quality_nulls_res
+    )
@@ -0,0 +1,82 @@
+import pytest
+
+from app.local_metrics.data_quality import classification_data_quality
+from app.local_metrics.model_quality import binary_reference_model_quality
+from app.local_metrics.statistics import calculate_statistics
+from app.models.inferred_schema_dto import SupportedTypes
+from tests.commons.local_metrics_factory import (
+    assert_parity,
+    get_binary_model,
+    read_dataset,
+    spark_results,
+)
+
+res = spark_results('binary_reference_results')
+
+heart_features = (
+    ('age', SupportedTypes.int),
+    ('sex', SupportedTypes.string),
+    ('chest_pain_type', SupportedTypes.int),
+    ('resting_blood_pressure', SupportedTypes.int),
+    ('cholesterol', SupportedTypes.int),
+    ('fasting_blood_sugar', SupportedTypes.int),
+    ('resting_ecg', SupportedTypes.int),
+    ('max_heart_rate_achieved', SupportedTypes.int),
+    ('exercise_induced_angina', SupportedTypes.int),
+    ('st_depression', SupportedTypes.float),
+    ('st_slope', SupportedTypes.int),
+)
+bool_features = (
+    ('cat1', SupportedTypes.string),
+    ('bool1', SupportedTypes.bool),
+    ('num1', SupportedTypes.float),
+    ('num2', SupportedTypes.float),
+)
+
+
+@pytest.mark.parametrize(
+    ('file_name', 'model_args', 'results'),
+    [
+        ('dataset.csv', {}, 'test_calculation'),
+        (
+            'reference_joined.csv',
+            {'features': heart_features},
+            'test_calculation_reference_joined',
+        ),
+        (
+            'complete_dataset.csv',
+            {'target_type': SupportedTypes.bool},
+            'test_calculation_complete',
+        ),
+        ('easy_dataset.csv', {}, 'test_calculation_easy_dataset'),
+        ('dataset_cat_missing.csv', {}, 'test_calculation_dataset_cat_missing'),
+        ('dataset_with_datetime.csv', {}, 'test_calculation_dataset_with_datetime'),
+        (
+            'dataset_bool_missing.csv',
+            {'features': bool_features},
+            'test_calculation_dataset_bool_missing',
+        ),
+    ],
+)
+def test_calculation(file_name, model_args, results):
+    """Tests that the metrics of a reference dataset match the Spark jobs."""
+    model = get_binary_model(**model_args)
+    dataset = read_dataset(model, f'reference/{file_name}')
+
+    assert_parity(calculate_statistics(dataset), getattr(res, f'{results}_stats_res'))
+    assert_parity(
+        classification_data_quality(dataset, binary=True),
+        getattr(res, f'{results}_dq_res'),
+    )
+    assert_parity(
+        binary_reference_model_quality(dataset), getattr(res, f'{results}_mq_res')
+    )
+
+
+def test_model_quality_nulls():
+    """Tests the model quality of a reference dataset with null and NaN values."""
+    dataset = read_dataset(get_binary_model(), 'reference/dataset_nulls.csv')
+
+    assert_parity(
+        binary_reference_model_quality(dataset), res.test_model_quality_nulls_res
+    )
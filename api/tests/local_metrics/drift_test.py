@@ -0,0 +1,107 @@
+import pytest
+
+from app.local_metrics.drift import calculate_drift
+from app.models.inferred_schema_dto import FieldType, SupportedTypes
+from app.models.model_dto import Granularity, ModelType
+from tests.commons.local_metrics_factory import (
+    assert_parity,
+    column,
+    get_bike_model,
+    get_binary_model,
+    get_model,
+    read_dataset,
+    spark_results,
+)
+
+res = spark_results('drift_calculator_results')
+
+bike_model = get_bike_model(Granularity.HOUR)
+phone_model = get_model(
+    ModelType.BINARY,
+    features=[
+        column('brand_name', SupportedTypes.string),
+        column('model', SupportedTypes.string),
+        column('price', SupportedTypes.int),
+        column('rating', SupportedTypes.float),
+        column('has_5g', SupportedTypes.bool),
+        column('has_nfc', SupportedTypes.bool),
+        column('has_ir_blaster', SupportedTypes.bool),
+        column('processor_brand', SupportedTypes.string),
+        column('num_cores', SupportedTypes.int, FieldType.categorical),
+        column('processor_speed', SupportedTypes.float),
+        column('battery_capacity', SupportedTypes.int),
+        column('fast_charging_available', SupportedTypes.int, FieldType.categorical),
+        column('fast_charging', SupportedTypes.float),
+        column('ram_capacity', SupportedTypes.int, FieldType.categorical),
+        column('internal_memory', SupportedTypes.int, FieldType.categorical),
+        column('screen_size', SupportedTypes.float),
+        column('refresh_rate', SupportedTypes.int),
+        column('num_rear_cameras', SupportedTypes.int, FieldType.categorical),
+        column('num_front_cameras', SupportedTypes.int, FieldType.categorical),
+        column('os', SupportedTypes.string),
+        column('primary_camera_rear', SupportedTypes.float),
+        column('primary_camera_front', SupportedTypes.float),
+        column('extended_memory_available', SupportedTypes.int, FieldType.categorical),
+        column('extended_upto', SupportedTypes.float, FieldType.categorical),
+        column('resolution_width', SupportedTypes.int, FieldType.categorical),
+        column('resolution_height', SupportedTypes.int, FieldType.categorical),
+    ],
+    target=column('target', SupportedTypes.float),
+    prediction=column('prediction', SupportedTypes.float),
+    prediction_proba=column('prediction_proba', SupportedTypes.float),
+    timestamp=column('timestamp', SupportedTypes.datetime),
+    granularity=Granularity.MONTH,
+)
+
+
+@pytest.mark.parametrize(
+    ('model', 'current_file', 'reference_file', 'results'),
+    [
+        (get_binary_model(), 'drift_dataset.csv', 'dataset.csv', 'test_drift_res'),
+        (
+            get_binary_model(),
+            'drift_small_dataset.csv',
+            'dataset.csv',
+            'test_drift_small_res',
+        ),
+        (
+            get_binary_model(
+                features=(
+                    ('cat1', SupportedTypes.string),
+                    ('bool1', SupportedTypes.bool),
+                    ('num1', SupportedTypes.float),
+                    ('num2', SupportedTypes.float),
+                )
+            ),
+            'dataset_bool_missing.csv',
+            'dataset_bool_missing.csv',
+            'test_drift_boolean_res',
+        ),
+        (
+            get_binary_model(),
+            'drift_dataset_bigger_file.csv',
+            'dataset.csv',
+            'test_drift_bigger_file_res',
+        ),
+        (
+            bike_model,
+            'regression/bike.csv',
+            'regression/reference_bike.csv',
+            'test_drift_bike_res',
+        ),
+        (
+            phone_model,
+            'current_phone_drift_dataset.csv',
+            'reference_phone_drift_dataset.csv',
+            'test_drift_phone_res',
+        ),
+    ],
+)
+def test_drift(model, current_file, reference_file, results):
+    """Tests that the drift of a current dataset matches the Spark jobs."""
+    current_dataset = read_dataset(model, f'current/{current_file}')
+    reference_dataset = read_dataset(model, f'reference/{reference_file}')
+
+    assert_parity(
+        calculate_drift(reference_dataset, current_dataset), getattr(res, results)
+    )
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from app.local_metrics import compute_current_metrics, compute_reference_metrics
+from app.models.inferred_schema_dto import SupportedTypes
+from tests.commons.local_metrics_factory import (
+    assert_parity,
+    get_binary_model,
+    get_multiclass_model,
+    read_dataset,
+    spark_results,
+)
+from tests.local_metrics.binary_reference_test import heart_features
+from tests.local_metrics.regression_test import abalone_model
+
+res = spark_results('jobs_results')
+
+
+def assert_record_parity(record, expected):
+    """Assert that every JSON of the record is the one of the Spark jobs, nulls too."""
+    assert record.keys() == expected.keys()
+    for key, value in expected.items():
+        assert_parity(json.loads(record[key]), json.loads(value), exclude_paths={})
+
+
+@pytest.mark.parametrize(
+    ('model', 'reference_file', 'current_file', 'results'),
+    [
+        (
+            get_binary_model(features=heart_features),
+            'reference/reference_joined.csv',
+            'current/current_joined.csv',
+            'test_bc_joined',
+        ),
+        (
+            get_multiclass_model(SupportedTypes.string),
+            'reference/multiclass/dataset_target_string.csv',
+            'current/multiclass/dataset_target_string.csv',
+            'test_mc_target_string',
+        ),
+        (
+            abalone_model,
+            'reference/regression/regression_abalone_reference.csv',
+            'current/regression/regression_abalone_current1.csv',
+            'test_reg_abalone',
+        ),
+    ],
+)
+def test_compute_metrics(model, reference_file, current_file, results):
+    """Tests that the records of the local metrics are the ones of the Spark jobs."""
+    reference = read_dataset(model, reference_file)
+    current = read_dataset(model, current_file)
+
+    assert_record_parity(
+        compute_reference_metrics(reference), getattr(res, f'{results}_reference_res')
+    )
+    assert_record_parity(
+        compute_current_metrics(current, reference),
+        getattr(res, f'{results}_current_res'),
+    )
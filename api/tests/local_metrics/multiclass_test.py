@@ -0,0 +1,106 @@
+import pytest
+
+from app.local_metrics.data_quality import classification_data_quality
+from app.local_metrics.model_quality import (
+    multiclass_current_model_quality,
+    multiclass_reference_model_quality,
+)
+from app.local_metrics.statistics import calculate_statistics
+from app.models.inferred_schema_dto import SupportedTypes
+from tests.commons.local_metrics_factory import (
+    assert_parity,
+    get_multiclass_model,
+    read_dataset,
+    spark_results,
+)
+
+reference_res = spark_results('multiclass_reference_results')
+current_res = spark_results('multiclass_current_results')
+
+calculations = [
+    ('dataset_target_int.csv', SupportedTypes.int, 'dataset_target_int'),
+    ('dataset_target_string.csv', SupportedTypes.string, 'dataset_target_string'),
+    ('dataset_perfect_classes.csv', SupportedTypes.string, 'dataset_perfect_classes'),
+]
+model_qualities = [
+    ('dataset_target_string_nulls.csv', SupportedTypes.string, 'dataset_with_nulls'),
+    ('dataset_target_int_indexing.csv', SupportedTypes.int, 'dataset_indexing'),
+]
+
+
+@pytest.mark.parametrize(('file_name', 'label_type', 'results'), calculations)
+def test_reference_calculation(file_name, label_type, results):
+    """Tests that the metrics of a reference dataset match the Spark jobs."""
+    dataset = read_dataset(
+        get_multiclass_model(label_type), f'reference/multiclass/{file_name}'
+    )
+
+    res = f'test_calculation_{results}'
+    assert_parity(
+        calculate_statistics(dataset), getattr(reference_res, f'{res}_stats_res')
+    )
+    assert_parity(
+        classification_data_quality(dataset, binary=False),
+        getattr(reference_res, f'{res}_dq_res'),
+    )
+    assert_parity(
+        multiclass_reference_model_quality(dataset),
+        getattr(reference_res, f'{res}_mq_res'),
+    )
+
+
+@pytest.mark.parametrize(('file_name', 'label_type', 'results'), model_qualities)
+def test_reference_model_quality(file_name, label_type, results):
+    """Tests the model quality of reference datasets with nulls and sparse classes."""
+    dataset = read_dataset(
+        get_multiclass_model(label_type), f'reference/multiclass/{file_name}'
+    )
+
+    assert_parity(
+        multiclass_reference_model_quality(dataset),
+        getattr(reference_res, f'test_calculation_{results}_res'),
+    )
+
+
+@pytest.mark.parametrize(
+    ('file_name', 'label_type', 'results'),
+    [
+        *calculations,
+        ('dataset_for_hour.csv', SupportedTypes.string, 'dataset_for_hour'),
+    ],
+)
+def test_current_calculation(file_name, label_type, results):
+    """Tests that the metrics of a current dataset match the Spark jobs."""
+    model = get_multiclass_model(label_type)
+    # the Spark jobs tests compute the current metrics of the reference files
+    current_dataset = read_dataset(model, f'reference/multiclass/{file_name}')
+    reference_dataset = read_dataset(model, f'current/multiclass/{file_name}')
+
+    res = f'test_calculation_{results}'
+    assert_parity(
+        calculate_statistics(current_dataset), getattr(current_res, f'{res}_stats_res')
+    )
+    assert_parity(
+        classification_data_quality(
+            current_dataset, binary=False, reference=reference_dataset
+        ),
+        getattr(current_res, f'{res}_dq_res'),
+    )
+    assert_parity(
+        multiclass_current_model_quality(current_dataset, reference_dataset),
+        getattr(current_res, f'{res}_mq_res'),
+    )
+
+
+@pytest.mark.parametrize(('file_name', 'label_type', 'results'), model_qualities)
+def test_current_model_quality(file_name, label_type, results):
+    """Tests the model quality of current datasets with nulls and sparse classes."""
+    model = get_multiclass_model(label_type)
+    # the Spark jobs tests compute the current metrics of the reference files
+    current_dataset = read_dataset(model, f'reference/multiclass/{file_name}')
+    reference_dataset = read_dataset(model, f'current/multiclass/{file_name}')
+
+    assert_parity(
+        multiclass_current_model_quality(current_dataset, reference_dataset),
+        getattr(current_res, f'test_calculation_{results}_res'),
+    )
@@ -0,0 +1,145 @@
+import pytest
+
+from app.local_metrics.data_quality import regression_data_quality
+from app.local_metrics.model_quality import (
+    regression_current_model_quality,
+    regression_reference_model_quality,
+)
+from app.local_metrics.statistics import calculate_statistics
+from app.models.inferred_schema_dto import SupportedTypes
+from app.models.model_dto import Granularity, ModelType
+from tests.commons.local_metrics_factory import (
+    assert_parity,
+    column,
+    get_bike_model,
+    get_model,
+    read_dataset,
+    spark_results,
+)
+
+reference_res = spark_results('regression_reference_results')
+current_res = spark_results('regression_current_results')
+
+bike_model = get_bike_model(Granularity.HOUR)
+abalone_model = get_model(
+    ModelType.REGRESSION,
+    features=[
+        column('Sex', SupportedTypes.string),
+        *(
+            column(name, SupportedTypes.float)
+            for name in [
+                'Length',
+                'Diameter',
+                'Height',
+                'Whole_weight',
+                'Shucked_weight',
+                'Viscera_weight',
+                'Shell_weight',
+            ]
+        ),
+        column('pred_id', SupportedTypes.string),
+    ],
+    target=column('ground_truth', SupportedTypes.int),
+    prediction=column('prediction', SupportedTypes.int),
+    timestamp=column('timestamp', SupportedTypes.datetime),
+    granularity=Granularity.MONTH,
+)
+
+
+@pytest.fixture
+def reference_bike():
+    return read_dataset(bike_model, 'reference/regression/reference_bike.csv')
+
+
+@pytest.fixture
+def current_bike():
+    return read_dataset(
+        get_bike_model(Granularity.MONTH), 'current/regression/bike.csv'
+    )
+
+
+def test_reference_statistics(reference_bike):
+    """Tests that the statistics of a reference dataset match the Spark jobs."""
+    assert_parity(
+        calculate_statistics(reference_bike), reference_res.test_statistics_metrics_res
+    )
+
+
+def test_reference_data_quality(reference_bike):
+    """Tests that the data quality of a reference dataset matches the Spark jobs."""
+    data_quality = regression_data_quality(reference_bike)
+
+    assert_parity(
+        data_quality['feature_metrics'],
+        reference_res.test_data_quality_metrics_res['feature_metrics'],
+    )
+    assert_parity(
+        data_quality['target_metrics'],
+        reference_res.test_data_quality_metrics_res['target_metrics'],
+    )
+
+
+@pytest.mark.parametrize(
+    ('model', 'file_name', 'results'),
+    [
+        (bike_model, 'reference_bike.csv', 'test_model_quality_metrics_res'),
+        (
+            bike_model,
+            'reference_bike_nulls.csv',
+            'test_model_quality_metrics_nulls_res',
+        ),
+        (
+            abalone_model,
+            'regression_abalone_reference.csv',
+            'test_model_quality_abalone_res',
+        ),
+    ],
+)
+def test_reference_model_quality(model, file_name, results):
+    """Tests that the model quality of a reference dataset matches the Spark jobs."""
+    dataset = read_dataset(model, f'reference/regression/{file_name}')
+
+    assert_parity(
+        regression_reference_model_quality(dataset), getattr(reference_res, results)
+    )
+
+
+def test_current_statistics(current_bike):
+    """Tests that the statistics of a current dataset match the Spark jobs."""
+    assert_parity(
+        calculate_statistics(current_bike), current_res.test_current_statistics_res
+    )
+
+
+def test_current_data_quality(current_bike, reference_bike):
+    """Tests that the data quality of a current dataset matches the Spark jobs."""
+    data_quality = regression_data_quality(current_bike, reference=reference_bike)
+
+    assert_parity(
+        data_quality['feature_metrics'],
+        current_res.test_data_quality_res['feature_metrics'],
+    )
+    assert_parity(
+        data_quality['target_metrics'],
+        current_res.test_data_quality_res['target_metrics'],
+    )
+
+
+def test_current_model_quality(current_bike):
+    """Tests that the model quality of a current dataset matches the Spark jobs."""
+    assert_parity(
+        regression_current_model_quality(current_bike),
+        current_res.test_model_quality_res,
+    )
+
+
+def test_current_model_quality_abalone():
+    """Tests the model quality of a current dataset grouped by month."""
+    dataset = read_dataset(
+        abalone_model, 'current/regression/regression_abalone_current1.csv'
+    )
+
+    assert_parity(
+        regression_current_model_quality(dataset),
+        current_res.test_model_quality_abalone_res,
+    )
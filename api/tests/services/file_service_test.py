@@ -12,11 +12,17 @@ from app.db.dao.current_dataset_dao import CurrentDatasetDAO
 from app.db.dao.reference_dataset_dao import ReferenceDatasetDAO
 from app.db.tables.current_dataset_table import CurrentDataset
 from app.db.tables.reference_dataset_table import ReferenceDataset
-from app.models.dataset_dto import CurrentDatasetDTO, FileReference, ReferenceDatasetDTO
+from app.models.dataset_dto import (
+    CurrentDatasetDTO,
+    DatasetFormat,
+    FileReference,
+    ReferenceDatasetDTO,
+)
 from app.models.exceptions import InvalidFileException, ModelNotFoundError
 from app.models.job_status import JobStatus
 from app.models.model_dto import ModelOut
 from app.services.file_service import FileService
+from app.services.local_metrics_service import LocalMetricsService
 from app.services.model_service import ModelService
 from tests.commons import csv_file_mock as csv, db_mock
 from tests.commons.db_mock import get_sample_reference_dataset
@@ -33,12 +39,22 @@ class FileServiceTest(unittest.TestCase):
         cls.files_service = FileService(
             cls.rd_dao, cls.cd_dao, cls.model_svc, cls.s3_client, cls.spark_k8s_client
         )
+        cls.local_metrics_svc = MagicMock(spec_set=LocalMetricsService)
+        cls.local_files_service = FileService(
+            cls.rd_dao,
+            cls.cd_dao,
+            cls.model_svc,
+            cls.s3_client,
+            cls.spark_k8s_client,
+            cls.local_metrics_svc,
+        )
         cls.mocks = [
             cls.rd_dao,
             cls.cd_dao,
             cls.model_svc,
             cls.s3_client,
             cls.spark_k8s_client,
+            cls.local_metrics_svc,
         ]
 
     def test_validate_file_ok(self):
@@ -50,6 +66,31 @@ class FileServiceTest(unittest.TestCase):
         with pytest.raises(InvalidFileException):
             self.files_service.validate_file(file, sep=',', columns=['a', 'b'])
 
+    def test_validate_columnar_file_ok(self):
+        parquet_file = csv.get_sample_columnar_file('sample.parquet', b'PAR1data')
+        self.files_service.validate_file(parquet_file, columns=['Name', 'Age'])
+        assert parquet_file.file.read() == b'PAR1data'
+
+        orc_file = csv.get_sample_columnar_file('sample.orc', b'ORCdata')
+        self.files_service.validate_file(orc_file, columns=['Name', 'Age'])
+
+    def test_validate_columnar_file_error(self):
+        file = csv.get_sample_columnar_file('sample.parquet', b'Name,Age')
+        with pytest.raises(InvalidFileException):
+            self.files_service.validate_file(file)
+
+    def test_dataset_format(self):
+        assert DatasetFormat.from_file_name('file.csv') == DatasetFormat.CSV
+        assert DatasetFormat.from_file_name('file.PARQUET') == DatasetFormat.PARQUET
+        assert DatasetFormat.from_file_name('s3://bucket/file.orc') == DatasetFormat.ORC
+        assert DatasetFormat.from_file_name('s3://bucket/folder') == DatasetFormat.CSV
+        assert (
+            FileReference(
+                file_url='s3://bucket/folder', file_format=DatasetFormat.PARQUET
+            ).get_file_format()
+            == DatasetFormat.PARQUET
+        )
+
     def test_infer_schema_ok(self):
         file = csv.get_correct_sample_csv_file()
         schema = FileService.infer_schema(file)
@@ -253,6 +294,137 @@ class FileServiceTest(unittest.TestCase):
             correlation_id_column,
         )
 
+    def test_upload_reference_file_local_metrics(self):
+        file = csv.get_correct_sample_csv_file()
+        model = db_mock.get_sample_model()
+        inserted_file = db_mock.get_sample_reference_dataset(model_uuid=model.uuid)
+
+        self.model_svc.get_model_by_uuid = MagicMock(
+            return_value=ModelOut.from_model(model)
+        )
+        self.s3_client.upload_fileobj = MagicMock()
+        self.rd_dao.get_reference_dataset_by_model_uuid = MagicMock(return_value=None)
+        self.rd_dao.insert_reference_dataset = MagicMock(return_value=inserted_file)
+        self.local_metrics_svc.accepts = MagicMock(return_value=True)
+        self.local_metrics_svc.submit_reference_metrics = MagicMock()
+        self.spark_k8s_client.submit_app = MagicMock()
+
+        result = self.local_files_service.upload_reference_file(model.uuid, file)
+
+        self.local_metrics_svc.accepts.assert_called_once_with(
+            file.size, DatasetFormat.CSV
+        )
+        self.local_metrics_svc.submit_reference_metrics.assert_called_once()
+        self.spark_k8s_client.submit_app.assert_not_called()
+        assert result == ReferenceDatasetDTO.from_reference_dataset(inserted_file)
+
+    def test_bind_reference_file_too_large_for_local_metrics(self):
+        file_url = f's3://test-bucket/{model_uuid}/reference/test.csv'
+        model = db_mock.get_sample_model()
+        inserted_file = db_mock.get_sample_reference_dataset(path=file_url)
+
+        self.model_svc.get_model_by_uuid = MagicMock(
+            return_value=ModelOut.from_model(model)
+        )
+        self.s3_client.head_object = MagicMock(return_value={'ContentLength': 2048})
+        self.rd_dao.get_reference_dataset_by_model_uuid = MagicMock(return_value=None)
+        self.rd_dao.insert_reference_dataset = MagicMock(return_value=inserted_file)
+        self.local_metrics_svc.accepts = MagicMock(return_value=False)
+        self.local_metrics_svc.submit_reference_metrics = MagicMock()
+        self.spark_k8s_client.submit_app = MagicMock()
+
+        self.local_files_service.bind_reference_file(
+            model_uuid, FileReference(file_url=file_url)
+        )
+
+        self.local_metrics_svc.accepts.assert_called_once_with(2048, DatasetFormat.CSV)
+        self.local_metrics_svc.submit_reference_metrics.assert_not_called()
+        self.spark_k8s_client.submit_app.assert_called_once()
+
+    def test_bind_current_file_local_metrics(self):
+        file_url = f's3://test-bucket/{model_uuid}/current/test.csv'
+        model = ModelOut.from_model(db_mock.get_sample_model())
+        reference_file = get_sample_reference_dataset(model_uuid=model_uuid)
+        inserted_file = db_mock.get_sample_current_dataset(path=file_url)
+
+        self.model_svc.get_model_by_uuid = MagicMock(return_value=model)
+        self.rd_dao.get_reference_dataset_by_model_uuid = MagicMock(
+            return_value=reference_file
+        )
+        self.s3_client.head_object = MagicMock(return_value={'ContentLength': 1024})
+        self.cd_dao.insert_current_dataset = MagicMock(return_value=inserted_file)
+        self.local_metrics_svc.accepts = MagicMock(return_value=True)
+        self.local_metrics_svc.submit_current_metrics = MagicMock()
+        self.spark_k8s_client.submit_app = MagicMock()
+
+        result = self.local_files_service.bind_current_file(
+            model_uuid, FileReference(file_url=file_url)
+        )
+
+        assert self.s3_client.head_object.call_count == 2
+        assert self.local_metrics_svc.accepts.call_count == 2
+        self.local_metrics_svc.submit_current_metrics.assert_called_once_with(
+            model, file_url, inserted_file.uuid, reference_file.path
+        )
+        self.spark_k8s_client.submit_app.assert_not_called()
+        assert result == CurrentDatasetDTO.from_current_dataset(inserted_file)
+
+    def test_bind_current_file_reference_too_large_for_local_metrics(self):
+        file_url = f's3://test-bucket/{model_uuid}/current/test.csv'
+        model = ModelOut.from_model(db_mock.get_sample_model())
+        reference_file = get_sample_reference_dataset(model_uuid=model_uuid)
+        inserted_file = db_mock.get_sample_current_dataset(path=file_url)
+
+        self.model_svc.get_model_by_uuid = MagicMock(return_value=model)
+        self.rd_dao.get_reference_dataset_by_model_uuid = MagicMock(
+            return_value=reference_file
+        )
+        self.s3_client.head_object = MagicMock(return_value={'ContentLength': 1024})
+        self.cd_dao.insert_current_dataset = MagicMock(return_value=inserted_file)
+        self.local_metrics_svc.accepts = MagicMock(side_effect=[True, False])
+        self.local_metrics_svc.submit_current_metrics = MagicMock()
+        self.spark_k8s_client.submit_app = MagicMock()
+
+        self.local_files_service.bind_current_file(
+            model_uuid, FileReference(file_url=file_url)
+        )
+
+        self.local_metrics_svc.submit_current_metrics.assert_not_called()
+        self.spark_k8s_client.submit_app.assert_called_once()
+
+    def test_bind_current_file_stored_reference_format(self):
+        file_url = f's3://test-bucket/{model_uuid}/current/test.csv'
+        model = ModelOut.from_model(db_mock.get_sample_model())
+        # a bound reference without extension
+        reference_file = get_sample_reference_dataset(
+            model_uuid=model_uuid,
+            path='s3://test-bucket/reference/dataset',
+            dataset_format=DatasetFormat.PARQUET.value,
+        )
+        inserted_file = db_mock.get_sample_current_dataset(path=file_url)
+
+        self.model_svc.get_model_by_uuid = MagicMock(return_value=model)
+        self.rd_dao.get_reference_dataset_by_model_uuid = MagicMock(
+            return_value=reference_file
+        )
+        self.s3_client.head_object = MagicMock(return_value={'ContentLength': 1024})
+        self.cd_dao.insert_current_dataset = MagicMock(return_value=inserted_file)
+        self.local_metrics_svc.accepts = MagicMock(side_effect=[True, False])
+        self.spark_k8s_client.submit_app = MagicMock()
+
+        self.local_files_service.bind_current_file(
+            model_uuid, FileReference(file_url=file_url)
+        )
+
+        self.local_metrics_svc.accepts.assert_called_with(1024, DatasetFormat.PARQUET)
+        app_arguments = self.spark_k8s_client.submit_app.call_args.kwargs[
+            'app_arguments'
+        ]
+        assert app_arguments[-2:] == [
+            '--reference-dataset-format',
+            DatasetFormat.PARQUET.value,
+        ]
+
     def test_get_all_reference_datasets_by_model_uuid_paginated(self):
         reference_upload_1 = db_mock.get_sample_reference_dataset(
             model_uuid=model_uuid, path='reference/test_1.csv'
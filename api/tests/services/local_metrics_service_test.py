@@ -0,0 +1,102 @@
+import unittest
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from app.db.dao.current_dataset_dao import CurrentDatasetDAO
+from app.db.dao.current_dataset_metrics_dao import CurrentDatasetMetricsDAO
+from app.db.dao.reference_dataset_dao import ReferenceDatasetDAO
+from app.db.dao.reference_dataset_metrics_dao import ReferenceDatasetMetricsDAO
+from app.models.dataset_dto import DatasetFormat
+from app.models.job_status import JobStatus
+from app.services.local_metrics_service import LocalMetricsService
+from tests.commons.local_metrics_factory import (
+    SPARK_TESTS_DIR,
+    assert_parity,
+    get_binary_model,
+    spark_results,
+)
+
+reference_path = 's3://test-bucket/model/reference/dataset.csv'
+current_path = 's3://test-bucket/model/current/dataset.csv'
+
+
+def get_object(Bucket: str, Key: str):  # noqa: N803
+    # reference and current datasets of the Spark jobs tests
+    file_name = f'{Key.split("/")[1]}/dataset.csv'
+    return {'Body': (SPARK_TESTS_DIR / 'resources' / file_name).open('rb')}
+
+
+class LocalMetricsServiceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.rd_dao = MagicMock(spec_set=ReferenceDatasetDAO)
+        cls.rdm_dao = MagicMock(spec_set=ReferenceDatasetMetricsDAO)
+        cls.cd_dao = MagicMock(spec_set=CurrentDatasetDAO)
+        cls.cdm_dao = MagicMock(spec_set=CurrentDatasetMetricsDAO)
+        cls.s3_client = MagicMock()
+        cls.local_metrics_service = LocalMetricsService(
+            cls.rd_dao, cls.rdm_dao, cls.cd_dao, cls.cdm_dao, cls.s3_client
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.local_metrics_service.shutdown()
+
+    def test_accepts(self):
+        max_bytes = self.local_metrics_service.max_bytes
+        assert self.local_metrics_service.accepts(max_bytes - 1, DatasetFormat.CSV)
+        assert not self.local_metrics_service.accepts(max_bytes, DatasetFormat.CSV)
+        assert not self.local_metrics_service.accepts(None, DatasetFormat.CSV)
+        assert not self.local_metrics_service.accepts(1, DatasetFormat.PARQUET)
+
+    def test_reference_metrics(self):
+        reference_uuid = uuid4()
+        self.s3_client.get_object = MagicMock(side_effect=get_object)
+        self.rdm_dao.insert_reference_metrics = MagicMock()
+        self.rd_dao.update_reference_dataset_status = MagicMock()
+
+        self.local_metrics_service.submit_reference_metrics(
+            get_binary_model(), reference_path, reference_uuid
+        ).result()
+
+        inserted = self.rdm_dao.insert_reference_metrics.call_args.args[0]
+        assert inserted.reference_uuid == reference_uuid
+        assert_parity(
+            inserted.statistics,
+            spark_results('binary_reference_results').test_calculation_stats_res,
+        )
+        self.rd_dao.update_reference_dataset_status.assert_called_once_with(
+            reference_uuid, JobStatus.SUCCEEDED
+        )
+
+    def test_current_metrics(self):
+        current_uuid = uuid4()
+        self.s3_client.get_object = MagicMock(side_effect=get_object)
+        self.cdm_dao.insert_current_dataset_metrics = MagicMock()
+        self.cd_dao.update_current_dataset_status = MagicMock()
+
+        self.local_metrics_service.submit_current_metrics(
+            get_binary_model(), current_path, current_uuid, reference_path
+        ).result()
+
+        inserted = self.cdm_dao.insert_current_dataset_metrics.call_args.args[0]
+        assert inserted.current_uuid == current_uuid
+        assert inserted.drift is not None
+        self.cd_dao.update_current_dataset_status.assert_called_once_with(
+            current_uuid, JobStatus.SUCCEEDED
+        )
+
+    def test_reference_metrics_error(self):
+        reference_uuid = uuid4()
+        self.s3_client.get_object = MagicMock(side_effect=Exception('not found'))
+        self.rdm_dao.insert_reference_metrics = MagicMock()
+        self.rd_dao.update_reference_dataset_status = MagicMock()
+
+        self.local_metrics_service.calculate_reference_metrics(
+            get_binary_model(), reference_path, reference_uuid
+        )
+
+        self.rdm_dao.insert_reference_metrics.assert_not_called()
+        self.rd_dao.update_reference_dataset_status.assert_called_once_with(
+            reference_uuid, JobStatus.ERROR
+        )
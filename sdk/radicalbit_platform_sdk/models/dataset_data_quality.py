@@ -77,7 +77,8 @@ class NumericalTargetMetrics(FeatureMetrics):
 
 
 class CategoryFrequency(BaseModel):
-    name: str
+    # None for the sum of the categories over the top k
+    name: Optional[str] = None
     count: int
     frequency: Optional[float] = None
 
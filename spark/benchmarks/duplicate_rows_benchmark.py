@@ -0,0 +1,58 @@
+"""
+Compares the count of duplicate rows with dropDuplicates over every column against the
+xxhash64 row hash, approximate and verified, by bytes written to the shuffle.
+
+Usage: PYTHONPATH=jobs:. poetry run python benchmarks/duplicate_rows_benchmark.py [rows] [features]
+"""
+
+import sys
+import time
+
+import pyspark.sql.functions as F
+from pyspark.sql import SparkSession
+
+from benchmarks.utils import measure, print_results, shuffle_write_bytes
+from metrics.statistics import count_duplicate_rows
+from utils.models import DuplicateRowsMode
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    features_number = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    spark_session = SparkSession.builder.appName(
+        "duplicate_rows_benchmark"
+    ).getOrCreate()
+    columns = [f"feature{i}" for i in range(features_number)]
+    # rows with an id multiple of ten repeat the values of the next row
+    key = F.when(F.col("id") % 10 == 0, F.col("id") + 1).otherwise(F.col("id"))
+    dataframe = spark_session.range(rows).select(
+        *[
+            F.concat(F.lit(f"value{i}-"), (key * (i + 1)).cast("string")).alias(c)
+            for i, c in enumerate(columns)
+        ]
+    )
+    dataframe.cache().count()
+
+    results = {}
+    duplicates = {}
+    for mode in DuplicateRowsMode:
+        with measure(spark_session, results, mode.value):
+            duplicates[mode] = count_duplicate_rows(dataframe, columns, rows, mode)
+    # the REST API is updated asynchronously by the listener bus
+    time.sleep(2)
+    for mode in DuplicateRowsMode:
+        results[mode.value]["shuffle_bytes"] = shuffle_write_bytes(
+            spark_session, results[mode.value]["job_ids"]
+        )
+        results[mode.value]["duplicates"] = duplicates[mode]
+
+    assert (
+        duplicates[DuplicateRowsMode.EXACT]
+        == duplicates[DuplicateRowsMode.HASH_VERIFIED]
+    )
+    print_results(
+        f"{rows} rows, {features_number} string features",
+        results,
+        ["jobs", "seconds", "shuffle_bytes", "duplicates"],
+    )
+    spark_session.stop()
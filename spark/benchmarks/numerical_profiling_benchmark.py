@@ -0,0 +1,103 @@
+"""
+Compares the numerical data quality profiling with per feature RDD histograms against
+the fused DataFrame histograms.
+
+Usage: PYTHONPATH=jobs:. poetry run python benchmarks/numerical_profiling_benchmark.py [rows] [features]
+"""
+
+import datetime
+import sys
+import uuid
+
+import pyspark.sql.functions as F
+from pyspark.sql import SparkSession
+
+from benchmarks.utils import measure, print_results
+from metrics.data_quality_calculator import DataQualityCalculator
+from models.data_quality import Histogram
+from utils.models import (
+    ColumnDefinition,
+    DataType,
+    FieldTypes,
+    Granularity,
+    ModelOut,
+    ModelType,
+    OutputType,
+    SupportedTypes,
+)
+
+
+def synthetic_model(features_number: int) -> ModelOut:
+    return ModelOut(
+        uuid=uuid.uuid4(),
+        name="benchmark",
+        description=None,
+        model_type=ModelType.REGRESSION,
+        data_type=DataType.TABULAR,
+        granularity=Granularity.DAY,
+        features=[
+            ColumnDefinition(
+                name=f"num{i}",
+                type=SupportedTypes.float,
+                field_type=FieldTypes.numerical,
+            )
+            for i in range(features_number)
+        ],
+        outputs=OutputType(
+            prediction=ColumnDefinition(
+                name="prediction",
+                type=SupportedTypes.float,
+                field_type=FieldTypes.numerical,
+            ),
+            output=[],
+        ),
+        target=ColumnDefinition(
+            name="target", type=SupportedTypes.float, field_type=FieldTypes.numerical
+        ),
+        timestamp=ColumnDefinition(
+            name="datetime",
+            type=SupportedTypes.datetime,
+            field_type=FieldTypes.datetime,
+        ),
+        frameworks=None,
+        algorithm=None,
+        created_at=str(datetime.datetime.now()),
+        updated_at=str(datetime.datetime.now()),
+    )
+
+
+def rdd_histograms(dataframe, columns):
+    histograms = {
+        column: dataframe.select(column).rdd.flatMap(lambda x: x).histogram(10)
+        for column in columns
+    }
+    return {
+        k: Histogram(buckets=v[0], reference_values=v[1]) for k, v in histograms.items()
+    }
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    features_number = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    spark_session = SparkSession.builder.appName(
+        "numerical_profiling_benchmark"
+    ).getOrCreate()
+    model = synthetic_model(features_number)
+    columns = [feature.name for feature in model.features]
+    dataframe = spark_session.range(rows).select(
+        *[(F.rand(seed=i) * 100).alias(c) for i, c in enumerate(columns)]
+    )
+    dataframe.cache().count()
+
+    results = {}
+    with measure(spark_session, results, "rdd_histograms"):
+        legacy = rdd_histograms(dataframe, columns)
+    with measure(spark_session, results, "fused_histograms"):
+        fused = DataQualityCalculator.numerical_histograms(dataframe, columns)
+    with measure(spark_session, results, "numerical_metrics"):
+        DataQualityCalculator.numerical_metrics(model, dataframe, rows)
+
+    assert all(legacy[c].reference_values == fused[c].reference_values for c in columns)
+    print_results(f"{rows} rows, {features_number} numerical features", results)
+    spark_session.stop()
@@ -0,0 +1,85 @@
+"""
+Compares the loading of a wide CSV dataset cast with a withColumn per field, with a single
+select of casts and with the schema passed to the CSV reader.
+Plan seconds are spent to build and optimize the logical plan, execution seconds to read
+and cast every column.
+
+Usage: PYTHONPATH=jobs:. poetry run python benchmarks/schema_on_read_benchmark.py [rows] [features]
+"""
+
+import sys
+import tempfile
+import time
+
+import pyspark.sql.functions as F
+from pyspark.sql import DataFrame, SparkSession
+
+from benchmarks.numerical_profiling_benchmark import synthetic_model
+from benchmarks.utils import measure, print_results
+from models.reference_dataset import ReferenceDataset
+from utils.models import CsvReadMode, DatasetFormat
+from utils.spark import apply_schema_to_dataframe, read_dataset
+
+
+def with_column_casts(dataframe: DataFrame, schema) -> DataFrame:
+    for field in schema.fields:
+        dataframe = dataframe.withColumn(
+            field.name, F.col(field.name).cast(field.dataType)
+        )
+    return dataframe
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    features_number = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    spark_session = SparkSession.builder.appName(
+        "schema_on_read_benchmark"
+    ).getOrCreate()
+    model = synthetic_model(features_number)
+    schema = ReferenceDataset.spark_schema(model)
+    path = f"{tempfile.mkdtemp()}/dataset"
+    spark_session.range(rows).select(
+        *[
+            (F.rand(seed=i) * 100).alias(c)
+            for i, c in enumerate(schema.names)
+            if c != model.timestamp.name
+        ],
+        F.current_timestamp().alias(model.timestamp.name),
+    ).write.csv(path, header=True)
+
+    loaders = {
+        "with_column_casts": lambda: with_column_casts(
+            spark_session.read.csv(path, header=True), schema
+        ),
+        "select_casts": lambda: apply_schema_to_dataframe(
+            read_dataset(spark_session, path, DatasetFormat.CSV, schema), schema
+        ),
+        "schema_on_read": lambda: apply_schema_to_dataframe(
+            read_dataset(
+                spark_session,
+                path,
+                DatasetFormat.CSV,
+                schema,
+                CsvReadMode.PERMISSIVE,
+            ),
+            schema,
+        ),
+    }
+
+    results = {}
+    for name, loader in loaders.items():
+        start = time.perf_counter()
+        dataframe = loader()
+        dataframe._jdf.queryExecution().optimizedPlan()
+        plan_seconds = round(time.perf_counter() - start, 3)
+        with measure(spark_session, results, name):
+            dataframe.write.format("noop").mode("overwrite").save()
+        results[name]["plan_seconds"] = plan_seconds
+
+    print_results(
+        f"{rows} rows, {features_number} features",
+        results,
+        ["plan_seconds", "jobs", "seconds"],
+    )
+    spark_session.stop()
@@ -0,0 +1,69 @@
+import json
+import time
+import urllib.request
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List
+
+from pyspark.sql import SparkSession
+
+
+@contextmanager
+def measure(spark_session: SparkSession, results: Dict, name: str):
+    """
+    Measures the wall time and the number of Spark jobs triggered inside the block.
+    Every Spark job scans its input at least once, so the number of jobs is an upper
+    bound proxy of the number of scans over the dataset.
+    """
+    spark_context = spark_session.sparkContext
+    group_id = f"benchmark-{name}-{uuid.uuid4()}"
+    spark_context.setJobGroup(group_id, name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        jobs = spark_context.statusTracker().getJobIdsForGroup(group_id)
+        spark_context.setLocalProperty("spark.jobGroup.id", None)
+        results[name] = {
+            "jobs": len(jobs),
+            "seconds": round(elapsed, 3),
+            "job_ids": list(jobs),
+        }
+
+
+def shuffle_write_bytes(spark_session: SparkSession, job_ids: List[int]) -> int:
+    """
+    Sums the shuffle bytes written by the stages of the given jobs, read from the REST
+    API of the Spark UI, that must be enabled.
+    """
+    spark_context = spark_session.sparkContext
+    tracker = spark_context.statusTracker()
+    stage_ids = {
+        stage_id
+        for job_id in job_ids
+        if tracker.getJobInfo(job_id)
+        for stage_id in tracker.getJobInfo(job_id).stageIds
+    }
+    url = (
+        f"{spark_context.uiWebUrl}/api/v1/applications/{spark_context.applicationId}"
+        "/stages/{}"
+    )
+    total = 0
+    for stage_id in stage_ids:
+        try:
+            with urllib.request.urlopen(url.format(stage_id)) as response:
+                attempts = json.load(response)
+        except OSError:
+            # skipped stages are not in the REST API
+            continue
+        total += sum(attempt.get("shuffleWriteBytes", 0) for attempt in attempts)
+    return total
+
+
+def print_results(title: str, results: Dict, columns: List[str] = None):
+    columns = columns or ["jobs", "seconds"]
+    print(title)
+    print("\t".join(["run"] + columns))
+    for name, values in results.items():
+        print("\t".join([name] + [str(values.get(c)) for c in columns]))
@@ -1,25 +1,69 @@
 import logging
+import argparse
 import sys
 import os
 import uuid
+from typing import List
 
 import orjson
 from pyspark.sql.types import StructType, StructField, StringType
 
-from metrics.statistics import calculate_statistics_current
+from metrics.metrics_state_calculator import MetricsStateCalculator
 from models.current_dataset import CurrentDataset
+from models.metrics_state import MetricsState
 from models.reference_dataset import ReferenceDataset
+from models.reference_profile import ReferenceProfile
 
 from utils.current_binary import CurrentMetricsService
 from utils.current_multiclass import CurrentMetricsMulticlassService
 from utils.current_regression import CurrentMetricsRegressionService
-from utils.models import JobStatus, ModelOut, ModelType
+from utils.arguments import (
+    add_categorical_arguments,
+    add_dataset_format_argument,
+    add_duplicate_rows_argument,
+    add_quantile_arguments,
+    add_read_arguments,
+    add_residual_points_argument,
+    categorical_accuracy,
+    job_argument_parser,
+    quantile_accuracy,
+)
+from utils.models import (
+    DEFAULT_RESIDUAL_POINTS_BUDGET,
+    CategoricalAccuracy,
+    CsvReadMode,
+    DatasetFormat,
+    DriftSampling,
+    DuplicateRowsMode,
+    JobStatus,
+    ModelOut,
+    ModelType,
+    PersistencePolicy,
+    QuantileAccuracy,
+)
+from utils.persistence import (
+    count_source_reads,
+    resolve_persistence_policy,
+    shared_spill_dir,
+    source_size_bytes,
+)
 from utils.db import update_job_status, write_to_db
+from utils.spark import count_corrupt_records, read_dataset
 
 from pyspark.sql import SparkSession
 
 
-def compute_metrics(spark_session, current_dataset, reference_dataset, model):
+def compute_metrics(
+    spark_session,
+    current_dataset,
+    reference_dataset,
+    model,
+    quantile_accuracy=QuantileAccuracy(),
+    categorical_accuracy=CategoricalAccuracy(),
+    drift_sampling=DriftSampling(),
+    duplicate_rows_mode=DuplicateRowsMode.EXACT,
+    residual_points_budget=DEFAULT_RESIDUAL_POINTS_BUDGET,
+):
     complete_record = {}
     match model.model_type:
         case ModelType.BINARY:
@@ -27,8 +71,12 @@ def compute_metrics(spark_session, current_dataset, reference_dataset, model):
                 spark_session=spark_session,
                 current=current_dataset,
                 reference=reference_dataset,
+                quantile_accuracy=quantile_accuracy,
+                categorical_accuracy=categorical_accuracy,
+                drift_sampling=drift_sampling,
+                duplicate_rows_mode=duplicate_rows_mode,
             )
-            statistics = calculate_statistics_current(current_dataset)
+            statistics = metrics_service.calculate_statistics()
             data_quality = metrics_service.calculate_data_quality()
             model_quality = (
                 metrics_service.calculate_model_quality_with_group_by_timestamp()
@@ -49,8 +97,12 @@ def compute_metrics(spark_session, current_dataset, reference_dataset, model):
                 spark_session=spark_session,
                 current=current_dataset,
                 reference=reference_dataset,
+                quantile_accuracy=quantile_accuracy,
+                categorical_accuracy=categorical_accuracy,
+                drift_sampling=drift_sampling,
+                duplicate_rows_mode=duplicate_rows_mode,
             )
-            statistics = calculate_statistics_current(current_dataset)
+            statistics = metrics_service.calculate_statistics()
             data_quality = metrics_service.calculate_data_quality()
             model_quality = metrics_service.calculate_model_quality()
             drift = metrics_service.calculate_drift()
@@ -69,8 +121,13 @@ def compute_metrics(spark_session, current_dataset, reference_dataset, model):
                 reference=reference_dataset,
                 current=current_dataset,
                 spark_session=spark_session,
+                quantile_accuracy=quantile_accuracy,
+                categorical_accuracy=categorical_accuracy,
+                drift_sampling=drift_sampling,
+                duplicate_rows_mode=duplicate_rows_mode,
+                residual_points_budget=residual_points_budget,
             )
-            statistics = calculate_statistics_current(current_dataset)
+            statistics = metrics_service.calculate_statistics()
             data_quality = metrics_service.calculate_data_quality(is_current=True)
             model_quality = metrics_service.calculate_model_quality()
             drift = metrics_service.calculate_drift()
@@ -85,6 +142,10 @@ def compute_metrics(spark_session, current_dataset, reference_dataset, model):
             )
             complete_record["DRIFT"] = orjson.dumps(drift).decode("utf-8")
 
+    # persisted datasets are released as soon as every metric is computed
+    current_dataset.unpersist()
+    reference_dataset.unpersist()
+
     return complete_record
 
 
@@ -95,6 +156,16 @@ def main(
     current_uuid: str,
     reference_dataset_path: str,
     table_name: str,
+    current_dataset_format: DatasetFormat = DatasetFormat.CSV,
+    reference_dataset_format: DatasetFormat = DatasetFormat.CSV,
+    persistence: PersistencePolicy = PersistencePolicy.AUTO,
+    csv_read_mode: CsvReadMode = CsvReadMode.CAST,
+    quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
+    categorical_accuracy: CategoricalAccuracy = CategoricalAccuracy(),
+    drift_sampling: DriftSampling = DriftSampling(),
+    duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+    incremental: bool = False,
+    residual_points_budget: int = DEFAULT_RESIDUAL_POINTS_BUDGET,
 ):
     spark_context = spark_session.sparkContext
 
@@ -116,16 +187,96 @@ def main(
             "fs.s3a.connection.ssl.enabled", "false"
         )
 
-    raw_current = spark_session.read.csv(current_dataset_path, header=True)
-    current_dataset = CurrentDataset(model=model, raw_dataframe=raw_current)
-    raw_reference = spark_session.read.csv(reference_dataset_path, header=True)
-    reference_dataset = ReferenceDataset(model=model, raw_dataframe=raw_reference)
+    raw_current = read_dataset(
+        spark_session,
+        current_dataset_path,
+        current_dataset_format,
+        CurrentDataset.spark_schema(model),
+        csv_read_mode,
+    )
+    if csv_read_mode == CsvReadMode.PERMISSIVE:
+        logging.info(
+            "Malformed records in current dataset: %s",
+            count_corrupt_records(raw_current),
+        )
+    current_dataset = CurrentDataset(
+        model=model,
+        raw_dataframe=raw_current,
+        persistence=resolve_persistence_policy(
+            persistence,
+            source_size_bytes(spark_session, current_dataset_path),
+            shared_spill_dir(spark_session),
+        ),
+    )
+    raw_reference = read_dataset(
+        spark_session,
+        reference_dataset_path,
+        reference_dataset_format,
+        ReferenceDataset.spark_schema(model),
+        csv_read_mode,
+    )
+    # with the profile written by the reference job, the reference is read only by the
+    # metrics of the features that are not in the profile, so it is persisted only when
+    # there are any of them
+    reference_profile = ReferenceProfile.load(
+        spark_session, ReferenceProfile.path(reference_dataset_path)
+    )
+    unprofiled_features = (
+        reference_profile.unprofiled_features() if reference_profile else []
+    )
+    if reference_profile is None and csv_read_mode == CsvReadMode.PERMISSIVE:
+        logging.info(
+            "Malformed records in reference dataset: %s",
+            count_corrupt_records(raw_reference),
+        )
+    reference_dataset = ReferenceDataset(
+        model=model,
+        raw_dataframe=raw_reference,
+        persistence=PersistencePolicy.NONE
+        if reference_profile and not unprofiled_features
+        else resolve_persistence_policy(
+            persistence,
+            source_size_bytes(spark_session, reference_dataset_path),
+            shared_spill_dir(spark_session),
+        ),
+        profile=reference_profile,
+    )
+    logging.info(
+        "Reference profile used: %s, features read from the reference: %s",
+        reference_profile is not None,
+        unprofiled_features,
+    )
+
+    if incremental:
+        # computed before compute_metrics, that releases the persisted current dataset
+        MetricsStateCalculator.calculate(
+            model,
+            current_dataset.current,
+            current_dataset.current_count,
+            duplicate_rows_mode,
+            residual_points_budget,
+            categorical_accuracy.top_k,
+        ).save(spark_session, MetricsState.path(current_dataset_path))
 
     complete_record = compute_metrics(
         spark_session=spark_session,
         current_dataset=current_dataset,
         reference_dataset=reference_dataset,
         model=model,
+        quantile_accuracy=quantile_accuracy,
+        categorical_accuracy=categorical_accuracy,
+        drift_sampling=drift_sampling,
+        duplicate_rows_mode=duplicate_rows_mode,
+        residual_points_budget=residual_points_budget,
+    )
+    logging.info(
+        "Current metrics computed with persistence %s (current) and %s (reference), "
+        "source files read %s times",
+        current_dataset.persistence.value,
+        reference_dataset.persistence.value,
+        count_source_reads(
+            spark_session, {current_dataset_format, reference_dataset_format}
+        ),
     )
     complete_record.update({"UUID": str(uuid.uuid4()), "CURRENT_UUID": current_uuid})
 
@@ -145,34 +296,62 @@ def main(
     update_job_status(current_uuid, JobStatus.SUCCEEDED, "current_dataset")
 
 
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    parser = job_argument_parser("Metrics of a current dataset")
+    parser.add_argument("current_dataset_path")
+    parser.add_argument("current_uuid")
+    parser.add_argument("reference_dataset_path")
+    parser.add_argument("table_name")
+    add_dataset_format_argument(parser, "--current-dataset-format")
+    add_dataset_format_argument(parser, "--reference-dataset-format")
+    add_read_arguments(parser)
+    add_quantile_arguments(parser)
+    add_categorical_arguments(parser)
+    parser.add_argument(
+        "--drift-sampling",
+        type=DriftSampling.model_validate_json,
+        default=DriftSampling(),
+        help="json of DriftSampling, disabled by default",
+    )
+    add_duplicate_rows_argument(parser)
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="saves the state of the current dataset for the merge job",
+    )
+    add_residual_points_argument(parser)
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
     spark_session = SparkSession.builder.appName(
         "radicalbit_reference_metrics"
     ).getOrCreate()
 
-    # Json of ModelOut is first param
-    model = ModelOut.model_validate_json(sys.argv[1])
-    # Current dataset s3 path is second param
-    current_dataset_path = sys.argv[2]
-    # Current file uuid third param
-    current_uuid = sys.argv[3]
-    # Reference dataset s3 path is fourth param
-    reference_dataset_path = sys.argv[4]
-    # Table name fifth param
-    table_name = sys.argv[5]
+    arguments = parse_arguments(sys.argv[1:])
 
     try:
         main(
             spark_session,
-            model,
-            current_dataset_path,
-            current_uuid,
-            reference_dataset_path,
-            table_name,
+            arguments.model,
+            arguments.current_dataset_path,
+            arguments.current_uuid,
+            arguments.reference_dataset_path,
+            arguments.table_name,
+            current_dataset_format=arguments.current_dataset_format,
+            reference_dataset_format=arguments.reference_dataset_format,
+            persistence=arguments.persistence,
+            csv_read_mode=arguments.csv_read_mode,
+            quantile_accuracy=quantile_accuracy(arguments),
+            categorical_accuracy=categorical_accuracy(arguments),
+            drift_sampling=arguments.drift_sampling,
+            duplicate_rows_mode=arguments.duplicate_rows_mode,
+            incremental=arguments.incremental,
+            residual_points_budget=arguments.residual_points_budget,
         )
     except Exception as e:
         logging.exception(e)
         # FIXME table name should come from parameters
-        update_job_status(current_uuid, JobStatus.ERROR, "current_dataset")
+        update_job_status(arguments.current_uuid, JobStatus.ERROR, "current_dataset")
     finally:
         spark_session.stop()
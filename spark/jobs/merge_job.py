@@ -0,0 +1,227 @@
+import logging
+import argparse
+import sys
+import os
+import uuid
+from typing import List
+
+import orjson
+from pyspark.sql.types import StructType, StructField, StringType
+
+from metrics.metrics_state_calculator import MetricsStateCalculator
+from models.metrics_state import MetricsState
+from models.reference_dataset import ReferenceDataset
+
+from utils.arguments import (
+    add_categories_top_k_argument,
+    add_dataset_format_argument,
+    add_read_arguments,
+    job_argument_parser,
+)
+from utils.models import (
+    DEFAULT_CATEGORIES_TOP_K,
+    CsvReadMode,
+    DatasetFormat,
+    JobStatus,
+    ModelOut,
+    PersistencePolicy,
+)
+from utils.persistence import (
+    resolve_persistence_policy,
+    shared_spill_dir,
+    source_size_bytes,
+)
+from utils.db import update_job_status, write_to_db
+from utils.spark import read_dataset
+
+from pyspark.sql import SparkSession
+
+
+def compute_metrics(
+    spark_session,
+    model,
+    current_state,
+    reference_state,
+    categories_top_k=DEFAULT_CATEGORIES_TOP_K,
+):
+    return {
+        "STATISTICS": MetricsStateCalculator.statistics(
+            model, current_state
+        ).model_dump_json(serialize_as_any=True),
+        "DATA_QUALITY": MetricsStateCalculator.data_quality(
+            spark_session, model, current_state, reference_state, categories_top_k
+        ).model_dump_json(serialize_as_any=True),
+        "MODEL_QUALITY": orjson.dumps(
+            MetricsStateCalculator.model_quality(model, current_state, reference_state)
+        ).decode("utf-8"),
+        "DRIFT": orjson.dumps(
+            MetricsStateCalculator.drift(model, current_state, reference_state)
+        ).decode("utf-8"),
+    }
+
+
+def reference_metrics_state(
+    spark_session: SparkSession,
+    model: ModelOut,
+    reference_dataset_path: str,
+    reference_dataset_format: DatasetFormat,
+    persistence: PersistencePolicy,
+    csv_read_mode: CsvReadMode,
+    categories_top_k: int = DEFAULT_CATEGORIES_TOP_K,
+) -> MetricsState:
+    """
+    Loads the state of the reference dataset, computed from the reference and saved
+    next to it the first time.
+    """
+    path = MetricsState.path(reference_dataset_path)
+    reference_state = MetricsState.load(spark_session, path)
+    if reference_state is not None:
+        return reference_state
+
+    reference_dataset = ReferenceDataset(
+        model=model,
+        raw_dataframe=read_dataset(
+            spark_session,
+            reference_dataset_path,
+            reference_dataset_format,
+            ReferenceDataset.spark_schema(model),
+            csv_read_mode,
+        ),
+        persistence=resolve_persistence_policy(
+            persistence,
+            source_size_bytes(spark_session, reference_dataset_path),
+            shared_spill_dir(spark_session),
+        ),
+    )
+    reference_state = MetricsStateCalculator.calculate(
+        model,
+        reference_dataset.reference,
+        reference_dataset.reference_count,
+        categories_top_k=categories_top_k,
+    )
+    reference_dataset.unpersist()
+    reference_state.save(spark_session, path)
+    return reference_state
+
+
+def main(
+    spark_session: SparkSession,
+    model: ModelOut,
+    current_dataset_paths: List[str],
+    current_uuid: str,
+    reference_dataset_path: str,
+    table_name: str,
+    reference_dataset_format: DatasetFormat = DatasetFormat.CSV,
+    persistence: PersistencePolicy = PersistencePolicy.AUTO,
+    csv_read_mode: CsvReadMode = CsvReadMode.CAST,
+    categories_top_k: int = DEFAULT_CATEGORIES_TOP_K,
+):
+    spark_context = spark_session.sparkContext
+
+    spark_context._jsc.hadoopConfiguration().set(
+        "fs.s3a.access.key", os.getenv("AWS_ACCESS_KEY_ID")
+    )
+    spark_context._jsc.hadoopConfiguration().set(
+        "fs.s3a.secret.key", os.getenv("AWS_SECRET_ACCESS_KEY")
+    )
+    spark_context._jsc.hadoopConfiguration().set(
+        "fs.s3a.endpoint.region", os.getenv("AWS_REGION")
+    )
+    if os.getenv("S3_ENDPOINT_URL"):
+        spark_context._jsc.hadoopConfiguration().set(
+            "fs.s3a.endpoint", os.getenv("S3_ENDPOINT_URL")
+        )
+        spark_context._jsc.hadoopConfiguration().set("fs.s3a.path.style.access", "true")
+        spark_context._jsc.hadoopConfiguration().set(
+            "fs.s3a.connection.ssl.enabled", "false"
+        )
+
+    current_states = []
+    for current_dataset_path in current_dataset_paths:
+        current_state = MetricsState.load(
+            spark_session, MetricsState.path(current_dataset_path)
+        )
+        if current_state is None:
+            raise ValueError(
+                f"Metrics state of {current_dataset_path} not found, the current job "
+                "must be run in incremental mode"
+            )
+        current_states.append(current_state)
+    reference_state = reference_metrics_state(
+        spark_session,
+        model,
+        reference_dataset_path,
+        reference_dataset_format,
+        persistence,
+        csv_read_mode,
+        categories_top_k,
+    )
+
+    complete_record = compute_metrics(
+        spark_session,
+        model,
+        MetricsStateCalculator.merge(spark_session, current_states),
+        reference_state,
+        categories_top_k,
+    )
+    logging.info("Metrics merged from %s current states", len(current_states))
+    complete_record.update({"UUID": str(uuid.uuid4()), "CURRENT_UUID": current_uuid})
+
+    schema = StructType(
+        [
+            StructField("UUID", StringType(), True),
+            StructField("CURRENT_UUID", StringType(), True),
+            StructField("STATISTICS", StringType(), True),
+            StructField("DATA_QUALITY", StringType(), True),
+            StructField("MODEL_QUALITY", StringType(), True),
+            StructField("DRIFT", StringType(), True),
+        ]
+    )
+
+    write_to_db(spark_session, complete_record, schema, table_name)
+    # FIXME table name should come from parameters
+    update_job_status(current_uuid, JobStatus.SUCCEEDED, "current_dataset")
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    parser = job_argument_parser("Metrics of many current datasets from their states")
+    parser.add_argument(
+        "current_dataset_paths",
+        type=orjson.loads,
+        help="json list of the current dataset paths, with their states",
+    )
+    parser.add_argument("current_uuid")
+    parser.add_argument("reference_dataset_path")
+    parser.add_argument("table_name")
+    add_dataset_format_argument(parser, "--reference-dataset-format")
+    add_read_arguments(parser)
+    add_categories_top_k_argument(parser)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    spark_session = SparkSession.builder.appName(
+        "radicalbit_merge_metrics"
+    ).getOrCreate()
+
+    arguments = parse_arguments(sys.argv[1:])
+
+    try:
+        main(
+            spark_session,
+            arguments.model,
+            arguments.current_dataset_paths,
+            arguments.current_uuid,
+            arguments.reference_dataset_path,
+            arguments.table_name,
+            reference_dataset_format=arguments.reference_dataset_format,
+            persistence=arguments.persistence,
+            csv_read_mode=arguments.csv_read_mode,
+            categories_top_k=arguments.categories_top_k,
+        )
+    except Exception as e:
+        logging.exception(e)
+        # FIXME table name should come from parameters
+        update_job_status(arguments.current_uuid, JobStatus.ERROR, "current_dataset")
+    finally:
+        spark_session.stop()
@@ -1,17 +1,23 @@
-from typing import Dict
-import pyspark.sql
-from pyspark.ml.stat import ChiSquareTest
-from pyspark.ml.feature import VectorAssembler, StringIndexer
-from pyspark.ml import Pipeline
+from typing import Dict, List, Optional
 import pyspark.sql.functions as F
+from pyspark.sql.types import StringType
 import numpy as np
-from scipy.stats import chisquare
+from scipy.stats import chi2_contingency, chisquare
+
+from models.reference_profile import ReferenceProfile
+from utils.spark import unpivot_columns
 
 
 class Chi2Test:
-    """Class for performing a chi-square test of independence using Pyspark."""
+    """Class for performing chi-square tests of independence and goodness of fit using Pyspark."""
 
-    def __init__(self, spark_session, reference_data, current_data) -> None:
+    def __init__(
+        self,
+        spark_session,
+        reference_data,
+        current_data,
+        reference_profile: Optional[ReferenceProfile] = None,
+    ) -> None:
         """
         Initializes the Chi2Test object with necessary data and parameters.
 
@@ -21,166 +27,59 @@ class Chi2Test:
         - current_data (pyspark.sql.DataFrame): The DataFrame containing the current data.
         - reference_column (str): The column name in the reference data DataFrame.
         - current_column (str): The column name in the current data DataFrame.
+        - reference_profile (Optional[ReferenceProfile]): The profile of the reference data,
+        its frequencies are used by test_goodness_fit_batch instead of reading reference_data.
         """
         self.spark_session = spark_session
         self.reference_data = reference_data
         self.current_data = current_data
+        self.reference_profile = reference_profile
 
-    def __have_same_size(self) -> bool:
-        """
-        Checks if the reference and current data have the same size.
-
-        Returns:
-        - bool: True if the sizes are equal, False otherwise.
-        """
-        return True if self.reference_size == self.current_size else False
-
-    def __concatenate_columns(self) -> pyspark.sql.DataFrame:
-        """
-        Concatenates the reference and current data if they have the same size or creates subsamples to make them
-         of equal size.
-
-        Returns:
-        - pyspark.sql.DataFrame: The concatenated DataFrame.
-        """
-
-        if self.__have_same_size():
-            self.reference = (
-                self.reference.rdd.flatMap(lambda x: x)
-                .zipWithIndex()
-                .toDF(tuple(self.reference.columns + ["id"]))
-            )
-            self.current = (
-                self.current.rdd.flatMap(lambda x: x)
-                .zipWithIndex()
-                .toDF(tuple(self.current.columns + ["id"]))
-            )
-            concatenated_data = self.reference.join(
-                self.current, self.reference.id == self.current.id, how="inner"
-            )
-
-        else:
-            max_size = max(self.reference_size, self.current_size)
-
-            if self.reference_size == max_size:
-                # create a reference subsample with a size equal to the current
-                subsample_reference = (
-                    self.spark_session.createDataFrame(
-                        self.reference.rdd.takeSample(
-                            withReplacement=True, num=self.current_size, seed=1990
-                        )
-                    )
-                    .rdd.flatMap(lambda x: x)
-                    .zipWithIndex()
-                    .toDF(tuple(self.reference.columns + ["id"]))
-                )
-                self.current = (
-                    self.current.rdd.flatMap(lambda x: x)
-                    .zipWithIndex()
-                    .toDF(tuple(self.current.columns + ["id"]))
-                )
-                concatenated_data = subsample_reference.join(
-                    self.current, subsample_reference.id == self.current.id, how="inner"
-                )
-            else:
-                # create a current subsample with a size equal to the reference
-                subsample_current = (
-                    self.spark_session.createDataFrame(
-                        self.current.rdd.takeSample(
-                            withReplacement=True, num=self.reference_size, seed=1990
-                        )
-                    )
-                    .rdd.flatMap(lambda x: x)
-                    .zipWithIndex()
-                    .toDF(tuple(self.current.columns + ["id"]))
-                )
-                self.reference = (
-                    self.reference.rdd.flatMap(lambda x: x)
-                    .zipWithIndex()
-                    .toDF(tuple(self.reference.columns + ["id"]))
-                )
-                concatenated_data = subsample_current.join(
-                    self.reference,
-                    subsample_current.id == self.reference.id,
-                    how="inner",
-                )
-
-        return concatenated_data
-
-    def __numeric_casting(
-        self, concatenated_data, reference_column, current_column
-    ) -> pyspark.sql.DataFrame:
+    def contingency_table(self, reference_column, current_column) -> np.ndarray:
         """
-        Performs numeric casting on the concatenated data.
-
-        Parameters:
-        - concatenated_data (pyspark.sql.DataFrame): The concatenated DataFrame.
+        Builds the 2 x K contingency table of dataset (reference, current) and category,
+        with a single distributed aggregation of the frequencies of every category.
+        Only the table, with a column for every category, is collected to the driver.
 
         Returns:
-        - pyspark.sql.DataFrame: The DataFrame with numeric casting applied.
+        - np.ndarray: The reference (first row) and current (second row) frequencies.
         """
-        indexers = [
-            StringIndexer(inputCol=column, outputCol=column + "_index").fit(
-                concatenated_data
+        reference = (
+            self.reference_data.select(
+                F.col(reference_column).cast(StringType()).alias("value")
             )
-            for column in [reference_column, current_column]
-        ]
-        pipeline = Pipeline(stages=indexers)
-        return (
-            pipeline.fit(concatenated_data)
-            .transform(concatenated_data)
-            .drop(reference_column, current_column)
-            .withColumnRenamed(reference_column + "_index", reference_column)
-            .withColumnRenamed(current_column + "_index", current_column)
-        )
-
-    def __current_column_to_vector(
-        self, data, reference_column, current_column
-    ) -> pyspark.sql.DataFrame:
-        """
-        Converts the current column data to a vector using VectorAssembler.
-
-        Parameters:
-        - data (pyspark.sql.DataFrame): The DataFrame containing the data.
-
-        Returns:
-        - pyspark.sql.DataFrame: The DataFrame with the current column data converted to a vector.
-        """
-        vector_assembler = VectorAssembler(
-            inputCols=[current_column],
-            outputCol=f"{current_column}_vector",
-            handleInvalid="skip",
-        )
-        return vector_assembler.transform(data).select(
-            reference_column, f"{current_column}_vector"
+            .na.drop()
+            .withColumn("type", F.lit("reference"))
         )
-
-    def __prepare_data_for_test(
-        self, reference_column, current_column
-    ) -> pyspark.sql.DataFrame:
-        """
-        Prepares the data for the chi-square test by concatenating columns, performing numeric casting, and converting
-        the current column data to a vector.
-
-        Returns:
-        - pyspark.sql.DataFrame: The prepared DataFrame for the chi-square test.
-        """
-        concatenated_data = self.__concatenate_columns()
-        numeric_concatenated_data = self.__numeric_casting(
-            concatenated_data=concatenated_data,
-            reference_column=reference_column,
-            current_column=current_column,
+        current = (
+            self.current_data.select(
+                F.col(current_column).cast(StringType()).alias("value")
+            )
+            .na.drop()
+            .withColumn("type", F.lit("current"))
         )
-        vector_data = self.__current_column_to_vector(
-            data=numeric_concatenated_data,
-            reference_column=reference_column,
-            current_column=current_column,
+        rows = (
+            reference.unionByName(current)
+            .groupBy("value")
+            .agg(
+                F.count(F.when(F.col("type") == "reference", 1)).alias("reference"),
+                F.count(F.when(F.col("type") == "current", 1)).alias("current"),
+            )
+            .collect()
         )
-        return vector_data.select(reference_column, f"{current_column}_vector")
+        return np.array(
+            [
+                [row["reference"] for row in rows],
+                [row["current"] for row in rows],
+            ],
+            dtype=float,
+        ).reshape(2, len(rows))
 
     def test_independence(self, reference_column, current_column) -> Dict:
         """
-        Performs the chi-square test of independence.
+        Performs the chi-square test of independence between the dataset (reference or
+        current) and the category, i.e. the test of homogeneity of the two distributions,
+        on the contingency table of their frequencies.
 
         Parameters:
         - reference_column (string): The column name in the reference DataFrame to test
@@ -189,33 +88,21 @@ class Chi2Test:
         Returns:
         - dict: A dictionary containing the test results including p-value, degrees of freedom, and statistic.
         """
-        self.reference = (
-            self.reference_data.select(reference_column)
-            .withColumnRenamed(reference_column, f"{reference_column}_reference")
-            .drop(*[reference_column])
-            .na.drop()
-        )
-        self.current = (
-            self.current_data.select(current_column)
-            .withColumnRenamed(current_column, f"{current_column}_current")
-            .drop(*[current_column])
-            .na.drop()
+        table = self.contingency_table(reference_column, current_column)
+        # the test is not defined if a dataset is empty or there is a single category
+        if table.shape[1] < 2 or (table.sum(axis=1) == 0).any():
+            return {
+                "pValue": float("nan"),
+                "degreesOfFreedom": 0,
+                "statistic": float("nan"),
+            }
+        statistic, p_value, degrees_of_freedom, _ = chi2_contingency(
+            table, correction=False
         )
-        reference_column = f"{reference_column}_reference"
-        current_column = f"{current_column}_current"
-        self.reference_size = self.reference.count()
-        self.current_size = self.current.count()
-        result = ChiSquareTest.test(
-            self.__prepare_data_for_test(reference_column, current_column),
-            f"{current_column}_vector",
-            reference_column,
-            True,
-        )
-
         return {
-            "pValue": result.select("pValue").collect()[0][0],
-            "degreesOfFreedom": result.select("degreesOfFreedom").collect()[0][0],
-            "statistic": result.select("statistic").collect()[0][0],
+            "pValue": float(p_value),
+            "degreesOfFreedom": int(degrees_of_freedom),
+            "statistic": float(statistic),
         }
 
     def test_goodness_fit(self, reference_column, current_column) -> Dict:
@@ -265,3 +152,99 @@ class Chi2Test:
         ref_fr = ref_fr * proportion
         res = chisquare(cur_fr, ref_fr)
         return {"pValue": float(res[1]), "statistic": float(res[0])}
+
+    def test_goodness_fit_batch(self, features: List[str]) -> Dict[str, Dict]:
+        """
+        Performs the chi-square goodness of fit test of all the given features, that must have
+        the same name in reference and current data.
+
+        Reference and current are unpivoted in (feature, value, type) rows and the reference
+        and current frequencies of every value of every feature are computed with a single
+        aggregation. The test of every feature is then performed on the driver.
+        Reference frequencies of the features in the reference profile are not computed.
+
+        Parameters:
+        - features (List[str]): The features to test.
+
+        Returns:
+        - dict: A dictionary containing the p-value and statistic of every feature.
+        """
+        if not features:
+            return {}
+
+        # reference frequencies in the profile are not computed again
+        profile_frequencies = {
+            feature: self.reference_profile.categorical_values(feature)
+            for feature in features
+            if self.reference_profile
+            and self.reference_profile.categorical_values(feature) is not None
+        }
+        reference_features = [f for f in features if f not in profile_frequencies]
+
+        concatenated_data = unpivot_columns(
+            self.current_data, features, StringType(), type="current"
+        )
+        if reference_features:
+            concatenated_data = concatenated_data.unionByName(
+                unpivot_columns(
+                    self.reference_data,
+                    reference_features,
+                    StringType(),
+                    type="reference",
+                )
+            )
+        concatenated_data = concatenated_data.na.drop(subset=["value"])
+
+        def cnt_cond(cond):
+            return F.sum(F.when(cond, 1).otherwise(0))
+
+        frequencies = (
+            concatenated_data.groupBy("feature", "value")
+            .agg(
+                cnt_cond(F.col("type") == "reference").alias("ref_count"),
+                cnt_cond(F.col("type") == "current").alias("cur_count"),
+            )
+            .collect()
+        )
+
+        values_frequencies = {feature: {} for feature in features}
+        for row in frequencies:
+            values_frequencies[row["feature"]][row["value"]] = [
+                row["ref_count"],
+                row["cur_count"],
+            ]
+        for feature, feature_frequencies in profile_frequencies.items():
+            for value, count in feature_frequencies.items():
+                values_frequencies[feature].setdefault(value, [0, 0])[0] += count
+
+        features_frequencies = {
+            feature: (
+                [ref_count for ref_count, _ in value_frequencies.values()],
+                [cur_count for _, cur_count in value_frequencies.values()],
+            )
+            for feature, value_frequencies in values_frequencies.items()
+        }
+
+        return {
+            feature: Chi2Test.goodness_fit(ref_counts, cur_counts)
+            for feature, (ref_counts, cur_counts) in features_frequencies.items()
+        }
+
+    @staticmethod
+    def goodness_fit(ref_counts: List[int], cur_counts: List[int]) -> Dict:
+        """
+        Performs the chi-square goodness of fit test of the current frequencies against
+        the reference ones, scaled to the size of the current data. Frequencies are
+        aligned by value.
+
+        Returns:
+        - dict: A dictionary containing the p-value and statistic.
+        """
+        if not ref_counts:
+            return {"pValue": float("nan"), "statistic": float("nan")}
+        ref_fr = np.array(ref_counts)
+        cur_fr = np.array(cur_counts)
+        proportion = sum(cur_fr) / sum(ref_fr)
+        ref_fr = ref_fr * proportion
+        res = chisquare(cur_fr, ref_fr)
+        return {"pValue": float(res[1]), "statistic": float(res[0])}
@@ -0,0 +1,117 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+class ConfusionMatrixMetrics:
+    """
+    This class computes on the driver the metrics of pyspark MulticlassClassificationEvaluator,
+    starting from the counts of every (label, prediction) pair instead of the full dataset.
+    It follows the definitions of pyspark.mllib.evaluation.MulticlassMetrics, so that the
+    counts can be aggregated by Spark once (e.g. for every time group) and all the metrics of
+    every class derived without further Spark jobs.
+    """
+
+    def __init__(self, confusions: Dict[Tuple[float, float], int]) -> None:
+        """
+        Initializes the metrics from the confusion counts.
+
+        Parameters:
+        - confusions (Dict[Tuple[float, float], int]): The number of rows of every
+        (label, prediction) pair.
+        """
+        self.classes = sorted(
+            {label for label, _ in confusions} | {pred for _, pred in confusions}
+        )
+        self.index = {c: i for i, c in enumerate(self.classes)}
+        self.matrix = np.zeros((len(self.classes), len(self.classes)))
+        for (label, prediction), count in confusions.items():
+            self.matrix[self.index[label], self.index[prediction]] += count
+        self.label_count_by_class = self.matrix.sum(axis=1)
+        self.label_count = self.matrix.sum()
+        self.tp_by_class = np.diag(self.matrix)
+        self.fp_by_class = self.matrix.sum(axis=0) - self.tp_by_class
+        # classes that are present as label, the only ones MulticlassMetrics knows about
+        self.label_classes = [
+            i for i in range(len(self.classes)) if self.label_count_by_class[i] > 0
+        ]
+
+    def __label_index(self, label: float) -> int:
+        i = self.index.get(label)
+        if i is None or self.label_count_by_class[i] == 0:
+            raise KeyError(f"Label {label} not found")
+        return i
+
+    def __precision(self, i: int) -> float:
+        tp = self.tp_by_class[i]
+        fp = self.fp_by_class[i]
+        return 0.0 if tp + fp == 0 else tp / (tp + fp)
+
+    def __recall(self, i: int) -> float:
+        return self.tp_by_class[i] / self.label_count_by_class[i]
+
+    def __false_positive_rate(self, i: int) -> float:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.float64(self.fp_by_class[i]) / (
+                self.label_count - self.label_count_by_class[i]
+            )
+
+    def __f_measure(self, i: int, beta: float = 1.0) -> float:
+        p = self.__precision(i)
+        r = self.__recall(i)
+        beta_sqrd = beta * beta
+        return 0.0 if p + r == 0 else (1 + beta_sqrd) * p * r / (beta_sqrd * p + r)
+
+    def __weighted(self, metric) -> float:
+        return sum(
+            metric(i) * self.label_count_by_class[i] / self.label_count
+            for i in self.label_classes
+        )
+
+    def accuracy(self) -> float:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.float64(self.tp_by_class.sum()) / self.label_count
+
+    def evaluate(self, metric_name: str, metric_label: float = 0.0) -> float:
+        """
+        Evaluates a metric with the names of MulticlassClassificationEvaluator.
+        As the evaluator in the services, it returns NaN if the metric cannot be computed.
+        """
+        try:
+            match metric_name:
+                case "f1" | "weightedFMeasure":
+                    value = self.__weighted(self.__f_measure)
+                case "accuracy":
+                    value = self.accuracy()
+                case "weightedPrecision":
+                    value = self.__weighted(self.__precision)
+                case "weightedRecall" | "weightedTruePositiveRate":
+                    value = self.__weighted(self.__recall)
+                case "weightedFalsePositiveRate":
+                    value = self.__weighted(self.__false_positive_rate)
+                case "truePositiveRateByLabel" | "recallByLabel":
+                    value = self.__recall(self.__label_index(metric_label))
+                case "falsePositiveRateByLabel":
+                    value = self.__false_positive_rate(self.__label_index(metric_label))
+                case "precisionByLabel":
+                    value = self.__precision(self.__label_index(metric_label))
+                case "fMeasureByLabel":
+                    value = self.__f_measure(self.__label_index(metric_label))
+                case _:
+                    raise ValueError(f"Metric {metric_name} not supported")
+            return float(value)
+        except Exception:
+            return float("nan")
+
+    def confusion_matrix(self, labels: List[float]) -> List[List[float]]:
+        """Returns the confusion matrix with rows (labels) and columns (predictions)
+        ordered as the given labels."""
+        return [
+            [
+                float(self.matrix[self.index[label], self.index[prediction]])
+                if label in self.index and prediction in self.index
+                else 0.0
+                for prediction in labels
+            ]
+            for label in labels
+        ]
@@ -1,12 +1,13 @@
-from math import inf
-from typing import List, Dict
+from math import inf, isnan
+from typing import List, Dict, Optional
 
 import numpy as np
 import pyspark.sql.functions as F
 from pandas import DataFrame
 from pyspark.ml.feature import Bucketizer
-from pyspark.sql import SparkSession
-from pyspark.sql.types import IntegerType
+from pyspark.sql import Column, SparkSession
+from pyspark.sql.types import DoubleType, IntegerType, StringType
+from pyspark.sql.window import Window
 
 from models.data_quality import (
     NumericalFeatureMetrics,
@@ -15,20 +16,52 @@ from models.data_quality import (
     ClassMetrics,
     NumericalTargetMetrics,
 )
+from models.reference_profile import ReferenceProfile
 from utils.misc import split_dict, rbit_prefix
-from utils.models import ModelOut
-from utils.spark import check_not_null
+from utils.models import (
+    DEFAULT_CATEGORIES_TOP_K,
+    ModelOut,
+    QuantileAccuracy,
+    QuantileMode,
+)
+from utils.spark import check_not_null, split_bucket, split_bucket_of, unpivot_columns
 
 
 class DataQualityCalculator:
     @staticmethod
-    def numerical_metrics(
-        model: ModelOut, dataframe: DataFrame, dataframe_count: int
-    ) -> List[NumericalFeatureMetrics]:
-        numerical_features = [
-            numerical.name for numerical in model.get_numerical_features()
+    def __quantiles_agg(
+        column: Column, prefix: str, quantile_accuracy: QuantileAccuracy
+    ) -> List[Column]:
+        """
+        Median and quartiles of the column, aliased as f"{prefix}median",
+        f"{prefix}perc_25" and f"{prefix}perc_75". With QuantileMode.APPROXIMATE they
+        come from a single percentile_approx sketch, that does not sort the values.
+        """
+        if quantile_accuracy.mode == QuantileMode.APPROXIMATE:
+            quantiles = F.percentile_approx(
+                column, [0.25, 0.5, 0.75], quantile_accuracy.accuracy
+            )
+            return [
+                quantiles[1].alias(f"{prefix}median"),
+                quantiles[0].alias(f"{prefix}perc_25"),
+                quantiles[2].alias(f"{prefix}perc_75"),
+            ]
+        return [
+            F.median(column).alias(f"{prefix}median"),
+            F.percentile(column, 0.25).alias(f"{prefix}perc_25"),
+            F.percentile(column, 0.75).alias(f"{prefix}perc_75"),
         ]
 
+    @staticmethod
+    def numerical_global_metrics_agg(
+        numerical_features: List[str],
+        dataframe_count: int,
+        quantile_accuracy: QuantileAccuracy,
+    ) -> List[Column]:
+        """
+        Aggregations of the global metrics of the numerical features, aliased as
+        f"{feature}-{metric}" to be split by feature with split_dict.
+        """
         mean_agg = [
             (F.mean(check_not_null(x))).alias(f"{x}-mean") for x in numerical_features
         ]
@@ -41,19 +74,12 @@ class DataQualityCalculator:
             (F.min(check_not_null(x))).alias(f"{x}-min") for x in numerical_features
         ]
 
-        median_agg = [
-            (F.median(check_not_null(x))).alias(f"{x}-median")
-            for x in numerical_features
-        ]
-
-        perc_25_agg = [
-            (F.percentile(check_not_null(x), 0.25)).alias(f"{x}-perc_25")
-            for x in numerical_features
-        ]
-
-        perc_75_agg = [
-            (F.percentile(check_not_null(x), 0.75)).alias(f"{x}-perc_75")
+        quantiles_agg = [
+            agg
             for x in numerical_features
+            for agg in DataQualityCalculator.__quantiles_agg(
+                check_not_null(x), f"{x}-", quantile_accuracy
+            )
         ]
 
         std_agg = [
@@ -75,40 +101,187 @@ class DataQualityCalculator:
             for x in numerical_features
         ]
 
+        return (
+            mean_agg
+            + max_agg
+            + min_agg
+            + quantiles_agg
+            + std_agg
+            + missing_values_agg
+            + missing_values_perc_agg
+        )
+
+    @staticmethod
+    def __numerical_global_metrics(
+        numerical_features: List[str],
+        dataframe: DataFrame,
+        dataframe_count: int,
+        quantile_accuracy: QuantileAccuracy,
+    ) -> Dict:
         # Global
         global_stat = dataframe.select(numerical_features).agg(
-            *(
-                mean_agg
-                + max_agg
-                + min_agg
-                + median_agg
-                + perc_25_agg
-                + perc_75_agg
-                + std_agg
-                + missing_values_agg
-                + missing_values_perc_agg
+            *DataQualityCalculator.numerical_global_metrics_agg(
+                numerical_features, dataframe_count, quantile_accuracy
             )
         )
 
         global_dict = global_stat.toPandas().iloc[0].to_dict()
-        global_data_quality = split_dict(global_dict)
+        return split_dict(global_dict)
 
-        # TODO probably not so efficient but I haven't found another way
-        histograms = {
-            column: dataframe.select(column).rdd.flatMap(lambda x: x).histogram(10)
-            for column in numerical_features
-        }
+    @staticmethod
+    def numerical_histograms(
+        dataframe: DataFrame,
+        columns: List[str],
+        bounds: Optional[Dict[str, Dict]] = None,
+        buckets_number: int = 10,
+    ) -> Dict[str, Histogram]:
+        """
+        Computes equal width histograms of all the given columns with the same semantic of
+        RDD.histogram(buckets_number): buckets are open to the right except for the last one,
+        null and NaN values are ignored and a single bucket is used if min == max.
+
+        All the columns are bucketed in a single pass over the dataframe, unpivoted as
+        (feature, bucket) pairs and counted with one aggregation.
+
+        Parameters:
+        - dataframe (DataFrame): The dataframe containing the columns.
+        - columns (List[str]): The numerical columns to compute the histogram for.
+        - bounds (Dict[str, Dict]): Optional min and max of every column, as computed by the
+        global metrics aggregation. If missing, they are computed with an additional aggregation.
+        - buckets_number (int): The number of buckets of every histogram.
+
+        Returns:
+        - Dict[str, Histogram]: The histogram of every column.
+        """
+        if not columns:
+            return {}
+
+        if bounds is None:
+            bounds = split_dict(
+                dataframe.agg(
+                    *(
+                        [F.min(check_not_null(x)).alias(f"{x}-min") for x in columns]
+                        + [F.max(check_not_null(x)).alias(f"{x}-max") for x in columns]
+                    )
+                )
+                .collect()[0]
+                .asDict()
+            )
+
+        def bucket_increment(min_value: float, max_value: float) -> float:
+            # same increment of RDD.histogram, kept as integer if possible
+            inc = (max_value - min_value) / buckets_number
+            if int(inc) * buckets_number == max_value - min_value:
+                inc = int(inc)
+            return inc
+
+        edges = {}
+        increments = {}
+        for column in columns:
+            min_value = bounds.get(column, {}).get("min")
+            max_value = bounds.get(column, {}).get("max")
+            # column without valid values, RDD.histogram cannot generate buckets
+            if min_value is None or max_value is None or isnan(min_value):
+                edges[column] = None
+                continue
+            min_value, max_value = float(min_value), float(max_value)
+            if min_value == max_value:
+                edges[column] = [min_value, max_value]
+            else:
+                increments[column] = bucket_increment(min_value, max_value)
+                edges[column] = [
+                    i * increments[column] + min_value for i in range(buckets_number)
+                ] + [max_value]
+
+        def bucket_index(column: str):
+            min_value, max_value = edges[column][0], edges[column][-1]
+            in_range = (
+                F.col(column).isNotNull()
+                & ~F.isnan(column)
+                & (F.col(column) >= min_value)
+                & (F.col(column) <= max_value)
+            )
+            if min_value == max_value:
+                return F.when(in_range, F.lit(0))
+            inc = increments[column]
+            # the max value falls in the last bucket, which is closed to the right
+            return F.when(
+                in_range,
+                F.least(
+                    F.floor((F.col(column) - min_value) / inc),
+                    F.lit(buckets_number - 1),
+                ).cast(IntegerType()),
+            )
 
-        dict_of_hist = {
-            k: Histogram(buckets=v[0], reference_values=v[1])
-            for k, v in histograms.items()
+        valid_columns = [column for column in columns if edges[column] is not None]
+        counts = {column: [0] * (len(edges[column]) - 1) for column in valid_columns}
+        if valid_columns:
+            buckets_count = (
+                dataframe.select(
+                    F.explode(
+                        F.array(
+                            *[
+                                F.struct(
+                                    F.lit(column).alias("feature"),
+                                    bucket_index(column).alias("bucket"),
+                                )
+                                for column in valid_columns
+                            ]
+                        )
+                    ).alias(f"{rbit_prefix}_histogram")
+                )
+                .select(f"{rbit_prefix}_histogram.*")
+                .filter(F.col("bucket").isNotNull())
+                .groupBy("feature", "bucket")
+                .count()
+                .collect()
+            )
+            for row in buckets_count:
+                counts[row["feature"]][row["bucket"]] = row["count"]
+
+        return {
+            column: Histogram(buckets=edges[column], reference_values=counts[column])
+            if edges[column] is not None
+            else Histogram(buckets=[], reference_values=[])
+            for column in columns
         }
 
+    @staticmethod
+    def numerical_metrics(
+        model: ModelOut,
+        dataframe: DataFrame,
+        dataframe_count: int,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
+        global_metrics: Optional[Dict[str, Dict]] = None,
+    ) -> List[NumericalFeatureMetrics]:
+        """
+        Computes the data quality of the numerical features. The global metrics of a
+        DatasetScan, computed with the same quantile_accuracy, are used instead of
+        aggregating the dataframe again.
+        """
+        numerical_features = [
+            numerical.name for numerical in model.get_numerical_features()
+        ]
+
+        global_data_quality = (
+            global_metrics
+            if global_metrics is not None
+            else DataQualityCalculator.__numerical_global_metrics(
+                numerical_features, dataframe, dataframe_count, quantile_accuracy
+            )
+        )
+
+        # min and max are reused from the global metrics to bucket every feature in one pass
+        dict_of_hist = DataQualityCalculator.numerical_histograms(
+            dataframe, numerical_features, bounds=global_data_quality
+        )
+
         numerical_features_metrics = [
             NumericalFeatureMetrics.from_dict(
                 feature_name,
                 metrics,
                 histogram=dict_of_hist.get(feature_name),
+                quantile_accuracy=quantile_accuracy,
             )
             for feature_name, metrics in global_data_quality.items()
         ]
@@ -116,13 +289,13 @@ class DataQualityCalculator:
         return numerical_features_metrics
 
     @staticmethod
-    def categorical_metrics(
-        model: ModelOut, dataframe: DataFrame, dataframe_count: int
-    ) -> List[CategoricalFeatureMetrics]:
-        categorical_features = [
-            categorical.name for categorical in model.get_categorical_features()
-        ]
-
+    def categorical_missing_values_agg(
+        categorical_features: List[str], dataframe_count: int
+    ) -> List[Column]:
+        """
+        Aggregations of the missing values of the categorical features, aliased as
+        f"{feature}-{metric}" to be split by feature with split_dict.
+        """
         missing_values_agg = [
             (F.count(F.when(F.col(x).isNull(), x))).alias(f"{x}-missing_values")
             for x in categorical_features
@@ -135,37 +308,114 @@ class DataQualityCalculator:
             for x in categorical_features
         ]
 
-        distinct_values = [
-            (F.countDistinct(check_not_null(x))).alias(f"{x}-distinct_values")
-            for x in categorical_features
+        return missing_values_agg + missing_values_perc_agg
+
+    @staticmethod
+    def categorical_metrics(
+        model: ModelOut,
+        dataframe: DataFrame,
+        dataframe_count: int,
+        top_k: int = DEFAULT_CATEGORIES_TOP_K,
+        approximate_distinct: bool = False,
+        global_metrics: Optional[Dict[str, Dict]] = None,
+    ) -> List[CategoricalFeatureMetrics]:
+        """
+        Computes missing values, distinct values and category frequencies of all the
+        categorical features. Features are unpivoted in (feature, value) rows and the
+        count of every category of every feature is computed with one groupBy, ranked by
+        count in the same job: only the top_k most frequent categories of every feature
+        are collected, the remaining ones are summed in the frequency with None name,
+        that cannot be taken by a category since null values are not counted.
+
+        Parameters:
+        - top_k (int): The maximum number of categories of every feature.
+        - approximate_distinct (bool): Counts distinct values with HyperLogLog
+        (approx_count_distinct) in the missing values aggregation, for very high
+        cardinality columns. Otherwise they are exact, from the count of the categories.
+        - global_metrics (Optional[Dict[str, Dict]]): The missing values of a DatasetScan,
+        that are not aggregated again.
+        """
+        categorical_features = [
+            categorical.name for categorical in model.get_categorical_features()
         ]
 
-        global_stat = dataframe.select(categorical_features).agg(
-            *(missing_values_agg + missing_values_perc_agg + distinct_values)
+        distinct_values = (
+            [
+                (F.approx_count_distinct(check_not_null(x))).alias(
+                    f"{x}-distinct_values"
+                )
+                for x in categorical_features
+            ]
+            if approximate_distinct
+            else []
         )
 
-        global_dict = global_stat.toPandas().iloc[0].to_dict()
-        global_data_quality = split_dict(global_dict)
+        global_data_quality = {
+            feature: dict(global_metrics[feature]) if global_metrics is not None else {}
+            for feature in categorical_features
+        }
+        global_agg = distinct_values + (
+            DataQualityCalculator.categorical_missing_values_agg(
+                categorical_features, dataframe_count
+            )
+            if global_metrics is None
+            else []
+        )
+        if global_agg:
+            global_dict = (
+                dataframe.select(categorical_features)
+                .agg(*global_agg)
+                .toPandas()
+                .iloc[0]
+                .to_dict()
+            )
+            for feature, metrics in split_dict(global_dict).items():
+                global_data_quality[feature].update(metrics)
 
-        # FIXME by design this is not efficient
         # FIXME understand if we want to divide by whole or by number of not null
+        by_feature = Window.partitionBy("feature")
+        top_categories = (
+            unpivot_columns(dataframe, categorical_features, StringType())
+            .na.drop(subset=["value"])
+            .groupBy("feature", "value")
+            .count()
+            .select(
+                "feature",
+                "value",
+                "count",
+                F.row_number()
+                .over(by_feature.orderBy(F.desc("count"), F.asc("value")))
+                .alias("rank"),
+                F.count(F.lit(1)).over(by_feature).alias("distinct_values"),
+                F.sum("count").over(by_feature).alias("total"),
+            )
+            .filter(F.col("rank") <= top_k)
+            .collect()
+        )
 
         count_distinct_categories = {
-            column: dict(
-                dataframe.select(column)
-                .filter(F.isnotnull(column))
-                .groupBy(column)
-                .agg(*[F.count(check_not_null(column)).alias("count")])
-                .withColumn(
-                    "freq",
-                    F.col("count") / dataframe_count,
-                )
-                .toPandas()
-                .set_index(column)
-                .to_dict()
-            )
-            for column in categorical_features
+            column: {"count": {}, "freq": {}} for column in categorical_features
         }
+        totals = {}
+        for row in top_categories:
+            categories = count_distinct_categories[row["feature"]]
+            categories["count"][row["value"]] = row["count"]
+            categories["freq"][row["value"]] = row["count"] / dataframe_count
+            totals[row["feature"]] = (row["distinct_values"], row["total"])
+        for column, (distinct, total) in totals.items():
+            if not approximate_distinct:
+                global_data_quality[column]["distinct_values"] = distinct
+            other_count = total - sum(
+                count_distinct_categories[column]["count"].values()
+            )
+            if other_count > 0:
+                count_distinct_categories[column]["count"][None] = other_count
+                count_distinct_categories[column]["freq"][None] = (
+                    other_count / dataframe_count
+                )
+        if not approximate_distinct:
+            for column in categorical_features:
+                global_data_quality[column].setdefault("distinct_values", 0)
 
         categorical_features_metrics = [
             CategoricalFeatureMetrics.from_dict(
@@ -212,7 +462,19 @@ class DataQualityCalculator:
         reference_dataframe: DataFrame,
         spark_session: SparkSession,
         columns: List[str],
+        reference_profile: Optional[ReferenceProfile] = None,
     ) -> Dict[str, Histogram]:
+        # features with their values in the reference profile do not read the reference
+        profiled_columns = [
+            column
+            for column in columns
+            if reference_profile
+            and reference_profile.numerical_values(column) is not None
+        ]
+        profiled_histograms = DataQualityCalculator.__profiled_combined_histograms(
+            current_dataframe, reference_profile, profiled_columns
+        )
+
         current = current_dataframe.withColumn(f"{rbit_prefix}_type", F.lit("current"))
         reference = reference_dataframe.withColumn(
             f"{rbit_prefix}_type", F.lit("reference")
@@ -289,7 +551,114 @@ class DataQualityCalculator:
                 buckets=buckets_spacing, reference_values=ref, current_values=cur
             )
 
-        return {feature: create_histogram(feature) for feature in columns}
+        return {
+            feature: profiled_histograms[feature]
+            if feature in profiled_histograms
+            else create_histogram(feature)
+            for feature in columns
+        }
+
+    @staticmethod
+    def __profiled_combined_histograms(
+        current_dataframe: DataFrame,
+        reference_profile: Optional[ReferenceProfile],
+        columns: List[str],
+    ) -> Dict[str, Histogram]:
+        """
+        Same histograms of calculate_combined_histogram, where the reference bounds and
+        bucket counts come from the distinct values of the reference profile. The current
+        bounds of all the columns are computed with one aggregation and the current
+        buckets with one groupBy.
+        """
+        if not columns:
+            return {}
+
+        current = unpivot_columns(current_dataframe, columns, DoubleType()).filter(
+            F.col("value").isNotNull() & ~F.isnan("value")
+        )
+        current_bounds = {
+            row["feature"]: (row["min"], row["max"])
+            for row in current.groupBy("feature")
+            .agg(F.min("value").alias("min"), F.max("value").alias("max"))
+            .collect()
+        }
+
+        splits = {}
+        buckets_spacings = {}
+        single_bucket = set()
+        for feature in columns:
+            values = [value for value, _ in reference_profile.numerical_values(feature)]
+            bounds = [b for b in current_bounds.get(feature, ()) if b is not None]
+            if not values and not bounds:
+                continue
+            min_value = min(values + bounds)
+            max_value = max(values + bounds)
+
+            buckets_spacing = np.linspace(min_value, max_value, 11).tolist()
+            lookup = set()
+            generated_buckets = [
+                x for x in buckets_spacing if x not in lookup and lookup.add(x) is None
+            ]
+            # workaround if all values are the same to not have errors
+            if len(generated_buckets) == 1:
+                single_bucket.add(feature)
+                buckets_spacing = [generated_buckets[0], generated_buckets[0]]
+                splits[feature] = [-float(inf), generated_buckets[0], float(inf)]
+            else:
+                splits[feature] = generated_buckets
+            buckets_spacings[feature] = buckets_spacing
+
+        buckets_count = {}
+        if splits:
+            features_splits = F.create_map(
+                *[
+                    item
+                    for feature, feature_splits in splits.items()
+                    for item in (
+                        F.lit(feature),
+                        F.array(*[F.lit(x) for x in feature_splits]),
+                    )
+                ]
+            )
+            for row in (
+                current.filter(F.col("feature").isin(list(splits)))
+                .withColumn(
+                    "bucket",
+                    split_bucket(
+                        F.element_at(features_splits, F.col("feature")),
+                        F.col("value"),
+                    ),
+                )
+                .groupBy("feature", "bucket")
+                .count()
+                .collect()
+            ):
+                buckets_count[(row["feature"], "current", row["bucket"])] = row["count"]
+            for feature in splits:
+                for value, count in reference_profile.numerical_values(feature):
+                    key = (
+                        feature,
+                        "reference",
+                        split_bucket_of(splits[feature], value),
+                    )
+                    buckets_count[key] = buckets_count.get(key, 0) + count
+
+        histograms = {}
+        for feature, buckets_spacing in buckets_spacings.items():
+            # workaround if all values are the same to not have errors
+            buckets_number = [1] if feature in single_bucket else list(range(10))
+            histograms[feature] = Histogram(
+                buckets=buckets_spacing,
+                reference_values=[
+                    buckets_count.get((feature, "reference", bucket), 0)
+                    for bucket in buckets_number
+                ],
+                current_values=[
+                    buckets_count.get((feature, "current", bucket), 0)
+                    for bucket in buckets_number
+                ],
+            )
+        return histograms
 
     @staticmethod
     def calculate_combined_data_quality_numerical(
@@ -298,81 +667,29 @@ class DataQualityCalculator:
         current_count: int,
         reference_dataframe: DataFrame,
         spark_session: SparkSession,
+        reference_profile: Optional[ReferenceProfile] = None,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
+        global_metrics: Optional[Dict[str, Dict]] = None,
     ) -> List[NumericalFeatureMetrics]:
         numerical_features = [
             numerical.name for numerical in model.get_numerical_features()
         ]
 
-        mean_agg = [
-            (F.mean(check_not_null(x))).alias(f"{x}-mean") for x in numerical_features
-        ]
-
-        max_agg = [
-            (F.max(check_not_null(x))).alias(f"{x}-max") for x in numerical_features
-        ]
-
-        min_agg = [
-            (F.min(check_not_null(x))).alias(f"{x}-min") for x in numerical_features
-        ]
-
-        median_agg = [
-            (F.median(check_not_null(x))).alias(f"{x}-median")
-            for x in numerical_features
-        ]
-
-        perc_25_agg = [
-            (F.percentile(check_not_null(x), 0.25)).alias(f"{x}-perc_25")
-            for x in numerical_features
-        ]
-
-        perc_75_agg = [
-            (F.percentile(check_not_null(x), 0.75)).alias(f"{x}-perc_75")
-            for x in numerical_features
-        ]
-
-        std_agg = [
-            (F.std(check_not_null(x))).alias(f"{x}-std") for x in numerical_features
-        ]
-
-        missing_values_agg = [
-            (F.count(F.when(F.col(x).isNull() | F.isnan(x), x))).alias(
-                f"{x}-missing_values"
-            )
-            for x in numerical_features
-        ]
-
-        missing_values_perc_agg = [
-            (
-                (F.count(F.when(F.col(x).isNull() | F.isnan(x), x)) / current_count)
-                * 100
-            ).alias(f"{x}-missing_values_perc")
-            for x in numerical_features
-        ]
-
-        # Global
-        global_stat = current_dataframe.select(numerical_features).agg(
-            *(
-                mean_agg
-                + max_agg
-                + min_agg
-                + median_agg
-                + perc_25_agg
-                + perc_75_agg
-                + std_agg
-                + missing_values_agg
-                + missing_values_perc_agg
+        global_data_quality = (
+            global_metrics
+            if global_metrics is not None
+            else DataQualityCalculator.__numerical_global_metrics(
+                numerical_features, current_dataframe, current_count, quantile_accuracy
             )
         )
 
-        global_dict = global_stat.toPandas().iloc[0].to_dict()
-        global_data_quality = split_dict(global_dict)
-
         numerical_features_histogram = (
             DataQualityCalculator.calculate_combined_histogram(
                 current_dataframe,
                 reference_dataframe,
                 spark_session,
                 numerical_features,
+                reference_profile,
             )
         )
 
@@ -381,6 +698,7 @@ class DataQualityCalculator:
                 feature_name,
                 metrics,
                 histogram=numerical_features_histogram.get(feature_name),
+                quantile_accuracy=quantile_accuracy,
             )
             for feature_name, metrics in global_data_quality.items()
         ]
@@ -388,19 +706,21 @@ class DataQualityCalculator:
         return numerical_features_metrics
 
     def regression_target_metrics(
-        target_column: str, dataframe: DataFrame, dataframe_count: int
+        target_column: str,
+        dataframe: DataFrame,
+        dataframe_count: int,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
     ) -> NumericalTargetMetrics:
         target_metrics = DataQualityCalculator.regression_target_metrics_for_dataframe(
-            target_column, dataframe, dataframe_count
+            target_column, dataframe, dataframe_count, quantile_accuracy
         )
 
-        _histogram = (
-            dataframe.select(target_column).rdd.flatMap(lambda x: x).histogram(10)
-        )
-        histogram = Histogram(buckets=_histogram[0], reference_values=_histogram[1])
+        histogram = DataQualityCalculator.numerical_histograms(
+            dataframe, [target_column]
+        )[target_column]
 
         return NumericalTargetMetrics.from_dict(
-            target_column, target_metrics, histogram
+            target_column, target_metrics, histogram, quantile_accuracy
         )
 
     @staticmethod
@@ -410,23 +730,38 @@ class DataQualityCalculator:
         curr_count: int,
         ref_df: DataFrame,
         spark_session: SparkSession,
+        reference_profile: Optional[ReferenceProfile] = None,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
     ):
         target_metrics = DataQualityCalculator.regression_target_metrics_for_dataframe(
-            target_column, curr_df, curr_count
+            target_column, curr_df, curr_count, quantile_accuracy
         )
         _histogram = DataQualityCalculator.calculate_combined_histogram(
-            curr_df, ref_df, spark_session, [target_column]
+            curr_df, ref_df, spark_session, [target_column], reference_profile
         )
         histogram = _histogram[target_column]
 
         return NumericalTargetMetrics.from_dict(
-            target_column, target_metrics, histogram
+            target_column, target_metrics, histogram, quantile_accuracy
         )
 
     @staticmethod
     def regression_target_metrics_for_dataframe(
-        target_column: str, dataframe: DataFrame, dataframe_count: int
+        target_column: str,
+        dataframe: DataFrame,
+        dataframe_count: int,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
     ) -> dict:
+        if quantile_accuracy.mode == QuantileMode.APPROXIMATE:
+            quantiles_agg = DataQualityCalculator.__quantiles_agg(
+                F.col(target_column), "", quantile_accuracy
+            )
+        else:
+            quantiles_agg = [
+                F.median(target_column).alias("median"),
+                F.percentile_approx(target_column, 0.25).alias("perc_25"),
+                F.percentile_approx(target_column, 0.75).alias("perc_75"),
+            ]
         return (
             dataframe.select(target_column)
             .filter(F.isnotnull(target_column))
@@ -435,9 +770,7 @@ class DataQualityCalculator:
                 F.stddev(target_column).alias("std"),
                 F.max(target_column).alias("max"),
                 F.min(target_column).alias("min"),
-                F.median(target_column).alias("median"),
-                F.percentile_approx(target_column, 0.25).alias("perc_25"),
-                F.percentile_approx(target_column, 0.75).alias("perc_75"),
+                *quantiles_agg,
                 F.count(F.when(F.col(target_column).isNull(), target_column)).alias(
                     "missing_values"
                 ),
@@ -0,0 +1,72 @@
+from typing import Dict, List
+
+import pyspark.sql.functions as F
+from pyspark.sql import Column, DataFrame
+
+from metrics.data_quality_calculator import DataQualityCalculator
+from utils.misc import split_dict
+from utils.models import ModelOut, QuantileAccuracy
+
+
+class DatasetScan:
+    """
+    The metrics of a dataset shared by statistics and data quality, computed with a
+    single aggregation:
+    - missing_cells: the missing values of every column, for the statistics
+    - numerical_metrics: the global metrics of every numerical feature, for
+    DataQualityCalculator.numerical_metrics
+    - categorical_metrics: the missing values of every categorical feature, for
+    DataQualityCalculator.categorical_metrics
+    """
+
+    @staticmethod
+    def missing_cells_agg(dataframe: DataFrame) -> List[Column]:
+        """
+        Aggregations of the missing values of every column, null or NaN, aliased as
+        f"{column}-missing_cells".
+        """
+        return [
+            F.count(F.when(F.isnan(c) | F.col(c).isNull(), c)).alias(
+                f"{c}-missing_cells"
+            )
+            if t not in ("datetime", "date", "timestamp", "bool", "boolean")
+            else F.count(F.when(F.col(c).isNull(), c)).alias(f"{c}-missing_cells")
+            for c, t in dataframe.dtypes
+        ]
+
+    def __init__(
+        self,
+        model: ModelOut,
+        dataframe: DataFrame,
+        dataframe_count: int,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
+    ):
+        numerical_features = [f.name for f in model.get_numerical_features()]
+        categorical_features = [f.name for f in model.get_categorical_features()]
+
+        metrics = split_dict(
+            dataframe.agg(
+                *DatasetScan.missing_cells_agg(dataframe),
+                *DataQualityCalculator.numerical_global_metrics_agg(
+                    numerical_features, dataframe_count, quantile_accuracy
+                ),
+                *DataQualityCalculator.categorical_missing_values_agg(
+                    categorical_features, dataframe_count
+                ),
+            )
+            .toPandas()
+            .iloc[0]
+            .to_dict()
+        )
+
+        self.dataframe_count = dataframe_count
+        self.quantile_accuracy = quantile_accuracy
+        self.missing_cells: Dict[str, int] = {
+            c: int(metrics[c].pop("missing_cells")) for c in dataframe.columns
+        }
+        self.numerical_metrics: Dict[str, Dict] = {
+            feature: metrics[feature] for feature in numerical_features
+        }
+        self.categorical_metrics: Dict[str, Dict] = {
+            feature: metrics[feature] for feature in categorical_features
+        }
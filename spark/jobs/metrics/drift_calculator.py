@@ -1,33 +1,160 @@
-from pyspark.sql import SparkSession
+from math import ceil, log, sqrt
+from typing import Optional, Tuple
+
+import pyspark.sql.functions as F
+from pyspark.sql import DataFrame, SparkSession
 
 from metrics.chi2 import Chi2Test
 from metrics.ks import KolmogorovSmirnovTest
 from metrics.psi import PSI
 from models.current_dataset import CurrentDataset
 from models.reference_dataset import ReferenceDataset
-from utils.models import FieldTypes
+from utils.misc import rbit_prefix
+from utils.models import DriftSampling, FieldTypes, ModelOut, PersistencePolicy
+from utils.persistence import persist_dataframe, release_dataframe
+from utils.spark import time_group_column
 
 
 class DriftCalculator:
+    # KS test parameters, also used by the reference profile
+    KS_ALPHA = 0.05
+    KS_PHI = 0.004
+    # drift samples are reproducible, a retried job computes the same drift
+    SAMPLE_SEED = 42
+    # rows kept at least in every time group of a stratified sample
+    MIN_STRATUM_SIZE = 100
+
+    @staticmethod
+    def sample_size(sampling: DriftSampling) -> int:
+        """
+        Returns the size of the samples of reference and current datasets needed to
+        detect a KS distance of sampling.min_detectable_distance, at the KS_ALPHA
+        significance level and with sampling.power, when both samples have this size:
+        n = 2 * ((c(KS_ALPHA) + c(1 - power)) / distance) ** 2, where
+        c(a) = sqrt(-ln(a / 2) / 2) is the asymptotic critical coefficient of the test.
+        """
+
+        def coefficient(significance_level: float) -> float:
+            return sqrt(-0.5 * log(significance_level / 2))
+
+        return ceil(
+            2
+            * (
+                (
+                    coefficient(DriftCalculator.KS_ALPHA)
+                    + coefficient(1 - sampling.power)
+                )
+                / sampling.min_detectable_distance
+            )
+            ** 2
+        )
+
+    @staticmethod
+    def __sample(
+        dataframe: DataFrame,
+        count: int,
+        sample_size: int,
+        model: ModelOut,
+        stratify_by_time_group: bool,
+    ) -> Tuple[DataFrame, int, Optional[str]]:
+        """
+        Samples about sample_size rows of the dataframe, that is persisted so that the
+        drift tests do not read the whole dataset again. A stratified sample keeps the
+        share of every time group, and at least MIN_STRATUM_SIZE rows of each one.
+
+        Returns:
+        - Tuple[DataFrame, int, Optional[str]]: the sample, its size and the spill path
+        to release it, the dataframe itself if it is not larger than sample_size.
+        """
+        if count <= sample_size:
+            return dataframe, count, None
+
+        fraction = sample_size / count
+        if stratify_by_time_group:
+            group_column = f"{rbit_prefix}_time_group"
+            grouped = dataframe.withColumn(
+                group_column,
+                F.coalesce(
+                    time_group_column(model.timestamp.name, model.granularity),
+                    F.lit(""),
+                ),
+            )
+            fractions = {
+                row[group_column]: min(
+                    1.0,
+                    max(fraction * row["count"], DriftCalculator.MIN_STRATUM_SIZE)
+                    / row["count"],
+                )
+                for row in grouped.groupBy(group_column).count().collect()
+            }
+            sample = grouped.sampleBy(
+                group_column, fractions, DriftCalculator.SAMPLE_SEED
+            ).drop(group_column)
+        else:
+            sample = dataframe.sample(
+                fraction=fraction, seed=DriftCalculator.SAMPLE_SEED
+            )
+
+        sample, spill_path = persist_dataframe(
+            sample, PersistencePolicy.MEMORY_AND_DISK
+        )
+        return sample, sample.count(), spill_path
+
     @staticmethod
     def calculate_drift(
         spark_session: SparkSession,
         reference_dataset: ReferenceDataset,
         current_dataset: CurrentDataset,
+        sampling: DriftSampling = DriftSampling(),
     ):
         drift_result = dict()
         drift_result["feature_metrics"] = []
 
+        reference_data = reference_dataset.reference
+        current_data = current_dataset.current
+        reference_size = None
+        current_size = None
+        if sampling.enabled:
+            sample_size = DriftCalculator.sample_size(sampling)
+            current_data, current_size, current_spill_path = DriftCalculator.__sample(
+                current_data,
+                current_dataset.current_count,
+                sample_size,
+                current_dataset.model,
+                sampling.stratify_by_time_group,
+            )
+            # with a profile the reference is not read, its statistics are exact
+            if reference_dataset.profile is None:
+                reference_data, reference_size, reference_spill_path = (
+                    DriftCalculator.__sample(
+                        reference_data,
+                        reference_dataset.reference_count,
+                        sample_size,
+                        reference_dataset.model,
+                        sampling.stratify_by_time_group,
+                    )
+                )
+            else:
+                reference_size = reference_dataset.reference_count
+                reference_spill_path = None
+            drift_result["sampling"] = {
+                "reference_size": reference_size,
+                "current_size": current_size,
+                "stratified": sampling.stratify_by_time_group,
+            }
+
         categorical_features = [
             categorical.name
             for categorical in reference_dataset.model.get_categorical_features()
         ]
         chi2 = Chi2Test(
             spark_session=spark_session,
-            reference_data=reference_dataset.reference,
-            current_data=current_dataset.current,
+            reference_data=reference_data,
+            current_data=current_data,
+            reference_profile=reference_dataset.profile,
         )
 
+        chi2_results = chi2.test_goodness_fit_batch(categorical_features)
         for column in categorical_features:
             feature_dict_to_append = {
                 "feature_name": column,
@@ -37,7 +164,7 @@ class DriftCalculator:
                 },
             }
             feature_dict_to_append["drift_calc"]["type"] = "CHI2"
-            result_tmp = chi2.test_goodness_fit(column, column)
+            result_tmp = chi2_results[column]
             feature_dict_to_append["drift_calc"]["value"] = float(result_tmp["pValue"])
             feature_dict_to_append["drift_calc"]["has_drift"] = bool(
                 result_tmp["pValue"] <= 0.05
@@ -48,12 +175,16 @@ class DriftCalculator:
             float_f.name for float_f in reference_dataset.model.get_float_features()
         ]
         ks = KolmogorovSmirnovTest(
-            reference_data=reference_dataset.reference,
-            current_data=current_dataset.current,
-            alpha=0.05,
-            phi=0.004,
+            reference_data=reference_data,
+            current_data=current_data,
+            alpha=DriftCalculator.KS_ALPHA,
+            phi=DriftCalculator.KS_PHI,
+            reference_profile=reference_dataset.profile,
+            reference_size=reference_size,
+            current_size=current_size,
         )
 
+        ks_results = ks.test_batch(float_features)
         for column in float_features:
             feature_dict_to_append = {
                 "feature_name": column,
@@ -62,7 +193,7 @@ class DriftCalculator:
                     "type": "KS",
                 },
             }
-            result_tmp = ks.test(column, column)
+            result_tmp = ks_results[column]
             feature_dict_to_append["drift_calc"]["value"] = float(
                 result_tmp["ks_statistic"]
             )
@@ -76,9 +207,11 @@ class DriftCalculator:
         ]
         psi_obj = PSI(
             spark_session=spark_session,
-            reference_data=reference_dataset.reference,
-            current_data=current_dataset.current,
+            reference_data=reference_data,
+            current_data=current_data,
+            reference_profile=reference_dataset.profile,
         )
+        psi_results = psi_obj.calculate_psi_batch(int_features)
         for column in int_features:
             feature_dict_to_append = {
                 "feature_name": column,
@@ -87,7 +220,7 @@ class DriftCalculator:
                     "type": "PSI",
                 },
             }
-            result_tmp = psi_obj.calculate_psi(column)
+            result_tmp = psi_results[column]
             feature_dict_to_append["drift_calc"]["value"] = float(
                 result_tmp["psi_value"]
             )
@@ -96,4 +229,10 @@ class DriftCalculator:
             )
             drift_result["feature_metrics"].append(feature_dict_to_append)
 
+        if sampling.enabled:
+            if current_data is not current_dataset.current:
+                release_dataframe(current_data, current_spill_path)
+            if reference_data is not reference_dataset.reference:
+                release_dataframe(reference_data, reference_spill_path)
+
         return drift_result
@@ -1,7 +1,11 @@
+from typing import Callable, Dict, List, Optional
+
 import numpy as np
 from math import ceil, sqrt
 from numpy import linspace, interp
 
+from models.reference_profile import ReferenceProfile
+
 
 class KolmogorovSmirnovTest:
     """
@@ -9,7 +13,16 @@ class KolmogorovSmirnovTest:
     It is designed to compare two sample distributions and determine if they differ significantly.
     """
 
-    def __init__(self, reference_data, current_data, alpha, phi) -> None:
+    def __init__(
+        self,
+        reference_data,
+        current_data,
+        alpha,
+        phi,
+        reference_profile: Optional[ReferenceProfile] = None,
+        reference_size: Optional[int] = None,
+        current_size: Optional[int] = None,
+    ) -> None:
         """
         Initializes the KolmogorovSmirnovTest with the provided data and parameters.
 
@@ -18,13 +31,25 @@ class KolmogorovSmirnovTest:
         - current_data (DataFrame): The current data as a Spark DataFrame.
         - alpha (float): The significance level for the hypothesis test.
         - phi (float): ϕ defines the precision of the KS test statistic.
+        - reference_profile (Optional[ReferenceProfile]): The profile of the reference data,
+        its size and quantiles are used instead of reading reference_data.
+        - reference_size (Optional[int]): The size of reference_data, counted if None.
+        - current_size (Optional[int]): The size of current_data, counted if None.
         """
         self.reference_data = reference_data
         self.current_data = current_data
         self.alpha = alpha
         self.phi = phi
-        self.reference_size = self.reference_data.count()
-        self.current_size = self.current_data.count()
+        self.reference_profile = reference_profile
+        if reference_size is not None:
+            self.reference_size = reference_size
+        elif reference_profile:
+            self.reference_size = reference_profile.reference_count
+        else:
+            self.reference_size = self.reference_data.count()
+        self.current_size = (
+            current_size if current_size is not None else self.current_data.count()
+        )
 
     @staticmethod
     def __eps45(n, delta) -> float:
@@ -56,28 +81,37 @@ class KolmogorovSmirnovTest:
             / (self.reference_size * self.current_size)
         )
 
-    def test(self, reference_column, current_column) -> dict:
-        """Approximates two-sample KS distance with precision
-        phi between columns of Spark DataFrames.
-
-        Parameters:
-        - reference_column (str): The column name in the reference data.
-        - current_column (str): The column name in the current data.
+    @staticmethod
+    def probabilities(n, phi):
+        """Compute the probability points and the relative error used to approximate
+        the quantiles of a sample of size n.
+        Returns:
+            - tuple: probability points and relative error
         """
 
-        delta = self.phi / 2
+        delta = phi / 2
+        eps45 = KolmogorovSmirnovTest.__eps45(delta=delta, n=n)
+        a = KolmogorovSmirnovTest.__num_probs(n=n, delta=delta, epsilon=eps45)
+        return linspace(1 / n, 1, a), eps45
 
-        eps45x = self.__eps45(delta=delta, n=self.reference_size)
-        eps45y = self.__eps45(delta=delta, n=self.current_size)
+    def __probabilities(self):
+        """Compute the probability points and the relative errors used to approximate
+        reference and current quantiles.
+        Returns:
+            - tuple: reference and current probability points and relative errors
+        """
 
-        ax = self.__num_probs(n=self.reference_size, delta=delta, epsilon=eps45x)
-        ay = self.__num_probs(n=self.current_size, delta=delta, epsilon=eps45y)
+        pxi, eps45x = self.probabilities(self.reference_size, self.phi)
+        pyj, eps45y = self.probabilities(self.current_size, self.phi)
 
-        pxi = linspace(1 / self.reference_size, 1, ax)
-        pyj = linspace(1 / self.current_size, 1, ay)
+        return pxi, eps45x, pyj, eps45y
 
-        xi = self.reference_data.approxQuantile(reference_column, list(pxi), eps45x)
-        yj = self.current_data.approxQuantile(current_column, list(pyj), eps45y)
+    @staticmethod
+    def __ks_distance(xi, pxi, yj, pyj) -> float:
+        """Compute the KS distance between two approximated empirical distributions.
+        Returns:
+            - float: the KS distance
+        """
 
         f_xi = pxi
         f_yi = interp(xi, yj, pyj)
@@ -87,7 +121,23 @@ class KolmogorovSmirnovTest:
 
         d_i = max(abs(f_xi - f_yi))
         d_j = max(abs(f_xj - f_yj))
-        d_ks = max(d_i, d_j)
+        return max(d_i, d_j)
+
+    def test(self, reference_column, current_column) -> dict:
+        """Approximates two-sample KS distance with precision
+        phi between columns of Spark DataFrames.
+
+        Parameters:
+        - reference_column (str): The column name in the reference data.
+        - current_column (str): The column name in the current data.
+        """
+
+        pxi, eps45x, pyj, eps45y = self.__probabilities()
+
+        xi = self.reference_data.approxQuantile(reference_column, list(pxi), eps45x)
+        yj = self.current_data.approxQuantile(current_column, list(pyj), eps45y)
+
+        d_ks = self.__ks_distance(xi, pxi, yj, pyj)
 
         critical_value = self.__critical_value(significance_level=self.alpha)
 
@@ -96,3 +146,86 @@ class KolmogorovSmirnovTest:
             "ks_statistic": round(d_ks, 10),
             "alpha": self.alpha,
         }
+
+    def test_quantiles(
+        self,
+        reference_quantiles: Callable[[List[float]], List[float]],
+        current_quantiles: Callable[[List[float]], List[float]],
+    ) -> dict:
+        """Approximates two-sample KS distance with precision phi from quantile
+        functions of reference and current data, e.g. of quantile sketches, that return
+        the quantiles at the given probability points, or no quantile without values.
+
+        Parameters:
+        - reference_quantiles (Callable): The quantile function of the reference data.
+        - current_quantiles (Callable): The quantile function of the current data.
+        """
+
+        pxi, _, pyj, _ = self.__probabilities()
+
+        xi = reference_quantiles(list(pxi))
+        yj = current_quantiles(list(pyj))
+        d_ks = (
+            self.__ks_distance(np.array(xi), pxi, np.array(yj), pyj)
+            if len(xi) and len(yj)
+            else float("nan")
+        )
+
+        return {
+            "critical_value": self.__critical_value(significance_level=self.alpha),
+            "ks_statistic": round(d_ks, 10),
+            "alpha": self.alpha,
+        }
+
+    def test_batch(self, columns: List[str]) -> Dict[str, dict]:
+        """Approximates two-sample KS distance with precision
+        phi for all the given columns, that must have the same name in reference and
+        current data. Quantiles of all the columns are computed with a single
+        approxQuantile on the reference and one on the current data.
+
+        Parameters:
+        - columns (List[str]): The column names to test.
+        """
+
+        if not columns:
+            return {}
+
+        pxi, eps45x, pyj, eps45y = self.__probabilities()
+
+        # quantiles in the reference profile are computed with the same probabilities
+        reference_quantiles = {
+            column: self.reference_profile.quantiles(column, self.phi)
+            for column in columns
+            if self.reference_profile
+            and self.reference_profile.quantiles(column, self.phi) is not None
+        }
+        missing_columns = [c for c in columns if c not in reference_quantiles]
+        if missing_columns:
+            reference_quantiles.update(
+                zip(
+                    missing_columns,
+                    self.reference_data.approxQuantile(
+                        missing_columns, list(pxi), eps45x
+                    ),
+                )
+            )
+        current_quantiles = self.current_data.approxQuantile(columns, list(pyj), eps45y)
+
+        critical_value = self.__critical_value(significance_level=self.alpha)
+
+        result = {}
+        for column, yj in zip(columns, current_quantiles):
+            xi = reference_quantiles[column]
+            # approxQuantile returns no quantile for columns without values
+            d_ks = (
+                self.__ks_distance(np.array(xi), pxi, np.array(yj), pyj)
+                if xi and yj
+                else float("nan")
+            )
+            result[column] = {
+                "critical_value": critical_value,
+                "ks_statistic": round(d_ks, 10),
+                "alpha": self.alpha,
+            }
+
+        return result
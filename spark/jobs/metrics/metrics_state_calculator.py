@@ -0,0 +1,989 @@
+import base64
+from functools import reduce
+from math import inf, isnan
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pyspark.sql.functions as F
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql.types import (
+    BinaryType,
+    DoubleType,
+    StringType,
+    StructField,
+    StructType,
+)
+from pyspark.sql.window import Window
+from scipy.stats import kstwo, norm
+
+from metrics.chi2 import Chi2Test
+from metrics.confusion_matrix_metrics import ConfusionMatrixMetrics
+from metrics.dataset_scan import DatasetScan
+from metrics.drift_calculator import DriftCalculator
+from metrics.ks import KolmogorovSmirnovTest
+from metrics.model_quality_binary_calculator import ModelQualityBinaryCalculator
+from metrics.model_quality_regression_calculator import ModelQualityRegressionCalculator
+from metrics.psi import PSI
+from metrics.statistics import count_duplicate_rows, statistics_from_counts
+from models.data_quality import (
+    BinaryClassDataQuality,
+    CategoricalFeatureMetrics,
+    ClassMetrics,
+    Histogram,
+    MultiClassDataQuality,
+    NumericalFeatureMetrics,
+    NumericalTargetMetrics,
+    RegressionDataQuality,
+)
+from models.metrics_state import (
+    MAX_DISTINCT_VALUES,
+    SCORE_BINS,
+    SKETCH_POINTS,
+    CategoricalState,
+    ClassificationState,
+    MetricsState,
+    NumericalState,
+    QuantileSketch,
+    RegressionState,
+)
+from models.regression_model_quality import Histogram as ResidualHistogram
+from models.statistics import Statistics
+from utils.current_binary import CurrentMetricsService
+from utils.current_multiclass import CurrentMetricsMulticlassService
+from utils.current_regression import CurrentMetricsRegressionService
+from utils.misc import split_dict
+from utils.models import (
+    DEFAULT_CATEGORIES_TOP_K,
+    DEFAULT_RESIDUAL_POINTS_BUDGET,
+    DuplicateRowsMode,
+    FieldTypes,
+    ModelOut,
+    ModelType,
+    QuantileAccuracy,
+    QuantileMode,
+)
+from utils.spark import check_not_null, is_not_null, time_group_column, unpivot_columns
+
+
+class MetricsStateCalculator:
+    # accuracy of percentile_approx for the quantile sketches
+    SKETCH_ACCURACY = 10 * SKETCH_POINTS
+    # lgConfigK of the HyperLogLog sketches, with a relative error of about 0.4%
+    HLL_LG_CONFIG_K = 16
+    # median and quartiles from the sketches have their rank error
+    QUANTILE_ACCURACY = QuantileAccuracy(
+        mode=QuantileMode.APPROXIMATE, relative_error=1 / SKETCH_POINTS
+    )
+
+    @staticmethod
+    def __numerical_columns(model: ModelOut) -> List[str]:
+        # as in the reference profile, the regression target is a numerical column
+        numerical_columns = [f.name for f in model.get_numerical_features()]
+        if (
+            model.model_type == ModelType.REGRESSION
+            and model.target.name not in numerical_columns
+        ):
+            numerical_columns.append(model.target.name)
+        return numerical_columns
+
+    @staticmethod
+    def __is_class(value: Any) -> bool:
+        # as count(), null and NaN classes are not counted
+        return value is not None and not (isinstance(value, float) and isnan(value))
+
+    @staticmethod
+    def calculate(
+        model: ModelOut,
+        dataframe: DataFrame,
+        dataframe_count: int,
+        duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+        residual_points_budget: int = DEFAULT_RESIDUAL_POINTS_BUDGET,
+        categories_top_k: int = DEFAULT_CATEGORIES_TOP_K,
+    ) -> MetricsState:
+        """
+        Computes the mergeable state of a dataset, with one aggregation for missing
+        cells, moments, quantile sketches and HyperLogLog sketches of all the columns,
+        one groupBy for the distinct values of the numerical columns with few of them,
+        one for the categories, one for the classes or the regression statistics of
+        every time group, one for the score bins of binary classification, and the
+        count of the duplicate rows.
+
+        Parameters:
+        - model (ModelOut): The model of the dataset.
+        - dataframe (DataFrame): The dataset, current or reference.
+        - dataframe_count (int): The number of rows of the dataset.
+        - duplicate_rows_mode (DuplicateRowsMode): How duplicate rows are counted.
+        - residual_points_budget (int): The residual points kept by the state.
+        - categories_top_k (int): The categories kept by the state for every feature.
+
+        Returns:
+        - MetricsState: The state of the dataset.
+        """
+        numerical_columns = MetricsStateCalculator.__numerical_columns(model)
+        categorical_columns = [f.name for f in model.get_categorical_features()]
+        probabilities = np.linspace(0, 1, SKETCH_POINTS + 1).tolist()
+
+        aggregations = DatasetScan.missing_cells_agg(dataframe)
+        for x in numerical_columns:
+            aggregations += [
+                F.count(F.when(F.col(x).isNull() | F.isnan(x), x)).alias(
+                    f"{x}-missing"
+                ),
+                F.count(check_not_null(x)).alias(f"{x}-count"),
+                F.mean(check_not_null(x)).alias(f"{x}-mean"),
+                (F.var_pop(check_not_null(x)) * F.count(check_not_null(x))).alias(
+                    f"{x}-m2"
+                ),
+                F.min(check_not_null(x)).alias(f"{x}-min"),
+                F.max(check_not_null(x)).alias(f"{x}-max"),
+                F.percentile_approx(
+                    check_not_null(x),
+                    probabilities,
+                    MetricsStateCalculator.SKETCH_ACCURACY,
+                ).alias(f"{x}-quantiles"),
+                F.approx_count_distinct(check_not_null(x)).alias(f"{x}-distinct"),
+            ]
+        for x in categorical_columns:
+            aggregations += [
+                F.count(F.when(F.col(x).isNull(), x)).alias(f"{x}-missing"),
+                F.hll_sketch_agg(
+                    F.col(x).cast(StringType()), MetricsStateCalculator.HLL_LG_CONFIG_K
+                ).alias(f"{x}-sketch"),
+            ]
+        metrics = split_dict(dataframe.agg(*aggregations).collect()[0].asDict())
+
+        numerical = {
+            x: NumericalState(
+                missing=metrics[x]["missing"],
+                count=metrics[x]["count"],
+                mean=metrics[x]["mean"],
+                m2=metrics[x]["m2"] or 0.0,
+                min=metrics[x]["min"],
+                max=metrics[x]["max"],
+                sketch=QuantileSketch(
+                    count=metrics[x]["count"], quantiles=metrics[x]["quantiles"] or []
+                ),
+            )
+            for x in numerical_columns
+        }
+        low_cardinality_columns = [
+            x
+            for x in numerical_columns
+            if metrics[x]["distinct"] <= MAX_DISTINCT_VALUES
+        ]
+        if low_cardinality_columns:
+            values = {x: [] for x in low_cardinality_columns}
+            for row in (
+                unpivot_columns(dataframe, low_cardinality_columns, DoubleType())
+                .filter(F.col("value").isNotNull() & ~F.isnan("value"))
+                .groupBy("feature", "value")
+                .count()
+                .collect()
+            ):
+                values[row["feature"]].append((row["value"], row["count"]))
+            for x, column_values in values.items():
+                # the count of distinct values is approximated
+                if len(column_values) <= MAX_DISTINCT_VALUES:
+                    numerical[x].values = sorted(column_values)
+
+        categorical = {
+            x: CategoricalState(
+                missing=metrics[x]["missing"], max_categories=categories_top_k
+            )
+            for x in categorical_columns
+        }
+        if categorical_columns:
+            by_feature = Window.partitionBy("feature")
+            for row in (
+                unpivot_columns(dataframe, categorical_columns, StringType())
+                .na.drop(subset=["value"])
+                .groupBy("feature", "value")
+                .count()
+                .select(
+                    "feature",
+                    "value",
+                    "count",
+                    F.row_number()
+                    .over(by_feature.orderBy(F.desc("count"), F.asc("value")))
+                    .alias("rank"),
+                )
+                .withColumn(
+                    "other",
+                    F.sum(
+                        F.when(F.col("rank") > categories_top_k, F.col("count"))
+                    ).over(by_feature),
+                )
+                .filter(F.col("rank") <= categories_top_k)
+                .collect()
+            ):
+                categorical[row["feature"]].counts[row["value"]] = row["count"]
+                categorical[row["feature"]].other = row["other"] or 0
+
+        state = MetricsState(
+            n_observations=dataframe_count,
+            missing_cells=sum(metrics[c]["missing_cells"] for c in dataframe.columns),
+            duplicate_rows=count_duplicate_rows(
+                dataframe,
+                [c for c in dataframe.columns if c != model.timestamp.name],
+                dataframe_count,
+                duplicate_rows_mode,
+            ),
+            numerical=numerical,
+            categorical=categorical,
+            sketches={
+                x: base64.b64encode(metrics[x]["sketch"]).decode("ascii")
+                for x in categorical_columns
+                if metrics[x]["sketch"] is not None
+            },
+        )
+
+        time_group = time_group_column(model.timestamp.name, model.granularity)
+        target = model.target.name
+        prediction = model.outputs.prediction.name
+        match model.model_type:
+            case ModelType.BINARY | ModelType.MULTI_CLASS:
+                is_class = MetricsStateCalculator.__is_class
+                target_counts = {}
+                prediction_counts = {}
+                confusions = []
+                for row in (
+                    dataframe.select(time_group, target, prediction)
+                    .groupBy("time_group", target, prediction)
+                    .count()
+                    .collect()
+                ):
+                    if is_class(row[target]):
+                        target_counts[row[target]] = (
+                            target_counts.get(row[target], 0) + row["count"]
+                        )
+                    if is_class(row[prediction]):
+                        prediction_counts[row[prediction]] = (
+                            prediction_counts.get(row[prediction], 0) + row["count"]
+                        )
+                    if is_class(row[target]) and is_class(row[prediction]):
+                        confusions.append(
+                            (
+                                row["time_group"],
+                                row[target],
+                                row[prediction],
+                                row["count"],
+                            )
+                        )
+                state.classification = ClassificationState(
+                    target_counts=list(target_counts.items()),
+                    prediction_counts=list(prediction_counts.items()),
+                    confusions=confusions,
+                )
+                if (
+                    model.model_type == ModelType.BINARY
+                    and model.outputs.prediction_proba is not None
+                ):
+                    MetricsStateCalculator.__score_counts(
+                        model, dataframe, state.classification
+                    )
+            case ModelType.REGRESSION:
+                valid = dataframe.filter(is_not_null(prediction) & is_not_null(target))
+                residual = F.col(target).cast(DoubleType()) - F.col(prediction).cast(
+                    DoubleType()
+                )
+                residuals = valid.agg(
+                    F.count(residual).alias("count"),
+                    F.percentile_approx(
+                        residual, probabilities, MetricsStateCalculator.SKETCH_ACCURACY
+                    ).alias("quantiles"),
+                ).collect()[0]
+                points = (
+                    valid.select(
+                        F.xxhash64(prediction, target).alias("hash"),
+                        F.col(prediction).cast(DoubleType()).alias("prediction"),
+                        F.col(target).cast(DoubleType()).alias("target"),
+                    )
+                    .orderBy("hash", "prediction", "target")
+                    .limit(residual_points_budget)
+                    .collect()
+                )
+                statistics = (
+                    dataframe.groupBy(time_group)
+                    .agg(*ModelQualityRegressionCalculator.sufficient_statistics(model))
+                    .collect()
+                )
+                state.regression = RegressionState(
+                    statistics=[
+                        (
+                            row["time_group"],
+                            {
+                                k: v
+                                for k, v in row.asDict().items()
+                                if k != "time_group"
+                            },
+                        )
+                        for row in statistics
+                    ],
+                    residuals=QuantileSketch(
+                        count=residuals["count"],
+                        quantiles=residuals["quantiles"] or [],
+                    ),
+                    points=[tuple(row) for row in points],
+                    points_budget=residual_points_budget,
+                )
+
+        return state
+
+    @staticmethod
+    def __score_counts(
+        model: ModelOut, dataframe: DataFrame, classification: ClassificationState
+    ) -> None:
+        """
+        Counts the positive and negative labels of every (time group, score bin) and
+        sums the log loss of every time group, with a single groupBy. Scores are
+        probabilities, so the bins have the same width between 0 and 1 in every state.
+        """
+        score = model.outputs.prediction_proba.name
+        target = model.target.name
+        score_bin = F.least(
+            F.floor(F.greatest(F.col(score), F.lit(0.0)) * SCORE_BINS),
+            F.lit(SCORE_BINS - 1),
+        ).cast("int")
+        log_loss = {}
+        for row in (
+            dataframe.filter(is_not_null(score) & is_not_null(target))
+            .select(
+                time_group_column(model.timestamp.name, model.granularity),
+                score_bin.alias("score_bin"),
+                (F.col(target) > 0.5).alias("positive"),
+                ModelQualityBinaryCalculator.log_loss_column(model).alias("log_loss"),
+            )
+            .groupBy("time_group", "score_bin", "positive")
+            .agg(
+                F.count("*").alias("count"),
+                F.sum("log_loss").alias("log_loss_sum"),
+                F.count("log_loss").alias("log_loss_count"),
+            )
+            .collect()
+        ):
+            classification.scores.append(
+                (row["time_group"], row["score_bin"], row["positive"], row["count"])
+            )
+            log_loss_sum, log_loss_count = log_loss.get(row["time_group"], (0.0, 0))
+            log_loss[row["time_group"]] = (
+                log_loss_sum + (row["log_loss_sum"] or 0.0),
+                log_loss_count + row["log_loss_count"],
+            )
+        classification.log_loss = [
+            (group, *values) for group, values in log_loss.items()
+        ]
+
+    @staticmethod
+    def merge(spark_session: SparkSession, states: List[MetricsState]) -> MetricsState:
+        """
+        Merges the states of many datasets in the state of their union, the HyperLogLog
+        sketches with a single aggregation.
+        """
+        merged = reduce(MetricsState.merge, states)
+        keys = sorted({key for state in states for key in state.sketches})
+        if keys:
+            sketches = spark_session.createDataFrame(
+                [
+                    tuple(
+                        base64.b64decode(state.sketches[key])
+                        if key in state.sketches
+                        else None
+                        for key in keys
+                    )
+                    for state in states
+                ],
+                StructType([StructField(key, BinaryType()) for key in keys]),
+            )
+            row = sketches.agg(
+                *[F.hll_union_agg(F.col(f"`{key}`")).alias(key) for key in keys]
+            ).collect()[0]
+            merged.sketches = {
+                key: base64.b64encode(row[key]).decode("ascii") for key in keys
+            }
+        return merged
+
+    @staticmethod
+    def __distinct_values(
+        spark_session: SparkSession, state: MetricsState
+    ) -> Dict[str, int]:
+        """
+        The distinct values of every categorical feature, exact if no category was
+        dropped, otherwise estimated from its HyperLogLog sketch.
+        """
+        estimated = [
+            feature
+            for feature, categorical in state.categorical.items()
+            if categorical.other > 0 and feature in state.sketches
+        ]
+        distinct_values = {
+            feature: len(categorical.counts)
+            for feature, categorical in state.categorical.items()
+        }
+        if estimated:
+            row = (
+                spark_session.createDataFrame(
+                    [tuple(base64.b64decode(state.sketches[x]) for x in estimated)],
+                    StructType([StructField(x, BinaryType()) for x in estimated]),
+                )
+                .select(
+                    *[
+                        F.hll_sketch_estimate(F.col(f"`{x}`")).alias(x)
+                        for x in estimated
+                    ]
+                )
+                .collect()[0]
+            )
+            distinct_values.update({x: row[x] for x in estimated})
+        return distinct_values
+
+    @staticmethod
+    def __percentage(count: int, total: int) -> float:
+        # percentages of an empty dataset are NaN, as a division by zero in Spark
+        return count / total * 100 if total else float("nan")
+
+    @staticmethod
+    def __histogram(
+        current: NumericalState, reference: NumericalState
+    ) -> Optional[Histogram]:
+        """
+        The histogram of calculate_combined_histogram, with 10 buckets between the
+        bounds of reference and current values.
+        """
+        bounds = [
+            v
+            for v in (reference.min, reference.max, current.min, current.max)
+            if v is not None
+        ]
+        if not bounds:
+            return Histogram(buckets=[], reference_values=[], current_values=[])
+        buckets_spacing = np.linspace(min(bounds), max(bounds), 11).tolist()
+        lookup = set()
+        generated_buckets = [
+            x for x in buckets_spacing if x not in lookup and lookup.add(x) is None
+        ]
+        # workaround if all values are the same to not have errors
+        if len(generated_buckets) == 1:
+            return Histogram(
+                buckets=[generated_buckets[0], generated_buckets[0]],
+                reference_values=[reference.count],
+                current_values=[current.count],
+            )
+        return Histogram(
+            buckets=buckets_spacing,
+            reference_values=reference.bucket_counts(generated_buckets),
+            current_values=current.bucket_counts(generated_buckets),
+        )
+
+    @staticmethod
+    def __numerical_metrics(state: NumericalState, n_observations: int) -> Dict:
+        median_metrics = state.sketch.quantile([0.25, 0.5, 0.75]) or [float("nan")] * 3
+        return {
+            "mean": state.mean if state.mean is not None else float("nan"),
+            "std": state.std(),
+            "min": state.min if state.min is not None else float("nan"),
+            "max": state.max if state.max is not None else float("nan"),
+            "perc_25": median_metrics[0],
+            "median": median_metrics[1],
+            "perc_75": median_metrics[2],
+            "missing_values": state.missing,
+            "missing_values_perc": MetricsStateCalculator.__percentage(
+                state.missing, n_observations
+            ),
+        }
+
+    @staticmethod
+    def __class_metrics(counts: List[tuple], n_observations: int) -> List[ClassMetrics]:
+        return [
+            ClassMetrics(
+                name=str(label),
+                count=count,
+                percentage=MetricsStateCalculator.__percentage(count, n_observations),
+            )
+            for label, count in sorted(counts)
+        ]
+
+    @staticmethod
+    def statistics(model: ModelOut, state: MetricsState) -> Statistics:
+        return statistics_from_counts(
+            model.features + [model.target] + [model.timestamp] + model.outputs.output,
+            state.n_observations,
+            state.missing_cells,
+            state.duplicate_rows,
+        )
+
+    @staticmethod
+    def data_quality(
+        spark_session: SparkSession,
+        model: ModelOut,
+        state: MetricsState,
+        reference_state: MetricsState,
+        categories_top_k: int = DEFAULT_CATEGORIES_TOP_K,
+    ):
+        """
+        The data quality of the current dataset of the state, as computed by the current
+        job, with median and quartiles from the quantile sketches and histograms of the
+        numerical features estimated from them when they have many distinct values.
+        Categories over the top categories_top_k are summed in the one without name.
+        """
+        n_observations = state.n_observations
+        quantile_accuracy = MetricsStateCalculator.QUANTILE_ACCURACY
+        feature_metrics = []
+        for feature in model.get_numerical_features():
+            current = state.numerical[feature.name]
+            feature_metrics.append(
+                NumericalFeatureMetrics.from_dict(
+                    feature.name,
+                    MetricsStateCalculator.__numerical_metrics(current, n_observations),
+                    MetricsStateCalculator.__histogram(
+                        current, reference_state.numerical[feature.name]
+                    ),
+                    quantile_accuracy,
+                )
+            )
+        distinct_values = MetricsStateCalculator.__distinct_values(spark_session, state)
+        for feature in model.get_categorical_features():
+            categorical = state.categorical[feature.name]
+            top_categories = dict(
+                sorted(categorical.counts.items(), key=lambda x: (-x[1], x[0]))[
+                    :categories_top_k
+                ]
+            )
+            other_count = (
+                categorical.other
+                + sum(categorical.counts.values())
+                - sum(top_categories.values())
+            )
+            if other_count > 0:
+                top_categories[None] = other_count
+            feature_metrics.append(
+                CategoricalFeatureMetrics.from_dict(
+                    feature.name,
+                    {
+                        "missing_values": categorical.missing,
+                        "missing_values_perc": MetricsStateCalculator.__percentage(
+                            categorical.missing, n_observations
+                        ),
+                        "distinct_values": distinct_values[feature.name],
+                    },
+                    {
+                        "count": top_categories,
+                        "freq": {
+                            k: v / n_observations if n_observations else float("nan")
+                            for k, v in top_categories.items()
+                        },
+                    },
+                )
+            )
+
+        match model.model_type:
+            case ModelType.BINARY | ModelType.MULTI_CLASS:
+                class_metrics = MetricsStateCalculator.__class_metrics(
+                    state.classification.target_counts, n_observations
+                )
+                class_metrics_prediction = MetricsStateCalculator.__class_metrics(
+                    state.classification.prediction_counts, n_observations
+                )
+                if model.model_type == ModelType.BINARY:
+                    return BinaryClassDataQuality(
+                        n_observations=n_observations,
+                        class_metrics=CurrentMetricsService.complete_binary_classes(
+                            class_metrics
+                        ),
+                        class_metrics_prediction=CurrentMetricsService.complete_binary_classes(
+                            class_metrics_prediction
+                        ),
+                        feature_metrics=feature_metrics,
+                    )
+                return MultiClassDataQuality(
+                    n_observations=n_observations,
+                    class_metrics=class_metrics,
+                    class_metrics_prediction=class_metrics_prediction,
+                    feature_metrics=feature_metrics,
+                )
+            case ModelType.REGRESSION:
+                target = state.numerical[model.target.name]
+                return RegressionDataQuality(
+                    n_observations=n_observations,
+                    target_metrics=NumericalTargetMetrics.from_dict(
+                        model.target.name,
+                        MetricsStateCalculator.__numerical_metrics(
+                            target, n_observations
+                        ),
+                        MetricsStateCalculator.__histogram(
+                            target, reference_state.numerical[model.target.name]
+                        ),
+                        quantile_accuracy,
+                    ),
+                    feature_metrics=feature_metrics,
+                )
+
+    @staticmethod
+    def __residual_metrics(
+        model: ModelOut,
+        statistics: Dict[str, Optional[float]],
+        regression: RegressionState,
+    ) -> Dict:
+        """
+        The residual metrics of residual_metrics: KS test and histogram of the residuals
+        from their sketch, and the scatter points standardized with the moments of all
+        the residuals.
+        """
+        residuals = regression.residuals
+        if residuals.count:
+            # KS distance from the normal distribution at the quantiles of the sketch
+            quantiles = np.array(residuals.quantiles)
+            probabilities = np.linspace(0, 1, len(quantiles))
+            normal = norm.cdf(quantiles)
+            statistic = float(
+                max(
+                    np.max(np.abs(probabilities - normal)),
+                    np.max(np.abs(probabilities[:-1] - normal[1:])),
+                )
+            )
+            p_value = float(kstwo.sf(statistic, residuals.count))
+            buckets_spacing = np.linspace(quantiles[0], quantiles[-1], 11).tolist()
+            lookup = set()
+            generated_buckets = [
+                x for x in buckets_spacing if x not in lookup and lookup.add(x) is None
+            ]
+            # workaround if all values are the same to not have errors
+            histogram = (
+                ResidualHistogram(
+                    buckets=[generated_buckets[0], generated_buckets[0]],
+                    values=[residuals.count],
+                )
+                if len(generated_buckets) == 1
+                else ResidualHistogram(
+                    buckets=buckets_spacing,
+                    values=residuals.bucket_counts(generated_buckets),
+                )
+            )
+        else:
+            statistic = p_value = float("nan")
+            histogram = ResidualHistogram(buckets=[], values=[])
+
+        mean, std = ModelQualityRegressionCalculator.residual_moments(statistics)
+        return {
+            "ks": {"p_value": p_value, "statistic": statistic},
+            "correlation_coefficient": (
+                ModelQualityRegressionCalculator.correlation_coefficient(statistics)
+            ),
+            "histogram": histogram.model_dump(serialize_as_any=True),
+            "standardized_residuals": [
+                (target - prediction - mean) / std if std > 0 else 0.0
+                for _, prediction, target in regression.points
+            ],
+            "predictions": [prediction for _, prediction, _ in regression.points],
+            "targets": [target for _, _, target in regression.points],
+            "regression_line": ModelQualityRegressionCalculator.get_regression_line(
+                model, None, statistics
+            ),
+        }
+
+    @staticmethod
+    def __binary_model_quality(
+        model: ModelOut, classification: ClassificationState
+    ) -> Dict:
+        """
+        The model quality of calculate_model_quality_with_group_by_timestamp, from the
+        confusions and, with the scores, from the score bins and the log loss sums.
+        Global and time grouped areas under the curves both come from the SCORE_BINS
+        bins of the scores.
+        """
+
+        def sorted_groups(groups):
+            return sorted(groups, key=lambda x: (x is not None, x))
+
+        global_confusions = {}
+        confusions_by_group = {}
+        for group, target, prediction, count in classification.confusions:
+            group_confusions = confusions_by_group.setdefault(group, {})
+            group_confusions[(target, prediction)] = (
+                group_confusions.get((target, prediction), 0) + count
+            )
+            global_confusions[(target, prediction)] = (
+                global_confusions.get((target, prediction), 0) + count
+            )
+        global_metrics = ConfusionMatrixMetrics(global_confusions)
+        metrics_by_group = {
+            group: ConfusionMatrixMetrics(confusions)
+            for group, confusions in confusions_by_group.items()
+        }
+        groups = sorted_groups(metrics_by_group.keys())
+        # metricLabel=1 as in the current job, the positive class is 1
+        multiclass_metrics = (
+            CurrentMetricsService.model_quality_multiclass_classificator
+        )
+        metrics = {
+            "global_metrics": {
+                label: global_metrics.evaluate(name, metric_label=1.0)
+                for name, label in multiclass_metrics.items()
+            },
+            "grouped_metrics": {
+                label: [
+                    {
+                        "timestamp": group,
+                        "value": metrics_by_group[group].evaluate(
+                            name, metric_label=1.0
+                        ),
+                    }
+                    for group in groups
+                ]
+                for name, label in multiclass_metrics.items()
+            },
+        }
+        metrics["global_metrics"].update(
+            ModelQualityBinaryCalculator.confusion_matrix(
+                model,
+                [
+                    {
+                        model.target.name: target,
+                        model.outputs.prediction.name: prediction,
+                        "count": count,
+                    }
+                    for (target, prediction), count in global_confusions.items()
+                ],
+            )
+        )
+        if model.outputs.prediction_proba is None:
+            return metrics
+
+        score_counts = {}
+        score_counts_by_group = {}
+        for group, score_bin, positive, count in classification.scores:
+            for counts in (score_counts, score_counts_by_group.setdefault(group, {})):
+                positives, negatives = counts.get(score_bin, (0, 0))
+                counts[score_bin] = (
+                    (positives + count, negatives)
+                    if positive
+                    else (positives, negatives + count)
+                )
+
+        def area_under_curves(counts: Dict[int, tuple]) -> Dict[str, float]:
+            return ModelQualityBinaryCalculator.area_under_curves(
+                [(score_bin, *labels) for score_bin, labels in counts.items()]
+            )
+
+        binary_metrics = CurrentMetricsService.model_quality_binary_classificator
+        global_area_under_curves = (
+            area_under_curves(score_counts)
+            if score_counts
+            else {name: float("nan") for name in binary_metrics}
+        )
+        area_under_curves_by_group = {
+            group: area_under_curves(counts)
+            for group, counts in score_counts_by_group.items()
+        }
+        for name, label in binary_metrics.items():
+            metrics["global_metrics"][label] = global_area_under_curves[name]
+            metrics["grouped_metrics"][label] = [
+                {"timestamp": group, "value": area_under_curves_by_group[group][name]}
+                for group in sorted_groups(area_under_curves_by_group.keys())
+            ]
+
+        def mean(log_loss_sum: float, count: int) -> float:
+            return log_loss_sum / count if count else float("nan")
+
+        metrics["global_metrics"]["log_loss"] = mean(
+            sum(log_loss_sum for _, log_loss_sum, _ in classification.log_loss),
+            sum(count for _, _, count in classification.log_loss),
+        )
+        log_loss_by_group = {
+            group: mean(log_loss_sum, count)
+            for group, log_loss_sum, count in classification.log_loss
+        }
+        metrics["grouped_metrics"]["log_loss"] = [
+            {"timestamp": group, "value": log_loss_by_group[group]}
+            for group in sorted_groups(log_loss_by_group.keys())
+        ]
+        return metrics
+
+    @staticmethod
+    def model_quality(
+        model: ModelOut, state: MetricsState, reference_state: MetricsState
+    ) -> Dict:
+        """
+        The model quality of the current dataset of the state, as computed by the
+        current job. The areas under the curves of binary classification are computed
+        from the bins of the scores, as the time grouped ones of the current job.
+        """
+        match model.model_type:
+            case ModelType.BINARY:
+                return MetricsStateCalculator.__binary_model_quality(
+                    model, state.classification
+                )
+            case ModelType.MULTI_CLASS:
+                # classes of reference and current are indexed as by the current job
+                classes = sorted(
+                    {
+                        label
+                        for s in (state, reference_state)
+                        for label, _ in s.classification.target_counts
+                        + s.classification.prediction_counts
+                    }
+                )
+                index_map = {label: float(index) for index, label in enumerate(classes)}
+                global_confusions = {}
+                confusions_by_group = {}
+                for group, target, prediction, count in state.classification.confusions:
+                    key = (index_map[target], index_map[prediction])
+                    group_confusions = confusions_by_group.setdefault(group, {})
+                    group_confusions[key] = group_confusions.get(key, 0) + count
+                    global_confusions[key] = global_confusions.get(key, 0) + count
+                return CurrentMetricsMulticlassService.model_quality_from_confusions(
+                    {str(index): str(label) for label, index in index_map.items()},
+                    ConfusionMatrixMetrics(global_confusions),
+                    {
+                        group: ConfusionMatrixMetrics(confusions)
+                        for group, confusions in confusions_by_group.items()
+                    },
+                )
+            case ModelType.REGRESSION:
+                regression = state.regression
+                statistics = regression.global_statistics()
+                global_metrics = (
+                    ModelQualityRegressionCalculator.metrics_from_statistics(
+                        model, statistics
+                    ).model_dump(serialize_as_any=True)
+                )
+                global_metrics["residuals"] = MetricsStateCalculator.__residual_metrics(
+                    model, statistics, regression
+                )
+                return {
+                    "global_metrics": global_metrics,
+                    "grouped_metrics": CurrentMetricsRegressionService.grouped_metrics_from_groups(
+                        {
+                            group: ModelQualityRegressionCalculator.metrics_from_statistics(
+                                model, group_statistics
+                            )
+                            for group, group_statistics in regression.statistics
+                        }
+                    ),
+                }
+
+    @staticmethod
+    def __psi(current: NumericalState, reference: NumericalState) -> float:
+        """The PSI of calculate_psi_batch, from the distinct values or the sketches."""
+        bounds = [
+            v
+            for v in (reference.min, reference.max, current.min, current.max)
+            if v is not None
+        ]
+        if not bounds:
+            return float("nan")
+        distinct_values = None
+        if current.values is not None and reference.values is not None:
+            distinct_values = {v for v, _ in current.values + reference.values}
+        if distinct_values is not None and len(distinct_values) < 10:
+            buckets_spacing = sorted(distinct_values)
+            buckets_spacing.append(buckets_spacing[-1] + 1)
+        else:
+            buckets_spacing = np.linspace(min(bounds), max(bounds), 11).tolist()
+
+        lookup = set()
+        generated_buckets = [
+            x for x in buckets_spacing if x not in lookup and lookup.add(x) is None
+        ]
+        # workaround if all values are the same to not have errors
+        if len(generated_buckets) == 1:
+            splits = [-float(inf), generated_buckets[0], float(inf)]
+            buckets_number = [1]
+        else:
+            splits = generated_buckets
+            buckets_number = list(range(10))
+        current_counts = current.bucket_counts(splits)
+        reference_counts = reference.bucket_counts(splits)
+        current_hist = [
+            current_counts[b] if b < len(current_counts) else 0 for b in buckets_number
+        ]
+        reference_hist = [
+            reference_counts[b] if b < len(reference_counts) else 0
+            for b in buckets_number
+        ]
+        if not sum(current_hist) or not sum(reference_hist):
+            return float("nan")
+        current_fractions = [x / sum(current_hist) for x in current_hist]
+        reference_fractions = [x / sum(reference_hist) for x in reference_hist]
+        return float(
+            sum(
+                PSI.sub_psi(reference_fractions[i], current_fractions[i])
+                for i in range(0, len(reference_fractions))
+            )
+        )
+
+    @staticmethod
+    def drift(
+        model: ModelOut, state: MetricsState, reference_state: MetricsState
+    ) -> Dict:
+        """
+        The drift of calculate_drift: Chi2 from the frequencies of the categories, KS
+        from the quantile sketches and PSI from the distinct values or the sketches.
+        """
+        drift_result = {"feature_metrics": []}
+
+        for feature in model.get_categorical_features():
+            current = state.categorical[feature.name].counts
+            reference = reference_state.categorical[feature.name].counts
+            values = list(reference.keys() | current.keys())
+            result = Chi2Test.goodness_fit(
+                [reference.get(v, 0) for v in values],
+                [current.get(v, 0) for v in values],
+            )
+            drift_result["feature_metrics"].append(
+                {
+                    "feature_name": feature.name,
+                    "field_type": FieldTypes.categorical.value,
+                    "drift_calc": {
+                        "type": "CHI2",
+                        "value": float(result["pValue"]),
+                        "has_drift": bool(result["pValue"] <= 0.05),
+                    },
+                }
+            )
+
+        for feature in model.get_float_features():
+            if state.n_observations and reference_state.n_observations:
+                result = KolmogorovSmirnovTest(
+                    reference_data=None,
+                    current_data=None,
+                    alpha=DriftCalculator.KS_ALPHA,
+                    phi=DriftCalculator.KS_PHI,
+                    reference_size=reference_state.n_observations,
+                    current_size=state.n_observations,
+                ).test_quantiles(
+                    reference_state.numerical[feature.name].sketch.quantile,
+                    state.numerical[feature.name].sketch.quantile,
+                )
+            else:
+                result = {"ks_statistic": float("nan"), "critical_value": float("nan")}
+            drift_result["feature_metrics"].append(
+                {
+                    "feature_name": feature.name,
+                    "field_type": FieldTypes.numerical.value,
+                    "drift_calc": {
+                        "type": "KS",
+                        "value": float(result["ks_statistic"]),
+                        "has_drift": bool(
+                            result["ks_statistic"] > result["critical_value"]
+                        ),
+                    },
+                }
+            )
+
+        for feature in model.get_int_features():
+            psi_value = MetricsStateCalculator.__psi(
+                state.numerical[feature.name], reference_state.numerical[feature.name]
+            )
+            drift_result["feature_metrics"].append(
+                {
+                    "feature_name": feature.name,
+                    "field_type": FieldTypes.numerical.value,
+                    "drift_calc": {
+                        "type": "PSI",
+                        "value": psi_value,
+                        "has_drift": bool(psi_value >= 0.1),
+                    },
+                }
+            )
+
+        return drift_result
@@ -0,0 +1,274 @@
+from math import isnan
+from typing import Dict, List, Optional, Tuple
+
+from pyspark.sql import Column, DataFrame, Row
+import pyspark.sql.functions as F
+
+from metrics.confusion_matrix_metrics import ConfusionMatrixMetrics
+from models.data_quality import ClassMetrics
+from utils.misc import rbit_prefix
+from utils.models import ModelOut
+from utils.spark import is_not_null
+
+
+class ModelQualityBinaryCalculator:
+    # same clipping of MulticlassMetrics.logLoss
+    LOG_LOSS_EPS = 1e-15
+
+    @staticmethod
+    def label_prediction_counts(model: ModelOut, dataframe: DataFrame) -> List[Row]:
+        """
+        Counts the rows of every (target, prediction) pair with a single aggregation.
+        The result has at most a few rows for a binary model, and it is enough to derive
+        both the confusion matrix and the class distributions of target and prediction.
+        """
+        return (
+            dataframe.groupBy(model.target.name, model.outputs.prediction.name)
+            .count()
+            .collect()
+        )
+
+    @staticmethod
+    def confusion_matrix(model: ModelOut, counts: List[Row]) -> Dict[str, int]:
+        def is_valid(x) -> bool:
+            return x is not None and not isnan(x)
+
+        def count_pairs(target, prediction) -> int:
+            return sum(
+                row["count"]
+                for row in counts
+                if is_valid(row[model.target.name])
+                and is_valid(row[model.outputs.prediction.name])
+                and row[model.target.name] == target
+                and row[model.outputs.prediction.name] == prediction
+            )
+
+        return {
+            "true_positive_count": count_pairs(1, 1),
+            "false_positive_count": count_pairs(0, 1),
+            "true_negative_count": count_pairs(0, 0),
+            "false_negative_count": count_pairs(1, 0),
+        }
+
+    @staticmethod
+    def class_metrics(
+        class_column: str, counts: List[Row], dataframe_count: int
+    ) -> List[ClassMetrics]:
+        class_counts = {}
+        for row in counts:
+            label = row[class_column]
+            if label is None:
+                continue
+            # NaN labels are grouped but not counted, as count() ignores them
+            count = 0 if isnan(label) else row["count"]
+            _, previous_count = class_counts.get(str(label), (label, 0))
+            class_counts[str(label)] = (label, previous_count + count)
+
+        # same order of Spark, with NaN greater than any other value
+        sorted_counts = sorted(
+            class_counts.items(), key=lambda x: (isnan(x[1][0]), x[1][0])
+        )
+        return [
+            ClassMetrics(
+                name=name,
+                count=count,
+                percentage=(count / dataframe_count) * 100,
+            )
+            for name, (_, count) in sorted_counts
+        ]
+
+    @staticmethod
+    def area_under_curves(
+        score_counts: List[Tuple[float, int, int]],
+    ) -> Dict[str, float]:
+        """
+        Computes the area under ROC and PR curves with the definitions of
+        BinaryClassificationMetrics, starting from the number of positive and negative
+        labels of every distinct score (or score bin).
+
+        Parameters:
+        - score_counts (List[Tuple[float, int, int]]): (score, positives, negatives) tuples.
+
+        Returns:
+        - Dict[str, float]: areaUnderROC and areaUnderPR.
+        """
+        sorted_counts = sorted(score_counts, key=lambda x: x[0], reverse=True)
+        positives = sum(p for _, p, _ in sorted_counts)
+        negatives = sum(n for _, _, n in sorted_counts)
+
+        roc_curve = [(0.0, 0.0)]
+        pr_curve = []
+        tp, fp = 0, 0
+        for _, p, n in sorted_counts:
+            tp += p
+            fp += n
+            recall = 0.0 if positives == 0 else tp / positives
+            false_positive_rate = 0.0 if negatives == 0 else fp / negatives
+            precision = 1.0 if tp + fp == 0 else tp / (tp + fp)
+            roc_curve.append((false_positive_rate, recall))
+            pr_curve.append((recall, precision))
+        roc_curve.append((1.0, 1.0))
+
+        def area_under_curve(curve: List[Tuple[float, float]]) -> float:
+            return sum(
+                (x2 - x1) * (y2 + y1) / 2.0
+                for (x1, y1), (x2, y2) in zip(curve, curve[1:])
+            )
+
+        return {
+            "areaUnderROC": area_under_curve(roc_curve),
+            # the PR curve starts from the precision of the first threshold
+            "areaUnderPR": area_under_curve([(0.0, pr_curve[0][1])] + pr_curve)
+            if pr_curve
+            else float("nan"),
+        }
+
+    @staticmethod
+    def area_under_curves_by_group(
+        model: ModelOut,
+        dataframe: DataFrame,
+        group_column: str,
+        num_bins: int = 1000,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Computes the area under ROC and PR curves of every group with a single aggregation.
+        Scores are bucketed in num_bins equal width bins between the global min and max,
+        like the down-sampling of BinaryClassificationEvaluator, and the positive and
+        negative labels of every (group, bin) are counted.
+
+        Returns:
+        - Dict[str, Dict[str, float]]: areaUnderROC and areaUnderPR of every group.
+        """
+        score = model.outputs.prediction_proba.name
+        label = model.target.name
+
+        min_score, max_score = dataframe.agg(F.min(score), F.max(score)).collect()[0]
+        if min_score is None:
+            return {}
+        if min_score == max_score:
+            score_bin = F.lit(0)
+        else:
+            score_bin = F.least(
+                F.floor(
+                    (F.col(score) - min_score) / (max_score - min_score) * num_bins
+                ),
+                F.lit(num_bins - 1),
+            )
+
+        rows = (
+            dataframe.withColumn(f"{rbit_prefix}_score_bin", score_bin)
+            .groupBy(group_column, f"{rbit_prefix}_score_bin")
+            .agg(
+                F.sum(F.when(F.col(label) > 0.5, 1).otherwise(0)).alias("positives"),
+                F.sum(F.when(F.col(label) > 0.5, 0).otherwise(1)).alias("negatives"),
+            )
+            .collect()
+        )
+
+        score_counts_by_group = {}
+        for row in rows:
+            score_counts_by_group.setdefault(row[group_column], []).append(
+                (row[f"{rbit_prefix}_score_bin"], row["positives"], row["negatives"])
+            )
+
+        return {
+            group: ModelQualityBinaryCalculator.area_under_curves(score_counts)
+            for group, score_counts in score_counts_by_group.items()
+        }
+
+    @staticmethod
+    def multiclass_metrics_by_group(
+        model: ModelOut, dataframe: DataFrame, group_column: str
+    ) -> Dict[str, ConfusionMatrixMetrics]:
+        """
+        Computes the confusion counts of every group with a single
+        groupBy(group, target, prediction) aggregation.
+
+        Returns:
+        - Dict[str, ConfusionMatrixMetrics]: the metrics calculator of every group.
+        """
+        rows = (
+            dataframe.groupBy(
+                group_column, model.target.name, model.outputs.prediction.name
+            )
+            .count()
+            .collect()
+        )
+
+        confusions_by_group = {}
+        for row in rows:
+            confusions_by_group.setdefault(row[group_column], {})[
+                (row[model.target.name], row[model.outputs.prediction.name])
+            ] = row["count"]
+
+        return {
+            group: ConfusionMatrixMetrics(confusions)
+            for group, confusions in confusions_by_group.items()
+        }
+
+    @staticmethod
+    def log_loss_column(model: ModelOut) -> Column:
+        """
+        Computes the clipped -log(p) of every row, where p is the probability of the
+        target class built from prediction and prediction_proba like the probability
+        vectors of MulticlassMetrics. The value is null for rows that are not counted
+        (missing prediction, target or probability), so that it is ignored by F.avg.
+        """
+        prediction = F.col(model.outputs.prediction.name)
+        proba = F.col(model.outputs.prediction_proba.name)
+        target = F.col(model.target.name).cast("int")
+
+        proba_class0 = F.when(prediction == 0, proba).otherwise(1 - proba)
+        proba_class1 = F.when(prediction == 1, proba).otherwise(1 - proba)
+        proba_target = F.when(target == 0, proba_class0).when(target == 1, proba_class1)
+        clipped = F.least(
+            F.greatest(proba_target, F.lit(ModelQualityBinaryCalculator.LOG_LOSS_EPS)),
+            F.lit(1 - ModelQualityBinaryCalculator.LOG_LOSS_EPS),
+        )
+        return F.when(
+            is_not_null(model.outputs.prediction.name)
+            & is_not_null(model.target.name)
+            & is_not_null(model.outputs.prediction_proba.name),
+            -F.log(clipped),
+        )
+
+    @staticmethod
+    def log_loss(model: ModelOut, dataframe: DataFrame) -> float:
+        """Computes the log loss of the whole dataframe with a single aggregation."""
+        log_loss = dataframe.agg(
+            F.avg(ModelQualityBinaryCalculator.log_loss_column(model))
+        ).collect()[0][0]
+        return float("nan") if log_loss is None else log_loss
+
+    @staticmethod
+    def log_loss_by_group(
+        model: ModelOut, dataframe: DataFrame, group_column: str
+    ) -> Tuple[float, Dict[Optional[str], float]]:
+        """
+        Computes the global log loss and the log loss of every group with a single
+        rollup aggregation, where the grand total row gives the global value.
+
+        Returns:
+        - Tuple[float, Dict[Optional[str], float]]: the global log loss and the log loss of
+        every group.
+        """
+        rows = (
+            dataframe.rollup(group_column)
+            .agg(
+                F.avg(ModelQualityBinaryCalculator.log_loss_column(model)).alias(
+                    "log_loss"
+                ),
+                F.grouping(group_column).alias(f"{rbit_prefix}_is_global"),
+            )
+            .collect()
+        )
+
+        global_log_loss = float("nan")
+        log_loss_by_group = {}
+        for row in rows:
+            log_loss = float("nan") if row["log_loss"] is None else row["log_loss"]
+            if row[f"{rbit_prefix}_is_global"] == 1:
+                global_log_loss = log_loss
+            else:
+                log_loss_by_group[row[group_column]] = log_loss
+        return global_log_loss, log_loss_by_group
@@ -0,0 +1,58 @@
+from typing import Dict, List, Optional, Tuple
+
+from pyspark.sql import DataFrame
+
+from metrics.confusion_matrix_metrics import ConfusionMatrixMetrics
+
+
+class ModelQualityMulticlassCalculator:
+    @staticmethod
+    def confusion_metrics_by_group(
+        dataframe: DataFrame,
+        label_column: str,
+        prediction_column: str,
+        group_column: str,
+    ) -> Tuple[ConfusionMatrixMetrics, Dict[Optional[str], ConfusionMatrixMetrics]]:
+        """
+        Computes the confusion matrix of every group with a single
+        groupBy(group, label, prediction).count(), the global matrix is the sum of the
+        matrices of the groups. Per label and weighted metrics are then derived on the
+        driver from the matrices.
+
+        Parameters:
+        - dataframe (DataFrame): Dataframe with indexed label and prediction columns.
+        - label_column (str): The indexed label column.
+        - prediction_column (str): The indexed prediction column.
+        - group_column (str): The group column, e.g. the time group.
+
+        Returns:
+        - Tuple[ConfusionMatrixMetrics, Dict[Optional[str], ConfusionMatrixMetrics]]: the
+        global metrics and the metrics of every group.
+        """
+        rows = (
+            dataframe.groupBy(group_column, label_column, prediction_column)
+            .count()
+            .collect()
+        )
+
+        confusions_by_group = {}
+        global_confusions: Dict[Tuple[float, float], int] = {}
+        for row in rows:
+            key = (row[label_column], row[prediction_column])
+            confusions_by_group.setdefault(row[group_column], {})[key] = row["count"]
+            global_confusions[key] = global_confusions.get(key, 0) + row["count"]
+
+        return ConfusionMatrixMetrics(global_confusions), {
+            group: ConfusionMatrixMetrics(confusions)
+            for group, confusions in confusions_by_group.items()
+        }
+
+    @staticmethod
+    def label_confusion_matrix(metrics: ConfusionMatrixMetrics) -> List[List[float]]:
+        """
+        Returns the confusion matrix of the classes present as label, ordered by index,
+        as the confusionMatrix of MulticlassMetrics.
+        """
+        return metrics.confusion_matrix(
+            [metrics.classes[i] for i in metrics.label_classes]
+        )
@@ -1,148 +1,213 @@
+from typing import Dict, List, Optional, Tuple
+
 import numpy as np
-from math import inf
+from math import inf, sqrt
 
-from pyspark.sql import DataFrame
+from pyspark.sql import Column, DataFrame
 import pyspark.sql.functions as F
-from pyspark.sql.types import ArrayType, FloatType
-from pyspark.ml.feature import StandardScaler, VectorAssembler, Bucketizer
+from pyspark.ml.feature import Bucketizer
 from pyspark.ml.stat import KolmogorovSmirnovTest
-from pyspark.ml.regression import LinearRegression
 
 from models.regression_model_quality import (
     RegressionMetricType,
     ModelQualityRegression,
     Histogram,
 )
-from utils.models import ModelOut
-from pyspark.ml.evaluation import RegressionEvaluator
+from utils.models import DEFAULT_RESIDUAL_POINTS_BUDGET, ModelOut
 from utils.spark import is_not_null
 from utils.misc import rbit_prefix
 
 
 class ModelQualityRegressionCalculator:
     @staticmethod
-    def eval_model_quality_metric(
-        model: ModelOut,
-        dataframe: DataFrame,
-        dataframe_count: int,
-        metric_name: RegressionMetricType,
-    ) -> float:
-        try:
-            dataframe = dataframe.withColumn(
-                model.outputs.prediction.name,
-                F.col(model.outputs.prediction.name).cast("float"),
-            )
-            match metric_name:
-                case RegressionMetricType.ADJ_R2:
-                    # Source: https://medium.com/analytics-vidhya/adjusted-r-squared-formula-explanation-1ce033e25699
-                    # adj_r2 = 1 - (n - 1) / (n - p - 1)
-                    # n: number of observations
-                    # p: number of indipendent variables (feaures)
-                    p: float = len(model.features)
-                    n: float = dataframe_count
-                    r2: float = (
-                        ModelQualityRegressionCalculator.eval_model_quality_metric(
-                            model, dataframe, dataframe_count, RegressionMetricType.R2
-                        )
-                    )
-                    return 1 - (1 - r2) * ((n - 1) / (n - p - 1))
-                case RegressionMetricType.MAPE:
-                    # Source: https://en.wikipedia.org/wiki/Mean_absolute_percentage_error
-                    # mape = 100 * (abs(actual - predicted) / actual) / n
-                    _dataframe = dataframe.withColumn(
-                        f"{rbit_prefix}_mape",
-                        F.abs(
-                            (
-                                F.col(model.outputs.prediction.name)
-                                - F.col(model.target.name)
-                            )
-                            / F.col(model.target.name)
-                        ),
-                    )
-                    return (
-                        _dataframe.agg({f"{rbit_prefix}_mape": "avg"}).collect()[0][0]
-                        * 100
-                    )
-                case RegressionMetricType.VAR:
-                    return RegressionEvaluator(
-                        metricName="var",
-                        labelCol=model.target.name,
-                        predictionCol=model.outputs.prediction.name,
-                    ).evaluate(dataframe)
-                case (
-                    RegressionMetricType.MAE
-                    | RegressionMetricType.MSE
-                    | RegressionMetricType.RMSE
-                    | RegressionMetricType.R2
-                ):
-                    return RegressionEvaluator(
-                        metricName=metric_name.value,
-                        labelCol=model.target.name,
-                        predictionCol=model.outputs.prediction.name,
-                    ).evaluate(dataframe)
-        except Exception:
-            return float("nan")
+    def __divide(numerator: float, denominator: float) -> float:
+        # same results of the JVM division, with infinite and NaN values instead of errors
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return float(np.divide(np.float64(numerator), np.float64(denominator)))
+
+    @staticmethod
+    def sufficient_statistics(model: ModelOut) -> List[Column]:
+        """
+        Aggregations of the sufficient statistics of all regression metrics, computed on
+        the rows with valid prediction and target. They are the moments used by the
+        metrics, the regression line and the standardization of residuals. All statistics
+        are sums, so they can be merged by adding them.
+        """
+        valid = is_not_null(model.outputs.prediction.name) & is_not_null(
+            model.target.name
+        )
+        y = F.when(valid, F.col(model.target.name).cast("double"))
+        y_hat = F.when(valid, F.col(model.outputs.prediction.name).cast("double"))
+        # null when target is 0, ignored as by the mean of the percentage errors
+        ape = F.abs((y_hat - y) / y)
+        return [
+            F.count(y).alias("n"),
+            F.sum(y).alias("sum_y"),
+            F.sum(y_hat).alias("sum_y_hat"),
+            F.sum(y * y).alias("sum_y2"),
+            F.sum(y_hat * y_hat).alias("sum_y_hat2"),
+            F.sum(y * y_hat).alias("sum_y_y_hat"),
+            F.sum(F.abs(y - y_hat)).alias("sum_abs_error"),
+            # summed directly, expanding it from the other sums loses precision
+            F.sum((y - y_hat) * (y - y_hat)).alias("sum_squared_error"),
+            F.sum(ape).alias("sum_ape"),
+            F.count(ape).alias("n_ape"),
+        ]
 
     @staticmethod
-    def __calc_mq_metrics(
-        model: ModelOut, dataframe: DataFrame, dataframe_count: int
+    def metrics_from_statistics(
+        model: ModelOut, statistics: Dict[str, Optional[float]]
     ) -> ModelQualityRegression:
+        """
+        Derives all regression metrics from the sufficient statistics, with the
+        definitions of RegressionEvaluator (MAE, MSE, RMSE, R2 and explained variance),
+        the mean absolute percentage error and the adjusted R2.
+        """
+        divide = ModelQualityRegressionCalculator.__divide
+        n = statistics["n"] or 0
+        if n == 0:
+            return ModelQualityRegression(
+                **{
+                    metric_name.value: float("nan")
+                    for metric_name in RegressionMetricType
+                }
+            )
+
+        mean_y = statistics["sum_y"] / n
+        # sum of (y - mean_y)^2 and (y_hat - mean_y)^2
+        ss_err = statistics["sum_squared_error"]
+        ss_tot = max(statistics["sum_y2"] - n * mean_y * mean_y, 0.0)
+        ss_reg = max(
+            statistics["sum_y_hat2"]
+            - 2 * mean_y * statistics["sum_y_hat"]
+            + n * mean_y * mean_y,
+            0.0,
+        )
+
+        mse = ss_err / n
+        r2 = 1 - divide(ss_err, ss_tot)
+        # Source: https://medium.com/analytics-vidhya/adjusted-r-squared-formula-explanation-1ce033e25699
+        # adj_r2 = 1 - (n - 1) / (n - p - 1)
+        # n: number of observations
+        # p: number of indipendent variables (feaures)
+        p = len(model.features)
+        adj_r2 = (
+            1 - (1 - r2) * ((n - 1) / (n - p - 1)) if n - p - 1 != 0 else float("nan")
+        )
+        # Source: https://en.wikipedia.org/wiki/Mean_absolute_percentage_error
+        # mape = 100 * (abs(actual - predicted) / actual) / n
+        mape = (
+            statistics["sum_ape"] / statistics["n_ape"] * 100
+            if statistics["n_ape"]
+            else float("nan")
+        )
+
         return ModelQualityRegression(
-            **{
-                metric_name.value: ModelQualityRegressionCalculator.eval_model_quality_metric(
-                    model,
-                    dataframe,
-                    dataframe_count,
-                    metric_name,
-                )
-                for metric_name in RegressionMetricType
-            }
+            mae=statistics["sum_abs_error"] / n,
+            mape=mape,
+            mse=mse,
+            rmse=sqrt(mse),
+            r2=r2,
+            adj_r2=adj_r2,
+            variance=ss_reg / n,
+        )
+
+    @staticmethod
+    def statistics(model: ModelOut, dataframe: DataFrame) -> Dict[str, Optional[float]]:
+        """Computes the sufficient statistics of the dataframe with a single aggregation."""
+        return (
+            dataframe.agg(
+                *ModelQualityRegressionCalculator.sufficient_statistics(model)
+            )
+            .collect()[0]
+            .asDict()
         )
 
     @staticmethod
     def numerical_metrics(
-        model: ModelOut, dataframe: DataFrame, dataframe_count: int
+        model: ModelOut,
+        dataframe: DataFrame,
+        dataframe_count: int,
+        statistics: Optional[Dict[str, Optional[float]]] = None,
     ) -> ModelQualityRegression:
-        # # drop row where prediction or ground_truth is null
-        dataframe_clean = dataframe.filter(
-            is_not_null(model.outputs.prediction.name) & is_not_null(model.target.name)
-        )
-        dataframe_clean_count = dataframe_clean.count()
-        return ModelQualityRegressionCalculator.__calc_mq_metrics(
-            model, dataframe_clean, dataframe_clean_count
+        """
+        Computes all regression metrics of the rows with valid prediction and target with
+        a single aggregation, or from the given statistics of the dataframe.
+        """
+        if statistics is None:
+            statistics = ModelQualityRegressionCalculator.statistics(model, dataframe)
+        return ModelQualityRegressionCalculator.metrics_from_statistics(
+            model, statistics
         )
 
     @staticmethod
-    def residual_calculation(model: ModelOut, dataframe: DataFrame):
-        dataframe_clean = dataframe.filter(
-            is_not_null(model.outputs.prediction.name) & is_not_null(model.target.name)
-        ).select(model.outputs.prediction.name, model.target.name)
-        dataframe_clean = dataframe_clean.withColumn(
-            f"{rbit_prefix}_residual",
-            F.col(model.target.name) - F.col(model.outputs.prediction.name),
-        )
-        va = (
-            VectorAssembler()
-            .setInputCols([f"{rbit_prefix}_residual"])
-            .setOutputCol(f"{rbit_prefix}_residual_vector")
+    def numerical_metrics_by_group(
+        model: ModelOut, dataframe: DataFrame, group_column: str
+    ) -> Dict[Optional[str], ModelQualityRegression]:
+        """
+        Computes all regression metrics of every group with a single groupBy, rows without
+        valid prediction and target are ignored.
+
+        Returns:
+        - Dict[Optional[str], ModelQualityRegression]: the metrics of every group.
+        """
+        rows = (
+            dataframe.groupBy(group_column)
+            .agg(*ModelQualityRegressionCalculator.sufficient_statistics(model))
+            .collect()
         )
-        data_va = va.transform(dataframe_clean)
+        return {
+            row[group_column]: ModelQualityRegressionCalculator.metrics_from_statistics(
+                model, row.asDict()
+            )
+            for row in rows
+        }
 
-        residual_scaler = StandardScaler(
-            inputCol=f"{rbit_prefix}_residual_vector",
-            outputCol=f"{rbit_prefix}_std_residual_vector",
-            withMean=True,
-            withStd=True,
+    @staticmethod
+    def residual_moments(statistics: Dict[str, Optional[float]]) -> Tuple[float, float]:
+        """
+        Returns mean and sample standard deviation of the residuals, derived from the
+        sufficient statistics like StandardScaler (0 when there are less than 2 rows).
+        """
+        n = statistics["n"] or 0
+        mean = (statistics["sum_y"] - statistics["sum_y_hat"]) / n if n > 0 else 0.0
+        variance = (
+            max(statistics["sum_squared_error"] - n * mean * mean, 0.0) / (n - 1)
+            if n > 1
+            else 0.0
         )
-        residual_scaler_model = residual_scaler.fit(data_va)
-        data_scaled = residual_scaler_model.transform(data_va)
+        return mean, sqrt(variance)
 
-        vector2list = F.udf(lambda x: x.toArray().tolist(), ArrayType(FloatType()))
-        data_norm = data_scaled.withColumn(
-            f"{rbit_prefix}_std_residual",
-            vector2list(F.col(f"{rbit_prefix}_std_residual_vector")).getItem(0),
+    @staticmethod
+    def residual_calculation(
+        model: ModelOut,
+        dataframe: DataFrame,
+        statistics: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        """
+        Computes the residual of every row with valid prediction and target and its
+        z-score, with mean and sample standard deviation of the residuals derived from
+        the sufficient statistics like StandardScaler (0 when the deviation is 0).
+        """
+        if statistics is None:
+            statistics = ModelQualityRegressionCalculator.statistics(model, dataframe)
+        mean, std = ModelQualityRegressionCalculator.residual_moments(statistics)
+
+        residual = F.col(model.target.name) - F.col(model.outputs.prediction.name)
+        return (
+            dataframe.filter(
+                is_not_null(model.outputs.prediction.name)
+                & is_not_null(model.target.name)
+            )
+            .select(model.outputs.prediction.name, model.target.name)
+            .withColumn(f"{rbit_prefix}_residual", residual)
+            .withColumn(
+                f"{rbit_prefix}_std_residual",
+                (F.col(f"{rbit_prefix}_residual") - F.lit(mean)) / F.lit(std)
+                if std > 0
+                else F.lit(0.0),
+            )
         )
-        return data_norm
 
     @staticmethod
     def create_histogram(dataframe: DataFrame, feature: str):
@@ -190,37 +255,91 @@ class ModelQualityRegressionCalculator:
         return Histogram(buckets=buckets_spacing, values=res)
 
     @staticmethod
-    def get_regression_line(model: ModelOut, dataframe: DataFrame):
-        dataframe_clean = (
-            dataframe.filter(
-                is_not_null(model.outputs.prediction.name)
-                & is_not_null(model.target.name)
-            )
-            .select(model.outputs.prediction.name, model.target.name)
-            .withColumnRenamed(
-                model.outputs.prediction.name, f"{rbit_prefix}_regr_pred"
-            )
-        )
-
-        va = VectorAssembler(inputCols=[model.target.name], outputCol="features")
-
-        data_va = va.transform(dataframe_clean)
+    def get_regression_line(
+        model: ModelOut,
+        dataframe: DataFrame,
+        statistics: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        """
+        Computes the ordinary least squares line of prediction on target in closed form
+        from the sufficient statistics. As LinearRegression, the coefficient is 0 when the
+        target is constant.
+        """
+        if statistics is None:
+            statistics = ModelQualityRegressionCalculator.statistics(model, dataframe)
+        n = statistics["n"] or 0
+        if n == 0:
+            return {"coefficient": float("nan"), "intercept": float("nan")}
+        mean_y = statistics["sum_y"] / n
+        mean_y_hat = statistics["sum_y_hat"] / n
+        covariance = statistics["sum_y_y_hat"] - n * mean_y * mean_y_hat
+        variance = max(statistics["sum_y2"] - n * mean_y * mean_y, 0.0)
+        c = covariance / variance if variance > 0 else 0.0
+        i = mean_y_hat - c * mean_y
 
-        train_data = data_va.select("features", f"{rbit_prefix}_regr_pred")
+        return {"coefficient": float(c), "intercept": float(i)}
 
-        lr = LinearRegression(labelCol=f"{rbit_prefix}_regr_pred")
+    @staticmethod
+    def correlation_coefficient(statistics: Dict[str, Optional[float]]) -> float:
+        """Computes the Pearson correlation of prediction and target."""
+        n = statistics["n"] or 0
+        if n == 0:
+            return float("nan")
+        mean_y = statistics["sum_y"] / n
+        mean_y_hat = statistics["sum_y_hat"] / n
+        covariance = statistics["sum_y_y_hat"] - n * mean_y * mean_y_hat
+        variance_y = max(statistics["sum_y2"] - n * mean_y * mean_y, 0.0)
+        variance_y_hat = max(
+            statistics["sum_y_hat2"] - n * mean_y_hat * mean_y_hat, 0.0
+        )
+        return ModelQualityRegressionCalculator.__divide(
+            covariance, sqrt(variance_y * variance_y_hat)
+        )
 
-        # Fit the model to the data and call this model lrModel
-        lr_model = lr.fit(train_data)
-        c = lr_model.coefficients[0]
-        i = lr_model.intercept
+    @staticmethod
+    def residual_points(
+        model: ModelOut, residual_dataframe: DataFrame, points_budget: int
+    ) -> Dict[str, List[float]]:
+        """
+        Collects at most points_budget (standardized residual, prediction, target) points
+        for the residual scatter plots, so that the size of the result does not depend on
+        the size of the dataset. Points are a deterministic uniform sample: rows are
+        ordered by a hash of their values and the first points_budget are kept, which
+        Spark computes with a bounded top-K of every partition. Datasets with fewer rows
+        are returned whole.
 
-        return {"coefficient": float(c), "intercept": float(i)}
+        Returns:
+        - Dict[str, List[float]]: aligned standardized_residuals, predictions and targets.
+        """
+        columns = [
+            f"{rbit_prefix}_std_residual",
+            model.outputs.prediction.name,
+            model.target.name,
+        ]
+        rows = (
+            residual_dataframe.select(*columns)
+            .orderBy(F.xxhash64(*columns), *columns)
+            .limit(points_budget)
+            .collect()
+        )
+        return {
+            "standardized_residuals": [row[0] for row in rows],
+            "predictions": [row[1] for row in rows],
+            "targets": [row[2] for row in rows],
+        }
 
     @staticmethod
-    def residual_metrics(model: ModelOut, dataframe: DataFrame):
+    def residual_metrics(
+        model: ModelOut,
+        dataframe: DataFrame,
+        points_budget: int = DEFAULT_RESIDUAL_POINTS_BUDGET,
+        statistics: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        # moments of the whole dataframe, shared by standardization, correlation and line
+        if statistics is None:
+            statistics = ModelQualityRegressionCalculator.statistics(model, dataframe)
         residual_df_norm = ModelQualityRegressionCalculator.residual_calculation(
-            model, dataframe
+            model, dataframe, statistics
         )
         ks_result = KolmogorovSmirnovTest.test(
             residual_df_norm, f"{rbit_prefix}_residual", "norm", 0.0, 1.0
@@ -230,24 +349,16 @@ class ModelQualityRegressionCalculator:
                 "p_value": ks_result.pValue,
                 "statistic": ks_result.statistic,
             },
-            "correlation_coefficient": dataframe.corr(
-                model.outputs.prediction.name, model.target.name
+            "correlation_coefficient": (
+                ModelQualityRegressionCalculator.correlation_coefficient(statistics)
             ),
             "histogram": ModelQualityRegressionCalculator.create_histogram(
                 residual_df_norm, f"{rbit_prefix}_residual"
             ).model_dump(serialize_as_any=True),
-            "standardized_residuals": residual_df_norm.select(
-                f"{rbit_prefix}_std_residual"
-            )
-            .rdd.flatMap(lambda x: x)
-            .collect(),
-            "predictions": residual_df_norm.select(model.outputs.prediction.name)
-            .rdd.flatMap(lambda x: x)
-            .collect(),
-            "targets": residual_df_norm.select(model.target.name)
-            .rdd.flatMap(lambda x: x)
-            .collect(),
+            **ModelQualityRegressionCalculator.residual_points(
+                model, residual_df_norm, points_budget
+            ),
             "regression_line": ModelQualityRegressionCalculator.get_regression_line(
-                model, dataframe
+                model, dataframe, statistics
             ),
         }
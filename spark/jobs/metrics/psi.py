@@ -1,9 +1,12 @@
+from typing import Dict, List, Optional
+
 import numpy as np
 from math import inf
 import pyspark.sql.functions as F
-from pyspark.ml.feature import Bucketizer
-from pyspark.sql.types import IntegerType
+from pyspark.sql.types import DoubleType
 from utils.misc import rbit_prefix
+from models.reference_profile import ReferenceProfile
+from utils.spark import split_bucket, split_bucket_of, unpivot_columns
 
 
 class PSI:
@@ -12,7 +15,13 @@ class PSI:
     It is designed to compare two sample distributions and determine if they differ significantly.
     """
 
-    def __init__(self, spark_session, reference_data, current_data) -> None:
+    def __init__(
+        self,
+        spark_session,
+        reference_data,
+        current_data,
+        reference_profile: Optional[ReferenceProfile] = None,
+    ) -> None:
         """
         Initializes the Population Stability Index with the provided data and parameters.
 
@@ -20,10 +29,12 @@ class PSI:
         - spark_session(SparkSession): The SparkSession object.
         - reference_data (DataFrame): The reference data as a Spark DataFrame.
         - current_data (DataFrame): The current data as a Spark DataFrame.
+        - reference_profile (Optional[ReferenceProfile]): The profile of the reference data.
         """
         self.spark_session = spark_session
         self.reference_data = reference_data
         self.current_data = current_data
+        self.reference_profile = reference_profile
 
     @staticmethod
     def sub_psi(e_perc, a_perc):
@@ -40,93 +51,188 @@ class PSI:
         return value
 
     def calculate_psi(self, feature) -> dict:
-        # first compute bucket as a list from 0 to 10 (or distinct().count() of the values in columns)
+        return self.calculate_psi_batch([feature])[feature]
 
-        current = self.current_data.withColumn(f"{rbit_prefix}_type", F.lit("current"))
-        reference = self.reference_data.withColumn(
-            f"{rbit_prefix}_type", F.lit("reference")
-        )
+    def calculate_psi_batch(self, features: List[str]) -> Dict[str, dict]:
+        """
+        Computes the PSI of all the given features with the same buckets of calculate_psi,
+        using a constant number of Spark jobs regardless of the number of features.
 
-        reference_and_current = (
-            current.select([feature, f"{rbit_prefix}_type"])
-            .unionByName(reference.select([feature, f"{rbit_prefix}_type"]))
-            .dropna()
-        )
+        Reference and current are unpivoted in a single long format dataframe of
+        (feature, value, type) rows, used to get bounds and distinct counts of every feature
+        with one aggregation, the distinct values of low cardinality features with one
+        collect and the count of every bucket with one groupBy.
+        Features with their distinct values in the reference profile are not read from the
+        reference data, their reference statistics and buckets are computed on the driver.
+
+        Parameters:
+        - features (List[str]): The features to compute the PSI for.
 
-        max_value = reference_and_current.agg(
-            F.max(
-                F.when(
-                    F.col(feature).isNotNull() & ~F.isnan(feature),
-                    F.col(feature),
+        Returns:
+        - Dict[str, dict]: The PSI value of every feature.
+        """
+        if not features:
+            return {}
+
+        profile_values = {
+            feature: self.reference_profile.numerical_values(feature)
+            for feature in features
+            if self.reference_profile
+            and self.reference_profile.numerical_values(feature) is not None
+        }
+        reference_features = [f for f in features if f not in profile_values]
+
+        reference_and_current = unpivot_columns(
+            self.current_data,
+            features,
+            DoubleType(),
+            **{f"{rbit_prefix}_type": "current"},
+        )
+        if reference_features:
+            reference_and_current = reference_and_current.unionByName(
+                unpivot_columns(
+                    self.reference_data,
+                    reference_features,
+                    DoubleType(),
+                    **{f"{rbit_prefix}_type": "reference"},
                 )
             )
-        ).collect()[0][0]
-        min_value = reference_and_current.agg(
-            F.min(
-                F.when(
-                    F.col(feature).isNotNull() & ~F.isnan(feature),
-                    F.col(feature),
-                )
+        reference_and_current = reference_and_current.dropna()
+
+        features_stats = {
+            row["feature"]: (row["min"], row["max"], row["distinct"])
+            for row in reference_and_current.groupBy("feature")
+            .agg(
+                F.min("value").alias("min"),
+                F.max("value").alias("max"),
+                F.countDistinct("value").alias("distinct"),
+            )
+            .collect()
+        }
+        # profile values are merged with the current statistics
+        for feature, values in profile_values.items():
+            if not values:
+                continue
+            reference_min = min(value for value, _ in values)
+            reference_max = max(value for value, _ in values)
+            current_min, current_max, current_distinct = features_stats.get(
+                feature, (reference_min, reference_max, 0)
+            )
+            features_stats[feature] = (
+                min(reference_min, current_min),
+                max(reference_max, current_max),
+                # lower bound of the distinct values, exact if below 10
+                max(len(values), current_distinct),
             )
-        ).collect()[0][0]
 
-        distinct_features = (
-            reference_and_current.select(feature).distinct().orderBy(feature)
-        )
-        dist_cnt = distinct_features.count()
-        if dist_cnt < 10:
-            buckets_spacing = distinct_features.rdd.flatMap(lambda x: x).collect()
-            buckets_spacing.append(buckets_spacing[-1] + 1)
-        else:
-            buckets_spacing = np.linspace(min_value, max_value, 11).tolist()
-
-        lookup = set()
-        generated_buckets = [
-            x for x in buckets_spacing if x not in lookup and lookup.add(x) is None
+        low_cardinality_features = [
+            feature
+            for feature, (_, _, distinct) in features_stats.items()
+            if distinct < 10
         ]
-        # workaround if all values are the same to not have errors
-        if len(generated_buckets) == 1:
-            # buckets_spacing = [generated_buckets[0], generated_buckets[0]]
-            buckets = [-float(inf), generated_buckets[0], float(inf)]
-        else:
-            buckets = generated_buckets
-
-        bucketizer = Bucketizer(splits=buckets, inputCol=feature, outputCol="bucket")
-        result = bucketizer.setHandleInvalid("keep").transform(reference_and_current)
-
-        current_df = (
-            result.filter(F.col(f"{rbit_prefix}_type") == "current")
-            .groupBy("bucket")
-            .agg(F.count(F.col(feature)).alias("curr_count"))
-        )
-        reference_df = (
-            result.filter(F.col(f"{rbit_prefix}_type") == "reference")
-            .groupBy("bucket")
-            .agg(F.count(F.col(feature)).alias("ref_count"))
-        )
-
-        buckets_number = list(range(10))
-        bucket_df = self.spark_session.createDataFrame(
-            buckets_number, IntegerType()
-        ).withColumnRenamed("value", "bucket")
-        tot_df = (
-            bucket_df.join(current_df, on=["bucket"], how="left")
-            .join(reference_df, on=["bucket"], how="left")
-            .fillna(0)
-            .orderBy("bucket")
-        )
-        # workaround if all values are the same to not have errors
-        if len(generated_buckets) == 1:
-            tot_df = tot_df.filter(F.col("bucket") == 1)
-        current_hist = tot_df.select("curr_count").rdd.flatMap(lambda x: x).collect()
-        reference_hist = tot_df.select("ref_count").rdd.flatMap(lambda x: x).collect()
-        current_fractions = [x / sum(current_hist) for x in current_hist]
-        reference_fractions = [x / sum(reference_hist) for x in reference_hist]
-
-        # compute PSI for each bucket and sum
-        psi_value = sum(
-            PSI.sub_psi(reference_fractions[i], current_fractions[i])
-            for i in range(0, len(reference_fractions))
-        )
+        distinct_values = {feature: set() for feature in low_cardinality_features}
+        if low_cardinality_features:
+            for row in (
+                reference_and_current.filter(
+                    F.col("feature").isin(low_cardinality_features)
+                )
+                .select("feature", "value")
+                .distinct()
+                .collect()
+            ):
+                distinct_values[row["feature"]].add(row["value"])
+            for feature in low_cardinality_features:
+                distinct_values[feature].update(
+                    value for value, _ in profile_values.get(feature, [])
+                )
+                if len(distinct_values[feature]) >= 10:
+                    del distinct_values[feature]
+
+        splits = {}
+        single_bucket = set()
+        for feature, (min_value, max_value, _) in features_stats.items():
+            if feature in distinct_values:
+                buckets_spacing = sorted(distinct_values[feature])
+                buckets_spacing.append(buckets_spacing[-1] + 1)
+            else:
+                buckets_spacing = np.linspace(min_value, max_value, 11).tolist()
+
+            lookup = set()
+            generated_buckets = [
+                x for x in buckets_spacing if x not in lookup and lookup.add(x) is None
+            ]
+            # workaround if all values are the same to not have errors
+            if len(generated_buckets) == 1:
+                single_bucket.add(feature)
+                splits[feature] = [-float(inf), generated_buckets[0], float(inf)]
+            else:
+                splits[feature] = generated_buckets
+
+        buckets_count = {}
+        if splits:
+            # same buckets of Bucketizer: splits[i] <= x < splits[i + 1], last one closed
+            features_splits = F.create_map(
+                *[
+                    item
+                    for feature, feature_splits in splits.items()
+                    for item in (
+                        F.lit(feature),
+                        F.array(*[F.lit(x) for x in feature_splits]),
+                    )
+                ]
+            )
+            rows = (
+                reference_and_current.filter(F.col("feature").isin(list(splits)))
+                .withColumn(
+                    f"{rbit_prefix}_splits",
+                    F.element_at(features_splits, F.col("feature")),
+                )
+                .withColumn(
+                    "bucket",
+                    split_bucket(F.col(f"{rbit_prefix}_splits"), F.col("value")),
+                )
+                .groupBy("feature", f"{rbit_prefix}_type", "bucket")
+                .count()
+                .collect()
+            )
+            buckets_count = {
+                (row["feature"], row[f"{rbit_prefix}_type"], row["bucket"]): row[
+                    "count"
+                ]
+                for row in rows
+            }
+            for feature, values in profile_values.items():
+                for value, count in values:
+                    key = (
+                        feature,
+                        "reference",
+                        split_bucket_of(splits[feature], value),
+                    )
+                    buckets_count[key] = buckets_count.get(key, 0) + count
+
+        result = {}
+        for feature in features:
+            if feature not in splits:
+                result[feature] = {"psi_value": float("nan")}
+                continue
+            # workaround if all values are the same to not have errors
+            buckets_number = [1] if feature in single_bucket else list(range(10))
+            current_hist = [
+                buckets_count.get((feature, "current", bucket), 0)
+                for bucket in buckets_number
+            ]
+            reference_hist = [
+                buckets_count.get((feature, "reference", bucket), 0)
+                for bucket in buckets_number
+            ]
+            current_fractions = [x / sum(current_hist) for x in current_hist]
+            reference_fractions = [x / sum(reference_hist) for x in reference_hist]
+
+            # compute PSI for each bucket and sum
+            psi_value = sum(
+                PSI.sub_psi(reference_fractions[i], current_fractions[i])
+                for i in range(0, len(reference_fractions))
+            )
+            result[feature] = {"psi_value": float(psi_value)}
 
-        return {"psi_value": float(psi_value)}
+        return result
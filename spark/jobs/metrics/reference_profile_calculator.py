@@ -0,0 +1,127 @@
+from typing import Dict
+
+import pyspark.sql.functions as F
+from pyspark.sql.types import DoubleType, StringType
+
+from metrics.drift_calculator import DriftCalculator
+from metrics.ks import KolmogorovSmirnovTest
+from models.reference_dataset import ReferenceDataset
+from models.reference_profile import FeatureProfile, ReferenceProfile
+from utils.models import ModelType
+from utils.spark import unpivot_columns
+
+
+class ReferenceProfileCalculator:
+    # features with more distinct values keep only bounds and quantiles in the profile
+    MAX_DISTINCT_VALUES = 1000
+
+    @staticmethod
+    def calculate(reference_dataset: ReferenceDataset) -> ReferenceProfile:
+        """
+        Computes the profile of the reference dataset used by the drift and the data
+        quality of the current jobs:
+        - the count of every distinct value of numerical features (PSI and histograms) and
+        categorical features (Chi2) with at most MAX_DISTINCT_VALUES values
+        - bounds of numerical features
+        - the quantiles of float features at the probability points of the KS test
+
+        Statistics are computed for all the features at once: one aggregation for bounds
+        and cardinality, one groupBy for the values and one approxQuantile.
+
+        Parameters:
+        - reference_dataset (ReferenceDataset): The reference dataset.
+
+        Returns:
+        - ReferenceProfile: The profile of the reference dataset.
+        """
+        model = reference_dataset.model
+        dataframe = reference_dataset.reference
+
+        numerical_features = [f.name for f in model.get_numerical_features()]
+        if (
+            model.model_type == ModelType.REGRESSION
+            and model.target.name not in numerical_features
+        ):
+            numerical_features.append(model.target.name)
+        categorical_features = [f.name for f in model.get_categorical_features()]
+        float_features = [f.name for f in model.get_float_features()]
+
+        features: Dict[str, FeatureProfile] = {
+            feature: FeatureProfile() for feature in numerical_features
+        }
+        features.update({feature: FeatureProfile() for feature in categorical_features})
+
+        values = None
+        if numerical_features:
+            values = unpivot_columns(
+                dataframe, numerical_features, DoubleType(), type="numerical"
+            ).filter(F.col("value").isNotNull() & ~F.isnan("value"))
+        if categorical_features:
+            categorical_values = unpivot_columns(
+                dataframe, categorical_features, StringType(), type="categorical"
+            ).na.drop(subset=["value"])
+            # values are kept as strings, numerical ones are cast back on the driver
+            values = (
+                categorical_values
+                if values is None
+                else values.withColumn(
+                    "value", F.col("value").cast(StringType())
+                ).unionByName(categorical_values)
+            )
+
+        if values is not None:
+            # features without any value have no row, their set of values is empty
+            low_cardinality_features = set(features)
+            for row in (
+                values.groupBy("feature", "type")
+                .agg(
+                    F.min(F.col("value").cast(DoubleType())).alias("min"),
+                    F.max(F.col("value").cast(DoubleType())).alias("max"),
+                    F.approx_count_distinct("value").alias("distinct"),
+                )
+                .collect()
+            ):
+                if row["type"] == "numerical":
+                    features[row["feature"]].min = row["min"]
+                    features[row["feature"]].max = row["max"]
+                if row["distinct"] > ReferenceProfileCalculator.MAX_DISTINCT_VALUES:
+                    low_cardinality_features.discard(row["feature"])
+            for feature in low_cardinality_features:
+                if feature in numerical_features:
+                    features[feature].numerical_values = []
+                else:
+                    features[feature].categorical_values = {}
+
+            if low_cardinality_features:
+                for row in (
+                    values.filter(F.col("feature").isin(list(low_cardinality_features)))
+                    .groupBy("feature", "type", "value")
+                    .count()
+                    .collect()
+                ):
+                    if row["type"] == "numerical":
+                        features[row["feature"]].numerical_values.append(
+                            (float(row["value"]), row["count"])
+                        )
+                    else:
+                        features[row["feature"]].categorical_values[row["value"]] = row[
+                            "count"
+                        ]
+
+        if float_features and reference_dataset.reference_count > 0:
+            probabilities, relative_error = KolmogorovSmirnovTest.probabilities(
+                reference_dataset.reference_count, DriftCalculator.KS_PHI
+            )
+            for feature, quantiles in zip(
+                float_features,
+                dataframe.approxQuantile(
+                    float_features, list(probabilities), relative_error
+                ),
+            ):
+                features[feature].quantiles = quantiles
+
+        return ReferenceProfile(
+            reference_count=reference_dataset.reference_count,
+            ks_phi=DriftCalculator.KS_PHI,
+            features=features,
+        )
@@ -1,8 +1,14 @@
-from models.current_dataset import CurrentDataset
-from models.reference_dataset import ReferenceDataset
+from typing import List, Optional
+
 import pyspark.sql.functions as F
+from pyspark.sql import DataFrame
 
+from metrics.dataset_scan import DatasetScan
+from models.current_dataset import CurrentDataset
+from models.reference_dataset import ReferenceDataset
 from models.statistics import Statistics
+from utils.misc import rbit_prefix
+from utils.models import ColumnDefinition, DuplicateRowsMode, ModelOut
 
 N_VARIABLES = "n_variables"
 N_OBSERVATION = "n_observations"
@@ -14,138 +20,129 @@ NUMERIC = "numeric"
 CATEGORICAL = "categorical"
 DATETIME = "datetime"
 
+row_hash_column = f"{rbit_prefix}_row_hash"
 
-# FIXME use pydantic struct like data quality
-# FIXME generalize to one method
-def calculate_statistics_reference(
-    reference_dataset: ReferenceDataset,
+
+def count_duplicate_rows(
+    dataframe: DataFrame,
+    columns: List[str],
+    dataframe_count: int,
+    mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+) -> int:
+    """
+    Counts the rows that are equal to a previous row in the given columns.
+
+    EXACT shuffles every column of every row with dropDuplicates. HASH shuffles only an
+    xxhash64 of the columns, and of their null flags, so that a null is not the same as
+    a missing column: rows with different values and the same hash are counted as
+    duplicates. HASH_VERIFIED computes the hashes, then counts exactly with
+    dropDuplicates only the rows whose hash is not unique, so that hash collisions are
+    not counted.
+    """
+    if mode == DuplicateRowsMode.EXACT:
+        return dataframe_count - dataframe.dropDuplicates(columns).count()
+
+    hashed = dataframe.withColumn(
+        row_hash_column,
+        F.xxhash64(*[F.col(c) for c in columns], *[F.isnull(c) for c in columns]),
+    )
+    if mode == DuplicateRowsMode.HASH:
+        return dataframe_count - hashed.select(row_hash_column).distinct().count()
+
+    repeated_hashes = hashed.groupBy(row_hash_column).count().filter(F.col("count") > 1)
+    candidates = hashed.join(repeated_hashes.select(row_hash_column), row_hash_column)
+    return (
+        candidates.count()
+        - candidates.dropDuplicates([row_hash_column, *columns]).count()
+    )
+
+
+def calculate_statistics(
+    model: ModelOut,
+    dataframe: DataFrame,
+    dataframe_count: int,
+    variables: List[ColumnDefinition],
+    scan: Optional[DatasetScan] = None,
+    duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+) -> Statistics:
+    """
+    Computes the statistics of a dataset from the missing cells of a DatasetScan, that
+    is computed if not given, and the count of the duplicate rows, ignoring the
+    timestamp.
+    """
+    if scan is None:
+        scan = DatasetScan(model, dataframe, dataframe_count)
+
+    duplicate_rows = count_duplicate_rows(
+        dataframe,
+        [c for c in dataframe.columns if c != model.timestamp.name],
+        dataframe_count,
+        duplicate_rows_mode,
+    )
+    return statistics_from_counts(
+        variables, dataframe_count, sum(scan.missing_cells.values()), duplicate_rows
+    )
+
+
+def statistics_from_counts(
+    variables: List[ColumnDefinition],
+    dataframe_count: int,
+    missing_cells: int,
+    duplicate_rows: int,
 ) -> Statistics:
-    number_of_variables = len(reference_dataset.get_all_variables())
-    number_of_observations = reference_dataset.reference_count
-    number_of_numerical = len(reference_dataset.get_numerical_variables())
-    number_of_categorical = len(reference_dataset.get_categorical_variables())
-    number_of_datetime = len(reference_dataset.get_datetime_variables())
-    reference_columns = reference_dataset.reference.columns
-
-    stats = (
-        reference_dataset.reference.select(
-            [
-                F.count(F.when(F.isnan(c) | F.col(c).isNull(), c)).alias(c)
-                if t not in ("datetime", "date", "timestamp", "bool", "boolean")
-                else F.count(F.when(F.col(c).isNull(), c)).alias(c)
-                for c, t in reference_dataset.reference.dtypes
-            ]
-        )
-        .withColumn(MISSING_CELLS, sum([F.col(c) for c in reference_columns]))
-        .withColumn(
-            MISSING_CELLS_PERC,
-            (F.col(MISSING_CELLS) / (number_of_variables * number_of_observations))
-            * 100,
-        )
-        .withColumn(
-            DUPLICATE_ROWS,
-            F.lit(
-                number_of_observations
-                - reference_dataset.reference.dropDuplicates(
-                    [
-                        c
-                        for c in reference_columns
-                        if c != reference_dataset.model.timestamp.name
-                    ]
-                ).count()
-            ),
-        )
-        .withColumn(
-            DUPLICATE_ROWS_PERC,
-            (F.col(DUPLICATE_ROWS) / number_of_observations) * 100,
-        )
-        .withColumn(N_VARIABLES, F.lit(number_of_variables))
-        .withColumn(N_OBSERVATION, F.lit(number_of_observations))
-        .withColumn(NUMERIC, F.lit(number_of_numerical))
-        .withColumn(CATEGORICAL, F.lit(number_of_categorical))
-        .withColumn(DATETIME, F.lit(number_of_datetime))
-        .select(
-            *[
-                MISSING_CELLS,
-                MISSING_CELLS_PERC,
-                DUPLICATE_ROWS,
-                DUPLICATE_ROWS_PERC,
-                N_VARIABLES,
-                N_OBSERVATION,
-                NUMERIC,
-                CATEGORICAL,
-                DATETIME,
-            ]
-        )
-        .toPandas()
-        .to_dict(orient="records")[0]
+    """Builds the statistics of a dataset from its counts of missing cells and rows."""
+    number_of_variables = len(variables)
+
+    # percentages of an empty dataset are null, as a division by zero in Spark
+    missing_cells_perc = (
+        missing_cells / (number_of_variables * dataframe_count) * 100
+        if dataframe_count
+        else None
     )
+    duplicate_rows_perc = (
+        duplicate_rows / dataframe_count * 100 if dataframe_count else None
+    )
+
+    stats = {
+        MISSING_CELLS: missing_cells,
+        MISSING_CELLS_PERC: missing_cells_perc,
+        DUPLICATE_ROWS: duplicate_rows,
+        DUPLICATE_ROWS_PERC: duplicate_rows_perc,
+        N_VARIABLES: number_of_variables,
+        N_OBSERVATION: dataframe_count,
+        NUMERIC: len([v for v in variables if v.is_numerical()]),
+        CATEGORICAL: len([v for v in variables if v.is_categorical()]),
+        DATETIME: len([v for v in variables if v.is_datetime()]),
+    }
 
     return Statistics(**stats)
 
 
+def calculate_statistics_reference(
+    reference_dataset: ReferenceDataset,
+    scan: Optional[DatasetScan] = None,
+    duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+) -> Statistics:
+    return calculate_statistics(
+        reference_dataset.model,
+        reference_dataset.reference,
+        reference_dataset.reference_count,
+        reference_dataset.get_all_variables(),
+        scan,
+        duplicate_rows_mode,
+    )
+
+
 def calculate_statistics_current(
     current_dataset: CurrentDataset,
+    scan: Optional[DatasetScan] = None,
+    duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
 ) -> Statistics:
-    number_of_variables = len(current_dataset.get_all_variables())
-    number_of_observations = current_dataset.current_count
-    number_of_numerical = len(current_dataset.get_numerical_variables())
-    number_of_categorical = len(current_dataset.get_categorical_variables())
-    number_of_datetime = len(current_dataset.get_datetime_variables())
-    reference_columns = current_dataset.current.columns
-
-    stats = (
-        current_dataset.current.select(
-            [
-                F.count(F.when(F.isnan(c) | F.col(c).isNull(), c)).alias(c)
-                if t not in ("datetime", "date", "timestamp", "bool", "boolean")
-                else F.count(F.when(F.col(c).isNull(), c)).alias(c)
-                for c, t in current_dataset.current.dtypes
-            ]
-        )
-        .withColumn(MISSING_CELLS, sum([F.col(c) for c in reference_columns]))
-        .withColumn(
-            MISSING_CELLS_PERC,
-            (F.col(MISSING_CELLS) / (number_of_variables * number_of_observations))
-            * 100,
-        )
-        .withColumn(
-            DUPLICATE_ROWS,
-            F.lit(
-                number_of_observations
-                - current_dataset.current.dropDuplicates(
-                    [
-                        c
-                        for c in reference_columns
-                        if c != current_dataset.model.timestamp.name
-                    ]
-                ).count()
-            ),
-        )
-        .withColumn(
-            DUPLICATE_ROWS_PERC,
-            (F.col(DUPLICATE_ROWS) / number_of_observations) * 100,
-        )
-        .withColumn(N_VARIABLES, F.lit(number_of_variables))
-        .withColumn(N_OBSERVATION, F.lit(number_of_observations))
-        .withColumn(NUMERIC, F.lit(number_of_numerical))
-        .withColumn(CATEGORICAL, F.lit(number_of_categorical))
-        .withColumn(DATETIME, F.lit(number_of_datetime))
-        .select(
-            *[
-                MISSING_CELLS,
-                MISSING_CELLS_PERC,
-                DUPLICATE_ROWS,
-                DUPLICATE_ROWS_PERC,
-                N_VARIABLES,
-                N_OBSERVATION,
-                NUMERIC,
-                CATEGORICAL,
-                DATETIME,
-            ]
-        )
-        .toPandas()
-        .to_dict(orient="records")[0]
+    return calculate_statistics(
+        current_dataset.model,
+        current_dataset.current,
+        current_dataset.current_count,
+        current_dataset.get_all_variables(),
+        scan,
+        duplicate_rows_mode,
     )
-
-    return Statistics(**stats)
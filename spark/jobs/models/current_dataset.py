@@ -2,26 +2,37 @@ from typing import List
 
 from pyspark.sql import DataFrame
 from pyspark.sql.types import DoubleType, StructField, StructType
-import pyspark.sql.functions as F
-from pyspark.sql.window import Window
 
 from models.reference_dataset import ReferenceDataset
-from utils.models import ModelOut, ModelType, ColumnDefinition
-from utils.spark import apply_schema_to_dataframe
-from utils.misc import rbit_prefix
+from utils.models import ModelOut, ModelType, ColumnDefinition, PersistencePolicy
+from utils.persistence import persist_dataframe, release_dataframe
+from utils.spark import apply_schema_to_dataframe, class_index_map, index_classes
 
 
 class CurrentDataset:
-    def __init__(self, model: ModelOut, raw_dataframe: DataFrame):
+    def __init__(
+        self,
+        model: ModelOut,
+        raw_dataframe: DataFrame,
+        persistence: PersistencePolicy = PersistencePolicy.NONE,
+    ):
         current_schema = self.spark_schema(model)
         current_dataset = apply_schema_to_dataframe(raw_dataframe, current_schema)
 
         self.model = model
-        self.current = current_dataset.select(
-            *[c for c in current_schema.names if c in current_dataset.columns]
+        self.persistence = persistence
+        # the first action materializes the persisted dataset, parsing the source once
+        self.current, self.spill_path = persist_dataframe(
+            current_dataset.select(
+                *[c for c in current_schema.names if c in current_dataset.columns]
+            ),
+            persistence,
         )
         self.current_count = self.current.count()
 
+    def unpersist(self):
+        release_dataframe(self.current, self.spill_path)
+
     # FIXME this must exclude target when we will have separate current and ground truth
     @staticmethod
     def spark_schema(model: ModelOut):
@@ -108,69 +119,17 @@ class CurrentDataset:
 
     def get_string_indexed_dataframe(self, reference: ReferenceDataset):
         """
-        Source: https://stackoverflow.com/questions/65911146/how-to-transform-multiple-categorical-columns-to-integers-maintaining-shared-val
-        Current dataset will be indexed with columns from both reference and current in order to have complete data
+        Current dataset will be indexed with classes from both reference and current in order to have complete data.
+        The small set of classes is collected once and applied with a literal map, without shuffling the dataset.
         """
-        predictions_df_current = self.current.select(
-            self.model.outputs.prediction.name
-        ).withColumnRenamed(self.model.outputs.prediction.name, "classes")
-        target_df_current = self.current.select(
-            self.model.target.name
-        ).withColumnRenamed(self.model.target.name, "classes")
-        predictions_df_reference = reference.reference.select(
-            self.model.outputs.prediction.name
-        ).withColumnRenamed(self.model.outputs.prediction.name, "classes")
-        target_df_reference = reference.reference.select(
-            self.model.target.name
-        ).withColumnRenamed(self.model.target.name, "classes")
-        prediction_target_df = (
-            predictions_df_current.union(target_df_current)
-            .union(predictions_df_reference)
-            .union(target_df_reference)
-        ).dropna()
-        classes_index_df = (
-            prediction_target_df.select("classes")
-            .distinct()
-            .withColumn(
-                "classes_index",
-                (
-                    F.row_number().over(
-                        Window.partitionBy(F.lit("A")).orderBy("classes")
-                    )
-                    - 1
-                ).cast(DoubleType()),
-            )
-        )
-        indexed_prediction_df = (
-            self.current.join(
-                classes_index_df,
-                self.current[self.model.outputs.prediction.name]
-                == classes_index_df["classes"],
-                how="inner",
-            )
-            .withColumnRenamed(
-                "classes_index",
-                f"{rbit_prefix}_{self.model.outputs.prediction.name}-idx",
-            )
-            .drop("classes")
-        )
-        indexed_target_df = (
-            indexed_prediction_df.join(
-                classes_index_df,
-                indexed_prediction_df[self.model.target.name]
-                == classes_index_df["classes"],
-                how="inner",
-            )
-            .withColumnRenamed(
-                "classes_index", f"{rbit_prefix}_{self.model.target.name}-idx"
-            )
-            .drop("classes")
+        columns = [self.model.outputs.prediction.name, self.model.target.name]
+        index_map = class_index_map(
+            self.current.select(*columns).unionByName(
+                reference.reference.select(*columns)
+            ),
+            columns,
         )
+        indexed_target_df = index_classes(self.current, columns, index_map)
 
-        index_label_map = {
-            str(float(row.__getitem__("classes_index"))): str(
-                row.__getitem__("classes")
-            )
-            for row in classes_index_df.collect()
-        }
+        index_label_map = {str(index): str(label) for label, index in index_map.items()}
         return index_label_map, indexed_target_df
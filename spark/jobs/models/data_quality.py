@@ -2,14 +2,30 @@ from typing import List, Dict, Optional
 
 from pydantic import BaseModel, ConfigDict
 
+from utils.models import QuantileAccuracy, QuantileMode
+
 
 class MedianMetrics(BaseModel):
     perc_25: float
     median: float
     perc_75: float
+    quantile_mode: str = QuantileMode.EXACT.value
+    relative_error: Optional[float] = None
 
     model_config = ConfigDict(ser_json_inf_nan="null")
 
+    @classmethod
+    def from_dict(
+        cls, global_dict: Dict, quantile_accuracy: QuantileAccuracy
+    ) -> "MedianMetrics":
+        return MedianMetrics(
+            median=global_dict.get("median"),
+            perc_25=global_dict.get("perc_25"),
+            perc_75=global_dict.get("perc_75"),
+            quantile_mode=quantile_accuracy.mode.value,
+            relative_error=quantile_accuracy.error_bound,
+        )
+
 
 class MissingValue(BaseModel):
     count: int
@@ -58,6 +74,7 @@ class NumericalFeatureMetrics(FeatureMetrics):
         feature_name: str,
         global_dict: Dict,
         histogram: Histogram,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
     ) -> "NumericalFeatureMetrics":
         return NumericalFeatureMetrics(
             feature_name=feature_name,
@@ -69,11 +86,7 @@ class NumericalFeatureMetrics(FeatureMetrics):
             std=global_dict.get("std"),
             min=global_dict.get("min"),
             max=global_dict.get("max"),
-            median_metrics=MedianMetrics(
-                median=global_dict.get("median"),
-                perc_25=global_dict.get("perc_25"),
-                perc_75=global_dict.get("perc_75"),
-            ),
+            median_metrics=MedianMetrics.from_dict(global_dict, quantile_accuracy),
             class_median_metrics=[],
             histogram=histogram,
         )
@@ -96,6 +109,7 @@ class NumericalTargetMetrics(FeatureMetrics):
         feature_name: str,
         global_dict: Dict,
         histogram: Histogram,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
     ) -> "NumericalTargetMetrics":
         return NumericalTargetMetrics(
             feature_name=feature_name,
@@ -107,17 +121,14 @@ class NumericalTargetMetrics(FeatureMetrics):
             std=global_dict.get("std"),
             min=global_dict.get("min"),
             max=global_dict.get("max"),
-            median_metrics=MedianMetrics(
-                median=global_dict.get("median"),
-                perc_25=global_dict.get("perc_25"),
-                perc_75=global_dict.get("perc_75"),
-            ),
+            median_metrics=MedianMetrics.from_dict(global_dict, quantile_accuracy),
             histogram=histogram,
         )
 
 
 class CategoryFrequency(BaseModel):
-    name: str
+    # None for the sum of the categories over the top k
+    name: Optional[str] = None
     count: int
     frequency: float
 
@@ -146,7 +157,9 @@ class CategoricalFeatureMetrics(FeatureMetrics):
             distinct_value=global_metrics.get("distinct_values"),
             category_frequency=[
                 CategoryFrequency(
-                    name=str(k), count=count.get(k), frequency=freq.get(k)
+                    name=None if k is None else str(k),
+                    count=count.get(k),
+                    frequency=freq.get(k),
                 )
                 for k in count.keys()
             ],
@@ -0,0 +1,346 @@
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel
+from pyspark.sql import SparkSession
+
+from utils.spark import read_text_file, split_bucket_of, write_text_file
+
+# to be increased when the state content or its semantics change
+METRICS_STATE_VERSION = 1
+# quantile sketches keep the quantiles at the probabilities i / SKETCH_POINTS
+SKETCH_POINTS = 1000
+# numerical features with more distinct values keep only their sketch
+MAX_DISTINCT_VALUES = 1000
+# equal width bins of the scores between 0 and 1 of binary classification
+SCORE_BINS = 1000
+
+
+def sum_nullable(x: Optional[float], y: Optional[float]) -> Optional[float]:
+    """Adds two sums of Spark, that are null without values."""
+    if x is None:
+        return y
+    if y is None:
+        return x
+    return x + y
+
+
+class QuantileSketch(BaseModel):
+    """
+    The quantiles of count values at the probabilities i / SKETCH_POINTS, so that the
+    first one is the minimum and the last one the maximum. Two sketches are merged
+    through the weighted mean of their distribution functions, interpolated between the
+    quantiles, with a rank error of about 1 / SKETCH_POINTS of the values.
+    """
+
+    count: int = 0
+    quantiles: List[float] = []
+
+    def cdf(self, x: np.ndarray) -> np.ndarray:
+        """The fraction of values lower than or equal to every x."""
+        return np.interp(
+            x, self.quantiles, np.linspace(0, 1, len(self.quantiles)), left=0, right=1
+        )
+
+    def quantile(self, probabilities: List[float]) -> List[float]:
+        """The quantiles at the given probabilities, none without values."""
+        if self.count == 0:
+            return []
+        return np.interp(
+            probabilities, np.linspace(0, 1, len(self.quantiles)), self.quantiles
+        ).tolist()
+
+    def bucket_counts(self, splits: List[float]) -> List[int]:
+        """
+        The count of values of every bucket, with the rules of Bucketizer: splits[i] <=
+        x < splits[i + 1] and the last bucket closed. Splits must include all the values.
+        """
+        cumulative = np.rint(self.count * self.cdf(np.array(splits))).astype(int)
+        cumulative[0] = 0
+        cumulative[-1] = self.count
+        return np.diff(cumulative).tolist()
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            return other
+        points = np.unique(np.concatenate([self.quantiles, other.quantiles]))
+        count = self.count + other.count
+        cdf = (self.count * self.cdf(points) + other.count * other.cdf(points)) / count
+        return QuantileSketch(
+            count=count,
+            quantiles=np.interp(
+                np.linspace(0, 1, SKETCH_POINTS + 1), cdf, points
+            ).tolist(),
+        )
+
+
+class NumericalState(BaseModel):
+    """Mergeable statistics of the non null and non NaN values of a numerical column."""
+
+    missing: int = 0
+    count: int = 0
+    mean: Optional[float] = None
+    # sum of the squared deviations from the mean
+    m2: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    sketch: QuantileSketch = QuantileSketch()
+    # count of every distinct value, only for columns with few distinct values
+    values: Optional[List[Tuple[float, int]]] = None
+
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / (self.count - 1))) if self.count > 1 else np.nan
+
+    def bucket_counts(self, splits: List[float]) -> List[int]:
+        """Same as QuantileSketch.bucket_counts, exact with the distinct values."""
+        if self.values is None:
+            return self.sketch.bucket_counts(splits)
+        counts = [0] * (len(splits) - 1)
+        for value, count in self.values:
+            counts[split_bucket_of(splits, value)] += count
+        return counts
+
+    def merge(self, other: "NumericalState") -> "NumericalState":
+        count = self.count + other.count
+        if self.count == 0 or other.count == 0:
+            moments = self if other.count == 0 else other
+            mean, m2 = moments.mean, moments.m2
+        else:
+            # parallel algorithm of Chan et al., stable for large counts
+            delta = other.mean - self.mean
+            mean = self.mean + delta * other.count / count
+            m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / count
+        values = None
+        if self.values is not None and other.values is not None:
+            merged_values = dict(self.values)
+            for value, value_count in other.values:
+                merged_values[value] = merged_values.get(value, 0) + value_count
+            if len(merged_values) <= MAX_DISTINCT_VALUES:
+                values = sorted(merged_values.items())
+        return NumericalState(
+            missing=self.missing + other.missing,
+            count=count,
+            mean=mean,
+            m2=m2,
+            min=min(v for v in (self.min, other.min) if v is not None)
+            if count
+            else None,
+            max=max(v for v in (self.max, other.max) if v is not None)
+            if count
+            else None,
+            sketch=self.sketch.merge(other.sketch),
+            values=values,
+        )
+
+
+class CategoricalState(BaseModel):
+    """
+    Mergeable frequencies of the non null values of a categorical column, as strings.
+    Only the max_categories most frequent categories are kept, the count of the others
+    is in other. The distinct values are estimated from the sketch of the column.
+    """
+
+    missing: int = 0
+    counts: Dict[str, int] = {}
+    other: int = 0
+    max_categories: int
+
+    def merge(self, other: "CategoricalState") -> "CategoricalState":
+        counts = dict(self.counts)
+        for value, count in other.counts.items():
+            counts[value] = counts.get(value, 0) + count
+        max_categories = min(self.max_categories, other.max_categories)
+        kept = dict(
+            sorted(counts.items(), key=lambda x: (-x[1], x[0]))[:max_categories]
+        )
+        return CategoricalState(
+            missing=self.missing + other.missing,
+            counts=kept,
+            other=self.other + other.other + sum(counts.values()) - sum(kept.values()),
+            max_categories=max_categories,
+        )
+
+
+class ClassificationState(BaseModel):
+    """
+    Mergeable counts of target and prediction classes, with their original values.
+    Confusions are the count of every (time group, target, prediction) of the rows
+    with both classes. With the scores of binary classification, scores are the count
+    of every (time group, score bin, positive label) of the rows with score and target,
+    in SCORE_BINS bins, and log_loss the sum and the count of the log loss of every
+    time group.
+    """
+
+    target_counts: List[Tuple[Any, int]] = []
+    prediction_counts: List[Tuple[Any, int]] = []
+    confusions: List[Tuple[Optional[str], Any, Any, int]] = []
+    scores: List[Tuple[Optional[str], int, bool, int]] = []
+    log_loss: List[Tuple[Optional[str], float, int]] = []
+
+    @staticmethod
+    def __merge_counts(*counts: List[Tuple]) -> List[Tuple]:
+        merged = {}
+        for rows in counts:
+            for *key, count in rows:
+                merged[tuple(key)] = merged.get(tuple(key), 0) + count
+        return [(*key, count) for key, count in merged.items()]
+
+    def merge(self, other: "ClassificationState") -> "ClassificationState":
+        merge_counts = ClassificationState.__merge_counts
+        log_loss = {}
+        for group, log_loss_sum, count in self.log_loss + other.log_loss:
+            previous_sum, previous_count = log_loss.get(group, (0.0, 0))
+            log_loss[group] = (previous_sum + log_loss_sum, previous_count + count)
+        return ClassificationState(
+            target_counts=merge_counts(self.target_counts, other.target_counts),
+            prediction_counts=merge_counts(
+                self.prediction_counts, other.prediction_counts
+            ),
+            confusions=merge_counts(self.confusions, other.confusions),
+            scores=merge_counts(self.scores, other.scores),
+            log_loss=[(group, *values) for group, values in log_loss.items()],
+        )
+
+
+class RegressionState(BaseModel):
+    """
+    Mergeable sufficient statistics of the regression metrics of every time group, the
+    sketch of the residuals and the residual points with the lowest hash of (prediction,
+    target), at most points_budget.
+    """
+
+    statistics: List[Tuple[Optional[str], Dict[str, Optional[float]]]] = []
+    residuals: QuantileSketch = QuantileSketch()
+    points: List[Tuple[int, float, float]] = []
+    points_budget: int
+
+    def global_statistics(self) -> Dict[str, Optional[float]]:
+        merged = {}
+        for _, statistics in self.statistics:
+            for name, value in statistics.items():
+                merged[name] = sum_nullable(merged.get(name), value)
+        return merged
+
+    def merge(self, other: "RegressionState") -> "RegressionState":
+        statistics = dict(self.statistics)
+        for group, group_statistics in other.statistics:
+            previous = statistics.get(group, {})
+            statistics[group] = {
+                name: sum_nullable(previous.get(name), value)
+                for name, value in group_statistics.items()
+            }
+        points_budget = min(self.points_budget, other.points_budget)
+        return RegressionState(
+            statistics=list(statistics.items()),
+            residuals=self.residuals.merge(other.residuals),
+            points=sorted(set(self.points) | set(other.points))[:points_budget],
+            points_budget=points_budget,
+        )
+
+
+class MetricsState(BaseModel):
+    """
+    Mergeable partial metrics of a dataset, written by the current job next to the
+    current file in incremental mode. The metrics of many datasets are derived from the
+    merge of their states, without reading the datasets again.
+
+    Sketches are the base64 HyperLogLog sketches of Spark of the categorical features,
+    for their distinct values. They are merged with Spark by MetricsStateCalculator.merge,
+    MetricsState.merge drops them.
+    """
+
+    version: int = METRICS_STATE_VERSION
+    n_observations: int = 0
+    missing_cells: int = 0
+    # duplicates within every dataset, duplicates of rows of different datasets are not
+    # counted
+    duplicate_rows: int = 0
+    numerical: Dict[str, NumericalState] = {}
+    categorical: Dict[str, CategoricalState] = {}
+    sketches: Dict[str, str] = {}
+    classification: Optional[ClassificationState] = None
+    regression: Optional[RegressionState] = None
+
+    def merge(self, other: "MetricsState") -> "MetricsState":
+        def merge_states(x: Dict[str, Any], y: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                key: x[key].merge(y[key])
+                if key in x and key in y
+                else x.get(key, y.get(key))
+                for key in x | y
+            }
+
+        def merge_optional(x, y):
+            if x is None or y is None:
+                return y if x is None else x
+            return x.merge(y)
+
+        return MetricsState(
+            n_observations=self.n_observations + other.n_observations,
+            missing_cells=self.missing_cells + other.missing_cells,
+            duplicate_rows=self.duplicate_rows + other.duplicate_rows,
+            numerical=merge_states(self.numerical, other.numerical),
+            categorical=merge_states(self.categorical, other.categorical),
+            classification=merge_optional(self.classification, other.classification),
+            regression=merge_optional(self.regression, other.regression),
+        )
+
+    @staticmethod
+    def path(dataset_path: str) -> str:
+        return f"{dataset_path.rstrip('/')}.rbit_state.json"
+
+    def save(self, spark_session: SparkSession, path: str) -> None:
+        write_text_file(spark_session, path, self.model_dump_json())
+
+    @staticmethod
+    def load(spark_session: SparkSession, path: str) -> Optional["MetricsState"]:
+        """Loads the state, None if it does not exist or has another version."""
+        try:
+            text = read_text_file(spark_session, path)
+            if text is None:
+                return None
+            state = MetricsState.model_validate_json(text)
+        except Exception as e:
+            logging.warning("Cannot load metrics state %s: %s", path, e)
+            return None
+        if state.version != METRICS_STATE_VERSION:
+            return None
+        return state
+
+
+class StreamingMetricsState(BaseModel):
+    """
+    State of the streaming job, saved in its checkpoint location after every
+    micro-batch: the id of the last micro-batch merged and the MetricsState of every
+    time group of the model granularity, with "" for rows without timestamp.
+    """
+
+    batch_id: int = -1
+    time_groups: Dict[str, MetricsState] = {}
+
+    @staticmethod
+    def path(checkpoint_location: str) -> str:
+        return f"{checkpoint_location.rstrip('/')}/rbit_metrics_state.json"
+
+    def save(self, spark_session: SparkSession, path: str) -> None:
+        write_text_file(spark_session, path, self.model_dump_json())
+
+    @staticmethod
+    def load(
+        spark_session: SparkSession, path: str
+    ) -> Optional["StreamingMetricsState"]:
+        """Loads the state, None if it does not exist or has another version."""
+        try:
+            text = read_text_file(spark_session, path)
+            if text is None:
+                return None
+            state = StreamingMetricsState.model_validate_json(text)
+        except Exception as e:
+            logging.warning("Cannot load streaming metrics state %s: %s", path, e)
+            return None
+        if any(s.version != METRICS_STATE_VERSION for s in state.time_groups.values()):
+            return None
+        return state
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from pyspark.sql import DataFrame
 from pyspark.sql.types import (
@@ -6,24 +6,41 @@ from pyspark.sql.types import (
     StructField,
     StructType,
 )
-import pyspark.sql.functions as F
-from pyspark.sql.window import Window
 
-from utils.models import ModelOut, ModelType, ColumnDefinition
-from utils.spark import apply_schema_to_dataframe
-from utils.misc import rbit_prefix
+from models.reference_profile import ReferenceProfile
+from utils.models import ModelOut, ModelType, ColumnDefinition, PersistencePolicy
+from utils.persistence import persist_dataframe, release_dataframe
+from utils.spark import apply_schema_to_dataframe, class_index_map, index_classes
 
 
 class ReferenceDataset:
-    def __init__(self, model: ModelOut, raw_dataframe: DataFrame):
+    def __init__(
+        self,
+        model: ModelOut,
+        raw_dataframe: DataFrame,
+        persistence: PersistencePolicy = PersistencePolicy.NONE,
+        profile: Optional[ReferenceProfile] = None,
+    ):
         reference_schema = self.spark_schema(model)
         reference_dataset = apply_schema_to_dataframe(raw_dataframe, reference_schema)
 
         self.model = model
-        self.reference = reference_dataset.select(
-            *[c for c in reference_schema.names if c in reference_dataset.columns]
+        self.persistence = persistence
+        # the first action materializes the persisted dataset, parsing the source once
+        self.reference, self.spill_path = persist_dataframe(
+            reference_dataset.select(
+                *[c for c in reference_schema.names if c in reference_dataset.columns]
+            ),
+            persistence,
         )
-        self.reference_count = self.reference.count()
+        # with a profile the reference is read only by the metrics that are not profiled
+        self.profile = profile
+        self.reference_count = (
+            profile.reference_count if profile else self.reference.count()
+        )
+
+    def unpersist(self):
+        release_dataframe(self.reference, self.spill_path)
 
     @staticmethod
     def spark_schema(model: ModelOut):
@@ -106,58 +123,11 @@ class ReferenceDataset:
 
     def get_string_indexed_dataframe(self):
         """
-        Source: https://stackoverflow.com/questions/65911146/how-to-transform-multiple-categorical-columns-to-integers-maintaining-shared-val
+        The small set of classes is collected once and applied with a literal map, without shuffling the dataset.
         """
-        predictions_df = self.reference.select(
-            self.model.outputs.prediction.name
-        ).withColumnRenamed(self.model.outputs.prediction.name, "classes")
-        target_df = self.reference.select(self.model.target.name).withColumnRenamed(
-            self.model.target.name, "classes"
-        )
-        prediction_target_df = predictions_df.union(target_df).dropna()
-        classes_index_df = (
-            prediction_target_df.select("classes")
-            .distinct()
-            .withColumn(
-                "classes_index",
-                (
-                    F.row_number().over(
-                        Window.partitionBy(F.lit("A")).orderBy("classes")
-                    )
-                    - 1
-                ).cast(DoubleType()),
-            )
-        )
-        indexed_prediction_df = (
-            self.reference.join(
-                classes_index_df,
-                self.reference[self.model.outputs.prediction.name]
-                == classes_index_df["classes"],
-                how="inner",
-            )
-            .withColumnRenamed(
-                "classes_index",
-                f"{rbit_prefix}_{self.model.outputs.prediction.name}-idx",
-            )
-            .drop("classes")
-        )
-        indexed_target_df = (
-            indexed_prediction_df.join(
-                classes_index_df,
-                indexed_prediction_df[self.model.target.name]
-                == classes_index_df["classes"],
-                how="inner",
-            )
-            .withColumnRenamed(
-                "classes_index", f"{rbit_prefix}_{self.model.target.name}-idx"
-            )
-            .drop("classes")
-        )
+        columns = [self.model.outputs.prediction.name, self.model.target.name]
+        index_map = class_index_map(self.reference, columns)
+        indexed_target_df = index_classes(self.reference, columns, index_map)
 
-        index_label_map = {
-            str(float(row.__getitem__("classes_index"))): str(
-                row.__getitem__("classes")
-            )
-            for row in classes_index_df.collect()
-        }
+        index_label_map = {str(index): str(label) for label, index in index_map.items()}
         return index_label_map, indexed_target_df
@@ -0,0 +1,80 @@
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel
+from pyspark.sql import SparkSession
+
+from utils.spark import read_text_file, write_text_file
+
+# to be increased when the profile content or its semantics change
+REFERENCE_PROFILE_VERSION = 1
+
+
+class FeatureProfile(BaseModel):
+    """Statistics of the non null and non NaN values of a reference feature."""
+
+    min: Optional[float] = None
+    max: Optional[float] = None
+    # count of every distinct value, only for features with few distinct values
+    numerical_values: Optional[List[Tuple[float, int]]] = None
+    categorical_values: Optional[Dict[str, int]] = None
+    # quantiles at the reference probability points of the KS test
+    quantiles: Optional[List[float]] = None
+
+
+class ReferenceProfile(BaseModel):
+    """
+    Compact summary of a reference dataset, written by the reference job next to the
+    reference file and used by the current jobs instead of reading it again.
+    Features without the needed statistic are computed from the reference dataset.
+    """
+
+    version: int = REFERENCE_PROFILE_VERSION
+    reference_count: int
+    ks_phi: float
+    features: Dict[str, FeatureProfile]
+
+    def numerical_values(self, feature: str) -> Optional[List[Tuple[float, int]]]:
+        profile = self.features.get(feature)
+        return profile.numerical_values if profile else None
+
+    def categorical_values(self, feature: str) -> Optional[Dict[str, int]]:
+        profile = self.features.get(feature)
+        return profile.categorical_values if profile else None
+
+    def quantiles(self, feature: str, phi: float) -> Optional[List[float]]:
+        profile = self.features.get(feature)
+        return profile.quantiles if profile and self.ks_phi == phi else None
+
+    def unprofiled_features(self) -> List[str]:
+        """
+        Features with too many distinct values to have their counts in the profile,
+        whose histograms, PSI and Chi2 read the reference dataset.
+        """
+        return [
+            feature
+            for feature, profile in self.features.items()
+            if profile.numerical_values is None and profile.categorical_values is None
+        ]
+
+    @staticmethod
+    def path(reference_dataset_path: str) -> str:
+        return f"{reference_dataset_path.rstrip('/')}.rbit_profile.json"
+
+    def save(self, spark_session: SparkSession, path: str) -> None:
+        write_text_file(spark_session, path, self.model_dump_json())
+
+    @staticmethod
+    def load(spark_session: SparkSession, path: str) -> Optional["ReferenceProfile"]:
+        """Loads the profile, None if it does not exist or has another version."""
+        try:
+            text = read_text_file(spark_session, path)
+            if text is None:
+                return None
+            profile = ReferenceProfile.model_validate_json(text)
+        except Exception as e:
+            logging.warning("Cannot load reference profile %s: %s", path, e)
+            return None
+        if profile.version != REFERENCE_PROFILE_VERSION:
+            return None
+        return profile
@@ -1,16 +1,48 @@
+import argparse
 import sys
 import os
 import uuid
+from typing import List
 
 import orjson
 from pyspark.sql.types import StructField, StructType, StringType
 
-from metrics.statistics import calculate_statistics_reference
+from metrics.reference_profile_calculator import ReferenceProfileCalculator
 from models.reference_dataset import ReferenceDataset
+from models.reference_profile import ReferenceProfile
 from utils.reference_regression import ReferenceMetricsRegressionService
 from utils.reference_binary import ReferenceMetricsService
-from utils.models import JobStatus, ModelOut, ModelType
+from utils.arguments import (
+    add_categorical_arguments,
+    add_dataset_format_argument,
+    add_duplicate_rows_argument,
+    add_quantile_arguments,
+    add_read_arguments,
+    add_residual_points_argument,
+    categorical_accuracy,
+    job_argument_parser,
+    quantile_accuracy,
+)
+from utils.models import (
+    DEFAULT_RESIDUAL_POINTS_BUDGET,
+    CategoricalAccuracy,
+    CsvReadMode,
+    DatasetFormat,
+    DuplicateRowsMode,
+    JobStatus,
+    ModelOut,
+    ModelType,
+    PersistencePolicy,
+    QuantileAccuracy,
+)
+from utils.persistence import (
+    count_source_reads,
+    resolve_persistence_policy,
+    shared_spill_dir,
+    source_size_bytes,
+)
 from utils.db import update_job_status, write_to_db
+from utils.spark import count_corrupt_records, read_dataset
 
 from pyspark.sql import SparkSession
 
@@ -19,13 +51,25 @@ import logging
 from utils.reference_multiclass import ReferenceMetricsMulticlassService
 
 
-def compute_metrics(reference_dataset, model):
+def compute_metrics(
+    reference_dataset,
+    model,
+    quantile_accuracy=QuantileAccuracy(),
+    categorical_accuracy=CategoricalAccuracy(),
+    duplicate_rows_mode=DuplicateRowsMode.EXACT,
+    residual_points_budget=DEFAULT_RESIDUAL_POINTS_BUDGET,
+):
     complete_record = {}
     match model.model_type:
         case ModelType.BINARY:
-            metrics_service = ReferenceMetricsService(reference=reference_dataset)
+            metrics_service = ReferenceMetricsService(
+                reference=reference_dataset,
+                quantile_accuracy=quantile_accuracy,
+                categorical_accuracy=categorical_accuracy,
+                duplicate_rows_mode=duplicate_rows_mode,
+            )
             model_quality = metrics_service.calculate_model_quality()
-            statistics = calculate_statistics_reference(reference_dataset)
+            statistics = metrics_service.calculate_statistics()
             data_quality = metrics_service.calculate_data_quality()
             complete_record["MODEL_QUALITY"] = orjson.dumps(model_quality).decode(
                 "utf-8"
@@ -38,9 +82,12 @@ def compute_metrics(reference_dataset, model):
             )
         case ModelType.MULTI_CLASS:
             metrics_service = ReferenceMetricsMulticlassService(
-                reference=reference_dataset
+                reference=reference_dataset,
+                quantile_accuracy=quantile_accuracy,
+                categorical_accuracy=categorical_accuracy,
+                duplicate_rows_mode=duplicate_rows_mode,
             )
-            statistics = calculate_statistics_reference(reference_dataset)
+            statistics = metrics_service.calculate_statistics()
             data_quality = metrics_service.calculate_data_quality()
             model_quality = metrics_service.calculate_model_quality()
             complete_record["STATISTICS"] = statistics.model_dump_json(
@@ -54,9 +101,13 @@ def compute_metrics(reference_dataset, model):
             )
         case ModelType.REGRESSION:
             metrics_service = ReferenceMetricsRegressionService(
-                reference=reference_dataset
+                reference=reference_dataset,
+                quantile_accuracy=quantile_accuracy,
+                categorical_accuracy=categorical_accuracy,
+                duplicate_rows_mode=duplicate_rows_mode,
+                residual_points_budget=residual_points_budget,
             )
-            statistics = calculate_statistics_reference(reference_dataset)
+            statistics = metrics_service.calculate_statistics()
             data_quality = metrics_service.calculate_data_quality()
             model_quality = metrics_service.calculate_model_quality()
 
@@ -69,6 +120,10 @@ def compute_metrics(reference_dataset, model):
             complete_record["DATA_QUALITY"] = data_quality.model_dump_json(
                 serialize_as_any=True
             )
+
+    # persisted dataset is released as soon as every metric is computed
+    reference_dataset.unpersist()
+
     return complete_record
 
 
@@ -78,6 +133,13 @@ def main(
     reference_dataset_path: str,
     reference_uuid: str,
     table_name: str,
+    dataset_format: DatasetFormat = DatasetFormat.CSV,
+    persistence: PersistencePolicy = PersistencePolicy.AUTO,
+    csv_read_mode: CsvReadMode = CsvReadMode.CAST,
+    quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
+    categorical_accuracy: CategoricalAccuracy = CategoricalAccuracy(),
+    duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+    residual_points_budget: int = DEFAULT_RESIDUAL_POINTS_BUDGET,
 ):
     spark_context = spark_session.sparkContext
 
@@ -99,10 +161,50 @@ def main(
             "fs.s3a.connection.ssl.enabled", "false"
         )
 
-    raw_dataframe = spark_session.read.csv(reference_dataset_path, header=True)
-    reference_dataset = ReferenceDataset(model=model, raw_dataframe=raw_dataframe)
+    raw_dataframe = read_dataset(
+        spark_session,
+        reference_dataset_path,
+        dataset_format,
+        ReferenceDataset.spark_schema(model),
+        csv_read_mode,
+    )
+    if csv_read_mode == CsvReadMode.PERMISSIVE:
+        logging.info(
+            "Malformed records in reference dataset: %s",
+            count_corrupt_records(raw_dataframe),
+        )
+    reference_dataset = ReferenceDataset(
+        model=model,
+        raw_dataframe=raw_dataframe,
+        persistence=resolve_persistence_policy(
+            persistence,
+            source_size_bytes(spark_session, reference_dataset_path),
+            shared_spill_dir(spark_session),
+        ),
+    )
 
-    complete_record = compute_metrics(reference_dataset, model)
+    # the profile is computed before the metrics release the persisted dataset,
+    # current jobs fall back to the reference dataset without it
+    try:
+        ReferenceProfileCalculator.calculate(reference_dataset).save(
+            spark_session, ReferenceProfile.path(reference_dataset_path)
+        )
+    except Exception as e:
+        logging.warning("Cannot write reference profile: %s", e)
+
+    complete_record = compute_metrics(
+        reference_dataset,
+        model,
+        quantile_accuracy=quantile_accuracy,
+        categorical_accuracy=categorical_accuracy,
+        duplicate_rows_mode=duplicate_rows_mode,
+        residual_points_budget=residual_points_budget,
+    )
+    logging.info(
+        "Reference metrics computed with persistence %s, source files read %s times",
+        reference_dataset.persistence.value,
+        count_source_reads(spark_session, {dataset_format}),
+    )
 
     complete_record.update(
         {"UUID": str(uuid.uuid4()), "REFERENCE_UUID": reference_uuid}
@@ -123,25 +225,47 @@ def main(
     update_job_status(reference_uuid, JobStatus.SUCCEEDED, "reference_dataset")
 
 
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    parser = job_argument_parser("Metrics of a reference dataset")
+    parser.add_argument("reference_dataset_path")
+    parser.add_argument("reference_uuid")
+    parser.add_argument("table_name")
+    add_dataset_format_argument(parser, "--dataset-format")
+    add_read_arguments(parser)
+    add_quantile_arguments(parser)
+    add_categorical_arguments(parser)
+    add_duplicate_rows_argument(parser)
+    add_residual_points_argument(parser)
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
     spark_session = SparkSession.builder.appName(
         "radicalbit_reference_metrics"
     ).getOrCreate()
 
-    # Json of ModelOut is first param
-    model = ModelOut.model_validate_json(sys.argv[1])
-    # Reference dataset s3 path is second param
-    reference_dataset_path = sys.argv[2]
-    # Reference file uuid third param
-    reference_uuid = sys.argv[3]
-    # Table name fourth param
-    table_name = sys.argv[4]
+    arguments = parse_arguments(sys.argv[1:])
 
     try:
-        main(spark_session, model, reference_dataset_path, reference_uuid, table_name)
+        main(
+            spark_session,
+            arguments.model,
+            arguments.reference_dataset_path,
+            arguments.reference_uuid,
+            arguments.table_name,
+            dataset_format=arguments.dataset_format,
+            persistence=arguments.persistence,
+            csv_read_mode=arguments.csv_read_mode,
+            quantile_accuracy=quantile_accuracy(arguments),
+            categorical_accuracy=categorical_accuracy(arguments),
+            duplicate_rows_mode=arguments.duplicate_rows_mode,
+            residual_points_budget=arguments.residual_points_budget,
+        )
     except Exception as e:
         logging.exception(e)
         # FIXME table name should come from parameters
-        update_job_status(reference_uuid, JobStatus.ERROR, "reference_dataset")
+        update_job_status(
+            arguments.reference_uuid, JobStatus.ERROR, "reference_dataset"
+        )
     finally:
         spark_session.stop()
@@ -0,0 +1,299 @@
+import logging
+import argparse
+import sys
+import os
+import uuid
+from typing import Callable, Dict, List, Optional
+
+import pyspark.sql.functions as F
+from pyspark.sql import DataFrame
+
+from merge_job import compute_metrics, reference_metrics_state
+from metrics.metrics_state_calculator import MetricsStateCalculator
+from models.current_dataset import CurrentDataset
+from models.metrics_state import MetricsState, StreamingMetricsState
+from utils.arguments import (
+    add_categories_top_k_argument,
+    add_dataset_format_argument,
+    add_duplicate_rows_argument,
+    add_read_arguments,
+    add_residual_points_argument,
+    job_argument_parser,
+)
+from utils.models import (
+    DEFAULT_CATEGORIES_TOP_K,
+    DEFAULT_RESIDUAL_POINTS_BUDGET,
+    CsvReadMode,
+    DatasetFormat,
+    DuplicateRowsMode,
+    JobStatus,
+    ModelOut,
+    PersistencePolicy,
+)
+from utils.db import update_job_status, upsert_metrics
+from utils.spark import read_dataset_stream, time_group_column
+
+from pyspark.sql import SparkSession
+
+
+class StreamingCurrentMetrics:
+    """
+    Merges every micro-batch of current predictions in the MetricsState of its time
+    groups, truncated to the model granularity, and writes the metrics of the last
+    windows time groups (of all of them without windows) with write_record. The state
+    is saved in the checkpoint location after every micro-batch, so that a restarted
+    query goes on from the last micro-batch merged.
+    """
+
+    def __init__(
+        self,
+        spark_session: SparkSession,
+        model: ModelOut,
+        reference_state: MetricsState,
+        current_uuid: str,
+        checkpoint_location: str,
+        write_record: Callable[[Dict], None],
+        windows: Optional[int] = None,
+        duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+        residual_points_budget: int = DEFAULT_RESIDUAL_POINTS_BUDGET,
+        categories_top_k: int = DEFAULT_CATEGORIES_TOP_K,
+    ):
+        self.spark_session = spark_session
+        self.model = model
+        self.reference_state = reference_state
+        self.current_uuid = current_uuid
+        self.state_path = StreamingMetricsState.path(checkpoint_location)
+        self.write_record = write_record
+        self.windows = windows
+        self.duplicate_rows_mode = duplicate_rows_mode
+        self.residual_points_budget = residual_points_budget
+        self.categories_top_k = categories_top_k
+        self.state = (
+            StreamingMetricsState.load(spark_session, self.state_path)
+            or StreamingMetricsState()
+        )
+
+    def process_batch(self, batch: DataFrame, batch_id: int) -> None:
+        # a micro-batch is run again when the query fails before committing it
+        if batch_id <= self.state.batch_id:
+            logging.info("Micro-batch %s already merged", batch_id)
+            return
+        current_dataset = CurrentDataset(
+            model=self.model,
+            raw_dataframe=batch,
+            persistence=PersistencePolicy.MEMORY_AND_DISK,
+        )
+        if current_dataset.current_count > 0:
+            self.__merge_batch(current_dataset)
+        current_dataset.unpersist()
+
+        self.state.batch_id = batch_id
+        self.state.save(self.spark_session, self.state_path)
+        logging.info(
+            "Micro-batch %s merged, %s time groups kept",
+            batch_id,
+            len(self.state.time_groups),
+        )
+
+    def __merge_batch(self, current_dataset: CurrentDataset) -> None:
+        model = self.model
+        current = current_dataset.current.withColumn(
+            "time_group",
+            F.coalesce(
+                time_group_column(model.timestamp.name, model.granularity), F.lit("")
+            ),
+        )
+        time_groups = [
+            row["time_group"]
+            for row in current.select("time_group").distinct().collect()
+        ]
+        for time_group in time_groups:
+            group = current.filter(F.col("time_group") == time_group).drop("time_group")
+            group_state = MetricsStateCalculator.calculate(
+                model,
+                group,
+                group.count(),
+                self.duplicate_rows_mode,
+                self.residual_points_budget,
+                self.categories_top_k,
+            )
+            previous = self.state.time_groups.get(time_group)
+            self.state.time_groups[time_group] = (
+                group_state
+                if previous is None
+                else MetricsStateCalculator.merge(
+                    self.spark_session, [previous, group_state]
+                )
+            )
+        if self.windows is not None:
+            kept = sorted(self.state.time_groups)[-self.windows :]
+            self.state.time_groups = {
+                time_group: self.state.time_groups[time_group] for time_group in kept
+            }
+
+        complete_record = compute_metrics(
+            self.spark_session,
+            model,
+            MetricsStateCalculator.merge(
+                self.spark_session, list(self.state.time_groups.values())
+            ),
+            self.reference_state,
+            self.categories_top_k,
+        )
+        complete_record.update(
+            {"UUID": str(uuid.uuid4()), "CURRENT_UUID": self.current_uuid}
+        )
+        self.write_record(complete_record)
+
+
+def main(
+    spark_session: SparkSession,
+    model: ModelOut,
+    current_dataset_directory: str,
+    current_uuid: str,
+    reference_dataset_path: str,
+    table_name: str,
+    checkpoint_location: str,
+    trigger_interval: Optional[str] = None,
+    windows: Optional[int] = None,
+    current_dataset_format: DatasetFormat = DatasetFormat.CSV,
+    reference_dataset_format: DatasetFormat = DatasetFormat.CSV,
+    persistence: PersistencePolicy = PersistencePolicy.AUTO,
+    csv_read_mode: CsvReadMode = CsvReadMode.CAST,
+    duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+    write_record: Optional[Callable[[Dict], None]] = None,
+    residual_points_budget: int = DEFAULT_RESIDUAL_POINTS_BUDGET,
+    categories_top_k: int = DEFAULT_CATEGORIES_TOP_K,
+):
+    spark_context = spark_session.sparkContext
+
+    spark_context._jsc.hadoopConfiguration().set(
+        "fs.s3a.access.key", os.getenv("AWS_ACCESS_KEY_ID")
+    )
+    spark_context._jsc.hadoopConfiguration().set(
+        "fs.s3a.secret.key", os.getenv("AWS_SECRET_ACCESS_KEY")
+    )
+    spark_context._jsc.hadoopConfiguration().set(
+        "fs.s3a.endpoint.region", os.getenv("AWS_REGION")
+    )
+    if os.getenv("S3_ENDPOINT_URL"):
+        spark_context._jsc.hadoopConfiguration().set(
+            "fs.s3a.endpoint", os.getenv("S3_ENDPOINT_URL")
+        )
+        spark_context._jsc.hadoopConfiguration().set("fs.s3a.path.style.access", "true")
+        spark_context._jsc.hadoopConfiguration().set(
+            "fs.s3a.connection.ssl.enabled", "false"
+        )
+
+    if write_record is None:
+
+        def write_record(record: Dict) -> None:
+            upsert_metrics(record, table_name)
+            # FIXME table name should come from parameters
+            update_job_status(current_uuid, JobStatus.SUCCEEDED, "current_dataset")
+
+    streaming_metrics = StreamingCurrentMetrics(
+        spark_session=spark_session,
+        model=model,
+        reference_state=reference_metrics_state(
+            spark_session,
+            model,
+            reference_dataset_path,
+            reference_dataset_format,
+            persistence,
+            csv_read_mode,
+            categories_top_k,
+        ),
+        current_uuid=current_uuid,
+        checkpoint_location=checkpoint_location,
+        write_record=write_record,
+        windows=windows,
+        duplicate_rows_mode=duplicate_rows_mode,
+        residual_points_budget=residual_points_budget,
+        categories_top_k=categories_top_k,
+    )
+    writer = (
+        read_dataset_stream(
+            spark_session,
+            current_dataset_directory,
+            current_dataset_format,
+            CurrentDataset.spark_schema(model),
+            csv_read_mode,
+        )
+        .writeStream.foreachBatch(streaming_metrics.process_batch)
+        .option("checkpointLocation", checkpoint_location)
+    )
+    # without trigger interval the files in the directory are processed and the job ends
+    query = (
+        writer.trigger(processingTime=trigger_interval)
+        if trigger_interval
+        else writer.trigger(availableNow=True)
+    ).start()
+    query.awaitTermination()
+
+
+def parse_arguments(argv: List[str]) -> argparse.Namespace:
+    parser = job_argument_parser("Streaming metrics of a directory of current files")
+    parser.add_argument(
+        "current_dataset_directory",
+        help="directory, or s3 prefix, of the incoming current files",
+    )
+    parser.add_argument("current_uuid")
+    parser.add_argument("reference_dataset_path")
+    parser.add_argument("table_name")
+    parser.add_argument(
+        "checkpoint_location",
+        help="checkpoint location of the query and of the metrics state",
+    )
+    parser.add_argument(
+        "--trigger-interval",
+        help='as "1 minute", without it the files in the directory are processed and '
+        "the job ends",
+    )
+    parser.add_argument(
+        "--windows",
+        type=int,
+        help="number of the last time groups of the model granularity in the metrics, "
+        "all of them by default",
+    )
+    add_dataset_format_argument(parser, "--current-dataset-format")
+    add_dataset_format_argument(parser, "--reference-dataset-format")
+    add_read_arguments(parser)
+    add_duplicate_rows_argument(parser)
+    add_residual_points_argument(parser)
+    add_categories_top_k_argument(parser)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    spark_session = SparkSession.builder.appName(
+        "radicalbit_streaming_metrics"
+    ).getOrCreate()
+
+    arguments = parse_arguments(sys.argv[1:])
+
+    try:
+        main(
+            spark_session,
+            arguments.model,
+            arguments.current_dataset_directory,
+            arguments.current_uuid,
+            arguments.reference_dataset_path,
+            arguments.table_name,
+            arguments.checkpoint_location,
+            trigger_interval=arguments.trigger_interval or None,
+            windows=arguments.windows or None,
+            current_dataset_format=arguments.current_dataset_format,
+            reference_dataset_format=arguments.reference_dataset_format,
+            persistence=arguments.persistence,
+            csv_read_mode=arguments.csv_read_mode,
+            duplicate_rows_mode=arguments.duplicate_rows_mode,
+            residual_points_budget=arguments.residual_points_budget,
+            categories_top_k=arguments.categories_top_k,
+        )
+    except Exception as e:
+        logging.exception(e)
+        # FIXME table name should come from parameters
+        update_job_status(arguments.current_uuid, JobStatus.ERROR, "current_dataset")
+    finally:
+        spark_session.stop()
@@ -0,0 +1,118 @@
+import argparse
+
+from utils.models import (
+    DEFAULT_CATEGORIES_TOP_K,
+    DEFAULT_QUANTILE_RELATIVE_ERROR,
+    DEFAULT_RESIDUAL_POINTS_BUDGET,
+    CategoricalAccuracy,
+    CsvReadMode,
+    DatasetFormat,
+    DuplicateRowsMode,
+    ModelOut,
+    PersistencePolicy,
+    QuantileAccuracy,
+    QuantileMode,
+)
+
+# Named options shared by the jobs. The required arguments stay positional, the optional
+# ones are named so that they can be given in any order and new ones can be added
+# without breaking the callers.
+
+
+def job_argument_parser(description: str) -> argparse.ArgumentParser:
+    """
+    Parser of the jobs, with the model json as first positional argument.
+    """
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument(
+        "model", type=ModelOut.model_validate_json, help="json of the ModelOut"
+    )
+    return parser
+
+
+def add_dataset_format_argument(parser: argparse.ArgumentParser, flag: str) -> None:
+    parser.add_argument(
+        flag,
+        type=DatasetFormat,
+        default=DatasetFormat.CSV,
+    )
+
+
+def add_read_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Persistence policy and csv read mode of the datasets.
+    """
+    parser.add_argument(
+        "--persistence",
+        type=PersistencePolicy,
+        default=PersistencePolicy.AUTO,
+        help="AUTO selects it from the dataset size",
+    )
+    parser.add_argument(
+        "--csv-read-mode",
+        type=CsvReadMode,
+        default=CsvReadMode.CAST,
+        help="CAST reads strings and casts them afterwards",
+    )
+
+
+def add_quantile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--quantile-mode",
+        type=QuantileMode,
+        default=QuantileMode.EXACT,
+    )
+    parser.add_argument(
+        "--quantile-relative-error",
+        type=float,
+        default=DEFAULT_QUANTILE_RELATIVE_ERROR,
+    )
+
+
+def add_duplicate_rows_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--duplicate-rows-mode",
+        type=DuplicateRowsMode,
+        default=DuplicateRowsMode.EXACT,
+    )
+
+
+def add_residual_points_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--residual-points-budget",
+        type=int,
+        default=DEFAULT_RESIDUAL_POINTS_BUDGET,
+        help="maximum number of points of the residual scatter plots",
+    )
+
+
+def add_categories_top_k_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--categories-top-k",
+        type=int,
+        default=DEFAULT_CATEGORIES_TOP_K,
+        help="maximum number of categories of every categorical feature",
+    )
+
+
+def add_categorical_arguments(parser: argparse.ArgumentParser) -> None:
+    add_categories_top_k_argument(parser)
+    parser.add_argument(
+        "--approximate-distinct",
+        action="store_true",
+        help="counts the distinct values of categorical features with HyperLogLog",
+    )
+
+
+def quantile_accuracy(arguments: argparse.Namespace) -> QuantileAccuracy:
+    return QuantileAccuracy(
+        mode=arguments.quantile_mode,
+        relative_error=arguments.quantile_relative_error,
+    )
+
+
+def categorical_accuracy(arguments: argparse.Namespace) -> CategoricalAccuracy:
+    return CategoricalAccuracy(
+        top_k=arguments.categories_top_k,
+        approximate_distinct=arguments.approximate_distinct,
+    )
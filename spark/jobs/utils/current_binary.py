@@ -1,15 +1,16 @@
+from functools import cached_property
 from typing import List
 
 from pyspark.ml.evaluation import (
     BinaryClassificationEvaluator,
     MulticlassClassificationEvaluator,
 )
-from pyspark.mllib.evaluation import MulticlassMetrics
-from pyspark.sql import DataFrame, SparkSession
-from pyspark.sql.types import DoubleType
-import pyspark.sql.functions as F
+from pyspark.sql import DataFrame, Row, SparkSession
 
 from metrics.data_quality_calculator import DataQualityCalculator
+from metrics.dataset_scan import DatasetScan
+from metrics.statistics import calculate_statistics_current
+from metrics.model_quality_binary_calculator import ModelQualityBinaryCalculator
 from metrics.drift_calculator import DriftCalculator
 from models.current_dataset import CurrentDataset
 from models.data_quality import (
@@ -19,9 +20,14 @@ from models.data_quality import (
     BinaryClassDataQuality,
 )
 from models.reference_dataset import ReferenceDataset
-from .misc import create_time_format, rbit_prefix
-from .models import Granularity
-from .spark import is_not_null
+from models.statistics import Statistics
+from utils.models import (
+    CategoricalAccuracy,
+    DriftSampling,
+    DuplicateRowsMode,
+    QuantileAccuracy,
+)
+from .spark import is_not_null, time_group_column
 
 
 class CurrentMetricsService:
@@ -62,10 +68,43 @@ class CurrentMetricsService:
         spark_session: SparkSession,
         current: CurrentDataset,
         reference: ReferenceDataset,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
+        categorical_accuracy: CategoricalAccuracy = CategoricalAccuracy(),
+        drift_sampling: DriftSampling = DriftSampling(),
+        duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
     ):
         self.spark_session = spark_session
         self.current = current
         self.reference = reference
+        self.quantile_accuracy = quantile_accuracy
+        self.categorical_accuracy = categorical_accuracy
+        self.duplicate_rows_mode = duplicate_rows_mode
+        self.drift_sampling = drift_sampling
+
+    @cached_property
+    def label_prediction_counts(self) -> List[Row]:
+        """
+        The target and prediction pairs counts, shared by class metrics and confusion
+        matrix. Lazy, so that statistics and drift alone do not run its aggregation.
+        """
+        return ModelQualityBinaryCalculator.label_prediction_counts(
+            model=self.current.model, dataframe=self.current.current
+        )
+
+    @cached_property
+    def scan(self) -> DatasetScan:
+        """The aggregation of the dataset shared by statistics and data quality."""
+        return DatasetScan(
+            self.current.model,
+            self.current.current,
+            self.current.current_count,
+            self.quantile_accuracy,
+        )
+
+    def calculate_statistics(self) -> Statistics:
+        return calculate_statistics_current(
+            self.current, self.scan, self.duplicate_rows_mode
+        )
 
     def calculate_data_quality_numerical(self) -> List[NumericalFeatureMetrics]:
         return DataQualityCalculator.calculate_combined_data_quality_numerical(
@@ -74,6 +113,9 @@ class CurrentMetricsService:
             current_count=self.current.current_count,
             reference_dataframe=self.reference.reference,
             spark_session=self.spark_session,
+            reference_profile=self.reference.profile,
+            quantile_accuracy=self.quantile_accuracy,
+            global_metrics=self.scan.numerical_metrics,
         )
 
     def calculate_data_quality_categorical(self) -> List[CategoricalFeatureMetrics]:
@@ -81,15 +123,23 @@ class CurrentMetricsService:
             model=self.current.model,
             dataframe=self.current.current,
             dataframe_count=self.current.current_count,
+            top_k=self.categorical_accuracy.top_k,
+            approximate_distinct=self.categorical_accuracy.approximate_distinct,
+            global_metrics=self.scan.categorical_metrics,
         )
 
     def calculate_class_metrics(self, column) -> List[ClassMetrics]:
-        metrics = DataQualityCalculator.class_metrics(
+        metrics = ModelQualityBinaryCalculator.class_metrics(
             class_column=column,
-            dataframe=self.current.current,
+            counts=self.label_prediction_counts,
             dataframe_count=self.current.current_count,
         )
 
+        return CurrentMetricsService.complete_binary_classes(metrics)
+
+    @staticmethod
+    def complete_binary_classes(metrics: List[ClassMetrics]) -> List[ClassMetrics]:
+        """Adds the metrics of the missing class, 0.0 or 1.0, with no rows."""
         # FIXME this should be avoided if we are sure that we have all classes in the file
 
         if len(metrics) == 1:
@@ -180,257 +230,99 @@ class CurrentMetricsService:
             & is_not_null(self.current.model.target.name)
         )
 
-        if self.current.model.granularity == Granularity.WEEK:
-            dataset_with_group = current_df_clean.select(
-                [
-                    self.current.model.outputs.prediction.name,
-                    self.current.model.target.name,
-                    F.date_format(
-                        F.to_timestamp(
-                            F.date_sub(
-                                F.next_day(
-                                    F.date_format(
-                                        self.current.model.timestamp.name,
-                                        create_time_format(
-                                            self.current.model.granularity
-                                        ),
-                                    ),
-                                    "sunday",
-                                ),
-                                7,
-                            )
-                        ),
-                        "yyyy-MM-dd HH:mm:ss",
-                    ).alias("time_group"),
-                ]
-            )
-        else:
-            dataset_with_group = current_df_clean.select(
-                [
-                    self.current.model.outputs.prediction.name,
-                    self.current.model.target.name,
-                    F.date_format(
-                        F.to_timestamp(
-                            F.date_format(
-                                self.current.model.timestamp.name,
-                                create_time_format(self.current.model.granularity),
-                            )
-                        ),
-                        "yyyy-MM-dd HH:mm:ss",
-                    ).alias("time_group"),
-                ]
-            )
+        dataset_with_group = current_df_clean.select(
+            [
+                self.current.model.outputs.prediction.name,
+                self.current.model.target.name,
+                time_group_column(
+                    self.current.model.timestamp.name, self.current.model.granularity
+                ),
+            ]
+        )
 
-        list_of_time_group = (
-            dataset_with_group.select("time_group")
-            .distinct()
-            .orderBy(F.col("time_group").asc())
-            .rdd.flatMap(lambda x: x)
-            .collect()
+        # one aggregation for all the groups, metrics are derived on the driver
+        metrics_by_group = ModelQualityBinaryCalculator.multiclass_metrics_by_group(
+            self.current.model, dataset_with_group, "time_group"
+        )
+        list_of_time_group = sorted(
+            metrics_by_group.keys(), key=lambda x: (x is not None, x)
         )
-        array_of_groups = [
-            dataset_with_group.where(F.col("time_group") == x)
-            for x in list_of_time_group
-        ]
 
+        # metricLabel=1 is required otherwise this will take 0 as the positive label, with errors in calculations
+        # because this is used as binary classificator even if it is a multiclass
         return {
             label: [
                 {
                     "timestamp": group,
-                    "value": self.__evaluate_multi_class_classification(
-                        group_dataset, name
-                    ),
+                    "value": metrics_by_group[group].evaluate(name, metric_label=1.0),
                 }
-                for group, group_dataset in zip(list_of_time_group, array_of_groups)
+                for group in list_of_time_group
             ]
             for name, label in self.model_quality_multiclass_classificator.items()
         }
 
-    def calculate_binary_class_model_quality_group_by_timestamp(self):
+    def __binary_dataset_with_group(self) -> DataFrame:
         current_df_clean = self.current.current.filter(
             is_not_null(self.current.model.outputs.prediction_proba.name)
             & is_not_null(self.current.model.target.name)
         )
 
-        if self.current.model.granularity == Granularity.WEEK:
-            dataset_with_group = current_df_clean.select(
-                [
-                    self.current.model.outputs.prediction.name,
-                    self.current.model.outputs.prediction_proba.name,
-                    self.current.model.target.name,
-                    F.date_format(
-                        F.to_timestamp(
-                            F.date_sub(
-                                F.next_day(
-                                    F.date_format(
-                                        self.current.model.timestamp.name,
-                                        create_time_format(
-                                            self.current.model.granularity
-                                        ),
-                                    ),
-                                    "sunday",
-                                ),
-                                7,
-                            )
-                        ),
-                        "yyyy-MM-dd HH:mm:ss",
-                    ).alias("time_group"),
-                ]
-            )
-        else:
-            dataset_with_group = current_df_clean.select(
-                [
-                    self.current.model.outputs.prediction.name,
-                    self.current.model.outputs.prediction_proba.name,
-                    self.current.model.target.name,
-                    F.date_format(
-                        F.to_timestamp(
-                            F.date_format(
-                                self.current.model.timestamp.name,
-                                create_time_format(self.current.model.granularity),
-                            )
-                        ),
-                        "yyyy-MM-dd HH:mm:ss",
-                    ).alias("time_group"),
-                ]
-            )
+        return current_df_clean.select(
+            [
+                self.current.model.outputs.prediction.name,
+                self.current.model.outputs.prediction_proba.name,
+                self.current.model.target.name,
+                time_group_column(
+                    self.current.model.timestamp.name, self.current.model.granularity
+                ),
+            ]
+        )
+
+    def calculate_binary_class_model_quality_group_by_timestamp(self):
+        dataset_with_group = self.__binary_dataset_with_group()
 
-        list_of_time_group = (
-            dataset_with_group.select("time_group")
-            .distinct()
-            .orderBy(F.col("time_group").asc())
-            .rdd.flatMap(lambda x: x)
-            .collect()
+        # one aggregation of the score histogram of every group
+        area_under_curves_by_group = (
+            ModelQualityBinaryCalculator.area_under_curves_by_group(
+                self.current.model, dataset_with_group, "time_group"
+            )
+        )
+        list_of_time_group = sorted(
+            area_under_curves_by_group.keys(), key=lambda x: (x is not None, x)
         )
-        array_of_groups = [
-            dataset_with_group.select(
-                [
-                    self.current.model.outputs.prediction_proba.name,
-                    self.current.model.target.name,
-                ]
-            ).where(F.col("time_group") == x)
-            for x in list_of_time_group
-        ]
-        array_of_groups_with_pred = [
-            dataset_with_group.where(F.col("time_group") == x)
-            for x in list_of_time_group
-        ]
 
-        res = {
+        return {
             label: [
                 {
                     "timestamp": group,
-                    "value": self.__evaluate_binary_classification(group_dataset, name),
+                    "value": area_under_curves_by_group[group][name],
                 }
-                for group, group_dataset in zip(list_of_time_group, array_of_groups)
+                for group in list_of_time_group
             ]
             for name, label in self.model_quality_binary_classificator.items()
         }
 
-        log_loss_res = {
-            "log_loss": [
-                {
-                    "timestamp": group,
-                    "value": self.__calculate_log_loss(group_dataset),
-                }
-                for group, group_dataset in zip(
-                    list_of_time_group, array_of_groups_with_pred
-                )
-            ]
-        }
-        res.update(log_loss_res)
-        return res
-
-    def calculate_confusion_matrix(self) -> dict[str, float]:
-        prediction_and_label = (
-            self.current.current.filter(
-                is_not_null(self.current.model.outputs.prediction.name)
-                & is_not_null(self.current.model.target.name)
+    def __calculate_log_loss_with_group_by_timestamp(self):
+        # global and time grouped log loss come from the same rollup aggregation,
+        # rows without prediction are ignored as in the global metric
+        global_log_loss, log_loss_by_group = (
+            ModelQualityBinaryCalculator.log_loss_by_group(
+                self.current.model, self.__binary_dataset_with_group(), "time_group"
             )
-            .select(
-                [
-                    self.current.model.outputs.prediction.name,
-                    self.current.model.target.name,
-                ]
-            )
-            .withColumn(
-                self.current.model.target.name, F.col(self.current.model.target.name)
-            )
-            .orderBy(self.current.model.target.name)
         )
-
-        tp = prediction_and_label.filter(
-            (F.col(self.current.model.outputs.prediction.name) == 1)
-            & (F.col(self.current.model.target.name) == 1)
-        ).count()
-        tn = prediction_and_label.filter(
-            (F.col(self.current.model.outputs.prediction.name) == 0)
-            & (F.col(self.current.model.target.name) == 0)
-        ).count()
-        fp = prediction_and_label.filter(
-            (F.col(self.current.model.outputs.prediction.name) == 1)
-            & (F.col(self.current.model.target.name) == 0)
-        ).count()
-        fn = prediction_and_label.filter(
-            (F.col(self.current.model.outputs.prediction.name) == 0)
-            & (F.col(self.current.model.target.name) == 1)
-        ).count()
-
-        return {
-            "true_positive_count": tp,
-            "false_positive_count": fp,
-            "true_negative_count": tn,
-            "false_negative_count": fn,
-        }
-
-    def __calculate_log_loss(self, current_df) -> float:
-        dataset_with_proba = (
-            current_df.filter(
-                is_not_null(self.current.model.outputs.prediction.name)
-                & is_not_null(self.current.model.target.name)
-                & is_not_null(self.current.model.outputs.prediction_proba.name)
-            )
-            .withColumn(
-                f"{rbit_prefix}_prediction_proba_class0",
-                F.when(
-                    F.col(self.current.model.outputs.prediction.name) == 0,
-                    F.col(self.current.model.outputs.prediction_proba.name),
-                ).otherwise(
-                    1 - F.col(self.current.model.outputs.prediction_proba.name)
-                ),
-            )
-            .withColumn(
-                f"{rbit_prefix}_prediction_proba_class1",
-                F.when(
-                    F.col(self.current.model.outputs.prediction.name) == 1,
-                    F.col(self.current.model.outputs.prediction_proba.name),
-                ).otherwise(
-                    1 - F.col(self.current.model.outputs.prediction_proba.name)
-                ),
-            )
-            .withColumn(f"{rbit_prefix}_weight_logloss_def", F.lit(1.0))
-            .withColumn(
-                self.current.model.outputs.prediction.name,
-                F.col(self.current.model.outputs.prediction.name).cast(DoubleType()),
-            )
-            .withColumn(
-                self.current.model.target.name,
-                F.col(self.current.model.target.name).cast(DoubleType()),
-            )
+        list_of_time_group = sorted(
+            log_loss_by_group.keys(), key=lambda x: (x is not None, x)
         )
 
-        dataset_proba_vector = dataset_with_proba.select(
-            self.current.model.outputs.prediction.name,
-            self.current.model.target.name,
-            f"{rbit_prefix}_weight_logloss_def",
-            F.array(
-                F.col(f"{rbit_prefix}_prediction_proba_class0"),
-                F.col(f"{rbit_prefix}_prediction_proba_class1"),
-            ).alias(f"{rbit_prefix}_prediction_proba_vector"),
-        ).rdd
+        return global_log_loss, [
+            {"timestamp": group, "value": log_loss_by_group[group]}
+            for group in list_of_time_group
+        ]
 
-        metrics = MulticlassMetrics(dataset_proba_vector)
-        return metrics.logLoss()
+    def calculate_confusion_matrix(self) -> dict[str, float]:
+        return ModelQualityBinaryCalculator.confusion_matrix(
+            model=self.current.model, counts=self.label_prediction_counts
+        )
 
     # FIXME use pydantic struct like data quality
     def calculate_model_quality_with_group_by_timestamp(self):
@@ -442,13 +334,14 @@ class CurrentMetricsService:
         metrics["global_metrics"].update(self.calculate_confusion_matrix())
         if self.current.model.outputs.prediction_proba is not None:
             metrics["global_metrics"].update(self.__calc_bc_metrics())
-            metrics["global_metrics"]["log_loss"] = self.__calculate_log_loss(
-                self.current.current
-            )
             binary_class_metrics = (
                 self.calculate_binary_class_model_quality_group_by_timestamp()
             )
             metrics["grouped_metrics"].update(binary_class_metrics)
+            (
+                metrics["global_metrics"]["log_loss"],
+                metrics["grouped_metrics"]["log_loss"],
+            ) = self.__calculate_log_loss_with_group_by_timestamp()
         return metrics
 
     def calculate_drift(self):
@@ -456,4 +349,5 @@ class CurrentMetricsService:
             spark_session=self.spark_session,
             reference_dataset=self.reference,
             current_dataset=self.current,
+            sampling=self.drift_sampling,
         )
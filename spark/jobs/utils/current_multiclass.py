@@ -1,13 +1,16 @@
-from typing import List, Dict
+from functools import cached_property
+from typing import List, Dict, Optional
 
-from pandas import DataFrame
-from pyspark.ml.evaluation import MulticlassClassificationEvaluator
-from pyspark.mllib.evaluation import MulticlassMetrics
 from pyspark.sql import SparkSession
-import pyspark.sql.functions as F
 
+from metrics.confusion_matrix_metrics import ConfusionMatrixMetrics
 from metrics.data_quality_calculator import DataQualityCalculator
+from metrics.dataset_scan import DatasetScan
+from metrics.statistics import calculate_statistics_current
 from metrics.drift_calculator import DriftCalculator
+from metrics.model_quality_multiclass_calculator import (
+    ModelQualityMulticlassCalculator,
+)
 from models.current_dataset import CurrentDataset
 from models.data_quality import (
     NumericalFeatureMetrics,
@@ -16,41 +19,72 @@ from models.data_quality import (
     MultiClassDataQuality,
 )
 from models.reference_dataset import ReferenceDataset
-from utils.misc import create_time_format, rbit_prefix
-from utils.models import Granularity
+from models.statistics import Statistics
+from utils.models import (
+    CategoricalAccuracy,
+    DriftSampling,
+    DuplicateRowsMode,
+    QuantileAccuracy,
+)
+from utils.misc import rbit_prefix
+from utils.spark import time_group_column
 
 
 class CurrentMetricsMulticlassService:
+    model_quality_multiclass_classificator_global = {
+        "f1": "f1",
+        "accuracy": "accuracy",
+        "weightedPrecision": "weighted_precision",
+        "weightedRecall": "weighted_recall",
+        "weightedTruePositiveRate": "weighted_true_positive_rate",
+        "weightedFalsePositiveRate": "weighted_false_positive_rate",
+        "weightedFMeasure": "weighted_f_measure",
+    }
+    model_quality_multiclass_classificator_by_label = {
+        "truePositiveRateByLabel": "true_positive_rate",
+        "falsePositiveRateByLabel": "false_positive_rate",
+        "precisionByLabel": "precision",
+        "recallByLabel": "recall",
+        "fMeasureByLabel": "f_measure",
+    }
+
     def __init__(
         self,
         spark_session: SparkSession,
         current: CurrentDataset,
         reference: ReferenceDataset,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
+        categorical_accuracy: CategoricalAccuracy = CategoricalAccuracy(),
+        drift_sampling: DriftSampling = DriftSampling(),
+        duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
     ):
         self.spark_session = spark_session
         self.current = current
         self.reference = reference
+        self.quantile_accuracy = quantile_accuracy
+        self.categorical_accuracy = categorical_accuracy
+        self.duplicate_rows_mode = duplicate_rows_mode
+        self.drift_sampling = drift_sampling
         index_label_map, indexed_current = current.get_string_indexed_dataframe(
             self.reference
         )
         self.index_label_map = index_label_map
         self.indexed_current = indexed_current
-        self.model_quality_multiclass_classificator_global = {
-            "f1": "f1",
-            "accuracy": "accuracy",
-            "weightedPrecision": "weighted_precision",
-            "weightedRecall": "weighted_recall",
-            "weightedTruePositiveRate": "weighted_true_positive_rate",
-            "weightedFalsePositiveRate": "weighted_false_positive_rate",
-            "weightedFMeasure": "weighted_f_measure",
-        }
-        self.model_quality_multiclass_classificator_by_label = {
-            "truePositiveRateByLabel": "true_positive_rate",
-            "falsePositiveRateByLabel": "false_positive_rate",
-            "precisionByLabel": "precision",
-            "recallByLabel": "recall",
-            "fMeasureByLabel": "f_measure",
-        }
+
+    @cached_property
+    def scan(self) -> DatasetScan:
+        """The aggregation of the dataset shared by statistics and data quality."""
+        return DatasetScan(
+            self.current.model,
+            self.current.current,
+            self.current.current_count,
+            self.quantile_accuracy,
+        )
+
+    def calculate_statistics(self) -> Statistics:
+        return calculate_statistics_current(
+            self.current, self.scan, self.duplicate_rows_mode
+        )
 
     def calculate_data_quality_numerical(self) -> List[NumericalFeatureMetrics]:
         return DataQualityCalculator.calculate_combined_data_quality_numerical(
@@ -59,6 +93,9 @@ class CurrentMetricsMulticlassService:
             current_count=self.current.current_count,
             reference_dataframe=self.reference.reference,
             spark_session=self.spark_session,
+            reference_profile=self.reference.profile,
+            quantile_accuracy=self.quantile_accuracy,
+            global_metrics=self.scan.numerical_metrics,
         )
 
     def calculate_data_quality_categorical(self) -> List[CategoricalFeatureMetrics]:
@@ -66,6 +103,9 @@ class CurrentMetricsMulticlassService:
             model=self.current.model,
             dataframe=self.current.current,
             dataframe_count=self.current.current_count,
+            top_k=self.categorical_accuracy.top_k,
+            approximate_distinct=self.categorical_accuracy.approximate_distinct,
+            global_metrics=self.scan.categorical_metrics,
         )
 
     def calculate_class_metrics(self, column) -> List[ClassMetrics]:
@@ -75,139 +115,108 @@ class CurrentMetricsMulticlassService:
             dataframe_count=self.current.current_count,
         )
 
-    def calculate_multiclass_model_quality_group_by_timestamp(self):
-        if self.current.model.granularity == Granularity.WEEK:
-            dataset_with_group = self.indexed_current.select(
-                [
-                    f"{rbit_prefix}_{self.reference.model.outputs.prediction.name}-idx",
-                    f"{rbit_prefix}_{self.current.model.target.name}-idx",
-                    self.current.model.outputs.prediction.name,
-                    self.current.model.target.name,
-                    F.date_format(
-                        F.to_timestamp(
-                            F.date_sub(
-                                F.next_day(
-                                    F.date_format(
-                                        self.current.model.timestamp.name,
-                                        create_time_format(
-                                            self.current.model.granularity
-                                        ),
-                                    ),
-                                    "sunday",
-                                ),
-                                7,
-                            )
-                        ),
-                        "yyyy-MM-dd HH:mm:ss",
-                    ).alias("time_group"),
-                ]
-            )
-        else:
-            dataset_with_group = self.indexed_current.select(
-                [
-                    f"{rbit_prefix}_{self.reference.model.outputs.prediction.name}-idx",
-                    f"{rbit_prefix}_{self.current.model.target.name}-idx",
-                    self.current.model.outputs.prediction.name,
-                    self.current.model.target.name,
-                    F.date_format(
-                        F.to_timestamp(
-                            F.date_format(
-                                self.current.model.timestamp.name,
-                                create_time_format(self.current.model.granularity),
-                            )
-                        ),
-                        "yyyy-MM-dd HH:mm:ss",
-                    ).alias("time_group"),
-                ]
-            )
+    def __confusion_metrics_by_group(self):
+        dataset_with_group = self.indexed_current.select(
+            [
+                f"{rbit_prefix}_{self.current.model.outputs.prediction.name}-idx",
+                f"{rbit_prefix}_{self.current.model.target.name}-idx",
+                time_group_column(
+                    self.current.model.timestamp.name, self.current.model.granularity
+                ),
+            ]
+        )
+        return ModelQualityMulticlassCalculator.confusion_metrics_by_group(
+            dataset_with_group,
+            label_column=f"{rbit_prefix}_{self.current.model.target.name}-idx",
+            prediction_column=f"{rbit_prefix}_{self.current.model.outputs.prediction.name}-idx",
+            group_column="time_group",
+        )
 
-        list_of_time_group = (
-            dataset_with_group.select("time_group")
-            .distinct()
-            .orderBy(F.col("time_group").asc())
-            .rdd.flatMap(lambda x: x)
-            .collect()
+    def calculate_multiclass_model_quality_group_by_timestamp(
+        self,
+        global_metrics: Optional[ConfusionMatrixMetrics] = None,
+        metrics_by_group: Optional[Dict[str, ConfusionMatrixMetrics]] = None,
+    ):
+        # one confusion matrix for every time group, all the metrics of every class
+        # are derived on the driver
+        if global_metrics is None or metrics_by_group is None:
+            global_metrics, metrics_by_group = self.__confusion_metrics_by_group()
+        return CurrentMetricsMulticlassService.class_metrics_from_confusions(
+            self.index_label_map, global_metrics, metrics_by_group
+        )
+
+    @staticmethod
+    def class_metrics_from_confusions(
+        index_label_map: Dict[str, str],
+        global_metrics: ConfusionMatrixMetrics,
+        metrics_by_group: Dict[Optional[str], ConfusionMatrixMetrics],
+    ) -> List[Dict]:
+        """The metrics of every class, global and by time group."""
+        service = CurrentMetricsMulticlassService
+        by_label = service.model_quality_multiclass_classificator_by_label
+        list_of_time_group = sorted(
+            metrics_by_group.keys(), key=lambda x: (x is not None, x)
         )
-        array_of_groups = [
-            dataset_with_group.where(F.col("time_group") == x)
-            for x in list_of_time_group
-        ]
 
         return [
             {
                 "class_name": label,
                 "metrics": {
-                    metric_label: self.__evaluate_multi_class_classification(
-                        self.indexed_current, metric_name, float(index)
-                    )
-                    for (
-                        metric_name,
-                        metric_label,
-                    ) in self.model_quality_multiclass_classificator_by_label.items()
+                    metric_label: global_metrics.evaluate(metric_name, float(index))
+                    for metric_name, metric_label in by_label.items()
                 },
                 "grouped_metrics": {
                     metric_label: [
                         {
                             "timestamp": group,
-                            "value": self.__evaluate_multi_class_classification(
-                                group_dataset, metric_name, float(index)
+                            "value": metrics_by_group[group].evaluate(
+                                metric_name, float(index)
                             ),
                         }
-                        for group, group_dataset in zip(
-                            list_of_time_group, array_of_groups
-                        )
+                        for group in list_of_time_group
                     ]
-                    for metric_name, metric_label in self.model_quality_multiclass_classificator_by_label.items()
+                    for metric_name, metric_label in by_label.items()
                 },
             }
-            for index, label in self.index_label_map.items()
+            for index, label in index_label_map.items()
         ]
 
-    def __evaluate_multi_class_classification(
-        self, dataset: DataFrame, metric_name: str, class_index: float
-    ) -> float:
-        try:
-            return MulticlassClassificationEvaluator(
-                metricName=metric_name,
-                predictionCol=f"{rbit_prefix}_{self.current.model.outputs.prediction.name}-idx",
-                labelCol=f"{rbit_prefix}_{self.current.model.target.name}-idx",
-                metricLabel=class_index,
-            ).evaluate(dataset)
-        except Exception:
-            return float("nan")
-
-    def __calc_multiclass_global_metrics(self) -> Dict:
-        return {
-            metric_label: self.__evaluate_multi_class_classification(
-                self.indexed_current, metric_name, 0.0
-            )
+    @staticmethod
+    def model_quality_from_confusions(
+        index_label_map: Dict[str, str],
+        global_confusion_metrics: ConfusionMatrixMetrics,
+        metrics_by_group: Dict[Optional[str], ConfusionMatrixMetrics],
+    ) -> Dict:
+        """
+        Builds the model quality from the confusion matrix of the whole dataset and of
+        every time group, indexed as index_label_map.
+        """
+        service = CurrentMetricsMulticlassService
+        global_metrics = {
+            metric_label: global_confusion_metrics.evaluate(metric_name)
             for (
                 metric_name,
                 metric_label,
-            ) in self.model_quality_multiclass_classificator_global.items()
+            ) in service.model_quality_multiclass_classificator_global.items()
         }
-
-    def __calc_confusion_matrix(self):
-        prediction_and_labels = self.indexed_current.select(
-            *[
-                f"{rbit_prefix}_{self.reference.model.outputs.prediction.name}-idx",
-                f"{rbit_prefix}_{self.reference.model.target.name}-idx",
-            ]
-        ).rdd
-        multiclass_metrics_calculator = MulticlassMetrics(prediction_and_labels)
-        return multiclass_metrics_calculator.confusionMatrix().toArray().tolist()
-
-    def calculate_model_quality(self) -> Dict:
-        metrics_by_label = self.calculate_multiclass_model_quality_group_by_timestamp()
-        global_metrics = self.__calc_multiclass_global_metrics()
-        global_metrics["confusion_matrix"] = self.__calc_confusion_matrix()
-        metrics = {
-            "classes": list(self.index_label_map.values()),
-            "class_metrics": metrics_by_label,
+        global_metrics["confusion_matrix"] = (
+            ModelQualityMulticlassCalculator.label_confusion_matrix(
+                global_confusion_metrics
+            )
+        )
+        return {
+            "classes": list(index_label_map.values()),
+            "class_metrics": service.class_metrics_from_confusions(
+                index_label_map, global_confusion_metrics, metrics_by_group
+            ),
             "global_metrics": global_metrics,
         }
 
-        return metrics
+    def calculate_model_quality(self) -> Dict:
+        global_confusion_metrics, metrics_by_group = self.__confusion_metrics_by_group()
+        return CurrentMetricsMulticlassService.model_quality_from_confusions(
+            self.index_label_map, global_confusion_metrics, metrics_by_group
+        )
 
     def calculate_data_quality(self) -> MultiClassDataQuality:
         feature_metrics = []
@@ -229,4 +238,5 @@ class CurrentMetricsMulticlassService:
             spark_session=self.spark_session,
             reference_dataset=self.reference,
             current_dataset=self.current,
+            sampling=self.drift_sampling,
         )
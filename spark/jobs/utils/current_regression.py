@@ -1,9 +1,11 @@
-from typing import List, Optional
+from functools import cached_property
+from typing import Dict, List, Optional
 
 from pyspark.sql import SparkSession
-import pyspark.sql.functions as F
 
 from metrics.data_quality_calculator import DataQualityCalculator
+from metrics.dataset_scan import DatasetScan
+from metrics.statistics import calculate_statistics_current
 from models.current_dataset import CurrentDataset
 from models.data_quality import (
     CategoricalFeatureMetrics,
@@ -12,10 +14,17 @@ from models.data_quality import (
     RegressionDataQuality,
 )
 from models.reference_dataset import ReferenceDataset
+from models.statistics import Statistics
+from utils.models import (
+    DEFAULT_RESIDUAL_POINTS_BUDGET,
+    CategoricalAccuracy,
+    DriftSampling,
+    DuplicateRowsMode,
+    QuantileAccuracy,
+)
 from models.regression_model_quality import ModelQualityRegression, RegressionMetricType
 from metrics.model_quality_regression_calculator import ModelQualityRegressionCalculator
-from .misc import create_time_format
-from .models import Granularity
+from .spark import time_group_column
 from metrics.drift_calculator import DriftCalculator
 
 
@@ -25,98 +34,100 @@ class CurrentMetricsRegressionService:
         spark_session: SparkSession,
         current: CurrentDataset,
         reference: ReferenceDataset,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
+        categorical_accuracy: CategoricalAccuracy = CategoricalAccuracy(),
+        drift_sampling: DriftSampling = DriftSampling(),
+        duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+        residual_points_budget: int = DEFAULT_RESIDUAL_POINTS_BUDGET,
     ):
         self.spark_session = spark_session
         self.current = current
         self.reference = reference
+        self.quantile_accuracy = quantile_accuracy
+        self.categorical_accuracy = categorical_accuracy
+        self.duplicate_rows_mode = duplicate_rows_mode
+        self.drift_sampling = drift_sampling
+        self.residual_points_budget = residual_points_budget
 
     def calculate_model_quality(self) -> ModelQualityRegression:
+        # moments shared by metrics, residuals and regression line
+        statistics = ModelQualityRegressionCalculator.statistics(
+            self.current.model, self.current.current
+        )
         metrics = dict()
         metrics["global_metrics"] = ModelQualityRegressionCalculator.numerical_metrics(
             model=self.current.model,
             dataframe=self.current.current,
             dataframe_count=self.current.current_count,
+            statistics=statistics,
         ).model_dump(serialize_as_any=True)
         metrics["grouped_metrics"] = (
             self.calculate_regression_model_quality_group_by_timestamp()
         )
         metrics["global_metrics"]["residuals"] = (
             ModelQualityRegressionCalculator.residual_metrics(
-                model=self.current.model, dataframe=self.current.current
+                model=self.current.model,
+                dataframe=self.current.current,
+                points_budget=self.residual_points_budget,
+                statistics=statistics,
             )
         )
         return metrics
 
     def calculate_regression_model_quality_group_by_timestamp(self):
-        if self.current.model.granularity == Granularity.WEEK:
-            dataset_with_group = self.current.current.select(
-                [
-                    self.current.model.outputs.prediction.name,
-                    self.current.model.target.name,
-                    F.date_format(
-                        F.to_timestamp(
-                            F.date_sub(
-                                F.next_day(
-                                    F.date_format(
-                                        self.current.model.timestamp.name,
-                                        create_time_format(
-                                            self.current.model.granularity
-                                        ),
-                                    ),
-                                    "sunday",
-                                ),
-                                7,
-                            )
-                        ),
-                        "yyyy-MM-dd HH:mm:ss",
-                    ).alias("time_group"),
-                ]
-            )
-        else:
-            dataset_with_group = self.current.current.select(
-                [
-                    self.current.model.outputs.prediction.name,
-                    self.current.model.target.name,
-                    F.date_format(
-                        F.to_timestamp(
-                            F.date_format(
-                                self.current.model.timestamp.name,
-                                create_time_format(self.current.model.granularity),
-                            )
-                        ),
-                        "yyyy-MM-dd HH:mm:ss",
-                    ).alias("time_group"),
-                ]
-            )
+        dataset_with_group = self.current.current.select(
+            [
+                self.current.model.outputs.prediction.name,
+                self.current.model.target.name,
+                time_group_column(
+                    self.current.model.timestamp.name, self.current.model.granularity
+                ),
+            ]
+        )
 
-        list_of_time_group = (
-            dataset_with_group.select("time_group")
-            .distinct()
-            .orderBy(F.col("time_group").asc())
-            .rdd.flatMap(lambda x: x)
-            .collect()
+        # one aggregation of the sufficient statistics of every group
+        metrics_by_group = ModelQualityRegressionCalculator.numerical_metrics_by_group(
+            self.current.model, dataset_with_group, "time_group"
+        )
+        return CurrentMetricsRegressionService.grouped_metrics_from_groups(
+            metrics_by_group
+        )
+
+    @staticmethod
+    def grouped_metrics_from_groups(
+        metrics_by_group: Dict[Optional[str], ModelQualityRegression],
+    ) -> Dict[str, List[Dict]]:
+        """The series of every regression metric, ordered by time group."""
+        list_of_time_group = sorted(
+            metrics_by_group.keys(), key=lambda x: (x is not None, x)
         )
-        array_of_groups = [
-            dataset_with_group.where(F.col("time_group") == x)
-            for x in list_of_time_group
-        ]
 
         return {
             metric_name.value: [
                 {
                     "timestamp": group,
-                    "value": ModelQualityRegressionCalculator.eval_model_quality_metric(
-                        self.current.model,
-                        group_dataset,
-                        group_dataset.count(),
-                        metric_name,
-                    ),
+                    "value": getattr(metrics_by_group[group], metric_name.value),
                 }
-                for group, group_dataset in zip(list_of_time_group, array_of_groups)
+                for group in list_of_time_group
             ]
             for metric_name in RegressionMetricType
         }
 
+    @cached_property
+    def scan(self) -> DatasetScan:
+        """The aggregation of the dataset shared by statistics and data quality."""
+        return DatasetScan(
+            self.current.model,
+            self.current.current,
+            self.current.current_count,
+            self.quantile_accuracy,
+        )
+
+    def calculate_statistics(self) -> Statistics:
+        return calculate_statistics_current(
+            self.current, self.scan, self.duplicate_rows_mode
+        )
+
     def calculate_data_quality_numerical(self) -> List[NumericalFeatureMetrics]:
         return DataQualityCalculator.calculate_combined_data_quality_numerical(
             model=self.current.model,
@@ -124,6 +135,9 @@ class CurrentMetricsRegressionService:
             current_count=self.current.current_count,
             reference_dataframe=self.reference.reference,
             spark_session=self.spark_session,
+            reference_profile=self.reference.profile,
+            quantile_accuracy=self.quantile_accuracy,
+            global_metrics=self.scan.numerical_metrics,
         )
 
     def calculate_data_quality_categorical(self) -> List[CategoricalFeatureMetrics]:
@@ -131,6 +145,9 @@ class CurrentMetricsRegressionService:
             model=self.current.model,
             dataframe=self.current.current,
             dataframe_count=self.current.current_count,
+            top_k=self.categorical_accuracy.top_k,
+            approximate_distinct=self.categorical_accuracy.approximate_distinct,
+            global_metrics=self.scan.categorical_metrics,
         )
 
     def calculate_target_metrics(self) -> NumericalTargetMetrics:
@@ -138,6 +155,7 @@ class CurrentMetricsRegressionService:
             target_column=self.current.model.target.name,
             dataframe=self.current.current,
             dataframe_count=self.current.current_count,
+            quantile_accuracy=self.quantile_accuracy,
         )
 
     def calculate_current_target_metrics(self) -> NumericalTargetMetrics:
@@ -147,6 +165,8 @@ class CurrentMetricsRegressionService:
             curr_count=self.current.current_count,
             ref_df=self.reference.reference,
             spark_session=self.spark_session,
+            reference_profile=self.reference.profile,
+            quantile_accuracy=self.quantile_accuracy,
         )
 
     def calculate_data_quality(
@@ -173,4 +193,5 @@ class CurrentMetricsRegressionService:
             spark_session=self.spark_session,
             reference_dataset=self.reference,
             current_dataset=self.current,
+            sampling=self.drift_sampling,
         )
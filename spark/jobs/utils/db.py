@@ -50,3 +50,42 @@ def write_to_db(
     ).option("driver", "org.postgresql.Driver").option("user", user).option(
         "password", password
     ).option("dbtable", f'"{postgres_schema}"."{table_name}"').mode("append").save()
+
+
+def upsert_metrics(record: Dict, table_name: str):
+    """
+    Updates the metrics of record["CURRENT_UUID"], inserting them the first time, so
+    that a current dataset keeps a single row of metrics.
+    """
+    columns = ["STATISTICS", "DATA_QUALITY", "MODEL_QUALITY", "DRIFT"]
+    with psycopg2.connect(
+        host=db_host,
+        dbname=db_name,
+        user=user,
+        password=password,
+        port=db_port,
+        options=f"-c search_path=dbo,{postgres_schema}",
+    ) as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                f"""
+                UPDATE {table_name}
+                SET {", ".join(f'"{c}" = %s' for c in columns)}
+                WHERE "CURRENT_UUID" = %s
+                """,
+                (*[record[c] for c in columns], record["CURRENT_UUID"]),
+            )
+            if cur.rowcount == 0:
+                cur.execute(
+                    f"""
+                    INSERT INTO {table_name}
+                    ("UUID", "CURRENT_UUID", {", ".join(f'"{c}"' for c in columns)})
+                    VALUES (%s, %s, {", ".join("%s" for _ in columns)})
+                    """,
+                    (
+                        record["UUID"],
+                        record["CURRENT_UUID"],
+                        *[record[c] for c in columns],
+                    ),
+                )
+            conn.commit()
@@ -1,8 +1,9 @@
+import math
 from enum import Enum
 from typing import Optional, List
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from pyspark.sql.types import (
     StringType,
     DoubleType,
@@ -17,6 +18,37 @@ class JobStatus(str, Enum):
     ERROR = "ERROR"
 
 
+class DatasetFormat(str, Enum):
+    CSV = "csv"
+    PARQUET = "parquet"
+    ORC = "orc"
+
+
+class CsvReadMode(str, Enum):
+    CAST = "CAST"
+    PERMISSIVE = "PERMISSIVE"
+    FAILFAST = "FAILFAST"
+
+
+class PersistencePolicy(str, Enum):
+    AUTO = "AUTO"
+    NONE = "NONE"
+    MEMORY_AND_DISK = "MEMORY_AND_DISK"
+    DISK_ONLY = "DISK_ONLY"
+    PARQUET = "PARQUET"
+
+
+class QuantileMode(str, Enum):
+    EXACT = "EXACT"
+    APPROXIMATE = "APPROXIMATE"
+
+
+class DuplicateRowsMode(str, Enum):
+    EXACT = "EXACT"
+    HASH = "HASH"
+    HASH_VERIFIED = "HASH_VERIFIED"
+
+
 class SupportedTypes(str, Enum):
     string = "string"
     int = "int"
@@ -50,6 +82,62 @@ class Granularity(str, Enum):
     MONTH = "MONTH"
 
 
+# relative error of the default accuracy of percentile_approx
+DEFAULT_QUANTILE_RELATIVE_ERROR = 0.0001
+
+# points of the residual scatter plots of regression models
+DEFAULT_RESIDUAL_POINTS_BUDGET = 10_000
+
+# categories of every categorical feature in the data quality
+DEFAULT_CATEGORIES_TOP_K = 10_000
+
+
+class QuantileAccuracy(BaseModel):
+    """
+    Accuracy of the median and quartiles of the data quality. EXACT sorts all the values
+    of every feature, APPROXIMATE uses percentile_approx, in bounded memory, with a rank
+    error of at most relative_error times the number of values.
+    """
+
+    mode: QuantileMode = QuantileMode.EXACT
+    relative_error: float = Field(default=DEFAULT_QUANTILE_RELATIVE_ERROR, gt=0, le=1)
+
+    @property
+    def accuracy(self) -> int:
+        """The accuracy parameter of percentile_approx, 1 / relative_error."""
+        return math.ceil(1 / self.relative_error)
+
+    @property
+    def error_bound(self) -> Optional[float]:
+        """The relative error of the quantiles, None when they are exact."""
+        return self.relative_error if self.mode == QuantileMode.APPROXIMATE else None
+
+
+class CategoricalAccuracy(BaseModel):
+    """
+    Accuracy of the categorical features of the data quality. Only the top_k most
+    frequent categories of every feature are kept, the remaining ones are summed in a
+    category without name. With approximate_distinct distinct values are counted with
+    HyperLogLog, otherwise they are exact, from the count of all the categories.
+    """
+
+    top_k: int = Field(default=DEFAULT_CATEGORIES_TOP_K, gt=0)
+    approximate_distinct: bool = False
+
+
+class DriftSampling(BaseModel):
+    """
+    Opt-in sampling of the datasets of the drift. Datasets larger than the sample size
+    needed to detect a KS distance of min_detectable_distance with the given power are
+    sampled, optionally keeping a share of every time group.
+    """
+
+    enabled: bool = False
+    min_detectable_distance: float = Field(default=0.01, gt=0, le=1)
+    power: float = Field(default=0.8, gt=0, lt=1)
+    stratify_by_time_group: bool = False
+
+
 class ColumnDefinition(BaseModel):
     name: str
     type: SupportedTypes
@@ -0,0 +1,150 @@
+import json
+import logging
+import tempfile
+import urllib.request
+import uuid
+from typing import Optional, Set, Tuple
+
+from pyspark import StorageLevel
+from pyspark.sql import DataFrame, SparkSession
+
+from utils.misc import rbit_prefix
+from utils.models import DatasetFormat, PersistencePolicy
+
+# thresholds on the size of the source files used by PersistencePolicy.AUTO
+MEMORY_AND_DISK_MAX_BYTES = 2 * 1024**3
+DISK_ONLY_MAX_BYTES = 20 * 1024**3
+
+# Spark conf with a directory readable by driver and executors, as an S3 prefix, where
+# PersistencePolicy.PARQUET spills the datasets
+SPILL_DIR_CONF = "spark.radicalbit.spillDir"
+
+
+def source_size_bytes(spark_session: SparkSession, path: str) -> Optional[int]:
+    """Returns the total size of the files under path, None if it cannot be read."""
+    try:
+        jvm = spark_session.sparkContext._jvm
+        hadoop_path = jvm.org.apache.hadoop.fs.Path(path)
+        file_system = hadoop_path.getFileSystem(
+            spark_session.sparkContext._jsc.hadoopConfiguration()
+        )
+        return file_system.getContentSummary(hadoop_path).getLength()
+    except Exception as e:
+        logging.warning("Cannot get the size of %s: %s", path, e)
+        return None
+
+
+def shared_spill_dir(spark_session: SparkSession) -> Optional[str]:
+    """
+    Returns the directory where datasets are spilled as Parquet files: SPILL_DIR_CONF or
+    the checkpoint directory if set, spark.local.dir only with a local master, where
+    driver and executors share the file system. None otherwise, because the local dirs
+    of the executors are not readable by the driver.
+    """
+    spark_context = spark_session.sparkContext
+    conf = spark_context.getConf()
+    spill_dir = conf.get(SPILL_DIR_CONF, None) or spark_context.getCheckpointDir()
+    if spill_dir:
+        return spill_dir.rstrip("/")
+    if spark_context.master.startswith("local"):
+        # spark.local.dir can be a comma separated list of directories
+        local_dir = conf.get("spark.local.dir", tempfile.gettempdir()).split(",")[0]
+        return f"file://{local_dir}"
+    return None
+
+
+def resolve_persistence_policy(
+    policy: PersistencePolicy, size_bytes: Optional[int], spill_dir: Optional[str]
+) -> PersistencePolicy:
+    """
+    Resolves PersistencePolicy.AUTO from the size of the source files: small datasets are
+    kept in memory, bigger ones on the executors disks and the biggest ones are spilled to
+    Parquet files under spill_dir, that are columnar and cheaper to read back than the
+    CSV source. Without a shared spill_dir the biggest datasets stay on the executors
+    disks. Other policies are returned as they are.
+    """
+    if policy != PersistencePolicy.AUTO:
+        return policy
+    if size_bytes is None or size_bytes <= MEMORY_AND_DISK_MAX_BYTES:
+        return PersistencePolicy.MEMORY_AND_DISK
+    if size_bytes <= DISK_ONLY_MAX_BYTES or spill_dir is None:
+        return PersistencePolicy.DISK_ONLY
+    return PersistencePolicy.PARQUET
+
+
+def persist_dataframe(
+    dataframe: DataFrame, policy: PersistencePolicy
+) -> Tuple[DataFrame, Optional[str]]:
+    """
+    Persists the dataframe with the given policy, so that the source files are parsed
+    and cast once and not by every metric family.
+    PersistencePolicy.PARQUET writes the dataframe under shared_spill_dir and reads it
+    back, the path is returned to be removed by release_dataframe. Without a shared spill
+    directory it falls back to DISK_ONLY.
+    Persistence is lazy, it happens with the first action on the returned dataframe.
+
+    Returns:
+    - Tuple[DataFrame, Optional[str]]: the persisted dataframe and the Parquet spill path.
+    """
+    match policy:
+        case PersistencePolicy.MEMORY_AND_DISK:
+            return dataframe.persist(StorageLevel.MEMORY_AND_DISK), None
+        case PersistencePolicy.DISK_ONLY:
+            return dataframe.persist(StorageLevel.DISK_ONLY), None
+        case PersistencePolicy.PARQUET:
+            spark_session = dataframe.sparkSession
+            spill_dir = shared_spill_dir(spark_session)
+            if spill_dir is None:
+                logging.warning(
+                    "No shared spill directory, set %s: dataset persisted on disk",
+                    SPILL_DIR_CONF,
+                )
+                return dataframe.persist(StorageLevel.DISK_ONLY), None
+            spill_path = f"{spill_dir}/{rbit_prefix}_spill_{uuid.uuid4()}"
+            dataframe.write.parquet(spill_path)
+            return spark_session.read.parquet(spill_path), spill_path
+        case _:
+            return dataframe, None
+
+
+def release_dataframe(dataframe: DataFrame, spill_path: Optional[str]) -> None:
+    """Unpersists the dataframe and removes the Parquet spill files, if any."""
+    dataframe.unpersist()
+    if spill_path is not None:
+        spark_context = dataframe.sparkSession.sparkContext
+        hadoop_path = spark_context._jvm.org.apache.hadoop.fs.Path(spill_path)
+        hadoop_path.getFileSystem(spark_context._jsc.hadoopConfiguration()).delete(
+            hadoop_path, True
+        )
+
+
+def count_source_reads(
+    spark_session: SparkSession, source_formats: Set[DatasetFormat]
+) -> Optional[int]:
+    """
+    Counts the SQL executions of the application that scanned files of source_formats,
+    from the Spark UI REST API. Reads served by persisted data are not counted.
+    Returns None if the Spark UI is not available.
+    """
+    spark_context = spark_session.sparkContext
+    if spark_context.uiWebUrl is None:
+        return None
+    url = (
+        f"{spark_context.uiWebUrl}/api/v1/applications/{spark_context.applicationId}"
+        f"/sql?details=true&planDescription=false&length={2**31 - 1}"
+    )
+    try:
+        with urllib.request.urlopen(url, timeout=10) as response:
+            executions = json.load(response)
+    except (OSError, ValueError) as e:
+        logging.warning("Cannot read the SQL executions from the Spark UI: %s", e)
+        return None
+    return sum(
+        1
+        for execution in executions
+        if any(
+            node["nodeName"].lower().startswith(f"scan {source_format.value}")
+            for node in execution.get("nodes", [])
+            for source_format in source_formats
+        )
+    )
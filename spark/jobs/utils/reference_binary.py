@@ -1,15 +1,16 @@
+from functools import cached_property
 from typing import List
 
-from pyspark.sql import DataFrame
+from pyspark.sql import DataFrame, Row
 from pyspark.ml.evaluation import (
     BinaryClassificationEvaluator,
     MulticlassClassificationEvaluator,
 )
-from pyspark.mllib.evaluation import MulticlassMetrics
-from pyspark.sql.types import DoubleType
-import pyspark.sql.functions as F
 
 from metrics.data_quality_calculator import DataQualityCalculator
+from metrics.dataset_scan import DatasetScan
+from metrics.statistics import calculate_statistics_reference
+from metrics.model_quality_binary_calculator import ModelQualityBinaryCalculator
 from models.data_quality import (
     NumericalFeatureMetrics,
     CategoricalFeatureMetrics,
@@ -17,8 +18,9 @@ from models.data_quality import (
     BinaryClassDataQuality,
 )
 from models.reference_dataset import ReferenceDataset
+from models.statistics import Statistics
+from utils.models import CategoricalAccuracy, DuplicateRowsMode, QuantileAccuracy
 from .spark import is_not_null
-from .misc import rbit_prefix
 
 
 class ReferenceMetricsService:
@@ -43,8 +45,17 @@ class ReferenceMetricsService:
         "fMeasureByLabel": "f_measure",
     }
 
-    def __init__(self, reference: ReferenceDataset):
+    def __init__(
+        self,
+        reference: ReferenceDataset,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
+        categorical_accuracy: CategoricalAccuracy = CategoricalAccuracy(),
+        duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+    ):
         self.reference = reference
+        self.quantile_accuracy = quantile_accuracy
+        self.categorical_accuracy = categorical_accuracy
+        self.duplicate_rows_mode = duplicate_rows_mode
 
     def __evaluate_binary_classification(
         self, dataset: DataFrame, metric_name: str
@@ -111,102 +122,49 @@ class ReferenceMetricsService:
 
     # FIXME use pydantic struct like data quality
     def calculate_confusion_matrix(self) -> dict[str, float]:
-        prediction_and_label = (
-            self.reference.reference.filter(
-                is_not_null(self.reference.model.outputs.prediction.name)
-                & is_not_null(self.reference.model.target.name)
-            )
-            .select(
-                [
-                    self.reference.model.outputs.prediction.name,
-                    self.reference.model.target.name,
-                ]
-            )
-            .withColumn(
-                self.reference.model.target.name,
-                F.col(self.reference.model.target.name),
-            )
-            .orderBy(self.reference.model.target.name)
+        return ModelQualityBinaryCalculator.confusion_matrix(
+            model=self.reference.model, counts=self.label_prediction_counts
         )
 
-        tp = prediction_and_label.filter(
-            (F.col(self.reference.model.outputs.prediction.name) == 1)
-            & (F.col(self.reference.model.target.name) == 1)
-        ).count()
-        tn = prediction_and_label.filter(
-            (F.col(self.reference.model.outputs.prediction.name) == 0)
-            & (F.col(self.reference.model.target.name) == 0)
-        ).count()
-        fp = prediction_and_label.filter(
-            (F.col(self.reference.model.outputs.prediction.name) == 1)
-            & (F.col(self.reference.model.target.name) == 0)
-        ).count()
-        fn = prediction_and_label.filter(
-            (F.col(self.reference.model.outputs.prediction.name) == 0)
-            & (F.col(self.reference.model.target.name) == 1)
-        ).count()
-
+    def __calculate_log_loss(self) -> dict[str, float]:
         return {
-            "true_positive_count": tp,
-            "false_positive_count": fp,
-            "true_negative_count": tn,
-            "false_negative_count": fn,
+            "log_loss": ModelQualityBinaryCalculator.log_loss(
+                self.reference.model, self.reference.reference
+            )
         }
 
-    def __calculate_log_loss(self) -> dict[str, float]:
-        dataset_with_proba = (
-            self.reference.reference.filter(
-                is_not_null(self.reference.model.outputs.prediction.name)
-                & is_not_null(self.reference.model.target.name)
-                & is_not_null(self.reference.model.outputs.prediction_proba.name)
-            )
-            .withColumn(
-                f"{rbit_prefix}_prediction_proba_class0",
-                F.when(
-                    F.col(self.reference.model.outputs.prediction.name) == 0,
-                    F.col(self.reference.model.outputs.prediction_proba.name),
-                ).otherwise(
-                    1 - F.col(self.reference.model.outputs.prediction_proba.name)
-                ),
-            )
-            .withColumn(
-                f"{rbit_prefix}_prediction_proba_class1",
-                F.when(
-                    F.col(self.reference.model.outputs.prediction.name) == 1,
-                    F.col(self.reference.model.outputs.prediction_proba.name),
-                ).otherwise(
-                    1 - F.col(self.reference.model.outputs.prediction_proba.name)
-                ),
-            )
-            .withColumn(f"{rbit_prefix}_weight_logloss_def", F.lit(1.0))
-            .withColumn(
-                self.reference.model.outputs.prediction.name,
-                F.col(self.reference.model.outputs.prediction.name).cast(DoubleType()),
-            )
-            .withColumn(
-                self.reference.model.target.name,
-                F.col(self.reference.model.target.name).cast(DoubleType()),
-            )
+    @cached_property
+    def label_prediction_counts(self) -> List[Row]:
+        """
+        The target and prediction pairs counts, shared by class metrics and confusion
+        matrix. Lazy, so that statistics and drift alone do not run its aggregation.
+        """
+        return ModelQualityBinaryCalculator.label_prediction_counts(
+            model=self.reference.model, dataframe=self.reference.reference
         )
 
-        dataset_proba_vector = dataset_with_proba.select(
-            self.reference.model.outputs.prediction.name,
-            self.reference.model.target.name,
-            f"{rbit_prefix}_weight_logloss_def",
-            F.array(
-                F.col(f"{rbit_prefix}_prediction_proba_class0"),
-                F.col(f"{rbit_prefix}_prediction_proba_class1"),
-            ).alias(f"{rbit_prefix}_prediction_proba_vector"),
-        ).rdd
+    @cached_property
+    def scan(self) -> DatasetScan:
+        """The aggregation of the dataset shared by statistics and data quality."""
+        return DatasetScan(
+            self.reference.model,
+            self.reference.reference,
+            self.reference.reference_count,
+            self.quantile_accuracy,
+        )
 
-        metrics = MulticlassMetrics(dataset_proba_vector)
-        return {"log_loss": metrics.logLoss()}
+    def calculate_statistics(self) -> Statistics:
+        return calculate_statistics_reference(
+            self.reference, self.scan, self.duplicate_rows_mode
+        )
 
     def calculate_data_quality_numerical(self) -> List[NumericalFeatureMetrics]:
         return DataQualityCalculator.numerical_metrics(
             model=self.reference.model,
             dataframe=self.reference.reference,
             dataframe_count=self.reference.reference_count,
+            quantile_accuracy=self.quantile_accuracy,
+            global_metrics=self.scan.numerical_metrics,
         )
 
     def calculate_data_quality_categorical(self) -> List[CategoricalFeatureMetrics]:
@@ -214,12 +172,15 @@ class ReferenceMetricsService:
             model=self.reference.model,
             dataframe=self.reference.reference,
             dataframe_count=self.reference.reference_count,
+            top_k=self.categorical_accuracy.top_k,
+            approximate_distinct=self.categorical_accuracy.approximate_distinct,
+            global_metrics=self.scan.categorical_metrics,
         )
 
     def calculate_class_metrics(self, column) -> List[ClassMetrics]:
-        metrics = DataQualityCalculator.class_metrics(
+        metrics = ModelQualityBinaryCalculator.class_metrics(
             class_column=column,
-            dataframe=self.reference.reference,
+            counts=self.label_prediction_counts,
             dataframe_count=self.reference.reference_count,
         )
 
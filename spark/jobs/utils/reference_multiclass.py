@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import List, Dict
 
 from pyspark.ml.evaluation import MulticlassClassificationEvaluator
@@ -6,7 +7,11 @@ from pyspark.sql import DataFrame
 import pyspark.sql.functions as f
 
 from metrics.data_quality_calculator import DataQualityCalculator
+from metrics.dataset_scan import DatasetScan
+from metrics.statistics import calculate_statistics_reference
 from models.reference_dataset import ReferenceDataset
+from models.statistics import Statistics
+from utils.models import CategoricalAccuracy, DuplicateRowsMode, QuantileAccuracy
 from models.data_quality import (
     NumericalFeatureMetrics,
     CategoricalFeatureMetrics,
@@ -17,8 +22,17 @@ from utils.misc import rbit_prefix
 
 
 class ReferenceMetricsMulticlassService:
-    def __init__(self, reference: ReferenceDataset):
+    def __init__(
+        self,
+        reference: ReferenceDataset,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
+        categorical_accuracy: CategoricalAccuracy = CategoricalAccuracy(),
+        duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+    ):
         self.reference = reference
+        self.quantile_accuracy = quantile_accuracy
+        self.categorical_accuracy = categorical_accuracy
+        self.duplicate_rows_mode = duplicate_rows_mode
         index_label_map, indexed_reference = reference.get_string_indexed_dataframe()
         self.index_label_map = index_label_map
         self.indexed_reference = indexed_reference
@@ -131,11 +145,28 @@ class ReferenceMetricsMulticlassService:
 
         return metrics
 
+    @cached_property
+    def scan(self) -> DatasetScan:
+        """The aggregation of the dataset shared by statistics and data quality."""
+        return DatasetScan(
+            self.reference.model,
+            self.reference.reference,
+            self.reference.reference_count,
+            self.quantile_accuracy,
+        )
+
+    def calculate_statistics(self) -> Statistics:
+        return calculate_statistics_reference(
+            self.reference, self.scan, self.duplicate_rows_mode
+        )
+
     def calculate_data_quality_numerical(self) -> List[NumericalFeatureMetrics]:
         return DataQualityCalculator.numerical_metrics(
             model=self.reference.model,
             dataframe=self.reference.reference,
             dataframe_count=self.reference.reference_count,
+            quantile_accuracy=self.quantile_accuracy,
+            global_metrics=self.scan.numerical_metrics,
         )
 
     def calculate_data_quality_categorical(self) -> List[CategoricalFeatureMetrics]:
@@ -143,6 +174,9 @@ class ReferenceMetricsMulticlassService:
             model=self.reference.model,
             dataframe=self.reference.reference,
             dataframe_count=self.reference.reference_count,
+            top_k=self.categorical_accuracy.top_k,
+            approximate_distinct=self.categorical_accuracy.approximate_distinct,
+            global_metrics=self.scan.categorical_metrics,
         )
 
     def calculate_class_metrics(self, column) -> List[ClassMetrics]:
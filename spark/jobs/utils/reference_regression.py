@@ -1,6 +1,14 @@
+from functools import cached_property
 from typing import List
 from models.regression_model_quality import ModelQualityRegression
 from models.reference_dataset import ReferenceDataset
+from models.statistics import Statistics
+from utils.models import (
+    DEFAULT_RESIDUAL_POINTS_BUDGET,
+    CategoricalAccuracy,
+    DuplicateRowsMode,
+    QuantileAccuracy,
+)
 from metrics.model_quality_regression_calculator import ModelQualityRegressionCalculator
 from models.data_quality import (
     CategoricalFeatureMetrics,
@@ -9,31 +17,68 @@ from models.data_quality import (
     RegressionDataQuality,
 )
 from metrics.data_quality_calculator import DataQualityCalculator
+from metrics.dataset_scan import DatasetScan
+from metrics.statistics import calculate_statistics_reference
 
 
 class ReferenceMetricsRegressionService:
-    def __init__(self, reference: ReferenceDataset):
+    def __init__(
+        self,
+        reference: ReferenceDataset,
+        quantile_accuracy: QuantileAccuracy = QuantileAccuracy(),
+        categorical_accuracy: CategoricalAccuracy = CategoricalAccuracy(),
+        duplicate_rows_mode: DuplicateRowsMode = DuplicateRowsMode.EXACT,
+        residual_points_budget: int = DEFAULT_RESIDUAL_POINTS_BUDGET,
+    ):
         self.reference = reference
+        self.quantile_accuracy = quantile_accuracy
+        self.categorical_accuracy = categorical_accuracy
+        self.duplicate_rows_mode = duplicate_rows_mode
+        self.residual_points_budget = residual_points_budget
 
     def calculate_model_quality(self) -> ModelQualityRegression:
+        # moments shared by metrics, residuals and regression line
+        statistics = ModelQualityRegressionCalculator.statistics(
+            self.reference.model, self.reference.reference
+        )
         metrics = ModelQualityRegressionCalculator.numerical_metrics(
             model=self.reference.model,
             dataframe=self.reference.reference,
             dataframe_count=self.reference.reference_count,
+            statistics=statistics,
         ).dict()
 
         metrics["residuals"] = ModelQualityRegressionCalculator.residual_metrics(
             model=self.reference.model,
             dataframe=self.reference.reference,
+            points_budget=self.residual_points_budget,
+            statistics=statistics,
         )
 
         return metrics
 
+    @cached_property
+    def scan(self) -> DatasetScan:
+        """The aggregation of the dataset shared by statistics and data quality."""
+        return DatasetScan(
+            self.reference.model,
+            self.reference.reference,
+            self.reference.reference_count,
+            self.quantile_accuracy,
+        )
+
+    def calculate_statistics(self) -> Statistics:
+        return calculate_statistics_reference(
+            self.reference, self.scan, self.duplicate_rows_mode
+        )
+
     def calculate_data_quality_numerical(self) -> List[NumericalFeatureMetrics]:
         return DataQualityCalculator.numerical_metrics(
             model=self.reference.model,
             dataframe=self.reference.reference,
             dataframe_count=self.reference.reference_count,
+            quantile_accuracy=self.quantile_accuracy,
+            global_metrics=self.scan.numerical_metrics,
         )
 
     def calculate_data_quality_categorical(self) -> List[CategoricalFeatureMetrics]:
@@ -41,6 +86,9 @@ class ReferenceMetricsRegressionService:
             model=self.reference.model,
             dataframe=self.reference.reference,
             dataframe_count=self.reference.reference_count,
+            top_k=self.categorical_accuracy.top_k,
+            approximate_distinct=self.categorical_accuracy.approximate_distinct,
+            global_metrics=self.scan.categorical_metrics,
         )
 
     def calculate_target_metrics(self) -> NumericalTargetMetrics:
@@ -48,6 +96,7 @@ class ReferenceMetricsRegressionService:
             target_column=self.reference.model.target.name,
             dataframe=self.reference.reference,
             dataframe_count=self.reference.reference_count,
+            quantile_accuracy=self.quantile_accuracy,
         )
 
     def calculate_data_quality(self) -> RegressionDataQuality:
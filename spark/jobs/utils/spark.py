@@ -1,10 +1,141 @@
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional
+
 import pyspark.sql.functions as F
+from pyspark.sql import Column, DataFrame, SparkSession
+from pyspark.errors import AnalysisException
+from pyspark.sql.types import (
+    DataType,
+    DoubleType,
+    StringType,
+    StructField,
+    StructType,
+)
+
+from utils.misc import create_time_format, rbit_prefix
+from utils.models import CsvReadMode, DatasetFormat, Granularity
 
 
 def apply_schema_to_dataframe(df, schema):
-    for field in schema.fields:
-        df = df.withColumn(field.name, F.col(field.name).cast(field.dataType))
-    return df
+    # a single projection, a withColumn per field grows the plan with the number of fields
+    fields = {field.name: field for field in schema.fields}
+    return df.select(
+        *[
+            F.col(c).cast(fields[c].dataType).alias(c) if c in fields else F.col(c)
+            for c in df.columns
+        ]
+    )
+
+
+corrupt_record_column = f"{rbit_prefix}_corrupt_record"
+
+
+def read_dataset(
+    spark_session: SparkSession,
+    path: str,
+    dataset_format: DatasetFormat,
+    schema: StructType,
+    csv_read_mode: CsvReadMode = CsvReadMode.CAST,
+) -> DataFrame:
+    """
+    Reads a dataset in the given format, selecting only the schema columns that are in the
+    file. With columnar formats the other columns are never read from storage.
+
+    CSV files are read as strings and cast afterwards with CsvReadMode.CAST. With
+    PERMISSIVE and FAILFAST the schema is passed to the reader, so that values are parsed
+    to their types while reading: malformed values are set to null, with the whole line
+    in the corrupt_record_column (PERMISSIVE), or fail the job (FAILFAST).
+    """
+    match dataset_format, csv_read_mode:
+        case DatasetFormat.CSV, CsvReadMode.CAST:
+            dataframe = spark_session.read.csv(path, header=True)
+        case DatasetFormat.CSV, _:
+            # the schema is positional, it is built in the order of the header
+            header = spark_session.read.csv(path, header=True).columns
+            fields = {field.name: field for field in schema.fields}
+            read_schema = StructType(
+                [fields.get(c, StructField(c, StringType())) for c in header]
+            )
+            if csv_read_mode == CsvReadMode.PERMISSIVE:
+                read_schema.add(StructField(corrupt_record_column, StringType()))
+            dataframe = spark_session.read.csv(
+                path,
+                header=True,
+                schema=read_schema,
+                mode=csv_read_mode.value,
+                columnNameOfCorruptRecord=corrupt_record_column,
+            )
+        case _:
+            dataframe = spark_session.read.format(dataset_format.value).load(path)
+    return dataframe.select(
+        *[c for c in schema.names + [corrupt_record_column] if c in dataframe.columns]
+    )
+
+
+def read_dataset_stream(
+    spark_session: SparkSession,
+    path: str,
+    dataset_format: DatasetFormat,
+    schema: StructType,
+    csv_read_mode: CsvReadMode = CsvReadMode.CAST,
+    max_files_per_trigger: Optional[int] = None,
+) -> DataFrame:
+    """
+    Same as read_dataset for the files that arrive in a directory, as a streaming
+    dataframe. The file source needs the schema upfront: CSV columns are taken in the
+    order of the header of the files already in the directory, or of the schema if it is
+    empty, and files with another header fail the query instead of being read with
+    shifted columns.
+    """
+    reader = spark_session.readStream.format(dataset_format.value)
+    if max_files_per_trigger is not None:
+        reader = reader.option("maxFilesPerTrigger", max_files_per_trigger)
+    try:
+        existing = spark_session.read.load(
+            path, format=dataset_format.value, header=True
+        )
+    except AnalysisException:
+        existing = None
+    match dataset_format:
+        case DatasetFormat.CSV:
+            fields = {field.name: field for field in schema.fields}
+            read_schema = StructType(
+                [
+                    StructField(c, StringType())
+                    if csv_read_mode == CsvReadMode.CAST
+                    else fields.get(c, StructField(c, StringType()))
+                    for c in (schema.names if existing is None else existing.columns)
+                ]
+            )
+            options = {"header": True, "enforceSchema": False}
+            if csv_read_mode != CsvReadMode.CAST:
+                options["mode"] = csv_read_mode.value
+            if csv_read_mode == CsvReadMode.PERMISSIVE:
+                read_schema.add(StructField(corrupt_record_column, StringType()))
+                options["columnNameOfCorruptRecord"] = corrupt_record_column
+            dataframe = reader.schema(read_schema).options(**options).load(path)
+        case _:
+            # columns are cast to the schema types afterwards, as with read_dataset
+            dataframe = reader.schema(
+                schema if existing is None else existing.schema
+            ).load(path)
+    return dataframe.select(
+        *[c for c in schema.names + [corrupt_record_column] if c in dataframe.columns]
+    )
+
+
+def count_corrupt_records(dataframe: DataFrame) -> int:
+    """
+    Counts the lines of a dataset read with CsvReadMode.PERMISSIVE that had malformed
+    values. Another column is aggregated because Spark refuses to scan a CSV file for the
+    corrupt record column only.
+    """
+    if corrupt_record_column not in dataframe.columns:
+        return 0
+    return dataframe.agg(
+        F.count(F.col(corrupt_record_column)),
+        F.count(F.col(dataframe.columns[0])),
+    ).collect()[0][0]
 
 
 def check_not_null(x):
@@ -13,3 +144,133 @@ def check_not_null(x):
 
 def is_not_null(x):
     return F.col(x).isNotNull() & ~F.isnan(x)
+
+
+def unpivot_columns(
+    df: DataFrame, columns: List[str], value_type: DataType, **literals
+) -> DataFrame:
+    """
+    Unpivots the given columns in a long format dataframe with a (feature, value) row for
+    every row and column, where value is cast to value_type.
+    Additional keyword arguments are added as constant columns.
+    """
+    return df.select(
+        F.explode(
+            F.array(
+                *[
+                    F.struct(
+                        F.lit(column).alias("feature"),
+                        F.col(column).cast(value_type).alias("value"),
+                        *[F.lit(v).alias(k) for k, v in literals.items()],
+                    )
+                    for column in columns
+                ]
+            )
+        ).alias(f"{rbit_prefix}_unpivot")
+    ).select(f"{rbit_prefix}_unpivot.*")
+
+
+def time_group_column(timestamp: str, granularity: Granularity):
+    """
+    Truncates the timestamp column to the model granularity, weeks start on sunday.
+    The result is formatted as yyyy-MM-dd HH:mm:ss and aliased as time_group.
+    """
+    if granularity == Granularity.WEEK:
+        truncated = F.date_sub(
+            F.next_day(
+                F.date_format(timestamp, create_time_format(granularity)),
+                "sunday",
+            ),
+            7,
+        )
+    else:
+        truncated = F.date_format(timestamp, create_time_format(granularity))
+    return F.date_format(F.to_timestamp(truncated), "yyyy-MM-dd HH:mm:ss").alias(
+        "time_group"
+    )
+
+
+def split_bucket(splits: Column, value: Column) -> Column:
+    """
+    Returns the bucket of value with the same rules of Bucketizer, where splits[i] <= x <
+    splits[i + 1] and the last bucket is closed. Value must be between the first and the
+    last split and not NaN.
+    """
+    return F.least(
+        F.size(F.filter(splits, lambda x: x <= value)) - 1, F.size(splits) - 2
+    )
+
+
+def split_bucket_of(splits: List[float], value: float) -> int:
+    """Same as split_bucket for a value on the driver."""
+    return min(bisect_right(splits, value) - 1, len(splits) - 2)
+
+
+def read_text_file(spark_session: SparkSession, path: str) -> Optional[str]:
+    """Reads a whole text file with the Hadoop filesystem, None if it does not exist."""
+    spark_context = spark_session.sparkContext
+    hadoop_path = spark_context._jvm.org.apache.hadoop.fs.Path(path)
+    file_system = hadoop_path.getFileSystem(spark_context._jsc.hadoopConfiguration())
+    if not file_system.exists(hadoop_path):
+        return None
+    return spark_session.read.text(path, wholetext=True).collect()[0][0]
+
+
+def write_text_file(spark_session: SparkSession, path: str, text: str) -> None:
+    """Writes a single text file with the Hadoop filesystem, overwriting it."""
+    spark_context = spark_session.sparkContext
+    hadoop_path = spark_context._jvm.org.apache.hadoop.fs.Path(path)
+    file_system = hadoop_path.getFileSystem(spark_context._jsc.hadoopConfiguration())
+    output_stream = file_system.create(hadoop_path, True)
+    try:
+        output_stream.write(bytearray(text.encode("utf-8")))
+    finally:
+        output_stream.close()
+
+
+def class_index_map(dataframe: DataFrame, columns: List[str]) -> Dict[Any, float]:
+    """
+    Collects the distinct non null values of the given columns with a single job and
+    maps them to their index in ascending order, as a 0-based double.
+    """
+    classes = (
+        dataframe.select(
+            F.explode(F.array(*[F.col(c) for c in columns])).alias("classes")
+        )
+        .dropna()
+        .distinct()
+        .collect()
+    )
+    return {
+        value: float(index)
+        for index, value in enumerate(sorted(row["classes"] for row in classes))
+    }
+
+
+def index_classes(
+    dataframe: DataFrame, columns: List[str], index_map: Dict[Any, float]
+) -> DataFrame:
+    """
+    Adds the index of every given column as f"{rbit_prefix}_{column}-idx" with a literal
+    map, so that the dataframe is not shuffled. Rows with a value that is not in the
+    map, or null, are dropped.
+    """
+    classes_map = F.create_map(
+        *[
+            item
+            for value, index in index_map.items()
+            for item in (F.lit(value), F.lit(index))
+        ]
+    )
+    indexed = dataframe.select(
+        "*",
+        *[
+            (
+                classes_map[F.col(column)]
+                if index_map
+                else F.lit(None).cast(DoubleType())
+            ).alias(f"{rbit_prefix}_{column}-idx")
+            for column in columns
+        ],
+    )
+    return indexed.dropna(subset=[f"{rbit_prefix}_{column}-idx" for column in columns])
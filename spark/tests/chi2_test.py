@@ -0,0 +1,123 @@
+import math
+
+import pytest
+from scipy.stats import chi2_contingency, chisquare
+
+from metrics.chi2 import Chi2Test
+from models.reference_profile import FeatureProfile, ReferenceProfile
+
+
+def test_independence(spark_fixture):
+    reference = spark_fixture.createDataFrame(
+        [("a",)] * 30 + [("b",)] * 20 + [("c",)] * 10 + [(None,)] * 5, ["cat"]
+    )
+    current = spark_fixture.createDataFrame(
+        [("a",)] * 10 + [("b",)] * 25 + [("c",)] * 15, ["cat"]
+    )
+    chi2 = Chi2Test(
+        spark_session=spark_fixture, reference_data=reference, current_data=current
+    )
+
+    result = chi2.test_independence("cat", "cat")
+    statistic, p_value, degrees_of_freedom, _ = chi2_contingency(
+        [[30, 20, 10], [10, 25, 15]], correction=False
+    )
+
+    assert sorted(chi2.contingency_table("cat", "cat").T.tolist()) == [
+        [10.0, 15.0],
+        [20.0, 25.0],
+        [30.0, 10.0],
+    ]
+    assert result["statistic"] == pytest.approx(statistic)
+    assert result["pValue"] == pytest.approx(p_value)
+    assert result["degreesOfFreedom"] == degrees_of_freedom == 2
+
+
+def test_independence_single_category(spark_fixture):
+    dataframe = spark_fixture.createDataFrame([("a",), ("a",)], ["cat"])
+    chi2 = Chi2Test(
+        spark_session=spark_fixture, reference_data=dataframe, current_data=dataframe
+    )
+
+    assert math.isnan(chi2.test_independence("cat", "cat")["pValue"])
+
+
+@pytest.fixture()
+def goodness_fit_data(spark_fixture):
+    reference = spark_fixture.createDataFrame(
+        [("a", "x")] * 30 + [("b", "y")] * 20 + [("c", "x")] * 10 + [(None, "y")] * 5,
+        ["cat1", "cat2"],
+    )
+    current = spark_fixture.createDataFrame(
+        [("a", "x")] * 10 + [("b", "x")] * 25 + [("c", "y")] * 15,
+        ["cat1", "cat2"],
+    )
+    yield reference, current
+
+
+def test_goodness_fit_batch(spark_fixture, goodness_fit_data):
+    reference, current = goodness_fit_data
+    chi2 = Chi2Test(
+        spark_session=spark_fixture, reference_data=reference, current_data=current
+    )
+
+    result = chi2.test_goodness_fit_batch(["cat1", "cat2"])
+
+    assert list(result) == ["cat1", "cat2"]
+    for feature, (reference_counts, current_counts) in {
+        "cat1": ([30, 20, 10], [10, 25, 15]),
+        "cat2": ([40, 25], [35, 15]),
+    }.items():
+        statistic, p_value = chisquare(
+            current_counts,
+            [x * sum(current_counts) / sum(reference_counts) for x in reference_counts],
+        )
+        assert result[feature]["statistic"] == pytest.approx(statistic)
+        assert result[feature]["pValue"] == pytest.approx(p_value)
+        # same result of the test of a single feature
+        assert result[feature] == pytest.approx(
+            chi2.test_goodness_fit(feature, feature)
+        )
+
+
+def test_goodness_fit_batch_category_not_in_reference(spark_fixture):
+    reference = spark_fixture.createDataFrame([("a",)] * 5 + [("b",)] * 5, ["cat"])
+    current = spark_fixture.createDataFrame(
+        [("a",)] * 5 + [("b",)] * 4 + [("c",)], ["cat"]
+    )
+    chi2 = Chi2Test(
+        spark_session=spark_fixture, reference_data=reference, current_data=current
+    )
+
+    result = chi2.test_goodness_fit_batch(["cat"])["cat"]
+
+    # the expected frequency of the new category is zero
+    assert result["statistic"] == math.inf
+    assert result["pValue"] == 0.0
+    assert result == chi2.test_goodness_fit("cat", "cat")
+
+
+def test_goodness_fit_batch_reference_profile(spark_fixture, goodness_fit_data):
+    reference, current = goodness_fit_data
+    profile = ReferenceProfile(
+        reference_count=65,
+        ks_phi=0.004,
+        features={
+            "cat1": FeatureProfile(categorical_values={"a": 30, "b": 20, "c": 10})
+        },
+    )
+    # cat1 is not read from the reference data, that has only cat2
+    chi2 = Chi2Test(
+        spark_session=spark_fixture,
+        reference_data=reference.select("cat2"),
+        current_data=current,
+        reference_profile=profile,
+    )
+    without_profile = Chi2Test(
+        spark_session=spark_fixture, reference_data=reference, current_data=current
+    )
+
+    result = chi2.test_goodness_fit_batch(["cat1", "cat2"])
+    expected = without_profile.test_goodness_fit_batch(["cat1", "cat2"])
+    for feature in ("cat1", "cat2"):
+        assert result[feature] == pytest.approx(expected[feature])
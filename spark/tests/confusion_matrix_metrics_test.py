@@ -0,0 +1,101 @@
+import math
+
+import pytest
+
+from metrics.confusion_matrix_metrics import ConfusionMatrixMetrics
+from metrics.model_quality_multiclass_calculator import (
+    ModelQualityMulticlassCalculator,
+)
+
+
+@pytest.fixture()
+def binary_metrics():
+    yield ConfusionMatrixMetrics(
+        {(1.0, 1.0): 5, (0.0, 1.0): 2, (0.0, 0.0): 4, (1.0, 0.0): 1}
+    )
+
+
+def test_global_metrics(binary_metrics):
+    precision = {0.0: 4 / 5, 1.0: 5 / 7}
+    recall = {0.0: 4 / 6, 1.0: 5 / 6}
+    f_measure = {
+        c: 2 * precision[c] * recall[c] / (precision[c] + recall[c]) for c in precision
+    }
+
+    assert binary_metrics.evaluate("accuracy") == pytest.approx(9 / 12)
+    assert binary_metrics.evaluate("weightedPrecision") == pytest.approx(
+        (precision[0.0] + precision[1.0]) / 2
+    )
+    assert binary_metrics.evaluate("weightedRecall") == pytest.approx(
+        (recall[0.0] + recall[1.0]) / 2
+    )
+    assert binary_metrics.evaluate("weightedFalsePositiveRate") == pytest.approx(
+        (1 / 6 + 2 / 6) / 2
+    )
+    assert binary_metrics.evaluate("f1") == pytest.approx(
+        (f_measure[0.0] + f_measure[1.0]) / 2
+    )
+
+
+def test_by_label_metrics(binary_metrics):
+    assert binary_metrics.evaluate("precisionByLabel", 1.0) == pytest.approx(5 / 7)
+    assert binary_metrics.evaluate("recallByLabel", 1.0) == pytest.approx(5 / 6)
+    assert binary_metrics.evaluate("truePositiveRateByLabel", 1.0) == pytest.approx(
+        5 / 6
+    )
+    assert binary_metrics.evaluate("falsePositiveRateByLabel", 1.0) == pytest.approx(
+        2 / 6
+    )
+    assert math.isnan(binary_metrics.evaluate("precisionByLabel", 2.0))
+
+
+def test_label_only_predicted():
+    metrics = ConfusionMatrixMetrics({(0.0, 0.0): 3, (0.0, 1.0): 1})
+
+    assert metrics.evaluate("accuracy") == pytest.approx(3 / 4)
+    assert math.isnan(metrics.evaluate("recallByLabel", 1.0))
+    assert metrics.evaluate("weightedPrecision") == pytest.approx(1.0)
+    assert metrics.confusion_matrix([0.0, 1.0]) == [[3.0, 1.0], [0.0, 0.0]]
+
+
+def test_label_confusion_matrix():
+    metrics = ConfusionMatrixMetrics(
+        {(0.0, 0.0): 3, (0.0, 2.0): 1, (1.0, 1.0): 2, (1.0, 2.0): 1}
+    )
+
+    # as MulticlassMetrics, classes only predicted are not in the matrix
+    assert ModelQualityMulticlassCalculator.label_confusion_matrix(metrics) == [
+        [3.0, 0.0],
+        [0.0, 2.0],
+    ]
+
+
+def test_confusion_metrics_by_group(spark_fixture):
+    dataframe = spark_fixture.createDataFrame(
+        [
+            ("a", 0.0, 0.0),
+            ("a", 1.0, 0.0),
+            ("a", 2.0, 2.0),
+            ("b", 1.0, 1.0),
+            ("b", 2.0, 1.0),
+            ("b", 2.0, 2.0),
+        ],
+        ["time_group", "label", "prediction"],
+    )
+
+    global_metrics, metrics_by_group = (
+        ModelQualityMulticlassCalculator.confusion_metrics_by_group(
+            dataframe, "label", "prediction", "time_group"
+        )
+    )
+
+    assert global_metrics.evaluate("accuracy") == pytest.approx(4 / 6)
+    assert global_metrics.confusion_matrix([0.0, 1.0, 2.0]) == [
+        [1.0, 0.0, 0.0],
+        [1.0, 1.0, 0.0],
+        [0.0, 1.0, 2.0],
+    ]
+    assert metrics_by_group["a"].evaluate("precisionByLabel", 0.0) == pytest.approx(
+        1 / 2
+    )
+    assert metrics_by_group["b"].evaluate("recallByLabel", 2.0) == pytest.approx(1 / 2)
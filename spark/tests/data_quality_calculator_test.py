@@ -0,0 +1,180 @@
+import datetime
+import uuid
+
+import pytest
+from pyspark.sql.types import DoubleType, IntegerType, StructField, StructType
+
+from metrics.data_quality_calculator import DataQualityCalculator
+from utils.models import (
+    ColumnDefinition,
+    DataType,
+    FieldTypes,
+    Granularity,
+    ModelOut,
+    ModelType,
+    OutputType,
+    QuantileAccuracy,
+    QuantileMode,
+    SupportedTypes,
+)
+
+
+@pytest.fixture()
+def numerical_dataframe(spark_fixture):
+    schema = StructType(
+        [
+            StructField("num_float", DoubleType(), True),
+            StructField("num_int", IntegerType(), True),
+            StructField("num_constant", DoubleType(), True),
+            StructField("num_empty", DoubleType(), True),
+        ]
+    )
+    data = [
+        (0.5, 1, 3.0, None),
+        (0.75, 5, 3.0, None),
+        (1.0, 11, 3.0, None),
+        (None, 21, None, None),
+        (float("nan"), 31, 3.0, None),
+        (2.3, 41, 3.0, None),
+        (3.0, 101, 3.0, None),
+        (1.1, None, 3.0, None),
+    ]
+    yield spark_fixture.createDataFrame(data, schema)
+
+
+def test_numerical_histograms_equal_to_rdd_histogram(numerical_dataframe):
+    columns = ["num_float", "num_int", "num_constant"]
+    histograms = DataQualityCalculator.numerical_histograms(
+        numerical_dataframe, columns
+    )
+
+    for column in columns:
+        buckets, values = (
+            numerical_dataframe.select(column).rdd.flatMap(lambda x: x).histogram(10)
+        )
+        assert histograms[column].buckets == pytest.approx(buckets)
+        assert histograms[column].reference_values == values
+
+
+def test_numerical_histograms_with_bounds(numerical_dataframe):
+    histograms = DataQualityCalculator.numerical_histograms(
+        numerical_dataframe,
+        ["num_int"],
+        bounds={"num_int": {"min": 1, "max": 101}},
+    )
+
+    assert histograms["num_int"].buckets == [
+        1.0,
+        11.0,
+        21.0,
+        31.0,
+        41.0,
+        51.0,
+        61.0,
+        71.0,
+        81.0,
+        91.0,
+        101.0,
+    ]
+    assert histograms["num_int"].reference_values == [2, 1, 1, 1, 1, 0, 0, 0, 0, 1]
+
+
+def test_numerical_histograms_empty_column(numerical_dataframe):
+    histograms = DataQualityCalculator.numerical_histograms(
+        numerical_dataframe, ["num_empty"]
+    )
+
+    assert histograms["num_empty"].buckets == []
+    assert histograms["num_empty"].reference_values == []
+
+
+@pytest.fixture()
+def categorical_model():
+    prediction = ColumnDefinition(
+        name="prediction", type=SupportedTypes.int, field_type=FieldTypes.numerical
+    )
+    yield ModelOut(
+        uuid=uuid.uuid4(),
+        name="model",
+        description="description",
+        model_type=ModelType.BINARY,
+        data_type=DataType.TABULAR,
+        timestamp=ColumnDefinition(
+            name="datetime",
+            type=SupportedTypes.datetime,
+            field_type=FieldTypes.datetime,
+        ),
+        granularity=Granularity.HOUR,
+        outputs=OutputType(prediction=prediction, output=[prediction]),
+        target=ColumnDefinition(
+            name="target", type=SupportedTypes.int, field_type=FieldTypes.numerical
+        ),
+        features=[
+            ColumnDefinition(
+                name=name,
+                type=SupportedTypes.string,
+                field_type=FieldTypes.categorical,
+            )
+            for name in ["cat1", "cat2"]
+        ],
+        frameworks="framework",
+        algorithm="algorithm",
+        created_at=str(datetime.datetime.now()),
+        updated_at=str(datetime.datetime.now()),
+    )
+
+
+def test_categorical_metrics_top_k(spark_fixture, categorical_model):
+    dataframe = spark_fixture.createDataFrame(
+        [("a", "x"), ("a", "x"), ("a", None), ("b", "y"), ("b", "x"), ("c", "z")],
+        ["cat1", "cat2"],
+    )
+
+    metrics = {
+        m.feature_name: m
+        for m in DataQualityCalculator.categorical_metrics(
+            categorical_model, dataframe, 6, top_k=2
+        )
+    }
+
+    assert metrics["cat1"].distinct_value == 3
+    assert [(c.name, c.count) for c in metrics["cat1"].category_frequency] == [
+        ("a", 3),
+        ("b", 2),
+        (None, 1),
+    ]
+    assert metrics["cat2"].distinct_value == 3
+    assert metrics["cat2"].missing_value.count == 1
+    assert [(c.name, c.count) for c in metrics["cat2"].category_frequency] == [
+        ("x", 3),
+        ("y", 1),
+        (None, 1),
+    ]
+    assert metrics["cat2"].category_frequency[0].frequency == pytest.approx(3 / 6)
+
+
+def test_regression_target_metrics_quantile_accuracy(spark_fixture):
+    dataframe = spark_fixture.createDataFrame(
+        [(float(i),) for i in range(1, 1001)], ["target"]
+    )
+
+    exact = DataQualityCalculator.regression_target_metrics(
+        "target", dataframe, 1000
+    ).median_metrics
+    approximate = DataQualityCalculator.regression_target_metrics(
+        "target",
+        dataframe,
+        1000,
+        QuantileAccuracy(mode=QuantileMode.APPROXIMATE, relative_error=0.01),
+    ).median_metrics
+
+    assert exact.median == 500.5
+    assert (exact.quantile_mode, exact.relative_error) == ("EXACT", None)
+    # the rank error is at most relative_error * count values
+    assert abs(approximate.median - exact.median) <= 10
+    assert abs(approximate.perc_25 - 250.0) <= 10
+    assert abs(approximate.perc_75 - 750.0) <= 10
+    assert (approximate.quantile_mode, approximate.relative_error) == (
+        "APPROXIMATE",
+        0.01,
+    )
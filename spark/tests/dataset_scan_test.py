@@ -0,0 +1,115 @@
+import datetime
+import uuid
+
+import pytest
+
+from metrics.data_quality_calculator import DataQualityCalculator
+from metrics.dataset_scan import DatasetScan
+from metrics.statistics import calculate_statistics_reference
+from models.reference_dataset import ReferenceDataset
+from utils.models import (
+    ColumnDefinition,
+    DataType,
+    FieldTypes,
+    Granularity,
+    ModelOut,
+    ModelType,
+    OutputType,
+    SupportedTypes,
+)
+
+
+@pytest.fixture()
+def model():
+    prediction = ColumnDefinition(
+        name="prediction", type=SupportedTypes.float, field_type=FieldTypes.numerical
+    )
+    yield ModelOut(
+        uuid=uuid.uuid4(),
+        name="model",
+        description="description",
+        model_type=ModelType.REGRESSION,
+        data_type=DataType.TABULAR,
+        timestamp=ColumnDefinition(
+            name="datetime",
+            type=SupportedTypes.datetime,
+            field_type=FieldTypes.datetime,
+        ),
+        granularity=Granularity.HOUR,
+        outputs=OutputType(prediction=prediction, output=[prediction]),
+        target=ColumnDefinition(
+            name="target", type=SupportedTypes.float, field_type=FieldTypes.numerical
+        ),
+        features=[
+            ColumnDefinition(
+                name="cat",
+                type=SupportedTypes.string,
+                field_type=FieldTypes.categorical,
+            ),
+            ColumnDefinition(
+                name="num", type=SupportedTypes.float, field_type=FieldTypes.numerical
+            ),
+        ],
+        frameworks="framework",
+        algorithm="algorithm",
+        created_at=str(datetime.datetime.now()),
+        updated_at=str(datetime.datetime.now()),
+    )
+
+
+def test_scan_shared_by_statistics_and_data_quality(spark_fixture, model):
+    raw_dataframe = spark_fixture.createDataFrame(
+        [
+            ("2024-01-01 00:00:00", "a", "1.0", "1.0", "1.0"),
+            ("2024-01-01 01:00:00", "a", "1.0", "1.0", "1.0"),
+            ("2024-01-01 02:00:00", None, "NaN", "2.0", "3.0"),
+            ("2024-01-01 03:00:00", "b", None, None, "4.0"),
+        ],
+        ["datetime", "cat", "num", "prediction", "target"],
+    )
+    reference_dataset = ReferenceDataset(model=model, raw_dataframe=raw_dataframe)
+
+    scan = DatasetScan(model, reference_dataset.reference, 4)
+    statistics = calculate_statistics_reference(reference_dataset, scan)
+
+    assert scan.missing_cells == {
+        "cat": 1,
+        "num": 2,
+        "target": 0,
+        "datetime": 0,
+        "prediction": 1,
+    }
+    assert scan.categorical_metrics == {
+        "cat": {"missing_values": 1, "missing_values_perc": 25.0}
+    }
+    assert statistics == calculate_statistics_reference(reference_dataset)
+    assert statistics.missing_cells == 4
+    assert statistics.duplicate_rows == 1
+    assert [
+        m.model_dump()
+        for m in DataQualityCalculator.numerical_metrics(
+            model,
+            reference_dataset.reference,
+            4,
+            global_metrics=scan.numerical_metrics,
+        )
+    ] == [
+        m.model_dump()
+        for m in DataQualityCalculator.numerical_metrics(
+            model, reference_dataset.reference, 4
+        )
+    ]
+    assert [
+        m.model_dump()
+        for m in DataQualityCalculator.categorical_metrics(
+            model,
+            reference_dataset.reference,
+            4,
+            global_metrics=scan.categorical_metrics,
+        )
+    ] == [
+        m.model_dump()
+        for m in DataQualityCalculator.categorical_metrics(
+            model, reference_dataset.reference, 4
+        )
+    ]
@@ -15,6 +15,7 @@ from jobs.utils.models import (
     SupportedTypes,
     FieldTypes,
     Granularity,
+    DriftSampling,
 )
 from metrics.drift_calculator import DriftCalculator
 import tests.results.drift_calculator_results as res
@@ -697,3 +698,87 @@ def test_drift_phone(spark_fixture, drift_dataset_phone):
         ignore_order=True,
         significant_digits=6,
     )
+
+
+def test_drift_sampling(spark_fixture):
+    prediction = ColumnDefinition(
+        name="prediction", type=SupportedTypes.float, field_type=FieldTypes.numerical
+    )
+    model = ModelOut(
+        uuid=uuid.uuid4(),
+        name="model",
+        description="description",
+        model_type=ModelType.REGRESSION,
+        data_type=DataType.TABULAR,
+        timestamp=ColumnDefinition(
+            name="datetime",
+            type=SupportedTypes.datetime,
+            field_type=FieldTypes.datetime,
+        ),
+        granularity=Granularity.HOUR,
+        outputs=OutputType(prediction=prediction, output=[prediction]),
+        target=ColumnDefinition(
+            name="target", type=SupportedTypes.float, field_type=FieldTypes.numerical
+        ),
+        features=[
+            ColumnDefinition(
+                name="num1", type=SupportedTypes.float, field_type=FieldTypes.numerical
+            ),
+            ColumnDefinition(
+                name="cat1",
+                type=SupportedTypes.string,
+                field_type=FieldTypes.categorical,
+            ),
+        ],
+        frameworks="framework",
+        algorithm="algorithm",
+        created_at=str(datetime.datetime.now()),
+        updated_at=str(datetime.datetime.now()),
+    )
+    # the second hour has only 100 rows
+    raw_dataframe = spark_fixture.createDataFrame(
+        [
+            (
+                f"2024-06-16 0{int(i >= 1900)}:00:00",
+                str(i % 100 / 10),
+                "ABC"[i % 3],
+                str(i % 4),
+                str(i % 4),
+            )
+            for i in range(2000)
+        ],
+        ["datetime", "num1", "cat1", "prediction", "target"],
+    )
+    current_dataset = CurrentDataset(model=model, raw_dataframe=raw_dataframe)
+    reference_dataset = ReferenceDataset(model=model, raw_dataframe=raw_dataframe)
+    sampling = DriftSampling(enabled=True, min_detectable_distance=0.15)
+
+    assert DriftCalculator.sample_size(sampling) == 526
+    drift = DriftCalculator.calculate_drift(
+        spark_session=spark_fixture,
+        current_dataset=current_dataset,
+        reference_dataset=reference_dataset,
+        sampling=sampling,
+    )
+    stratified_drift = DriftCalculator.calculate_drift(
+        spark_session=spark_fixture,
+        current_dataset=current_dataset,
+        reference_dataset=reference_dataset,
+        sampling=sampling.model_copy(update={"stratify_by_time_group": True}),
+    )
+    unsampled_drift = DriftCalculator.calculate_drift(
+        spark_session=spark_fixture,
+        current_dataset=current_dataset,
+        reference_dataset=reference_dataset,
+    )
+
+    assert 400 < drift["sampling"]["current_size"] < 650
+    assert 400 < drift["sampling"]["reference_size"] < 650
+    assert not drift["sampling"]["stratified"]
+    # every row of the second hour is kept, with about 26% of the first one
+    assert 500 < stratified_drift["sampling"]["current_size"] < 750
+    assert stratified_drift["sampling"]["stratified"]
+    assert "sampling" not in unsampled_drift
+    assert [f["feature_name"] for f in drift["feature_metrics"]] == [
+        f["feature_name"] for f in unsampled_drift["feature_metrics"]
+    ]
@@ -4,12 +4,20 @@ import pytest
 import deepdiff
 
 from current_job import compute_metrics as cur_compute_metrics
+from current_job import parse_arguments as cur_parse_arguments
 from reference_job import compute_metrics as ref_compute_metrics
+from reference_job import parse_arguments as ref_parse_arguments
 from models.current_dataset import CurrentDataset
 from models.reference_dataset import ReferenceDataset
 from utils.models import (
+    DEFAULT_CATEGORIES_TOP_K,
+    DEFAULT_RESIDUAL_POINTS_BUDGET,
     ColumnDefinition,
+    DatasetFormat,
     DataType,
+    DuplicateRowsMode,
+    PersistencePolicy,
+    QuantileMode,
     Granularity,
     ModelOut,
     ModelType,
@@ -448,3 +456,47 @@ def test_bc_joined(
         ignore_order=True,
         ignore_type_subclasses=True,
     )
+
+
+def test_parse_arguments(reg_model_abalone):
+    model_json = reg_model_abalone.model_dump_json()
+
+    arguments = ref_parse_arguments(
+        [model_json, "reference.csv", "uuid", "reference_dataset_metrics"]
+    )
+    assert arguments.model == reg_model_abalone
+    assert arguments.dataset_format == DatasetFormat.CSV
+    assert arguments.persistence == PersistencePolicy.AUTO
+    assert arguments.quantile_mode == QuantileMode.EXACT
+    assert arguments.residual_points_budget == DEFAULT_RESIDUAL_POINTS_BUDGET
+    assert arguments.categories_top_k == DEFAULT_CATEGORIES_TOP_K
+    assert not arguments.approximate_distinct
+
+    # named options in any order
+    arguments = cur_parse_arguments(
+        [
+            model_json,
+            "current",
+            "uuid",
+            "reference",
+            "current_dataset_metrics",
+            "--incremental",
+            "--duplicate-rows-mode",
+            "HASH",
+            "--reference-dataset-format",
+            "parquet",
+            "--residual-points-budget",
+            "500",
+            "--categories-top-k",
+            "100",
+            "--approximate-distinct",
+        ]
+    )
+    assert arguments.current_dataset_format == DatasetFormat.CSV
+    assert arguments.reference_dataset_format == DatasetFormat.PARQUET
+    assert arguments.duplicate_rows_mode == DuplicateRowsMode.HASH
+    assert arguments.incremental
+    assert arguments.residual_points_budget == 500
+    assert arguments.categories_top_k == 100
+    assert arguments.approximate_distinct
+    assert not arguments.drift_sampling.enabled
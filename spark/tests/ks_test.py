@@ -0,0 +1,30 @@
+import math
+
+import pytest
+
+from metrics.ks import KolmogorovSmirnovTest
+
+
+def test_ks_batch(spark_fixture):
+    reference = spark_fixture.createDataFrame(
+        [(float(i), float(i % 7), None) for i in range(50)],
+        "a double, b double, nulls double",
+    )
+    current = spark_fixture.createDataFrame(
+        [(float(i) + 10, float(i % 5), None) for i in range(40)],
+        "a double, b double, nulls double",
+    )
+    ks = KolmogorovSmirnovTest(
+        reference_data=reference, current_data=current, alpha=0.05, phi=0.004
+    )
+
+    result = ks.test_batch(["a", "b", "nulls"])
+
+    # quantiles of all the columns in one approxQuantile match the ones of every column
+    for column in ("a", "b"):
+        assert result[column] == ks.test(column, column)
+    assert result["a"]["ks_statistic"] == pytest.approx(0.195)
+    assert result["b"]["ks_statistic"] == pytest.approx(0.42)
+    # a column without values has no quantiles, its statistic is not computed
+    assert math.isnan(result["nulls"]["ks_statistic"])
+    assert result["nulls"]["critical_value"] == result["a"]["critical_value"]
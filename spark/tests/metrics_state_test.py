@@ -0,0 +1,278 @@
+import datetime
+import uuid
+
+import deepdiff
+import numpy as np
+import pytest
+
+from metrics.metrics_state_calculator import MetricsStateCalculator
+from models.current_dataset import CurrentDataset
+from models.metrics_state import (
+    SKETCH_POINTS,
+    MetricsState,
+    NumericalState,
+    QuantileSketch,
+)
+from models.reference_dataset import ReferenceDataset
+from utils.current_binary import CurrentMetricsService
+from utils.current_multiclass import CurrentMetricsMulticlassService
+from utils.models import (
+    ColumnDefinition,
+    DataType,
+    FieldTypes,
+    Granularity,
+    ModelOut,
+    ModelType,
+    OutputType,
+    SupportedTypes,
+)
+
+
+@pytest.fixture()
+def model():
+    prediction = ColumnDefinition(
+        name="prediction", type=SupportedTypes.string, field_type=FieldTypes.categorical
+    )
+    yield ModelOut(
+        uuid=uuid.uuid4(),
+        name="model",
+        description="description",
+        model_type=ModelType.MULTI_CLASS,
+        data_type=DataType.TABULAR,
+        timestamp=ColumnDefinition(
+            name="datetime",
+            type=SupportedTypes.datetime,
+            field_type=FieldTypes.datetime,
+        ),
+        granularity=Granularity.HOUR,
+        outputs=OutputType(prediction=prediction, output=[prediction]),
+        target=ColumnDefinition(
+            name="target",
+            type=SupportedTypes.string,
+            field_type=FieldTypes.categorical,
+        ),
+        features=[
+            ColumnDefinition(
+                name="cat1",
+                type=SupportedTypes.string,
+                field_type=FieldTypes.categorical,
+            ),
+            ColumnDefinition(
+                name="cat2",
+                type=SupportedTypes.string,
+                field_type=FieldTypes.categorical,
+            ),
+            ColumnDefinition(
+                name="num1", type=SupportedTypes.float, field_type=FieldTypes.numerical
+            ),
+            ColumnDefinition(
+                name="num2", type=SupportedTypes.float, field_type=FieldTypes.numerical
+            ),
+        ],
+        frameworks="framework",
+        algorithm="algorithm",
+        created_at=str(datetime.datetime.now()),
+        updated_at=str(datetime.datetime.now()),
+    )
+
+
+@pytest.fixture()
+def binary_model(model):
+    prediction = ColumnDefinition(
+        name="prediction", type=SupportedTypes.float, field_type=FieldTypes.numerical
+    )
+    prediction_proba = ColumnDefinition(
+        name="prediction_proba",
+        type=SupportedTypes.float,
+        field_type=FieldTypes.numerical,
+    )
+    yield model.model_copy(
+        update={
+            "model_type": ModelType.BINARY,
+            "outputs": OutputType(
+                prediction=prediction,
+                prediction_proba=prediction_proba,
+                output=[prediction, prediction_proba],
+            ),
+            "target": ColumnDefinition(
+                name="target",
+                type=SupportedTypes.float,
+                field_type=FieldTypes.numerical,
+            ),
+        }
+    )
+
+
+def sketch(values):
+    return QuantileSketch(
+        count=len(values),
+        quantiles=np.quantile(
+            values, np.linspace(0, 1, SKETCH_POINTS + 1), method="inverted_cdf"
+        ).tolist(),
+    )
+
+
+def numerical_state(values):
+    return NumericalState(
+        count=len(values),
+        mean=values.mean(),
+        m2=((values - values.mean()) ** 2).sum(),
+        min=values.min(),
+        max=values.max(),
+        sketch=sketch(values),
+    )
+
+
+def test_numerical_state_merge():
+    rng = np.random.default_rng(42)
+    first = rng.normal(0, 1, 100_000)
+    second = rng.normal(1, 2, 50_000)
+    values = np.concatenate([first, second])
+
+    merged = numerical_state(first).merge(numerical_state(second))
+
+    assert merged.count == len(values)
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.std() == pytest.approx(values.std(ddof=1))
+    assert (merged.min, merged.max) == (values.min(), values.max())
+    # the rank error of the merged quantiles is about 1 / SKETCH_POINTS
+    probabilities = [0.01, 0.25, 0.5, 0.75, 0.99]
+    ranks = [np.mean(values <= q) for q in merged.sketch.quantile(probabilities)]
+    assert ranks == pytest.approx(probabilities, abs=2 / SKETCH_POINTS)
+
+
+def test_merged_states_equal_state_of_union(spark_fixture, test_data_dir, model):
+    current_dataset = CurrentDataset(
+        model=model,
+        raw_dataframe=spark_fixture.read.csv(
+            f"{test_data_dir}/current/multiclass/dataset_target_string.csv",
+            header=True,
+        ),
+    )
+    reference_dataset = ReferenceDataset(
+        model=model,
+        raw_dataframe=spark_fixture.read.csv(
+            f"{test_data_dir}/reference/multiclass/dataset_target_string.csv",
+            header=True,
+        ),
+    )
+    first, second = current_dataset.current.randomSplit([0.5, 0.5], seed=42)
+
+    states = [
+        MetricsStateCalculator.calculate(model, dataframe, dataframe.count())
+        for dataframe in (first, second)
+    ]
+    # states are stored as json between the current jobs and the merge
+    merged = MetricsStateCalculator.merge(
+        spark_fixture,
+        [MetricsState.model_validate_json(s.model_dump_json()) for s in states],
+    )
+    union = MetricsStateCalculator.calculate(
+        model, current_dataset.current, current_dataset.current_count
+    )
+    reference_state = MetricsStateCalculator.calculate(
+        model, reference_dataset.reference, reference_dataset.reference_count
+    )
+
+    assert merged.n_observations == union.n_observations == 10
+    assert merged.missing_cells == union.missing_cells
+    assert merged.categorical == union.categorical
+    for feature in ("num1", "num2"):
+        assert merged.numerical[feature].values == union.numerical[feature].values
+        assert merged.numerical[feature].mean == pytest.approx(
+            union.numerical[feature].mean
+        )
+    assert (
+        MetricsStateCalculator.statistics(model, merged).n_observations
+        == current_dataset.current_count
+    )
+
+    metrics_service = CurrentMetricsMulticlassService(
+        spark_session=spark_fixture,
+        current=current_dataset,
+        reference=reference_dataset,
+    )
+    assert not deepdiff.DeepDiff(
+        MetricsStateCalculator.model_quality(model, merged, reference_state),
+        metrics_service.calculate_model_quality(),
+        ignore_order=True,
+        significant_digits=6,
+    )
+
+
+def test_merged_binary_states_equal_current_model_quality(
+    spark_fixture, test_data_dir, binary_model
+):
+    current_dataset = CurrentDataset(
+        model=binary_model,
+        raw_dataframe=spark_fixture.read.csv(
+            f"{test_data_dir}/current/dataset.csv", header=True
+        ),
+    )
+    reference_dataset = ReferenceDataset(
+        model=binary_model,
+        raw_dataframe=spark_fixture.read.csv(
+            f"{test_data_dir}/reference/dataset.csv", header=True
+        ),
+    )
+    first, second = current_dataset.current.randomSplit([0.5, 0.5], seed=42)
+
+    merged = MetricsStateCalculator.merge(
+        spark_fixture,
+        [
+            MetricsState.model_validate_json(
+                MetricsStateCalculator.calculate(
+                    binary_model, dataframe, dataframe.count()
+                ).model_dump_json()
+            )
+            for dataframe in (first, second)
+        ],
+    )
+    reference_state = MetricsStateCalculator.calculate(
+        binary_model, reference_dataset.reference, reference_dataset.reference_count
+    )
+
+    metrics_service = CurrentMetricsService(
+        spark_session=spark_fixture,
+        current=current_dataset,
+        reference=reference_dataset,
+    )
+    # scores of the dataset are in different bins, so the areas are the exact ones
+    assert not deepdiff.DeepDiff(
+        MetricsStateCalculator.model_quality(binary_model, merged, reference_state),
+        metrics_service.calculate_model_quality_with_group_by_timestamp(),
+        ignore_nan_inequality=True,
+        significant_digits=6,
+    )
+
+
+def test_categories_over_top_k_in_other(spark_fixture, test_data_dir, model):
+    dataframe = CurrentDataset(
+        model=model,
+        raw_dataframe=spark_fixture.read.csv(
+            f"{test_data_dir}/current/multiclass/dataset_target_string.csv",
+            header=True,
+        ),
+    ).current
+
+    state = MetricsStateCalculator.calculate(
+        model, dataframe, dataframe.count(), categories_top_k=1
+    )
+    all_categories = MetricsStateCalculator.calculate(
+        model, dataframe, dataframe.count()
+    )
+
+    for feature in ("cat1", "cat2"):
+        categorical = state.categorical[feature]
+        assert categorical.max_categories == 1
+        assert len(categorical.counts) == 1
+        assert categorical.other + sum(categorical.counts.values()) == sum(
+            all_categories.categorical[feature].counts.values()
+        )
+        # the merge keeps the lowest number of categories of the two states
+        merged = categorical.merge(all_categories.categorical[feature])
+        assert merged.max_categories == 1
+        assert len(merged.counts) == 1
+        assert merged.other + sum(merged.counts.values()) == 2 * sum(
+            all_categories.categorical[feature].counts.values()
+        )
@@ -0,0 +1,206 @@
+import datetime
+from unittest.mock import MagicMock
+import uuid
+
+import pytest
+from pyspark.mllib.evaluation import MulticlassMetrics
+from pyspark.sql import Row
+import pyspark.sql.functions as F
+
+from metrics.model_quality_binary_calculator import ModelQualityBinaryCalculator
+from utils.current_binary import CurrentMetricsService
+from utils.reference_binary import ReferenceMetricsService
+from utils.models import (
+    ColumnDefinition,
+    DataType,
+    FieldTypes,
+    Granularity,
+    ModelOut,
+    ModelType,
+    OutputType,
+    SupportedTypes,
+)
+
+
+@pytest.fixture()
+def binary_model():
+    yield ModelOut(
+        uuid=uuid.uuid4(),
+        name="model",
+        description="description",
+        model_type=ModelType.BINARY,
+        data_type=DataType.TABULAR,
+        timestamp=ColumnDefinition(
+            name="datetime",
+            type=SupportedTypes.datetime,
+            field_type=FieldTypes.datetime,
+        ),
+        granularity=Granularity.HOUR,
+        outputs=OutputType(
+            prediction=ColumnDefinition(
+                name="prediction",
+                type=SupportedTypes.int,
+                field_type=FieldTypes.numerical,
+            ),
+            output=[
+                ColumnDefinition(
+                    name="prediction",
+                    type=SupportedTypes.int,
+                    field_type=FieldTypes.numerical,
+                )
+            ],
+        ),
+        target=ColumnDefinition(
+            name="target", type=SupportedTypes.int, field_type=FieldTypes.numerical
+        ),
+        features=[],
+        frameworks="framework",
+        algorithm="algorithm",
+        created_at=str(datetime.datetime.now()),
+        updated_at=str(datetime.datetime.now()),
+    )
+
+
+@pytest.fixture()
+def binary_model_with_proba(binary_model):
+    prediction = ColumnDefinition(
+        name="prediction", type=SupportedTypes.int, field_type=FieldTypes.numerical
+    )
+    prediction_proba = ColumnDefinition(
+        name="prediction_proba",
+        type=SupportedTypes.float,
+        field_type=FieldTypes.numerical,
+    )
+    yield binary_model.model_copy(
+        update={
+            "outputs": OutputType(
+                prediction=prediction,
+                prediction_proba=prediction_proba,
+                output=[prediction, prediction_proba],
+            )
+        }
+    )
+
+
+@pytest.fixture()
+def counts():
+    counts_row = Row("target", "prediction", "count")
+    yield [
+        counts_row(1.0, 1.0, 5),
+        counts_row(0.0, 1.0, 2),
+        counts_row(0.0, 0.0, 4),
+        counts_row(1.0, 0.0, 1),
+        counts_row(None, 1.0, 3),
+        counts_row(1.0, float("nan"), 2),
+    ]
+
+
+def test_confusion_matrix(binary_model, counts):
+    confusion_matrix = ModelQualityBinaryCalculator.confusion_matrix(
+        binary_model, counts
+    )
+
+    assert confusion_matrix == {
+        "true_positive_count": 5,
+        "false_positive_count": 2,
+        "true_negative_count": 4,
+        "false_negative_count": 1,
+    }
+
+
+def test_class_metrics(counts):
+    target_metrics = ModelQualityBinaryCalculator.class_metrics("target", counts, 17)
+    prediction_metrics = ModelQualityBinaryCalculator.class_metrics(
+        "prediction", counts, 17
+    )
+
+    assert [m.model_dump() for m in target_metrics] == [
+        {"name": "0.0", "count": 6, "percentage": 6 / 17 * 100},
+        {"name": "1.0", "count": 8, "percentage": 8 / 17 * 100},
+    ]
+    assert [m.model_dump() for m in prediction_metrics] == [
+        {"name": "0.0", "count": 5, "percentage": 5 / 17 * 100},
+        {"name": "1.0", "count": 10, "percentage": 10 / 17 * 100},
+        {"name": "nan", "count": 0, "percentage": 0.0},
+    ]
+
+
+def test_area_under_curves():
+    area_under_curves = ModelQualityBinaryCalculator.area_under_curves(
+        [(0.5, 0, 1), (0.9, 1, 0), (0.7, 0, 1), (0.8, 1, 0), (0.6, 1, 0)]
+    )
+
+    assert area_under_curves["areaUnderROC"] == pytest.approx(5 / 6)
+    assert area_under_curves["areaUnderPR"] == pytest.approx(65 / 72)
+
+
+def test_log_loss_equal_to_multiclass_metrics(spark_fixture, binary_model_with_proba):
+    dataframe = spark_fixture.createDataFrame(
+        [
+            ("a", 1, 1, 0.9),
+            ("a", 0, 1, 0.6),
+            ("a", 0, 0, 1.0),
+            ("b", 1, 0, 0.7),
+            ("b", 1, 1, 0.55),
+            ("b", None, 1, 0.8),
+            ("b", 1, 0, float("nan")),
+        ],
+        ["time_group", "target", "prediction", "prediction_proba"],
+    )
+
+    def expected_log_loss(df):
+        rows = (
+            df.dropna()
+            .select(
+                F.col("prediction").cast("double"),
+                F.col("target").cast("double"),
+                F.lit(1.0),
+                F.array(
+                    F.when(
+                        F.col("prediction") == 0, F.col("prediction_proba")
+                    ).otherwise(1 - F.col("prediction_proba")),
+                    F.when(
+                        F.col("prediction") == 1, F.col("prediction_proba")
+                    ).otherwise(1 - F.col("prediction_proba")),
+                ),
+            )
+            .rdd
+        )
+        return MulticlassMetrics(rows).logLoss()
+
+    global_log_loss, log_loss_by_group = ModelQualityBinaryCalculator.log_loss_by_group(
+        binary_model_with_proba, dataframe, "time_group"
+    )
+
+    assert global_log_loss == pytest.approx(expected_log_loss(dataframe))
+    assert ModelQualityBinaryCalculator.log_loss(
+        binary_model_with_proba, dataframe
+    ) == pytest.approx(global_log_loss)
+    for group in ["a", "b"]:
+        assert log_loss_by_group[group] == pytest.approx(
+            expected_log_loss(dataframe.where(F.col("time_group") == group))
+        )
+
+
+def test_label_prediction_counts_are_lazy(monkeypatch, binary_model, counts):
+    calls = []
+
+    def label_prediction_counts(model, dataframe):
+        calls.append(dataframe)
+        return counts
+
+    monkeypatch.setattr(
+        ModelQualityBinaryCalculator, "label_prediction_counts", label_prediction_counts
+    )
+    reference = MagicMock(model=binary_model)
+    current = MagicMock(model=binary_model)
+    reference_service = ReferenceMetricsService(reference=reference)
+    current_service = CurrentMetricsService(
+        spark_session=MagicMock(), current=current, reference=reference
+    )
+
+    assert calls == []
+    assert reference_service.label_prediction_counts == counts
+    assert current_service.label_prediction_counts == counts
+    assert current_service.label_prediction_counts == counts
+    assert calls == [reference.reference, current.current]
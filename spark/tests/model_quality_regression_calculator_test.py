@@ -0,0 +1,180 @@
+import datetime
+import math
+import uuid
+
+import pytest
+from pyspark.ml.evaluation import RegressionEvaluator
+import pyspark.sql.functions as F
+
+from metrics.model_quality_regression_calculator import (
+    ModelQualityRegressionCalculator,
+)
+from utils.models import (
+    ColumnDefinition,
+    DataType,
+    FieldTypes,
+    Granularity,
+    ModelOut,
+    ModelType,
+    OutputType,
+    SupportedTypes,
+)
+
+
+@pytest.fixture()
+def regression_model():
+    prediction = ColumnDefinition(
+        name="prediction", type=SupportedTypes.float, field_type=FieldTypes.numerical
+    )
+    yield ModelOut(
+        uuid=uuid.uuid4(),
+        name="model",
+        description="description",
+        model_type=ModelType.REGRESSION,
+        data_type=DataType.TABULAR,
+        timestamp=ColumnDefinition(
+            name="datetime",
+            type=SupportedTypes.datetime,
+            field_type=FieldTypes.datetime,
+        ),
+        granularity=Granularity.HOUR,
+        outputs=OutputType(prediction=prediction, output=[prediction]),
+        target=ColumnDefinition(
+            name="target", type=SupportedTypes.float, field_type=FieldTypes.numerical
+        ),
+        features=[
+            ColumnDefinition(
+                name="feature",
+                type=SupportedTypes.float,
+                field_type=FieldTypes.numerical,
+            )
+        ],
+        frameworks="framework",
+        algorithm="algorithm",
+        created_at=str(datetime.datetime.now()),
+        updated_at=str(datetime.datetime.now()),
+    )
+
+
+def statistics_of(targets, predictions):
+    errors = [t - p for t, p in zip(targets, predictions)]
+    return {
+        "n": len(targets),
+        "sum_y": sum(targets),
+        "sum_y_hat": sum(predictions),
+        "sum_y2": sum(t * t for t in targets),
+        "sum_y_hat2": sum(p * p for p in predictions),
+        "sum_y_y_hat": sum(t * p for t, p in zip(targets, predictions)),
+        "sum_abs_error": sum(abs(e) for e in errors),
+        "sum_squared_error": sum(e * e for e in errors),
+        "sum_ape": sum(abs(e / t) for e, t in zip(errors, targets)),
+        "n_ape": len(targets),
+    }
+
+
+def test_metrics_from_statistics(regression_model):
+    statistics = statistics_of([1.0, 2.0, 4.0, 5.0], [1.5, 2.0, 3.0, 6.0])
+
+    metrics = ModelQualityRegressionCalculator.metrics_from_statistics(
+        regression_model, statistics
+    )
+
+    assert metrics.mae == pytest.approx(2.5 / 4)
+    assert metrics.mse == pytest.approx(2.25 / 4)
+    assert metrics.rmse == pytest.approx(math.sqrt(2.25 / 4))
+    assert metrics.r2 == pytest.approx(1 - 2.25 / 10)
+    assert metrics.adj_r2 == pytest.approx(1 - (2.25 / 10) * 3 / 2)
+    assert metrics.variance == pytest.approx(12.25 / 4)
+    assert metrics.mape == pytest.approx((0.5 + 0 + 0.25 + 0.2) / 4 * 100)
+
+
+def test_metrics_from_empty_statistics(regression_model):
+    metrics = ModelQualityRegressionCalculator.metrics_from_statistics(
+        regression_model, {"n": 0}
+    )
+
+    assert all(math.isnan(value) for value in metrics.model_dump().values())
+
+
+def test_regression_line_and_correlation(regression_model):
+    targets = [1.0, 2.0, 4.0, 5.0]
+    predictions = [1.5, 2.0, 3.0, 6.0]
+    statistics = statistics_of(targets, predictions)
+
+    regression_line = ModelQualityRegressionCalculator.get_regression_line(
+        regression_model, None, statistics
+    )
+    correlation = ModelQualityRegressionCalculator.correlation_coefficient(statistics)
+
+    # sums of squares: 10 for covariance, 10 for targets and 12.1875 for predictions
+    assert regression_line["coefficient"] == pytest.approx(1.0)
+    assert regression_line["intercept"] == pytest.approx(3.125 - 3.0)
+    assert correlation == pytest.approx(10 / math.sqrt(10 * 12.1875))
+    assert ModelQualityRegressionCalculator.get_regression_line(
+        regression_model, None, statistics_of([2.0, 2.0], [1.0, 3.0])
+    ) == {"coefficient": 0.0, "intercept": 2.0}
+
+
+def test_numerical_metrics_equal_to_evaluator(spark_fixture, regression_model):
+    dataframe = spark_fixture.createDataFrame(
+        [
+            ("a", 3.0, 2.5),
+            ("a", 1.0, 1.5),
+            ("a", 0.0, 0.2),
+            ("b", 4.0, 4.5),
+            ("b", 7.0, 6.0),
+            ("b", None, 1.0),
+            ("b", 2.0, float("nan")),
+        ],
+        ["time_group", "target", "prediction"],
+    )
+
+    def expected(df, metric_name):
+        return RegressionEvaluator(
+            metricName=metric_name, labelCol="target", predictionCol="prediction"
+        ).evaluate(df.dropna())
+
+    metrics = ModelQualityRegressionCalculator.numerical_metrics(
+        regression_model, dataframe, dataframe.count()
+    )
+    metrics_by_group = ModelQualityRegressionCalculator.numerical_metrics_by_group(
+        regression_model, dataframe, "time_group"
+    )
+
+    for metric_name in ["mae", "mse", "rmse", "r2", "var"]:
+        field = "variance" if metric_name == "var" else metric_name
+        assert getattr(metrics, field) == pytest.approx(
+            expected(dataframe, metric_name)
+        )
+        for group in ["a", "b"]:
+            assert getattr(metrics_by_group[group], field) == pytest.approx(
+                expected(dataframe.where(F.col("time_group") == group), metric_name)
+            )
+
+
+def test_residual_points_budget(spark_fixture, regression_model):
+    dataframe = spark_fixture.createDataFrame(
+        [(float(i % 7), float(i % 5)) for i in range(100)], ["target", "prediction"]
+    )
+    residual_dataframe = ModelQualityRegressionCalculator.residual_calculation(
+        regression_model, dataframe
+    )
+
+    points = ModelQualityRegressionCalculator.residual_points(
+        regression_model, residual_dataframe, 10
+    )
+    all_points = ModelQualityRegressionCalculator.residual_points(
+        regression_model, residual_dataframe, 1000
+    )
+
+    assert len(points["standardized_residuals"]) == 10
+    assert len(all_points["targets"]) == 100
+    assert points == ModelQualityRegressionCalculator.residual_points(
+        regression_model, residual_dataframe, 10
+    )
+    # points are aligned, the standardized residual depends only on target - prediction
+    standardized = {}
+    for std_residual, prediction, target in zip(*points.values()):
+        assert (
+            standardized.setdefault(target - prediction, std_residual) == std_residual
+        )
@@ -0,0 +1,108 @@
+from unittest.mock import MagicMock
+
+from pyspark import StorageLevel
+
+from utils.models import PersistencePolicy
+from utils.persistence import (
+    DISK_ONLY_MAX_BYTES,
+    MEMORY_AND_DISK_MAX_BYTES,
+    SPILL_DIR_CONF,
+    persist_dataframe,
+    release_dataframe,
+    resolve_persistence_policy,
+    shared_spill_dir,
+)
+
+spill_dir = "s3a://test-bucket/spill"
+
+
+def test_resolve_persistence_policy():
+    assert (
+        resolve_persistence_policy(PersistencePolicy.AUTO, None, spill_dir)
+        == PersistencePolicy.MEMORY_AND_DISK
+    )
+    assert (
+        resolve_persistence_policy(
+            PersistencePolicy.AUTO, MEMORY_AND_DISK_MAX_BYTES, spill_dir
+        )
+        == PersistencePolicy.MEMORY_AND_DISK
+    )
+    assert (
+        resolve_persistence_policy(
+            PersistencePolicy.AUTO, DISK_ONLY_MAX_BYTES, spill_dir
+        )
+        == PersistencePolicy.DISK_ONLY
+    )
+    assert (
+        resolve_persistence_policy(
+            PersistencePolicy.AUTO, DISK_ONLY_MAX_BYTES + 1, spill_dir
+        )
+        == PersistencePolicy.PARQUET
+    )
+    assert (
+        resolve_persistence_policy(
+            PersistencePolicy.AUTO, DISK_ONLY_MAX_BYTES + 1, None
+        )
+        == PersistencePolicy.DISK_ONLY
+    )
+    assert (
+        resolve_persistence_policy(
+            PersistencePolicy.NONE, DISK_ONLY_MAX_BYTES + 1, spill_dir
+        )
+        == PersistencePolicy.NONE
+    )
+
+
+def spark_session_mock(master, conf, checkpoint_dir=None):
+    spark_session = MagicMock()
+    spark_session.sparkContext.master = master
+    spark_session.sparkContext.getConf.return_value.get.side_effect = conf.get
+    spark_session.sparkContext.getCheckpointDir.return_value = checkpoint_dir
+    return spark_session
+
+
+def test_shared_spill_dir():
+    assert (
+        shared_spill_dir(
+            spark_session_mock("k8s://cluster", {SPILL_DIR_CONF: f"{spill_dir}/"})
+        )
+        == spill_dir
+    )
+    assert (
+        shared_spill_dir(spark_session_mock("k8s://cluster", {}, "hdfs:/checkpoint"))
+        == "hdfs:/checkpoint"
+    )
+    # the local dirs of the executors are not readable by the driver
+    assert (
+        shared_spill_dir(
+            spark_session_mock("k8s://cluster", {"spark.local.dir": "/tmp/spark"})
+        )
+        is None
+    )
+    assert (
+        shared_spill_dir(
+            spark_session_mock("local[*]", {"spark.local.dir": "/tmp/a,/tmp/b"})
+        )
+        == "file:///tmp/a"
+    )
+
+
+def test_persist_dataframe(spark_fixture):
+    dataframe = spark_fixture.createDataFrame([(1, "a"), (2, "b")], ["num", "cat"])
+
+    persisted, spill_path = persist_dataframe(
+        dataframe, PersistencePolicy.MEMORY_AND_DISK
+    )
+    assert spill_path is None
+    assert persisted.storageLevel == StorageLevel.MEMORY_AND_DISK
+    release_dataframe(persisted, spill_path)
+    assert persisted.storageLevel == StorageLevel.NONE
+
+
+def test_persist_dataframe_parquet(spark_fixture):
+    dataframe = spark_fixture.createDataFrame([(1, "a"), (2, "b")], ["num", "cat"])
+
+    persisted, spill_path = persist_dataframe(dataframe, PersistencePolicy.PARQUET)
+    assert spill_path is not None
+    assert sorted(persisted.collect()) == sorted(dataframe.collect())
+    release_dataframe(persisted, spill_path)
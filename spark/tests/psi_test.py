@@ -0,0 +1,42 @@
+import pytest
+
+from metrics.psi import PSI
+
+
+@pytest.fixture()
+def psi(spark_fixture):
+    reference = spark_fixture.createDataFrame(
+        [(float(i % 4), float(i), 5.0) for i in range(20)] + [(None, None, None)],
+        "few double, many double, constant double",
+    )
+    current = spark_fixture.createDataFrame(
+        [(float(i % 3 + 1), float(2 * i), 5.0) for i in range(15)],
+        "few double, many double, constant double",
+    )
+    yield PSI(spark_fixture, reference, current)
+
+
+def test_psi_batch(psi):
+    result = psi.calculate_psi_batch(["few", "many", "constant"])
+
+    # values of calculate_psi before the batch, one feature at a time with Bucketizer
+    assert result["few"]["psi_value"] == pytest.approx(2.0271496162259326)
+    assert result["many"]["psi_value"] == pytest.approx(2.572317198060442)
+    # every feature gets the same result alone
+    for feature in ("few", "many", "constant"):
+        assert psi.calculate_psi(feature) == result[feature]
+
+
+def test_psi_batch_few_distinct_values(psi):
+    # the buckets of features with less than 10 distinct values are the values
+    fractions = [[1 / 4, 1 / 4, 1 / 4, 1 / 4], [0, 1 / 3, 1 / 3, 1 / 3]]
+    expected = sum(PSI.sub_psi(r, c) for r, c in zip(*fractions))
+
+    assert psi.calculate_psi_batch(["few"])["few"]["psi_value"] == pytest.approx(
+        expected
+    )
+
+
+def test_psi_batch_equal_values(psi):
+    # all the values in the first bucket, with the same distribution
+    assert psi.calculate_psi_batch(["constant"]) == {"constant": {"psi_value": 0.0}}
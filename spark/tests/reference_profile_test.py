@@ -0,0 +1,170 @@
+import datetime
+import uuid
+
+import deepdiff
+import pytest
+
+from metrics.data_quality_calculator import DataQualityCalculator
+from metrics.drift_calculator import DriftCalculator
+from metrics.reference_profile_calculator import ReferenceProfileCalculator
+from models.current_dataset import CurrentDataset
+from models.reference_dataset import ReferenceDataset
+from models.reference_profile import (
+    FeatureProfile,
+    REFERENCE_PROFILE_VERSION,
+    ReferenceProfile,
+)
+from utils.models import (
+    ColumnDefinition,
+    DataType,
+    FieldTypes,
+    Granularity,
+    ModelOut,
+    ModelType,
+    OutputType,
+    SupportedTypes,
+)
+from utils.spark import split_bucket_of
+
+
+@pytest.fixture()
+def model():
+    prediction = ColumnDefinition(
+        name="prediction", type=SupportedTypes.float, field_type=FieldTypes.numerical
+    )
+    yield ModelOut(
+        uuid=uuid.uuid4(),
+        name="model",
+        description="description",
+        model_type=ModelType.REGRESSION,
+        data_type=DataType.TABULAR,
+        timestamp=ColumnDefinition(
+            name="datetime",
+            type=SupportedTypes.datetime,
+            field_type=FieldTypes.datetime,
+        ),
+        granularity=Granularity.HOUR,
+        outputs=OutputType(prediction=prediction, output=[prediction]),
+        target=ColumnDefinition(
+            name="target", type=SupportedTypes.float, field_type=FieldTypes.numerical
+        ),
+        features=[
+            ColumnDefinition(
+                name="cat",
+                type=SupportedTypes.string,
+                field_type=FieldTypes.categorical,
+            ),
+            ColumnDefinition(
+                name="num_int", type=SupportedTypes.int, field_type=FieldTypes.numerical
+            ),
+            ColumnDefinition(
+                name="num_float",
+                type=SupportedTypes.float,
+                field_type=FieldTypes.numerical,
+            ),
+        ],
+        frameworks="framework",
+        algorithm="algorithm",
+        created_at=str(datetime.datetime.now()),
+        updated_at=str(datetime.datetime.now()),
+    )
+
+
+def dataframe(spark_session, rows):
+    return spark_session.createDataFrame(
+        [
+            (
+                f"2024-01-01 0{i % 3}:00:00",
+                "abc"[i % 3] if i % 7 else None,
+                str(i % 5),
+                str(i * offset / 10),
+                str(i % 4),
+                str(i % 4 + offset),
+            )
+            for i, offset in rows
+        ],
+        ["datetime", "cat", "num_int", "num_float", "prediction", "target"],
+    )
+
+
+def test_split_bucket_of():
+    splits = [0.0, 1.0, 2.0, 3.0]
+
+    assert [split_bucket_of(splits, x) for x in [0.0, 0.5, 1.0, 2.5, 3.0]] == [
+        0,
+        0,
+        1,
+        2,
+        2,
+    ]
+
+
+def test_profile_accessors():
+    profile = ReferenceProfile(
+        reference_count=3,
+        ks_phi=0.004,
+        features={
+            "num": FeatureProfile(
+                min=1.0, max=2.0, numerical_values=[(1.0, 2), (2.0, 1)]
+            ),
+            "float": FeatureProfile(min=1.0, max=2.0, quantiles=[1.0, 2.0]),
+        },
+    )
+
+    assert profile.numerical_values("num") == [(1.0, 2), (2.0, 1)]
+    assert profile.numerical_values("float") is None
+    assert profile.numerical_values("missing") is None
+    assert profile.quantiles("float", 0.004) == [1.0, 2.0]
+    assert profile.quantiles("float", 0.01) is None
+    assert profile.unprofiled_features() == ["float"]
+    assert profile.version == REFERENCE_PROFILE_VERSION
+
+
+def test_profile_save_and_load(spark_fixture, tmp_path):
+    profile = ReferenceProfile(
+        reference_count=1,
+        ks_phi=0.004,
+        features={"cat": FeatureProfile(categorical_values={"a": 1})},
+    )
+    path = ReferenceProfile.path(f"{tmp_path}/reference.csv")
+
+    assert ReferenceProfile.load(spark_fixture, path) is None
+    profile.save(spark_fixture, path)
+    assert ReferenceProfile.load(spark_fixture, path) == profile
+
+
+def test_metrics_with_profile_equal_to_reference(spark_fixture, model):
+    raw_reference = dataframe(spark_fixture, [(i, 1) for i in range(200)])
+    raw_current = dataframe(spark_fixture, [(i, 2) for i in range(150)])
+    current_dataset = CurrentDataset(model=model, raw_dataframe=raw_current)
+    reference_dataset = ReferenceDataset(model=model, raw_dataframe=raw_reference)
+    profile = ReferenceProfileCalculator.calculate(reference_dataset)
+    profiled_reference_dataset = ReferenceDataset(
+        model=model, raw_dataframe=raw_reference, profile=profile
+    )
+
+    assert profile.reference_count == 200
+    assert profile.categorical_values("cat") == {"a": 57, "b": 57, "c": 57}
+    assert profile.numerical_values("num_int") is not None
+
+    for reference in [reference_dataset, profiled_reference_dataset]:
+        drift = DriftCalculator.calculate_drift(
+            spark_session=spark_fixture,
+            current_dataset=current_dataset,
+            reference_dataset=reference,
+        )
+        data_quality = DataQualityCalculator.calculate_combined_data_quality_numerical(
+            model=model,
+            current_dataframe=current_dataset.current,
+            current_count=current_dataset.current_count,
+            reference_dataframe=reference.reference,
+            spark_session=spark_fixture,
+            reference_profile=reference.profile,
+        )
+        if reference.profile is None:
+            expected_drift, expected_data_quality = drift, data_quality
+        else:
+            assert not deepdiff.DeepDiff(drift, expected_drift, ignore_order=True)
+            assert [m.model_dump() for m in data_quality] == [
+                m.model_dump() for m in expected_data_quality
+            ]
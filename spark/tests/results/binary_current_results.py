@@ -85,25 +85,18 @@ test_calculation_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 1, "percentage": 10.0},
             "mean": 1.1666666666666667,
-            "std": 0.7500000000000001,
+            "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
                 "current_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
@@ -120,6 +113,7 @@ test_calculation_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -192,13 +186,14 @@ test_calculation_current_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 53.34873949579832,
-            "std": 9.050737112869957,
+            "std": 9.050737112869959,
             "min": 28.0,
             "max": 74.0,
             "median_metrics": {
                 "perc_25": 47.0,
                 "median": 54.0,
                 "perc_75": 60.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -227,7 +222,12 @@ test_calculation_current_joined_dq_res = {
             "std": 0.9205197793554797,
             "min": 1.0,
             "max": 4.0,
-            "median_metrics": {"perc_25": 3.0, "median": 4.0, "perc_75": 4.0},
+            "median_metrics": {
+                "perc_25": 3.0,
+                "median": 4.0,
+                "perc_75": 4.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -252,13 +252,14 @@ test_calculation_current_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 132.85294117647058,
-            "std": 18.16286527113178,
+            "std": 18.162865271131764,
             "min": 94.0,
             "max": 192.0,
             "median_metrics": {
                 "perc_25": 120.0,
                 "median": 130.0,
                 "perc_75": 140.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -284,13 +285,14 @@ test_calculation_current_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 212.2436974789916,
-            "std": 107.54541510599883,
+            "std": 107.54541510599881,
             "min": 0.0,
             "max": 564.0,
             "median_metrics": {
                 "perc_25": 186.25,
                 "median": 234.0,
                 "perc_75": 277.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -316,10 +318,15 @@ test_calculation_current_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 0.20588235294117646,
-            "std": 0.4051970646565134,
+            "std": 0.40519706465651334,
             "min": 0.0,
             "max": 1.0,
-            "median_metrics": {"perc_25": 0.0, "median": 0.0, "perc_75": 0.0},
+            "median_metrics": {
+                "perc_25": 0.0,
+                "median": 0.0,
+                "perc_75": 0.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -344,10 +351,15 @@ test_calculation_current_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 0.7016806722689075,
-            "std": 0.8710518587532667,
+            "std": 0.8710518587532668,
             "min": 0.0,
             "max": 2.0,
-            "median_metrics": {"perc_25": 0.0, "median": 0.0, "perc_75": 2.0},
+            "median_metrics": {
+                "perc_25": 0.0,
+                "median": 0.0,
+                "perc_75": 2.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -372,13 +384,14 @@ test_calculation_current_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 138.84453781512605,
-            "std": 26.31962319212335,
+            "std": 26.31962319212336,
             "min": 63.0,
             "max": 195.0,
             "median_metrics": {
                 "perc_25": 120.0,
                 "median": 140.0,
                 "perc_75": 159.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -404,10 +417,15 @@ test_calculation_current_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 0.42857142857142855,
-            "std": 0.4959145933585413,
+            "std": 0.4959145933585414,
             "min": 0.0,
             "max": 1.0,
-            "median_metrics": {"perc_25": 0.0, "median": 0.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 0.0,
+                "median": 0.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -431,14 +449,15 @@ test_calculation_current_joined_dq_res = {
             "feature_name": "st_depression",
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
-            "mean": 0.9920168067226889,
-            "std": 1.0415317183799289,
+            "mean": 0.9920168067226887,
+            "std": 1.041531718379929,
             "min": -1.1,
             "max": 4.0,
             "median_metrics": {
                 "perc_25": 0.0,
                 "median": 1.0,
                 "perc_75": 1.6749999999999998,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -464,10 +483,15 @@ test_calculation_current_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 1.6428571428571428,
-            "std": 0.5905116752253559,
+            "std": 0.5905116752253561,
             "min": 1.0,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 2.0, "perc_75": 2.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 2.0,
+                "perc_75": 2.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -492,8 +516,8 @@ test_calculation_current_joined_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "F", "count": 49, "frequency": 0.20588235294117646},
                 {"name": "M", "count": 189, "frequency": 0.7941176470588235},
+                {"name": "F", "count": 49, "frequency": 0.20588235294117646},
             ],
             "distinct_value": 2,
         },
@@ -515,12 +539,12 @@ test_calculation_complete_stats_res = {
 test_calculation_complete_dq_res = {
     "n_observations": 7,
     "class_metrics": [
-        {"name": "0.0", "count": 0, "percentage": 0.0},
         {"name": "1.0", "count": 7, "percentage": 100.0},
+        {"name": "0.0", "count": 0, "percentage": 0.0},
     ],
     "class_metrics_prediction": [
-        {"name": "0.0", "count": 0, "percentage": 0.0},
         {"name": "1.0", "count": 7, "percentage": 100.0},
+        {"name": "0.0", "count": 0, "percentage": 0.0},
     ],
     "feature_metrics": [
         {
@@ -531,7 +555,12 @@ test_calculation_complete_dq_res = {
             "std": 0.0,
             "min": 1.0,
             "max": 1.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [1.0, 1.0],
@@ -551,6 +580,7 @@ test_calculation_complete_dq_res = {
                 "perc_25": 100.0,
                 "median": 100.0,
                 "perc_75": 100.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -623,7 +653,12 @@ test_calculation_easy_dataset_dq_res = {
             "std": 0.0,
             "min": 1.0,
             "max": 1.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [1.0, 1.0],
@@ -643,6 +678,7 @@ test_calculation_easy_dataset_dq_res = {
                 "perc_25": 100.0,
                 "median": 100.0,
                 "perc_75": 100.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -712,25 +748,18 @@ test_calculation_dataset_cat_missing_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 1, "percentage": 10.0},
             "mean": 1.1666666666666667,
-            "std": 0.7500000000000001,
+            "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
                 "current_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
@@ -747,6 +776,7 @@ test_calculation_dataset_cat_missing_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -819,25 +849,18 @@ test_calculation_dataset_with_datetime_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 1, "percentage": 10.0},
             "mean": 1.1666666666666667,
-            "std": 0.7500000000000001,
+            "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
                 "current_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
@@ -854,6 +877,7 @@ test_calculation_dataset_with_datetime_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -933,6 +957,7 @@ test_calculation_easy_dataset_bucket_test_dq_res = {
                 "perc_25": -1e-05,
                 "median": -1e-05,
                 "perc_75": -1e-05,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -965,6 +990,7 @@ test_calculation_easy_dataset_bucket_test_dq_res = {
                 "perc_25": 100.0,
                 "median": 100.0,
                 "perc_75": 100.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1046,25 +1072,18 @@ test_calculation_for_hour_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 1, "percentage": 10.0},
             "mean": 1.1666666666666667,
-            "std": 0.7500000000000001,
+            "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
                 "current_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
@@ -1081,6 +1100,7 @@ test_calculation_for_hour_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1248,10 +1268,10 @@ test_calculation_for_hour_mq_res = {
         ],
         "log_loss": [
             {"timestamp": "2024-06-16 00:00:00", "value": 0.07832690502268844},
-            {"timestamp": "2024-06-16 01:00:00", "value": 1.0000000000000007e-15},
+            {"timestamp": "2024-06-16 01:00:00", "value": 9.992007221626415e-16},
             {"timestamp": "2024-06-16 02:00:00", "value": 0.5364793041447009},
-            {"timestamp": "2024-06-16 03:00:00", "value": 1.0000000000000007e-15},
-            {"timestamp": "2024-06-16 04:00:00", "value": 1.0000000000000007e-15},
+            {"timestamp": "2024-06-16 03:00:00", "value": 9.992007221626415e-16},
+            {"timestamp": "2024-06-16 04:00:00", "value": 9.992007221626415e-16},
         ],
     },
 }
@@ -1284,25 +1304,18 @@ test_calculation_for_day_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 1, "percentage": 10.0},
             "mean": 1.1666666666666667,
-            "std": 0.7500000000000001,
+            "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
                 "current_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
@@ -1319,6 +1332,7 @@ test_calculation_for_day_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1473,8 +1487,8 @@ test_calculation_for_day_mq_res = {
         "log_loss": [
             {"timestamp": "2024-06-16 00:00:00", "value": 0.05221793668179262},
             {"timestamp": "2024-06-17 00:00:00", "value": 0.5364793041447008},
-            {"timestamp": "2024-06-18 00:00:00", "value": 1.0000000000000007e-15},
-            {"timestamp": "2024-06-19 00:00:00", "value": 1.0000000000000007e-15},
+            {"timestamp": "2024-06-18 00:00:00", "value": 9.992007221626415e-16},
+            {"timestamp": "2024-06-19 00:00:00", "value": 9.992007221626415e-16},
         ],
     },
 }
@@ -1507,25 +1521,18 @@ test_calculation_for_week_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 1, "percentage": 10.0},
             "mean": 1.1666666666666667,
-            "std": 0.7500000000000001,
+            "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
                 "current_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
@@ -1542,6 +1549,7 @@ test_calculation_for_week_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1695,9 +1703,9 @@ test_calculation_for_week_mq_res = {
         ],
         "log_loss": [
             {"timestamp": "2024-06-16 00:00:00", "value": 0.05221793668179262},
-            {"timestamp": "2024-06-23 00:00:00", "value": 1.0000000000000007e-15},
+            {"timestamp": "2024-06-23 00:00:00", "value": 9.992007221626415e-16},
             {"timestamp": "2024-06-30 00:00:00", "value": 0.40235947810852596},
-            {"timestamp": "2024-07-14 00:00:00", "value": 1.0000000000000007e-15},
+            {"timestamp": "2024-07-14 00:00:00", "value": 9.992007221626415e-16},
         ],
     },
 }
@@ -1730,25 +1738,18 @@ test_calculation_for_month_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 1, "percentage": 10.0},
             "mean": 1.1666666666666667,
-            "std": 0.7500000000000001,
+            "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
                 "current_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
@@ -1765,6 +1766,7 @@ test_calculation_for_month_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1905,7 +1907,7 @@ test_calculation_for_month_mq_res = {
         "log_loss": [
             {"timestamp": "2024-06-01 00:00:00", "value": 0.03916345251134472},
             {"timestamp": "2024-07-01 00:00:00", "value": 0.5364793041447009},
-            {"timestamp": "2024-08-01 00:00:00", "value": 1.0000000000000007e-15},
+            {"timestamp": "2024-08-01 00:00:00", "value": 9.992007221626415e-16},
         ],
     },
 }
@@ -26,25 +26,18 @@ test_calculation_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 1, "percentage": 10.0},
             "mean": 1.1666666666666667,
-            "std": 0.7500000000000001,
+            "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
         },
@@ -60,6 +53,7 @@ test_calculation_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -153,13 +147,14 @@ test_calculation_reference_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 53.34873949579832,
-            "std": 9.050737112869957,
+            "std": 9.050737112869959,
             "min": 28.0,
             "max": 74.0,
             "median_metrics": {
                 "perc_25": 47.0,
                 "median": 54.0,
                 "perc_75": 60.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -187,7 +182,12 @@ test_calculation_reference_joined_dq_res = {
             "std": 0.9205197793554797,
             "min": 1.0,
             "max": 4.0,
-            "median_metrics": {"perc_25": 3.0, "median": 4.0, "perc_75": 4.0},
+            "median_metrics": {
+                "perc_25": 3.0,
+                "median": 4.0,
+                "perc_75": 4.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -211,13 +211,14 @@ test_calculation_reference_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 132.85294117647058,
-            "std": 18.16286527113178,
+            "std": 18.162865271131764,
             "min": 94.0,
             "max": 192.0,
             "median_metrics": {
                 "perc_25": 120.0,
                 "median": 130.0,
                 "perc_75": 140.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -242,13 +243,14 @@ test_calculation_reference_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 212.2436974789916,
-            "std": 107.54541510599883,
+            "std": 107.54541510599881,
             "min": 0.0,
             "max": 564.0,
             "median_metrics": {
                 "perc_25": 186.25,
                 "median": 234.0,
                 "perc_75": 277.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -273,10 +275,15 @@ test_calculation_reference_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 0.20588235294117646,
-            "std": 0.4051970646565134,
+            "std": 0.40519706465651334,
             "min": 0.0,
             "max": 1.0,
-            "median_metrics": {"perc_25": 0.0, "median": 0.0, "perc_75": 0.0},
+            "median_metrics": {
+                "perc_25": 0.0,
+                "median": 0.0,
+                "perc_75": 0.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -300,10 +307,15 @@ test_calculation_reference_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 0.7016806722689075,
-            "std": 0.8710518587532667,
+            "std": 0.8710518587532668,
             "min": 0.0,
             "max": 2.0,
-            "median_metrics": {"perc_25": 0.0, "median": 0.0, "perc_75": 2.0},
+            "median_metrics": {
+                "perc_25": 0.0,
+                "median": 0.0,
+                "perc_75": 2.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -327,13 +339,14 @@ test_calculation_reference_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 138.84453781512605,
-            "std": 26.31962319212335,
+            "std": 26.31962319212336,
             "min": 63.0,
             "max": 195.0,
             "median_metrics": {
                 "perc_25": 120.0,
                 "median": 140.0,
                 "perc_75": 159.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -358,10 +371,15 @@ test_calculation_reference_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 0.42857142857142855,
-            "std": 0.4959145933585413,
+            "std": 0.4959145933585414,
             "min": 0.0,
             "max": 1.0,
-            "median_metrics": {"perc_25": 0.0, "median": 0.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 0.0,
+                "median": 0.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -384,14 +402,15 @@ test_calculation_reference_joined_dq_res = {
             "feature_name": "st_depression",
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
-            "mean": 0.9920168067226889,
-            "std": 1.0415317183799289,
+            "mean": 0.9920168067226887,
+            "std": 1.041531718379929,
             "min": -1.1,
             "max": 4.0,
             "median_metrics": {
                 "perc_25": 0.0,
                 "median": 1.0,
                 "perc_75": 1.6749999999999998,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -416,10 +435,15 @@ test_calculation_reference_joined_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "mean": 1.6428571428571428,
-            "std": 0.5905116752253559,
+            "std": 0.5905116752253561,
             "min": 1.0,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 2.0, "perc_75": 2.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 2.0,
+                "perc_75": 2.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -443,8 +467,8 @@ test_calculation_reference_joined_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "F", "count": 49, "frequency": 0.20588235294117646},
                 {"name": "M", "count": 189, "frequency": 0.7941176470588235},
+                {"name": "F", "count": 49, "frequency": 0.20588235294117646},
             ],
             "distinct_value": 2,
         },
@@ -488,12 +512,12 @@ test_calculation_complete_stats_res = {
 test_calculation_complete_dq_res = {
     "n_observations": 7,
     "class_metrics": [
-        {"name": "0.0", "count": 0, "percentage": 0.0},
         {"name": "1.0", "count": 7, "percentage": 100.0},
+        {"name": "0.0", "count": 0, "percentage": 0.0},
     ],
     "class_metrics_prediction": [
-        {"name": "0.0", "count": 0, "percentage": 0.0},
         {"name": "1.0", "count": 7, "percentage": 100.0},
+        {"name": "0.0", "count": 0, "percentage": 0.0},
     ],
     "feature_metrics": [
         {
@@ -504,7 +528,12 @@ test_calculation_complete_dq_res = {
             "std": 0.0,
             "min": 1.0,
             "max": 1.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {"buckets": [1.0, 1.0], "reference_values": [7]},
         },
@@ -520,6 +549,7 @@ test_calculation_complete_dq_res = {
                 "perc_25": 100.0,
                 "median": 100.0,
                 "perc_75": 100.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {"buckets": [100.0, 100.0], "reference_values": [7]},
@@ -576,7 +606,7 @@ test_calculation_complete_mq_res = {
     "false_negative_count": 0,
     "area_under_roc": 1.0,
     "area_under_pr": 1.0,
-    "log_loss": 1.0000000000000007e-15,
+    "log_loss": 9.992007221626415e-16,
 }
 
 test_calculation_easy_dataset_stats_res = {
@@ -610,7 +640,12 @@ test_calculation_easy_dataset_dq_res = {
             "std": 0.0,
             "min": 1.0,
             "max": 1.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {"buckets": [1.0, 1.0], "reference_values": [7]},
         },
@@ -626,6 +661,7 @@ test_calculation_easy_dataset_dq_res = {
                 "perc_25": 100.0,
                 "median": 100.0,
                 "perc_75": 100.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {"buckets": [100.0, 100.0], "reference_values": [7]},
@@ -713,25 +749,18 @@ test_calculation_dataset_cat_missing_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 1, "percentage": 10.0},
             "mean": 1.1666666666666667,
-            "std": 0.7500000000000001,
+            "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
         },
@@ -747,6 +776,7 @@ test_calculation_dataset_cat_missing_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -840,25 +870,18 @@ test_calculation_dataset_with_datetime_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 1, "percentage": 10.0},
             "mean": 1.1666666666666667,
-            "std": 0.7500000000000001,
+            "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
         },
@@ -874,6 +897,7 @@ test_calculation_dataset_with_datetime_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -974,6 +998,7 @@ test_calculation_enhanced_data_dq_res = {
                 "perc_25": -1.0840126970135682,
                 "median": -0.2502794169949083,
                 "perc_75": 0.5933410153121773,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1016,6 +1041,7 @@ test_calculation_enhanced_data_dq_res = {
                 "perc_25": -1.01949325701271,
                 "median": -0.0766183061333018,
                 "perc_75": 0.8552504712786367,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1058,6 +1084,7 @@ test_calculation_enhanced_data_dq_res = {
                 "perc_25": -1.447157073352852,
                 "median": -0.1423515033878019,
                 "perc_75": 1.2966669810036546,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1100,6 +1127,7 @@ test_calculation_enhanced_data_dq_res = {
                 "perc_25": -0.7248317693310871,
                 "median": 0.2917484210629673,
                 "perc_75": 1.2565657381789663,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1142,6 +1170,7 @@ test_calculation_enhanced_data_dq_res = {
                 "perc_25": -0.9531061902461275,
                 "median": 0.023245141575466,
                 "perc_75": 0.9741310364527399,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1184,6 +1213,7 @@ test_calculation_enhanced_data_dq_res = {
                 "perc_25": -1.1763067000805298,
                 "median": 0.0198519555113513,
                 "perc_75": 1.465839157860066,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1226,6 +1256,7 @@ test_calculation_enhanced_data_dq_res = {
                 "perc_25": -1.381936111189342,
                 "median": -0.1793887792969184,
                 "perc_75": 1.0459150801924464,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1268,6 +1299,7 @@ test_calculation_enhanced_data_dq_res = {
                 "perc_25": -0.7350813046717275,
                 "median": 0.2797318101957035,
                 "perc_75": 1.2432583676125146,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1310,6 +1342,7 @@ test_calculation_enhanced_data_dq_res = {
                 "perc_25": -0.7079702812609976,
                 "median": 0.2606943392896966,
                 "perc_75": 1.1974171806547638,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1352,6 +1385,7 @@ test_calculation_enhanced_data_dq_res = {
                 "perc_25": -1.1815015799989832,
                 "median": -0.2532013764602815,
                 "perc_75": 0.663191189879565,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -1457,25 +1491,18 @@ test_calculation_dataset_bool_missing_dq_res = {
             "type": "numerical",
             "missing_value": {"count": 1, "percentage": 10.0},
             "mean": 1.1666666666666667,
-            "std": 0.7500000000000001,
+            "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
         },
@@ -1491,6 +1518,7 @@ test_calculation_dataset_bool_missing_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
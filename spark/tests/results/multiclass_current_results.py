@@ -33,22 +33,15 @@ test_calculation_dataset_target_int_dq_res = {
             "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
                 "current_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
@@ -65,6 +58,7 @@ test_calculation_dataset_target_int_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -90,9 +84,9 @@ test_calculation_dataset_target_int_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
+                {"name": "A", "count": 5, "frequency": 0.5},
                 {"name": "B", "count": 4, "frequency": 0.4},
                 {"name": "C", "count": 1, "frequency": 0.1},
-                {"name": "A", "count": 5, "frequency": 0.5},
             ],
             "distinct_value": 3,
         },
@@ -101,8 +95,8 @@ test_calculation_dataset_target_int_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "Y", "count": 1, "frequency": 0.1},
                 {"name": "X", "count": 9, "frequency": 0.9},
+                {"name": "Y", "count": 1, "frequency": 0.1},
             ],
             "distinct_value": 2,
         },
@@ -123,20 +117,14 @@ test_calculation_dataset_target_int_mq_res = {
             },
             "grouped_metrics": {
                 "true_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.6666666666666666,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.6666666666666666}
                 ],
                 "false_positive_rate": [
                     {"timestamp": "2024-06-16 00:00:00", "value": 0.0}
                 ],
                 "precision": [{"timestamp": "2024-06-16 00:00:00", "value": 1.0}],
                 "recall": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.6666666666666666,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.6666666666666666}
                 ],
                 "f_measure": [{"timestamp": "2024-06-16 00:00:00", "value": 0.8}],
             },
@@ -155,18 +143,12 @@ test_calculation_dataset_target_int_mq_res = {
                     {"timestamp": "2024-06-16 00:00:00", "value": 1.0}
                 ],
                 "false_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.14285714285714285,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.14285714285714285}
                 ],
                 "precision": [{"timestamp": "2024-06-16 00:00:00", "value": 0.75}],
                 "recall": [{"timestamp": "2024-06-16 00:00:00", "value": 1.0}],
                 "f_measure": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.8571428571428571,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.8571428571428571}
                 ],
             },
         },
@@ -181,23 +163,14 @@ test_calculation_dataset_target_int_mq_res = {
             },
             "grouped_metrics": {
                 "true_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.3333333333333333,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.3333333333333333}
                 ],
                 "false_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.14285714285714285,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.14285714285714285}
                 ],
                 "precision": [{"timestamp": "2024-06-16 00:00:00", "value": 0.5}],
                 "recall": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.3333333333333333,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.3333333333333333}
                 ],
                 "f_measure": [{"timestamp": "2024-06-16 00:00:00", "value": 0.4}],
             },
@@ -216,10 +189,7 @@ test_calculation_dataset_target_int_mq_res = {
                     {"timestamp": "2024-06-16 00:00:00", "value": 0.0}
                 ],
                 "false_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.2222222222222222,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.2222222222222222}
                 ],
                 "precision": [{"timestamp": "2024-06-16 00:00:00", "value": 0.0}],
                 "recall": [{"timestamp": "2024-06-16 00:00:00", "value": 0.0}],
@@ -231,8 +201,8 @@ test_calculation_dataset_target_int_mq_res = {
         "f1": 0.6171428571428572,
         "accuracy": 0.6,
         "weighted_precision": 0.675,
-        "weighted_recall": 0.6000000000000001,
-        "weighted_true_positive_rate": 0.6000000000000001,
+        "weighted_recall": 0.6,
+        "weighted_true_positive_rate": 0.6,
         "weighted_false_positive_rate": 0.10793650793650794,
         "weighted_f_measure": 0.6171428571428572,
         "confusion_matrix": [
@@ -279,22 +249,15 @@ test_calculation_dataset_target_string_dq_res = {
             "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
                 "current_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
@@ -311,6 +274,7 @@ test_calculation_dataset_target_string_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -336,9 +300,9 @@ test_calculation_dataset_target_string_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
+                {"name": "A", "count": 5, "frequency": 0.5},
                 {"name": "B", "count": 4, "frequency": 0.4},
                 {"name": "C", "count": 1, "frequency": 0.1},
-                {"name": "A", "count": 5, "frequency": 0.5},
             ],
             "distinct_value": 3,
         },
@@ -347,8 +311,8 @@ test_calculation_dataset_target_string_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "Y", "count": 1, "frequency": 0.1},
                 {"name": "X", "count": 9, "frequency": 0.9},
+                {"name": "Y", "count": 1, "frequency": 0.1},
             ],
             "distinct_value": 2,
         },
@@ -372,18 +336,12 @@ test_calculation_dataset_target_string_mq_res = {
                     {"timestamp": "2024-06-16 00:00:00", "value": 1.0}
                 ],
                 "false_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.14285714285714285,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.14285714285714285}
                 ],
                 "precision": [{"timestamp": "2024-06-16 00:00:00", "value": 0.75}],
                 "recall": [{"timestamp": "2024-06-16 00:00:00", "value": 1.0}],
                 "f_measure": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.8571428571428571,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.8571428571428571}
                 ],
             },
         },
@@ -401,10 +359,7 @@ test_calculation_dataset_target_string_mq_res = {
                     {"timestamp": "2024-06-16 00:00:00", "value": 0.0}
                 ],
                 "false_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.2222222222222222,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.2222222222222222}
                 ],
                 "precision": [{"timestamp": "2024-06-16 00:00:00", "value": 0.0}],
                 "recall": [{"timestamp": "2024-06-16 00:00:00", "value": 0.0}],
@@ -422,20 +377,14 @@ test_calculation_dataset_target_string_mq_res = {
             },
             "grouped_metrics": {
                 "true_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.6666666666666666,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.6666666666666666}
                 ],
                 "false_positive_rate": [
                     {"timestamp": "2024-06-16 00:00:00", "value": 0.0}
                 ],
                 "precision": [{"timestamp": "2024-06-16 00:00:00", "value": 1.0}],
                 "recall": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.6666666666666666,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.6666666666666666}
                 ],
                 "f_measure": [{"timestamp": "2024-06-16 00:00:00", "value": 0.8}],
             },
@@ -451,23 +400,14 @@ test_calculation_dataset_target_string_mq_res = {
             },
             "grouped_metrics": {
                 "true_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.3333333333333333,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.3333333333333333}
                 ],
                 "false_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.14285714285714285,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.14285714285714285}
                 ],
                 "precision": [{"timestamp": "2024-06-16 00:00:00", "value": 0.5}],
                 "recall": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.3333333333333333,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.3333333333333333}
                 ],
                 "f_measure": [{"timestamp": "2024-06-16 00:00:00", "value": 0.4}],
             },
@@ -476,9 +416,9 @@ test_calculation_dataset_target_string_mq_res = {
     "global_metrics": {
         "f1": 0.6171428571428572,
         "accuracy": 0.6,
-        "weighted_precision": 0.6749999999999999,
-        "weighted_recall": 0.6000000000000001,
-        "weighted_true_positive_rate": 0.6000000000000001,
+        "weighted_precision": 0.675,
+        "weighted_recall": 0.6,
+        "weighted_true_positive_rate": 0.6,
         "weighted_false_positive_rate": 0.10793650793650793,
         "weighted_f_measure": 0.6171428571428572,
         "confusion_matrix": [
@@ -525,22 +465,15 @@ test_calculation_dataset_perfect_classes_dq_res = {
             "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
                 "current_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
@@ -557,6 +490,7 @@ test_calculation_dataset_perfect_classes_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -582,9 +516,9 @@ test_calculation_dataset_perfect_classes_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
+                {"name": "A", "count": 5, "frequency": 0.5},
                 {"name": "B", "count": 4, "frequency": 0.4},
                 {"name": "C", "count": 1, "frequency": 0.1},
-                {"name": "A", "count": 5, "frequency": 0.5},
             ],
             "distinct_value": 3,
         },
@@ -593,8 +527,8 @@ test_calculation_dataset_perfect_classes_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "Y", "count": 1, "frequency": 0.1},
                 {"name": "X", "count": 9, "frequency": 0.9},
+                {"name": "Y", "count": 1, "frequency": 0.1},
             ],
             "distinct_value": 2,
         },
@@ -739,22 +673,15 @@ test_calculation_dataset_for_hour_dq_res = {
             "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
                 "current_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
@@ -771,6 +698,7 @@ test_calculation_dataset_for_hour_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -796,9 +724,9 @@ test_calculation_dataset_for_hour_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
+                {"name": "A", "count": 5, "frequency": 0.5},
                 {"name": "B", "count": 4, "frequency": 0.4},
                 {"name": "C", "count": 1, "frequency": 0.1},
-                {"name": "A", "count": 5, "frequency": 0.5},
             ],
             "distinct_value": 3,
         },
@@ -807,8 +735,8 @@ test_calculation_dataset_for_hour_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "Y", "count": 1, "frequency": 0.1},
                 {"name": "X", "count": 9, "frequency": 0.9},
+                {"name": "Y", "count": 1, "frequency": 0.1},
             ],
             "distinct_value": 2,
         },
@@ -905,10 +833,7 @@ test_calculation_dataset_for_hour_mq_res = {
                 ],
                 "f_measure": [
                     {"timestamp": "2024-06-16 00:00:00", "value": float("nan")},
-                    {
-                        "timestamp": "2024-06-16 01:00:00",
-                        "value": 0.6666666666666666,
-                    },
+                    {"timestamp": "2024-06-16 01:00:00", "value": 0.6666666666666666},
                     {"timestamp": "2024-06-16 02:00:00", "value": float("nan")},
                     {"timestamp": "2024-06-16 03:00:00", "value": 1.0},
                     {"timestamp": "2024-06-16 04:00:00", "value": float("nan")},
@@ -956,10 +881,7 @@ test_calculation_dataset_for_hour_mq_res = {
                 "f_measure": [
                     {"timestamp": "2024-06-16 00:00:00", "value": 1.0},
                     {"timestamp": "2024-06-16 01:00:00", "value": float("nan")},
-                    {
-                        "timestamp": "2024-06-16 02:00:00",
-                        "value": 0.6666666666666666,
-                    },
+                    {"timestamp": "2024-06-16 02:00:00", "value": 0.6666666666666666},
                     {"timestamp": "2024-06-16 03:00:00", "value": float("nan")},
                     {"timestamp": "2024-06-16 04:00:00", "value": float("nan")},
                 ],
@@ -969,10 +891,10 @@ test_calculation_dataset_for_hour_mq_res = {
     "global_metrics": {
         "f1": 0.6933333333333332,
         "accuracy": 0.7,
-        "weighted_precision": 0.7083333333333334,
+        "weighted_precision": 0.7083333333333333,
         "weighted_recall": 0.7,
         "weighted_true_positive_rate": 0.7,
-        "weighted_false_positive_rate": 0.16785714285714287,
+        "weighted_false_positive_rate": 0.16785714285714284,
         "weighted_f_measure": 0.6933333333333332,
         "confusion_matrix": [[3.0, 1.0, 1.0], [1.0, 2.0, 0.0], [0.0, 0.0, 2.0]],
     },
@@ -995,16 +917,10 @@ test_calculation_dataset_with_nulls_res = {
                     {"timestamp": "2024-06-16 00:00:00", "value": 1.0}
                 ],
                 "false_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.16666666666666666,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.16666666666666666}
                 ],
                 "precision": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.6666666666666666,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.6666666666666666}
                 ],
                 "recall": [{"timestamp": "2024-06-16 00:00:00", "value": 1.0}],
                 "f_measure": [{"timestamp": "2024-06-16 00:00:00", "value": 0.8}],
@@ -1024,10 +940,7 @@ test_calculation_dataset_with_nulls_res = {
                     {"timestamp": "2024-06-16 00:00:00", "value": 0.0}
                 ],
                 "false_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.2857142857142857,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.2857142857142857}
                 ],
                 "precision": [{"timestamp": "2024-06-16 00:00:00", "value": 0.0}],
                 "recall": [{"timestamp": "2024-06-16 00:00:00", "value": 0.0}],
@@ -1066,20 +979,14 @@ test_calculation_dataset_with_nulls_res = {
             },
             "grouped_metrics": {
                 "true_positive_rate": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.3333333333333333,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.3333333333333333}
                 ],
                 "false_positive_rate": [
                     {"timestamp": "2024-06-16 00:00:00", "value": 0.0}
                 ],
                 "precision": [{"timestamp": "2024-06-16 00:00:00", "value": 1.0}],
                 "recall": [
-                    {
-                        "timestamp": "2024-06-16 00:00:00",
-                        "value": 0.3333333333333333,
-                    }
+                    {"timestamp": "2024-06-16 00:00:00", "value": 0.3333333333333333}
                 ],
                 "f_measure": [{"timestamp": "2024-06-16 00:00:00", "value": 0.5}],
             },
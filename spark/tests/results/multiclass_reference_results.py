@@ -33,22 +33,15 @@ test_calculation_dataset_target_int_dq_res = {
             "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
         },
@@ -64,6 +57,7 @@ test_calculation_dataset_target_int_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -88,9 +82,9 @@ test_calculation_dataset_target_int_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
+                {"name": "A", "count": 5, "frequency": 0.5},
                 {"name": "B", "count": 4, "frequency": 0.4},
                 {"name": "C", "count": 1, "frequency": 0.1},
-                {"name": "A", "count": 5, "frequency": 0.5},
             ],
             "distinct_value": 3,
         },
@@ -99,8 +93,8 @@ test_calculation_dataset_target_int_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "Y", "count": 1, "frequency": 0.1},
                 {"name": "X", "count": 9, "frequency": 0.9},
+                {"name": "Y", "count": 1, "frequency": 0.1},
             ],
             "distinct_value": 2,
         },
@@ -203,22 +197,15 @@ test_calculation_dataset_target_string_dq_res = {
             "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
         },
@@ -234,6 +221,7 @@ test_calculation_dataset_target_string_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -258,9 +246,9 @@ test_calculation_dataset_target_string_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
+                {"name": "A", "count": 5, "frequency": 0.5},
                 {"name": "B", "count": 4, "frequency": 0.4},
                 {"name": "C", "count": 1, "frequency": 0.1},
-                {"name": "A", "count": 5, "frequency": 0.5},
             ],
             "distinct_value": 3,
         },
@@ -269,8 +257,8 @@ test_calculation_dataset_target_string_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "Y", "count": 1, "frequency": 0.1},
                 {"name": "X", "count": 9, "frequency": 0.9},
+                {"name": "Y", "count": 1, "frequency": 0.1},
             ],
             "distinct_value": 2,
         },
@@ -373,22 +361,15 @@ test_calculation_dataset_perfect_classes_dq_res = {
             "std": 0.75,
             "min": 0.5,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 1.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 1.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
-                "buckets": [
-                    0.5,
-                    0.75,
-                    1.0,
-                    1.25,
-                    1.5,
-                    1.75,
-                    2.0,
-                    2.25,
-                    2.5,
-                    2.75,
-                    3.0,
-                ],
+                "buckets": [0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 2.75, 3.0],
                 "reference_values": [2, 0, 5, 0, 1, 0, 0, 0, 0, 1],
             },
         },
@@ -404,6 +385,7 @@ test_calculation_dataset_perfect_classes_dq_res = {
                 "perc_25": 117.25,
                 "median": 250.0,
                 "perc_75": 499.0,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -428,9 +410,9 @@ test_calculation_dataset_perfect_classes_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
+                {"name": "A", "count": 5, "frequency": 0.5},
                 {"name": "B", "count": 4, "frequency": 0.4},
                 {"name": "C", "count": 1, "frequency": 0.1},
-                {"name": "A", "count": 5, "frequency": 0.5},
             ],
             "distinct_value": 3,
         },
@@ -439,8 +421,8 @@ test_calculation_dataset_perfect_classes_dq_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "Y", "count": 1, "frequency": 0.1},
                 {"name": "X", "count": 9, "frequency": 0.9},
+                {"name": "Y", "count": 1, "frequency": 0.1},
             ],
             "distinct_value": 2,
         },
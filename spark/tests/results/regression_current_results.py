@@ -20,7 +20,12 @@ test_data_quality_res = {
         "std": 317.1797010012979,
         "min": 9.0,
         "max": 1651.0,
-        "median_metrics": {"perc_25": 82.0, "median": 167.5, "perc_75": 354.0},
+        "median_metrics": {
+            "perc_25": 82.0,
+            "median": 167.5,
+            "perc_75": 354.0,
+            "quantile_mode": "EXACT",
+        },
         "histogram": {
             "buckets": [
                 2.0,
@@ -48,7 +53,12 @@ test_data_quality_res = {
             "std": 0.5573204290227127,
             "min": 1.0,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 2.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 2.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -80,6 +90,7 @@ test_data_quality_res = {
                 "perc_25": 0.19874975,
                 "median": 0.26749999999999996,
                 "perc_75": 0.3432335,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -112,6 +123,7 @@ test_data_quality_res = {
                 "perc_25": 0.2166045,
                 "median": 0.263879,
                 "perc_75": 0.339734,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -144,6 +156,7 @@ test_data_quality_res = {
                 "perc_25": 0.4671605,
                 "median": 0.538125,
                 "perc_75": 0.6866479999999999,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -176,6 +189,7 @@ test_data_quality_res = {
                 "perc_25": 0.165519,
                 "median": 0.22015,
                 "perc_75": 0.2636855,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -218,10 +232,10 @@ test_data_quality_res = {
             "type": "categorical",
             "missing_value": {"count": 1, "percentage": 1.0},
             "category_frequency": [
-                {"name": "1", "count": 28, "frequency": 0.28},
                 {"name": "3", "count": 32, "frequency": 0.32},
-                {"name": "4", "count": 10, "frequency": 0.1},
                 {"name": "2", "count": 29, "frequency": 0.29},
+                {"name": "1", "count": 28, "frequency": 0.28},
+                {"name": "4", "count": 10, "frequency": 0.1},
             ],
             "distinct_value": 4,
         },
@@ -230,8 +244,8 @@ test_data_quality_res = {
             "type": "categorical",
             "missing_value": {"count": 1, "percentage": 1.0},
             "category_frequency": [
-                {"name": "1", "count": 2, "frequency": 0.02},
                 {"name": "0", "count": 97, "frequency": 0.97},
+                {"name": "1", "count": 2, "frequency": 0.02},
             ],
             "distinct_value": 2,
         },
@@ -241,12 +255,12 @@ test_data_quality_res = {
             "missing_value": {"count": 1, "percentage": 1.0},
             "category_frequency": [
                 {"name": "1", "count": 15, "frequency": 0.15},
-                {"name": "6", "count": 13, "frequency": 0.13},
-                {"name": "3", "count": 14, "frequency": 0.14},
-                {"name": "5", "count": 14, "frequency": 0.14},
                 {"name": "4", "count": 15, "frequency": 0.15},
-                {"name": "2", "count": 14, "frequency": 0.14},
                 {"name": "0", "count": 14, "frequency": 0.14},
+                {"name": "2", "count": 14, "frequency": 0.14},
+                {"name": "3", "count": 14, "frequency": 0.14},
+                {"name": "5", "count": 14, "frequency": 0.14},
+                {"name": "6", "count": 13, "frequency": 0.13},
             ],
             "distinct_value": 7,
         },
@@ -265,13 +279,13 @@ test_data_quality_res = {
 
 test_model_quality_res = {
     "global_metrics": {
-        "mae": 71.82559791564941,
-        "mape": 64.05699022707124,
-        "mse": 17820.506660010054,
-        "rmse": 133.49347047706138,
-        "r2": 0.8210737408739541,
-        "adj_r2": 0.7987079584831984,
-        "variance": 118288.02759401732,
+        "mae": 71.82560000000001,
+        "mape": 64.05698977276327,
+        "mse": 17820.507872,
+        "rmse": 133.4934750165715,
+        "r2": 0.8210737287050057,
+        "adj_r2": 0.7987079447931315,
+        "variance": 118288.03041600005,
         "residuals": {
             "ks": {"p_value": -2.220446049250313e-16, "statistic": 0.6999575270692112},
             "correlation_coefficient": 0.9312137386402216,
@@ -292,359 +306,359 @@ test_model_quality_res = {
                 "values": [1, 1, 1, 2, 3, 20, 62, 6, 4],
             },
             "standardized_residuals": [
-                0.4446159899234772,
-                0.4991498291492462,
-                0.21789957582950592,
-                0.0040146526880562305,
-                0.5322710871696472,
-                0.13537704944610596,
-                -0.46778324246406555,
-                0.30202603340148926,
-                0.3025874197483063,
-                0.3220752477645874,
-                0.3298543393611908,
-                0.2805332839488983,
-                0.11059622466564178,
-                0.3782130181789398,
-                0.2687443494796753,
-                -0.7558501958847046,
-                -0.2531765401363373,
-                0.12960287928581238,
-                0.38510993123054504,
-                -0.5215151309967041,
-                0.22142823040485382,
-                0.4759729504585266,
-                0.5447818040847778,
-                0.32175445556640625,
-                0.14580263197422028,
-                -0.6692376732826233,
-                0.239151731133461,
-                -0.055330995470285416,
-                0.33458593487739563,
-                -0.6881641149520874,
-                0.20859673619270325,
-                0.2835005819797516,
-                -0.34492170810699463,
-                -0.41509392857551575,
-                0.2987379729747772,
-                -0.14009903371334076,
-                0.23297657072544098,
-                0.34469074010849,
-                0.20298296213150024,
-                0.5024378895759583,
-                0.6636335253715515,
-                -0.9259476661682129,
-                -1.318992257118225,
-                -0.24852512776851654,
-                0.35623908042907715,
-                -0.21764935553073883,
-                -2.853398084640503,
-                -3.805013418197632,
-                1.6875865459442139,
-                -0.3142865300178528,
-                0.464023619890213,
-                0.3198297321796417,
-                0.13216917216777802,
-                -0.6799840331077576,
-                0.32648608088493347,
-                -0.07842767983675003,
-                0.10426067560911179,
-                0.10426067560911179,
-                0.19929391145706177,
-                0.2117244154214859,
-                0.21413032710552216,
-                0.21413032710552216,
-                0.5585756897926331,
-                -0.10376987606287003,
-                -3.4072372913360596,
-                0.6151946187019348,
-                0.4379596412181854,
-                0.47204330563545227,
-                -2.8373587131500244,
-                0.2397933006286621,
-                -0.4462102949619293,
-                0.4345111846923828,
-                0.52144455909729,
-                0.6685255169868469,
-                0.6502406597137451,
-                0.7085437178611755,
-                -5.151036739349365,
-                -1.2634960412979126,
-                -0.25462010502815247,
-                1.2400882244110107,
-                -0.019322622567415237,
-                0.27876895666122437,
-                0.3636171817779541,
-                0.642541766166687,
-                2.0622661113739014,
-                0.43707749247550964,
-                -0.19054283201694489,
-                -0.05228351429104805,
-                -0.007694082800298929,
-                0.45030996203422546,
-                0.43411019444465637,
-                1.5360946655273438,
-                1.5385807752609253,
-                -0.3092341423034668,
-                -0.12959325313568115,
-                0.10827051848173141,
-                0.46995818614959717,
-                -0.37651926279067993,
-                0.4154243469238281,
-                0.020535197108983994,
+                -0.10376987373779561,
+                -0.00769408294542578,
+                0.4370774827761778,
+                0.3198297314085282,
+                0.38510994318230835,
+                0.4341102004228241,
+                -0.24852513448923672,
+                0.4991498217355215,
+                -3.805013527034486,
+                -0.05228351506609165,
+                0.43795964780014746,
+                0.5024378913703188,
+                0.4759729406512187,
+                0.544781812520879,
+                1.6875865026638381,
+                0.34469074572041003,
+                -0.19054283336829908,
+                -0.30923412750244555,
+                0.3220752423786336,
+                0.6425417365408277,
+                -2.8533980566319355,
+                0.2687443568386289,
+                -0.46778324135596305,
+                0.21789957272981234,
+                0.10426067827840368,
+                0.10426067827840368,
+                0.356239087852381,
+                0.1458026312253547,
+                0.23915173012545335,
+                0.3025874150309326,
+                0.1992939104060814,
+                -0.05533099423980595,
+                -3.4072372980443753,
+                0.45030995813572766,
+                1.5385808104332677,
+                0.3636171953255846,
+                -0.6692376541025675,
+                -0.7558502200923497,
+                0.2805332894316825,
+                0.1353770445784365,
+                -0.3765192597852484,
+                -0.14009903336128735,
+                -0.6799840280309294,
+                -0.31428652718518235,
+                -0.5215151109977725,
+                0.11059622708691536,
+                -0.6881641037077422,
+                0.5585756656229554,
+                0.32175445509719,
+                0.532271108544577,
+                -1.2634960929769057,
+                2.0622660473900063,
+                -1.3189922926666555,
+                0.4640236144174432,
+                0.2835005717850361,
+                -0.4462102966788782,
+                -5.1510369599719885,
+                0.5214445377958543,
+                0.6636335002957466,
+                0.23297657495766325,
+                1.2400882450499635,
+                -0.9259476760778386,
+                0.1321691717640002,
+                1.53609470900208,
+                0.2787689593837426,
+                0.2029829641426832,
+                -0.01932262189775778,
+                -2.8373586925597527,
+                0.6502406312954748,
+                0.0040146528272668285,
+                -0.21764935865028687,
+                0.6685255063377622,
+                0.3264860674984836,
+                0.46995817912415083,
+                0.12960287351245103,
+                0.3298543339536418,
+                0.44461598389010315,
+                0.20859674156794675,
+                -0.1295932498940082,
+                -0.4150939303788456,
+                -0.25462009283666576,
+                0.2117244175620222,
+                0.2397933046883405,
+                0.2987379676536091,
+                0.22142823282569232,
+                -0.25317655007016954,
+                -0.3449217125630499,
+                0.3020260372884062,
+                0.37821301663127005,
+                0.6151946207977574,
+                0.3345859463549355,
+                -0.07842767850374759,
+                0.21413032217284958,
+                0.21413032217284958,
+                0.10827051929644928,
+                0.4720432964535342,
+                0.7085437196978559,
+                0.4154243412787319,
+                0.020535197821613956,
+                0.4345111845246283,
             ],
             "predictions": [
-                113.83,
-                95.03,
-                104.1,
-                136.77,
-                130.9,
-                100.39,
-                161.6,
-                52.61,
-                54.54,
-                34.11,
-                46.14,
-                68.29,
-                257.48,
-                253.11,
-                132.76,
-                152.52,
-                158.84,
-                116.11,
+                702.21,
+                218.23,
+                466.77,
+                148.39,
                 76.25,
-                207.3,
-                171.66,
+                302.14,
+                220.26,
+                95.03,
+                1055.73,
+                372.79,
+                310.66,
+                135.62,
                 75.92,
                 167.34,
-                43.15,
+                477.84,
+                59.29,
+                295.03,
+                821.83,
+                34.11,
+                269.15,
+                984.07,
+                132.76,
+                161.6,
+                104.1,
+                117.27,
+                117.27,
+                222.85,
                 46.09,
-                170.72,
                 142.45,
+                54.54,
+                161.42,
                 196.17,
-                49.55,
+                588.13,
+                172.12,
+                1508.42,
+                169.93,
+                170.72,
+                152.52,
+                68.29,
+                100.39,
+                268.22,
+                186.74,
+                254.06,
+                283.46,
+                207.3,
+                257.48,
                 182.08,
-                95.26,
+                193.62,
+                43.15,
+                130.9,
+                1630.82,
+                773.12,
+                421.74,
+                65.41,
                 74.92,
-                180.28,
-                201.03,
-                366.02,
-                186.74,
-                84.22,
-                59.29,
-                70.96,
-                135.62,
+                828.91,
+                1575.57,
+                343.25,
                 254.52,
+                84.22,
+                295.64,
                 561.73,
-                421.74,
-                220.26,
-                222.85,
-                335.41,
-                984.07,
-                1055.73,
-                477.84,
-                283.46,
-                65.41,
-                148.39,
                 132.79,
-                254.06,
+                755.73,
+                217.51,
+                70.96,
+                511.68,
+                449.07,
+                289.19,
+                136.77,
+                335.41,
+                254.91,
                 432.56,
-                753.05,
-                117.27,
-                117.27,
-                161.42,
+                561.67,
+                116.11,
+                46.14,
+                113.83,
+                95.26,
+                232.43,
+                201.03,
+                1128.02,
                 253.87,
+                266.37,
+                366.02,
+                171.66,
+                158.84,
+                180.28,
+                52.61,
+                253.11,
+                216.56,
+                49.55,
+                753.05,
                 145.57,
                 145.57,
-                193.62,
-                702.21,
-                588.13,
-                216.56,
-                310.66,
+                448.77,
                 181.41,
-                449.07,
-                266.37,
-                828.91,
-                977.09,
-                343.25,
-                254.91,
-                289.19,
                 384.92,
-                1575.57,
-                1630.82,
-                1128.02,
-                295.64,
-                511.68,
-                217.51,
-                169.93,
-                269.15,
-                773.12,
-                466.77,
-                295.03,
-                372.79,
-                218.23,
-                172.12,
-                302.14,
-                755.73,
-                1508.42,
-                821.83,
-                232.43,
-                448.77,
-                561.67,
-                268.22,
                 876.47,
                 1234.71,
+                977.09,
             ],
             "targets": [
-                120,
-                108,
-                82,
-                88,
-                148,
-                68,
-                54,
-                41,
-                43,
-                25,
-                38,
-                54,
-                222,
-                251,
-                117,
-                9,
-                78,
-                83,
+                640,
+                168,
+                472,
+                139,
                 75,
-                93,
-                150,
+                307,
+                140,
+                108,
+                532,
+                317,
+                316,
+                149,
                 86,
                 186,
-                34,
-                15,
-                38,
-                123,
-                140,
-                42,
-                47,
-                72,
-                61,
-                88,
-                100,
-                354,
-                120,
-                64,
+                639,
                 53,
-                47,
-                149,
-                288,
-                397,
-                208,
-                140,
-                218,
-                259,
+                222,
+                734,
+                25,
+                300,
                 579,
-                532,
-                639,
-                195,
-                74,
-                139,
-                100,
-                120,
-                424,
-                694,
+                117,
+                54,
+                82,
                 81,
                 81,
-                137,
-                231,
-                123,
+                218,
+                15,
                 123,
-                214,
-                640,
+                43,
+                137,
+                140,
                 114,
-                244,
-                316,
-                191,
-                46,
-                247,
+                179,
+                1651,
+                166,
+                38,
+                9,
+                54,
+                68,
+                172,
+                120,
+                120,
+                195,
+                93,
+                222,
+                47,
+                214,
+                34,
+                148,
+                1424,
+                981,
+                208,
+                74,
+                61,
                 724,
-                982,
-                359,
-                289,
-                321,
-                424,
                 884,
-                1424,
-                1047,
+                359,
+                288,
+                64,
                 401,
-                460,
-                203,
-                166,
-                300,
-                981,
-                472,
-                222,
-                317,
-                168,
-                179,
-                307,
+                397,
+                100,
                 898,
-                1651,
-                734,
+                203,
+                47,
+                460,
+                46,
+                321,
+                88,
+                259,
+                289,
+                424,
+                571,
+                83,
+                38,
+                120,
+                72,
                 167,
+                100,
+                1047,
+                231,
+                247,
+                354,
+                150,
+                78,
+                88,
+                41,
+                251,
+                244,
+                42,
+                694,
+                123,
+                123,
                 413,
-                571,
-                172,
+                191,
+                424,
                 879,
                 1188,
+                982,
             ],
             "regression_line": {
-                "coefficient": 1.0043705635148725,
-                "intercept": 48.00912425270233,
+                "coefficient": 1.004370563514872,
+                "intercept": 48.00912425270246,
             },
         },
     },
     "grouped_metrics": {
         "mae": [
-            {"timestamp": "2011-01-01 00:00:00", "value": 35.67896665375808},
-            {"timestamp": "2011-02-01 00:00:00", "value": 89.13965238373855},
-            {"timestamp": "2011-03-01 00:00:00", "value": 91.54030847549438},
-            {"timestamp": "2011-04-01 00:00:00", "value": 63.352996826171875},
+            {"timestamp": "2011-01-01 00:00:00", "value": 35.67896551724138},
+            {"timestamp": "2011-02-01 00:00:00", "value": 89.1396551724138},
+            {"timestamp": "2011-03-01 00:00:00", "value": 91.54031249999998},
+            {"timestamp": "2011-04-01 00:00:00", "value": 63.352999999999994},
         ],
         "mape": [
-            {"timestamp": "2011-01-01 00:00:00", "value": 106.34668638669385},
-            {"timestamp": "2011-02-01 00:00:00", "value": 50.266650033642435},
-            {"timestamp": "2011-03-01 00:00:00", "value": 53.63275529139244},
-            {"timestamp": "2011-04-01 00:00:00", "value": 14.766409719281478},
+            {"timestamp": "2011-01-01 00:00:00", "value": 106.34668362054698},
+            {"timestamp": "2011-02-01 00:00:00", "value": 50.26665120922357},
+            {"timestamp": "2011-03-01 00:00:00", "value": 53.63275511849746},
+            {"timestamp": "2011-04-01 00:00:00", "value": 14.766410342106367},
         ],
         "mse": [
-            {"timestamp": "2011-01-01 00:00:00", "value": 2848.1117152678507},
-            {"timestamp": "2011-02-01 00:00:00", "value": 21631.812814960613},
-            {"timestamp": "2011-03-01 00:00:00", "value": 31460.34954782362},
-            {"timestamp": "2011-04-01 00:00:00", "value": 6540.166909402423},
+            {"timestamp": "2011-01-01 00:00:00", "value": 2848.111568965518},
+            {"timestamp": "2011-02-01 00:00:00", "value": 21631.813796551716},
+            {"timestamp": "2011-03-01 00:00:00", "value": 31460.352303125},
+            {"timestamp": "2011-04-01 00:00:00", "value": 6540.1677899999995},
         ],
         "rmse": [
-            {"timestamp": "2011-01-01 00:00:00", "value": 53.36770292290882},
-            {"timestamp": "2011-02-01 00:00:00", "value": 147.07757414018158},
-            {"timestamp": "2011-03-01 00:00:00", "value": 177.37065582509305},
-            {"timestamp": "2011-04-01 00:00:00", "value": 80.87129842782556},
+            {"timestamp": "2011-01-01 00:00:00", "value": 53.367701552207755},
+            {"timestamp": "2011-02-01 00:00:00", "value": 147.07757747716582},
+            {"timestamp": "2011-03-01 00:00:00", "value": 177.3706635921651},
+            {"timestamp": "2011-04-01 00:00:00", "value": 80.87130387226361},
         ],
         "r2": [
-            {"timestamp": "2011-01-01 00:00:00", "value": 0.17834457710460982},
-            {"timestamp": "2011-02-01 00:00:00", "value": 0.3895389519246505},
-            {"timestamp": "2011-03-01 00:00:00", "value": 0.7043715304337479},
-            {"timestamp": "2011-04-01 00:00:00", "value": 0.9678020649997567},
+            {"timestamp": "2011-01-01 00:00:00", "value": 0.17834461931155876},
+            {"timestamp": "2011-02-01 00:00:00", "value": 0.3895389242236371},
+            {"timestamp": "2011-03-01 00:00:00", "value": 0.7043715045425691},
+            {"timestamp": "2011-04-01 00:00:00", "value": 0.9678020606644815},
         ],
         "adj_r2": [
-            {"timestamp": "2011-01-01 00:00:00", "value": -0.3533148141806426},
-            {"timestamp": "2011-02-01 00:00:00", "value": -0.005465255653516854},
-            {"timestamp": "2011-03-01 00:00:00", "value": 0.5417758721723092},
-            {"timestamp": "2011-04-01 00:00:00", "value": 1.1448907075010948},
+            {"timestamp": "2011-01-01 00:00:00", "value": -0.3533147446633149},
+            {"timestamp": "2011-02-01 00:00:00", "value": -0.005465301278715362},
+            {"timestamp": "2011-03-01 00:00:00", "value": 0.5417758320409822},
+            {"timestamp": "2011-04-01 00:00:00", "value": 1.1448907270098334},
         ],
         "variance": [
-            {"timestamp": "2011-01-01 00:00:00", "value": 4720.867246089001},
-            {"timestamp": "2011-02-01 00:00:00", "value": 70942.48575413873},
-            {"timestamp": "2011-03-01 00:00:00", "value": 150522.0080596708},
-            {"timestamp": "2011-04-01 00:00:00", "value": 163422.9263027128},
+            {"timestamp": "2011-01-01 00:00:00", "value": 4720.867098097505},
+            {"timestamp": "2011-02-01 00:00:00", "value": 70942.4877085612},
+            {"timestamp": "2011-03-01 00:00:00", "value": 150522.01462734363},
+            {"timestamp": "2011-04-01 00:00:00", "value": 163422.92378999983},
         ],
     },
 }
@@ -653,14 +667,14 @@ test_model_quality_abalone_res = {
     "global_metrics": {
         "mae": 1.9353551476456505,
         "mape": 31.485240568260803,
-        "mse": 27.08087257249268,
+        "mse": 27.080872572492684,
         "rmse": 5.203928571040602,
-        "r2": 0.5889298283658604,
-        "adj_r2": 0.5879429967988539,
-        "variance": 66.05376508457398,
+        "r2": 0.5889298283658606,
+        "adj_r2": 0.5879429967988541,
+        "variance": 66.05376508457383,
         "residuals": {
             "ks": {"p_value": 4.479538961987828e-11, "statistic": 0.40476190476190477},
-            "correlation_coefficient": 0.7947413198857094,
+            "correlation_coefficient": 0.7947413198857097,
             "histogram": {
                 "buckets": [
                     -27.0,
@@ -678,11291 +692,11291 @@ test_model_quality_abalone_res = {
                 "values": [21, 36, 79, 130, 121, 3099, 120, 66, 53, 34],
             },
             "standardized_residuals": [
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                -0.7640066146850586,
-                -0.5718676447868347,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.3495217561721802,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.4237446784973145,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.6944942474365234,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.9652438759803772,
-                1.3495217561721802,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.6944942474365234,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.877534866333008,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.19668811559677124,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.847327947616577,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                1.733799695968628,
-                0.004549179691821337,
-                1.5416606664657593,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                4.2316060066223145,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.847327947616577,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.5416606664657593,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.0787723064422607,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.453951835632324,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                1.925938606262207,
-                0.7731049656867981,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.877534866333008,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.222507476806641,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.261812925338745,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.3102164268493652,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.453951835632324,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.19668811559677124,
-                3.0787723064422607,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.9561455249786377,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                5.000161647796631,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                -2.877534866333008,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                -0.18758976459503174,
-                -3.8382296562194824,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.38882705569267273,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.069673776626587,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.0787723064422607,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.069673776626587,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.3102164268493652,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.877534866333008,
-                0.004549179691821337,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.655189037322998,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                3.0787723064422607,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                -4.222507476806641,
-                0.004549179691821337,
-                2.5023553371429443,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                4.2316060066223145,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.27091121673584,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.2316060066223145,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.925938606262207,
-                -3.069673776626587,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.2316060066223145,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                4.039466857910156,
-                0.004549179691821337,
-                3.27091121673584,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.5416606664657593,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.069673776626587,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.8866333961486816,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.847327947616577,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.222507476806641,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.877534866333008,
-                -4.991063117980957,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                2.118077516555786,
-                3.0787723064422607,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.655189037322998,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.069673776626587,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.8866333961486816,
-                0.004549179691821337,
-                0.38882705569267273,
-                -2.6853959560394287,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                1.5416606664657593,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.5416606664657593,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.261812925338745,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                4.039466857910156,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                3.0787723064422607,
-                0.004549179691821337,
-                -4.798924446105957,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.5023553371429443,
-                -0.5718676447868347,
-                -3.261812925338745,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.3102164268493652,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.261812925338745,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.118077516555786,
-                -0.7640066146850586,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                -0.9561455249786377,
-                3.0787723064422607,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.733799695968628,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.261812925338745,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.615883827209473,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.7731049656867981,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.8866333961486816,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.222507476806641,
-                -3.261812925338745,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.733799695968628,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.9561455249786377,
-                1.3495217561721802,
-                2.5023553371429443,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.877534866333008,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.8866333961486816,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.7640066146850586,
-                2.118077516555786,
-                0.004549179691821337,
-                -1.7247012853622437,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.847327947616577,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                -2.3011181354522705,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.463050127029419,
-                -0.5718676447868347,
-                1.157382845878601,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                -4.991063117980957,
-                1.157382845878601,
-                3.847327947616577,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.7731049656867981,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                -4.030368804931641,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                2.5023553371429443,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.463050127029419,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.5416606664657593,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.606785297393799,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.8382296562194824,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.7640066146850586,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.6460907459259033,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                2.3102164268493652,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.030368804931641,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.8382296562194824,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.808022499084473,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.3102164268493652,
-                0.004549179691821337,
-                3.847327947616577,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                -3.069673776626587,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.925938606262207,
-                4.2316060066223145,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.039466857910156,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.655189037322998,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.2316060066223145,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.615883827209473,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.8866333961486816,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.7731049656867981,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.261812925338745,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.606785297393799,
-                0.004549179691821337,
-                0.7731049656867981,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.463050127029419,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.5023553371429443,
-                -3.261812925338745,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                4.2316060066223145,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                4.039466857910156,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.030368804931641,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.069673776626587,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.453951835632324,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.118077516555786,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.4237446784973145,
-                4.4237446784973145,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                -1.7247012853622437,
-                3.463050127029419,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.5416606664657593,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                2.3102164268493652,
-                0.004549179691821337,
-                -4.222507476806641,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.5023553371429443,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.463050127029419,
-                -3.453951835632324,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.655189037322998,
-                0.7731049656867981,
-                0.004549179691821337,
-                2.5023553371429443,
-                0.004549179691821337,
-                1.5416606664657593,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.0787723064422607,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.19668811559677124,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.069673776626587,
-                0.004549179691821337,
-                2.8866333961486816,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.7731049656867981,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.453951835632324,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.463050127029419,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.4237446784973145,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.9561455249786377,
-                0.7731049656867981,
-                -3.261812925338745,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.5416606664657593,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.877534866333008,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.463050127029419,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.261812925338745,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.222507476806641,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                -1.9168401956558228,
-                0.38882705569267273,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.7731049656867981,
-                3.847327947616577,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.453951835632324,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                4.4237446784973145,
-                0.004549179691821337,
-                2.3102164268493652,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.7640066146850586,
-                4.039466857910156,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.877534866333008,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.5416606664657593,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.606785297393799,
-                0.004549179691821337,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                3.27091121673584,
-                0.004549179691821337,
-                1.157382845878601,
-                -2.877534866333008,
-                0.9652438759803772,
-                0.004549179691821337,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.6460907459259033,
-                0.004549179691821337,
-                1.3495217561721802,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.069673776626587,
-                0.004549179691821337,
-                -3.8382296562194824,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.069673776626587,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.877534866333008,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.7640066146850586,
-                -1.3404234647750854,
-                0.7731049656867981,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.463050127029419,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                -1.1482844352722168,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.3102164268493652,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.9652438759803772,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.615883827209473,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.463050127029419,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.3102164268493652,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.9561455249786377,
-                1.157382845878601,
-                1.157382845878601,
-                0.004549179691821337,
-                -0.9561455249786377,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                2.6944942474365234,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.733799695968628,
-                0.38882705569267273,
-                -1.9168401956558228,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                3.847327947616577,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.414646625518799,
-                2.5023553371429443,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.877534866333008,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.7731049656867981,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.991063117980957,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                0.004549179691821337,
-                2.5023553371429443,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.615883827209473,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.0787723064422607,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                -2.1089792251586914,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.5023553371429443,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.5416606664657593,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                -3.6460907459259033,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.261812925338745,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.7731049656867981,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                -0.3797287046909332,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.7731049656867981,
-                4.039466857910156,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.261812925338745,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.261812925338745,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.5416606664657593,
-                0.004549179691821337,
-                -4.222507476806641,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.6944942474365234,
-                2.6944942474365234,
-                1.925938606262207,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.118077516555786,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.3102164268493652,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.7731049656867981,
-                0.7731049656867981,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.4237446784973145,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.606785297393799,
-                -4.991063117980957,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.0787723064422607,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.0787723064422607,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.414646625518799,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.039466857910156,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.8866333961486816,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.615883827209473,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.7247012853622437,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.2316060066223145,
-                0.004549179691821337,
-                -0.5718676447868347,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.8382296562194824,
-                4.039466857910156,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.8866333961486816,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.6944942474365234,
-                0.004549179691821337,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                1.925938606262207,
-                -0.3797287046909332,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.3797287046909332,
-                3.655189037322998,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.6460907459259033,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                -0.3797287046909332,
-                0.004549179691821337,
-                -0.9561455249786377,
-                -4.414646625518799,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                2.5023553371429443,
-                0.004549179691821337,
-                2.5023553371429443,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.463050127029419,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.7731049656867981,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.7731049656867981,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                4.039466857910156,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                -2.1089792251586914,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.030368804931641,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.6944942474365234,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                3.655189037322998,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.6460907459259033,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.3102164268493652,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.5023553371429443,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.9652438759803772,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.6853959560394287,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.5325623750686646,
-                -0.18758976459503174,
-                4.2316060066223145,
-                -3.453951835632324,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                0.004549179691821337,
-                -1.5325623750686646,
-                4.4237446784973145,
-                1.925938606262207,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.3102164268493652,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                2.5023553371429443,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -5.183202266693115,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.8866333961486816,
-                0.004549179691821337,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.1089792251586914,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.5809659957885742,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.3102164268493652,
-                -0.5718676447868347,
-                0.004549179691821337,
-                1.733799695968628,
-                -3.261812925338745,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.1482844352722168,
-                2.118077516555786,
-                0.004549179691821337,
-                1.157382845878601,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                -1.1482844352722168,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                -2.3011181354522705,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.3102164268493652,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.7731049656867981,
-                0.004549179691821337,
-                0.38882705569267273,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.655189037322998,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                4.615883827209473,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.5416606664657593,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.157382845878601,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.7731049656867981,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.27091121673584,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.18758976459503174,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                5.000161647796631,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.5416606664657593,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.7640066146850586,
-                0.004549179691821337,
-                0.004549179691821337,
-                -3.8382296562194824,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.3404234647750854,
-                0.004549179691821337,
-                -2.6853959560394287,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                1.733799695968628,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.655189037322998,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.118077516555786,
-                -0.9561455249786377,
-                0.004549179691821337,
-                0.004549179691821337,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                2.118077516555786,
-                1.5416606664657593,
-                2.118077516555786,
-                0.004549179691821337,
-                0.004549179691821337,
-                -4.414646625518799,
-                -0.5718676447868347,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                3.655189037322998,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -2.4932570457458496,
-                0.004549179691821337,
-                0.19668811559677124,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                -1.9168401956558228,
-                1.3495217561721802,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
-                0.004549179691821337,
+                -0.3797287029586909,
+                2.1180775330733925,
+                2.1180775330733925,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                3.4630501217060528,
+                4.039466945405764,
+                4.039466945405764,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -2.301118115291063,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                1.1573828269072066,
+                1.1573828269072066,
+                1.1573828269072066,
+                4.231605886639001,
+                4.231605886639001,
+                4.231605886639001,
+                -1.7247012915913513,
+                -1.7247012915913513,
+                -1.7247012915913513,
+                -1.7247012915913513,
+                0.38882706197425787,
+                -1.9168402328245886,
+                1.541660709373681,
+                4.423744827872239,
+                -2.6853959977575372,
+                -2.6853959977575372,
+                0.38882706197425787,
+                0.7731049444407322,
+                0.7731049444407322,
+                -0.9561455266584026,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                1.9259385918401553,
+                -0.7640065854251653,
+                3.2709111804728157,
+                0.19668812074102068,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                -0.9561455266584026,
+                -0.9561455266584026,
+                -0.9561455266584026,
+                2.694494356773104,
+                -2.1089791740578256,
+                0.7731049444407322,
+                -1.9168402328245886,
+                1.9259385918401553,
+                -0.18758976172545372,
+                0.38882706197425787,
+                0.38882706197425787,
+                1.7337996506069182,
+                1.7337996506069182,
+                3.6551890629392902,
+                1.3495217681404437,
+                1.3495217681404437,
+                3.2709111804728157,
+                3.2709111804728157,
+                4.231605886639001,
+                4.231605886639001,
+                4.231605886639001,
+                -2.6853959977575372,
+                -2.4932570565243,
+                -2.4932570565243,
+                0.7731049444407322,
+                -0.7640065854251653,
+                -0.7640065854251653,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                3.8473280041725273,
+                3.8473280041725273,
+                -0.3797287029586909,
+                4.039466945405764,
+                4.039466945405764,
+                4.039466945405764,
+                4.039466945405764,
+                -2.6853959977575372,
+                -3.4539517626904863,
+                -3.4539517626904863,
+                -1.340423409124877,
+                1.3495217681404437,
+                1.3495217681404437,
+                -3.0696738802240118,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                -0.3797287029586909,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                -0.9561455266584026,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -0.571867644191928,
+                -0.9561455266584026,
+                0.19668812074102068,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -0.18758976172545372,
+                -3.0696738802240118,
+                0.580966003207495,
+                -2.301118115291063,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                -0.7640065854251653,
+                1.3495217681404437,
+                1.3495217681404437,
+                1.3495217681404437,
+                -4.606785410089909,
+                2.694494356773104,
+                0.38882706197425787,
+                4.423744827872239,
+                2.3102164743066296,
+                -2.6853959977575372,
+                -2.6853959977575372,
+                -2.6853959977575372,
+                -4.414646468856672,
+                -4.414646468856672,
+                3.8473280041725273,
+                2.3102164743066296,
+                0.19668812074102068,
+                -2.1089791740578256,
+                2.1180775330733925,
+                2.1180775330733925,
+                3.2709111804728157,
+                3.2709111804728157,
+                -0.7640065854251653,
+                2.1180775330733925,
+                2.1180775330733925,
+                2.1180775330733925,
+                -0.571867644191928,
+                -0.571867644191928,
+                -2.301118115291063,
+                3.0787722392395787,
+                3.4630501217060528,
+                -2.6853959977575372,
+                2.694494356773104,
+                -2.4932570565243,
+                0.19668812074102068,
+                0.19668812074102068,
+                4.231605886639001,
+                4.231605886639001,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                -1.340423409124877,
+                0.9652438856739693,
+                0.580966003207495,
+                0.580966003207495,
+                0.580966003207495,
+                0.19668812074102068,
+                2.3102164743066296,
+                0.38882706197425787,
+                -3.261812821457249,
+                2.3102164743066296,
+                2.3102164743066296,
+                1.1573828269072066,
+                1.1573828269072066,
+                1.1573828269072066,
+                1.1573828269072066,
+                -2.4932570565243,
+                -2.4932570565243,
+                -2.4932570565243,
+                -2.4932570565243,
+                2.502355415539867,
+                2.1180775330733925,
+                -2.4932570565243,
+                -2.4932570565243,
+                3.6551890629392902,
+                3.6551890629392902,
+                -2.8775349389907747,
+                -2.8775349389907747,
+                -1.7247012915913513,
+                0.9652438856739693,
+                -1.340423409124877,
+                -1.340423409124877,
+                -1.340423409124877,
+                2.886633298006341,
+                -0.7640065854251653,
+                -0.7640065854251653,
+                -0.3797287029586909,
+                -0.3797287029586909,
+                -2.8775349389907747,
+                -3.261812821457249,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -1.9168402328245886,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                -1.1482844678916397,
+                2.1180775330733925,
+                0.580966003207495,
+                -1.7247012915913513,
+                -2.8775349389907747,
+                -2.8775349389907747,
+                0.38882706197425787,
+                1.7337996506069182,
+                -1.7247012915913513,
+                -0.3797287029586909,
+                -0.7640065854251653,
+                -2.301118115291063,
+                -2.6853959977575372,
+                0.19668812074102068,
+                0.19668812074102068,
+                0.19668812074102068,
+                -3.4539517626904863,
+                -3.4539517626904863,
+                -3.4539517626904863,
+                2.1180775330733925,
+                2.1180775330733925,
+                -5.183202233789621,
+                -0.7640065854251653,
+                -3.261812821457249,
+                -3.261812821457249,
+                -3.261812821457249,
+                -3.261812821457249,
+                -0.571867644191928,
+                -2.8775349389907747,
+                -1.532562350358114,
+                1.1573828269072066,
+                -1.9168402328245886,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                -1.532562350358114,
+                -1.532562350358114,
+                -0.3797287029586909,
+                1.9259385918401553,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                -0.571867644191928,
+                -0.571867644191928,
+                -1.9168402328245886,
+                -1.9168402328245886,
+                -1.9168402328245886,
+                3.2709111804728157,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                2.3102164743066296,
+                2.3102164743066296,
+                2.3102164743066296,
+                -4.414646468856672,
+                -0.571867644191928,
+                -0.571867644191928,
+                0.19668812074102068,
+                -0.9561455266584026,
+                -0.9561455266584026,
+                3.0787722392395787,
+                -1.340423409124877,
+                -1.340423409124877,
+                -1.340423409124877,
+                -2.6853959977575372,
+                3.6551890629392902,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -2.8775349389907747,
+                -3.6460907039237234,
+                3.0787722392395787,
+                3.0787722392395787,
+                3.0787722392395787,
+                -3.8382296451569604,
+                -0.571867644191928,
+                -1.9168402328245886,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                1.1573828269072066,
+                2.886633298006341,
+                0.19668812074102068,
+                0.580966003207495,
+                4.039466945405764,
+                3.6551890629392902,
+                -2.6853959977575372,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                -3.261812821457249,
+                -3.261812821457249,
+                -3.261812821457249,
+                -2.4932570565243,
+                -2.4932570565243,
+                2.3102164743066296,
+                3.4630501217060528,
+                3.4630501217060528,
+                -1.532562350358114,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                1.9259385918401553,
+                1.9259385918401553,
+                0.9652438856739693,
+                -0.571867644191928,
+                -0.571867644191928,
+                0.19668812074102068,
+                -2.6853959977575372,
+                -2.6853959977575372,
+                -1.1482844678916397,
+                -3.0696738802240118,
+                -2.1089791740578256,
+                0.19668812074102068,
+                -3.6460907039237234,
+                -3.6460907039237234,
+                2.1180775330733925,
+                2.1180775330733925,
+                -0.571867644191928,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                2.3102164743066296,
+                3.4630501217060528,
+                3.4630501217060528,
+                -0.9561455266584026,
+                -0.9561455266584026,
+                -1.7247012915913513,
+                -1.9168402328245886,
+                -1.9168402328245886,
+                -1.9168402328245886,
+                -1.9168402328245886,
+                -0.9561455266584026,
+                -0.9561455266584026,
+                -0.9561455266584026,
+                0.9652438856739693,
+                3.2709111804728157,
+                -0.7640065854251653,
+                -4.222507527623435,
+                -0.571867644191928,
+                3.6551890629392902,
+                3.6551890629392902,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -1.7247012915913513,
+                -1.7247012915913513,
+                -1.7247012915913513,
+                -1.7247012915913513,
+                -0.7640065854251653,
+                -0.7640065854251653,
+                -0.7640065854251653,
+                -0.18758976172545372,
+                -0.3797287029586909,
+                -4.030368586390198,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -3.0696738802240118,
+                -2.301118115291063,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -2.6853959977575372,
+                0.7731049444407322,
+                -0.7640065854251653,
+                0.38882706197425787,
+                0.19668812074102068,
+                0.19668812074102068,
+                0.19668812074102068,
+                0.19668812074102068,
+                -1.532562350358114,
+                2.886633298006341,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -0.18758976172545372,
+                0.38882706197425787,
+                0.38882706197425787,
+                -1.340423409124877,
+                0.38882706197425787,
+                0.38882706197425787,
+                0.7731049444407322,
+                0.580966003207495,
+                0.580966003207495,
+                0.580966003207495,
+                0.580966003207495,
+                1.9259385918401553,
+                1.9259385918401553,
+                0.9652438856739693,
+                -0.3797287029586909,
+                -0.3797287029586909,
+                0.9652438856739693,
+                0.9652438856739693,
+                -4.222507527623435,
+                -4.222507527623435,
+                2.3102164743066296,
+                2.3102164743066296,
+                1.541660709373681,
+                1.541660709373681,
+                -1.9168402328245886,
+                -1.9168402328245886,
+                2.1180775330733925,
+                2.1180775330733925,
+                2.1180775330733925,
+                2.1180775330733925,
+                2.1180775330733925,
+                0.9652438856739693,
+                0.9652438856739693,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                -2.301118115291063,
+                1.541660709373681,
+                1.1573828269072066,
+                1.1573828269072066,
+                1.1573828269072066,
+                1.1573828269072066,
+                -0.571867644191928,
+                1.9259385918401553,
+                1.9259385918401553,
+                -1.7247012915913513,
+                -1.7247012915913513,
+                0.580966003207495,
+                0.580966003207495,
+                0.9652438856739693,
+                4.615883769105476,
+                4.615883769105476,
+                4.615883769105476,
+                3.0787722392395787,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                2.502355415539867,
+                2.502355415539867,
+                2.502355415539867,
+                0.19668812074102068,
+                0.38882706197425787,
+                0.38882706197425787,
+                0.38882706197425787,
+                0.9652438856739693,
+                -0.3797287029586909,
+                -0.3797287029586909,
+                0.7731049444407322,
+                -2.6853959977575372,
+                2.1180775330733925,
+                2.1180775330733925,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                1.7337996506069182,
+                0.38882706197425787,
+                0.38882706197425787,
+                -0.3797287029586909,
+                -3.0696738802240118,
+                -3.0696738802240118,
+                -3.0696738802240118,
+                2.3102164743066296,
+                -1.9168402328245886,
+                -1.9168402328245886,
+                -1.9168402328245886,
+                -1.9168402328245886,
+                3.0787722392395787,
+                -2.6853959977575372,
+                0.19668812074102068,
+                0.19668812074102068,
+                1.541660709373681,
+                1.1573828269072066,
+                0.38882706197425787,
+                0.38882706197425787,
+                0.7731049444407322,
+                0.19668812074102068,
+                -3.261812821457249,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                -3.261812821457249,
+                1.7337996506069182,
+                1.7337996506069182,
+                1.7337996506069182,
+                -1.340423409124877,
+                -1.340423409124877,
+                -4.606785410089909,
+                -1.1482844678916397,
+                3.6551890629392902,
+                0.9652438856739693,
+                0.9652438856739693,
+                0.9652438856739693,
+                1.9259385918401553,
+                1.9259385918401553,
+                -2.301118115291063,
+                -2.4932570565243,
+                -2.4932570565243,
+                -2.4932570565243,
+                0.9652438856739693,
+                -1.532562350358114,
+                1.1573828269072066,
+                1.1573828269072066,
+                0.38882706197425787,
+                0.38882706197425787,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -1.9168402328245886,
+                -0.9561455266584026,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -0.7640065854251653,
+                3.4630501217060528,
+                3.4630501217060528,
+                3.4630501217060528,
+                -0.3797287029586909,
+                -0.3797287029586909,
+                -0.3797287029586909,
+                0.38882706197425787,
+                -0.571867644191928,
+                -3.6460907039237234,
+                -3.6460907039237234,
+                -2.8775349389907747,
+                -1.340423409124877,
+                -1.340423409124877,
+                -2.301118115291063,
+                -2.301118115291063,
+                -2.301118115291063,
+                4.615883769105476,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                2.502355415539867,
+                2.502355415539867,
+                2.502355415539867,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                3.4630501217060528,
+                1.1573828269072066,
+                1.1573828269072066,
+                2.886633298006341,
+                3.8473280041725273,
+                0.7731049444407322,
+                3.2709111804728157,
+                3.2709111804728157,
+                1.9259385918401553,
+                -2.4932570565243,
+                -2.4932570565243,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                0.580966003207495,
+                0.580966003207495,
+                2.694494356773104,
+                2.694494356773104,
+                0.9652438856739693,
+                0.9652438856739693,
+                -0.571867644191928,
+                2.886633298006341,
+                2.886633298006341,
+                0.19668812074102068,
+                0.19668812074102068,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.7731049444407322,
+                0.7731049444407322,
+                -0.3797287029586909,
+                0.9652438856739693,
+                0.9652438856739693,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                1.9259385918401553,
+                0.38882706197425787,
+                -2.6853959977575372,
+                -2.6853959977575372,
+                -2.6853959977575372,
+                0.7731049444407322,
+                0.7731049444407322,
+                1.7337996506069182,
+                -4.030368586390198,
+                -0.571867644191928,
+                -1.532562350358114,
+                -1.532562350358114,
+                -1.532562350358114,
+                -1.7247012915913513,
+                2.502355415539867,
+                2.502355415539867,
+                -0.9561455266584026,
+                0.7731049444407322,
+                0.7731049444407322,
+                0.7731049444407322,
+                3.8473280041725273,
+                3.8473280041725273,
+                -0.9561455266584026,
+                -2.4932570565243,
+                -2.4932570565243,
+                0.580966003207495,
+                3.2709111804728157,
+                3.2709111804728157,
+                3.2709111804728157,
+                -1.7247012915913513,
+                3.0787722392395787,
+                3.0787722392395787,
+                -1.532562350358114,
+                -0.9561455266584026,
+                -0.9561455266584026,
+                0.9652438856739693,
+                -0.7640065854251653,
+                -1.340423409124877,
+                1.7337996506069182,
+                1.7337996506069182,
+                1.7337996506069182,
+                1.1573828269072066,
+                3.6551890629392902,
+                3.0787722392395787,
+                3.0787722392395787,
+                -1.9168402328245886,
+                4.423744827872239,
+                4.423744827872239,
+                4.423744827872239,
+                4.423744827872239,
+                -4.030368586390198,
+                -0.3797287029586909,
+                -0.3797287029586909,
+                1.1573828269072066,
+                1.1573828269072066,
+                1.1573828269072066,
+                2.694494356773104,
+                -0.3797287029586909,
+                -0.571867644191928,
+                2.502355415539867,
+                2.502355415539867,
+                2.502355415539867,
+                -2.4932570565243,
+                -2.4932570565243,
+                -4.222507527623435,
+                -4.222507527623435,
+                -4.222507527623435,
+                -2.8775349389907747,
+                -3.8382296451569604,
+                -2.301118115291063,
+                1.7337996506069182,
+                1.7337996506069182,
+                -0.571867644191928,
+                -0.571867644191928,
+                1.9259385918401553,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                -2.301118115291063,
+                4.808022710338713,
+                0.9652438856739693,
+                0.9652438856739693,
+                0.9652438856739693,
+                -0.3797287029586909,
+                -0.3797287029586909,
+                -0.3797287029586909,
+                1.541660709373681,
+                3.8473280041725273,
+                3.8473280041725273,
+                -0.18758976172545372,
+                1.7337996506069182,
+                1.7337996506069182,
+                1.7337996506069182,
+                2.502355415539867,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                4.039466945405764,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -3.8382296451569604,
+                -3.8382296451569604,
+                -1.532562350358114,
+                -1.532562350358114,
+                -1.532562350358114,
+                -1.532562350358114,
+                -1.532562350358114,
+                -1.532562350358114,
+                2.886633298006341,
+                2.886633298006341,
+                -1.1482844678916397,
+                0.19668812074102068,
+                1.3495217681404437,
+                1.3495217681404437,
+                1.1573828269072066,
+                5.0001616515719505,
+                5.0001616515719505,
+                -0.571867644191928,
+                -0.571867644191928,
+                -2.1089791740578256,
+                -2.1089791740578256,
+                4.039466945405764,
+                4.615883769105476,
+                4.615883769105476,
+                -4.414646468856672,
+                -3.0696738802240118,
+                -4.030368586390198,
+                0.9652438856739693,
+                0.7731049444407322,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                1.1573828269072066,
+                1.1573828269072066,
+                1.1573828269072066,
+                2.3102164743066296,
+                -3.8382296451569604,
+                -0.571867644191928,
+                -1.9168402328245886,
+                -1.9168402328245886,
+                4.231605886639001,
+                0.19668812074102068,
+                -3.261812821457249,
+                1.3495217681404437,
+                -1.9168402328245886,
+                -2.4932570565243,
+                1.3495217681404437,
+                1.3495217681404437,
+                1.1573828269072066,
+                3.2709111804728157,
+                3.2709111804728157,
+                -1.340423409124877,
+                -1.340423409124877,
+                1.3495217681404437,
+                -0.18758976172545372,
+                -1.1482844678916397,
+                -1.340423409124877,
+                -4.991063292556384,
+                -4.991063292556384,
+                -4.991063292556384,
+                -4.991063292556384,
+                2.1180775330733925,
+                1.3495217681404437,
+                1.3495217681404437,
+                2.886633298006341,
+                -1.340423409124877,
+                1.7337996506069182,
+                -2.301118115291063,
+                2.1180775330733925,
+                -4.798924351323146,
+                4.423744827872239,
+                -0.3797287029586909,
+                0.7731049444407322,
+                0.7731049444407322,
+                -0.9561455266584026,
+                -0.9561455266584026,
+                0.19668812074102068,
+                0.19668812074102068,
+                -4.606785410089909,
+                -0.7640065854251653,
+                -0.7640065854251653,
+                -3.4539517626904863,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -1.340423409124877,
+                -1.340423409124877,
+                1.541660709373681,
+                1.541660709373681,
+                1.541660709373681,
+                1.541660709373681,
+                1.541660709373681,
+                1.541660709373681,
+                -2.301118115291063,
+                -2.301118115291063,
+                -0.571867644191928,
+                -0.571867644191928,
+                -0.571867644191928,
+                -0.571867644191928,
+                -2.301118115291063,
+                -2.301118115291063,
+                -2.301118115291063,
+                -1.7247012915913513,
+                -1.7247012915913513,
+                1.541660709373681,
+                1.541660709373681,
+                1.541660709373681,
+                -1.532562350358114,
+                -0.7640065854251653,
+                -0.7640065854251653,
+                -3.0696738802240118,
+                -1.532562350358114,
+                -1.532562350358114,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                2.502355415539867,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -0.7640065854251653,
+                1.9259385918401553,
+                1.9259385918401553,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                -1.1482844678916397,
+                -3.0696738802240118,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                -0.18758976172545372,
+                -0.18758976172545372,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                2.694494356773104,
+                0.580966003207495,
+                3.2709111804728157,
+                -3.4539517626904863,
+                -3.8382296451569604,
+                -4.606785410089909,
+                -3.261812821457249,
+                -3.261812821457249,
+                1.1573828269072066,
+                1.1573828269072066,
+                1.1573828269072066,
+                1.9259385918401553,
+                -4.222507527623435,
+                -2.8775349389907747,
+                -2.8775349389907747,
+                0.9652438856739693,
+                1.3495217681404437,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
+                0.004549179507783482,
             ],
             "predictions": [
-                21,
-                12,
-                18,
-                18,
+                3,
+                13,
                 13,
-                7,
-                9,
-                17,
                 4,
-                26,
-                17,
-                18,
-                11,
-                5,
-                25,
-                27,
-                19,
-                2,
-                23,
                 4,
-                13,
-                7,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                14,
+                14,
+                0,
                 6,
-                2,
-                18,
                 6,
-                10,
-                27,
-                17,
                 18,
-                14,
-                25,
-                4,
-                10,
-                25,
-                19,
-                10,
-                3,
-                5,
-                5,
-                17,
-                25,
-                13,
-                3,
-                3,
-                13,
-                4,
-                10,
-                11,
-                9,
-                9,
-                9,
-                3,
-                27,
-                1,
-                27,
-                7,
-                26,
-                25,
-                20,
-                8,
                 18,
-                23,
-                10,
-                22,
-                19,
-                26,
-                2,
-                12,
-                3,
-                0,
-                19,
-                10,
-                10,
-                26,
-                21,
-                12,
-                10,
-                25,
-                9,
-                6,
-                13,
-                12,
-                14,
-                7,
-                27,
-                2,
-                27,
-                8,
-                8,
-                17,
-                10,
-                10,
-                12,
-                0,
-                15,
-                21,
-                20,
-                16,
-                12,
-                25,
-                9,
-                27,
-                12,
-                22,
-                24,
-                20,
-                6,
-                0,
-                9,
-                25,
-                25,
-                3,
-                1,
-                24,
                 18,
-                3,
-                10,
-                3,
-                5,
-                1,
-                24,
-                20,
-                14,
-                12,
-                2,
-                9,
-                9,
-                23,
-                2,
-                0,
-                11,
-                9,
-                26,
-                8,
-                3,
-                7,
-                2,
-                2,
-                6,
-                4,
-                21,
-                3,
-                17,
-                5,
-                13,
-                3,
-                19,
-                17,
-                6,
-                2,
-                11,
-                21,
                 18,
-                20,
-                1,
-                1,
-                21,
-                10,
-                19,
-                23,
-                8,
-                25,
                 18,
-                26,
-                5,
-                21,
-                2,
-                3,
-                0,
-                10,
-                3,
-                4,
                 18,
-                11,
-                27,
-                4,
-                20,
-                19,
-                11,
-                27,
-                20,
-                4,
-                9,
-                4,
-                3,
-                27,
-                14,
-                22,
-                4,
-                7,
-                5,
-                16,
-                1,
-                21,
-                25,
-                15,
-                0,
-                14,
-                7,
-                11,
-                0,
-                27,
-                20,
-                19,
-                20,
                 18,
-                5,
-                5,
                 18,
-                26,
-                8,
-                13,
-                14,
-                8,
-                16,
                 18,
-                27,
-                17,
-                12,
-                21,
-                8,
-                2,
-                15,
-                1,
-                21,
-                24,
-                17,
-                16,
-                9,
-                1,
-                14,
-                14,
-                26,
-                27,
-                26,
-                19,
-                14,
-                13,
-                2,
-                19,
-                16,
-                11,
                 18,
-                14,
-                23,
-                4,
-                7,
-                12,
-                24,
-                24,
-                24,
-                3,
-                12,
-                11,
-                24,
-                9,
                 18,
-                4,
-                13,
-                10,
-                11,
-                26,
-                4,
-                27,
-                26,
-                19,
-                13,
-                0,
                 18,
-                17,
-                1,
-                4,
-                22,
-                23,
-                1,
-                13,
                 18,
-                13,
-                9,
-                4,
-                7,
-                25,
-                11,
-                27,
                 18,
-                24,
-                15,
-                3,
-                13,
-                26,
-                3,
-                1,
-                19,
-                2,
-                22,
-                23,
-                25,
-                9,
-                22,
-                13,
-                11,
-                16,
-                8,
-                9,
-                5,
-                25,
-                12,
-                16,
-                3,
-                23,
-                8,
-                5,
-                21,
                 18,
-                27,
-                27,
-                4,
-                22,
-                6,
-                3,
-                22,
-                9,
-                27,
-                1,
-                10,
-                16,
-                24,
-                1,
-                16,
-                1,
-                17,
-                23,
-                12,
-                0,
-                3,
-                6,
-                1,
-                8,
-                8,
-                16,
-                7,
-                19,
-                5,
-                19,
-                13,
-                3,
-                12,
-                22,
-                11,
-                15,
-                20,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
                 19,
-                24,
                 6,
-                0,
-                17,
                 6,
-                25,
-                24,
-                10,
-                17,
-                10,
-                17,
-                13,
-                5,
-                10,
-                16,
-                15,
-                15,
-                9,
-                17,
-                17,
-                24,
-                2,
-                27,
-                5,
-                16,
-                9,
-                16,
-                13,
-                27,
-                26,
-                26,
-                3,
-                21,
-                14,
-                16,
-                8,
-                5,
-                24,
-                27,
-                1,
-                13,
-                22,
-                5,
-                4,
-                10,
-                4,
-                22,
-                17,
                 6,
-                10,
-                9,
-                26,
-                24,
-                12,
-                2,
-                1,
-                5,
-                11,
-                17,
-                19,
-                14,
-                1,
-                12,
-                1,
-                1,
-                2,
-                9,
-                19,
-                24,
-                9,
-                2,
-                24,
-                12,
-                15,
-                18,
-                9,
-                27,
-                8,
-                8,
-                24,
-                12,
-                21,
-                22,
-                27,
-                3,
-                1,
-                13,
-                19,
-                19,
-                15,
-                11,
-                15,
-                8,
-                17,
-                20,
-                11,
-                19,
-                16,
-                2,
-                12,
-                16,
-                13,
-                5,
-                26,
-                9,
-                18,
-                13,
-                16,
-                15,
-                12,
-                5,
                 6,
-                16,
                 6,
-                10,
-                14,
-                12,
-                5,
-                14,
-                2,
                 6,
                 6,
-                17,
-                11,
-                17,
-                24,
-                5,
-                26,
-                11,
-                22,
-                16,
-                22,
-                0,
-                26,
-                15,
-                8,
-                22,
                 6,
-                14,
-                9,
-                22,
-                17,
-                8,
-                22,
-                20,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
                 6,
                 21,
-                2,
                 21,
-                9,
-                8,
-                24,
-                10,
-                27,
-                13,
-                18,
-                24,
+                21,
+                3,
+                3,
+                3,
+                11,
+                11,
+                11,
+                11,
+                12,
+                16,
                 7,
-                18,
-                22,
-                19,
-                25,
+                1,
                 21,
                 21,
+                21,
+                19,
+                19,
+                21,
                 12,
+                12,
+                5,
+                24,
+                0,
+                0,
+                22,
+                22,
                 22,
-                1,
                 15,
-                16,
-                24,
                 15,
-                24,
-                5,
-                26,
-                0,
-                26,
-                17,
-                12,
-                12,
+                15,
                 12,
-                1,
-                21,
-                2,
-                11,
-                8,
-                20,
-                20,
-                17,
-                23,
                 13,
-                7,
-                7,
-                23,
                 15,
-                18,
+                27,
+                15,
+                15,
                 20,
                 20,
-                14,
+                3,
+                3,
+                3,
+                9,
+                9,
                 6,
-                25,
-                26,
+                6,
+                0,
+                0,
+                0,
+                18,
+                23,
+                23,
+                8,
+                12,
+                12,
+                12,
                 12,
-                20,
-                1,
-                17,
                 4,
-                11,
-                13,
-                11,
-                22,
-                19,
-                6,
-                5,
-                16,
-                10,
-                16,
+                4,
                 7,
-                24,
-                18,
-                22,
-                14,
-                20,
-                27,
-                18,
-                6,
-                6,
-                22,
-                0,
+                5,
+                5,
+                5,
+                5,
                 25,
-                13,
-                20,
+                23,
+                23,
+                19,
+                3,
+                3,
                 25,
-                17,
-                10,
-                1,
-                26,
-                20,
+                21,
+                21,
+                11,
                 15,
-                0,
-                1,
-                0,
-                13,
-                1,
-                1,
-                0,
-                2,
-                19,
-                27,
-                13,
-                26,
                 15,
-                10,
                 15,
-                9,
-                26,
-                20,
-                22,
-                0,
-                11,
-                14,
-                21,
-                26,
                 22,
-                24,
-                0,
-                23,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                13,
+                10,
                 25,
                 11,
-                6,
-                6,
                 11,
-                9,
-                5,
-                7,
-                22,
-                0,
-                9,
-                12,
-                24,
-                26,
-                2,
-                14,
-                19,
-                2,
-                21,
-                26,
                 11,
-                19,
-                26,
                 11,
-                1,
-                13,
-                9,
-                1,
-                2,
-                24,
-                27,
-                5,
-                21,
                 11,
-                21,
-                2,
-                20,
-                2,
-                12,
-                27,
-                6,
-                17,
-                23,
-                26,
-                23,
-                20,
-                25,
-                13,
-                12,
-                10,
-                26,
-                18,
-                18,
-                18,
-                17,
-                14,
-                0,
-                18,
-                14,
-                20,
-                17,
-                4,
-                1,
-                25,
-                10,
-                3,
-                26,
-                3,
                 11,
-                0,
-                23,
-                6,
-                5,
-                20,
-                13,
-                5,
-                26,
-                17,
-                22,
                 11,
-                24,
-                2,
-                18,
-                7,
-                21,
-                13,
-                23,
-                20,
-                25,
-                3,
-                17,
-                21,
-                26,
-                16,
-                15,
-                3,
-                3,
-                23,
-                22,
-                18,
-                8,
-                12,
-                24,
-                23,
-                27,
-                2,
-                18,
-                8,
-                22,
-                26,
-                6,
-                26,
-                27,
-                6,
-                4,
-                0,
-                0,
-                6,
-                1,
-                16,
-                23,
-                5,
-                1,
-                4,
-                9,
-                8,
                 11,
-                15,
-                25,
-                14,
-                7,
-                27,
-                0,
-                25,
-                22,
-                4,
-                21,
-                0,
-                15,
-                17,
-                24,
-                5,
-                17,
-                8,
-                10,
-                5,
-                18,
-                14,
-                15,
-                26,
-                19,
-                21,
-                4,
-                9,
-                26,
-                18,
-                3,
-                7,
-                4,
-                2,
-                7,
-                1,
-                4,
-                12,
-                14,
-                0,
                 11,
-                26,
-                8,
-                5,
-                26,
-                14,
-                23,
-                2,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                17,
                 24,
-                16,
-                21,
+                2,
                 26,
                 16,
-                9,
-                6,
-                25,
-                4,
-                10,
-                26,
                 16,
-                22,
-                0,
-                1,
-                17,
-                3,
-                12,
-                23,
-                2,
-                7,
-                14,
-                18,
-                7,
-                3,
-                20,
-                14,
-                13,
-                8,
                 13,
                 17,
                 17,
-                26,
-                7,
-                22,
-                7,
-                13,
+                17,
+                25,
+                2,
+                17,
+                0,
+                3,
                 16,
-                4,
+                16,
+                16,
+                27,
+                27,
+                7,
                 5,
+                9,
+                19,
+                16,
                 16,
-                14,
-                20,
                 5,
-                21,
-                26,
+                5,
                 9,
-                25,
-                26,
-                7,
-                25,
-                6,
-                26,
-                2,
+                0,
+                0,
+                0,
+                21,
+                21,
                 23,
+                0,
+                1,
+                27,
+                10,
                 17,
+                20,
+                20,
+                2,
+                2,
                 27,
-                9,
-                5,
-                7,
-                3,
-                8,
-                25,
-                19,
-                26,
-                8,
-                1,
-                12,
                 27,
-                25,
-                1,
-                3,
-                16,
-                12,
-                12,
                 27,
-                7,
-                13,
-                13,
-                6,
+                10,
+                14,
+                0,
+                0,
                 0,
-                4,
-                12,
                 17,
+                6,
+                4,
+                26,
+                1,
+                1,
                 11,
+                11,
+                6,
+                6,
+                16,
+                20,
+                20,
+                20,
+                8,
                 15,
-                9,
                 18,
-                24,
-                26,
+                18,
+                1,
+                1,
                 27,
-                14,
-                15,
                 27,
-                24,
-                14,
-                12,
+                26,
+                16,
+                16,
+                16,
+                16,
                 6,
-                13,
-                27,
-                7,
-                24,
-                22,
-                11,
-                20,
-                4,
-                1,
-                14,
-                25,
-                21,
-                12,
-                2,
-                5,
-                0,
-                24,
-                24,
-                16,
-                11,
-                22,
-                26,
-                26,
-                17,
-                0,
-                0,
-                10,
-                26,
-                5,
-                9,
-                5,
-                10,
-                5,
-                9,
-                23,
-                19,
                 10,
-                2,
-                6,
-                4,
-                20,
-                6,
-                24,
-                8,
-                24,
-                5,
-                7,
-                27,
-                0,
                 10,
-                23,
-                16,
-                8,
+                26,
+                26,
                 18,
-                17,
-                25,
-                21,
                 18,
                 7,
-                2,
-                4,
-                26,
-                13,
-                16,
-                0,
                 7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                25,
+                20,
+                20,
+                24,
+                12,
+                15,
                 17,
-                0,
-                5,
-                6,
-                13,
-                10,
-                0,
-                23,
-                27,
-                8,
-                14,
+                19,
+                19,
+                7,
+                15,
+                16,
                 14,
+                15,
                 16,
                 19,
-                15,
-                4,
-                13,
-                6,
-                17,
-                22,
-                18,
-                5,
-                23,
-                26,
-                26,
-                25,
-                10,
-                20,
-                10,
-                21,
-                18,
-                0,
-                22,
-                9,
-                22,
-                11,
-                17,
-                21,
-                17,
+                24,
+                24,
+                24,
                 19,
                 19,
-                8,
-                6,
-                5,
-                11,
-                8,
                 19,
-                26,
-                2,
-                4,
-                27,
-                26,
                 11,
+                11,
+                27,
                 22,
-                13,
-                8,
                 27,
-                1,
-                9,
-                25,
-                9,
-                18,
+                27,
+                27,
+                27,
                 17,
-                23,
-                23,
-                9,
+                20,
+                12,
+                13,
+                15,
                 7,
-                24,
+                7,
+                21,
+                21,
+                20,
                 14,
-                26,
-                16,
-                26,
-                19,
-                14,
-                23,
-                23,
-                20,
-                1,
-                1,
-                10,
-                5,
-                10,
-                8,
-                16,
                 7,
-                22,
-                20,
+                7,
                 18,
-                20,
-                24,
-                27,
-                5,
-                8,
-                17,
                 18,
-                0,
-                19,
-                13,
+                24,
+                24,
+                24,
                 7,
-                14,
-                3,
-                2,
                 1,
-                4,
-                15,
-                4,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                0,
                 0,
-                21,
-                3,
-                8,
-                8,
-                12,
-                14,
-                8,
-                12,
-                21,
-                10,
-                16,
-                5,
                 0,
-                5,
-                9,
-                18,
-                24,
-                20,
-                16,
-                19,
-                3,
                 25,
-                18,
-                21,
-                1,
-                13,
-                19,
-                14,
+                15,
+                15,
                 5,
-                7,
-                7,
                 6,
-                26,
-                1,
-                18,
-                17,
-                19,
-                16,
-                17,
-                5,
-                27,
                 6,
-                17,
-                19,
-                10,
-                25,
-                16,
-                13,
-                16,
-                10,
-                25,
-                10,
-                25,
-                0,
-                17,
-                17,
-                21,
-                5,
-                11,
-                14,
-                4,
-                26,
-                12,
-                14,
                 5,
-                0,
-                16,
-                27,
                 25,
                 25,
-                18,
-                22,
-                17,
-                14,
-                27,
-                13,
-                18,
-                21,
-                1,
-                4,
-                17,
-                9,
                 25,
-                8,
-                24,
-                17,
-                1,
-                21,
-                13,
                 14,
-                13,
-                22,
-                12,
-                6,
-                18,
-                16,
-                8,
-                21,
-                15,
-                12,
-                21,
-                9,
                 2,
-                16,
-                1,
-                9,
-                14,
-                11,
-                5,
-                17,
-                21,
-                9,
-                7,
-                25,
-                12,
-                11,
-                10,
-                12,
-                12,
-                20,
-                7,
-                9,
-                11,
-                13,
-                3,
-                2,
-                5,
-                8,
-                23,
-                1,
-                3,
-                18,
-                2,
-                0,
-                27,
-                11,
-                21,
-                0,
-                24,
-                27,
-                9,
-                18,
-                23,
-                17,
-                2,
-                4,
-                11,
-                10,
-                10,
-                21,
-                18,
-                3,
-                10,
-                27,
-                10,
-                7,
-                0,
-                14,
-                25,
-                27,
-                27,
-                22,
-                21,
-                18,
                 26,
-                17,
-                0,
-                15,
-                10,
-                3,
-                23,
-                8,
-                20,
-                13,
-                21,
-                9,
-                13,
-                19,
-                24,
-                25,
-                10,
-                12,
-                9,
-                5,
-                2,
-                12,
-                3,
                 26,
-                2,
-                18,
-                12,
-                9,
-                13,
-                16,
-                1,
-                25,
-                18,
-                16,
-                13,
-                1,
-                13,
-                15,
-                23,
                 26,
-                8,
-                19,
-                4,
-                17,
-                19,
                 26,
-                11,
-                13,
-                10,
-                13,
-                4,
-                22,
-                6,
-                19,
-                9,
-                6,
-                7,
-                7,
-                4,
-                9,
-                9,
-                10,
-                9,
-                24,
-                3,
-                1,
-                1,
-                14,
-                10,
-                19,
-                5,
-                22,
-                1,
-                10,
-                0,
-                0,
-                19,
-                21,
-                15,
-                0,
-                8,
-                25,
                 26,
-                21,
                 26,
-                18,
-                10,
-                7,
-                8,
-                4,
-                19,
-                19,
-                17,
-                0,
-                22,
-                9,
-                8,
-                16,
-                6,
-                24,
-                24,
-                12,
-                25,
-                5,
-                17,
-                4,
-                4,
-                7,
-                12,
-                6,
-                15,
-                13,
-                17,
-                27,
-                21,
-                0,
                 26,
-                9,
-                6,
-                17,
-                5,
-                7,
-                18,
-                0,
                 26,
-                19,
-                14,
-                16,
-                21,
-                17,
-                24,
-                9,
-                14,
-                12,
-                1,
-                5,
-                21,
-                25,
-                7,
-                10,
-                21,
-                8,
-                2,
-                13,
-                22,
-                14,
-                2,
-                0,
-                11,
-                10,
-                9,
-                11,
-                13,
-                27,
-                10,
-                19,
-                3,
-                15,
-                5,
-                8,
-                18,
-                22,
-                25,
-                3,
-                10,
-                21,
-                20,
-                20,
-                11,
-                2,
-                13,
-                13,
-                3,
-                19,
-                10,
-                12,
-                21,
-                4,
-                5,
-                19,
-                16,
-                27,
-                7,
-                4,
-                10,
-                6,
-                24,
-                3,
-                25,
-                16,
-                3,
-                12,
-                25,
-                27,
-                14,
-                21,
                 26,
-                12,
-                13,
-                0,
-                10,
-                8,
-                19,
-                11,
-                22,
-                0,
-                4,
-                16,
-                17,
-                19,
-                1,
-                4,
-                11,
-                8,
-                1,
-                19,
-                23,
-                20,
-                4,
-                11,
-                10,
-                16,
-                17,
-                24,
-                17,
-                27,
-                18,
-                11,
-                22,
-                15,
-                11,
-                9,
-                24,
-                0,
-                25,
-                24,
-                23,
-                2,
-                20,
-                27,
-                23,
-                20,
-                19,
-                2,
-                1,
-                6,
-                7,
-                2,
-                8,
-                21,
-                13,
-                24,
-                25,
-                24,
-                7,
-                9,
-                7,
-                7,
-                15,
-                24,
-                11,
-                17,
-                6,
-                16,
-                20,
-                18,
-                4,
-                3,
                 26,
-                5,
-                24,
-                24,
-                27,
-                25,
-                15,
                 26,
-                27,
-                10,
-                19,
-                22,
-                19,
-                11,
-                8,
-                21,
-                2,
-                20,
-                10,
-                20,
-                13,
-                20,
-                1,
-                23,
-                13,
-                3,
-                15,
-                4,
-                13,
-                9,
-                23,
-                8,
-                25,
-                9,
-                13,
-                8,
-                0,
-                1,
-                15,
-                8,
-                20,
-                15,
-                4,
-                12,
-                0,
-                20,
-                4,
-                6,
-                16,
-                24,
-                5,
-                20,
-                17,
-                13,
-                20,
-                0,
-                23,
-                18,
-                10,
-                6,
-                18,
-                27,
-                18,
-                16,
-                2,
-                14,
-                27,
-                6,
                 26,
-                23,
-                19,
-                2,
-                0,
-                3,
-                9,
-                8,
                 26,
-                6,
-                10,
-                14,
-                16,
-                13,
-                8,
-                8,
-                24,
-                12,
-                8,
-                21,
-                0,
-                2,
-                19,
-                8,
-                17,
-                20,
-                5,
-                12,
-                21,
-                15,
-                3,
-                21,
-                7,
-                18,
-                7,
-                18,
-                4,
-                12,
-                3,
-                22,
-                0,
-                13,
-                17,
-                24,
-                8,
                 26,
-                7,
-                14,
-                5,
-                9,
-                21,
-                10,
-                0,
-                15,
-                18,
-                10,
-                7,
-                20,
-                18,
-                7,
-                14,
-                2,
-                13,
-                0,
                 26,
                 26,
-                24,
-                4,
-                19,
-                23,
-                22,
-                25,
-                2,
-                15,
-                7,
-                19,
-                2,
-                6,
-                15,
-                5,
-                23,
-                3,
-                8,
-                9,
-                8,
-                5,
-                25,
-                13,
-                10,
-                20,
-                21,
-                18,
-                22,
-                23,
-                0,
-                18,
-                16,
                 26,
-                25,
-                7,
-                6,
-                10,
-                3,
-                18,
-                16,
-                2,
-                4,
-                23,
-                5,
-                21,
-                20,
-                25,
-                21,
-                25,
-                12,
-                2,
-                15,
-                3,
-                1,
-                12,
-                0,
-                1,
-                1,
-                20,
-                6,
-                13,
-                17,
-                15,
-                3,
-                2,
-                18,
-                17,
-                22,
-                20,
-                14,
-                0,
-                18,
-                20,
-                19,
-                23,
-                19,
-                19,
-                25,
-                0,
-                24,
-                0,
-                6,
                 26,
-                1,
-                6,
-                19,
-                20,
-                23,
-                11,
-                6,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
                 0,
-                6,
-                13,
-                21,
                 0,
-                3,
-                8,
-                4,
-                25,
-                24,
-                22,
-                17,
                 0,
-                27,
-                17,
-                14,
-                8,
-                9,
-                4,
-                18,
-                2,
                 0,
-                15,
-                9,
-                18,
-                13,
-                15,
-                8,
-                22,
-                21,
-                4,
-                14,
-                27,
-                11,
-                3,
-                18,
-                10,
-                13,
-                10,
-                16,
-                9,
-                20,
-                6,
-                16,
-                7,
-                19,
-                15,
-                21,
-                9,
-                19,
-                14,
-                8,
-                1,
-                7,
-                22,
-                2,
-                8,
-                5,
-                22,
-                25,
-                3,
-                18,
-                22,
-                8,
-                13,
-                3,
-                13,
-                18,
-                3,
-                16,
-                13,
-                1,
-                11,
-                27,
-                19,
-                5,
-                11,
-                5,
-                21,
-                19,
-                14,
-                20,
-                27,
-                7,
-                23,
-                25,
-                20,
-                24,
-                3,
-                4,
-                1,
-                13,
-                24,
-                9,
-                16,
                 0,
-                21,
-                15,
-                8,
-                12,
-                13,
-                14,
-                1,
                 0,
-                5,
-                7,
-                21,
-                10,
-                18,
-                3,
-                2,
-                20,
-                4,
-                16,
-                25,
                 0,
-                10,
-                24,
-                6,
-                7,
-                16,
-                13,
-                16,
-                8,
-                19,
                 0,
-                7,
-                24,
-                24,
-                9,
-                22,
-                13,
-                4,
-                15,
-                8,
-                5,
-                24,
-                20,
-                11,
-                5,
-                10,
-                1,
-                15,
-                17,
-                24,
-                5,
-                26,
-                20,
-                5,
-                5,
-                17,
-                24,
-                21,
-                12,
-                17,
-                24,
-                8,
-                2,
-                16,
-                21,
-                4,
-                7,
-                17,
-                15,
-                15,
-                24,
-                16,
-                3,
-                22,
-                17,
-                1,
-                14,
-                10,
-                5,
-                23,
-                11,
-                17,
-                21,
-                14,
                 0,
-                2,
-                7,
-                2,
                 0,
-                16,
-                6,
-                12,
-                8,
-                25,
-                18,
-                11,
-                5,
-                18,
-                10,
                 0,
-                11,
-                27,
-                4,
                 0,
-                7,
-                11,
-                4,
-                4,
-                9,
-                26,
-                11,
-                23,
-                16,
-                4,
-                15,
-                14,
-                16,
-                2,
-                5,
-                21,
                 0,
-                2,
-                12,
-                2,
-                17,
-                2,
-                24,
-                10,
-                2,
-                25,
                 0,
-                3,
-                15,
-                11,
-                20,
-                11,
-                19,
                 0,
-                14,
-                9,
-                24,
                 0,
-                6,
-                4,
-                11,
-                21,
-                23,
-                6,
-                24,
-                6,
-                23,
-                6,
-                26,
-                27,
-                20,
-                3,
-                18,
-                11,
-                25,
-                18,
-                16,
-                1,
-                11,
-                13,
-                3,
-                15,
-                1,
-                5,
-                4,
-                7,
-                22,
-                9,
-                27,
-                23,
-                26,
-                3,
-                6,
-                18,
-                26,
-                19,
-                15,
-                26,
-                11,
-                14,
-                25,
-                22,
-                20,
-                19,
-                23,
                 0,
-                17,
-                17,
-                23,
-                27,
-                15,
-                20,
-                25,
-                2,
-                12,
-                20,
                 0,
-                19,
-                7,
-                5,
-                14,
-                22,
-                11,
-                10,
-                8,
-                18,
-                16,
-                10,
                 0,
-                3,
-                20,
-                1,
-                12,
-                6,
-                5,
-                3,
-                19,
-                11,
                 0,
-                12,
-                25,
-                9,
-                17,
-                2,
-                11,
-                8,
-                5,
-                2,
-                20,
-                13,
-                10,
-                3,
-                9,
-                16,
-                2,
-                15,
-                3,
-                4,
-                23,
-                6,
-                4,
-                21,
-                13,
-                11,
-                12,
-                4,
-                21,
-                17,
-                12,
-                12,
-                14,
-                7,
-                8,
                 0,
-                10,
-                20,
-                7,
-                16,
-                20,
-                26,
-                24,
-                13,
                 0,
-                10,
-                13,
-                24,
-                5,
-                16,
-                18,
                 0,
-                12,
-                14,
-                17,
-                10,
-                16,
-                16,
-                8,
-                1,
-                11,
-                20,
-                2,
-                15,
-                19,
-                9,
-                8,
-                9,
-                12,
                 0,
-                18,
-                14,
-                20,
                 0,
-                6,
-                26,
-                19,
-                19,
-                24,
-                16,
-                7,
-                15,
-                19,
-                9,
                 0,
-                14,
-                6,
-                27,
                 0,
-                18,
-                22,
-                9,
-                14,
-                15,
-                18,
-                26,
-                6,
-                17,
-                19,
-                27,
-                7,
-                6,
-                11,
-                17,
-                9,
-                14,
-                8,
-                11,
-                10,
-                11,
-                15,
-                24,
-                4,
-                10,
-                13,
-                18,
-                24,
-                16,
-                25,
-                20,
-                3,
-                9,
                 0,
-                20,
-                25,
-                9,
-                1,
-                2,
-                3,
-                3,
-                20,
-                8,
-                23,
                 0,
-                4,
                 0,
-                17,
-                5,
-                27,
-                24,
-                15,
-                13,
-                10,
-                17,
-                15,
-                16,
-                10,
-                26,
-                26,
-                18,
-                3,
-                13,
                 0,
-                6,
-                15,
                 26,
                 21,
-                25,
-                23,
-                22,
                 1,
-                27,
-                11,
-                13,
+                1,
+                1,
                 24,
-                23,
-                22,
-                2,
-                9,
-                21,
-                16,
-                0,
+                20,
                 13,
+                23,
+                23,
                 18,
-                3,
-                5,
-                9,
-                8,
-                20,
-                10,
-                27,
-                6,
-                14,
-                5,
-                6,
-                0,
-                4,
                 5,
-                5,
-                20,
-                4,
-                13,
                 26,
-                2,
-                11,
-                2,
-                18,
-                2,
-                22,
-                10,
-                24,
-                9,
-                9,
-                20,
-                12,
-                11,
-                10,
-                20,
+                17,
+                1,
+                0,
+                23,
                 18,
-                12,
-                24,
-                11,
-                24,
-                27,
-                9,
-                21,
                 18,
-                6,
-                4,
-                7,
-                8,
-                15,
-                12,
-                13,
-                4,
-                1,
                 18,
-                10,
-                16,
-                17,
                 18,
-                26,
-                3,
-                23,
-                16,
-                26,
-                15,
-                2,
-                6,
-                17,
-                16,
-                13,
-                12,
-                0,
-                2,
                 20,
-                0,
-                17,
-                9,
-                27,
-                2,
-                9,
-                0,
-                21,
-                7,
-                11,
-                4,
-                14,
-                3,
                 25,
-                1,
-                21,
-                14,
-                24,
-                6,
-                2,
-                19,
-                19,
-                22,
-                17,
-                2,
-                5,
-                12,
                 25,
-                3,
-                2,
-                2,
-                22,
-                12,
-                11,
-                10,
-                5,
-                20,
-                6,
-                18,
-                4,
-                9,
-                23,
-                24,
-                10,
-                5,
+                25,
                 15,
-                26,
-                26,
-                2,
-                3,
                 15,
-                14,
-                7,
-                2,
-                22,
-                26,
-                20,
-                2,
-                0,
-                3,
                 4,
-                3,
-                11,
-                18,
-                19,
-                14,
-                19,
-                25,
-                24,
-                1,
-                26,
-                9,
-                7,
-                5,
-                6,
-                5,
-                10,
-                16,
-                26,
-                16,
-                12,
-                13,
-                20,
-                11,
-                21,
-                20,
-                16,
                 4,
-                19,
-                8,
-                15,
-                12,
-                19,
-                24,
-                11,
-                8,
-                20,
-                20,
-                19,
-                12,
-                18,
-                16,
-                0,
-                5,
-                0,
-                0,
-                8,
+                4,
+                23,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
                 27,
-                26,
-                13,
-                16,
-                8,
-                20,
                 27,
-                17,
-                19,
-                0,
-                15,
                 27,
-                3,
-                6,
-                3,
-                26,
-                22,
-                10,
-                6,
-                4,
-                24,
-                4,
-                8,
                 27,
-                14,
-                8,
-                10,
-                7,
-                22,
                 0,
-                10,
-                18,
-                19,
                 0,
-                12,
-                7,
-                22,
-                19,
-                3,
+                20,
+                24,
+                24,
+                10,
+                20,
+                20,
                 16,
+                23,
+                26,
                 6,
                 24,
-                17,
-                22,
-                3,
-                26,
+                24,
+                10,
+                10,
                 23,
-                0,
-                1,
-                12,
+                11,
+                11,
                 7,
                 5,
-                24,
-                15,
-                26,
-                13,
-                14,
-                22,
-                1,
-                9,
-                4,
-                25,
-                11,
-                6,
-                0,
-                21,
-                12,
+                5,
+                17,
+                17,
                 18,
+                17,
+                17,
+                17,
+                17,
+                19,
+                27,
                 27,
-                2,
-                14,
-                14,
                 9,
                 4,
+                6,
                 25,
-                25,
-                24,
+                19,
+                5,
+                5,
                 20,
-                2,
-                26,
-                7,
-                22,
-                4,
-                15,
-                27,
-                16,
-                12,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                10,
+                10,
+                10,
+                10,
                 21,
-                5,
-                22,
-                26,
-                14,
-                15,
-                0,
-                7,
-                12,
-                23,
-                26,
-                3,
-                15,
+                21,
+                21,
+                27,
                 12,
-                15,
-                1,
-                15,
-                25,
-                1,
-                1,
+                24,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
                 13,
-                16,
-                15,
-                7,
-                21,
                 13,
-                12,
-                6,
-                26,
-                20,
                 13,
-                26,
-                6,
                 13,
-                11,
                 13,
-                11,
-                5,
-                26,
-                5,
-                22,
-                6,
                 13,
                 13,
-                16,
-                3,
-                15,
-                11,
-                26,
-                10,
-                3,
-                19,
-                27,
-                1,
-                9,
-                25,
-                17,
-                4,
-                1,
-                3,
-                9,
-                20,
-                5,
-                5,
-                24,
-                2,
-                17,
-                27,
-                14,
-                3,
-                22,
-                5,
-                18,
                 13,
-                2,
                 13,
-                1,
-                8,
-                6,
-                27,
-                5,
-                26,
-                5,
-                8,
-                7,
-                6,
-                15,
-                25,
-                7,
-                23,
-                27,
-                9,
-                9,
-                8,
-                25,
-                27,
-                19,
-                15,
-                1,
-                26,
-                2,
-                14,
-                27,
-                17,
-                9,
-                16,
-                9,
-                25,
-                10,
-                6,
-                24,
-                27,
-                17,
-                8,
-                4,
-                4,
-                15,
-                25,
-                23,
-                23,
-                7,
-                22,
-                25,
-                20,
-                23,
-                21,
-                22,
-                21,
-                2,
-                14,
-                8,
-                18,
-                25,
-                14,
-                21,
-                2,
-                14,
-                22,
-                9,
                 13,
-                4,
-                12,
-                7,
-                25,
-                22,
-                3,
-                18,
-                22,
-                12,
-                12,
-                2,
                 18,
-                5,
-                22,
-                21,
-                6,
-                17,
-                27,
-                5,
-                21,
-                26,
-                11,
-                4,
-                7,
-                10,
-                17,
-                22,
-                14,
-                10,
-                27,
-                6,
-                0,
-                4,
-                7,
+                20,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
                 25,
-                12,
-                6,
-                4,
-                17,
-                19,
-                9,
                 25,
-                23,
-                24,
-                14,
-                4,
-                12,
-                21,
-                17,
-                2,
-                11,
-                17,
-                22,
-                5,
-                7,
-                11,
                 25,
-                8,
-                27,
-                27,
-                18,
                 25,
-                17,
-                19,
-                14,
-                27,
-                1,
-                9,
-                20,
-                18,
-                8,
-                6,
-                27,
-                0,
-                3,
-                10,
-                13,
-                1,
-                19,
-                20,
-                20,
-                9,
-                24,
-                7,
-                19,
-                0,
-                5,
-                8,
-                10,
-                22,
-                8,
-                8,
-                15,
-                12,
-                27,
                 25,
-                11,
                 25,
-                2,
-                24,
-                3,
-                1,
-                27,
-                16,
-                0,
-                4,
                 25,
-                24,
-                18,
-                24,
-                23,
-                23,
-                18,
-                7,
-                23,
-                0,
-                7,
-                15,
-                14,
-                7,
-                10,
-                7,
-                17,
-                14,
-                1,
-                6,
                 25,
-                3,
-                3,
-                18,
-                7,
-                5,
-                7,
-                14,
-                23,
-                17,
-                14,
-                27,
-                21,
-                5,
-                24,
-                22,
-                9,
-                12,
-                7,
-                6,
-                14,
-                8,
-                21,
-                23,
-                20,
-                0,
-                14,
-                15,
-                23,
-                6,
-                23,
-                26,
-                9,
-                9,
-                1,
-                9,
-                7,
-                26,
-                19,
-                14,
-                24,
-                26,
-                24,
-                27,
-                20,
-                9,
-                20,
-                13,
-                18,
-                8,
                 25,
-                23,
-                11,
-                1,
-                9,
-                27,
-                5,
-                10,
-                17,
-                21,
-                23,
                 25,
                 25,
-                2,
-                11,
-                18,
-                1,
-                22,
-                10,
-                20,
-                6,
-                2,
-                16,
-                11,
-                17,
-                20,
-                18,
-                3,
                 25,
-                19,
-                17,
-                18,
-                16,
-                1,
-                6,
-                8,
-                14,
-                4,
-                4,
-                1,
-                24,
-                16,
-                26,
-                10,
-                26,
                 25,
-                20,
-                10,
-                2,
-                21,
-                2,
-                18,
-                6,
-                27,
-                12,
-                12,
-                2,
-                2,
-                11,
-                18,
-                14,
-                0,
-                14,
                 25,
-                10,
-                5,
-                23,
-                23,
-                11,
-                0,
-                18,
-                8,
                 25,
-                18,
-                23,
-                8,
-                5,
-                17,
-                27,
-                18,
-                20,
-                7,
-                21,
-                1,
-                23,
-                6,
-                16,
-                1,
-                12,
-                16,
-                9,
-                26,
-                10,
-                14,
-                5,
-                18,
-                19,
-                1,
-                2,
-                12,
-                27,
-                0,
-                1,
-                26,
-                3,
-                16,
-                14,
-                17,
-                9,
-                3,
-                8,
                 25,
-                13,
-                16,
-                8,
-                21,
-                12,
-                12,
-                26,
-                11,
-                7,
-                7,
-                12,
-                13,
-                14,
-                7,
-                21,
-                10,
-                5,
-                4,
-                4,
-                15,
-                11,
-                10,
-                11,
-                16,
                 25,
-                5,
-                18,
                 25,
-                27,
-                22,
                 25,
-                12,
-                15,
-                2,
-                11,
-                17,
-                6,
-                15,
-                24,
-                7,
-                10,
-                23,
-                6,
                 25,
-                9,
-                17,
-                19,
-                23,
-                17,
-                8,
-                0,
-                15,
-                22,
-                4,
-                27,
-                22,
-                18,
-                26,
-                11,
-                8,
-                5,
-                4,
-                7,
-                4,
-                21,
-                1,
-                19,
-                16,
-                27,
-                9,
-                20,
-                26,
-                12,
-                16,
-                12,
-                21,
-                12,
-                4,
-                15,
-                27,
-                2,
-                18,
-                26,
-                5,
-                20,
-                6,
-                18,
-                11,
-                0,
-                9,
-                23,
-                7,
-                1,
-                3,
-                19,
-                5,
-                2,
-                19,
-                26,
-                15,
-                11,
-                13,
-                11,
-                11,
-                18,
-                7,
-                14,
                 25,
-                6,
-                10,
-                14,
-                22,
-                11,
-                18,
-                19,
-                15,
-                10,
-                2,
-                6,
-                22,
-                24,
-                13,
-                24,
-                26,
-                14,
-                13,
-                12,
-                22,
-                1,
-                7,
-                2,
-                20,
-                27,
-                27,
-                23,
-                10,
                 17,
-                19,
-                26,
-                20,
-                5,
-                14,
-                20,
                 16,
-                26,
                 20,
-                4,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                0,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
                 26,
-                23,
-                15,
-                21,
-                1,
+                19,
+                19,
                 26,
-                1,
-                27,
-                21,
-                27,
-                24,
-                23,
-                0,
-                18,
-                16,
-                27,
-                27,
-                16,
                 8,
-                3,
-                0,
-                1,
+                8,
+                4,
+                12,
+                12,
+                12,
                 12,
-                23,
                 1,
-                27,
-                17,
-                7,
-                14,
-                11,
+                1,
                 10,
-                27,
-                26,
+                18,
+                18,
+                22,
+                22,
+                22,
+                22,
+                2,
                 2,
-                12,
                 19,
-                8,
-                23,
-                12,
-                8,
-                10,
-                13,
-                24,
-                21,
-                5,
-                13,
-                20,
-                12,
-                8,
-                0,
+                19,
+                22,
+                22,
+                6,
+                6,
+                6,
+                6,
                 6,
-                17,
                 11,
-                13,
-                13,
-                15,
-                14,
-                26,
-                22,
+                11,
+                3,
+                3,
                 18,
-                2,
-                21,
+                8,
                 5,
-                18,
-                17,
-                19,
-                27,
-                21,
-                15,
+                20,
+                20,
+                20,
                 16,
-                9,
-                2,
-                18,
-                21,
-                5,
-                0,
-                5,
-                0,
-                19,
-                4,
-                5,
-                27,
-                22,
-                2,
-                26,
-                0,
-                18,
-                27,
-                21,
-                26,
+                7,
+                7,
+                20,
+                20,
+                8,
+                8,
                 12,
-                16,
-                24,
-                13,
-                24,
                 0,
-                24,
-                3,
                 0,
-                13,
-                21,
-                12,
-                23,
-                26,
-                20,
-                25,
-                3,
-                18,
-                14,
-                3,
-                21,
-                25,
-                25,
-                2,
-                13,
-                23,
-                24,
-                26,
-                24,
-                2,
-                26,
-                26,
-                21,
+                0,
                 11,
+                22,
                 9,
-                21,
-                24,
-                21,
-                6,
-                21,
-                2,
+                9,
+                12,
+                12,
+                12,
                 7,
-                1,
-                0,
+                6,
+                6,
+                6,
                 5,
-                1,
-                16,
-                20,
-                25,
-                10,
+                17,
+                17,
                 9,
-                14,
+                24,
                 1,
-                7,
-                27,
-                16,
-                5,
-                3,
-                4,
-                27,
                 1,
-                20,
-                26,
                 15,
-                13,
-                19,
-                6,
-                16,
-                2,
-                10,
                 15,
-                13,
-                19,
-                21,
-                25,
-                26,
-                14,
-                8,
-                6,
-                4,
-                20,
-                0,
-                2,
-                21,
-                3,
-                16,
-                4,
-                12,
-                7,
-                0,
-                5,
-                8,
-                1,
-                0,
-                23,
+                15,
+                15,
                 0,
-                25,
                 2,
                 2,
-                20,
+                9,
+                16,
+                16,
                 16,
-                17,
-                20,
-                3,
-                6,
-                27,
-                20,
-                15,
-                10,
-                8,
-                3,
-                2,
-                18,
-                13,
-                21,
-                20,
-                24,
-                26,
-                19,
-                21,
                 14,
-                3,
                 19,
-                24,
+                19,
+                19,
+                19,
+                2,
+                22,
                 15,
-                26,
-                7,
+                15,
+                6,
+                0,
                 11,
-                13,
-                12,
                 11,
+                0,
                 2,
-                25,
+                20,
+                12,
                 12,
+                23,
+                16,
+                16,
                 7,
-                15,
-                4,
+                23,
+                23,
                 27,
                 19,
-                16,
                 7,
-                19,
-                8,
-                11,
-                9,
-                1,
-                24,
-                11,
-                20,
-                9,
-                0,
+                13,
+                13,
+                13,
+                16,
+                16,
                 22,
-                4,
-                23,
-                21,
-                24,
-                6,
-                4,
-                25,
-                18,
-                26,
-                5,
-                9,
-                9,
-                14,
-                4,
                 22,
-                25,
-                8,
-                26,
-                15,
-                24,
-                2,
-                26,
-                7,
-                12,
-                20,
-                13,
-                20,
-                1,
-                6,
-                7,
-                10,
-                26,
-                15,
-                15,
-                7,
-                15,
-                18,
-                26,
-                15,
-                10,
-                8,
-                23,
-                2,
-                13,
-                6,
-                15,
                 22,
+                22,
+                17,
+                19,
+                19,
+                19,
+                18,
                 18,
-                7,
-                20,
-                25,
-                15,
-                14,
                 10,
-                0,
-                12,
-                11,
-                26,
-                20,
-                5,
-                16,
-                16,
-                1,
-                5,
-                11,
-                22,
                 10,
-                7,
-                15,
-                17,
-                4,
-                6,
-                11,
-                21,
-                15,
-                22,
-                13,
-                21,
                 10,
-                6,
                 10,
-                3,
-                0,
-                9,
-                15,
-                7,
-                3,
-                15,
-                1,
-                16,
-                24,
-                15,
-                4,
-                2,
-                22,
-                6,
-                6,
-                18,
-                15,
-                19,
-                4,
-                4,
-                26,
-                23,
-                15,
-                9,
-                12,
-                5,
-                2,
                 10,
-                26,
-                5,
-                16,
-                18,
-                20,
-                1,
-                16,
-                2,
-                18,
-                21,
-                9,
                 10,
-                0,
-                16,
-                19,
-                21,
-                12,
-                1,
-                23,
-                17,
-                6,
-                13,
-                15,
                 10,
-                12,
-                3,
-                13,
-                11,
-                21,
                 10,
-                24,
-                16,
-                5,
-                12,
-                8,
-                6,
-                2,
-                18,
-                25,
-                19,
-                1,
-                4,
-                24,
-                5,
-                1,
-                21,
-                22,
-                26,
-                27,
-                1,
-                5,
-                1,
-                8,
-                19,
-                1,
-                13,
-                1,
-                17,
-                2,
-                20,
-                17,
-                27,
-                25,
-                19,
-                15,
-                18,
-                17,
-                3,
-                21,
-                17,
                 10,
-                7,
-                25,
-                24,
-                4,
-                6,
-                6,
-                15,
-                26,
-                22,
-                17,
-                23,
-                5,
-                21,
-                20,
-                13,
-                6,
-                13,
-                17,
-                8,
-                20,
-                27,
-                14,
-                14,
-                8,
-                7,
-                8,
-                26,
-                25,
-                24,
-                25,
-                0,
-                18,
-                12,
                 10,
-                26,
-                24,
-                24,
-                12,
-                11,
-                22,
-                15,
                 10,
-                3,
-                26,
-                2,
-                19,
-                7,
-                12,
-                0,
-                15,
-                19,
-                13,
-                15,
-                24,
-                20,
-                21,
-                7,
-                22,
-                5,
-                27,
-                20,
-                7,
-                27,
-                3,
-                6,
-                8,
-                3,
-                4,
-                9,
-                17,
-                11,
-                26,
-                1,
-                8,
-                8,
-                20,
-                0,
-                17,
-                9,
-                25,
-                17,
-                18,
-                15,
-                19,
-                20,
-                18,
-                16,
-                3,
-                22,
-                24,
-                1,
-                13,
-                26,
-                4,
-                11,
-                13,
-                1,
-                14,
-                26,
-                27,
-                4,
-                20,
-                0,
-                12,
-                21,
-                6,
-                13,
-                19,
-                27,
-                14,
-                26,
-                7,
-                21,
-                5,
-                6,
-                18,
-                26,
-                5,
-                6,
-                17,
                 10,
-                11,
-                21,
-                25,
-                9,
-                6,
-                11,
-                11,
-                15,
-                11,
-                18,
-                8,
-                23,
-                24,
-                18,
-                6,
-                21,
-                8,
-                5,
-                19,
-                6,
-                2,
-                3,
-                7,
-                6,
-                25,
-                7,
-                12,
-                12,
-                16,
-                13,
-                11,
-                26,
-                2,
-                22,
-                22,
-                8,
-                19,
-                27,
-                17,
-                6,
-                7,
-                21,
-                14,
-                9,
-                12,
-                11,
-                11,
-                14,
-                12,
-                12,
-                2,
-                21,
-                27,
-                0,
-                11,
-                18,
-                7,
-                25,
-                6,
-                18,
-                17,
-                15,
-                16,
-                8,
-                19,
-                11,
-                20,
                 10,
-                17,
-                23,
-                23,
-                2,
-                2,
-                23,
-                1,
-                26,
-                26,
-                9,
-                3,
-                27,
-                0,
-                14,
-                20,
-                1,
-                19,
-                23,
-                4,
-                0,
                 10,
-                25,
-                6,
-                14,
-                6,
-                9,
-                7,
-                7,
-                0,
-                1,
-                24,
-                1,
-                25,
-                0,
-                16,
-                12,
-                7,
                 10,
-                27,
-                15,
-                27,
-                2,
-                23,
-                6,
-                17,
-                16,
-                7,
-                6,
-                20,
-                27,
-                27,
-                21,
-                5,
-                22,
-                23,
-                4,
-                1,
-                18,
-                4,
-                1,
-                26,
-                17,
-                9,
-                2,
-                9,
-                16,
-                25,
-                7,
-                13,
-                19,
-                22,
-                23,
-                20,
-                22,
-                4,
-                13,
-                15,
-                9,
-                23,
-                11,
-                11,
-                17,
-                23,
-                3,
-                13,
-                6,
-                18,
-                15,
-                20,
-                6,
-                11,
-                11,
-                0,
-                11,
-                18,
-                23,
-            ],
-            "targets": [
-                21,
-                12,
-                18,
-                5,
-                19,
-                7,
-                9,
-                17,
-                4,
-                26,
-                17,
-                18,
-                11,
-                5,
-                25,
-                27,
-                19,
-                2,
-                23,
-                4,
-                6,
-                7,
-                6,
-                1,
-                14,
-                3,
-                3,
-                27,
-                17,
-                25,
-                14,
-                12,
-                4,
                 10,
-                25,
-                19,
                 10,
-                26,
-                5,
-                5,
-                17,
-                17,
-                13,
-                3,
-                3,
-                13,
-                4,
                 10,
-                11,
-                9,
-                9,
-                9,
-                3,
-                27,
-                1,
-                27,
-                21,
-                26,
-                25,
-                20,
-                8,
-                18,
-                23,
                 10,
-                22,
-                25,
-                26,
-                2,
-                1,
-                8,
-                7,
-                9,
                 10,
                 10,
-                26,
-                21,
-                12,
                 10,
-                25,
-                9,
-                6,
-                13,
-                12,
-                14,
-                7,
-                27,
-                2,
-                27,
-                8,
-                8,
-                17,
-                24,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
                 10,
                 12,
-                0,
-                15,
                 21,
-                20,
-                16,
-                12,
-                25,
-                9,
-                12,
-                12,
-                22,
-                24,
-                20,
-                6,
-                0,
-                9,
-                15,
-                25,
-                3,
-                1,
-                24,
-                18,
-                3,
-                10,
-                3,
-                5,
-                1,
-                14,
                 21,
-                14,
-                3,
-                2,
-                9,
-                0,
-                23,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                11,
                 2,
-                0,
-                13,
-                4,
-                26,
-                8,
-                3,
-                7,
                 2,
                 2,
-                26,
-                4,
                 21,
-                3,
-                8,
-                5,
+                21,
+                21,
+                14,
+                7,
                 22,
-                3,
-                27,
+                22,
+                15,
+                8,
+                8,
+                24,
+                24,
                 24,
-                6,
                 2,
-                11,
-                21,
-                18,
-                20,
-                6,
-                1,
-                18,
-                10,
-                19,
-                17,
-                8,
-                25,
-                5,
-                26,
-                5,
-                21,
-                3,
-                3,
-                22,
-                10,
-                3,
-                24,
-                18,
-                11,
-                26,
-                4,
-                20,
-                19,
-                11,
-                27,
-                20,
-                4,
-                9,
-                4,
-                12,
-                27,
-                14,
-                22,
-                4,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                7,
+                7,
                 7,
-                5,
-                16,
-                1,
-                21,
-                13,
-                12,
-                0,
+                14,
                 14,
                 7,
-                11,
-                0,
-                27,
-                20,
-                19,
-                20,
-                16,
-                5,
+                8,
+                8,
+                7,
+                2,
                 5,
-                18,
-                26,
                 8,
-                13,
-                14,
                 8,
-                16,
-                18,
-                27,
-                17,
-                12,
+                9,
                 21,
-                8,
-                2,
-                18,
-                1,
                 21,
-                14,
-                17,
-                16,
-                9,
                 1,
-                14,
-                14,
-                26,
-                27,
-                26,
-                19,
-                14,
-                13,
-                2,
-                19,
-                16,
-                11,
-                18,
-                22,
-                23,
-                4,
-                7,
-                12,
-                24,
-                24,
-                24,
-                3,
-                12,
-                11,
-                24,
-                9,
-                20,
+                1,
                 4,
-                13,
-                10,
-                27,
-                26,
                 4,
-                27,
-                26,
-                1,
-                13,
-                0,
-                12,
-                27,
                 5,
+                5,
+                19,
+                19,
+                14,
                 4,
-                22,
-                22,
-                1,
-                13,
-                3,
-                13,
-                8,
                 4,
-                7,
-                25,
-                11,
-                27,
-                18,
-                24,
-                15,
-                3,
-                18,
-                26,
-                3,
-                1,
-                19,
-                2,
-                22,
-                22,
-                25,
+                16,
+                16,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
                 9,
-                0,
                 9,
-                11,
-                21,
-                8,
                 9,
-                5,
-                8,
-                12,
                 9,
-                3,
-                23,
-                8,
-                5,
-                20,
-                18,
-                27,
-                27,
-                4,
-                22,
-                6,
-                3,
-                22,
                 9,
-                27,
-                1,
-                10,
-                16,
-                24,
-                1,
-                16,
-                1,
-                17,
-                23,
-                12,
-                10,
-                3,
-                6,
-                1,
-                8,
-                8,
-                16,
-                7,
-                19,
-                5,
-                19,
-                13,
-                3,
-                12,
-                22,
-                11,
-                15,
-                20,
-                19,
-                24,
-                6,
-                0,
-                17,
-                18,
-                25,
-                10,
-                10,
-                17,
-                10,
-                17,
-                13,
-                5,
-                10,
-                16,
-                3,
-                15,
                 9,
-                17,
-                17,
-                24,
-                2,
-                27,
-                5,
-                16,
                 9,
-                3,
-                13,
-                27,
-                26,
-                26,
-                3,
-                21,
-                14,
-                16,
-                8,
-                5,
-                24,
                 9,
-                1,
-                13,
-                22,
-                5,
-                4,
-                10,
-                7,
-                22,
-                18,
-                22,
-                10,
                 9,
-                26,
-                24,
-                10,
-                2,
-                1,
-                5,
-                11,
-                17,
-                12,
-                14,
-                1,
-                12,
-                1,
-                1,
-                2,
                 9,
-                19,
-                24,
                 9,
-                2,
-                24,
-                12,
-                15,
-                18,
                 9,
-                27,
-                8,
-                8,
-                24,
-                12,
-                21,
-                22,
-                27,
-                3,
-                1,
-                13,
-                19,
-                19,
-                15,
-                11,
-                15,
-                8,
-                17,
-                20,
-                16,
-                19,
-                16,
-                2,
-                12,
-                16,
-                13,
-                5,
-                26,
                 9,
-                18,
-                14,
-                16,
-                15,
-                12,
-                5,
-                6,
-                16,
-                6,
-                5,
-                14,
-                6,
-                5,
-                14,
-                2,
-                11,
-                7,
-                17,
-                11,
-                20,
-                24,
-                5,
-                26,
-                16,
-                22,
-                16,
-                22,
-                26,
-                26,
-                15,
-                8,
-                22,
-                6,
-                16,
                 9,
-                7,
-                17,
-                8,
-                22,
-                20,
-                6,
-                11,
-                1,
-                1,
                 9,
-                8,
-                24,
-                10,
-                27,
-                13,
-                18,
-                24,
-                8,
-                18,
-                22,
-                19,
-                25,
-                27,
-                23,
                 9,
-                22,
-                1,
-                15,
-                16,
-                24,
-                2,
-                24,
-                5,
-                26,
-                0,
-                26,
-                17,
-                15,
-                12,
-                12,
-                1,
-                21,
-                2,
-                11,
-                8,
-                20,
-                20,
-                17,
-                23,
-                13,
-                7,
-                7,
-                7,
-                15,
-                18,
-                21,
-                20,
-                14,
-                6,
-                25,
-                26,
-                12,
-                8,
-                1,
-                17,
-                20,
-                11,
-                13,
-                11,
-                22,
                 9,
-                6,
-                5,
-                16,
-                10,
-                0,
-                17,
-                24,
-                18,
-                22,
-                14,
-                7,
-                27,
                 18,
-                6,
-                6,
-                22,
-                0,
                 18,
+                24,
+                8,
+                8,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
                 13,
-                20,
-                13,
-                17,
                 10,
+                26,
+                26,
+                26,
+                21,
+                21,
+                5,
+                27,
+                3,
+                25,
+                25,
+                25,
+                12,
+                1,
                 1,
                 26,
-                20,
-                15,
-                0,
                 1,
-                0,
-                13,
                 1,
                 1,
-                0,
+                6,
+                6,
+                9,
+                25,
+                25,
+                21,
                 2,
-                19,
-                27,
+                2,
+                2,
+                21,
+                4,
+                4,
+                10,
+                16,
+                16,
+                1,
+                25,
                 13,
-                26,
-                27,
                 10,
-                15,
-                9,
-                26,
+                10,
+                10,
+                3,
+                4,
+                6,
                 6,
-                22,
-                0,
                 11,
-                14,
-                21,
+                3,
+                3,
+                3,
+                3,
                 26,
-                9,
-                24,
-                0,
-                23,
-                25,
-                11,
-                6,
-                6,
-                11,
-                9,
-                5,
-                7,
-                22,
-                0,
-                9,
+                16,
+                16,
                 12,
-                21,
-                26,
+                12,
+                12,
+                7,
+                10,
+                11,
                 2,
-                14,
-                4,
                 2,
-                16,
-                26,
-                11,
-                19,
-                26,
-                11,
-                1,
-                13,
-                9,
-                1,
                 2,
                 24,
-                27,
                 24,
-                21,
-                11,
-                21,
-                2,
-                7,
-                18,
-                12,
-                27,
-                6,
-                14,
-                23,
                 26,
-                16,
-                20,
-                3,
-                13,
-                25,
-                10,
                 26,
-                18,
-                18,
-                18,
-                17,
-                14,
-                0,
-                18,
-                14,
-                20,
-                17,
-                4,
-                1,
-                25,
-                10,
-                2,
                 26,
-                25,
-                1,
-                0,
-                23,
-                6,
-                5,
-                20,
-                13,
                 22,
-                26,
-                7,
-                27,
-                11,
-                24,
-                24,
-                12,
-                7,
                 21,
                 13,
-                23,
-                20,
-                25,
-                3,
-                27,
-                5,
-                26,
-                16,
-                15,
-                3,
-                25,
+                17,
+                17,
                 10,
-                22,
-                18,
-                8,
-                12,
-                24,
+                10,
+                6,
                 23,
-                27,
+                23,
+                17,
                 2,
-                18,
-                0,
-                22,
-                26,
                 6,
-                26,
-                27,
                 6,
-                4,
-                3,
-                0,
                 6,
-                1,
-                15,
-                23,
-                26,
-                1,
-                21,
-                9,
-                14,
-                11,
-                21,
-                25,
-                14,
-                7,
-                27,
-                0,
-                25,
-                22,
-                4,
-                21,
-                0,
-                15,
-                17,
-                24,
-                5,
-                17,
-                8,
-                10,
-                5,
-                18,
-                22,
-                15,
-                26,
                 19,
-                21,
-                4,
-                9,
-                15,
-                9,
-                3,
-                7,
-                4,
-                2,
-                1,
-                1,
-                4,
-                12,
-                14,
-                3,
-                11,
-                26,
-                8,
-                5,
                 19,
-                14,
-                23,
-                2,
-                24,
-                0,
-                17,
-                26,
-                16,
-                9,
-                6,
-                25,
                 19,
-                10,
-                26,
-                16,
-                11,
                 0,
-                1,
-                17,
-                3,
-                12,
-                23,
-                2,
-                7,
-                14,
-                18,
-                27,
-                3,
-                11,
-                14,
                 0,
-                8,
-                13,
-                24,
-                17,
-                26,
-                7,
-                22,
-                7,
-                13,
-                16,
+                0,
                 4,
-                5,
-                16,
-                24,
-                20,
-                5,
-                26,
-                26,
-                9,
-                25,
-                26,
-                7,
-                25,
                 6,
-                4,
-                2,
-                23,
-                2,
-                1,
-                9,
-                10,
-                7,
-                3,
-                8,
-                25,
-                19,
-                27,
-                19,
-                17,
-                15,
-                27,
-                25,
-                1,
-                3,
-                16,
-                13,
-                12,
-                27,
-                7,
-                1,
-                13,
                 6,
-                0,
-                4,
-                12,
-                17,
-                2,
-                15,
-                9,
-                18,
-                24,
-                26,
-                27,
-                14,
-                15,
-                27,
-                24,
-                14,
-                12,
                 6,
-                13,
-                27,
-                7,
-                25,
-                22,
                 11,
-                20,
-                4,
-                1,
                 14,
-                25,
-                21,
-                12,
-                2,
-                5,
-                19,
-                24,
-                24,
-                16,
-                11,
-                22,
-                26,
-                10,
-                17,
-                0,
-                0,
-                10,
-                26,
-                5,
-                9,
-                5,
-                10,
-                5,
-                9,
-                23,
-                19,
-                10,
-                2,
-                6,
-                4,
-                20,
-                6,
-                18,
-                8,
-                24,
-                5,
-                7,
-                27,
-                0,
-                10,
-                20,
-                16,
-                8,
-                18,
-                7,
-                25,
-                21,
-                18,
-                22,
-                2,
-                6,
-                12,
-                13,
                 14,
-                0,
-                7,
-                26,
-                0,
-                5,
-                6,
-                13,
-                21,
-                0,
-                23,
-                27,
-                25,
                 14,
                 14,
                 14,
-                19,
-                23,
-                4,
-                13,
-                23,
-                17,
-                22,
-                25,
-                5,
-                23,
-                26,
-                26,
-                25,
-                18,
-                18,
-                10,
-                21,
-                18,
-                0,
-                22,
-                9,
-                22,
-                11,
-                17,
-                4,
-                17,
-                19,
-                19,
-                1,
-                27,
-                5,
-                11,
-                8,
-                19,
-                24,
-                2,
-                20,
-                27,
-                1,
-                11,
-                22,
-                13,
-                8,
-                27,
                 14,
-                6,
-                8,
-                9,
-                18,
-                15,
-                23,
-                23,
-                9,
-                7,
-                13,
                 14,
-                26,
-                16,
-                26,
-                19,
                 14,
-                23,
-                23,
-                9,
-                12,
-                1,
-                10,
-                5,
-                15,
-                8,
-                17,
-                7,
-                22,
-                26,
-                18,
-                20,
-                24,
-                27,
-                17,
-                8,
-                17,
-                18,
-                0,
-                19,
-                13,
-                7,
                 14,
-                3,
-                2,
-                1,
-                4,
-                15,
-                4,
-                0,
-                4,
-                3,
-                8,
-                8,
-                12,
                 14,
-                8,
-                23,
-                17,
-                21,
-                16,
-                5,
-                0,
-                5,
-                9,
-                18,
-                24,
-                20,
-                16,
-                19,
-                3,
-                25,
-                18,
-                21,
-                1,
-                13,
-                16,
                 14,
-                5,
-                7,
-                7,
-                6,
-                26,
-                1,
-                18,
-                17,
-                19,
-                16,
-                3,
-                5,
-                22,
-                22,
-                17,
-                19,
-                19,
-                21,
-                16,
-                13,
-                16,
-                10,
-                25,
-                10,
-                25,
-                0,
-                17,
-                17,
-                21,
-                5,
-                11,
                 14,
                 14,
-                26,
-                12,
-                12,
-                5,
-                0,
-                16,
-                27,
-                25,
-                25,
-                1,
-                22,
-                15,
                 14,
-                27,
-                13,
-                6,
-                21,
-                1,
-                4,
-                16,
-                9,
-                25,
-                8,
-                24,
-                17,
-                25,
-                21,
-                13,
                 14,
-                13,
-                22,
-                12,
-                6,
-                18,
-                20,
-                8,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                2,
                 21,
-                15,
-                12,
                 21,
-                9,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                23,
+                23,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
                 1,
-                16,
                 1,
-                9,
-                14,
-                11,
-                5,
-                17,
-                22,
-                7,
-                7,
-                25,
+                8,
                 12,
-                11,
-                10,
                 18,
-                12,
-                20,
-                7,
-                9,
-                26,
-                13,
-                3,
-                2,
-                1,
-                8,
-                23,
-                1,
-                3,
-                24,
+                18,
                 2,
                 0,
-                27,
-                11,
-                21,
                 0,
-                2,
-                10,
                 9,
-                18,
-                23,
+                9,
+                24,
+                24,
+                0,
+                1,
+                1,
                 26,
-                2,
-                7,
+                19,
+                25,
+                3,
                 11,
-                10,
-                10,
-                21,
-                18,
-                3,
-                10,
-                22,
-                17,
-                20,
-                0,
-                14,
-                25,
-                12,
-                27,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                26,
                 22,
                 21,
-                18,
-                26,
-                10,
-                0,
-                15,
-                10,
-                3,
-                23,
-                8,
-                20,
-                13,
                 21,
-                9,
-                13,
-                19,
-                24,
-                25,
-                10,
-                12,
-                9,
-                5,
-                2,
-                12,
-                3,
-                26,
-                2,
-                18,
-                12,
-                9,
-                13,
-                16,
-                16,
-                25,
-                18,
-                16,
-                13,
                 1,
+                14,
+                19,
+                20,
+                14,
                 13,
                 15,
-                23,
-                26,
-                13,
-                19,
-                4,
-                17,
-                19,
-                26,
+                15,
+                14,
+                9,
+                9,
+                11,
                 11,
-                13,
                 10,
-                13,
-                4,
                 18,
                 17,
-                19,
-                0,
-                1,
-                7,
-                7,
-                4,
-                9,
-                9,
-                10,
-                9,
-                24,
-                3,
-                1,
-                1,
+                20,
+                27,
+                27,
+                27,
+                27,
                 14,
-                1,
-                19,
-                5,
-                8,
-                12,
-                10,
                 0,
-                20,
-                19,
-                21,
-                15,
                 0,
+                11,
+                14,
+                13,
+                27,
                 8,
-                25,
                 26,
-                21,
-                17,
-                18,
-                10,
-                1,
-                8,
-                4,
-                19,
-                19,
-                17,
-                0,
-                22,
-                9,
-                10,
                 4,
-                6,
-                12,
-                24,
-                12,
                 25,
+                17,
+                17,
                 5,
-                10,
-                4,
-                4,
-                25,
-                9,
-                12,
-                15,
                 5,
-                17,
-                1,
-                27,
-                20,
+                21,
+                21,
                 26,
-                10,
-                6,
-                11,
                 5,
-                7,
-                18,
-                4,
-                26,
-                19,
-                14,
-                16,
-                21,
-                17,
-                24,
-                9,
-                14,
-                12,
-                1,
                 5,
-                7,
-                4,
-                9,
-                10,
-                21,
-                8,
-                2,
-                18,
+                27,
                 22,
-                8,
-                2,
-                13,
-                11,
-                10,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                17,
+                17,
                 9,
-                11,
-                13,
-                27,
-                10,
-                19,
-                3,
                 15,
-                5,
-                8,
-                18,
-                22,
-                25,
-                3,
+                15,
                 10,
-                21,
-                20,
-                20,
-                11,
-                20,
-                13,
-                13,
-                3,
-                27,
                 10,
-                12,
-                21,
-                4,
-                5,
-                19,
-                16,
-                27,
-                7,
                 4,
-                10,
+                15,
+                15,
+                6,
                 6,
-                0,
-                3,
-                25,
-                16,
-                3,
+                12,
                 12,
                 25,
-                27,
+                25,
+                25,
+                9,
+                9,
                 14,
-                21,
+                14,
+                14,
+                18,
+                18,
+                18,
                 26,
-                12,
-                13,
-                0,
-                10,
-                8,
-                19,
-                11,
-                22,
-                0,
-                4,
-                16,
-                17,
                 14,
-                1,
-                4,
-                11,
-                8,
-                1,
-                19,
-                3,
+                14,
                 20,
-                4,
-                7,
-                27,
-                16,
-                17,
-                5,
-                4,
-                27,
-                18,
-                11,
-                22,
-                15,
-                11,
-                9,
-                25,
-                12,
-                25,
-                24,
-                23,
-                2,
                 20,
-                6,
+                0,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
                 23,
-                20,
-                19,
-                2,
-                1,
-                1,
-                7,
-                2,
-                8,
-                21,
-                13,
-                24,
-                25,
-                24,
-                7,
-                26,
-                7,
-                7,
-                4,
-                24,
-                11,
-                17,
-                6,
-                16,
-                20,
-                18,
-                4,
-                3,
-                26,
-                15,
-                24,
-                24,
-                7,
-                12,
-                15,
-                26,
-                27,
-                10,
-                19,
-                22,
-                9,
-                11,
-                8,
-                21,
-                27,
-                20,
-                10,
-                20,
-                13,
-                20,
-                1,
-                10,
-                13,
-                3,
-                15,
-                4,
-                13,
-                9,
                 23,
-                8,
-                25,
-                9,
-                13,
-                8,
-                0,
-                1,
-                2,
-                8,
-                20,
-                15,
-                4,
-                12,
-                0,
-                20,
-                4,
-                6,
-                16,
-                24,
-                5,
-                20,
                 17,
-                13,
-                20,
-                0,
                 17,
-                18,
-                10,
-                6,
-                18,
-                27,
-                18,
-                16,
-                19,
-                14,
-                27,
-                6,
-                26,
-                23,
-                19,
                 2,
-                0,
-                3,
-                9,
-                8,
-                26,
-                6,
-                10,
+                2,
+                2,
+                14,
+                14,
                 14,
-                16,
-                13,
-                8,
-                11,
-                24,
-                12,
-                8,
                 21,
-                0,
-                2,
-                19,
-                0,
-                17,
-                20,
                 5,
-                12,
-                21,
-                22,
-                3,
-                21,
-                7,
-                18,
-                7,
-                18,
-                4,
-                12,
-                3,
-                22,
-                0,
-                13,
-                17,
-                24,
-                8,
-                26,
-                7,
-                14,
                 5,
-                9,
-                15,
-                10,
-                0,
-                15,
-                18,
-                10,
-                7,
-                20,
-                18,
-                7,
-                14,
-                2,
-                13,
-                0,
-                26,
-                26,
-                24,
-                4,
-                25,
-                23,
-                22,
-                25,
-                2,
-                15,
-                19,
-                19,
-                22,
-                6,
-                15,
                 5,
-                23,
-                12,
-                8,
-                9,
-                8,
                 5,
-                25,
-                13,
-                10,
-                20,
-                8,
-                2,
-                22,
-                23,
-                0,
-                18,
-                16,
-                26,
-                25,
-                7,
-                6,
-                10,
-                3,
-                18,
-                26,
-                24,
-                4,
-                23,
-                26,
-                21,
-                20,
-                25,
-                21,
-                25,
-                12,
-                2,
-                15,
-                3,
-                1,
-                12,
-                0,
-                1,
-                1,
-                20,
-                6,
-                13,
-                17,
-                15,
-                3,
-                21,
-                18,
-                17,
-                22,
-                20,
-                14,
-                22,
-                18,
-                20,
-                19,
-                23,
-                19,
-                19,
-                25,
-                0,
-                24,
-                24,
-                6,
-                26,
-                16,
-                6,
-                19,
-                20,
-                23,
-                11,
-                6,
-                1,
-                6,
-                13,
-                25,
-                0,
-                3,
-                8,
-                4,
-                25,
-                24,
-                22,
-                17,
-                0,
-                27,
-                12,
-                14,
-                8,
-                9,
-                4,
-                18,
-                2,
-                0,
-                15,
-                9,
-                18,
-                3,
-                15,
-                8,
-                22,
-                21,
-                4,
-                14,
-                27,
-                11,
-                3,
-                18,
-                10,
-                13,
-                10,
-                16,
-                9,
-                20,
-                23,
-                16,
-                7,
-                2,
-                15,
-                17,
-                9,
-                8,
-                14,
-                0,
-                1,
-                7,
-                22,
-                2,
-                0,
                 5,
-                22,
-                1,
-                3,
-                22,
-                22,
-                8,
-                13,
-                3,
-                13,
-                17,
-                2,
-                16,
-                13,
-                1,
-                11,
-                27,
-                19,
                 5,
-                11,
                 5,
-                21,
-                21,
-                14,
-                20,
-                27,
-                7,
-                23,
-                13,
-                20,
-                21,
-                3,
-                4,
-                1,
-                13,
-                24,
-                9,
-                16,
-                18,
-                21,
-                15,
-                8,
-                11,
-                13,
-                14,
-                1,
-                0,
-                22,
-                7,
-                21,
-                10,
-                18,
-                3,
-                15,
-                3,
-                4,
-                16,
-                25,
-                0,
-                10,
-                24,
-                6,
-                7,
-                16,
-                15,
-                16,
-                14,
-                19,
-                22,
-                7,
-                24,
-                22,
-                14,
-                22,
-                13,
-                4,
-                21,
-                8,
-                26,
-                24,
-                20,
-                11,
                 5,
-                10,
-                1,
-                15,
-                17,
-                3,
                 5,
-                26,
-                20,
                 5,
                 5,
                 5,
-                24,
-                21,
-                12,
-                7,
-                24,
-                8,
-                2,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                9,
+                9,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                4,
+                13,
+                10,
+                20,
+                27,
+                24,
+                21,
+                21,
+                16,
+                16,
+                16,
+                4,
+                24,
+                24,
+                17,
+                21,
+                14,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+            ],
+            "targets": [
+                1,
+                24,
+                24,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                4,
+                3,
+                3,
+                18,
+                27,
+                27,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                18,
+                7,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                6,
+                27,
+                27,
+                27,
+                25,
+                25,
+                25,
+                2,
+                2,
+                2,
+                2,
+                14,
+                6,
+                15,
+                24,
+                7,
+                7,
+                23,
+                23,
+                23,
+                16,
+                6,
+                6,
+                15,
+                20,
+                17,
+                1,
+                11,
+                11,
+                11,
+                10,
+                10,
+                10,
+                26,
+                2,
+                19,
+                17,
+                25,
+                14,
+                22,
+                22,
+                12,
+                12,
+                22,
+                16,
+                16,
+                23,
+                23,
+                22,
+                22,
+                22,
+                4,
+                10,
+                10,
+                12,
+                8,
+                8,
+                11,
+                11,
+                24,
+                24,
+                5,
+                26,
+                26,
+                26,
+                26,
+                11,
+                5,
+                5,
+                12,
+                10,
+                10,
+                9,
+                20,
+                20,
+                9,
+                9,
+                9,
+                9,
+                17,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                8,
+                10,
+                5,
+                26,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                11,
+                16,
+                8,
+                5,
+                14,
+                15,
+                15,
+                9,
+                24,
+                24,
+                24,
+                1,
+                16,
+                19,
+                23,
+                15,
+                2,
+                2,
+                2,
+                4,
+                4,
+                27,
+                17,
+                10,
+                8,
+                27,
+                27,
+                22,
+                22,
+                5,
+                11,
+                11,
+                11,
+                18,
+                18,
+                11,
+                16,
+                19,
+                13,
+                24,
+                4,
+                21,
+                21,
+                24,
+                24,
+                16,
+                16,
+                16,
+                3,
+                19,
+                3,
+                3,
+                3,
+                18,
+                18,
+                6,
+                9,
+                13,
+                13,
+                17,
+                17,
+                12,
+                12,
+                3,
+                7,
+                7,
+                7,
+                21,
+                26,
+                5,
+                5,
+                20,
+                20,
+                12,
+                12,
+                17,
+                21,
+                9,
+                9,
+                9,
+                21,
+                6,
+                6,
+                24,
+                24,
+                3,
+                1,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                7,
+                15,
+                9,
+                9,
+                18,
+                23,
+                18,
+                8,
+                4,
+                4,
+                9,
+                24,
+                7,
+                12,
+                11,
+                4,
+                5,
+                25,
+                25,
+                25,
+                1,
+                1,
+                1,
+                22,
+                22,
+                0,
+                18,
+                10,
+                10,
+                10,
+                10,
+                14,
+                5,
+                4,
+                19,
+                5,
+                1,
+                1,
+                13,
+                13,
+                18,
+                24,
+                6,
+                6,
+                15,
+                15,
+                14,
+                14,
+                14,
+                24,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                1,
+                12,
+                12,
+                12,
+                2,
+                12,
+                12,
+                6,
+                1,
+                1,
+                21,
+                18,
+                18,
+                18,
+                0,
+                21,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                26,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
                 0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                11,
+                2,
+                17,
+                17,
+                17,
+                4,
+                17,
+                3,
+                17,
+                17,
+                24,
+                20,
+                27,
+                20,
+                22,
+                19,
+                9,
+                12,
+                12,
+                12,
+                12,
+                14,
+                8,
+                8,
+                8,
+                2,
+                2,
+                16,
+                22,
+                22,
+                15,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                27,
+                10,
+                10,
+                25,
                 21,
-                4,
+                21,
+                11,
+                6,
+                6,
+                10,
                 7,
-                17,
-                15,
                 15,
-                24,
-                16,
-                3,
-                22,
-                17,
-                1,
-                13,
-                10,
+                7,
                 5,
                 5,
-                22,
-                17,
                 21,
-                14,
-                0,
-                2,
-                4,
-                2,
+                21,
+                20,
                 0,
-                27,
-                6,
-                15,
-                8,
-                25,
-                18,
-                11,
-                5,
-                10,
-                10,
                 0,
-                11,
-                27,
-                27,
+                19,
                 23,
-                7,
-                11,
-                4,
-                4,
-                9,
-                26,
-                9,
                 23,
+                12,
+                12,
+                9,
+                7,
+                7,
                 7,
+                7,
+                14,
+                22,
                 22,
-                15,
                 14,
-                16,
-                2,
-                11,
                 21,
-                0,
                 2,
-                12,
-                2,
-                17,
-                2,
-                24,
-                10,
-                2,
-                25,
-                10,
                 3,
-                15,
-                11,
+                16,
+                24,
+                24,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
+                20,
                 20,
-                11,
-                19,
-                8,
-                14,
-                9,
-                24,
-                0,
-                6,
-                4,
-                11,
-                21,
-                23,
-                6,
-                11,
-                6,
-                23,
-                6,
-                26,
-                27,
                 20,
-                3,
-                18,
-                11,
-                17,
-                12,
-                16,
                 1,
-                2,
-                13,
                 1,
-                15,
                 1,
-                5,
-                4,
-                7,
-                22,
-                9,
-                27,
-                23,
+                1,
+                17,
+                17,
+                17,
                 26,
+                10,
                 3,
-                15,
-                18,
-                26,
-                19,
-                15,
-                26,
-                0,
-                26,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                13,
+                2,
+                8,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
+                25,
                 25,
-                0,
-                20,
-                24,
-                23,
-                0,
-                22,
-                17,
-                23,
-                27,
-                16,
-                20,
-                17,
-                2,
-                18,
-                20,
-                0,
-                19,
-                7,
-                5,
-                6,
-                22,
-                11,
-                10,
-                8,
-                18,
-                16,
-                10,
-                0,
-                3,
-                20,
-                0,
-                12,
-                6,
-                5,
-                3,
-                19,
-                11,
-                0,
-                12,
                 25,
-                9,
-                17,
-                15,
-                11,
-                8,
-                5,
-                20,
-                2,
-                13,
-                10,
-                3,
-                9,
-                10,
-                2,
-                15,
-                3,
-                4,
-                23,
-                6,
-                23,
                 25,
-                13,
-                24,
-                12,
-                12,
-                11,
-                17,
-                12,
-                12,
-                14,
-                7,
-                8,
-                0,
-                10,
-                20,
-                7,
-                16,
-                20,
-                26,
-                24,
-                13,
-                0,
-                10,
-                13,
-                24,
-                21,
-                16,
-                18,
-                0,
-                12,
-                7,
-                17,
-                10,
-                16,
-                16,
-                8,
-                1,
-                11,
-                20,
-                2,
-                10,
-                19,
-                9,
-                8,
-                9,
-                12,
-                0,
-                18,
-                14,
-                20,
-                9,
-                6,
-                26,
-                13,
-                19,
                 25,
                 25,
-                7,
-                15,
                 3,
-                9,
+                20,
+                16,
                 15,
                 14,
-                6,
-                16,
-                0,
-                22,
-                22,
-                9,
                 14,
+                14,
+                14,
+                5,
                 15,
-                18,
-                12,
-                6,
                 17,
-                1,
-                27,
-                7,
-                6,
-                11,
                 17,
-                9,
-                14,
-                1,
-                11,
-                10,
-                11,
-                15,
-                20,
-                4,
-                10,
-                13,
-                18,
-                24,
-                22,
-                25,
-                20,
-                3,
-                9,
-                11,
-                20,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
+                17,
                 25,
-                9,
+                21,
+                21,
                 19,
-                2,
-                3,
-                26,
-                20,
-                8,
-                23,
-                0,
-                4,
-                0,
-                12,
-                9,
                 10,
-                24,
-                15,
-                13,
                 10,
-                17,
+                8,
+                15,
+                15,
                 15,
-                16,
-                18,
-                26,
-                26,
-                18,
-                3,
-                13,
-                0,
-                2,
                 15,
-                21,
-                21,
-                25,
-                23,
-                22,
-                1,
-                27,
                 11,
-                24,
-                24,
-                23,
-                22,
-                2,
-                9,
-                21,
+                11,
+                15,
                 16,
-                0,
-                13,
-                18,
-                3,
-                5,
-                9,
-                8,
-                5,
-                10,
-                27,
                 16,
-                14,
-                5,
-                6,
+                27,
+                27,
                 0,
-                4,
-                23,
-                5,
-                16,
-                4,
-                13,
-                26,
-                2,
-                11,
-                2,
-                18,
-                2,
-                22,
-                10,
-                24,
-                9,
-                9,
-                20,
-                12,
-                11,
-                2,
-                20,
-                20,
+                0,
+                14,
+                14,
+                27,
+                27,
                 12,
-                24,
-                11,
-                24,
-                10,
-                9,
-                21,
-                18,
-                6,
-                4,
-                7,
-                8,
-                15,
                 12,
-                13,
-                4,
-                1,
-                18,
-                10,
-                16,
-                17,
-                18,
-                4,
-                3,
-                16,
                 17,
-                26,
-                15,
-                2,
-                11,
                 17,
-                16,
-                13,
-                12,
-                0,
-                2,
-                20,
-                0,
                 17,
-                8,
                 17,
-                4,
-                19,
-                0,
-                21,
-                7,
-                15,
-                24,
-                14,
-                3,
-                25,
-                1,
-                20,
-                14,
-                24,
-                6,
-                2,
-                1,
-                19,
-                22,
                 17,
+                16,
+                16,
                 2,
-                5,
-                12,
-                11,
-                26,
                 2,
-                14,
-                19,
-                12,
-                11,
-                10,
-                5,
-                11,
                 6,
-                18,
-                4,
                 16,
-                23,
-                24,
-                6,
+                11,
                 26,
-                15,
                 26,
+                26,
+                13,
+                17,
+                17,
                 11,
-                2,
-                3,
-                23,
-                14,
-                7,
-                2,
-                22,
-                2,
-                20,
-                19,
-                0,
-                3,
-                4,
-                3,
                 11,
-                12,
-                19,
-                3,
-                19,
-                25,
-                12,
-                1,
-                26,
-                9,
-                7,
-                5,
-                6,
-                5,
-                1,
-                16,
-                26,
-                16,
-                1,
-                24,
-                20,
                 11,
-                21,
-                20,
-                16,
-                4,
-                19,
-                8,
-                15,
-                15,
-                19,
-                14,
                 11,
-                25,
-                20,
-                26,
-                4,
-                17,
-                18,
-                25,
-                0,
-                5,
-                0,
-                0,
-                8,
-                27,
-                26,
-                13,
-                2,
-                8,
-                22,
-                27,
                 17,
-                7,
-                0,
-                22,
+                24,
+                24,
+                24,
                 27,
+                16,
                 3,
                 3,
-                3,
-                26,
-                27,
-                7,
-                6,
-                4,
-                24,
-                4,
+                25,
+                25,
+                25,
+                8,
+                8,
                 8,
-                27,
-                4,
                 8,
-                0,
-                7,
-                22,
-                0,
                 10,
-                18,
-                19,
-                0,
-                12,
-                7,
-                3,
-                19,
+                15,
+                15,
+                13,
                 10,
-                6,
-                6,
-                24,
-                17,
-                22,
-                3,
-                26,
-                23,
-                0,
-                1,
                 12,
-                7,
-                5,
-                8,
-                15,
-                6,
-                16,
-                14,
-                22,
-                1,
+                12,
+                4,
+                4,
+                4,
+                4,
                 9,
                 4,
-                25,
-                11,
-                6,
-                0,
+                4,
                 7,
-                12,
-                18,
-                27,
-                2,
-                14,
-                14,
+                0,
+                0,
+                0,
+                26,
                 9,
-                4,
-                25,
                 9,
-                24,
-                20,
-                2,
-                26,
-                7,
-                11,
-                4,
-                15,
-                27,
+                9,
+                9,
+                18,
+                8,
+                16,
                 16,
-                12,
-                21,
-                6,
-                22,
-                26,
                 14,
-                15,
-                0,
-                7,
-                12,
-                23,
-                26,
+                6,
+                13,
+                13,
+                4,
+                3,
                 3,
-                0,
-                12,
-                15,
                 1,
-                11,
-                18,
-                5,
                 1,
-                13,
+                6,
+                25,
+                25,
                 16,
-                12,
-                7,
-                19,
+                16,
+                16,
+                3,
                 13,
-                12,
-                6,
                 26,
-                20,
-                13,
+                18,
+                18,
+                18,
                 26,
-                6,
-                13,
-                11,
-                13,
-                11,
-                23,
                 26,
-                5,
-                22,
-                8,
-                13,
-                13,
+                10,
                 9,
-                3,
                 9,
-                2,
-                26,
+                9,
+                22,
+                11,
+                25,
+                25,
+                20,
+                20,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
+                10,
                 10,
-                3,
-                19,
-                27,
-                1,
-                9,
-                23,
-                17,
-                4,
-                13,
-                3,
-                3,
-                25,
-                5,
-                1,
-                24,
-                2,
-                17,
-                27,
-                19,
-                3,
-                9,
-                5,
-                18,
-                13,
-                2,
-                13,
-                25,
-                8,
-                6,
-                27,
-                5,
-                26,
-                5,
-                8,
-                7,
-                11,
-                3,
-                25,
-                7,
-                23,
-                27,
-                9,
-                5,
-                8,
-                25,
-                27,
-                9,
-                15,
-                1,
-                26,
-                20,
-                14,
-                27,
-                17,
-                9,
-                16,
-                9,
-                25,
                 10,
-                6,
-                24,
-                27,
-                7,
-                8,
-                4,
-                4,
-                15,
-                25,
-                23,
-                23,
+                10,
+                10,
+                10,
+                10,
+                0,
                 7,
-                22,
-                25,
-                20,
-                23,
                 21,
-                22,
                 21,
-                14,
-                14,
-                8,
-                18,
-                25,
                 21,
                 21,
-                2,
-                14,
-                10,
-                9,
-                13,
-                4,
-                12,
-                7,
-                25,
-                22,
-                0,
-                18,
-                22,
-                7,
-                18,
-                8,
-                18,
-                0,
-                17,
                 21,
-                6,
-                17,
-                16,
-                19,
                 21,
-                26,
-                11,
-                4,
-                7,
-                19,
-                19,
-                12,
-                14,
-                1,
-                27,
-                26,
-                17,
-                4,
-                7,
-                2,
-                25,
-                6,
-                4,
-                17,
-                19,
-                9,
-                25,
-                23,
-                9,
-                14,
-                4,
-                14,
                 21,
                 21,
-                2,
-                11,
-                17,
-                22,
-                5,
-                7,
-                11,
-                25,
-                8,
-                1,
-                27,
-                18,
-                25,
-                17,
-                19,
-                14,
-                27,
-                1,
-                9,
-                20,
-                18,
-                8,
-                8,
-                27,
-                3,
-                3,
-                6,
-                13,
-                1,
-                19,
-                19,
-                20,
-                9,
-                24,
-                7,
-                17,
-                0,
-                5,
-                8,
-                10,
-                12,
-                8,
                 21,
-                24,
-                12,
-                27,
-                25,
-                11,
-                25,
-                26,
-                24,
-                3,
-                1,
-                27,
-                16,
-                16,
-                4,
-                25,
-                24,
-                18,
-                24,
-                23,
-                23,
-                18,
-                7,
-                23,
-                0,
-                7,
-                9,
-                3,
-                6,
-                10,
-                7,
-                17,
-                14,
-                1,
-                6,
-                25,
-                3,
-                3,
-                18,
-                20,
-                5,
-                7,
-                22,
-                23,
-                17,
-                6,
-                27,
                 21,
-                5,
-                11,
-                22,
-                9,
-                12,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
+                21,
                 7,
-                6,
-                14,
-                13,
-                2,
-                23,
                 20,
-                0,
-                14,
-                15,
-                23,
-                6,
-                23,
-                26,
-                9,
-                3,
-                1,
-                9,
-                7,
-                26,
-                19,
-                14,
-                24,
-                26,
-                24,
-                27,
                 20,
-                9,
-                14,
-                13,
-                18,
-                8,
-                25,
-                23,
-                11,
-                1,
-                9,
-                16,
-                5,
-                10,
-                17,
-                21,
-                23,
-                8,
-                25,
-                2,
-                4,
-                18,
-                1,
-                22,
-                10,
                 20,
-                6,
-                2,
+                19,
+                19,
+                19,
                 16,
-                0,
-                17,
-                20,
                 4,
                 3,
-                25,
-                19,
-                17,
-                18,
-                16,
+                3,
                 0,
-                6,
-                8,
-                14,
-                4,
-                4,
                 1,
-                24,
-                16,
-                26,
-                10,
+                1,
+                12,
+                12,
+                12,
                 26,
-                25,
-                20,
-                10,
                 2,
-                21,
                 2,
-                18,
-                6,
-                27,
-                12,
-                12,
                 2,
-                4,
-                11,
-                18,
-                8,
-                0,
-                14,
-                25,
-                10,
-                5,
-                23,
-                23,
-                11,
-                0,
-                18,
-                8,
-                25,
-                18,
-                23,
-                8,
-                0,
-                17,
-                27,
-                18,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                2,
+                20,
+                20,
                 20,
-                7,
-                21,
-                1,
-                23,
-                6,
-                11,
-                1,
-                12,
                 13,
-                9,
-                26,
-                8,
+                13,
                 25,
-                5,
-                18,
-                19,
-                1,
-                5,
-                12,
-                27,
-                0,
-                1,
-                26,
-                10,
-                16,
                 14,
-                24,
-                9,
-                3,
-                2,
-                25,
-                13,
-                16,
-                12,
-                21,
-                8,
-                12,
-                24,
-                2,
-                7,
-                7,
-                12,
                 14,
-                8,
-                7,
-                21,
-                1,
-                5,
-                4,
-                4,
-                15,
-                11,
-                10,
-                11,
-                16,
-                25,
-                5,
-                18,
-                25,
-                27,
-                11,
+                22,
+                22,
+                9,
                 25,
-                12,
-                16,
-                2,
-                11,
-                21,
-                27,
-                15,
-                24,
-                7,
-                10,
-                6,
-                6,
                 25,
-                9,
-                17,
                 19,
-                23,
-                17,
                 8,
-                7,
-                15,
-                22,
-                4,
-                10,
-                22,
-                14,
-                26,
-                11,
                 8,
-                5,
-                4,
+                0,
+                0,
                 7,
-                4,
-                24,
-                1,
-                19,
-                16,
-                27,
-                17,
-                20,
-                4,
-                12,
-                16,
-                12,
-                21,
-                26,
-                18,
-                25,
-                13,
-                2,
-                18,
-                14,
-                5,
-                20,
-                12,
-                18,
-                11,
-                11,
-                26,
-                23,
                 7,
-                1,
-                15,
                 19,
-                5,
-                2,
-                11,
-                26,
-                15,
-                4,
-                13,
-                11,
+                19,
+                24,
+                24,
                 11,
-                16,
-                7,
-                14,
-                25,
-                6,
-                10,
-                14,
+                19,
+                19,
+                17,
+                17,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                9,
+                22,
                 22,
-                11,
-                18,
-                23,
-                19,
-                10,
-                2,
-                6,
                 22,
-                24,
                 13,
-                24,
-                26,
-                14,
                 13,
-                12,
-                22,
-                24,
-                7,
-                2,
-                20,
-                3,
-                1,
-                23,
-                10,
-                17,
                 19,
-                26,
-                26,
-                5,
-                14,
-                6,
-                16,
-                26,
-                20,
-                4,
-                26,
-                9,
-                15,
-                21,
-                1,
-                26,
-                17,
-                27,
-                21,
-                27,
-                24,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
+                19,
                 23,
-                6,
-                18,
-                16,
-                27,
-                27,
-                22,
-                8,
-                3,
-                0,
-                17,
                 12,
-                15,
-                1,
-                27,
-                17,
-                7,
-                11,
-                11,
-                10,
-                4,
-                26,
-                2,
                 12,
-                19,
-                0,
-                23,
                 12,
-                8,
-                10,
-                13,
-                24,
-                21,
-                5,
-                13,
-                20,
                 12,
-                8,
-                21,
+                25,
+                25,
+                14,
                 6,
+                0,
                 17,
-                11,
-                18,
-                13,
-                15,
-                14,
-                26,
-                16,
-                18,
-                2,
-                21,
-                20,
-                18,
                 17,
                 17,
-                27,
+                3,
+                14,
+                14,
                 21,
-                15,
-                22,
-                9,
-                2,
-                15,
-                19,
                 5,
-                0,
                 5,
-                0,
-                19,
-                3,
                 5,
-                27,
-                22,
-                2,
                 26,
-                24,
-                18,
-                27,
-                12,
                 26,
+                4,
                 12,
-                16,
-                24,
-                13,
-                24,
-                0,
-                24,
-                25,
-                0,
-                10,
-                13,
-                12,
-                23,
                 12,
-                20,
-                25,
-                3,
-                18,
-                14,
-                3,
-                21,
-                18,
-                25,
+                24,
+                19,
+                19,
+                19,
+                12,
+                20,
+                20,
                 2,
-                13,
+                11,
+                11,
+                6,
+                21,
+                6,
+                19,
+                19,
+                19,
+                9,
                 23,
-                24,
+                22,
+                22,
+                1,
                 26,
-                4,
-                23,
                 26,
                 26,
+                26,
+                5,
+                14,
+                14,
+                18,
+                18,
+                18,
                 21,
+                8,
+                8,
+                15,
+                15,
+                15,
                 11,
-                6,
-                27,
-                24,
-                21,
-                21,
-                22,
-                2,
+                11,
+                4,
+                4,
+                4,
                 7,
                 1,
-                0,
-                19,
                 1,
                 26,
-                20,
-                25,
-                10,
-                9,
-                15,
-                11,
-                5,
-                27,
+                26,
+                7,
+                7,
                 16,
+                22,
+                22,
                 5,
+                27,
+                11,
+                11,
+                11,
+                17,
+                17,
+                17,
+                8,
+                20,
+                20,
+                3,
+                15,
+                15,
+                15,
+                24,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                14,
+                23,
+                15,
+                15,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
+                3,
                 3,
-                4,
-                27,
-                1,
-                20,
-                26,
-                14,
-                13,
-                19,
-                6,
-                15,
-                2,
-                10,
-                15,
-                2,
-                19,
-                21,
-                25,
-                25,
-                14,
-                8,
-                6,
-                4,
-                20,
                 0,
-                2,
-                19,
-                22,
-                16,
-                4,
-                12,
-                17,
                 0,
-                5,
-                8,
-                1,
                 0,
-                23,
                 0,
-                26,
-                2,
-                2,
-                20,
+                0,
+                0,
+                16,
                 16,
-                17,
-                20,
-                3,
-                6,
-                27,
-                20,
-                15,
-                10,
-                8,
-                3,
                 2,
-                18,
-                13,
-                21,
-                20,
-                5,
-                26,
-                19,
-                21,
-                0,
-                3,
-                17,
-                24,
-                10,
-                3,
-                7,
-                11,
-                13,
-                12,
                 13,
-                15,
                 25,
                 25,
-                7,
-                15,
-                22,
-                27,
-                19,
-                16,
-                7,
-                19,
                 8,
-                11,
+                26,
+                26,
+                6,
+                6,
+                13,
                 13,
-                1,
-                12,
-                11,
-                20,
-                9,
-                0,
-                22,
-                4,
-                11,
                 21,
-                24,
-                6,
-                4,
                 25,
-                18,
-                26,
-                5,
-                9,
-                9,
-                14,
-                8,
-                22,
                 25,
-                0,
-                26,
-                15,
-                24,
-                2,
-                26,
-                7,
-                12,
-                20,
-                13,
-                7,
-                22,
-                8,
-                7,
-                12,
-                26,
+                3,
+                3,
                 4,
-                26,
-                7,
+                8,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
+                15,
                 15,
-                18,
-                5,
                 15,
-                10,
-                8,
-                23,
-                16,
-                14,
-                6,
                 15,
-                22,
-                18,
-                7,
-                20,
-                25,
                 15,
-                14,
-                10,
-                0,
-                8,
-                11,
-                26,
-                17,
-                24,
-                16,
-                2,
-                1,
-                5,
-                17,
-                22,
-                10,
-                7,
-                4,
-                17,
-                4,
-                6,
-                11,
-                21,
                 15,
-                3,
-                13,
-                21,
-                10,
-                6,
-                10,
-                3,
-                12,
-                9,
                 15,
-                20,
-                3,
                 15,
+                15,
+                15,
+                15,
+                15,
+                21,
+                21,
+                21,
+                27,
+                6,
+                19,
                 11,
-                16,
-                24,
-                4,
-                4,
+                11,
+                23,
+                15,
                 2,
+                27,
+                4,
+                0,
                 22,
-                6,
-                6,
-                18,
-                15,
-                24,
+                22,
+                20,
+                26,
+                26,
                 4,
                 4,
+                17,
+                17,
+                11,
+                13,
+                1,
+                1,
+                1,
+                1,
+                25,
+                7,
+                7,
                 26,
-                23,
+                7,
+                22,
                 15,
-                9,
-                12,
-                5,
+                19,
+                1,
+                27,
+                23,
+                21,
+                21,
+                0,
+                0,
+                22,
+                22,
                 2,
-                10,
-                26,
-                5,
+                1,
+                1,
+                9,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                22,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
                 16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                16,
+                10,
+                10,
+                17,
+                23,
+                23,
                 18,
-                20,
-                1,
-                2,
-                19,
                 18,
-                21,
+                12,
+                3,
+                3,
+                3,
+                3,
+                9,
                 9,
-                10,
-                0,
-                16,
-                19,
                 13,
-                11,
-                23,
-                5,
-                17,
-                6,
                 13,
-                9,
-                10,
-                4,
-                26,
-                23,
-                11,
-                21,
+                13,
+                0,
+                0,
+                22,
+                22,
+                22,
                 10,
-                24,
-                9,
                 14,
-                12,
-                8,
+                14,
+                10,
+                6,
                 6,
-                2,
-                18,
-                25,
                 19,
-                1,
-                4,
+                19,
                 13,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                23,
+                19,
+                27,
+                27,
+                1,
+                1,
+                1,
+                8,
+                8,
+                8,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
+                5,
                 5,
-                1,
-                21,
-                22,
-                26,
-                27,
-                13,
                 5,
-                1,
-                8,
-                21,
-                14,
-                13,
-                1,
-                17,
-                2,
-                20,
-                17,
-                0,
-                25,
-                19,
-                10,
-                18,
-                17,
-                3,
-                21,
-                17,
-                10,
-                7,
-                25,
-                24,
-                19,
-                6,
-                15,
-                15,
-                26,
-                22,
-                17,
-                23,
                 5,
-                21,
-                22,
-                13,
-                6,
-                13,
-                17,
-                8,
-                9,
-                27,
-                14,
-                14,
-                11,
-                7,
-                8,
-                26,
-                25,
-                24,
-                25,
-                12,
-                15,
-                12,
-                19,
-                9,
-                24,
-                24,
-                6,
-                22,
-                22,
-                21,
-                11,
-                3,
-                26,
-                2,
-                19,
-                7,
-                12,
-                0,
-                15,
-                19,
-                13,
-                15,
-                24,
-                19,
-                15,
-                7,
-                22,
                 5,
-                27,
-                20,
-                6,
-                15,
-                3,
-                6,
-                8,
-                3,
-                16,
-                16,
-                17,
-                11,
-                26,
                 5,
-                8,
-                10,
-                20,
-                0,
-                17,
-                9,
-                25,
-                17,
-                18,
-                15,
-                19,
-                20,
-                18,
-                16,
-                9,
-                22,
-                24,
-                20,
-                13,
-                26,
-                4,
-                11,
-                13,
-                1,
-                20,
-                26,
-                27,
-                4,
-                20,
-                24,
-                12,
-                21,
-                6,
-                13,
-                19,
-                27,
-                14,
-                26,
-                7,
-                21,
                 5,
-                14,
-                18,
-                26,
                 5,
-                6,
-                17,
-                10,
-                11,
-                8,
-                25,
-                9,
-                6,
-                17,
-                11,
-                15,
-                11,
-                18,
                 8,
-                23,
-                24,
-                18,
-                6,
-                21,
                 8,
-                5,
-                23,
-                15,
-                2,
-                3,
-                7,
-                6,
-                25,
-                24,
                 12,
                 12,
-                16,
-                13,
-                11,
-                26,
-                2,
-                22,
-                22,
-                8,
-                19,
-                27,
-                17,
-                17,
-                7,
-                21,
-                14,
-                9,
                 12,
-                11,
-                11,
-                13,
                 12,
                 12,
-                2,
-                21,
-                27,
-                26,
-                11,
-                18,
-                7,
-                25,
-                17,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
+                12,
                 18,
-                17,
-                15,
-                16,
                 16,
-                19,
-                8,
-                20,
-                10,
-                17,
-                23,
-                19,
-                2,
-                2,
-                3,
-                1,
-                26,
-                26,
-                9,
-                3,
                 27,
-                0,
-                14,
-                13,
-                1,
-                5,
-                23,
-                4,
-                0,
-                10,
-                25,
-                17,
-                14,
-                6,
-                9,
-                16,
+                2,
                 7,
                 0,
-                20,
-                24,
-                1,
-                25,
-                11,
-                11,
-                12,
-                7,
-                7,
-                27,
-                15,
-                27,
-                2,
-                23,
-                6,
-                17,
-                27,
-                15,
-                17,
-                20,
-                27,
                 4,
-                18,
-                5,
-                22,
-                23,
                 4,
-                1,
-                18,
-                4,
-                1,
-                26,
-                17,
-                9,
-                2,
-                9,
-                16,
-                25,
-                26,
-                13,
-                19,
                 22,
-                23,
-                20,
-                9,
-                4,
+                22,
+                22,
                 14,
-                15,
+                2,
                 9,
-                23,
-                11,
-                11,
-                17,
-                23,
-                3,
-                13,
-                6,
-                18,
-                5,
-                27,
-                6,
-                11,
-                11,
-                0,
-                11,
-                18,
-                23,
+                2,
+                26,
+                21,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
+                24,
             ],
             "regression_line": {
-                "coefficient": 0.7957916804773302,
-                "intercept": 2.7608502737828453,
+                "coefficient": 0.7957916804773295,
+                "intercept": 2.7608502737828555,
             },
         },
     },
@@ -11985,15 +11999,15 @@ test_model_quality_abalone_res = {
         ],
         "r2": [
             {"timestamp": "2024-08-01 00:00:00", "value": 0.6170457372079308},
-            {"timestamp": "2024-09-01 00:00:00", "value": 0.5523034482262631},
+            {"timestamp": "2024-09-01 00:00:00", "value": 0.5523034482262628},
         ],
         "adj_r2": [
             {"timestamp": "2024-08-01 00:00:00", "value": 0.6154060662445013},
-            {"timestamp": "2024-09-01 00:00:00", "value": 0.5498420743924429},
+            {"timestamp": "2024-09-01 00:00:00", "value": 0.5498420743924426},
         ],
         "variance": [
-            {"timestamp": "2024-08-01 00:00:00", "value": 65.26589761248866},
-            {"timestamp": "2024-09-01 00:00:00", "value": 67.00857403333812},
+            {"timestamp": "2024-08-01 00:00:00", "value": 65.26589761248849},
+            {"timestamp": "2024-09-01 00:00:00", "value": 67.0085740333384},
         ],
     },
 }
@@ -11,16 +11,16 @@ test_statistics_metrics_res = {
 }
 
 test_model_quality_metrics_res = {
-    "mae": 125.01377550326033,
-    "mape": 35.193142348933826,
-    "mse": 40897.75984430675,
-    "rmse": 202.23194565722486,
-    "r2": 0.913132366469604,
-    "adj_r2": 0.911803376248694,
-    "variance": 393448.31482725806,
+    "mae": 125.0137756497949,
+    "mape": 35.19314237273801,
+    "mse": 40897.76059849524,
+    "rmse": 202.23194752188695,
+    "r2": 0.913132364867693,
+    "adj_r2": 0.9118033746222752,
+    "variance": 393448.313270901,
     "residuals": {
         "ks": {"p_value": 1.738431620879055e-11, "statistic": 0.5710305797502211},
-        "correlation_coefficient": 0.9566625287995656,
+        "correlation_coefficient": 0.956662528799567,
         "histogram": {
             "buckets": [
                 -924.81,
@@ -38,4434 +38,4434 @@ test_model_quality_metrics_res = {
             "values": [5, 14, 74, 503, 105, 21, 6, 2, 1],
         },
         "standardized_residuals": [
-            -0.8154440522193909,
-            -2.4422099590301514,
-            0.0845152959227562,
-            0.11816603690385818,
-            -0.055382709950208664,
-            -0.1873628944158554,
-            0.13860391080379486,
-            -0.10630419850349426,
-            -0.47849127650260925,
-            -0.003471493488177657,
-            -0.003125088755041361,
-            0.008900102227926254,
-            0.013700281269848347,
-            -0.016733843833208084,
-            -0.12159548699855804,
-            0.04354057088494301,
-            -0.024008341133594513,
-            -0.6562463641166687,
-            -0.3460657298564911,
-            -0.10986721515655518,
-            0.047796398401260376,
-            -0.5116471648216248,
-            -0.05320530757308006,
-            0.10386446863412857,
-            0.1463237851858139,
-            0.008702157065272331,
-            -0.099870964884758,
-            -0.6028010845184326,
-            -0.042268816381692886,
-            -0.2239828109741211,
-            0.016619978472590446,
-            -0.6144798398017883,
-            -0.06112312898039818,
-            -0.014902847819030285,
-            -0.40267813205718994,
-            -0.44597873091697693,
-            -0.005500434897840023,
-            -0.2762899100780487,
-            -0.04607926681637764,
-            0.022855261340737343,
-            -0.06458717584609985,
-            0.12019497901201248,
-            0.219662606716156,
-            -0.7612069845199585,
-            -1.0037397146224976,
-            -0.34319549798965454,
-            0.029981300234794617,
-            -0.32414326071739197,
-            -1.9505627155303955,
-            -2.5377681255340576,
-            0.8515047430992126,
-            -0.3837743401527405,
-            0.0964910015463829,
-            0.007514483295381069,
-            -0.10828365385532379,
-            -0.6094322204589844,
-            0.011621853336691856,
-            -0.23823489248752594,
-            -0.12550491094589233,
-            -0.06686355173587799,
-            -0.05919316038489342,
-            -0.05770856887102127,
-            0.15483544766902924,
-            -0.2538725733757019,
-            -2.292315721511841,
-            0.189772829413414,
-            0.08040792495012283,
-            0.10143963992595673,
-            -1.940665364265442,
-            -0.04187292605638504,
-            -0.465179443359375,
-            0.078280009329319,
-            0.13192324340343475,
-            0.22268126904964447,
-            0.21139837801456451,
-            0.2473749816417694,
-            -3.368347644805908,
-            -0.9694951772689819,
-            -0.3469564616680145,
-            0.575370728969574,
-            -0.20176342129707336,
-            -0.017822545021772385,
-            0.03453404828906059,
-            0.20664767920970917,
-            1.0827051401138306,
-            0.07986357063055038,
-            -0.3074168562889099,
-            -0.2221023291349411,
-            -0.19458790123462677,
-            0.08802882581949234,
-            0.07803257554769516,
-            0.7580249309539795,
-            0.7595590353012085,
-            -0.3806566894054413,
-            -0.26980718970298767,
-            -0.12303059548139572,
-            0.10015299171209335,
-            -0.4221757650375366,
-            0.06650225073099136,
-            -0.17716869711875916,
-            0.17354129254817963,
-            -1.59727942943573,
-            -0.019010217860341072,
-            -1.599456787109375,
-            -2.6677193641662598,
-            -1.738563060760498,
-            0.23406314849853516,
-            -0.16083818674087524,
-            -0.3638313412666321,
-            -0.9051628708839417,
-            -0.07468239963054657,
-            -0.3234504461288452,
-            0.5666611194610596,
-            -1.7943341732025146,
-            0.10549751669168472,
-            -0.1730613261461258,
-            0.04274878650903702,
-            -0.02905595302581787,
-            -0.8226690888404846,
-            -0.4786892235279083,
-            -1.3355953693389893,
-            0.23861588537693024,
-            -0.4857657849788666,
-            0.14652173221111298,
-            -0.2638193368911743,
-            -0.1076403260231018,
-            -1.5079070329666138,
-            -4.5225677490234375,
-            -0.13124532997608185,
-            -0.267085462808609,
-            -0.40698346495628357,
-            -0.03405407816171646,
-            0.5800719261169434,
-            -0.9931991100311279,
-            0.19432558119297028,
-            -0.10338450223207474,
-            0.3535727560520172,
-            0.12944893538951874,
-            -0.04019038751721382,
-            -0.2133927196264267,
-            0.12677666544914246,
-            -0.9833018779754639,
-            0.8175570964813232,
-            -0.07854233682155609,
-            -0.2382843792438507,
-            -0.04048730805516243,
-            -0.20042729377746582,
-            -0.4991270899772644,
-            1.018075942993164,
-            -1.1186470985412598,
-            -0.25956353545188904,
-            -0.5383697748184204,
-            -0.42291808128356934,
-            -0.41480231285095215,
-            -0.9237202405929565,
-            -2.625507354736328,
-            -1.032936692237854,
-            -0.501947820186615,
-            -0.1244656965136528,
-            -0.3637818396091461,
-            -0.3497771918773651,
-            -0.7044956088066101,
-            -2.315772294998169,
-            -0.11847784370183945,
-            -0.3091488778591156,
-            -1.1673911809921265,
-            -0.23437495529651642,
-            -0.1892433762550354,
-            -0.372342973947525,
-            -1.4193758964538574,
-            -0.4624082148075104,
-            0.01958916150033474,
-            -0.7594254612922668,
-            0.16260480880737305,
-            -0.0691894069314003,
-            -3.3518190383911133,
-            -0.5670719146728516,
-            -0.14450767636299133,
-            -0.21512475609779358,
-            -0.16826114058494568,
-            0.07239113003015518,
-            -0.25812840461730957,
-            -0.07710722833871841,
-            0.07664696127176285,
-            2.0332889556884766,
-            0.35020768642425537,
-            -0.10378038883209229,
-            -1.043031930923462,
-            -0.6539205312728882,
-            -0.40544939041137695,
-            -0.4634474217891693,
-            -0.16301558911800385,
-            -0.11813144385814667,
-            -0.5820662975311279,
-            -0.05835189297795296,
-            0.4692719280719757,
-            0.6667225956916809,
-            -0.4290049076080322,
-            0.03423713147640228,
-            -0.26936182379722595,
-            -0.9076866507530212,
-            -0.1311463564634323,
-            -1.7784985303878784,
-            -1.2543882131576538,
-            -1.4275411367416382,
-            -0.6434293985366821,
-            -0.010350100696086884,
-            -0.4170786738395691,
-            -0.47289931774139404,
-            -0.8206401467323303,
-            -2.1489040851593018,
-            -1.9614001512527466,
-            -0.34067168831825256,
-            -0.02796725183725357,
-            -2.651339292526245,
-            0.032802022993564606,
-            -0.15029758214950562,
-            0.038344498723745346,
-            -0.4874483048915863,
-            0.08421837538480759,
-            0.2380715310573578,
-            0.07961614429950714,
-            -1.2521613836288452,
-            -0.48254916071891785,
-            -0.7546252608299255,
-            -0.9988405704498291,
-            -0.056174490600824356,
-            -0.28801819682121277,
-            -0.6567907333374023,
-            -0.5011065602302551,
-            -0.9814213514328003,
-            -0.1552957147359848,
-            -0.753338634967804,
-            -0.3499751389026642,
-            0.5189067721366882,
-            0.6778570413589478,
-            -1.6171234846115112,
-            -0.5027396082878113,
-            -1.9338858127593994,
-            -0.6529307961463928,
-            -0.9154065251350403,
-            -0.5563828349113464,
-            -1.9103302955627441,
-            -0.23091091215610504,
-            -0.2557035982608795,
-            -0.07631544768810272,
-            1.145998239517212,
-            -3.693225622177124,
-            -0.14044979214668274,
-            -1.127752661705017,
-            -0.8974429965019226,
-            -0.44766125082969666,
-            -0.8462740778923035,
-            -0.7057327628135681,
-            -0.47507670521736145,
-            -0.5120925307273865,
-            -0.3446801006793976,
-            -0.4506799280643463,
-            -0.5902315378189087,
-            -0.8349911570549011,
-            -0.862901508808136,
-            -0.8494907021522522,
-            -0.04612875357270241,
-            0.35520580410957336,
-            0.31878381967544556,
-            -0.4656248092651367,
-            0.7756420969963074,
-            -0.8639901876449585,
-            0.7709903717041016,
-            0.023548072203993797,
-            -0.10056377202272415,
-            -0.29083892703056335,
-            -0.699794352054596,
-            -1.385032296180725,
-            -0.3465605676174164,
-            0.08624731749296188,
-            -0.12139753997325897,
-            -0.23744310438632965,
-            0.17586715519428253,
-            -0.9057072401046753,
-            0.002219440648332238,
-            0.5759150981903076,
-            -1.9278979301452637,
-            -0.1296122819185257,
-            -0.041180115193128586,
-            -0.8598828315734863,
-            -0.5824621915817261,
-            -0.6385797262191772,
-            -0.6393715143203735,
-            -0.022078372538089752,
-            -0.18157298862934113,
-            0.055862680077552795,
-            -0.30692198872566223,
-            -0.9450984001159668,
-            -2.9420719146728516,
-            -0.4863596260547638,
-            0.17557023465633392,
-            0.2693469226360321,
-            -0.15143577754497528,
-            -1.5767920017242432,
-            0.4705090820789337,
-            -0.8961068391799927,
-            0.6399504542350769,
-            -0.24674655497074127,
-            -0.00936037302017212,
-            -0.11115386337041855,
-            -0.376103937625885,
-            -0.34844106435775757,
-            0.30319562554359436,
-            0.3258603811264038,
-            0.1324675977230072,
-            -0.07290089130401611,
-            -0.14341898262500763,
-            -0.6525843739509583,
-            -0.42321500182151794,
-            0.8042947053909302,
-            -2.3242342472076416,
-            -0.8742833733558655,
-            -1.0680720806121826,
-            -0.3142954707145691,
-            -0.35922908782958984,
-            -0.1721210777759552,
-            -0.37061095237731934,
-            -1.5389844179153442,
-            -0.020544296130537987,
-            -0.9038267135620117,
-            -0.5067974925041199,
-            -1.126515507698059,
-            0.0708075687289238,
-            0.3827202320098877,
-            -2.43473744392395,
-            -1.7018935680389404,
-            -1.7026358842849731,
-            -0.5497516393661499,
-            -0.4444941282272339,
-            -0.09046855568885803,
-            0.6486600637435913,
-            -0.7466084957122803,
-            -0.040338847786188126,
-            -0.24333198368549347,
-            -0.2997959554195404,
-            -0.19057950377464294,
-            -0.016684357076883316,
-            0.11341533809900284,
-            0.46021589636802673,
-            -0.20364390313625336,
-            -0.8397418856620789,
-            -0.17019110918045044,
-            -0.10081120580434799,
-            -0.5416358709335327,
-            -0.04988972097635269,
-            -0.13822291791439056,
-            -0.2473403811454773,
-            -0.33572307229042053,
-            -0.6228925585746765,
-            -0.2387792468070984,
-            -3.218156337738037,
-            -0.7264675498008728,
-            -0.39738309383392334,
-            -0.515952467918396,
-            -0.6844536066055298,
-            0.07976460456848145,
-            0.04789537191390991,
-            0.39553719758987427,
-            -1.2390475273132324,
-            -0.134758859872818,
-            -0.9455437660217285,
-            0.09441257268190384,
-            0.07263856381177902,
-            -0.222547709941864,
-            -0.12149651348590851,
-            -0.11526123434305191,
-            -1.1943117380142212,
-            -0.022078372538089752,
-            -0.2498147040605545,
-            -0.1660342663526535,
-            0.0731334239244461,
-            0.049478936940431595,
-            0.35644295811653137,
-            0.28345054388046265,
-            0.11321739852428436,
-            -0.15425649285316467,
-            -0.5309963226318359,
-            0.16646474599838257,
-            0.05512038245797157,
-            -0.0969017818570137,
-            0.5077723264694214,
-            0.03616710007190704,
-            0.3795531094074249,
-            1.0981943607330322,
-            -0.15099039673805237,
-            -0.6259607076644897,
-            0.15602311491966248,
-            -0.05082996189594269,
-            -0.02460217848420143,
-            -0.1816224753856659,
-            -0.8815083503723145,
-            0.03012976050376892,
-            0.1536477655172348,
-            0.15439006686210632,
-            -0.15400907397270203,
-            -0.03078797645866871,
-            -0.1261977255344391,
-            -0.01089445035904646,
-            0.0019225222058594227,
-            0.03329688683152199,
-            0.08565348386764526,
-            -0.14713045954704285,
-            -0.06671509146690369,
-            -0.17588205635547638,
-            -0.1943899542093277,
-            -0.19523122906684875,
-            0.023399611935019493,
-            2.4128000736236572,
-            0.43913471698760986,
-            0.31165778636932373,
-            -0.06587382405996323,
-            0.32204991579055786,
-            0.041115738451480865,
-            -0.5786517262458801,
-            -0.3588331937789917,
-            0.19675040245056152,
-            -0.08720245212316513,
-            -0.08091767877340317,
-            -0.545198917388916,
-            -0.8416718244552612,
-            -0.39906564354896545,
-            -0.5003147721290588,
-            0.03572172299027443,
-            0.11391020566225052,
-            0.18398292362689972,
-            0.21085402369499207,
-            -1.4065093994140625,
-            -0.4108434021472931,
-            0.689882218837738,
-            1.3456262350082397,
-            0.2598455548286438,
-            -0.2376905381679535,
-            0.04076933115720749,
-            0.5267751216888428,
-            -0.3591301143169403,
-            2.2130730152130127,
-            0.6932472586631775,
-            0.5077228546142578,
-            0.3798995018005371,
-            0.29700982570648193,
-            0.9858107566833496,
-            2.5238475799560547,
-            -0.8654252886772156,
-            1.092552900314331,
-            0.35847190022468567,
-            0.6535592079162598,
-            -0.37788546085357666,
-            0.10886259377002716,
-            0.4906005561351776,
-            1.9876625537872314,
-            5.230653762817383,
-            3.6647067070007324,
-            1.061475396156311,
-            0.4225567579269409,
-            0.6922575831413269,
-            2.168931245803833,
-            8.030543327331543,
-            0.009444452822208405,
-            0.010236234404146671,
-            0.28924044966697693,
-            0.2663777470588684,
-            0.33298641443252563,
-            0.7566888332366943,
-            1.2751576900482178,
-            1.8866113424301147,
-            -1.5710021257400513,
-            0.2964159846305847,
-            -0.27792295813560486,
-            0.16354504227638245,
-            1.8789410591125488,
-            2.034872531890869,
-            -1.296995997428894,
-            0.023548072203993797,
-            0.056407030671834946,
-            -0.3745698630809784,
-            -0.0987822636961937,
-            -0.3085055649280548,
-            -2.1978461742401123,
-            0.836955726146698,
-            0.5744304656982422,
-            -0.28242623805999756,
-            -0.3920385539531708,
-            0.012017744593322277,
-            0.3459518551826477,
-            1.650115966796875,
-            0.5436004400253296,
-            0.5814575552940369,
-            -0.06191490963101387,
-            -0.10100915282964706,
-            1.4062966108322144,
-            0.6956226229667664,
-            1.3763078451156616,
-            -1.0983082056045532,
-            -1.7721147537231445,
-            -0.13164122402668,
-            0.38262125849723816,
-            0.8205262422561646,
-            1.8421231508255005,
-            5.428104400634766,
-            2.2450907230377197,
-            -0.19988293945789337,
-            0.06496817618608475,
-            -0.02960030362010002,
-            1.479585886001587,
-            1.412234902381897,
-            3.1538586616516113,
-            2.663201093673706,
-            2.5544300079345703,
-            0.11826501041650772,
-            0.005980405490845442,
-            0.24480168521404266,
-            -0.44404876232147217,
-            1.7433483600616455,
-            0.20367850363254547,
-            1.0366827249526978,
-            1.173710584640503,
-            0.36084726452827454,
-            1.0148098468780518,
-            1.0647910833358765,
-            1.022925615310669,
-            -0.16672706604003906,
-            0.3876688778400421,
-            -0.18033581972122192,
-            1.844943881034851,
-            2.0825278759002686,
-            2.3703901767730713,
-            3.484873056411743,
-            1.252294898033142,
-            -0.10392884910106659,
-            0.48288068175315857,
-            0.17190824449062347,
-            -0.14094465970993042,
-            -0.06285515427589417,
-            0.8497726917266846,
-            1.2890138626098633,
-            0.5580999851226807,
-            0.24470271170139313,
-            0.43591809272766113,
-            -0.12590080499649048,
-            -0.24714243412017822,
-            -0.9581133127212524,
-            -1.551751971244812,
-            -0.16514350473880768,
-            0.3585708737373352,
-            1.2346283197402954,
-            0.9650264978408813,
-            0.8308194279670715,
-            0.7768297791481018,
-            -0.26109760999679565,
-            0.2817680239677429,
-            0.23426108062267303,
-            0.31908074021339417,
-            0.2377251386642456,
-            0.5859608054161072,
-            0.4601169228553772,
-            -0.020643267780542374,
-            0.3998425304889679,
-            0.04413440451025963,
-            0.1293499618768692,
-            0.018896350637078285,
-            0.8118661642074585,
-            -1.4043320417404175,
-            1.343646764755249,
-            1.3112332820892334,
-            1.6111701726913452,
-            1.6744632720947266,
-            1.7545322179794312,
-            1.144464135169983,
-            0.5568132996559143,
-            0.2591032385826111,
-            0.5016360282897949,
-            0.2061033397912979,
-            0.7168027758598328,
-            -0.706277072429657,
-            1.4591975212097168,
-            1.429505705833435,
-            0.8831265568733215,
-            0.2853805124759674,
-            0.5087620615959167,
-            0.37514880299568176,
-            0.551072895526886,
-            0.5667105913162231,
-            2.828188896179199,
-            0.410234659910202,
-            1.5992439985275269,
-            0.448289692401886,
-            0.537365198135376,
-            1.916303277015686,
-            1.4809714555740356,
-            3.680344343185425,
-            -3.673431158065796,
-            -0.01089445035904646,
-            -0.08749937266111374,
-            0.004347355104982853,
-            0.6442062854766846,
-            0.11217818409204483,
-            0.06407742202281952,
-            0.27627503871917725,
-            -0.13658985495567322,
-            0.005040164105594158,
-            0.47728872299194336,
-            0.04982534050941467,
-            1.126945972442627,
-            0.34293317794799805,
-            1.2622911930084229,
-            0.0036545456387102604,
-            0.32160454988479614,
-            0.17586715519428253,
-            -0.24352993071079254,
-            0.2023918628692627,
-            -0.7543778419494629,
-            0.49411407113075256,
-            1.0273298025131226,
-            0.20481668412685394,
-            0.37871184945106506,
-            0.20085777342319489,
-            0.3140331208705902,
-            4.0642595291137695,
-            -0.09323979169130325,
-            0.49272847175598145,
-            -0.6359074711799622,
-            -0.005698380526155233,
-            -0.019999945536255836,
-            0.2444552779197693,
-            1.3191015720367432,
-            0.6235209703445435,
-            0.9961534142494202,
-            0.11069358885288239,
-            0.06843221932649612,
-            0.053685277700424194,
-            0.4229031801223755,
-            0.4920356571674347,
-            -0.7429959774017334,
-            -0.02856108918786049,
-            -0.22734788060188293,
-            -0.4589441418647766,
-            0.2947334349155426,
-            0.8759015202522278,
-            1.3414199352264404,
-            -3.0159056186676025,
-            -0.08062076568603516,
-            0.9610180854797363,
-            0.5629001259803772,
-            0.26207244396209717,
-            0.7438223361968994,
-            1.5509947538375854,
-            -0.7414619326591492,
-            0.02988232858479023,
-            0.4278518259525299,
-            1.8633527755737305,
-            0.6672669053077698,
-            -0.17311081290245056,
-            1.4240126609802246,
-            0.40726548433303833,
-            0.07506339251995087,
-            0.021024266257882118,
-            -0.4973950684070587,
-            0.3210602104663849,
-            1.0045166015625,
-            0.9407781958580017,
-            -1.1597702503204346,
-            -0.4293513000011444,
-            -0.3162749111652374,
-            0.5000524520874023,
-            0.1475609391927719,
-            0.26429933309555054,
-            0.44339054822921753,
-            0.6357935667037964,
-            0.5145024657249451,
-            0.335213303565979,
-            0.272909939289093,
-            -0.4775015413761139,
-            0.21506036818027496,
-            3.35125994682312,
-            1.2985646724700928,
-            -0.5836003422737122,
-            0.20258979499340057,
-            0.1942760944366455,
-            0.002169954124838114,
-            0.026764685288071632,
-            0.7557980418205261,
-            0.266674667596817,
-            0.3319966793060303,
-            0.37782108783721924,
-            0.3672804832458496,
-            0.1301417350769043,
-            1.6043905019760132,
-            0.3293244242668152,
-            -0.08042281866073608,
-            0.0698673278093338,
-            -0.1820678412914276,
-            -0.14322103559970856,
-            -0.16548991203308105,
-            -0.1999819129705429,
-            0.6016479730606079,
-            0.84324049949646,
-            -0.4217303991317749,
-            -0.045040056109428406,
-            -0.2971237003803253,
-            0.188535675406456,
-            0.24559347331523895,
-            0.8863926529884338,
-            -1.9537793397903442,
-            0.30636274814605713,
-            0.09753021597862244,
-            0.13677291572093964,
-            0.33125439286231995,
-            0.2697923183441162,
-            -0.14000442624092102,
-            -0.6180428862571716,
-            0.03715682774782181,
-            0.20511360466480255,
-            0.02483471669256687,
-            0.12247134745121002,
-            -0.21834136545658112,
-            -0.28059524297714233,
-            0.2540556490421295,
-            0.02849670872092247,
-            0.47778356075286865,
-            -0.2843562066555023,
-            0.18546751141548157,
-            2.0595662593841553,
-            -0.24323301017284393,
-            0.5210346579551697,
-            0.7505525350570679,
+            0.4941140800378813,
+            -1.953779303958454,
+            -2.6255074565150838,
+            0.12944892929456256,
+            -0.1098672152290754,
+            -0.3074168531402338,
+            -0.2843561990153342,
+            -0.3499751418685897,
+            -0.34067170200704217,
+            0.20481668944954623,
+            -0.10056377536752795,
+            0.20258980224864367,
+            0.0684322199898383,
+            1.1737105673710322,
+            -0.029055953027441517,
+            -0.39906563305292575,
+            0.19675040914405556,
+            0.8118661404155234,
+            1.429505677181348,
+            -0.754377857552454,
+            -0.11847784573923123,
+            0.03616709876787575,
+            -0.23877924097019979,
+            0.2853805197399685,
+            0.10549752028930169,
+            1.6043905520255446,
+            -0.9038267319241226,
+            -0.8416718358278261,
+            -0.8349911742251196,
+            -0.8961068562943277,
+            0.25984554650295516,
+            4.064259640524511,
+            0.0498253402667438,
+            -0.14713046105750788,
+            -0.4108433920265867,
+            -0.2225477075947337,
+            0.001922522256221938,
+            0.19427609003194185,
+            -0.09987096601613603,
+            -0.23828437714777664,
+            -0.19057950466622453,
+            1.7545322357486046,
+            -0.13475886549693925,
+            -1.4065094027411436,
+            -0.8154440532394207,
+            -0.684453599444121,
+            -3.2181563702485594,
+            -0.23437495295063715,
+            0.13246759861134136,
+            -0.4026781389566117,
+            0.044134406308881824,
+            0.1885356696918379,
+            0.6016479886503426,
+            1.5992439682723483,
+            0.585960805479542,
+            0.716802800128115,
+            0.22268127343900712,
+            -0.09690178308159954,
+            0.03715682641272118,
+            -0.24333198813648893,
+            0.2061033353878453,
+            -2.4347374529711168,
+            -0.6567907117706897,
+            -0.24323301537200434,
+            -2.4422098966897,
+            -1.5517519346222184,
+            -0.1082836509973226,
+            0.38272023361052215,
+            -0.1400044220146206,
+            1.2985647097682902,
+            -0.2471424395691441,
+            0.2051136077429999,
+            0.2762750254073904,
+            -0.945098374714179,
+            1.4591975065267124,
+            -3.0159055260243846,
+            0.266674667252389,
+            0.034237129860426985,
+            0.07803257814483976,
+            -0.5120925300942799,
+            0.4602159082019231,
+            -0.18033582354207395,
+            2.1689312006454093,
+            0.32106020133664837,
+            0.16646474321178367,
+            -0.040487307325407146,
+            -0.4825491598956426,
+            -0.2017634270529786,
+            -0.18736288982047683,
+            -0.23823489076553442,
+            0.3258603804141491,
+            0.5667106027872973,
+            -0.4229180692937019,
+            -0.8397418669203776,
+            -0.5786517142101386,
+            -0.4857657747413903,
+            5.428104335121587,
+            0.3502076804773478,
+            0.21506037057369667,
+            0.12019497581525726,
+            0.07664695944205564,
+            -0.29712368563384084,
+            -0.17311081173470175,
+            -2.324234361424118,
+            0.07506339521030318,
+            -0.2805952339649214,
+            -0.08749937045556706,
+            0.2455934684171802,
+            -0.098782265606806,
+            -0.46562481716878446,
+            0.4278518142154757,
+            -0.4440487545111529,
+            -0.5309963281108288,
+            0.35357275446982217,
+            -0.05770856834571837,
+            0.3319966918121909,
+            0.03329688859782379,
+            -0.05538270838033149,
+            -1.5710021373144623,
+            0.04111573699210303,
+            0.21085402808310352,
+            -0.7062770940129645,
+            -0.10392884936000234,
+            0.7768297817879931,
+            -0.030787976405921225,
+            -0.07290088769409651,
+            -0.01668435746687297,
+            -0.12590080307557236,
+            -0.26381935038479054,
+            -0.14094466327722352,
+            -1.2969960388389907,
+            -0.10378039021327566,
+            0.09441257066703244,
+            0.6667225812989341,
+            0.8863926320723886,
+            -0.7612069783018883,
+            -0.35883320428995685,
+            0.1367729138664192,
+            1.2890138379955323,
+            0.12677666465347992,
+            2.3703902627537063,
+            -0.11115386116737455,
+            0.12247134939840176,
+            -0.1654899088693917,
+            0.028496709520323196,
+            -1.3850323128479962,
+            0.07986357428780391,
+            0.7756421086141785,
+            -0.16083818893861765,
+            -0.8654252993041175,
+            -0.12159548782049448,
+            0.06650225108238966,
+            -0.5416359002929177,
+            0.1293499565300781,
+            0.040769332316407426,
+            0.08565348101014993,
+            0.3352133066579386,
+            0.15439006594466884,
+            -0.3723429866420981,
+            -1.9505626891127061,
+            0.7557980693350266,
+            -0.13114635959325316,
+            2.5238475340869986,
+            -0.39738309605668826,
+            -0.308505553549564,
+            -0.07468239745481844,
+            0.31878382775350356,
+            0.004347354986093559,
+            0.05512038316666676,
+            -0.3484410640190795,
+            0.7595590343854394,
+            -0.3446800989686661,
+            -0.6259606956337527,
+            -0.005500435080119049,
+            -0.010894450744527022,
+            0.20367850265797383,
+            -1.0329367031942158,
+            -0.1892433723456831,
+            0.23861588852101914,
+            0.875901519037026,
+            -0.5067974871943566,
+            0.49272846133509723,
+            0.41023466213722526,
+            -0.9455437521543597,
+            0.9650264934553616,
+            0.49060054689867966,
+            0.6672669315035981,
+            -0.131641223415676,
+            -0.37788546145323226,
+            -0.5563828422011154,
+            -0.6180428744749887,
+            0.24480168630130342,
+            0.4777835738979305,
+            0.0796161423765922,
+            -1.5994568071037705,
+            0.25405563978060897,
+            -0.4874483117376278,
+            -0.33572306378281475,
+            -0.010350100539862008,
+            -0.5451989198143614,
+            0.5759150698843593,
+            0.43591809452096636,
+            -0.6562463615660248,
+            -0.06587382141569365,
+            0.02339961214936895,
+            0.171908245258434,
+            -0.05320530756167144,
+            -0.06686354906053907,
+            0.1626048053968865,
+            1.4809715147133125,
+            0.3564429646398743,
+            -0.3234504409867308,
+            -1.9338857782970598,
+            -0.10630419570763167,
+            0.537365178117629,
+            0.24737497817790186,
+            -0.9051628642446641,
+            -0.846274069376358,
+            -0.6393715052214087,
+            -0.16826114627495878,
+            -0.6539205016006376,
+            0.06496817323287943,
+            0.47728871007550766,
+            0.6442062773786985,
+            -0.6228925399347318,
+            -3.6932256397743917,
+            -0.6144798549535453,
+            0.5568133263388431,
+            0.005040164337485329,
+            -0.5159524679091771,
+            0.2892404575548657,
+            0.2693469318934716,
+            -0.5011065532364949,
+            1.126945936152083,
+            -0.247340385098113,
+            -2.2923156448778514,
+            -2.19784614117735,
+            0.38262126084603715,
+            0.501636010138707,
+            -0.18162246948037303,
+            -1.2543882637283932,
+            0.8175570743733849,
+            0.770990388683405,
+            1.311233223622312,
+            1.0273298486983855,
+            -0.28801819130126255,
+            0.018896351365321876,
+            0.692257554535947,
+            -0.020544295281770503,
+            -0.19988294452777192,
+            0.02988232822310688,
+            -0.1432210368603682,
+            -0.3761039516925106,
+            -0.2538725875540935,
+            -0.15400906818918383,
+            -3.351819088684942,
+            -0.05082996121404205,
+            -0.40698345421168947,
+            0.6235209696014288,
+            0.14756094519523502,
+            -0.17306132535245952,
+            -0.3431955075013981,
+            0.5087620491815946,
+            -0.90768666973902,
+            1.1459981933153591,
+            1.0366827749421754,
+            0.19432557641418352,
+            -0.1815729830981308,
+            0.21966260412222835,
+            -0.4459787234186016,
+            0.02998130098759148,
+            1.345626259280693,
+            -0.05919315981298665,
+            -0.4293512989851975,
+            -0.14044979945480082,
+            0.8497727092131053,
+            -0.1943899560988797,
+            0.5629001513546423,
+            0.1465217311681471,
+            0.04789537135929476,
+            -0.8226690650467933,
+            0.820526257307922,
+            -0.44449413195133347,
+            0.3329864194570363,
+            0.804294723932455,
+            0.15364777021103457,
+            -0.02064326804625468,
+            -0.15099039887240534,
+            0.5077228351545068,
+            0.1758671558378157,
+            -1.1597703008811644,
+            0.5666611164050546,
+            0.49203565198370547,
+            -0.414802302605969,
+            0.07263856248043178,
+            1.8449438561052394,
+            0.4391347093667146,
+            0.3063627458106928,
+            -0.12961228174374292,
+            0.3787118366488977,
+            -1.5079069999555628,
+            2.2130730536055183,
+            -0.019999945077105702,
+            2.8281887848769847,
+            0.08040792449246871,
+            -0.3745698738430001,
+            -0.45067992973161775,
+            0.02354807129609578,
+            0.02354807129609592,
+            -0.2997959502749237,
+            0.2970098195669024,
+            -0.16301558975727798,
+            1.4122349297787942,
+            -0.7429959896367323,
+            0.10143963694543538,
+            0.8831265308443981,
+            0.13014173864595432,
+            -0.0771072301846888,
+            -0.5820662745848555,
+            -1.1673912037464744,
+            -0.7546252894636662,
+            0.00870215662341356,
+            0.5210346719776782,
+            3.6803442870889476,
+            0.010236234472923895,
+            1.061475452445554,
+            0.2663777489589353,
+            -1.6171234455642627,
+            1.2522949423717642,
+            -0.10338449915533726,
+            -0.30914887651871353,
+            1.9163032192985991,
+            0.648660051780503,
+            0.8515047325915853,
+            0.02102426580173998,
+            0.5267750923177819,
+            0.4601169354374395,
+            0.37514881712745435,
+            0.8308194248143146,
+            -0.5836003524343657,
+            0.6898822081883177,
+            1.6501159692174059,
+            0.6932472821807915,
+            0.007514483449599039,
+            1.08270511042749,
+            -0.05617449049620786,
+            0.03834449958653539,
+            -0.02400834203872964,
+            1.5509947455861308,
+            -0.359229095347895,
+            1.098194348069322,
+            0.05368527808164106,
+            -0.34606571767145006,
+            -0.5824621656427938,
+            -0.6028010687443686,
+            0.5510729059987388,
+            -0.38065669885879994,
+            0.0708075663374681,
+            0.6399504485058628,
+            -0.11813144106353506,
+            -0.42321498758715526,
+            0.0021699541674332244,
+            -0.06458717547739448,
+            0.024834717234395003,
+            0.2444552816256078,
+            0.3795531051470164,
+            0.37782108176853674,
+            -0.0785423352697157,
+            -0.5902315276548307,
+            -0.003125088732489974,
+            -0.3706109632636178,
+            -1.4043320019224836,
+            0.14632378563917803,
+            0.06986732507486434,
+            0.34595185160451214,
+            -0.01089445074452653,
+            1.0647910400557867,
+            0.5189067575412607,
+            -0.09046855339010391,
+            3.351259845177823,
+            1.3763078162709033,
+            0.9407781661566469,
+            -0.6997943779392263,
+            -0.5383697990649278,
+            0.019589160716713648,
+            -0.4290048943095011,
+            -0.19523122459699838,
+            -0.6529307739557919,
+            -0.2183413651041403,
+            -0.243529933665458,
+            -0.4054493763621798,
+            0.2697923093336522,
+            -0.21339272687991287,
+            -0.08042281779492239,
+            0.3608472526594366,
+            0.985810773997117,
+            -0.4973950745683243,
+            1.341419916790099,
+            0.31403313505824504,
+            2.0825279772503977,
+            0.02676468614184363,
+            -1.4193758621241348,
+            -0.19458790162784875,
+            0.6778570173034453,
+            -1.9278979260457443,
+            -0.4775015489069302,
+            0.514502469521698,
+            -0.5497516669806506,
+            0.24470271353681894,
+            0.009444452357047665,
+            0.33125439607855656,
+            -0.5003147711206186,
+            0.3220499289814938,
+            -0.16514350419369553,
+            0.032802024775401215,
+            -0.200427294732437,
+            0.003654545634701225,
+            -0.13822291225389838,
+            -0.1542565001003954,
+            -0.9237202575855175,
+            -0.05835189131486819,
+            -0.39203856677452276,
+            1.886611389953234,
+            0.20239185671967475,
+            0.2642993209047597,
+            -0.9833018618052143,
+            1.022925560678824,
+            1.6111701863927361,
+            -3.673431086877482,
+            -2.6513393480455507,
+            0.23406314135473066,
+            0.03572172132769499,
+            -0.21512475025839256,
+            -0.3241432503381227,
+            -0.26708545161278047,
+            -0.7466084955404172,
+            0.6357935923975117,
+            -2.5377681007995316,
+            5.230653669974912,
+            -0.897442988614869,
+            3.4848730772319643,
+            0.35520580508381744,
+            -0.3497771963396208,
+            0.022855261944703973,
+            -0.2779229693238385,
+            -0.17212108408985632,
+            -0.47849127655177576,
+            3.664706590300388,
+            -0.01673384384911541,
+            -0.10100915280770857,
+            0.5744304784170918,
+            0.558099972277141,
+            -1.118647117237835,
+            0.2066476855925104,
+            2.0348725911510877,
+            0.28176801383628236,
+            -0.447661260414839,
+            -0.6525843692800963,
+            -0.1076403280281729,
+            -0.7414619117872198,
+            1.3191015583988346,
+            -0.9988405858292889,
+            1.6744632692806052,
+            0.32932442717110794,
+            1.2751576509676945,
+            -0.26109759936146565,
+            0.13192324840667627,
+            -0.5019478217346139,
+            -0.7533386435253672,
+            -0.4786892220807442,
+            -0.02796725261811135,
+            2.0595662958899825,
+            0.4828806712688846,
+            0.10886259428177665,
+            -0.17716869507856847,
+            -0.46517943972860387,
+            0.06407741835251818,
+            -0.96949516115962,
+            -0.3469564725518109,
+            -0.7594254685411664,
+            0.5753707196796953,
+            -0.2239828126797596,
+            0.6535592036224885,
+            1.8789410007056817,
+            -0.01901021743225999,
+            -0.6094322439648333,
+            -0.2467465485112057,
+            0.7505525128173458,
+            0.0845152942185776,
+            1.8633527902993656,
+            -0.23769054056086988,
+            -0.7264675379678117,
+            -0.02460217862563695,
+            0.9961534278857526,
+            -0.0872024521621137,
+            1.9876625824919583,
+            0.011621853175707717,
+            -1.0983082141362595,
+            -0.316274915561601,
+            0.3798995098227123,
+            0.11321739591909662,
+            -0.07631544806881314,
+            0.08802882735777903,
+            -0.9581132932438972,
+            0.2380715383163546,
+            -0.4750767161770587,
+            0.07976460152331931,
+            0.13860391000938324,
+            -0.25570358369705765,
+            0.0782800100560509,
+            -0.1445076827986674,
+            0.11069359042474082,
+            0.46927191615225977,
+            0.1758671558378157,
+            0.2113983782877686,
+            0.18977282924789476,
+            -0.23744310864965817,
+            -4.522567919772665,
+            -0.8494906842221056,
+            0.3190807460469575,
+            -1.7943341803738462,
+            -0.20364390957818498,
+            -0.06285515209891498,
+            -1.5972794062851101,
+            -0.04019038903195321,
+            -0.022078373131281012,
+            0.2947334459837582,
+            0.1038644696753068,
+            0.08421837592512402,
+            0.11826500690780864,
+            0.18398292252554876,
+            0.15602311655866383,
+            -1.940665412664251,
+            1.4795858960105295,
+            0.5814575446954952,
+            0.016619977782177435,
+            -1.961400206823764,
+            0.047796398594810156,
+            0.1735412958724287,
+            -2.942071843718911,
+            0.0862473175970571,
+            0.32160455154131345,
+            -0.022078373131281012,
+            -0.15029758952101327,
+            -0.9057072144493292,
+            1.4062965639097211,
+            0.42290317599124827,
+            0.8369557362123555,
+            -0.41707867618911376,
+            -0.09323979079567128,
+            0.11217818189200882,
+            -0.08091768161734496,
+            0.40726547920268924,
+            -0.8206401233748596,
+            0.09649099872120796,
+            -0.5670719007654466,
+            0.012017744233645832,
+            -0.12149651505600974,
+            -0.04187292602819069,
+            -0.638579723105533,
+            0.03453404815388064,
+            -0.19998191729225667,
+            -0.12139754229152556,
+            0.5000524459069539,
+            -0.10081120727873924,
+            0.961018096493738,
+            -0.08062076332389159,
+            -1.3355954169879642,
+            -0.04607926851878397,
+            -1.7026359140789122,
+            0.8432405067571254,
+            -0.2595635215119549,
+            0.09753021274829576,
+            -0.0034714934081858948,
+            0.31165778871061606,
+            -0.5116471526540995,
+            0.387668871834749,
+            0.7438223648323964,
+            2.5544301183127254,
+            0.18546751399281688,
+            -2.6677193405677437,
+            0.44339053823955027,
+            -0.028561089205018663,
+            0.367280482350932,
+            0.28345055083251985,
+            0.0022194405496754536,
+            0.35847190631180736,
+            3.1538586664133907,
+            0.03012976013431831,
+            -1.7018936183452784,
+            -1.003739737671274,
+            1.8421231323174294,
+            -0.15143577631258567,
+            -2.315772190060689,
+            -2.148904109139741,
+            0.04354056972197451,
+            -0.4728993153583989,
+            0.25910325076932,
+            -0.0422688170861288,
+            0.6956226285284218,
+            -0.014902847706151242,
+            0.05640702910496591,
+            -0.8629014938097616,
+            -0.22210233015455336,
+            -0.7044955842522419,
+            -1.5767920440368088,
+            0.5077723215367488,
+            -0.12619772136902588,
+            0.11816603414332404,
+            -0.8815083735328569,
+            -1.7385630275868034,
+            0.2964159829799957,
+            -0.3465605814938731,
+            -0.14341898238933723,
+            0.2729099514149155,
+            2.2450907429162683,
+            -0.8639901942190917,
+            1.144464115465848,
+            -0.1701911151824077,
+            -0.12303059290552025,
+            1.2346283039112715,
+            -0.22734788667223443,
+            -0.009360372895016582,
+            0.005980405600088247,
+            -0.04118011667679877,
+            -0.9154065453688145,
+            -0.06918940902592595,
+            -1.0680720345862305,
+            -0.045040054491696166,
+            -0.2581284164269285,
+            -0.4217303961198873,
+            -0.017822544258445365,
+            -0.8742833617254849,
+            -0.27628991870984354,
+            -0.24981470421022672,
+            0.1635450466594894,
+            0.04274878760609828,
+            0.0494789355910475,
+            -1.772114794747065,
+            -0.2824262301078856,
+            0.4225567713155527,
+            0.3585708790762918,
+            0.055862678900300826,
+            -0.11526123089348352,
+            -1.2521613765274908,
+            -0.42217577356006786,
+            -0.04033884817868018,
+            2.033289026919334,
+            -0.04988971995143913,
+            -0.7057327438082988,
+            2.4128000923353357,
+            -0.3638313288964265,
+            -0.03405407763391116,
+            1.0148097939910898,
+            0.5800719259927111,
+            0.17557023754436235,
+            0.7566888242153879,
+            -0.45894415556607737,
+            0.23772513364065845,
+            -1.9103302603497372,
+            -1.0430319251716396,
+            0.07313342630285456,
+            -0.15529571412748291,
+            -0.6434293885652754,
+            -0.38377434094006285,
+            0.47050907570831635,
+            -0.04612875490102634,
+            -0.2698072026361056,
+            -0.30692198931781095,
+            -1.1943117956862719,
+            1.2622911915847035,
+            0.3031956173471867,
+            -0.17588204914026911,
+            -0.06191491083631151,
+            -0.46344741635012415,
+            0.5436004622801555,
+            -0.06671508991381231,
+            -0.35913012258341054,
+            0.3955372066112708,
+            2.663201186481244,
+            0.11341534144806567,
+            -0.859882824492983,
+            0.07239113056922056,
+            0.7580249565359292,
+            -0.31429546027191,
+            0.23426108688369904,
+            1.0925529004937022,
+            0.3429331822877328,
+            1.424012688752455,
+            -1.7784985380563183,
+            -0.29083891508907184,
+            -0.46240820232303675,
+            -0.1820678469205534,
+            0.44828969008153546,
+            -0.499127097946804,
+            0.26207243370385713,
+            -0.2309109061936783,
+            -1.538984448003712,
+            -0.9814213792800085,
+            0.11391020527048852,
+            -3.368347540353861,
+            1.018075895219081,
+            -0.1312453323577376,
+            -0.12550491201763403,
+            -1.126515452014356,
+            -0.06112312872043535,
+            0.10015299100713644,
+            -1.4275411151941106,
+            -0.48635961132829764,
+            0.008900102152382652,
+            -1.1277526115704133,
+            -0.005698380609087966,
+            -0.5027396038504901,
+            0.013700281229883243,
+            1.3436468039910028,
+            -0.166727068425448,
+            -0.363781842514184,
+            -0.6359074584644502,
+            0.1548354433848492,
+            -0.2693618251959253,
+            -0.12446569799054602,
+            -0.9931991382536691,
+            1.7433483133618513,
+            -0.16603425907405664,
+            -1.2390474852332876,
+            1.0045166264846972,
+            8.030543690860544,
+            -0.13658986163990341,
+            0.2008577788701645,
+            -0.0296003032321066,
+            0.39984252186634867,
         ],
         "predictions": [
-            506.69,
-            635.42,
-            113.83,
-            95.03,
-            104.1,
-            136.77,
-            130.9,
-            100.39,
-            161.6,
-            52.61,
-            54.54,
-            34.11,
-            46.14,
-            68.29,
-            257.48,
-            253.11,
-            132.76,
-            152.52,
-            158.84,
+            2481.06,
+            846.72,
+            2226.46,
+            520.75,
             116.11,
-            76.25,
-            207.3,
-            171.66,
-            75.92,
-            167.34,
-            43.15,
+            295.03,
+            77.37,
+            914.63,
+            808.75,
+            1039.52,
+            511.23,
+            296.97,
+            784.08,
+            741.73,
+            585.78,
+            337.55,
+            486.15,
+            593.85,
+            2067.04,
+            1720.35,
+            897.85,
+            148.6,
+            286.16,
+            1186.24,
+            762.59,
+            1289.7,
+            262.55,
+            505.99,
+            1613.64,
+            248.99,
+            796.4,
+            2349.62,
+            1172.84,
+            113.64,
+            540.93,
+            195.88,
+            173.52,
+            344.65,
             46.09,
-            170.72,
-            142.45,
-            196.17,
-            49.55,
-            182.08,
-            95.26,
-            74.92,
+            799.06,
+            199.42,
+            692.36,
+            724.14,
+            781.13,
+            506.69,
+            252.22,
+            824.22,
+            603.27,
+            357.14,
             180.28,
-            201.03,
-            366.02,
-            186.74,
-            84.22,
-            59.29,
-            70.96,
-            135.62,
-            254.52,
-            561.73,
-            421.74,
-            220.26,
-            222.85,
-            335.41,
-            984.07,
-            1055.73,
-            477.84,
-            283.46,
-            65.41,
-            148.39,
+            922.99,
+            312.81,
+            840.33,
+            894.74,
+            1403.5,
+            940.06,
+            254.91,
+            97.49,
+            215.4,
+            186.08,
+            937.26,
+            1312.91,
+            811.63,
+            219.06,
+            635.42,
+            1745.48,
             132.79,
-            254.06,
-            432.56,
+            1182.57,
+            806.2,
+            2038.5,
+            889.85,
+            402.46,
+            1438.08,
+            877.89,
+            1044.04,
+            1401.35,
+            879.02,
+            844.99,
+            302.14,
+            815.39,
+            294.91,
+            524.35,
+            1379.62,
+            821.03,
+            107.27,
+            777.09,
+            1159.42,
+            511.68,
+            136.77,
             753.05,
-            117.27,
-            161.42,
-            253.87,
+            897.06,
+            961.39,
+            832.37,
+            335.6,
+            373.84,
+            712.07,
+            2324.02,
+            971.14,
+            676.45,
+            135.62,
+            2277.42,
+            401.95,
+            798.89,
+            1484.58,
+            825.74,
+            272.61,
+            1109.59,
+            310.28,
+            505.87,
+            363.0,
+            846.45,
+            633.64,
+            227.21,
+            617.46,
             145.57,
-            193.62,
-            702.21,
-            588.13,
-            216.56,
-            310.66,
-            181.41,
-            449.07,
-            266.37,
-            828.91,
-            977.09,
-            343.25,
-            254.91,
-            289.19,
-            384.92,
-            1575.57,
-            1630.82,
-            1128.02,
-            295.64,
-            511.68,
-            217.51,
-            169.93,
-            269.15,
-            773.12,
+            392.82,
+            231.18,
+            104.1,
+            1526.37,
+            518.6,
+            400.3,
+            1136.63,
+            684.91,
+            1301.93,
+            223.13,
+            401.64,
+            275.28,
+            957.35,
+            678.22,
+            817.39,
+            393.0,
+            815.88,
+            80.83,
+            2294.18,
+            984.79,
+            561.73,
+            400.42,
+            293.27,
+            2301.43,
+            2243.29,
+            1094.91,
+            403.37,
+            300.16,
+            287.35,
+            179.15,
+            770.79,
             466.77,
-            295.03,
-            372.79,
-            218.23,
-            172.12,
-            302.14,
-            755.73,
-            1508.42,
-            821.83,
-            232.43,
-            448.77,
-            561.67,
-            268.22,
-            876.47,
-            1234.71,
-            830.84,
-            590.68,
-            223.75,
-            863.12,
-            1191.99,
-            483.23,
-            1521.61,
+            1630.17,
             712.41,
-            493.43,
-            806.82,
-            771.0,
-            253.27,
-            1358.4,
-            2083.5,
-            762.59,
-            723.88,
-            549.27,
-            585.78,
-            1055.15,
-            2072.64,
-            1418.8,
-            809.69,
-            712.07,
-            236.3,
-            678.22,
-            926.66,
-            1927.62,
-            2325.81,
-            701.43,
-            758.88,
-            643.15,
-            712.79,
-            585.69,
-            1113.61,
-            1553.64,
-            804.8,
-            617.46,
-            520.75,
-            754.03,
-            963.03,
-            2243.29,
-            1785.61,
-            681.7,
-            685.78,
-            799.06,
-            777.09,
-            922.41,
-            2112.77,
-            2160.18,
-            1785.96,
-            736.36,
-            632.7,
-            832.37,
-            992.73,
-            2066.57,
-            2226.46,
+            1218.79,
+            257.48,
+            876.47,
+            298.36,
+            783.77,
+            999.67,
+            185.6,
+            409.17,
+            363.71,
+            1893.15,
+            984.07,
+            1171.18,
+            669.41,
+            1969.9,
+            394.21,
+            1087.25,
+            771.0,
+            501.49,
+            1104.03,
+            114.77,
+            551.32,
+            1508.42,
+            727.56,
+            406.4,
+            366.02,
+            122.11,
+            2463.75,
             892.64,
-            875.34,
-            712.06,
-            647.42,
-            896.59,
-            1882.27,
-            1945.87,
-            897.85,
-            800.38,
-            1015.81,
-            603.27,
             912.15,
-            1893.15,
-            1936.73,
-            803.35,
-            780.95,
-            825.37,
+            809.69,
+            1349.91,
+            225.32,
+            933.34,
+            2110.01,
+            445.98,
+            1220.9,
+            707.77,
+            884.07,
+            662.51,
+            761.27,
+            898.34,
+            673.8,
+            1061.44,
+            354.36,
+            878.82,
+            863.12,
+            367.57,
+            1407.41,
+            294.75,
+            763.0,
+            186.08,
+            2291.53,
+            999.82,
+            152.52,
+            187.22,
+            355.18,
+            848.17,
+            171.66,
+            161.42,
             724.05,
-            993.89,
-            2470.23,
-            2045.5,
-            894.11,
-            786.38,
+            1194.64,
+            271.88,
+            253.27,
+            627.7,
+            100.39,
+            1100.32,
+            384.92,
+            806.82,
+            1931.92,
+            1888.11,
             892.91,
-            1023.28,
-            1309.07,
-            2230.49,
-            2277.42,
-            2665.03,
-            971.14,
-            815.88,
-            975.68,
             835.05,
-            2080.84,
-            1847.56,
-            766.85,
-            696.78,
-            876.53,
-            910.7,
-            1234.08,
-            2294.18,
-            2103.6,
-            844.99,
-            817.34,
-            838.33,
-            669.41,
-            932.3,
+            816.78,
+            1091.46,
+            1243.73,
+            243.78,
+            1993.22,
+            182.08,
+            2132.39,
+            944.89,
+            545.17,
+            771.46,
+            651.48,
+            751.17,
+            1216.18,
+            320.89,
+            588.13,
+            1575.04,
+            924.59,
+            949.54,
+            371.61,
             1251.39,
-            1349.38,
-            708.93,
-            763.0,
-            850.19,
-            712.47,
-            846.74,
-            2004.15,
-            1931.26,
-            808.75,
-            817.56,
-            1013.68,
-            803.28,
-            1064.28,
-            1524.16,
-            1407.41,
-            839.89,
-            869.8,
-            878.82,
-            1075.94,
-            1159.42,
-            1667.4,
-            1550.75,
-            797.26,
+            681.7,
+            539.11,
+            880.94,
+            921.31,
             790.11,
-            811.63,
-            751.17,
-            1006.23,
-            1956.29,
-            1412.14,
-            914.63,
-            1187.05,
-            822.93,
-            772.69,
-            880.5,
-            627.7,
-            1557.85,
-            924.89,
-            898.34,
-            1084.94,
-            840.57,
-            937.58,
-            1961.33,
+            895.09,
+            1063.02,
+            235.06,
+            681.3,
+            764.87,
+            237.85,
+            404.91,
+            702.21,
+            360.03,
+            2470.23,
+            579.18,
+            643.15,
+            2338.91,
+            447.09,
+            723.88,
+            220.26,
+            1186.1,
+            838.33,
             2300.33,
-            1993.22,
+            872.42,
+            1553.64,
+            684.6,
+            254.52,
+            201.03,
+            222.85,
+            1396.99,
+            253.87,
+            99.67,
             243.29,
-            356.8,
-            345.26,
-            518.37,
-            1931.92,
-            1786.52,
-            796.91,
-            815.39,
-            727.56,
-            529.98,
-            872.18,
-            1613.64,
-            1538.28,
-            873.57,
-            458.23,
-            478.13,
-            501.49,
-            363.0,
-            1630.17,
-            1729.5,
-            539.11,
-            483.15,
-            511.23,
-            722.68,
-            982.32,
-            770.79,
-            696.94,
-            323.48,
-            521.44,
-            617.89,
-            614.37,
-            1142.93,
-            2245.46,
-            2291.53,
-            1914.49,
+            2496.19,
+            191.19,
+            677.16,
+            236.3,
+            255.23,
+            1055.15,
+            1087.1,
+            282.73,
+            606.62,
+            1123.38,
+            289.86,
+            1935.08,
+            285.42,
+            890.31,
+            807.37,
+            1243.27,
+            1358.4,
+            2500.48,
+            992.73,
+            91.23,
+            811.09,
+            540.17,
+            278.0,
             704.1,
-            236.23,
-            474.67,
+            984.38,
+            1927.62,
+            2718.7,
+            953.95,
+            1686.4,
+            310.66,
+            741.6,
+            529.98,
+            201.15,
+            483.15,
+            121.49,
+            1072.89,
+            766.85,
+            1142.53,
+            2176.05,
+            181.41,
+            1539.45,
+            939.61,
+            2230.49,
+            876.53,
+            1015.81,
+            1667.4,
+            43.15,
+            269.62,
+            2094.2,
+            913.84,
+            1144.41,
+            439.08,
+            772.69,
+            2391.85,
+            804.8,
+            800.38,
+            961.67,
+            585.83,
+            477.84,
+            847.66,
+            909.46,
+            2272.93,
+            1198.1,
+            1209.02,
+            1225.84,
+            839.5,
+            2173.46,
+            2077.82,
+            148.39,
+            773.12,
+            797.26,
+            1524.16,
+            132.76,
+            1949.49,
+            222.5,
+            255.99,
+            751.06,
+            158.84,
             657.61,
-            2038.95,
-            1888.11,
-            728.37,
-            684.6,
-            253.62,
-            543.93,
-            877.89,
-            2104.43,
-            1728.19,
-            674.43,
-            651.48,
-            445.51,
-            569.54,
-            371.83,
-            248.99,
+            170.72,
+            1095.55,
+            821.83,
+            1091.6,
             766.59,
-            422.77,
-            422.8,
-            403.37,
-            404.91,
-            551.32,
-            1105.64,
-            897.06,
-            357.14,
-            401.64,
-            344.89,
-            332.78,
+            696.78,
             536.43,
-            1123.38,
-            1484.58,
-            782.58,
-            675.74,
-            219.42,
-            222.5,
-            290.69,
+            330.47,
+            70.96,
+            338.89,
+            1211.51,
+            373.21,
+            468.56,
+            685.78,
+            872.18,
+            54.54,
             1028.8,
-            1108.9,
-            235.06,
-            262.55,
-            225.32,
-            798.55,
-            1091.6,
-            1182.57,
-            1312.91,
-            607.82,
-            450.97,
-            310.0,
-            282.73,
+            1558.69,
+            167.34,
+            333.79,
+            1010.0,
+            1039.11,
+            1283.74,
+            1187.05,
             297.19,
-            585.83,
-            795.78,
-            252.06,
-            186.08,
-            121.49,
-            199.42,
-            275.28,
-            489.99,
-            294.91,
-            195.06,
-            335.6,
-            223.3,
-            212.28,
-            298.36,
-            295.99,
+            1423.7,
+            2354.79,
+            2463.8,
+            982.32,
+            632.7,
+            780.95,
+            2103.6,
+            124.36,
+            1557.85,
+            276.03,
+            671.12,
+            2080.84,
+            385.39,
+            963.03,
+            336.16,
+            964.99,
+            1145.7,
+            906.42,
+            2770.84,
+            1326.45,
+            770.08,
+            489.5,
+            1936.73,
+            218.23,
+            822.93,
+            1914.49,
+            447.4,
+            284.94,
+            310.0,
+            1038.46,
+            2239.0,
+            368.97,
+            1068.01,
+            339.83,
+            948.28,
+            803.28,
+            922.41,
+            1975.17,
             258.84,
-            320.89,
-            294.75,
-            243.78,
-            286.16,
-            824.22,
-            312.71,
-            394.21,
-            545.17,
-            252.22,
-            249.79,
-            255.23,
-            421.98,
-            926.29,
-            724.14,
-            445.98,
-            80.83,
-            91.23,
-            195.88,
-            342.46,
-            1104.2,
-            851.25,
-            121.37,
-            234.39,
-            136.46,
-            265.13,
-            174.91,
-            271.88,
-            237.63,
-            205.03,
             169.08,
-            227.21,
-            107.27,
-            114.77,
-            97.49,
-            104.3,
-            148.6,
-            373.21,
-            255.99,
-            285.42,
-            406.4,
-            754.38,
-            579.18,
-            141.88,
-            371.61,
-            493.04,
-            194.82,
-            289.86,
-            363.71,
-            360.03,
-            223.13,
-            235.41,
-            122.11,
-            173.52,
-            231.18,
-            185.6,
-            113.64,
-            118.39,
-            181.45,
-            191.19,
-            124.36,
-            355.18,
-            958.34,
-            540.17,
-            449.93,
-            187.22,
-            339.83,
-            518.6,
-            373.84,
-            400.42,
-            486.15,
-            281.53,
-            256.26,
-            186.08,
-            505.99,
-            337.55,
-            1068.01,
+            2066.57,
+            910.7,
+            757.13,
+            2475.67,
+            1015.01,
+            575.5,
+            1785.61,
+            2512.2,
+            825.33,
+            1961.22,
+            1013.68,
+            1521.61,
             713.69,
-            190.89,
-            194.73,
-            400.3,
-            781.13,
-            540.93,
-            839.5,
-            1396.99,
-            796.4,
-            820.94,
-            999.67,
-            909.46,
-            631.48,
-            2718.7,
-            2077.82,
-            890.31,
-            985.14,
-            1072.89,
-            1145.7,
-            1969.9,
-            1218.79,
-            1322.13,
-            733.47,
-            409.84,
-            761.27,
-            822.91,
-            707.77,
-            1910.25,
+            786.38,
+            335.41,
+            758.88,
+            795.78,
+            1083.43,
+            1055.73,
             1300.92,
-            478.36,
-            1144.41,
-            983.52,
-            1063.02,
-            1379.62,
-            1640.13,
-            2239.0,
-            913.84,
-            771.46,
-            439.08,
-            606.62,
-            1110.0,
-            2548.23,
-            2475.67,
-            1526.37,
-            940.01,
+            345.26,
+            2269.7,
+            478.13,
+            896.59,
+            59.29,
             414.07,
-            823.86,
-            971.22,
-            2140.71,
-            393.0,
-            201.15,
-            517.51,
-            741.6,
-            505.87,
-            1087.25,
-            1575.04,
-            2070.78,
-            559.83,
-            720.98,
-            757.13,
-            772.48,
-            1010.0,
-            2173.46,
-            2036.06,
-            901.41,
-            761.42,
+            290.69,
+            161.6,
+            478.36,
+            68.29,
             651.32,
-            752.73,
-            1189.34,
-            2354.79,
-            2404.85,
-            711.01,
-            662.51,
-            924.59,
-            1087.1,
-            1159.66,
-            2324.02,
-            2261.23,
-            681.3,
-            816.78,
-            782.89,
-            770.92,
-            1142.53,
-            2228.59,
-            2755.74,
-            2051.72,
-            867.01,
-            754.7,
-            1061.44,
-            633.64,
-            2453.62,
-            2463.75,
-            872.42,
-            741.73,
-            964.99,
-            843.84,
-            1283.74,
-            2512.2,
-            2268.6,
-            949.57,
-            524.35,
-            811.09,
-            770.08,
-            1094.91,
-            2269.7,
-            2391.85,
-            684.91,
-            881.33,
-            848.17,
-            817.39,
-            987.61,
-            2496.19,
-            2301.43,
+            559.83,
             1037.13,
-            1038.46,
-            999.82,
-            957.35,
-            889.85,
-            1659.52,
-            1745.48,
-            948.28,
-            990.45,
-            2323.42,
-            1220.9,
-            1209.02,
-            1301.93,
-            1266.67,
+            1785.96,
+            269.15,
+            2140.71,
             951.97,
-            917.57,
-            921.43,
-            994.87,
-            1403.5,
-            2272.93,
-            1935.08,
-            1018.11,
-            922.99,
-            783.77,
-            895.09,
-            593.85,
-            1558.69,
-            2283.39,
-            880.94,
-            825.33,
+            518.37,
+            332.78,
+            926.66,
+            2240.74,
+            2256.35,
+            1550.75,
             1055.54,
-            692.36,
-            1038.64,
-            2132.39,
-            2111.55,
-            949.54,
-            937.26,
-            940.06,
-            1136.63,
-            1044.04,
-            2067.04,
-            1539.45,
-            1186.24,
-            1186.1,
-            1198.1,
-            1095.55,
-            961.39,
-            1686.4,
-            2110.01,
-            894.74,
-            1048.32,
-            1100.32,
-            961.67,
-            1194.64,
-            2094.2,
-            1961.22,
-            1039.11,
-            1109.59,
-            1104.03,
-            1243.73,
-            1313.24,
+            476.36,
+            2548.23,
+            1266.67,
+            343.25,
+            875.34,
+            1412.14,
+            2072.64,
+            817.56,
+            238.72,
+            881.33,
+            822.91,
+            1234.71,
+            828.91,
             1826.96,
-            1438.08,
-            1027.51,
-            944.89,
-            1091.46,
-            1172.84,
-            1216.18,
-            2293.61,
-            2368.83,
-            1975.17,
-            812.92,
-            807.37,
-            671.12,
-            1015.01,
-            1720.35,
-            2481.06,
-            921.31,
-            1039.52,
-            984.38,
-            1024.32,
-            1326.45,
-            2349.62,
-            2195.75,
-            933.34,
-            510.41,
-            800.06,
-            953.95,
-            1211.51,
-            2256.35,
-            2338.91,
+            1630.82,
+            1128.02,
+            825.37,
+            295.64,
+            196.17,
+            409.84,
+            971.22,
+            223.75,
+            254.06,
+            422.77,
+            298.24,
+            113.83,
+            613.37,
+            820.94,
+            312.71,
+            141.88,
             810.61,
+            281.53,
+            1910.25,
+            432.56,
+            2404.85,
+            161.82,
+            985.14,
+            205.03,
+            1961.33,
+            172.12,
+            1659.52,
+            869.8,
+            796.91,
+            249.79,
+            130.9,
+            937.58,
+            977.09,
+            894.11,
             833.54,
-            784.08,
-            751.06,
-            970.45,
-            2500.48,
-            2176.05,
-            779.68,
-            371.85,
-            831.65,
+            1234.08,
+            614.37,
+            289.19,
+            216.56,
+            617.89,
+            2325.81,
+            873.57,
+            921.43,
+            2083.5,
+            195.06,
+            987.61,
+            590.68,
+            754.03,
+            728.37,
             842.35,
-            1349.91,
-            2770.84,
-            1401.35,
-            901.2,
-            417.71,
-            677.16,
-            791.95,
-            920.6,
-            1949.49,
-            2240.74,
-            764.87,
-            846.45,
-            613.37,
-            884.07,
-            798.89,
-            2529.15,
+            75.92,
+            839.89,
+            867.01,
+            194.73,
+            754.38,
+            449.07,
+            770.92,
+            901.41,
+            49.55,
+            1931.26,
+            76.25,
+            830.84,
+            2104.43,
+            323.48,
+            812.92,
+            121.37,
+            1064.28,
+            1142.93,
+            752.73,
+            970.45,
+            2070.78,
+            850.19,
+            2195.75,
+            1313.24,
+            256.26,
             2060.61,
-            825.74,
-            847.66,
-            906.42,
-            821.03,
-            989.92,
-            2463.8,
-            1243.27,
-            99.67,
-            161.82,
-            328.86,
-            447.09,
-            575.5,
-            950.31,
-            1083.43,
-            284.94,
-            409.17,
-            281.76,
-            447.4,
-            676.45,
-            1423.7,
-            2038.5,
-            1225.84,
-            296.97,
-            344.65,
-            330.47,
-            489.5,
-            1171.18,
-            879.02,
-            392.82,
-            468.56,
-            551.69,
-            939.61,
-            1289.7,
-            476.36,
-            336.16,
-            333.79,
-            170.7,
-            237.85,
-            287.35,
+            846.74,
+            65.41,
+            2045.5,
+            772.48,
+            342.46,
+            266.37,
+            2038.95,
+            169.93,
             413.32,
-            840.33,
+            521.44,
+            328.86,
+            212.28,
+            417.71,
+            901.2,
+            1418.8,
+            84.22,
+            450.97,
             732.51,
-            651.13,
-            571.01,
-            401.95,
-            312.81,
-            310.28,
-            984.79,
-            846.72,
-            278.0,
+            736.36,
             273.2,
-            293.27,
-            368.97,
-            385.39,
-            806.2,
-            673.8,
-            215.4,
-            402.46,
-            338.89,
-            300.16,
-            276.03,
-            272.61,
-            367.57,
-            179.15,
-            354.36,
-            77.37,
+            52.61,
+            449.93,
+            207.3,
+            949.57,
+            920.6,
+            2051.72,
             220.43,
-            238.72,
-            219.06,
-            269.62,
-            298.24,
-        ],
-        "targets": [
-            331,
-            131,
-            120,
-            108,
-            82,
-            88,
-            148,
-            68,
-            54,
-            41,
-            43,
-            25,
-            38,
-            54,
-            222,
-            251,
-            117,
-            9,
-            78,
-            83,
-            75,
-            93,
-            150,
-            86,
-            186,
-            34,
-            15,
-            38,
-            123,
-            140,
-            42,
-            47,
-            72,
-            61,
-            88,
-            100,
-            354,
-            120,
-            64,
-            53,
-            47,
-            149,
-            288,
-            397,
-            208,
-            140,
-            218,
-            259,
-            579,
-            532,
-            639,
-            195,
-            74,
-            139,
-            100,
-            120,
-            424,
-            694,
-            81,
-            137,
-            231,
-            123,
-            214,
-            640,
-            114,
-            244,
-            316,
-            191,
-            46,
-            247,
-            724,
-            982,
-            359,
-            289,
-            321,
-            424,
-            884,
-            1424,
-            1047,
-            401,
-            460,
-            203,
-            166,
-            300,
-            981,
-            472,
+            1191.99,
+            950.31,
+            779.68,
+            551.69,
+            237.63,
+            2245.46,
+            733.47,
+            2228.59,
+            194.82,
+            607.82,
+            421.74,
+            1159.66,
+            445.51,
+            1945.87,
+            2004.15,
+            253.11,
+            712.47,
+            2111.55,
+            142.45,
+            1189.34,
+            74.92,
+            517.51,
+            1538.28,
+            372.79,
+            1882.27,
+            569.54,
+            104.3,
+            235.41,
+            95.03,
+            493.04,
+            483.23,
+            940.01,
+            696.94,
+            344.89,
+            281.76,
+            2261.23,
+            1729.5,
+            1038.64,
+            223.3,
+            448.77,
+            2323.42,
+            371.85,
+            422.8,
+            754.7,
+            236.23,
+            924.89,
+            993.89,
+            675.74,
+            571.01,
+            1309.07,
+            651.13,
+            217.51,
+            782.58,
+            186.74,
+            234.39,
+            823.86,
+            549.27,
+            174.91,
+            711.01,
+            720.98,
+            983.52,
+            990.45,
+            253.62,
+            1104.2,
+            1075.94,
+            268.22,
+            252.06,
+            2665.03,
+            295.99,
+            1786.52,
+            958.34,
+            493.43,
+            712.79,
+            843.84,
+            585.69,
+            674.43,
+            1110.0,
+            831.65,
+            994.87,
+            1084.94,
+            975.68,
+            265.13,
+            1956.29,
+            708.93,
+            283.46,
+            371.83,
+            458.23,
+            232.43,
+            543.93,
+            851.25,
+            2368.83,
+            1105.64,
+            181.45,
+            761.42,
+            1847.56,
+            2036.06,
+            118.39,
+            631.48,
+            421.98,
+            2755.74,
+            489.99,
+            474.67,
+            1023.28,
+            755.73,
+            219.42,
+            917.57,
+            1322.13,
+            2293.61,
+            2529.15,
+            932.3,
+            722.68,
+            803.35,
+            170.7,
+            1048.32,
+            2112.77,
+            791.95,
+            840.57,
+            1108.9,
+            1006.23,
+            190.89,
+            1575.57,
+            2160.18,
+            701.43,
+            117.27,
+            798.55,
+            95.26,
+            561.67,
+            1349.38,
+            1728.19,
+            34.11,
+            356.8,
+            800.06,
+            880.5,
+            46.14,
+            2283.39,
+            2268.6,
+            647.42,
+            510.41,
+            193.62,
+            817.34,
+            712.06,
+            1113.61,
+            2453.62,
+            136.46,
+            926.29,
+            989.92,
+            1640.13,
+            1027.51,
+            1024.32,
+            782.89,
+            1018.11,
+        ],
+        "targets": [
+            2570,
+            441,
+            1685,
+            536,
+            83,
             222,
-            317,
-            168,
-            179,
-            307,
-            898,
-            1651,
-            734,
-            167,
-            413,
-            571,
-            172,
-            879,
-            1188,
-            855,
-            257,
-            209,
-            529,
-            642,
-            121,
-            1558,
-            669,
-            409,
-            613,
-            745,
-            177,
-            1462,
-            1710,
-            773,
-            678,
-            547,
+            9,
+            833,
+            729,
+            1070,
+            480,
+            327,
+            787,
+            968,
             569,
-            878,
-            1965,
-            1138,
-            847,
-            603,
-            255,
-            614,
-            894,
-            1612,
-            1401,
-            664,
-            694,
-            550,
-            695,
-            692,
-            902,
-            1582,
-            773,
-            678,
-            536,
-            735,
-            909,
-            2258,
-            1576,
-            836,
-            659,
-            740,
-            758,
-            871,
-            2001,
-            2355,
-            1549,
-            673,
-            513,
-            736,
-            898,
-            1869,
-            1685,
-            673,
-            763,
-            676,
-            563,
-            815,
-            1729,
-            1467,
+            246,
+            515,
+            747,
+            2345,
+            1557,
             863,
-            727,
-            769,
+            145,
+            227,
+            1233,
+            773,
+            1603,
+            69,
+            325,
+            1434,
+            57,
+            838,
+            3160,
+            1172,
+            73,
+            447,
+            140,
+            163,
+            373,
+            15,
+            740,
+            150,
+            1036,
+            686,
+            486,
+            331,
+            103,
+            163,
             545,
-            863,
-            1807,
-            1639,
-            699,
-            774,
-            661,
-            746,
-            969,
-            1782,
-            1920,
-            854,
-            732,
-            848,
-            1027,
-            1246,
-            2204,
-            2282,
-            3065,
-            1031,
-            784,
-            754,
-            692,
-            1988,
-            1743,
-            723,
-            662,
-            748,
-            888,
-            1318,
-            2418,
-            2006,
-            841,
-            752,
-            644,
-            632,
-            562,
-            987,
-            1050,
-            568,
-            750,
-            755,
-            606,
-            670,
-            1559,
-            1524,
-            729,
-            801,
-            467,
-            799,
-            1023,
-            1521,
-            1298,
-            846,
-            907,
-            884,
-            812,
-            1051,
-            1504,
-            1338,
-            775,
-            721,
+            373,
+            88,
+            921,
+            340,
+            951,
+            1207,
+            1511,
+            1074,
+            289,
+            67,
+            212,
+            126,
+            968,
+            810,
             668,
-            639,
-            797,
-            1914,
+            159,
+            131,
+            1421,
+            100,
             1249,
-            833,
-            1281,
-            949,
-            435,
-            768,
-            226,
-            1415,
-            729,
-            775,
-            688,
-            783,
-            875,
-            1935,
-            2521,
-            1236,
-            204,
-            118,
-            153,
-            417,
-            1750,
-            1633,
-            690,
+            767,
+            2290,
+            829,
+            433,
+            1483,
+            676,
+            1328,
+            781,
+            922,
+            841,
+            307,
             701,
-            647,
-            428,
-            742,
-            1434,
-            1353,
-            691,
-            438,
-            539,
-            555,
-            258,
-            1776,
-            1544,
-            684,
+            377,
             477,
-            480,
-            653,
-            830,
-            480,
-            616,
-            330,
-            486,
-            559,
-            639,
-            949,
-            2235,
-            2397,
-            1514,
-            667,
-            217,
-            290,
-            529,
-            1899,
-            1748,
-            713,
-            637,
-            254,
-            471,
-            676,
-            1499,
-            1619,
-            699,
-            695,
-            404,
-            240,
-            456,
-            57,
-            885,
-            362,
-            410,
-            370,
-            318,
-            470,
-            1156,
+            1807,
+            875,
+            130,
+            758,
+            1051,
+            460,
+            88,
+            694,
             952,
-            373,
-            376,
-            305,
-            190,
-            440,
-            1275,
+            1065,
+            736,
+            155,
+            246,
+            603,
+            3410,
+            1031,
+            709,
+            149,
+            2282,
+            331,
+            753,
             1004,
-            595,
-            449,
-            145,
-            139,
-            245,
-            943,
-            787,
-            220,
-            69,
-            112,
-            560,
-            1095,
-            1249,
-            810,
-            253,
-            96,
-            188,
-            182,
-            268,
-            706,
-            634,
-            233,
-            126,
-            50,
-            150,
+            830,
+            205,
+            1081,
+            349,
+            475,
+            258,
+            922,
+            533,
+            109,
+            678,
+            123,
+            449,
+            227,
+            82,
+            1198,
+            516,
+            432,
+            983,
+            653,
+            1448,
+            206,
+            376,
             261,
-            502,
-            377,
-            143,
-            155,
-            178,
-            181,
+            921,
+            614,
+            778,
+            120,
+            784,
+            89,
+            2418,
+            1153,
+            397,
+            317,
+            310,
+            2551,
+            2258,
+            1563,
+            370,
+            314,
+            243,
+            174,
+            480,
+            472,
+            1776,
+            669,
+            1033,
+            222,
+            879,
             178,
-            275,
-            220,
-            260,
-            216,
-            107,
-            227,
-            163,
-            155,
+            799,
+            997,
+            192,
+            466,
+            384,
+            1807,
+            579,
+            1313,
+            632,
+            2469,
             303,
-            430,
-            103,
-            255,
-            254,
-            491,
-            665,
-            686,
-            244,
-            89,
-            95,
-            140,
-            307,
-            1070,
-            599,
-            106,
-            173,
-            92,
+            1014,
+            745,
+            555,
+            1094,
+            115,
+            470,
+            1651,
+            647,
             269,
-            174,
-            333,
-            284,
-            217,
-            127,
+            354,
             109,
-            130,
-            115,
-            67,
-            196,
-            145,
-            439,
-            467,
+            2494,
+            673,
+            863,
+            847,
+            1516,
+            112,
+            1022,
+            2182,
             244,
-            269,
+            1405,
+            796,
+            1008,
+            625,
+            674,
             775,
-            558,
-            126,
-            324,
-            304,
-            190,
-            310,
-            384,
-            318,
-            206,
-            199,
-            109,
+            538,
+            1100,
+            440,
+            884,
+            529,
+            408,
+            1298,
+            216,
+            750,
+            65,
+            2397,
+            1077,
+            9,
             163,
-            227,
-            192,
-            73,
-            94,
-            135,
-            141,
-            74,
             349,
-            1435,
-            618,
-            502,
-            163,
-            394,
-            516,
-            246,
-            317,
-            515,
-            253,
-            229,
-            65,
-            325,
-            246,
-            956,
-            710,
-            203,
-            221,
-            432,
-            486,
-            447,
-            968,
-            1658,
-            838,
-            762,
-            997,
-            1005,
-            548,
-            3155,
-            2207,
-            982,
-            1051,
-            1122,
-            1334,
-            2469,
-            1033,
-            1532,
-            795,
-            531,
-            674,
-            834,
-            796,
-            2301,
-            2347,
-            1208,
-            1348,
-            1058,
-            1192,
-            1807,
-            3252,
-            2230,
-            905,
-            819,
-            482,
-            663,
-            1252,
-            2795,
-            2846,
+            872,
+            150,
+            137,
+            746,
+            1483,
+            333,
+            177,
+            226,
+            68,
             1198,
-            989,
-            347,
-            846,
-            1340,
-            2541,
-            120,
-            195,
-            518,
-            655,
-            475,
-            1014,
-            1120,
-            2229,
-            665,
-            653,
-            667,
-            764,
-            1069,
-            2496,
-            2135,
-            1008,
-            738,
-            620,
-            1026,
-            1319,
-            2622,
-            2172,
-            342,
-            625,
-            991,
-            1242,
-            1521,
-            3410,
-            2704,
-            630,
+            424,
+            613,
+            1750,
+            1748,
+            848,
+            692,
             819,
-            766,
-            1059,
-            1417,
-            2855,
-            3283,
-            2557,
-            880,
-            745,
-            1100,
-            533,
-            2795,
-            2494,
-            1071,
-            968,
-            1027,
-            1038,
-            1488,
-            2708,
-            2224,
-            1017,
-            477,
-            1173,
-            1180,
-            1563,
-            2963,
-            2634,
-            653,
-            968,
-            872,
-            778,
-            964,
-            2657,
-            2551,
-            1139,
-            1077,
-            1077,
-            921,
-            829,
-            1455,
-            1421,
-            904,
-            1052,
-            2562,
-            1405,
-            1366,
-            1448,
-            1203,
-            998,
-            954,
-            975,
-            1032,
-            1511,
-            2355,
-            1920,
-            1088,
-            921,
-            799,
-            888,
-            747,
-            1264,
-            2544,
-            1135,
-            1140,
-            1383,
-            1036,
-            1259,
-            2234,
-            2153,
-            1040,
-            968,
-            1074,
-            983,
-            1328,
-            2345,
-            1707,
-            1233,
-            1278,
-            1263,
-            1196,
-            1065,
-            2247,
-            2182,
-            1207,
-            1128,
-            1198,
-            1338,
-            1483,
-            2827,
-            1208,
-            1026,
-            1081,
-            1094,
+            1177,
             1363,
-            1325,
-            1829,
-            1483,
-            989,
+            107,
+            1236,
+            47,
+            2234,
             935,
-            1177,
-            1172,
+            430,
+            819,
+            695,
+            639,
             1433,
-            2352,
-            2613,
-            1965,
-            867,
-            832,
-            611,
-            1045,
-            1557,
-            2570,
+            260,
+            114,
+            1120,
+            991,
+            1040,
+            324,
+            987,
+            836,
+            684,
+            1135,
             1118,
-            1070,
-            1050,
-            1054,
-            1379,
-            3160,
-            2166,
-            1022,
-            371,
-            788,
-            939,
-            1250,
-            2512,
+            721,
+            888,
+            1192,
+            220,
+            630,
+            760,
+            198,
+            318,
+            640,
+            318,
+            1782,
+            558,
+            550,
             2454,
-            1001,
-            845,
-            787,
-            751,
-            1045,
-            2589,
-            2015,
-            763,
-            315,
-            728,
-            891,
-            1516,
-            3031,
-            781,
-            874,
-            601,
+            466,
+            678,
+            140,
+            1278,
+            644,
+            2521,
+            1071,
+            1582,
+            637,
+            288,
+            100,
+            218,
+            1658,
+            231,
+            2,
+            204,
+            2657,
+            141,
             780,
-            834,
-            1060,
-            2252,
-            2080,
-            760,
-            922,
-            979,
-            1008,
-            753,
-            2806,
-            2132,
-            830,
-            841,
-            795,
-            875,
-            1182,
-            2643,
+            255,
+            254,
+            878,
+            1242,
+            182,
+            663,
+            1275,
+            310,
+            1920,
+            244,
+            982,
+            832,
             998,
-            2,
-            87,
-            419,
-            466,
+            1462,
+            2589,
+            898,
+            95,
+            1173,
             618,
-            1029,
-            1201,
-            378,
-            466,
-            326,
-            340,
-            709,
-            2090,
-            2290,
+            329,
+            667,
+            1050,
+            1612,
+            3155,
+            939,
+            2247,
+            316,
+            655,
+            428,
+            195,
+            477,
+            50,
+            1122,
+            723,
+            1417,
+            2015,
+            191,
+            1707,
+            955,
+            2204,
+            748,
+            769,
+            1504,
+            34,
+            364,
+            2827,
+            905,
+            1348,
+            482,
+            435,
+            2634,
+            773,
+            727,
+            1338,
+            706,
+            639,
+            841,
+            1005,
+            2355,
+            1263,
+            1366,
             1097,
-            327,
-            373,
+            968,
+            2496,
+            2207,
+            139,
+            981,
+            775,
+            1521,
+            117,
+            2252,
+            139,
+            467,
+            751,
+            78,
+            529,
+            38,
+            1196,
+            734,
+            1095,
+            885,
+            662,
+            440,
             320,
-            484,
-            1313,
-            922,
-            449,
+            47,
+            333,
+            1250,
+            439,
             534,
-            615,
-            955,
-            1603,
-            532,
-            309,
+            659,
+            742,
+            43,
+            943,
+            1264,
+            186,
             337,
-            123,
-            198,
-            243,
-            362,
-            951,
-            892,
-            555,
-            551,
-            331,
+            1069,
+            1026,
+            1488,
+            1281,
+            268,
+            2090,
+            2622,
+            2643,
+            830,
+            513,
+            774,
+            2006,
+            74,
+            1415,
+            221,
+            611,
+            1988,
+            429,
+            909,
+            309,
+            1027,
+            1334,
+            795,
+            3031,
+            1379,
+            1180,
+            484,
+            1639,
+            168,
+            949,
+            1514,
             340,
-            349,
-            1153,
-            441,
-            329,
-            282,
-            310,
+            378,
+            188,
+            1077,
+            2230,
             425,
-            429,
-            767,
-            538,
-            212,
-            433,
-            333,
-            314,
-            221,
-            205,
-            408,
-            174,
-            440,
-            9,
-            247,
+            956,
+            394,
+            904,
+            799,
+            871,
+            1965,
+            220,
+            127,
+            1869,
+            888,
+            667,
+            2846,
+            1045,
+            618,
+            1576,
+            2708,
+            1140,
+            1208,
+            467,
+            1558,
+            710,
+            732,
+            259,
+            694,
+            634,
+            1201,
+            532,
+            2347,
+            153,
+            2963,
+            539,
+            815,
+            53,
+            347,
+            245,
+            54,
+            1208,
+            54,
+            620,
+            665,
+            1139,
+            1549,
+            300,
+            2541,
+            998,
+            417,
+            190,
+            894,
+            2080,
+            2512,
+            1338,
+            1383,
+            532,
+            2795,
+            1203,
+            359,
+            763,
+            1249,
+            1965,
+            801,
             644,
-            159,
-            364,
+            968,
+            834,
+            1188,
+            724,
+            1829,
+            1424,
+            1047,
+            661,
+            401,
+            140,
+            531,
+            1340,
+            209,
+            120,
+            362,
             439,
-        ],
-        "regression_line": {
-            "coefficient": 0.874412098939795,
-            "intercept": 117.42919788186754,
-        },
-    },
-}
-
-test_model_quality_metrics_nulls_res = {
-    "mae": 125.10728380284355,
-    "mape": 35.20983105808412,
-    "mse": 40967.56845041558,
-    "rmse": 202.40446746654476,
-    "r2": 0.9130200200429489,
-    "adj_r2": 0.9116855991509998,
-    "variance": 393588.5428577967,
-    "residuals": {
-        "ks": {"p_value": 1.6576962025283137e-11, "statistic": 0.5712276152109744},
-        "correlation_coefficient": 0.9564966165224408,
-        "histogram": {
-            "buckets": [
-                -924.81,
-                -671.1419999999999,
-                -417.474,
-                -163.80600000000004,
-                89.86199999999997,
-                343.53,
-                597.1979999999999,
-                850.866,
-                1104.5339999999999,
-                1358.2019999999998,
-                1611.87,
-            ],
-            "values": [5, 14, 73, 502, 105, 21, 6, 2, 1],
-        },
-        "standardized_residuals": [
-            -2.440988540649414,
-            0.11705673485994339,
-            -0.05633402615785599,
-            -0.18819406628608704,
-            0.13747601211071014,
-            -0.10720916092395782,
-            -0.4790574610233307,
-            -0.004470066633075476,
-            -0.004123976919800043,
-            0.007890267297625542,
-            0.012686077505350113,
-            -0.01772034540772438,
-            -0.12248653173446655,
-            0.042499203234910965,
-            -0.024988221004605293,
-            -0.656650722026825,
-            -0.34675243496894836,
-            -0.11076893657445908,
-            0.04675115644931793,
-            -0.5121831297874451,
-            -0.05415860936045647,
-            0.1027681902050972,
-            0.1451888531446457,
-            0.007692502345889807,
-            -0.10078179091215134,
-            -0.6032540798187256,
-            -0.04323207214474678,
-            -0.22478066384792328,
-            0.015603115782141685,
-            -0.6149222254753113,
-            -0.06206922233104706,
-            -0.01589101552963257,
-            -0.4033133089542389,
-            -0.44657447934150696,
-            -0.006497161462903023,
-            -0.27704015374183655,
-            -0.047039058059453964,
-            0.021832725033164024,
-            -0.06553011387586594,
-            0.11908382922410965,
-            0.21846091747283936,
-            -0.7615157961845398,
-            -1.0038278102874756,
-            -0.34388482570648193,
-            0.028952276334166527,
-            -0.324849933385849,
-            -1.9497889280319214,
-            -2.5364596843719482,
-            0.8497278690338135,
-            -0.3844267427921295,
-            0.09540142863988876,
-            0.006505910307168961,
-            -0.1091868132352829,
-            -0.609879195690155,
-            0.010609541088342667,
-            -0.23901976644992828,
-            -0.1263923943042755,
-            -0.06780441850423813,
-            -0.06014101207256317,
-            -0.05865776911377907,
-            0.15369276702404022,
-            -0.2546432316303253,
-            -2.2912306785583496,
-            0.18859834969043732,
-            0.07933299988508224,
-            0.10034556686878204,
-            -1.9399006366729736,
-            -0.042836543172597885,
-            -0.46575772762298584,
-            0.07720702141523361,
-            0.13080142438411713,
-            0.22147683799266815,
-            0.21020421385765076,
-            0.24614806473255157,
-            -3.3662831783294678,
-            -0.9696143865585327,
-            -0.3476423919200897,
-            0.5738452672958374,
-            -0.2025814950466156,
-            -0.01880805380642414,
-            0.033500880002975464,
-            0.20545785129070282,
-            1.0807178020477295,
-            0.07878914475440979,
-            -0.30813875794410706,
-            -0.22290189564228058,
-            -0.1954125016927719,
-            0.08694696426391602,
-            0.07695981115102768,
-            0.7563332319259644,
-            0.7578659057617188,
-            -0.38131192326545715,
-            -0.2705633342266083,
-            -0.12392033636569977,
-            0.09906008839607239,
-            -0.4227932095527649,
-            0.06543998420238495,
-            -0.17800915241241455,
-            0.17238159477710724,
-            -1.5968271493911743,
-            -0.019994646310806274,
-            -1.5990025997161865,
-            -2.666292667388916,
-            -1.737982153892517,
-            0.23284834623336792,
-            -0.1616935133934021,
-            -0.36450186371803284,
-            -0.9053406715393066,
-            -0.07561615109443665,
-            -0.3241577446460724,
-            0.5651435852050781,
-            -1.7937026023864746,
-            0.10439975559711456,
-            -0.17390552163124084,
-            0.041708141565322876,
-            -0.0300312377512455,
-            -0.8229219317436218,
-            -0.47925522923469543,
-            -1.3353813886642456,
-            0.2373969554901123,
-            -0.48632532358169556,
-            0.14538662135601044,
-            -0.26458093523979187,
-            -0.10854408144950867,
-            -1.5075361728668213,
-            -4.519453048706055,
-            -0.13212759792804718,
-            -0.2678440511226654,
-            -0.40761470794677734,
-            -0.03502481058239937,
-            0.578542172908783,
-            -0.9932968020439148,
-            0.1931469589471817,
-            -0.1042921245098114,
-            0.3522491753101349,
-            0.12832936644554138,
-            -0.04115553945302963,
-            -0.2142002135515213,
-            0.1256595253944397,
-            -0.983408510684967,
-            0.8158111572265625,
-            -0.07947257161140442,
-            -0.23906920850276947,
-            -0.041452184319496155,
-            -0.20124658942222595,
-            -0.4996744990348816,
-            1.0161473751068115,
-            -1.1186305284500122,
-            -0.2603289783000946,
-            -0.5388814806938171,
-            -0.4235348403453827,
-            -0.41542646288871765,
-            -0.9238811731338501,
-            -2.624119281768799,
-            -1.0329982042312622,
-            -0.5024926662445068,
-            -0.1253541260957718,
-            -0.36445242166519165,
-            -0.3504605293273926,
-            -0.7048560380935669,
-            -2.3146660327911377,
-            -0.11937173455953598,
-            -0.3098691999912262,
-            -1.167330265045166,
-            -0.2351633459329605,
-            -0.19007283449172974,
-            -0.37300577759742737,
-            -1.4190856218338013,
-            -0.4629890024662018,
-            0.018569596111774445,
-            -0.7597359418869019,
-            0.16145505011081696,
-            -0.07012815773487091,
-            -3.3497698307037354,
-            -0.5675574541091919,
-            -0.14537787437438965,
-            -0.21593065559864044,
-            -0.16910971701145172,
-            0.07132349908351898,
-            -0.2588951885700226,
-            -0.0780387744307518,
-            0.07557545602321625,
-            2.0304365158081055,
-            0.348887175321579,
-            -0.1046876534819603,
-            -1.0430842638015747,
-            -0.6543269753456116,
-            -0.40608203411102295,
-            -0.4640272855758667,
-            -0.16386893391609192,
-            -0.11902564018964767,
-            -0.5825381875038147,
-            -0.059300508350133896,
-            0.46784302592277527,
-            0.6651139259338379,
-            -0.42961612343788147,
-            0.03320423141121864,
-            -0.2701183557510376,
-            -0.90786212682724,
-            -0.1320287138223648,
-            -1.777881383895874,
-            -1.2542481422424316,
-            -1.4272433519363403,
-            -0.6438454389572144,
-            -0.011342411860823631,
-            -0.41770073771476746,
-            -0.4734705686569214,
-            -0.8208948373794556,
-            -2.147949695587158,
-            -1.9606164693832397,
-            -0.3413633406162262,
-            -0.02894352748990059,
-            -2.6499276161193848,
-            0.031770434230566025,
-            -0.1511625051498413,
-            0.03730786219239235,
-            -0.4880063235759735,
-            0.08313997834920883,
-            0.23685309290885925,
-            0.07854193449020386,
-            -1.2520233392715454,
-            -0.4831116497516632,
-            -0.7549400925636292,
-            -0.9989330768585205,
-            -0.05712508782744408,
-            -0.2887577414512634,
-            -0.6571945548057556,
-            -0.5016521215438843,
-            -0.9815297722816467,
-            -0.15615607798099518,
-            -0.7536546587944031,
-            -0.3506582975387573,
-            0.517432689666748,
-            0.6762382388114929,
-            -1.6166532039642334,
-            -0.503283679485321,
-            -1.9331271648406982,
-            -0.6533381342887878,
-            -0.9155750274658203,
-            -0.5568780899047852,
-            -1.909593105316162,
-            -0.23170244693756104,
-            -0.25647255778312683,
-            -0.07724771648645401,
-            1.1439533233642578,
-            -3.6908655166625977,
-            -0.14132368564605713,
-            -1.127727746963501,
-            -0.8976277709007263,
-            -0.4482555091381073,
-            -0.8465054631233215,
-            -0.7060920596122742,
-            -0.4756459891796112,
-            -0.5126281380653381,
-            -0.34536808729171753,
-            -0.4512714147567749,
-            -0.5906959772109985,
-            -0.8352328538894653,
-            -0.8631177544593811,
-            -0.8497191667556763,
-            -0.04708849638700485,
-            0.35388073325157166,
-            0.31749191880226135,
-            -0.4662027060985565,
-            0.7739343047142029,
-            -0.8642054796218872,
-            0.7692868113517761,
-            0.02252490259706974,
-            -0.10147396475076675,
-            -0.29157590866088867,
-            -0.7001591324806213,
-            -1.3847732543945312,
-            -0.34724685549736023,
-            0.08516707271337509,
-            -0.1222887709736824,
-            -0.2382287085056305,
-            0.17470534145832062,
-            -0.9058845043182373,
-            0.0012156871380284429,
-            0.5743891000747681,
-            -1.9271447658538818,
-            -0.13049602508544922,
-            -0.04214436560869217,
-            -0.8601018190383911,
-            -0.5829337239265442,
-            -0.6390001773834229,
-            -0.6397912502288818,
-            -0.023060008883476257,
-            -0.18240943551063538,
-            0.05481009557843208,
-            -0.3076443374156952,
-            -0.945239782333374,
-            -2.9403955936431885,
-            -0.4869186282157898,
-            0.1744086891412735,
-            0.2681000232696533,
-            -0.1522996574640274,
-            -1.576358437538147,
-            0.46907904744148254,
-            -0.8962928652763367,
-            0.638366162776947,
-            -0.24752368032932281,
-            -0.010353585705161095,
-            -0.11205441504716873,
-            -0.37676331400871277,
-            -0.34912562370300293,
-            0.3019178807735443,
-            0.3245620131492615,
-            0.13134528696537018,
-            -0.07383625954389572,
-            -0.14429016411304474,
-            -0.6529920697212219,
-            -0.4238314628601074,
-            0.8025608658790588,
-            -2.323120355606079,
-            -0.8744892477989197,
-            -1.0681015253067017,
-            -0.31501108407974243,
-            -0.35990384221076965,
-            -0.1729661375284195,
-            -0.3712753355503082,
-            -1.5385853052139282,
-            -0.021527327597141266,
-            -0.9040057063102722,
-            -0.5073378682136536,
-            -1.1264917850494385,
-            0.0697413757443428,
-            0.3813701272010803,
-            -2.433522939682007,
-            -1.7013461589813232,
-            -1.7020877599716187,
-            -0.5502529740333557,
-            -0.44509124755859375,
-            -0.09138793498277664,
-            0.6470678448677063,
-            -0.7469305992126465,
-            -0.041303861886262894,
-            -0.24411222338676453,
-            -0.3005247712135315,
-            -0.19140775501728058,
-            -0.017670903354883194,
-            0.11231037229299545,
-            0.4587952494621277,
-            -0.2044602632522583,
-            -0.8399792313575745,
-            -0.1710379272699356,
-            -0.10172117501497269,
-            -0.5421445965766907,
-            -0.05084604024887085,
-            -0.13909882307052612,
-            -0.24811697006225586,
-            -0.3364191949367523,
-            -0.6233272552490234,
-            -0.23956361413002014,
-            -3.216228723526001,
-            -0.7268080115318298,
-            -0.3980230987071991,
-            -0.5164845585823059,
-            -0.6848322749137878,
-            0.07869026064872742,
-            0.046850040555000305,
-            0.3941754102706909,
-            -1.2389212846755981,
-            -0.13563792407512665,
-            -0.9456847906112671,
-            0.09332489967346191,
-            0.07157070934772491,
-            -0.22334685921669006,
-            -0.12238765507936478,
-            -0.11615804582834244,
-            -1.1942263841629028,
-            -0.023060008883476257,
-            -0.2505890429019928,
-            -0.16688485443592072,
-            0.07206512242555618,
-            0.04843216389417648,
-            0.3551167845726013,
-            0.28219079971313477,
-            0.1121126040816307,
-            -0.15511780977249146,
-            -0.5315147042274475,
-            0.16531148552894592,
-            0.05406847596168518,
-            -0.09781530499458313,
-            0.506308376789093,
-            0.03513244539499283,
-            0.3782058656215668,
-            1.0961929559707642,
-            -0.15185469388961792,
-            -0.6263926029205322,
-            0.1548793613910675,
-            -0.0517854243516922,
-            -0.025581516325473785,
-            -0.18245887756347656,
-            -0.8817076683044434,
-            0.029100600630044937,
-            0.15250617265701294,
-            0.15324778854846954,
-            -0.15487061440944672,
-            -0.03176168352365494,
-            -0.12708458304405212,
-            -0.011886266991496086,
-            0.0009190391283482313,
-            0.03226484730839729,
-            0.08457378298044205,
-            -0.14799825847148895,
-            -0.06765609234571457,
-            -0.1767236739397049,
-            -0.19521473348140717,
-            -0.19605524837970734,
-            0.02237657830119133,
-            2.409601926803589,
-            0.4377332329750061,
-            0.31037235260009766,
-            -0.06681559234857559,
-            0.3207550346851349,
-            0.04007657617330551,
-            -0.5791267156600952,
-            -0.35950830578804016,
-            0.19556957483291626,
-            -0.08812480419874191,
-            -0.08184576034545898,
-            -0.5457043647766113,
-            -0.8419074416160583,
-            -0.39970409870147705,
-            -0.5008611083030701,
-            0.03468747064471245,
-            0.11280478537082672,
-            0.18281371891498566,
-            0.2096603661775589,
-            -1.4062308073043823,
-            -0.4114711582660675,
-            0.6882525086402893,
-            1.3433996438980103,
-            0.25860726833343506,
-            -0.23847590386867523,
-            0.0397304892539978,
-            0.5252938270568848,
-            -0.3598049581050873,
-            2.210056781768799,
-            0.6916145086288452,
-            0.5062589049339294,
-            0.3785519599914551,
-            0.29573771357536316,
-            0.9839116930961609,
-            2.5205483436584473,
-            -0.8656392693519592,
-            1.0905566215515137,
-            0.3571438789367676,
-            0.6519625782966614,
-            -0.3785432279109955,
-            0.10776176303625107,
-            0.4891522228717804,
-            1.9848514795303345,
-            5.22489070892334,
-            3.6603689193725586,
-            1.0595074892044067,
-            0.4211703836917877,
-            0.6906256675720215,
-            2.165955066680908,
-            8.022232055664062,
-            0.008434122428297997,
-            0.009225183166563511,
-            0.2879754304885864,
-            0.2651335299015045,
-            0.33168157935142517,
-            0.7549982666969299,
-            1.272995114326477,
-            1.883892297744751,
-            -1.5705738067626953,
-            0.2951444387435913,
-            -0.2786717116832733,
-            0.1623944491147995,
-            1.876228928565979,
-            2.0320186614990234,
-            -1.2968171834945679,
-            0.02252490259706974,
-            0.05535395070910454,
-            -0.3752306401729584,
-            -0.09969408065080643,
-            -0.30922645330429077,
-            -2.1968472003936768,
-            0.8351921439170837,
-            0.5729058384895325,
-            -0.2831708788871765,
-            -0.3926834464073181,
-            0.011005071923136711,
-            0.3446352183818817,
-            1.64761221408844,
-            0.5421038866043091,
-            0.5799265503883362,
-            -0.06286028772592545,
-            -0.10191894322633743,
-            1.4040147066116333,
-            0.6939876675605774,
-            1.3740532398223877,
-            -1.0983102321624756,
-            -1.7715034484863281,
-            -0.13252311944961548,
-            0.38127124309539795,
-            0.8187776207923889,
-            1.8394445180892944,
-            5.42216157913208,
-            2.2420454025268555,
-            -0.2007027268409729,
-            0.06390730291604996,
-            -0.030575091019272804,
-            1.477237343788147,
-            1.4099476337432861,
-            3.1499860286712646,
-            2.6597752571105957,
-            2.551103115081787,
-            0.11715561896562576,
-            0.004973228555172682,
-            0.24357712268829346,
-            -0.44464626908302307,
-            1.7407596111297607,
-            0.2024913728237152,
-            1.0347373485565186,
-            1.171640396118164,
-            0.35951703786849976,
-            1.012884259223938,
-            1.0628200769424438,
-            1.020992636680603,
-            -0.16757702827453613,
-            0.3863142430782318,
-            -0.1811733990907669,
-            1.8422627449035645,
-            2.0796306133270264,
-            2.3672308921813965,
-            3.480699062347412,
-            1.2501533031463623,
-            -0.10483597964048386,
-            0.48143938183784485,
-            0.17075002193450928,
-            -0.1418180912733078,
-            -0.0637996718287468,
-            0.8479974269866943,
-            1.2868387699127197,
-            0.55659019947052,
-            0.24347823858261108,
-            0.43451955914497375,
-            -0.126787930727005,
-            -0.2479192018508911,
-            -0.9582428932189941,
-            -1.55134117603302,
-            -0.16599491238594055,
-            0.35724273324012756,
-            1.2325026988983154,
-            0.9631463289260864,
-            0.8290613889694214,
-            0.7751209139823914,
-            -0.261861652135849,
-            0.2805097997188568,
-            0.23304611444473267,
-            0.31778857111930847,
-            0.23650699853897095,
-            0.584425687789917,
-            0.4586963653564453,
-            -0.02162620984017849,
-            0.39847680926322937,
-            0.043092500418424606,
-            0.128230482339859,
-            0.01787741668522358,
-            0.8101254105567932,
-            -1.4040553569793701,
-            1.3414219617843628,
-            1.3090379238128662,
-            1.6087018251419067,
-            1.671937346458435,
-            1.7519333362579346,
-            1.1424206495285034,
-            0.555304765701294,
-            0.25786566734313965,
-            0.5001776218414307,
-            0.20491398870944977,
-            0.7151485681533813,
-            -0.7066358923912048,
-            1.4568674564361572,
-            1.4272027015686035,
-            0.8813208937644958,
-            0.28411900997161865,
-            0.5072972178459167,
-            0.37380558252334595,
-            0.5495695471763611,
-            0.5651929974555969,
-            2.824612617492676,
-            0.4088594913482666,
-            1.5967864990234375,
-            0.44687989354133606,
-            0.5358743071556091,
-            1.9135571718215942,
-            1.4786217212677002,
-            3.675992488861084,
-            -3.671088933944702,
-            -0.011886266991496086,
-            -0.08842145651578903,
-            0.0033416645601391792,
-            0.6426181197166443,
-            0.11107433587312698,
-            0.0630173534154892,
-            0.2750217914581299,
-            -0.13746726512908936,
-            0.004033843521028757,
-            0.47585251927375793,
-            0.04877825081348419,
-            1.1249183416366577,
-            0.3416192829608917,
-            1.2601404190063477,
-            0.002649485832080245,
-            0.3203100562095642,
-            0.17470534145832062,
-            -0.24430999159812927,
-            0.20120589435100555,
-            -0.7546929121017456,
-            0.49266257882118225,
-            1.025393009185791,
-            0.2036285102367401,
-            0.377365380525589,
-            0.19967320561408997,
-            0.3127455413341522,
-            4.059558391571045,
-            -0.0941566526889801,
-            0.49127820134162903,
-            -0.6363303661346436,
-            -0.006694926414638758,
-            -0.02098347246646881,
-            0.24323102831840515,
-            1.316899061203003,
-            0.6219516396522522,
-            0.9942449331283569,
-            0.10959109663963318,
-            0.06736819446086884,
-            0.052634675055742264,
-            0.421516478061676,
-            0.4905860424041748,
-            -0.743321418762207,
-            -0.02953682467341423,
-            -0.2281426638364792,
-            -0.4595281183719635,
-            0.29346340894699097,
-            0.8741024732589722,
-            1.3391971588134766,
-            -3.014162063598633,
-            -0.08154910802841187,
-            0.9591415524482727,
-            0.5613860487937927,
-            0.26083213090896606,
-            0.7421435713768005,
-            1.5485811233520508,
-            -0.7417886853218079,
-            0.028853394091129303,
-            0.4264606237411499,
-            1.8606548309326172,
-            0.6656578183174133,
-            -0.17395496368408203,
-            1.4217146635055542,
-            0.4058930277824402,
-            0.07399333268404007,
-            0.020003395155072212,
-            -0.49794402718544006,
-            0.31976622343063354,
-            1.0026005506515503,
-            0.9389200806617737,
-            -1.1597163677215576,
-            -0.4299622178077698,
-            -0.3169887363910675,
-            0.49859553575515747,
-            0.14642488956451416,
-            0.26305699348449707,
-            0.44198518991470337,
-            0.6342130899429321,
-            0.5130323767662048,
-            0.3339064419269562,
-            0.271659791469574,
-            -0.47806861996650696,
-            0.21386286616325378,
-            3.347207546234131,
-            1.296380877494812,
-            -0.5840708613395691,
-            0.2014036625623703,
-            0.19309751689434052,
-            0.0011662457836791873,
-            0.025738589465618134,
-            0.7541083693504333,
-            0.26543018221855164,
-            0.33069273829460144,
-            0.37647542357444763,
-            0.36594441533088684,
-            0.1290215402841568,
-            1.6019283533096313,
-            0.32802292704582214,
-            -0.08135134726762772,
-            0.06880199164152145,
-            -0.18290384113788605,
-            -0.14409239590168,
-            -0.16634100675582886,
-            -0.20080161094665527,
-            0.6000986099243164,
-            0.8414711952209473,
-            -0.4223482310771942,
-            -0.04600078985095024,
-            -0.2978549599647522,
-            0.18736231327056885,
-            0.24436818063259125,
-            0.8845840096473694,
-            -1.9530025720596313,
-            0.30508214235305786,
-            0.09643969684839249,
-            0.13564668595790863,
-            0.32995113730430603,
-            0.268545001745224,
-            -0.14087870717048645,
-            -0.6184819936752319,
-            0.036121271550655365,
-            0.20392516255378723,
-            0.023810377344489098,
-            0.12135813385248184,
-            -0.21914434432983398,
-            -0.281341552734375,
-            0.2528226375579834,
-            0.027469037100672722,
-            0.4763469398021698,
-            -0.2850990891456604,
-            0.18429695069789886,
-            2.056689739227295,
-            -0.24401333928108215,
-            0.5195586681365967,
-            0.7488675713539124,
-        ],
-        "predictions": [
-            635.42,
-            95.03,
-            104.1,
-            136.77,
-            130.9,
+            120,
+            979,
+            762,
+            155,
+            126,
+            1001,
+            253,
+            2301,
+            424,
+            2172,
+            87,
+            1051,
+            217,
+            1935,
+            179,
+            1455,
+            907,
+            690,
+            255,
+            148,
+            875,
+            982,
+            854,
+            845,
+            1318,
+            639,
+            321,
+            244,
+            559,
+            1401,
+            691,
+            975,
+            1710,
+            143,
+            964,
+            257,
+            735,
+            713,
+            891,
+            86,
+            846,
+            880,
+            221,
+            775,
+            46,
+            1059,
+            1008,
+            42,
+            1524,
+            75,
+            855,
+            1499,
+            330,
+            867,
+            106,
+            1023,
+            949,
+            1026,
+            1045,
+            2229,
+            755,
+            2166,
+            1325,
+            229,
+            2132,
+            670,
+            74,
+            1920,
+            764,
+            307,
+            247,
+            1899,
+            166,
+            362,
+            486,
+            419,
+            181,
+            601,
+            874,
+            1138,
+            64,
+            96,
+            892,
+            673,
+            282,
+            41,
+            502,
+            93,
+            1017,
+            1060,
+            2557,
+            247,
+            642,
+            1029,
+            763,
+            615,
+            284,
+            2235,
+            795,
+            2855,
+            190,
+            253,
+            208,
+            1521,
+            404,
+            1467,
+            1559,
+            251,
+            606,
+            2153,
+            123,
+            1319,
+            61,
+            518,
+            1353,
+            317,
+            1729,
+            240,
+            196,
+            199,
+            108,
+            304,
+            121,
+            989,
+            616,
+            305,
+            326,
+            2704,
+            1544,
+            1259,
+            178,
+            413,
+            2562,
+            315,
+            410,
+            745,
+            217,
+            729,
+            969,
+            449,
+            551,
+            1246,
+            555,
+            203,
+            595,
+            120,
+            173,
+            846,
+            547,
+            174,
+            342,
+            653,
+            1058,
+            1052,
+            254,
+            1070,
+            812,
+            172,
+            233,
+            3065,
+            275,
+            1633,
+            1435,
+            409,
+            695,
+            1038,
+            692,
+            699,
+            1252,
+            728,
+            1032,
+            688,
+            754,
+            269,
+            1914,
+            568,
+            195,
+            456,
+            438,
+            167,
+            471,
+            599,
+            2613,
+            1156,
+            135,
+            738,
+            1743,
+            2135,
+            94,
+            548,
+            491,
+            3283,
+            502,
+            290,
+            1027,
+            898,
+            145,
+            954,
+            1532,
+            2352,
+            2806,
+            562,
+            653,
+            699,
+            123,
+            1128,
+            2001,
+            834,
+            783,
+            787,
+            797,
+            203,
+            884,
+            2355,
+            664,
+            81,
+            560,
+            72,
+            571,
+            1050,
+            1619,
+            25,
+            118,
+            788,
+            768,
+            38,
+            2544,
+            2224,
+            563,
+            371,
+            214,
+            752,
+            676,
+            902,
+            2795,
+            92,
+            665,
+            1182,
+            3252,
+            989,
+            1054,
+            766,
+            1088,
+        ],
+        "regression_line": {
+            "coefficient": 0.8744120989397959,
+            "intercept": 117.4291978818668,
+        },
+    },
+}
+
+test_model_quality_metrics_nulls_res = {
+    "mae": 125.10728395061736,
+    "mape": 35.20983108087226,
+    "mse": 40967.56920781895,
+    "rmse": 202.40446933755922,
+    "r2": 0.9130200184348738,
+    "adj_r2": 0.9116855975182541,
+    "variance": 393588.5412923579,
+    "residuals": {
+        "ks": {"p_value": 1.6576962025283137e-11, "statistic": 0.5712276152109744},
+        "correlation_coefficient": 0.9565968949984525,
+        "histogram": {
+            "buckets": [
+                -924.81,
+                -671.1419999999999,
+                -417.474,
+                -163.80600000000004,
+                89.86199999999997,
+                343.53,
+                597.1979999999999,
+                850.866,
+                1104.5339999999999,
+                1358.2019999999998,
+                1611.87,
+            ],
+            "values": [5, 14, 73, 502, 105, 21, 6, 2, 1],
+        },
+        "standardized_residuals": [
+            1.0128843028211345,
+            -1.406230822544367,
+            -0.18245887578381814,
+            -0.6263926310344227,
+            0.39417542508351705,
+            -0.10720916250935315,
+            -0.16386893347685447,
+            -0.10429212368990916,
+            0.06543998253298013,
+            0.20120589097692287,
+            -1.2520232958012292,
+            1.2501532739145367,
+            0.7578658921314563,
+            -0.531514707398616,
+            0.08694696365938775,
+            -0.7268079842935805,
+            -0.9815297469677221,
+            -0.41770075210438606,
+            0.5130323966418704,
+            -0.6098792248362157,
+            2.030436437447784,
+            0.022524902952010897,
+            -1.3847732827538821,
+            -0.14409239910774393,
+            1.8394445567781015,
+            -0.8229219413274573,
+            0.8741024728859024,
+            -0.8208948465546232,
+            0.23739694887239451,
+            0.421516483848812,
+            0.023810377686003026,
+            -1.5385852788096386,
+            -0.0772477129401506,
+            -0.5388814664511097,
+            0.028853393950126077,
+            -0.10172117422192503,
+            0.6651139459403299,
+            -0.07561614885469936,
+            -0.2281426701764631,
+            1.0253929608095973,
+            -1.4272433903115473,
+            -0.5164845412780918,
+            -0.15229966087092472,
+            0.676238246522954,
+            -0.42353482974327333,
+            -0.6390001716947308,
+            0.021832724249091925,
+            0.1996732095633171,
+            0.1707500280484931,
+            -0.04703905669133489,
+            -2.3231203972322456,
+            -0.01589101505998609,
+            -0.006694926578349497,
+            -0.035024812062100175,
+            0.032264846128797604,
+            0.4586963684627405,
+            -0.18290384780712302,
+            1.2729951711108585,
+            0.5785421667395482,
+            -0.4792552153282411,
+            1.171640432469168,
+            0.6656578006354794,
+            -0.14132368429606848,
+            0.1536927671551352,
+            -0.6233272682072107,
+            -0.4734705790252771,
+            -0.37676332596032747,
+            -0.122486535309491,
+            0.1955695786817265,
+            -0.7060920645419374,
+            0.5174326755389976,
+            -0.21914434703851765,
+            -0.5121831450528106,
+            -1.5075361198501342,
+            0.5358742938381932,
+            -0.08184575718096908,
+            1.3090379049985619,
+            -0.5126281170761154,
+            -1.5763584594546387,
+            -0.2701183643748999,
+            -1.702087776706258,
+            2.0320185601973138,
+            -0.4869186223962723,
+            0.7541083506013254,
+            -1.003827789468894,
+            -0.20124658343447277,
+            -0.6533381591123352,
+            0.039730487853137,
+            1.4568674994076622,
+            -0.25464322623107105,
+            -0.9238811492817661,
+            0.07399333364762044,
+            0.06974137875826221,
+            -1.0430842101915778,
+            0.5062589336204504,
+            -0.3785432140535472,
+            -0.17800915555076843,
+            0.07933299792728016,
+            -0.010353585436635239,
+            0.5651435647044757,
+            0.5799265241453864,
+            1.6087018420265067,
+            1.3433996334648914,
+            0.29346342380882257,
+            -0.2351633398774971,
+            1.0161474309920389,
+            -1.927144737826734,
+            -0.11615804431137582,
+            0.03320423151133033,
+            -0.7001591042312046,
+            -0.25058903668540317,
+            -0.09138793501406486,
+            0.6470678583285157,
+            0.055353950004734025,
+            2.3672308177537342,
+            0.18736231691854557,
+            -0.021527327355182545,
+            0.17470533492231494,
+            2.079630566690947,
+            0.3738055946833339,
+            1.2963809230023315,
+            -0.36445243331555593,
+            0.20362851643713895,
+            1.6719373106717375,
+            -0.20070272873932216,
+            1.0026005049491975,
+            -2.1479497440578514,
+            -1.960616522246453,
+            -0.8962928838368563,
+            0.6916145019949361,
+            1.876228910704647,
+            0.027469036544288346,
+            0.13080142862289,
+            -0.2008016114111679,
+            -0.7536546296996484,
+            0.9389200642806611,
+            -1.93990060249481,
+            -0.9932967849173422,
+            0.5001776493019489,
+            0.20249136571091503,
+            0.14518885737641776,
+            -0.16634100027299326,
+            -0.8352328339722286,
+            0.2716597946668785,
+            0.565193006040399,
+            -0.9582428777480945,
+            -0.17390552466917783,
+            -0.06206922281185879,
+            -0.12535413279301164,
+            0.24347823319089604,
+            -0.19140775758584044,
+            -0.16169351469625204,
+            0.4088595018525805,
+            0.5729058544443518,
+            -1.7379821865861933,
+            0.04309249869588551,
+            -0.5073378941323784,
+            0.6000985892018785,
+            -0.11902564179489646,
+            0.35724274714920334,
+            -0.32415774453849383,
+            0.08516707556616775,
+            0.4377332420314829,
+            0.1121126036440807,
+            0.3595170486016512,
+            0.9942449191782482,
+            0.03513244361231867,
+            -3.6908655141999183,
+            -3.2162286893412695,
+            0.34161928499760574,
+            0.007890267518869124,
+            -0.004470066461824849,
+            -1.4190855698842888,
+            -0.057125089219581135,
+            0.004973228699425118,
+            -0.4076147195761394,
+            1.6476121733977314,
+            -0.4595281222950541,
+            0.1043997552401275,
+            -0.24430998702321075,
+            1.142420602938807,
+            1.477237329807846,
+            -0.04115553771652443,
+            -0.03176168389119712,
+            -2.6241192503301054,
+            -0.35950829972327863,
+            -1.5968271725266678,
+            0.8414711911768707,
+            -0.267844062922452,
+            0.12565952968692148,
+            -0.6529920697608761,
+            0.29514442923019707,
+            -0.13049603172898072,
+            0.5195586529836768,
+            -0.30764433834028637,
+            -0.8631177474326736,
+            -1.0983101824173183,
+            -0.23847590938432345,
+            -0.8419074143218029,
+            0.19314695322150988,
+            -0.15116251014470078,
+            -0.42383147775880975,
+            -0.04283654313789897,
+            -0.3598049477388153,
+            -0.9078621564427861,
+            0.23304611131119027,
+            0.046850040226016576,
+            -0.13212759581443195,
+            -0.21593066020353735,
+            -0.46402728386402653,
+            0.004033843316892669,
+            -0.13746726009409196,
+            0.017877417375269693,
+            -0.2887577480177863,
+            -0.006497161234658573,
+            1.0807178157071833,
+            -0.6184820172867784,
+            -0.27056333639820473,
+            1.4272026978539967,
+            -0.24752367385819107,
+            0.7563332107178505,
+            -0.478068623266095,
+            -0.2831708770585127,
+            0.05481009530958342,
+            1.5485811775444114,
+            0.30191789225161686,
+            0.11231036898777176,
+            -0.8399792022208147,
+            -0.4482554977046613,
+            0.037307862392920374,
+            -0.9058845030058752,
+            -0.5829336967583029,
+            -0.05415860906421461,
+            0.32995112971983115,
+            -0.7549401044336406,
+            0.5565902135898354,
+            8.022231937928995,
+            -0.39268343612746115,
+            -0.37300578443019683,
+            0.7421435473080138,
+            0.6342131109885939,
+            0.24614806533072606,
+            -0.2588951811204293,
+            0.5613860231743454,
+            0.47585251202794276,
+            0.020003394819949373,
+            -0.1418180976552962,
+            -0.49794404030705086,
+            -0.31501109739278016,
+            -0.23956361877462437,
+            -0.4880063317865735,
+            -0.704856031143868,
+            -0.30922646108981544,
+            -0.4296161140617743,
+            -0.15487061033890898,
+            -1.296817146147264,
+            0.5738452398268848,
+            -0.42279320970443185,
+            0.3203100692148902,
+            2.056689786822779,
+            0.18859835031661498,
+            1.3391971199114547,
+            -0.17672368081677603,
+            0.1283293618267512,
+            1.8422627129257,
+            -0.10918681594626416,
+            3.6759924209655366,
+            -0.06553011632645304,
+            -0.7597359140181493,
+            0.07695981380298711,
+            0.15487935921728188,
+            0.10034556569446006,
+            -0.19605524316258144,
+            0.009225183588783912,
+            3.660368958813938,
+            -0.10483597838505976,
+            -0.09415664982574032,
+            -4.519452862929719,
+            0.23685309417724448,
+            -0.35065830059310166,
+            -3.3497697376686872,
+            -0.9456847784237096,
+            0.01268607710337838,
+            0.04877825232700519,
+            -0.15185468884761988,
+            0.06390730111937434,
+            -0.05178542493992113,
+            0.06736819463396831,
+            0.3984768213087986,
+            -0.3472468484144304,
+            -1.1264917438933006,
+            0.06301735707276405,
+            -0.4060820381625342,
+            -0.1561560850729011,
+            1.1249183700221446,
+            -1.238921341781693,
+            -2.649927627681794,
+            0.008434122214019655,
+            -1.9095930635741487,
+            0.36594442227161184,
+            -0.2481169698892644,
+            0.11107433558970237,
+            -0.1729661392866451,
+            0.007692502175178024,
+            -0.18117340104982602,
+            -0.9053406483107246,
+            0.16531148109698757,
+            0.3551167697045242,
+            0.310372360694412,
+            1.059507482596312,
+            -0.6397912330694945,
+            -0.5840708474845262,
+            1.409947671616948,
+            0.07878914323212984,
+            -0.021626210027027727,
+            -0.4154264506519382,
+            -0.6363303395549008,
+            -0.9834085177327869,
+            -0.8744892546949123,
+            -0.9452398064004044,
+            0.20966035941971747,
+            0.12902154052967,
+            0.033500879526867,
+            0.006505910113031464,
+            0.4419851969208417,
+            -0.06286028418662298,
+            0.43451955519650204,
+            -1.5705738231516735,
+            0.33390643659365327,
+            -0.39802310040712086,
+            -0.14799826464564328,
+            2.242045355197266,
+            0.28411901131941797,
+            -0.04600078863695656,
+            -0.011886266850240742,
+            -0.11205441342978521,
+            0.20491399117113107,
+            -1.1277277772913703,
+            0.8290614158602541,
+            0.0033416646139738737,
+            -0.1668848549681437,
+            0.32075504123819504,
+            -0.8976277999067712,
+            -0.6149222411003389,
+            -0.3438848375716813,
+            0.022524902952010758,
+            0.5743890945220342,
+            0.0012156871692941957,
+            -0.13252312650181436,
+            -0.8497191453976017,
+            -0.18240943444789542,
+            1.0628200521031383,
+            0.022376578944242425,
+            -0.2770401514040884,
+            -0.04214436443498003,
+            0.04170814129004792,
+            -0.2317024463629031,
+            0.3306927497586729,
+            -0.01767090315320588,
+            -0.44464628018229857,
+            -0.371275337672899,
+            0.29573772526126985,
+            -0.7066359192370886,
+            -2.4335229003478047,
+            -0.12228876996580007,
+            0.1930975118855877,
+            -1.7778813446758732,
+            -1.6166531482317015,
+            0.26083214209979033,
+            -0.8465054585626214,
+            -0.6032540858225637,
+            -0.030031237133899852,
+            0.011005071682003912,
+            -0.04708849802725776,
+            5.224890592754258,
+            0.9839116799703879,
+            0.28050979379705526,
+            0.2435771158627415,
+            0.09906009096046807,
+            -3.366283143866894,
+            -0.12392033405125132,
+            -0.2564725556602138,
+            0.4814393829872164,
+            1.143953284352414,
+            0.8479974475186769,
+            -0.06780441777890071,
+            0.0964397001565608,
+            0.15324779513183034,
+            -0.08812480684316153,
+            0.49266256624168697,
+            -0.10854407857926794,
+            -0.30813875169951427,
+            3.4806991440705715,
+            0.6939876861192307,
+            0.2630570022163155,
+            -0.1710379271856569,
+            -0.31698875082969125,
+            -0.7546928977540257,
+            -0.24791920454557348,
+            0.4058930216972144,
+            0.028952276621971678,
+            0.10959109551201932,
+            1.341421980027981,
+            0.31778856108282866,
+            -0.403313323350858,
+            -0.011886266850241233,
+            -0.3476423791018122,
+            0.44687988917719657,
+            -0.27867171548953995,
+            0.0831399807933341,
+            5.422161523086134,
+            -0.017720344489128823,
+            0.0009190391537576695,
+            0.13564667954332213,
+            0.25860728198326577,
+            0.09540143210218247,
+            -0.4114711437781158,
+            0.5063083749563729,
+            -0.6848322900951438,
+            -0.6543269858307909,
+            1.2325027169901048,
+            -2.5364597617390237,
+            0.04249920266481218,
+            0.8845840361015315,
+            -0.6571945833143121,
+            0.4985955265524198,
+            0.305082137750675,
+            -0.0249882208697768,
+            0.02910060062974001,
+            0.2528226456803009,
+            0.10276819115467604,
+            -0.043232073825281096,
+            0.7488675689935114,
+            0.38127123640767246,
+            -0.34675243505520237,
+            -0.19521474045189424,
+            0.17440868690677855,
+            -3.6710889798308077,
+            -1.159716321633406,
+            -0.05633402784481673,
+            -2.196847225285476,
+            -0.3813119288652229,
+            1.9135571193263432,
+            0.49127820883584883,
+            0.21846091721397157,
+            0.7751209183685052,
+            -0.06014101071087053,
+            -0.2618616612757965,
+            0.4264606174410896,
+            0.15250617509298853,
+            1.740759650276242,
+            1.6019283790050864,
+            -1.1673302873655136,
+            0.21386287297315323,
+            0.07869026056028423,
+            0.6519625505848708,
+            0.8497278942759744,
+            -0.3752306445467214,
+            0.37855196293192006,
+            1.3740532617370127,
+            0.6882524911521882,
+            -2.940395476228102,
+            -1.2542481559177543,
+            0.4763469253871706,
+            2.520548400450262,
+            0.9631463188828218,
+            0.34463520648889573,
+            -2.6662927098722333,
+            -0.17395496600510055,
+            -0.48311163953021863,
+            -0.09781530868402571,
+            -0.46620270264462893,
+            -0.9040057322408095,
+            -0.12678793153477252,
+            0.24436817723750634,
+            -0.16910971508466843,
+            -0.24411222167951968,
+            0.20545784586628169,
+            -1.93312713947339,
+            -0.7433213904917886,
+            1.9848515257269859,
+            -2.4409885420721436,
+            0.2681000184804385,
+            -1.7013461566674166,
+            -0.24401333900767408,
+            -0.06765609377113245,
+            2.659775202408801,
+            -0.06681559106044524,
+            -0.9696143850103327,
+            1.034737373299002,
+            3.3472075370790755,
+            0.04843216297554537,
+            0.2365070048257848,
+            -0.4512714191959507,
+            0.32456202410424895,
+            0.8813209079306279,
+            0.3813701190795185,
+            -1.0329981776633317,
+            0.05406847527074182,
+            0.025738589786991218,
+            0.1623944422775437,
+            -0.42234823768112667,
+            -0.28509908915950083,
+            0.2879754355213944,
+            0.06880199337572891,
+            -1.7937025721711617,
+            0.1374760089724647,
+            -0.46298901580964863,
+            -0.6566507286191616,
+            2.824612616375334,
+            -0.5032837045867108,
+            0.4678430156084536,
+            0.38631425267179553,
+            -0.12708457955030905,
+            1.8606548898889728,
+            -0.2247806593337142,
+            -0.15511781701852306,
+            0.21020421411486806,
+            2.5511031460505396,
+            0.11280478234699963,
+            -0.20446027026945338,
+            -1.1186305714815796,
+            0.034687471589013384,
+            0.352249172221003,
+            0.37820587358046065,
+            0.9591415706730775,
+            -0.02306000876878861,
+            0.3197662145197396,
+            -0.8642054568229748,
+            0.04007657720459611,
+            -0.5502529737133479,
+            -0.5457043708084526,
+            -0.8601018259413845,
+            -0.49967448706434814,
+            3.149986048083122,
+            -0.2025814995043879,
+            -1.7715034123418352,
+            -0.18819407075086014,
+            -0.9155750048467388,
+            -0.26032897986219017,
+            0.05263467652898157,
+            -0.8817076897396375,
+            0.5553047388558444,
+            -0.06379966956915599,
+            0.32802291761884295,
+            0.5421039021644629,
+            0.08457377953509455,
+            -0.21420021344624007,
+            -0.2813415476293699,
+            -0.7469306080141502,
+            -0.5016521405012591,
+            -1.4040554037637651,
+            0.8101253842018307,
+            -0.6438454226151624,
+            -0.1954125057955853,
+            1.5967864800691178,
+            0.4891522313911697,
+            -0.5421445946220128,
+            -1.335381388167029,
+            0.12823047915490574,
+            -0.16757703367106208,
+            0.7549982946479357,
+            0.35714386447735785,
+            0.10776176608287658,
+            1.316899077410284,
+            -0.7417887090781806,
+            -0.019994645941576482,
+            -0.144290164451435,
+            1.421714709566568,
+            0.3764754268231634,
+            0.07854193655251562,
+            0.07720702048260077,
+            -0.0413038617242929,
+            -0.12238765263764526,
+            0.12135813346163966,
+            0.5844256857143588,
+            1.0905566415558152,
+            0.7692868407296178,
+            -0.030575091829050455,
+            1.096192953851012,
+            0.7151485778941786,
+            -0.028943527743598648,
+            0.26543018634060883,
+            -0.19007284151592546,
+            -0.08154910916543269,
+            2.2100568108552308,
+            -0.018808053879429815,
+            -0.3413633294396198,
+            0.2432310265112824,
+            -0.5791267138922489,
+            -0.4465744922832869,
+            -0.35990383041066076,
+            0.818777617988317,
+            -0.3364191958473422,
+            1.2868387451692367,
+            -0.5906959864981783,
+            -0.050846039557388686,
+            -2.2912307355620554,
+            1.4040147113062147,
+            -0.11076893869579302,
+            -0.02306000876878861,
+            0.09332489599342587,
+            -0.3997041058284954,
+            -0.3005247859674069,
+            -0.14087871227276377,
+            0.5252938479507187,
+            -0.2915759041653842,
+            0.2685449905037437,
+            0.1313452833180406,
+            -0.3844267330283575,
+            2.1659551392121146,
+            -0.22290188856864887,
+            0.4690790490065227,
+            -0.47564599780587896,
+            -0.10468765437729156,
+            0.6219516596797464,
+            0.8351921415146771,
+            0.010609540994621783,
+            -0.5675574412863195,
+            -1.5513411434777145,
+            -1.9530025565143458,
+            0.14642489077448728,
+            0.015603115922822174,
+            -0.35046053524941073,
+            -0.32484992324141276,
+            -0.4299622034132342,
+            -1.5990025913072703,
+            0.18429695409133345,
+            -0.29785495382757693,
+            0.5072972016748288,
+            -0.1453778738417362,
+            -0.47905744998455063,
+            0.18281371401365026,
+            0.2039251644526756,
+            0.17470533492231494,
+            -0.029536823774671983,
+            4.0595583050544315,
+            0.11908383200919208,
+            0.45879525113458514,
+            0.28219079921842977,
+            0.37736537086977334,
+            0.8158111378329498,
+            0.2014036563206138,
+            0.7739343263063585,
+            0.6383661832061072,
+            0.046751157554170975,
+            0.49058603013293006,
+            -0.12639240084739017,
+            -0.34912561917949586,
+            -2.314665928789451,
+            -0.16599491092153357,
+            0.03177043276957001,
+            0.6906256752764816,
+            0.018569596078188488,
+            -0.22334686059195372,
+            -0.2390692054153962,
+            0.03612127033077413,
+            -0.23901976407947348,
+            0.22147683870526097,
+            -0.0113424121550907,
+            -0.7615158021113694,
+            0.642618138095466,
+            1.478621687213683,
+            -0.30986919845681155,
+            1.7519333921947886,
+            -0.5825381660709205,
+            -0.264580934751549,
+            0.07132350150779072,
+            0.07206512154663225,
+            -0.08135134382174149,
+            -0.07947257305667575,
+            0.2328483459674999,
+            0.11705673723635829,
+            -0.07383626076147937,
+            2.4096020426395532,
+            0.17238159213394433,
+            -0.04145218573206138,
+            0.14538662272010883,
+            -0.09969407944909124,
+            -0.8656392555647351,
+            -0.23822870270470922,
+            0.3174919130672917,
+            0.07157070818740445,
+            0.549569543888802,
+            0.35388073630645484,
+            -0.4450912522056037,
+            -0.10191893956561639,
+            -1.0681015261685025,
+            -0.486325326365199,
+            -0.11937173114635614,
+            -0.05930050800018354,
+            -0.3453680776493644,
+            -0.1320287131425865,
+            0.3488871613782545,
+            -0.5024926432119465,
+            -0.4657577306213238,
+            -0.0041239771103654165,
+            -0.025581516900850136,
+            -0.36450187465147893,
+            0.8025608598056455,
+            -0.10147396754231124,
+            0.2578656619444231,
+            0.31274554481870503,
+            0.0026494859110545166,
+            -0.13563793066494922,
+            0.07557545639714895,
+            -0.058657770633187195,
+            -0.07012816056727117,
+            0.26513353832507214,
+            -0.0780387743149143,
+            -0.020983472660032226,
+            1.2601404237709373,
+            -0.13909882417954347,
+            -0.556878112727,
+            1.8838923177726772,
+            -1.9497888696793655,
+            0.11715561990820389,
+            -1.1942263741075039,
+            0.33168157647712837,
+            0.0011662458333714647,
+            0.16145505689501125,
+            -0.1007817888393923,
+            0.4211703944973529,
+            -0.08842145485869791,
+            -0.9989330972125391,
+            -3.0141619494248837,
+            1.0209926819124708,
+            -0.5008610791264948,
+            0.2750218055096276,
+        ],
+        "predictions": [
+            843.84,
+            781.13,
+            371.61,
+            406.4,
+            421.98,
             100.39,
-            161.6,
-            52.61,
-            54.54,
-            34.11,
-            46.14,
-            68.29,
-            257.48,
-            253.11,
-            132.76,
-            152.52,
-            158.84,
-            116.11,
-            76.25,
-            207.3,
-            171.66,
-            75.92,
-            167.34,
-            43.15,
-            46.09,
-            170.72,
-            142.45,
-            196.17,
-            49.55,
-            182.08,
-            95.26,
-            74.92,
-            180.28,
-            201.03,
-            366.02,
-            186.74,
-            84.22,
-            59.29,
-            70.96,
-            135.62,
-            254.52,
-            561.73,
-            421.74,
-            220.26,
-            222.85,
-            335.41,
-            984.07,
-            1055.73,
-            477.84,
-            283.46,
-            65.41,
-            148.39,
-            132.79,
-            254.06,
-            432.56,
-            753.05,
-            117.27,
-            161.42,
-            253.87,
-            145.57,
-            193.62,
-            702.21,
-            588.13,
-            216.56,
-            310.66,
-            181.41,
-            449.07,
-            266.37,
-            828.91,
-            977.09,
-            343.25,
-            254.91,
-            289.19,
-            384.92,
-            1575.57,
-            1630.82,
-            1128.02,
-            295.64,
-            511.68,
-            217.51,
-            169.93,
-            269.15,
-            773.12,
-            466.77,
-            295.03,
-            372.79,
-            218.23,
-            172.12,
-            302.14,
-            755.73,
-            1508.42,
-            821.83,
-            232.43,
-            448.77,
-            561.67,
-            268.22,
+            766.85,
+            804.8,
             876.47,
-            1234.71,
-            830.84,
-            590.68,
-            223.75,
-            863.12,
-            1191.99,
-            483.23,
-            1521.61,
-            712.41,
-            493.43,
-            806.82,
-            771.0,
-            253.27,
-            1358.4,
-            2083.5,
-            762.59,
-            723.88,
-            549.27,
-            585.78,
+            1015.01,
+            1075.94,
+            2391.85,
+            1508.42,
+            227.21,
+            172.12,
+            312.71,
+            1006.23,
+            850.19,
+            284.94,
+            254.06,
+            2665.03,
+            483.15,
+            770.79,
+            237.85,
+            1159.66,
             1055.15,
-            2072.64,
-            1418.8,
+            1349.91,
+            846.74,
             809.69,
-            712.07,
-            236.3,
-            678.22,
-            926.66,
-            1927.62,
-            2325.81,
-            701.43,
-            758.88,
-            643.15,
-            712.79,
-            585.69,
-            1113.61,
-            1553.64,
-            804.8,
-            617.46,
-            520.75,
-            754.03,
-            963.03,
-            2243.29,
-            1785.61,
-            681.7,
-            685.78,
-            799.06,
-            777.09,
-            922.41,
-            2112.77,
-            2160.18,
-            1785.96,
-            736.36,
+            970.45,
+            338.89,
+            1108.9,
+            1961.33,
             632.7,
-            832.37,
-            992.73,
-            2066.57,
-            2226.46,
-            892.64,
-            875.34,
-            712.06,
-            647.42,
-            896.59,
-            1882.27,
-            1945.87,
-            897.85,
-            800.38,
-            1015.81,
-            603.27,
-            912.15,
-            1893.15,
-            1936.73,
-            803.35,
-            780.95,
-            825.37,
-            724.05,
-            993.89,
-            2470.23,
-            2045.5,
-            894.11,
-            786.38,
-            892.91,
-            1023.28,
-            1309.07,
-            2230.49,
-            2277.42,
-            2665.03,
-            971.14,
-            815.88,
-            975.68,
-            835.05,
-            2080.84,
-            1847.56,
-            766.85,
-            696.78,
-            876.53,
-            910.7,
-            1234.08,
+            764.87,
+            212.28,
             2294.18,
-            2103.6,
-            844.99,
-            817.34,
-            838.33,
-            669.41,
-            932.3,
-            1251.39,
+            771.0,
+            371.85,
+            921.31,
             1349.38,
-            708.93,
-            763.0,
-            850.19,
-            712.47,
-            846.74,
-            2004.15,
-            1931.26,
-            808.75,
-            817.56,
-            1013.68,
-            803.28,
-            1064.28,
-            1524.16,
-            1407.41,
-            839.89,
-            869.8,
-            878.82,
-            1075.94,
-            1159.42,
-            1667.4,
-            1550.75,
-            797.26,
-            790.11,
-            811.63,
-            751.17,
-            1006.23,
-            1956.29,
-            1412.14,
-            914.63,
-            1187.05,
+            545.17,
+            445.51,
             822.93,
-            772.69,
-            880.5,
-            627.7,
-            1557.85,
-            924.89,
-            898.34,
-            1084.94,
-            840.57,
-            937.58,
-            1961.33,
-            2300.33,
-            1993.22,
+            832.37,
+            2038.95,
+            59.29,
+            1024.32,
+            848.17,
+            84.22,
+            1484.58,
+            74.92,
+            800.06,
+            712.79,
+            231.18,
+            2272.93,
+            170.7,
+            2548.23,
+            585.69,
+            2072.64,
+            741.73,
+            884.07,
             243.29,
-            356.8,
-            345.26,
-            518.37,
-            1931.92,
+            193.62,
+            243.78,
+            712.47,
+            404.91,
+            257.48,
+            486.15,
             1786.52,
-            796.91,
+            1187.05,
+            276.03,
+            207.3,
+            1927.62,
+            1100.32,
+            256.26,
+            880.94,
             815.39,
-            727.56,
-            529.98,
-            872.18,
-            1613.64,
-            1538.28,
-            873.57,
-            458.23,
-            478.13,
-            501.49,
-            363.0,
-            1630.17,
-            1729.5,
-            539.11,
-            483.15,
-            511.23,
-            722.68,
-            982.32,
-            770.79,
-            696.94,
-            323.48,
-            521.44,
-            617.89,
-            614.37,
-            1142.93,
-            2245.46,
-            2291.53,
-            1914.49,
-            704.1,
-            236.23,
-            474.67,
-            657.61,
-            2038.95,
-            1888.11,
-            728.37,
-            684.6,
-            253.62,
-            543.93,
-            877.89,
-            2104.43,
-            1728.19,
-            674.43,
-            651.48,
-            445.51,
             569.54,
-            371.83,
-            248.99,
-            766.59,
-            422.77,
-            422.8,
-            403.37,
-            404.91,
-            551.32,
-            1105.64,
-            897.06,
-            357.14,
-            401.64,
-            344.89,
-            332.78,
-            536.43,
-            1123.38,
-            1484.58,
-            782.58,
-            675.74,
-            219.42,
-            222.5,
-            290.69,
-            1028.8,
-            1108.9,
-            235.06,
-            262.55,
-            225.32,
-            798.55,
+            817.34,
+            450.97,
+            2140.71,
+            1728.19,
+            1171.18,
+            421.74,
+            922.41,
+            1557.85,
+            999.67,
+            1044.04,
+            702.21,
+            2066.57,
+            825.74,
             1091.6,
-            1182.57,
-            1312.91,
-            607.82,
-            450.97,
-            310.0,
-            282.73,
+            975.68,
+            890.31,
+            761.27,
+            1234.71,
+            310.66,
+            422.8,
+            1358.4,
+            901.41,
+            825.33,
+            1396.99,
+            842.35,
+            603.27,
+            2160.18,
+            1914.49,
+            1104.2,
+            844.99,
+            982.32,
+            234.39,
             297.19,
             585.83,
-            795.78,
-            252.06,
-            186.08,
-            121.49,
+            517.51,
+            1094.91,
+            312.81,
+            235.06,
+            614.37,
+            770.08,
+            1198.1,
+            2038.5,
+            647.42,
+            1039.52,
+            1055.54,
+            681.3,
+            989.92,
+            2004.15,
+            1931.26,
+            248.99,
+            2077.82,
+            971.22,
+            179.15,
+            343.25,
+            413.32,
+            1412.14,
+            2463.8,
+            449.07,
+            1113.61,
+            949.54,
+            2463.75,
+            167.34,
+            287.35,
+            1613.64,
+            281.76,
+            961.39,
+            1659.52,
+            723.88,
+            95.26,
+            712.06,
+            1038.46,
             199.42,
-            275.28,
-            489.99,
-            294.91,
-            195.06,
-            335.6,
-            223.3,
-            212.28,
-            298.36,
-            295.99,
-            258.84,
-            320.89,
-            294.75,
-            243.78,
-            286.16,
-            824.22,
-            312.71,
-            394.21,
-            545.17,
-            252.22,
-            249.79,
-            255.23,
-            421.98,
-            926.29,
-            724.14,
-            445.98,
-            80.83,
-            91.23,
-            195.88,
-            342.46,
-            1104.2,
-            851.25,
-            121.37,
-            234.39,
-            136.46,
-            265.13,
-            174.91,
-            271.88,
-            237.63,
+            712.41,
+            2110.01,
+            559.83,
+            483.23,
+            922.99,
+            225.32,
+            840.33,
+            696.78,
+            990.45,
+            253.27,
+            323.48,
+            540.17,
             205.03,
-            169.08,
-            227.21,
-            107.27,
-            114.77,
-            97.49,
-            104.3,
+            964.99,
+            810.61,
             148.6,
-            373.21,
-            255.99,
-            285.42,
-            406.4,
-            754.38,
-            579.18,
-            141.88,
-            371.61,
-            493.04,
-            194.82,
-            289.86,
-            363.71,
-            360.03,
+            1993.22,
+            824.22,
+            2293.61,
+            34.11,
+            52.61,
+            1936.73,
+            797.26,
+            754.7,
+            643.15,
+            2173.46,
+            831.65,
+            762.59,
+            671.12,
+            1038.64,
+            770.92,
+            754.03,
             223.13,
-            235.41,
-            122.11,
-            173.52,
-            231.18,
-            185.6,
-            113.64,
-            118.39,
-            181.45,
-            191.19,
-            124.36,
-            355.18,
-            958.34,
-            540.17,
-            449.93,
-            187.22,
-            339.83,
-            518.6,
-            373.84,
+            2226.46,
             400.42,
-            486.15,
-            281.53,
-            256.26,
-            186.08,
-            505.99,
-            337.55,
-            1068.01,
-            713.69,
-            190.89,
-            194.73,
-            400.3,
-            781.13,
-            540.93,
-            839.5,
-            1396.99,
-            796.4,
+            590.68,
+            732.51,
+            758.88,
+            2243.29,
+            332.78,
+            940.01,
+            704.1,
+            269.62,
+            543.93,
+            1538.28,
+            2404.85,
             820.94,
-            999.67,
-            909.46,
+            505.99,
+            1553.64,
+            1064.28,
+            536.43,
+            266.37,
             631.48,
-            2718.7,
-            2077.82,
-            890.31,
-            985.14,
-            1072.89,
-            1145.7,
-            1969.9,
-            1218.79,
-            1322.13,
-            733.47,
-            409.84,
-            761.27,
-            822.91,
-            707.77,
-            1910.25,
-            1300.92,
-            478.36,
-            1144.41,
-            983.52,
-            1063.02,
-            1379.62,
+            838.33,
+            917.57,
+            255.23,
+            701.43,
+            786.38,
+            1847.56,
+            944.89,
+            1027.51,
+            895.09,
+            790.11,
+            366.02,
+            773.12,
+            673.8,
+            232.43,
+            2067.04,
+            422.77,
+            755.73,
+            447.4,
+            720.98,
+            253.62,
+            1949.49,
+            1105.64,
+            489.99,
+            335.6,
+            518.37,
+            1524.16,
+            1142.93,
+            657.61,
+            171.66,
+            368.97,
+            1667.4,
+            1037.13,
             1640.13,
-            2239.0,
+            757.13,
+            1893.15,
+            920.6,
+            1083.43,
+            384.92,
+            1309.07,
+            677.16,
+            1091.46,
+            847.66,
+            817.39,
+            906.42,
+            219.42,
+            286.16,
+            1407.41,
+            1882.27,
+            1087.25,
+            2103.6,
+            360.03,
+            393.0,
+            295.64,
+            268.22,
+            812.92,
+            238.72,
+            216.56,
+            2770.84,
+            181.45,
+            520.75,
+            811.09,
+            132.79,
+            2094.2,
+            70.96,
+            825.37,
+            302.14,
+            754.38,
+            181.41,
+            124.36,
             913.84,
-            771.46,
-            439.08,
-            606.62,
-            1110.0,
-            2548.23,
-            2475.67,
+            478.36,
+            684.91,
+            2195.75,
+            2325.81,
+            869.8,
+            914.63,
+            2470.23,
+            445.98,
+            46.14,
+            1172.84,
+            285.42,
+            816.78,
+            579.18,
+            784.08,
+            1018.11,
+            696.94,
+            798.55,
+            1826.96,
+            2080.84,
+            1956.29,
+            1216.18,
+            926.29,
+            1013.68,
+            2239.0,
+            1084.94,
+            551.69,
+            320.89,
+            1313.24,
+            290.69,
+            43.15,
+            524.35,
+            806.82,
+            107.27,
+            271.88,
+            449.93,
+            1144.41,
+            1888.11,
+            1225.84,
+            1142.53,
+            466.77,
+            1935.08,
+            992.73,
+            510.41,
+            1785.61,
+            782.58,
+            877.89,
+            400.3,
+            939.61,
+            169.93,
+            148.39,
+            950.31,
+            761.42,
+            999.82,
             1526.37,
-            940.01,
-            414.07,
-            823.86,
-            971.22,
-            2140.71,
-            393.0,
+            409.17,
+            394.21,
+            113.64,
+            2261.23,
+            1186.24,
+            571.01,
+            1039.11,
+            403.37,
+            937.26,
+            356.8,
+            1209.02,
+            1104.03,
+            136.46,
+            339.83,
+            345.26,
+            182.08,
+            220.26,
             201.15,
-            517.51,
-            741.6,
-            505.87,
-            1087.25,
-            1575.04,
-            2070.78,
-            559.83,
-            720.98,
-            757.13,
-            772.48,
-            1010.0,
-            2173.46,
-            2036.06,
-            901.41,
-            761.42,
-            651.32,
-            752.73,
-            1189.34,
-            2354.79,
-            2404.85,
-            711.01,
+            2291.53,
+            2245.46,
             662.51,
-            924.59,
-            1087.1,
-            1159.66,
-            2324.02,
-            2261.23,
-            681.3,
-            816.78,
-            782.89,
-            770.92,
-            1142.53,
-            2228.59,
-            2755.74,
-            2051.72,
-            867.01,
-            754.7,
-            1061.44,
-            633.64,
-            2453.62,
-            2463.75,
-            872.42,
-            741.73,
-            964.99,
-            843.84,
+            873.57,
+            684.6,
             1283.74,
-            2512.2,
-            2268.6,
-            949.57,
-            524.35,
-            811.09,
-            770.08,
-            1094.91,
-            2269.7,
-            2391.85,
-            684.91,
+            355.18,
+            186.74,
+            236.23,
+            549.27,
+            840.57,
+            392.82,
+            275.28,
+            633.64,
+            1028.8,
+            1072.89,
+            1136.63,
+            1312.91,
+            521.44,
+            344.65,
+            932.3,
+            772.69,
+            791.95,
+            1931.92,
+            170.72,
+            585.78,
+            772.48,
+            458.23,
+            1300.92,
+            1145.7,
+            951.97,
+            1061.44,
+            561.67,
+            1575.57,
+            448.77,
+            937.58,
             881.33,
-            848.17,
-            817.39,
-            987.61,
+            2300.33,
             2496.19,
-            2301.43,
-            1037.13,
-            1038.46,
-            999.82,
-            957.35,
+            161.42,
+            273.2,
+            363.71,
+            281.53,
+            2481.06,
+            926.66,
+            295.03,
+            2269.7,
+            1189.34,
+            575.5,
+            223.3,
+            161.82,
+            1720.35,
             889.85,
-            1659.52,
-            1745.48,
-            948.28,
-            990.45,
+            2060.61,
+            222.85,
+            833.54,
+            2283.39,
+            921.43,
+            180.28,
+            122.11,
+            1128.02,
+            1048.32,
+            414.07,
+            839.89,
+            2324.02,
+            68.29,
+            173.52,
+            293.27,
+            796.4,
+            65.41,
+            540.93,
+            104.3,
+            252.22,
+            835.05,
             2323.42,
-            1220.9,
-            1209.02,
+            1055.73,
+            253.11,
+            984.79,
+            811.63,
+            328.86,
+            278.0,
+            132.76,
+            194.82,
+            367.57,
+            75.92,
+            142.45,
+            298.24,
+            924.59,
+            158.84,
+            191.19,
+            674.43,
+            1961.22,
+            1243.27,
+            104.1,
+            1575.04,
+            821.83,
+            961.67,
+            933.34,
+            254.52,
             1301.93,
+            253.87,
             1266.67,
-            951.97,
-            917.57,
-            921.43,
+            846.45,
+            289.86,
+            2453.62,
+            1289.7,
+            1015.81,
+            676.45,
+            249.79,
+            409.84,
+            477.84,
+            741.6,
+            985.14,
+            2354.79,
+            839.5,
+            2104.43,
+            1251.39,
+            354.36,
+            1969.9,
+            1220.9,
+            1010.0,
+            1191.99,
+            798.89,
+            1159.42,
+            97.49,
+            363.0,
+            262.55,
+            957.35,
+            310.28,
+            892.91,
+            186.08,
+            269.15,
+            627.7,
+            2176.05,
+            1910.25,
+            635.42,
+            651.48,
+            607.82,
+            219.06,
+            118.39,
+            2755.74,
+            187.22,
+            1630.82,
+            872.42,
+            1423.7,
+            174.91,
             994.87,
-            1403.5,
-            2272.93,
-            1935.08,
-            1018.11,
-            922.99,
-            783.77,
-            895.09,
-            593.85,
-            1558.69,
-            2283.39,
-            880.94,
-            825.33,
-            1055.54,
-            692.36,
-            1038.64,
-            2132.39,
-            2111.55,
-            949.54,
-            937.26,
-            940.06,
-            1136.63,
-            1044.04,
-            2067.04,
+            529.98,
+            897.06,
             1539.45,
-            1186.24,
-            1186.1,
-            1198.1,
-            1095.55,
-            961.39,
+            1182.57,
+            892.64,
+            114.77,
+            489.5,
+            823.86,
+            651.13,
+            77.37,
+            771.46,
+            333.79,
+            2083.5,
+            130.9,
+            803.35,
+            152.52,
             1686.4,
-            2110.01,
+            880.5,
+            1234.08,
+            949.57,
+            235.41,
+            613.37,
+            196.17,
+            169.08,
+            289.19,
+            2051.72,
+            190.89,
+            195.06,
+            1785.96,
+            713.69,
+            617.46,
+            373.21,
+            417.71,
+            121.37,
+            821.03,
+            1729.5,
+            518.6,
+            310.0,
+            186.08,
+            474.67,
+            2112.77,
+            2228.59,
+            511.68,
+            711.01,
+            136.77,
+            924.89,
+            736.36,
+            751.06,
+            493.04,
+            2132.39,
+            987.61,
+            476.36,
+            2036.06,
+            185.6,
+            963.03,
+            272.61,
+            795.78,
+            751.17,
+            1558.69,
+            593.85,
+            708.93,
+            218.23,
             894.74,
-            1048.32,
-            1100.32,
-            961.67,
-            1194.64,
-            2094.2,
-            1961.22,
-            1039.11,
-            1109.59,
-            1104.03,
-            1243.73,
-            1313.24,
-            1826.96,
-            1438.08,
-            1027.51,
-            944.89,
-            1091.46,
-            1172.84,
-            1216.18,
-            2293.61,
-            2368.83,
-            1975.17,
-            812.92,
+            707.77,
+            298.36,
+            1418.8,
+            783.77,
+            2268.6,
+            1110.0,
+            733.47,
+            822.91,
+            2256.35,
+            2240.74,
+            223.75,
+            344.89,
+            2529.15,
+            468.56,
+            878.82,
+            977.09,
+            252.06,
+            342.46,
+            300.16,
+            1403.5,
+            1322.13,
+            539.11,
+            782.89,
+            255.99,
+            940.06,
+            817.56,
+            879.02,
+            912.15,
+            901.2,
+            2718.7,
+            217.51,
+            808.75,
+            1211.51,
+            373.84,
+            201.03,
+            222.5,
+            1087.1,
+            294.75,
+            2301.43,
+            872.18,
+            295.99,
+            588.13,
+            752.73,
+            116.11,
+            728.37,
+            80.83,
+            337.55,
+            121.49,
+            806.2,
+            909.46,
+            722.68,
+            385.39,
+            357.14,
+            283.46,
+            1379.62,
+            372.79,
+            371.83,
+            796.91,
+            815.88,
+            2338.91,
+            2070.78,
+            432.56,
+            2045.5,
+            1745.48,
+            846.72,
+            447.09,
+            49.55,
+            896.59,
+            335.41,
+            99.67,
+            863.12,
+            220.43,
+            401.95,
+            1186.1,
+            894.11,
+            161.6,
+            194.73,
+            402.46,
             807.37,
-            671.12,
-            1015.01,
-            1720.35,
-            2481.06,
-            921.31,
-            1039.52,
+            779.68,
+            2349.62,
+            135.62,
+            294.91,
+            237.63,
             984.38,
-            1024.32,
+            681.7,
+            296.97,
+            1630.17,
+            766.59,
+            76.25,
+            2500.48,
+            117.27,
+            551.32,
+            1945.87,
+            948.28,
+            803.28,
+            1063.02,
+            780.95,
+            195.88,
+            799.06,
+            215.4,
+            753.05,
+            254.91,
+            763.0,
+            561.73,
+            1243.73,
+            1194.64,
+            800.38,
+            692.36,
+            876.53,
+            678.22,
+            1023.28,
+            265.13,
+            336.16,
+            685.78,
+            1521.61,
+            95.03,
+            401.64,
+            958.34,
+            830.84,
+            777.09,
+            236.3,
+            505.87,
+            1218.79,
+            617.89,
+            501.49,
+            91.23,
+            1095.55,
+            478.13,
+            282.73,
+            651.32,
+            675.74,
+            712.07,
+            897.85,
+            910.7,
+            727.56,
+            669.41,
+            971.14,
+            875.34,
+            828.91,
+            54.54,
+            141.88,
+            493.43,
+            1123.38,
+            511.23,
+            2111.55,
             1326.45,
-            2349.62,
-            2195.75,
-            933.34,
-            510.41,
-            800.06,
+            1975.17,
+            724.14,
+            2277.42,
+            145.57,
+            993.89,
+            439.08,
+            2230.49,
             953.95,
-            1211.51,
-            2256.35,
-            2338.91,
-            810.61,
-            833.54,
-            784.08,
-            751.06,
-            970.45,
-            2500.48,
-            2176.05,
-            779.68,
-            371.85,
-            831.65,
-            842.35,
-            1349.91,
-            2770.84,
-            1401.35,
-            901.2,
-            417.71,
-            677.16,
-            791.95,
-            920.6,
-            1949.49,
-            2240.74,
-            764.87,
-            846.45,
-            613.37,
-            884.07,
-            798.89,
-            2529.15,
-            2060.61,
-            825.74,
-            847.66,
-            906.42,
-            821.03,
-            989.92,
-            2463.8,
-            1243.27,
-            99.67,
-            161.82,
-            328.86,
-            447.09,
-            575.5,
-            950.31,
-            1083.43,
-            284.94,
-            409.17,
-            281.76,
-            447.4,
-            676.45,
-            1423.7,
-            2038.5,
-            1225.84,
-            296.97,
-            344.65,
+            2368.83,
+            258.84,
+            898.34,
+            2475.67,
+            984.07,
+            867.01,
+            851.25,
+            606.62,
             330.47,
-            489.5,
-            1171.18,
-            879.02,
-            392.82,
-            468.56,
-            551.69,
-            939.61,
-            1289.7,
-            476.36,
-            336.16,
-            333.79,
-            170.7,
-            237.85,
-            287.35,
-            413.32,
-            840.33,
-            732.51,
-            651.13,
-            571.01,
-            401.95,
-            312.81,
-            310.28,
-            984.79,
-            846.72,
-            278.0,
-            273.2,
-            293.27,
-            368.97,
-            385.39,
-            806.2,
-            673.8,
-            215.4,
-            402.46,
-            338.89,
-            300.16,
-            276.03,
-            272.61,
-            367.57,
-            179.15,
-            354.36,
-            77.37,
-            220.43,
-            238.72,
-            219.06,
-            269.62,
-            298.24,
+            724.05,
+            46.09,
+            983.52,
+            1109.59,
+            1550.75,
+            1401.35,
+            2512.2,
+            1068.01,
+            1438.08,
         ],
         "targets": [
-            131,
-            108,
-            82,
-            88,
-            148,
+            1038,
+            486,
+            324,
+            269,
+            491,
             68,
-            54,
-            41,
-            43,
-            25,
-            38,
-            54,
-            222,
-            251,
-            117,
-            9,
-            78,
-            83,
-            75,
-            93,
-            150,
-            86,
-            186,
-            34,
-            15,
-            38,
-            123,
-            140,
-            42,
-            47,
-            72,
-            61,
-            88,
-            100,
-            354,
+            723,
+            773,
+            879,
+            1045,
+            812,
+            2634,
+            1651,
+            109,
+            179,
+            155,
+            797,
+            755,
+            378,
             120,
-            64,
+            3065,
+            477,
+            480,
+            198,
+            1521,
+            878,
+            1516,
+            670,
+            847,
+            1045,
+            333,
+            787,
+            1935,
+            513,
+            760,
+            181,
+            2418,
+            745,
+            315,
+            1118,
+            1050,
+            430,
+            404,
+            949,
+            736,
+            1899,
             53,
-            47,
-            149,
-            288,
-            397,
-            208,
-            140,
-            218,
-            259,
-            579,
-            532,
-            639,
-            195,
-            74,
-            139,
-            100,
-            120,
-            424,
-            694,
-            81,
-            137,
-            231,
+            1054,
+            872,
+            64,
+            1004,
+            61,
+            788,
+            695,
+            227,
+            2355,
             123,
+            2795,
+            692,
+            1965,
+            968,
+            1008,
+            204,
             214,
-            640,
-            114,
-            244,
-            316,
-            191,
-            46,
-            247,
-            724,
-            982,
-            359,
-            289,
-            321,
-            424,
-            884,
-            1424,
-            1047,
-            401,
-            460,
-            203,
-            166,
-            300,
-            981,
-            472,
+            107,
+            606,
+            318,
             222,
-            317,
-            168,
-            179,
-            307,
-            898,
-            1651,
-            734,
-            167,
-            413,
-            571,
-            172,
-            879,
-            1188,
-            855,
-            257,
-            209,
-            529,
-            642,
-            121,
-            1558,
-            669,
-            409,
-            613,
-            745,
-            177,
-            1462,
-            1710,
-            773,
-            678,
-            547,
-            569,
-            878,
-            1965,
-            1138,
-            847,
-            603,
-            255,
-            614,
-            894,
+            515,
+            1633,
+            1281,
+            221,
+            93,
             1612,
-            1401,
-            664,
-            694,
-            550,
-            695,
-            692,
-            902,
-            1582,
-            773,
-            678,
-            536,
-            735,
-            909,
-            2258,
-            1576,
-            836,
-            659,
-            740,
-            758,
+            1198,
+            229,
+            1135,
+            701,
+            240,
+            752,
+            96,
+            2541,
+            1619,
+            1313,
+            208,
             871,
-            2001,
-            2355,
-            1549,
-            673,
-            513,
-            736,
-            898,
+            1415,
+            997,
+            1328,
+            640,
             1869,
-            1685,
-            673,
-            763,
-            676,
-            563,
-            815,
-            1729,
-            1467,
-            863,
-            727,
-            769,
-            545,
-            863,
-            1807,
-            1639,
-            699,
-            774,
-            661,
-            746,
-            969,
-            1782,
-            1920,
-            854,
-            732,
-            848,
-            1027,
-            1246,
-            2204,
-            2282,
-            3065,
-            1031,
-            784,
+            830,
+            1095,
             754,
-            692,
-            1988,
-            1743,
-            723,
-            662,
-            748,
-            888,
-            1318,
-            2418,
-            2006,
+            982,
+            674,
+            1188,
+            316,
+            410,
+            1462,
+            1008,
+            1140,
+            1658,
+            891,
+            545,
+            2355,
+            1514,
+            1070,
             841,
-            752,
-            644,
-            632,
-            562,
-            987,
-            1050,
-            568,
-            750,
-            755,
-            606,
-            670,
+            830,
+            173,
+            268,
+            706,
+            518,
+            1563,
+            340,
+            220,
+            639,
+            1180,
+            1263,
+            2290,
+            563,
+            1070,
+            1383,
+            630,
+            1182,
             1559,
             1524,
-            729,
-            801,
-            467,
-            799,
-            1023,
-            1521,
-            1298,
-            846,
-            907,
-            884,
-            812,
-            1051,
-            1504,
-            1338,
-            775,
-            721,
-            668,
-            639,
-            797,
-            1914,
+            57,
+            2207,
+            1340,
+            174,
+            359,
+            362,
             1249,
-            833,
-            1281,
-            949,
-            435,
-            768,
-            226,
-            1415,
-            729,
-            775,
-            688,
-            783,
-            875,
-            1935,
-            2521,
-            1236,
-            204,
-            118,
-            153,
-            417,
-            1750,
-            1633,
-            690,
-            701,
-            647,
-            428,
-            742,
+            2643,
+            46,
+            902,
+            1040,
+            2494,
+            186,
+            243,
             1434,
-            1353,
-            691,
-            438,
-            539,
-            555,
-            258,
-            1776,
-            1544,
-            684,
-            477,
-            480,
-            653,
-            830,
-            480,
-            616,
+            326,
+            1065,
+            1455,
+            678,
+            72,
+            676,
+            1077,
+            150,
+            669,
+            2182,
+            665,
+            121,
+            921,
+            112,
+            951,
+            662,
+            1052,
+            177,
             330,
-            486,
-            559,
-            639,
-            949,
-            2235,
-            2397,
-            1514,
-            667,
+            618,
             217,
-            290,
-            529,
-            1899,
-            1748,
-            713,
-            637,
-            254,
+            1027,
+            1001,
+            145,
+            1236,
+            163,
+            2352,
+            25,
+            41,
+            1639,
+            775,
+            745,
+            550,
+            2496,
+            728,
+            773,
+            611,
+            1259,
+            1059,
+            735,
+            206,
+            1685,
+            317,
+            257,
+            892,
+            694,
+            2258,
+            190,
+            989,
+            667,
+            364,
             471,
-            676,
-            1499,
-            1619,
-            699,
-            695,
-            404,
-            240,
-            456,
-            57,
-            885,
+            1353,
+            2172,
+            762,
+            325,
+            1582,
+            1023,
+            440,
+            247,
+            548,
+            644,
+            954,
+            254,
+            664,
+            732,
+            1743,
+            935,
+            989,
+            888,
+            721,
+            354,
+            981,
+            538,
+            167,
+            2345,
             362,
-            410,
-            370,
-            318,
-            470,
+            898,
+            340,
+            653,
+            254,
+            2252,
             1156,
-            952,
-            373,
-            376,
-            305,
-            190,
-            440,
-            1275,
-            1004,
-            595,
-            449,
-            145,
-            139,
-            245,
-            943,
-            787,
-            220,
-            69,
-            112,
-            560,
-            1095,
-            1249,
-            810,
-            253,
-            96,
-            188,
-            182,
-            268,
-            706,
-            634,
-            233,
-            126,
-            50,
-            150,
-            261,
             502,
-            377,
-            143,
             155,
-            178,
-            181,
-            178,
-            275,
-            220,
-            260,
-            216,
-            107,
+            417,
+            1521,
+            949,
+            529,
+            150,
+            425,
+            1504,
+            1139,
+            3252,
+            667,
+            1807,
+            1060,
+            1201,
+            424,
+            1246,
+            780,
+            1177,
+            841,
+            778,
+            795,
+            145,
             227,
-            163,
-            155,
-            303,
-            430,
-            103,
-            255,
-            254,
-            491,
-            665,
-            686,
+            1298,
+            1729,
+            1014,
+            2006,
+            318,
+            120,
+            401,
+            172,
+            867,
+            644,
             244,
-            89,
-            95,
-            140,
+            3031,
+            135,
+            536,
+            1173,
+            100,
+            2827,
+            47,
+            661,
             307,
-            1070,
-            599,
-            106,
-            173,
-            92,
-            269,
-            174,
-            333,
-            284,
-            217,
-            127,
-            109,
-            130,
-            115,
-            67,
-            196,
-            145,
-            439,
-            467,
-            244,
-            269,
             775,
-            558,
-            126,
-            324,
-            304,
-            190,
-            310,
-            384,
-            318,
-            206,
-            199,
-            109,
-            163,
-            227,
-            192,
-            73,
-            94,
-            135,
-            141,
+            191,
             74,
-            349,
-            1435,
-            618,
-            502,
-            163,
-            394,
-            516,
-            246,
-            317,
-            515,
-            253,
-            229,
-            65,
-            325,
-            246,
-            956,
-            710,
-            203,
-            221,
-            432,
-            486,
-            447,
-            968,
-            1658,
-            838,
-            762,
-            997,
-            1005,
-            548,
-            3155,
-            2207,
-            982,
-            1051,
-            1122,
-            1334,
-            2469,
-            1033,
-            1532,
-            795,
-            531,
-            674,
-            834,
-            796,
-            2301,
-            2347,
-            1208,
-            1348,
-            1058,
-            1192,
-            1807,
-            3252,
-            2230,
             905,
+            1208,
+            653,
+            2166,
+            1401,
+            907,
+            833,
+            1782,
+            244,
+            38,
+            1172,
+            244,
             819,
-            482,
-            663,
-            1252,
-            2795,
-            2846,
-            1198,
-            989,
-            347,
-            846,
-            1340,
-            2541,
-            120,
-            195,
-            518,
-            655,
-            475,
-            1014,
-            1120,
-            2229,
+            558,
+            787,
+            1088,
+            616,
+            560,
+            1829,
+            1988,
+            1914,
+            1433,
             665,
-            653,
-            667,
-            764,
-            1069,
-            2496,
-            2135,
-            1008,
+            467,
+            2230,
+            688,
+            615,
+            260,
+            1325,
+            245,
+            34,
+            477,
+            613,
+            130,
+            333,
+            502,
+            1348,
+            1748,
+            1097,
+            1417,
+            472,
+            1920,
+            898,
+            371,
+            1576,
+            595,
+            676,
+            432,
+            955,
+            166,
+            139,
+            1029,
             738,
-            620,
+            1077,
+            1198,
+            466,
+            303,
+            73,
+            2704,
+            1233,
+            551,
             1026,
-            1319,
-            2622,
-            2172,
-            342,
+            370,
+            968,
+            118,
+            1366,
+            1094,
+            92,
+            394,
+            153,
+            47,
+            140,
+            195,
+            2397,
+            2235,
             625,
-            991,
-            1242,
-            1521,
-            3410,
-            2704,
-            630,
-            819,
-            766,
-            1059,
-            1417,
-            2855,
-            3283,
-            2557,
-            880,
-            745,
+            691,
+            637,
+            1488,
+            349,
+            120,
+            217,
+            547,
+            783,
+            449,
+            261,
+            533,
+            943,
+            1122,
+            983,
+            810,
+            486,
+            373,
+            562,
+            435,
+            834,
+            1750,
+            38,
+            569,
+            764,
+            438,
+            2347,
+            1334,
+            998,
             1100,
-            533,
-            2795,
-            2494,
-            1071,
-            968,
-            1027,
-            1038,
-            1488,
-            2708,
-            2224,
-            1017,
-            477,
-            1173,
-            1180,
-            1563,
-            2963,
-            2634,
-            653,
+            571,
+            884,
+            413,
+            875,
             968,
-            872,
-            778,
-            964,
+            2521,
             2657,
-            2551,
-            1139,
-            1077,
-            1077,
-            921,
+            137,
+            282,
+            384,
+            253,
+            2570,
+            894,
+            222,
+            2963,
+            1319,
+            618,
+            178,
+            87,
+            1557,
             829,
-            1455,
-            1421,
-            904,
-            1052,
-            2562,
-            1405,
-            1366,
-            1448,
-            1203,
-            998,
-            954,
-            975,
-            1032,
-            1511,
-            2355,
-            1920,
-            1088,
-            921,
-            799,
-            888,
-            747,
-            1264,
+            2132,
+            218,
+            845,
             2544,
-            1135,
-            1140,
-            1383,
-            1036,
-            1259,
-            2234,
-            2153,
-            1040,
-            968,
-            1074,
-            983,
-            1328,
-            2345,
-            1707,
-            1233,
-            1278,
-            1263,
-            1196,
-            1065,
-            2247,
-            2182,
-            1207,
+            975,
+            88,
+            109,
+            1047,
             1128,
-            1198,
-            1338,
-            1483,
-            2827,
+            347,
+            846,
+            3410,
+            54,
+            163,
+            310,
+            838,
+            74,
+            447,
+            196,
+            103,
+            692,
+            2562,
+            532,
+            251,
+            1153,
+            668,
+            419,
+            329,
+            117,
+            190,
+            408,
+            86,
+            123,
+            439,
+            991,
+            78,
+            141,
+            699,
             1208,
-            1026,
-            1081,
-            1094,
-            1363,
-            1325,
-            1829,
-            1483,
-            989,
-            935,
-            1177,
-            1172,
-            1433,
-            2352,
-            2613,
-            1965,
-            867,
-            832,
-            611,
-            1045,
-            1557,
-            2570,
-            1118,
-            1070,
-            1050,
-            1054,
-            1379,
-            3160,
-            2166,
+            998,
+            82,
+            1120,
+            734,
+            1338,
             1022,
-            371,
-            788,
-            939,
-            1250,
-            2512,
-            2454,
-            1001,
-            845,
-            787,
-            751,
-            1045,
-            2589,
+            288,
+            1448,
+            231,
+            1203,
+            922,
+            310,
+            2795,
+            1603,
+            769,
+            709,
+            255,
+            531,
+            639,
+            655,
+            1051,
+            2622,
+            968,
+            1499,
+            987,
+            440,
+            2469,
+            1405,
+            1069,
+            642,
+            753,
+            1051,
+            67,
+            258,
+            69,
+            921,
+            349,
+            848,
+            126,
+            300,
+            226,
             2015,
-            763,
-            315,
-            728,
-            891,
-            1516,
-            3031,
-            781,
-            874,
+            2301,
+            131,
+            695,
+            253,
+            159,
+            94,
+            3283,
+            163,
+            1424,
+            1071,
+            2090,
+            174,
+            1032,
+            428,
+            952,
+            1707,
+            1249,
+            673,
+            115,
+            484,
+            846,
+            555,
+            9,
+            819,
+            337,
+            1710,
+            148,
+            699,
+            9,
+            2247,
+            768,
+            1318,
+            1017,
+            199,
+            979,
+            140,
+            127,
+            321,
+            2557,
+            203,
+            143,
+            1549,
+            710,
+            678,
+            439,
             601,
-            780,
+            106,
+            875,
+            1544,
+            516,
+            188,
+            65,
+            290,
+            2001,
+            2855,
+            460,
+            342,
+            88,
+            729,
+            673,
+            751,
+            304,
+            2234,
+            964,
+            532,
+            2135,
+            192,
+            909,
+            205,
+            634,
+            639,
+            1264,
+            747,
+            568,
+            168,
+            1207,
+            796,
+            178,
+            1138,
+            799,
+            2224,
+            1252,
+            795,
             834,
-            1060,
-            2252,
+            2512,
             2080,
-            760,
-            922,
-            979,
-            1008,
-            753,
+            209,
+            305,
             2806,
-            2132,
-            830,
-            841,
-            795,
-            875,
-            1182,
-            2643,
-            998,
-            2,
-            87,
-            419,
-            466,
-            618,
-            1029,
-            1201,
-            378,
+            534,
+            884,
+            982,
+            233,
+            307,
+            314,
+            1511,
+            1532,
+            684,
+            766,
+            467,
+            1074,
+            801,
+            922,
+            863,
+            874,
+            3155,
+            203,
+            729,
+            1250,
+            246,
+            100,
+            139,
+            1242,
+            216,
+            2551,
+            742,
+            275,
+            114,
+            1026,
+            83,
+            713,
+            89,
+            246,
+            50,
+            767,
+            1005,
+            653,
+            429,
+            373,
+            195,
+            1807,
+            317,
+            456,
+            690,
+            784,
+            2454,
+            2229,
+            424,
+            1920,
+            1421,
+            441,
             466,
-            326,
-            340,
-            709,
-            2090,
-            2290,
-            1097,
+            42,
+            815,
+            259,
+            2,
+            529,
+            247,
+            331,
+            1278,
+            854,
+            54,
+            221,
+            433,
+            832,
+            763,
+            3160,
+            149,
+            377,
+            284,
+            1050,
+            836,
             327,
-            373,
-            320,
-            484,
-            1313,
-            922,
-            449,
-            534,
-            615,
-            955,
-            1603,
-            532,
+            1776,
+            885,
+            75,
+            2589,
+            81,
+            470,
+            1467,
+            904,
+            799,
+            1192,
+            774,
+            140,
+            740,
+            212,
+            694,
+            289,
+            750,
+            397,
+            1363,
+            1483,
+            727,
+            1036,
+            748,
+            614,
+            1027,
+            269,
             309,
-            337,
-            123,
-            198,
-            243,
-            362,
-            951,
-            892,
+            659,
+            1558,
+            108,
+            376,
+            1435,
+            855,
+            758,
+            255,
+            475,
+            1033,
+            559,
             555,
-            551,
-            331,
-            340,
-            349,
-            1153,
-            441,
-            329,
-            282,
-            310,
-            425,
-            429,
-            767,
-            538,
-            212,
-            433,
-            333,
-            314,
-            221,
-            205,
-            408,
-            174,
-            440,
-            9,
-            247,
-            644,
-            159,
-            364,
-            439,
+            95,
+            1196,
+            539,
+            182,
+            620,
+            449,
+            603,
+            863,
+            888,
+            647,
+            632,
+            1031,
+            763,
+            724,
+            43,
+            126,
+            409,
+            1275,
+            480,
+            2153,
+            1379,
+            1965,
+            686,
+            2282,
+            123,
+            969,
+            482,
+            2204,
+            939,
+            2613,
+            220,
+            775,
+            2846,
+            579,
+            880,
+            599,
+            663,
+            320,
+            746,
+            15,
+            1058,
+            1081,
+            1338,
+            781,
+            2708,
+            956,
+            1483,
         ],
         "regression_line": {
-            "coefficient": 0.874332261401738,
-            "intercept": 117.50898234893108,
+            "coefficient": 0.8743322614017384,
+            "intercept": 117.50898234893077,
         },
     },
 }
@@ -4480,7 +4480,12 @@ test_data_quality_metrics_res = {
         "std": 686.6224882846551,
         "min": 2.0,
         "max": 3410.0,
-        "median_metrics": {"perc_25": 315.0, "median": 713.0, "perc_75": 1097.0},
+        "median_metrics": {
+            "perc_25": 315.0,
+            "median": 713.0,
+            "perc_75": 1097.0,
+            "quantile_mode": "EXACT",
+        },
         "histogram": {
             "buckets": [
                 2.0,
@@ -4507,7 +4512,12 @@ test_data_quality_metrics_res = {
             "std": 0.5448943419593665,
             "min": 1.0,
             "max": 3.0,
-            "median_metrics": {"perc_25": 1.0, "median": 1.0, "perc_75": 2.0},
+            "median_metrics": {
+                "perc_25": 1.0,
+                "median": 1.0,
+                "perc_75": 2.0,
+                "quantile_mode": "EXACT",
+            },
             "class_median_metrics": [],
             "histogram": {
                 "buckets": [
@@ -4538,6 +4548,7 @@ test_data_quality_metrics_res = {
                 "perc_25": 0.3370835,
                 "median": 0.498333,
                 "perc_75": 0.6554165000000001,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -4569,6 +4580,7 @@ test_data_quality_metrics_res = {
                 "perc_25": 0.3378425,
                 "median": 0.486733,
                 "perc_75": 0.6086020000000001,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -4600,6 +4612,7 @@ test_data_quality_metrics_res = {
                 "perc_25": 0.52,
                 "median": 0.626667,
                 "perc_75": 0.7302085,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -4631,6 +4644,7 @@ test_data_quality_metrics_res = {
                 "perc_25": 0.13495,
                 "median": 0.180975,
                 "perc_75": 0.2332145,
+                "quantile_mode": "EXACT",
             },
             "class_median_metrics": [],
             "histogram": {
@@ -4655,10 +4669,10 @@ test_data_quality_metrics_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "1", "count": 181, "frequency": 0.2476060191518468},
                 {"name": "3", "count": 188, "frequency": 0.25718194254445964},
-                {"name": "4", "count": 178, "frequency": 0.24350205198358413},
                 {"name": "2", "count": 184, "frequency": 0.25170998632010944},
+                {"name": "1", "count": 181, "frequency": 0.2476060191518468},
+                {"name": "4", "count": 178, "frequency": 0.24350205198358413},
             ],
             "distinct_value": 4,
         },
@@ -4677,17 +4691,17 @@ test_data_quality_metrics_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "12", "count": 62, "frequency": 0.08481532147742818},
                 {"name": "1", "count": 62, "frequency": 0.08481532147742818},
-                {"name": "6", "count": 60, "frequency": 0.08207934336525308},
+                {"name": "10", "count": 62, "frequency": 0.08481532147742818},
+                {"name": "12", "count": 62, "frequency": 0.08481532147742818},
                 {"name": "3", "count": 62, "frequency": 0.08481532147742818},
                 {"name": "5", "count": 62, "frequency": 0.08481532147742818},
-                {"name": "9", "count": 60, "frequency": 0.08207934336525308},
-                {"name": "4", "count": 60, "frequency": 0.08207934336525308},
-                {"name": "8", "count": 62, "frequency": 0.08481532147742818},
                 {"name": "7", "count": 62, "frequency": 0.08481532147742818},
-                {"name": "10", "count": 62, "frequency": 0.08481532147742818},
+                {"name": "8", "count": 62, "frequency": 0.08481532147742818},
                 {"name": "11", "count": 60, "frequency": 0.08207934336525308},
+                {"name": "4", "count": 60, "frequency": 0.08207934336525308},
+                {"name": "6", "count": 60, "frequency": 0.08207934336525308},
+                {"name": "9", "count": 60, "frequency": 0.08207934336525308},
                 {"name": "2", "count": 57, "frequency": 0.07797537619699042},
             ],
             "distinct_value": 12,
@@ -4697,8 +4711,8 @@ test_data_quality_metrics_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
-                {"name": "1", "count": 21, "frequency": 0.028727770177838577},
                 {"name": "0", "count": 710, "frequency": 0.9712722298221614},
+                {"name": "1", "count": 21, "frequency": 0.028727770177838577},
             ],
             "distinct_value": 2,
         },
@@ -4707,13 +4721,13 @@ test_data_quality_metrics_res = {
             "type": "categorical",
             "missing_value": {"count": 0, "percentage": 0.0},
             "category_frequency": [
+                {"name": "0", "count": 105, "frequency": 0.1436388508891929},
                 {"name": "1", "count": 105, "frequency": 0.1436388508891929},
                 {"name": "6", "count": 105, "frequency": 0.1436388508891929},
+                {"name": "2", "count": 104, "frequency": 0.14227086183310533},
                 {"name": "3", "count": 104, "frequency": 0.14227086183310533},
-                {"name": "5", "count": 104, "frequency": 0.14227086183310533},
                 {"name": "4", "count": 104, "frequency": 0.14227086183310533},
-                {"name": "2", "count": 104, "frequency": 0.14227086183310533},
-                {"name": "0", "count": 105, "frequency": 0.1436388508891929},
+                {"name": "5", "count": 104, "frequency": 0.14227086183310533},
             ],
             "distinct_value": 7,
         },
@@ -4733,14 +4747,14 @@ test_data_quality_metrics_res = {
 test_model_quality_abalone_res = {
     "mae": 1.9473369239976062,
     "mape": 32.80513741749641,
-    "mse": 27.478755236385403,
+    "mse": 27.4787552363854,
     "rmse": 5.242018240752831,
-    "r2": 0.5846200997960207,
-    "adj_r2": 0.5834981252756619,
-    "variance": 66.40816713170544,
+    "r2": 0.5846200997960197,
+    "adj_r2": 0.5834981252756608,
+    "variance": 66.40816713170533,
     "residuals": {
         "ks": {"p_value": 6.407496755400643e-11, "statistic": 0.40783961699581084},
-        "correlation_coefficient": 0.7927527098984378,
+        "correlation_coefficient": 0.7927527098984389,
         "histogram": {
             "buckets": [
                 -27.0,
@@ -4758,10040 +4772,10040 @@ test_model_quality_abalone_res = {
             "values": [20, 31, 73, 122, 106, 2754, 104, 58, 42, 32],
         },
         "standardized_residuals": [
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.180782318115234,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.305126905441284,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.305126905441284,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.2269723415374756,
-            0.015982456505298615,
-            2.1143648624420166,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.594271659851074,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.5420788526535034,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.6866509914398193,
-            -3.7992584705352783,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.258937120437622,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.8454482555389404,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.9378277659416199,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.3513168096542358,
-            0.015982456505298615,
-            2.1143648624420166,
-            0.015982456505298615,
-            4.975795745849609,
-            0.7790306210517883,
-            -0.9378277659416199,
-            -2.654686212539673,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.036210298538208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.2067445069551468,
-            2.4958889484405518,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            0.015982456505298615,
-            1.3513168096542358,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.0219855308532715,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.990020513534546,
-            0.015982456505298615,
-            -4.371544361114502,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.9236029386520386,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.877413034439087,
-            3.6404612064361572,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.258937120437622,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.9236029386520386,
-            0.015982456505298615,
-            2.877413034439087,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            -0.9378277659416199,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.2269723415374756,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.7008758783340454,
-            -3.2269723415374756,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.4958889484405518,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.36554163694381714,
-            1.9236029386520386,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            -2.8454482555389404,
-            0.015982456505298615,
-            3.831223249435425,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.594271659851074,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.180782318115234,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.5420788526535034,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            -0.7470657229423523,
-            0.015982456505298615,
-            2.877413034439087,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.36554163694381714,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.7008758783340454,
-            -1.3193517923355103,
-            1.9236029386520386,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.0681750774383545,
-            -2.2731621265411377,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.0681750774383545,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.8454482555389404,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.6866509914398193,
-            0.015982456505298615,
-            1.5420788526535034,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.0219855308532715,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.1143648624420166,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.403509616851807,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.1143648624420166,
-            -0.9378277659416199,
-            0.015982456505298615,
-            -1.7008758783340454,
-            0.015982456505298615,
-            -0.36554163694381714,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            0.015982456505298615,
-            2.305126905441284,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.36554163694381714,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.831223249435425,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.1143648624420166,
-            0.9697926640510559,
-            0.015982456505298615,
-            -4.5623064041137695,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.7992584705352783,
-            -0.9378277659416199,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.36554163694381714,
-            1.9236029386520386,
-            4.403509616851807,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.0219855308532715,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.4958889484405518,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.5882685780525208,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.594271659851074,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.305126905441284,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.4958889484405518,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.2269723415374756,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.753068447113037,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.9378277659416199,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.1143648624420166,
-            -3.7992584705352783,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.258937120437622,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.4496991634368896,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.305126905441284,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.2269723415374756,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            -1.7008758783340454,
-            4.594271659851074,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.036210298538208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.7992584705352783,
-            0.015982456505298615,
-            2.1143648624420166,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            1.5420788526535034,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.8454482555389404,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.0219855308532715,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            0.015982456505298615,
-            1.1605547666549683,
-            1.9236029386520386,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            2.877413034439087,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.831223249435425,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.403509616851807,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.3193517923355103,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            2.305126905441284,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.785033702850342,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.3513168096542358,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.305126905441284,
-            0.015982456505298615,
-            3.4496991634368896,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.3513168096542358,
-            0.015982456505298615,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            -0.9378277659416199,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.1143648624420166,
-            1.732840895652771,
-            0.015982456505298615,
-            3.0681750774383545,
-            -1.3193517923355103,
-            0.015982456505298615,
-            -0.36554163694381714,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.0681750774383545,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.036210298538208,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.2067445069551468,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.7008758783340454,
-            -3.417734384536743,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.036210298538208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.831223249435425,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.212747573852539,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.36554163694381714,
-            1.5420788526535034,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            2.1143648624420166,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.4958889484405518,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.8454482555389404,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.08240008354187,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.9236029386520386,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.36554163694381714,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            -2.2731621265411377,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.0219855308532715,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.9236029386520386,
-            0.015982456505298615,
-            3.4496991634368896,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.6084964275360107,
-            2.877413034439087,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.9378277659416199,
-            -1.891637921333313,
-            0.015982456505298615,
-            3.258937120437622,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            2.305126905441284,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.1143648624420166,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            4.0219855308532715,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.943830490112305,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            2.1143648624420166,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.212747573852539,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.943830490112305,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.8454482555389404,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            3.6404612064361572,
-            0.015982456505298615,
-            2.305126905441284,
-            0.015982456505298615,
-            2.1143648624420166,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.5420788526535034,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.1143648624420166,
-            -3.990020513534546,
-            0.015982456505298615,
-            -0.36554163694381714,
-            0.015982456505298615,
-            -0.36554163694381714,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.831223249435425,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.5420788526535034,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            -2.654686212539673,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.6404612064361572,
-            -3.990020513534546,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.6084964275360107,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.990020513534546,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.9378277659416199,
-            4.403509616851807,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.9236029386520386,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.5420788526535034,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            -1.5101138353347778,
-            -1.1285897493362427,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.180782318115234,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.943830490112305,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.36554163694381714,
-            -3.036210298538208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.3975065350532532,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.08240008354187,
-            -1.3193517923355103,
-            0.015982456505298615,
-            -0.36554163694381714,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.08240008354187,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            3.6404612064361572,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.7008758783340454,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            -0.36554163694381714,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.4496991634368896,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.6404612064361572,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            -2.8454482555389404,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.9236029386520386,
-            0.015982456505298615,
-            1.5420788526535034,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            3.6404612064361572,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.9236029386520386,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.180782318115234,
-            2.305126905441284,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.403509616851807,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.6866509914398193,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.08240008354187,
-            -3.7992584705352783,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.212747573852539,
-            0.015982456505298615,
-            3.831223249435425,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            0.015982456505298615,
-            2.1143648624420166,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            -3.036210298538208,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            4.212747573852539,
-            0.015982456505298615,
-            2.6866509914398193,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -5.134592533111572,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            -3.6084964275360107,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.0681750774383545,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.2269723415374756,
-            3.831223249435425,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.3513168096542358,
-            0.015982456505298615,
-            -3.417734384536743,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.305126905441284,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            -3.417734384536743,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.2269723415374756,
-            -0.5563036799430847,
-            1.1605547666549683,
-            0.015982456505298615,
-            -4.180782318115234,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.08240008354187,
-            0.015982456505298615,
-            1.9236029386520386,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.36554163694381714,
-            -3.6084964275360107,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.036210298538208,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.212747573852539,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.2269723415374756,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.5623064041137695,
-            0.015982456505298615,
-            -2.654686212539673,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.5420788526535034,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.036210298538208,
-            0.015982456505298615,
-            -0.17477957904338837,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            1.5420788526535034,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.877413034439087,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.371544361114502,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            1.732840895652771,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.4958889484405518,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.831223249435425,
-            -0.36554163694381714,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.305126905441284,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.831223249435425,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.8454482555389404,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.8454482555389404,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.3513168096542358,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.6404612064361572,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.3513168096542358,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.3193517923355103,
-            2.4958889484405518,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            1.5420788526535034,
-            1.9236029386520386,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.4496991634368896,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.4958889484405518,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            -4.371544361114502,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.594271659851074,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            -2.08240008354187,
-            4.212747573852539,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.1143648624420166,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.305126905441284,
-            4.212747573852539,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.258937120437622,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.5101138353347778,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.0681750774383545,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.180782318115234,
-            -0.36554163694381714,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.036210298538208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.258937120437622,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.3975065350532532,
-            2.1143648624420166,
-            -1.5101138353347778,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            2.4958889484405518,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            -3.2269723415374756,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.0219855308532715,
-            0.015982456505298615,
-            0.2067445069551468,
-            3.6404612064361572,
-            -0.5563036799430847,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.417734384536743,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.36554163694381714,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.036210298538208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            1.3513168096542358,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.0219855308532715,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            3.258937120437622,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.3513168096542358,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.5563036799430847,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            2.305126905441284,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.3513168096542358,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            0.015982456505298615,
-            0.9697926640510559,
-            -2.654686212539673,
-            1.9236029386520386,
-            0.015982456505298615,
-            2.6866509914398193,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.9236029386520386,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.9378277659416199,
-            1.1605547666549683,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.371544361114502,
-            3.258937120437622,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.1143648624420166,
-            1.732840895652771,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.4639241695404053,
-            0.7790306210517883,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            2.4958889484405518,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.4496991634368896,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.3513168096542358,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.258937120437622,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.180782318115234,
-            2.305126905441284,
-            4.403509616851807,
-            0.015982456505298615,
-            2.4958889484405518,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.732840895652771,
-            0.015982456505298615,
-            4.403509616851807,
-            -0.5563036799430847,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.7008758783340454,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.9378277659416199,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.990020513534546,
-            0.015982456505298615,
-            0.015982456505298615,
-            4.212747573852539,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.036210298538208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.831223249435425,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.891637921333313,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.417734384536743,
-            -0.36554163694381714,
-            0.015982456505298615,
-            2.305126905441284,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.6866509914398193,
-            0.015982456505298615,
-            1.1605547666549683,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.36554163694381714,
-            -3.7992584705352783,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.2067445069551468,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.9378277659416199,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.4496991634368896,
-            -3.7992584705352783,
-            0.015982456505298615,
-            0.5882685780525208,
-            -0.9378277659416199,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.9378277659416199,
-            0.015982456505298615,
-            -2.4639241695404053,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.5882685780525208,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            -0.17477957904338837,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.08240008354187,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            -0.9378277659416199,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.2731621265411377,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.9697926640510559,
-            0.015982456505298615,
-            0.015982456505298615,
-            -3.417734384536743,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            3.4496991634368896,
-            4.594271659851074,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.1143648624420166,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.5623064041137695,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.654686212539673,
-            -0.9378277659416199,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -4.943830490112305,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.3975065350532532,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -2.8454482555389404,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.7790306210517883,
-            0.015982456505298615,
-            -0.7470657229423523,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            2.4958889484405518,
-            3.258937120437622,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.1285897493362427,
-            0.015982456505298615,
-            0.015982456505298615,
-            -0.17477957904338837,
-            4.212747573852539,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            -1.3193517923355103,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
-            0.015982456505298615,
+            -0.9378277569973933,
+            -0.9378277569973933,
+            -0.9378277569973933,
+            1.3513167571002,
+            0.20674450005140343,
+            2.877413099831929,
+            2.877413099831929,
+            0.3975065428928695,
+            -1.1285897998388594,
+            -1.1285897998388594,
+            -1.1285897998388594,
+            0.20674450005140343,
+            -0.7470657141559272,
+            -2.08240001404619,
+            3.0681751426733954,
+            3.2589371855148612,
+            -1.3193518426803255,
+            -0.7470657141559272,
+            -0.556303671314461,
+            -3.03621022825352,
+            1.160554714258734,
+            -0.7470657141559272,
+            -0.9378277569973933,
+            4.594271485405124,
+            1.3513167571002,
+            4.212747399722192,
+            4.212747399722192,
+            0.5882685857343356,
+            0.5882685857343356,
+            -0.9378277569973933,
+            2.305126971307531,
+            2.305126971307531,
+            2.305126971307531,
+            -0.556303671314461,
+            -0.556303671314461,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            3.8312233140392595,
+            3.8312233140392595,
+            -0.3655416284729949,
+            -3.6084963567779185,
+            -4.562306570985249,
+            0.5882685857343356,
+            -0.556303671314461,
+            -0.556303671314461,
+            0.3975065428928695,
+            3.6404612711977937,
+            1.5420787999416663,
+            1.160554714258734,
+            1.160554714258734,
+            1.5420787999416663,
+            -0.556303671314461,
+            -0.3655416284729949,
+            4.403509442563658,
+            -1.1285897998388594,
+            -1.1285897998388594,
+            -3.2269722710949864,
+            -3.2269722710949864,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -3.2269722710949864,
+            -1.3193518426803255,
+            -1.3193518426803255,
+            -1.3193518426803255,
+            0.3975065428928695,
+            0.5882685857343356,
+            -3.03621022825352,
+            -0.556303671314461,
+            -0.7470657141559272,
+            3.4496992283563275,
+            3.0681751426733954,
+            -2.08240001404619,
+            -2.08240001404619,
+            -2.08240001404619,
+            -1.1285897998388594,
+            2.877413099831929,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.7790306285758017,
+            0.7790306285758017,
+            4.212747399722192,
+            4.212747399722192,
+            4.212747399722192,
+            -4.180782485302317,
+            -4.180782485302317,
+            -0.7470657141559272,
+            -3.990020442460851,
+            0.9697926714172679,
+            0.5882685857343356,
+            1.160554714258734,
+            3.8312233140392595,
+            2.495889014148997,
+            2.305126971307531,
+            -1.5101138855217917,
+            3.6404612711977937,
+            -1.5101138855217917,
+            -1.5101138855217917,
+            -1.5101138855217917,
+            -1.5101138855217917,
+            -1.5101138855217917,
+            -1.5101138855217917,
+            1.160554714258734,
+            1.160554714258734,
+            -0.556303671314461,
+            -2.08240001404619,
+            -0.556303671314461,
+            -0.3655416284729949,
+            2.495889014148997,
+            2.495889014148997,
+            2.495889014148997,
+            2.495889014148997,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -0.9378277569973933,
+            -0.9378277569973933,
+            -1.5101138855217917,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            3.6404612711977937,
+            1.7328408427831326,
+            1.160554714258734,
+            1.160554714258734,
+            -1.5101138855217917,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.20674450005140343,
+            4.021985356880726,
+            -3.2269722710949864,
+            -1.5101138855217917,
+            -1.5101138855217917,
+            -1.5101138855217917,
+            -4.371544528143783,
+            0.3975065428928695,
+            -1.7008759283632575,
+            -0.1747795856315288,
+            3.4496992283563275,
+            3.4496992283563275,
+            1.160554714258734,
+            1.160554714258734,
+            1.160554714258734,
+            1.7328408427831326,
+            -0.7470657141559272,
+            2.686651056990463,
+            2.686651056990463,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -2.463924099729122,
+            -2.463924099729122,
+            1.9236028856245986,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            0.20674450005140343,
+            0.3975065428928695,
+            0.3975065428928695,
+            0.3975065428928695,
+            2.1143649284660646,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            -2.654686142570588,
+            -0.556303671314461,
+            -0.556303671314461,
+            -0.3655416284729949,
+            -4.7530686138267155,
+            -3.7992583996193847,
+            -3.7992583996193847,
+            -0.3655416284729949,
+            -1.7008759283632575,
+            1.3513167571002,
+            0.7790306285758017,
+            0.7790306285758017,
+            -1.1285897998388594,
+            -1.1285897998388594,
+            1.160554714258734,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.3975065428928695,
+            0.3975065428928695,
+            0.3975065428928695,
+            0.5882685857343356,
+            -1.5101138855217917,
+            0.20674450005140343,
+            -1.7008759283632575,
+            0.9697926714172679,
+            0.9697926714172679,
+            0.9697926714172679,
+            -2.273162056887656,
+            -2.273162056887656,
+            -2.273162056887656,
+            2.1143649284660646,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            1.5420787999416663,
+            -0.1747795856315288,
+            -4.180782485302317,
+            4.975795571088057,
+            2.495889014148997,
+            -2.273162056887656,
+            0.20674450005140343,
+            -0.3655416284729949,
+            -2.8454481854120544,
+            -4.371544528143783,
+            2.1143649284660646,
+            0.9697926714172679,
+            -1.8916379712047238,
+            -3.03621022825352,
+            -0.3655416284729949,
+            -0.3655416284729949,
+            3.6404612711977937,
+            0.9697926714172679,
+            0.9697926714172679,
+            -0.9378277569973933,
+            4.78503352824659,
+            2.495889014148997,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            -4.943830656668181,
+            -4.943830656668181,
+            -4.943830656668181,
+            -4.943830656668181,
+            2.305126971307531,
+            2.305126971307531,
+            -3.4177343139364527,
+            -0.3655416284729949,
+            -2.273162056887656,
+            -2.654686142570588,
+            1.7328408427831326,
+            1.7328408427831326,
+            -2.463924099729122,
+            -2.463924099729122,
+            -2.463924099729122,
+            0.3975065428928695,
+            1.5420787999416663,
+            -1.3193518426803255,
+            -0.7470657141559272,
+            0.20674450005140343,
+            -1.3193518426803255,
+            1.160554714258734,
+            1.160554714258734,
+            -2.8454481854120544,
+            3.0681751426733954,
+            -1.3193518426803255,
+            -1.3193518426803255,
+            -1.3193518426803255,
+            -1.3193518426803255,
+            -3.990020442460851,
+            -3.990020442460851,
+            4.403509442563658,
+            4.403509442563658,
+            4.403509442563658,
+            4.403509442563658,
+            -0.7470657141559272,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -3.03621022825352,
+            -3.03621022825352,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            -3.2269722710949864,
+            -3.4177343139364527,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -2.08240001404619,
+            -2.08240001404619,
+            -2.08240001404619,
+            -1.1285897998388594,
+            -1.1285897998388594,
+            -1.7008759283632575,
+            -1.7008759283632575,
+            0.7790306285758017,
+            0.9697926714172679,
+            0.9697926714172679,
+            2.305126971307531,
+            -0.556303671314461,
+            -0.556303671314461,
+            -1.1285897998388594,
+            -1.1285897998388594,
+            -1.1285897998388594,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            2.305126971307531,
+            2.305126971307531,
+            2.305126971307531,
+            -3.6084963567779185,
+            -2.08240001404619,
+            -2.08240001404619,
+            -2.08240001404619,
+            -2.08240001404619,
+            -2.08240001404619,
+            3.8312233140392595,
+            3.8312233140392595,
+            -2.273162056887656,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            -0.9378277569973933,
+            1.7328408427831326,
+            1.7328408427831326,
+            1.3513167571002,
+            1.3513167571002,
+            -2.8454481854120544,
+            2.1143649284660646,
+            2.1143649284660646,
+            -1.1285897998388594,
+            -1.1285897998388594,
+            -4.180782485302317,
+            -4.180782485302317,
+            -2.654686142570588,
+            -0.7470657141559272,
+            -0.7470657141559272,
+            -0.7470657141559272,
+            1.9236028856245986,
+            -0.7470657141559272,
+            -0.9378277569973933,
+            -1.1285897998388594,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            3.0681751426733954,
+            3.2589371855148612,
+            -1.1285897998388594,
+            -1.1285897998388594,
+            -1.7008759283632575,
+            -0.3655416284729949,
+            0.5882685857343356,
+            0.5882685857343356,
+            0.5882685857343356,
+            1.5420787999416663,
+            1.5420787999416663,
+            0.9697926714172679,
+            -0.556303671314461,
+            -0.9378277569973933,
+            -2.8454481854120544,
+            -3.03621022825352,
+            -3.03621022825352,
+            -3.03621022825352,
+            3.2589371855148612,
+            3.2589371855148612,
+            3.2589371855148612,
+            -1.8916379712047238,
+            0.20674450005140343,
+            4.021985356880726,
+            4.021985356880726,
+            4.021985356880726,
+            4.021985356880726,
+            2.686651056990463,
+            -1.7008759283632575,
+            -1.7008759283632575,
+            -1.7008759283632575,
+            -1.7008759283632575,
+            -1.7008759283632575,
+            2.686651056990463,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.9697926714172679,
+            0.9697926714172679,
+            1.9236028856245986,
+            1.9236028856245986,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            2.1143649284660646,
+            2.1143649284660646,
+            2.1143649284660646,
+            0.9697926714172679,
+            0.9697926714172679,
+            0.9697926714172679,
+            -2.654686142570588,
+            -2.654686142570588,
+            -2.654686142570588,
+            -2.654686142570588,
+            -1.3193518426803255,
+            0.9697926714172679,
+            3.2589371855148612,
+            -2.273162056887656,
+            -2.654686142570588,
+            -1.3193518426803255,
+            1.9236028856245986,
+            1.9236028856245986,
+            4.021985356880726,
+            4.021985356880726,
+            -3.990020442460851,
+            0.7790306285758017,
+            -2.463924099729122,
+            -2.463924099729122,
+            -2.463924099729122,
+            3.8312233140392595,
+            3.8312233140392595,
+            3.8312233140392595,
+            0.3975065428928695,
+            0.3975065428928695,
+            0.3975065428928695,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -2.8454481854120544,
+            0.7790306285758017,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -2.463924099729122,
+            -2.463924099729122,
+            -0.7470657141559272,
+            -2.273162056887656,
+            1.160554714258734,
+            -1.7008759283632575,
+            4.403509442563658,
+            4.403509442563658,
+            4.212747399722192,
+            4.212747399722192,
+            4.212747399722192,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            2.1143649284660646,
+            2.1143649284660646,
+            -2.654686142570588,
+            -1.8916379712047238,
+            -2.08240001404619,
+            -2.463924099729122,
+            -2.463924099729122,
+            -2.463924099729122,
+            0.9697926714172679,
+            0.9697926714172679,
+            0.9697926714172679,
+            0.5882685857343356,
+            0.5882685857343356,
+            -1.1285897998388594,
+            -0.9378277569973933,
+            -3.7992583996193847,
+            -3.7992583996193847,
+            -2.463924099729122,
+            -0.3655416284729949,
+            1.9236028856245986,
+            2.1143649284660646,
+            -2.8454481854120544,
+            -1.3193518426803255,
+            -1.3193518426803255,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -1.3193518426803255,
+            0.9697926714172679,
+            -3.4177343139364527,
+            0.9697926714172679,
+            1.160554714258734,
+            1.160554714258734,
+            2.495889014148997,
+            2.495889014148997,
+            -2.273162056887656,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.3975065428928695,
+            0.20674450005140343,
+            0.20674450005140343,
+            1.5420787999416663,
+            -4.562306570985249,
+            -3.4177343139364527,
+            0.5882685857343356,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            2.495889014148997,
+            -1.5101138855217917,
+            -0.3655416284729949,
+            -0.3655416284729949,
+            -0.9378277569973933,
+            1.9236028856245986,
+            -2.8454481854120544,
+            -0.7470657141559272,
+            4.212747399722192,
+            -2.08240001404619,
+            -2.08240001404619,
+            -4.562306570985249,
+            -3.4177343139364527,
+            -3.4177343139364527,
+            2.1143649284660646,
+            2.1143649284660646,
+            1.160554714258734,
+            -1.1285897998388594,
+            -5.134592699509647,
+            1.3513167571002,
+            2.305126971307531,
+            -1.7008759283632575,
+            -1.7008759283632575,
+            -1.7008759283632575,
+            -1.3193518426803255,
+            -4.371544528143783,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            3.4496992283563275,
+            3.4496992283563275,
+            -2.8454481854120544,
+            2.877413099831929,
+            2.877413099831929,
+            0.20674450005140343,
+            0.3975065428928695,
+            -4.180782485302317,
+            3.6404612711977937,
+            3.6404612711977937,
+            -1.5101138855217917,
+            -1.5101138855217917,
+            0.5882685857343356,
+            -0.7470657141559272,
+            -0.7470657141559272,
+            2.305126971307531,
+            2.305126971307531,
+            0.9697926714172679,
+            0.9697926714172679,
+            -0.3655416284729949,
+            -0.3655416284729949,
+            0.5882685857343356,
+            3.4496992283563275,
+            -3.03621022825352,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -1.1285897998388594,
+            -1.1285897998388594,
+            3.6404612711977937,
+            3.6404612711977937,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -4.371544528143783,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            2.686651056990463,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            1.9236028856245986,
+            1.3513167571002,
+            1.3513167571002,
+            -1.7008759283632575,
+            4.594271485405124,
+            4.594271485405124,
+            4.594271485405124,
+            3.2589371855148612,
+            3.2589371855148612,
+            -2.8454481854120544,
+            -2.8454481854120544,
+            0.9697926714172679,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            -0.7470657141559272,
+            -0.7470657141559272,
+            2.305126971307531,
+            2.877413099831929,
+            1.7328408427831326,
+            1.7328408427831326,
+            -0.9378277569973933,
+            -0.9378277569973933,
+            1.7328408427831326,
+            1.7328408427831326,
+            1.7328408427831326,
+            -3.7992583996193847,
+            -3.7992583996193847,
+            -3.03621022825352,
+            1.5420787999416663,
+            -2.654686142570588,
+            1.160554714258734,
+            1.160554714258734,
+            1.160554714258734,
+            2.495889014148997,
+            -0.9378277569973933,
+            -3.990020442460851,
+            0.7790306285758017,
+            3.2589371855148612,
+            0.3975065428928695,
+            -0.7470657141559272,
+            -0.7470657141559272,
+            -0.7470657141559272,
+            1.5420787999416663,
+            -2.463924099729122,
+            -2.463924099729122,
+            -0.556303671314461,
+            -0.556303671314461,
+            0.7790306285758017,
+            1.7328408427831326,
+            0.7790306285758017,
+            2.686651056990463,
+            1.3513167571002,
+            1.9236028856245986,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            1.3513167571002,
+            -0.1747795856315288,
+            -2.654686142570588,
+            -1.8916379712047238,
+            -2.273162056887656,
+            -2.273162056887656,
+            -2.273162056887656,
+            -2.273162056887656,
+            -2.654686142570588,
+            -2.654686142570588,
+            -1.5101138855217917,
+            -1.5101138855217917,
+            -2.654686142570588,
+            1.5420787999416663,
+            -0.556303671314461,
+            -0.556303671314461,
+            -0.3655416284729949,
+            -0.3655416284729949,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            2.495889014148997,
+            1.7328408427831326,
+            1.7328408427831326,
+            0.20674450005140343,
+            2.305126971307531,
+            3.4496992283563275,
+            1.9236028856245986,
+            0.20674450005140343,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            1.7328408427831326,
+            -3.6084963567779185,
+            1.9236028856245986,
+            -0.556303671314461,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            -1.8916379712047238,
+            2.1143649284660646,
+            -1.3193518426803255,
+            0.20674450005140343,
+            3.4496992283563275,
+            1.9236028856245986,
+            1.160554714258734,
+            -2.654686142570588,
+            -2.654686142570588,
+            -2.654686142570588,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            3.2589371855148612,
+            0.7790306285758017,
+            0.7790306285758017,
+            3.0681751426733954,
+            3.0681751426733954,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            -3.2269722710949864,
+            -3.7992583996193847,
+            -1.5101138855217917,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            0.3975065428928695,
+            0.3975065428928695,
+            3.8312233140392595,
+            3.8312233140392595,
+            -3.6084963567779185,
+            1.5420787999416663,
+            1.5420787999416663,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            0.015982457209937316,
+            4.021985356880726,
+            -2.08240001404619,
+            0.20674450005140343,
+            0.20674450005140343,
+            0.20674450005140343,
+            0.20674450005140343,
+            -4.180782485302317,
+            1.3513167571002,
+            -2.463924099729122,
+            -3.2269722710949864,
+            -3.2269722710949864,
+            -3.2269722710949864,
+            0.7790306285758017,
+            0.7790306285758017,
+            0.7790306285758017,
+            -1.7008759283632575,
+            -1.7008759283632575,
+            -2.08240001404619,
+            -1.8916379712047238,
+            2.305126971307531,
+            -0.1747795856315288,
+            -0.1747795856315288,
+            0.20674450005140343,
+            4.594271485405124,
+            4.594271485405124,
+            -2.08240001404619,
+            1.160554714258734,
+            1.160554714258734,
+            0.20674450005140343,
+            0.20674450005140343,
+            1.160554714258734,
+            1.160554714258734,
+            -2.273162056887656,
+            -1.3193518426803255,
+            -1.3193518426803255,
+            -0.556303671314461,
+            2.1143649284660646,
+            2.1143649284660646,
+            2.1143649284660646,
+            2.1143649284660646,
+            -3.03621022825352,
+            -0.3655416284729949,
+            -0.3655416284729949,
+            0.9697926714172679,
+            0.7790306285758017,
+            0.7790306285758017,
+            -1.5101138855217917,
+            0.3975065428928695,
+            -0.556303671314461,
+            -0.556303671314461,
+            -2.463924099729122,
+            -2.463924099729122,
+            -2.463924099729122,
+            -2.463924099729122,
+            1.9236028856245986,
+            1.9236028856245986,
+            -2.08240001404619,
         ],
         "predictions": [
+            15,
+            15,
+            15,
+            14,
+            2,
+            4,
+            4,
+            7,
+            14,
+            14,
+            14,
+            10,
+            25,
+            13,
+            1,
+            8,
+            26,
+            11,
+            23,
+            21,
+            19,
+            20,
+            9,
+            2,
+            9,
+            3,
+            3,
+            12,
+            12,
+            16,
+            0,
+            0,
+            0,
+            6,
+            6,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            0,
+            0,
+            11,
+            24,
+            26,
+            9,
+            10,
+            10,
+            21,
+            4,
+            4,
+            15,
+            15,
+            19,
+            17,
+            25,
+            4,
+            7,
+            7,
+            25,
+            25,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            20,
+            11,
+            11,
+            11,
+            13,
+            8,
+            25,
+            5,
+            18,
+            7,
+            0,
+            22,
+            22,
+            22,
+            24,
+            0,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            19,
+            19,
+            2,
+            2,
+            2,
+            22,
+            22,
+            15,
+            27,
+            5,
+            21,
+            13,
+            7,
+            11,
+            4,
+            17,
+            3,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            12,
+            12,
+            19,
+            17,
+            11,
+            16,
+            12,
+            12,
+            12,
+            12,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            27,
+            27,
+            23,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            0,
+            1,
+            11,
             11,
+            19,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            24,
+            1,
+            21,
+            18,
+            18,
+            18,
+            27,
+            17,
+            26,
+            4,
+            5,
+            5,
+            8,
+            8,
+            8,
+            5,
+            12,
+            5,
+            5,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            15,
+            15,
+            6,
+            22,
+            22,
+            17,
+            4,
+            19,
+            19,
+            1,
+            3,
+            3,
+            14,
+            12,
+            12,
+            17,
+            26,
+            23,
+            23,
+            24,
+            21,
+            0,
+            18,
+            18,
+            21,
+            21,
+            14,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
             2,
             2,
-            17,
-            27,
-            13,
-            7,
             18,
-            22,
-            13,
             18,
-            4,
-            22,
-            9,
-            0,
-            27,
-            12,
+            18,
             13,
+            10,
+            21,
             16,
-            16,
-            24,
-            13,
-            7,
-            13,
-            8,
-            14,
-            12,
-            6,
-            6,
-            4,
-            24,
-            5,
-            26,
-            12,
-            18,
-            27,
-            3,
-            11,
-            18,
-            3,
-            1,
-            8,
-            0,
-            27,
-            2,
-            26,
             11,
-            3,
-            8,
             11,
-            17,
-            26,
-            14,
-            13,
-            22,
             11,
-            13,
             25,
-            26,
-            19,
-            11,
-            4,
-            12,
-            4,
-            7,
+            25,
+            25,
+            10,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
             14,
-            21,
-            16,
-            8,
-            16,
             18,
-            15,
+            27,
             0,
-            20,
-            22,
-            17,
-            11,
-            10,
-            5,
-            16,
-            24,
-            23,
-            12,
             0,
-            13,
-            23,
-            27,
-            20,
-            24,
             19,
-            22,
-            0,
-            15,
-            26,
-            5,
-            9,
-            22,
-            25,
-            23,
+            16,
+            20,
             17,
+            24,
             13,
-            21,
-            19,
-            25,
-            9,
-            27,
-            19,
-            7,
-            0,
-            3,
-            27,
-            27,
-            10,
-            12,
-            15,
+            16,
             13,
-            4,
-            15,
-            4,
-            25,
-            5,
             24,
-            19,
-            4,
+            18,
+            18,
             7,
             9,
+            9,
+            10,
+            2,
             13,
-            13,
-            7,
+            24,
+            24,
+            24,
+            27,
+            27,
+            27,
+            27,
+            1,
+            1,
+            23,
+            14,
+            26,
             20,
-            21,
+            3,
+            3,
+            22,
+            22,
+            22,
             12,
+            11,
+            19,
+            22,
+            14,
+            17,
             21,
-            2,
-            20,
             21,
+            24,
+            2,
+            25,
+            25,
+            25,
+            25,
+            26,
+            26,
+            3,
+            3,
+            3,
+            3,
             17,
-            20,
-            9,
-            6,
-            27,
-            9,
-            27,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            18,
+            18,
+            14,
+            14,
             23,
-            9,
-            7,
+            20,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
             11,
             27,
-            22,
-            27,
-            10,
             27,
-            5,
-            25,
             27,
-            25,
+            12,
             12,
             9,
-            15,
-            26,
-            6,
-            17,
-            0,
-            18,
-            15,
+            9,
+            9,
+            19,
+            19,
+            7,
             15,
             15,
-            12,
-            17,
-            25,
             18,
-            26,
-            20,
-            9,
-            8,
-            17,
-            9,
-            2,
-            24,
-            13,
-            13,
-            21,
-            11,
-            23,
-            14,
-            8,
-            24,
             18,
             18,
             19,
-            25,
-            11,
-            18,
-            21,
+            19,
+            19,
+            19,
             2,
-            27,
             2,
-            0,
-            6,
-            0,
-            10,
-            17,
-            12,
-            26,
-            20,
-            5,
-            25,
             2,
-            15,
             21,
-            16,
-            8,
-            6,
-            24,
-            11,
-            24,
-            10,
-            6,
-            9,
-            7,
-            2,
-            26,
-            8,
             26,
             26,
-            16,
-            25,
-            21,
+            15,
+            15,
+            15,
             2,
-            6,
+            2,
+            17,
+            23,
+            23,
+            17,
+            16,
+            16,
+            18,
             18,
-            4,
             21,
+            8,
+            8,
+            15,
+            15,
+            26,
             26,
-            10,
-            24,
-            19,
-            13,
             19,
+            10,
+            10,
+            10,
+            16,
+            23,
             12,
-            11,
+            17,
+            9,
             9,
-            21,
-            4,
-            4,
             4,
-            16,
-            14,
-            18,
+            7,
+            9,
             9,
+            27,
+            7,
             0,
-            4,
-            19,
-            11,
-            6,
             0,
-            21,
-            19,
-            13,
-            19,
-            4,
-            15,
-            1,
-            24,
+            0,
+            10,
             10,
             12,
-            14,
-            23,
-            2,
-            17,
-            22,
-            15,
-            17,
-            7,
-            5,
-            24,
-            16,
-            6,
-            25,
             20,
-            2,
+            21,
             20,
-            13,
-            3,
-            6,
-            25,
-            10,
-            27,
-            0,
-            11,
             16,
-            24,
-            0,
-            11,
-            12,
-            6,
-            10,
+            16,
+            16,
+            2,
+            2,
+            2,
             14,
+            26,
             5,
-            20,
-            2,
-            4,
-            24,
-            13,
-            13,
-            4,
-            27,
-            4,
-            4,
+            5,
+            5,
+            5,
+            12,
+            10,
+            10,
+            10,
+            10,
+            10,
+            7,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
             14,
-            21,
-            19,
-            20,
             14,
-            2,
-            6,
             7,
-            17,
-            16,
+            7,
+            7,
+            7,
             0,
-            16,
-            14,
             0,
-            26,
             0,
-            1,
-            26,
-            2,
-            1,
-            13,
-            24,
-            25,
-            26,
-            15,
-            25,
-            24,
-            18,
-            25,
-            15,
-            24,
-            15,
-            19,
-            26,
-            23,
-            26,
-            26,
-            10,
-            11,
-            17,
-            8,
-            20,
             6,
             6,
-            22,
-            13,
-            22,
-            0,
-            10,
-            24,
-            5,
-            19,
-            15,
-            20,
             6,
-            4,
-            15,
-            20,
-            20,
-            4,
-            17,
-            23,
-            14,
-            4,
             23,
             16,
-            26,
-            25,
-            15,
-            26,
-            18,
-            2,
-            23,
-            21,
-            8,
-            21,
-            6,
-            26,
-            1,
+            16,
+            16,
             10,
-            11,
-            13,
-            17,
-            25,
+            3,
             0,
-            22,
-            27,
-            17,
+            18,
+            18,
             20,
-            21,
-            2,
-            12,
-            2,
-            3,
-            26,
-            10,
-            2,
+            0,
+            0,
+            6,
             6,
-            24,
-            24,
-            26,
-            13,
-            8,
-            2,
             25,
-            24,
-            17,
-            11,
-            12,
+            0,
+            20,
+            20,
+            20,
             4,
-            24,
-            14,
-            21,
-            19,
             4,
-            24,
-            24,
-            24,
-            1,
-            5,
-            21,
-            23,
-            15,
             4,
-            8,
-            7,
-            7,
-            19,
-            11,
-            21,
-            10,
             6,
-            15,
-            10,
-            15,
-            22,
-            15,
-            18,
             6,
-            5,
-            19,
-            1,
-            21,
+            6,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
             20,
-            2,
-            4,
-            1,
-            0,
-            3,
-            27,
-            7,
             20,
-            17,
-            1,
-            19,
-            13,
-            15,
-            4,
-            5,
-            11,
-            12,
-            17,
-            23,
-            7,
-            12,
-            8,
-            16,
-            8,
-            12,
-            2,
-            19,
-            10,
-            24,
-            6,
-            11,
-            4,
-            3,
-            15,
-            7,
-            0,
-            22,
-            26,
-            11,
-            17,
-            26,
-            8,
-            21,
-            9,
             20,
-            19,
-            26,
-            1,
-            7,
-            15,
-            2,
-            5,
-            16,
-            21,
-            27,
-            22,
-            16,
-            8,
-            5,
-            7,
-            2,
             20,
-            8,
             20,
-            21,
-            13,
-            0,
-            21,
-            11,
-            16,
-            18,
-            13,
-            18,
-            5,
-            13,
-            25,
-            19,
-            6,
-            27,
-            15,
-            12,
-            2,
-            2,
-            5,
             20,
-            5,
-            13,
-            18,
-            19,
-            24,
-            7,
-            18,
-            23,
-            15,
-            13,
-            3,
-            4,
-            1,
-            13,
-            19,
-            17,
-            26,
-            11,
-            0,
-            18,
-            25,
-            24,
-            11,
-            8,
-            11,
             26,
-            5,
-            18,
             11,
-            0,
-            25,
-            2,
-            27,
-            15,
-            18,
-            5,
-            18,
             1,
-            9,
-            6,
             1,
-            13,
-            5,
             1,
-            18,
-            18,
-            25,
-            9,
-            18,
-            18,
-            27,
-            23,
-            21,
-            4,
-            13,
-            0,
-            5,
-            2,
-            25,
-            25,
             1,
-            11,
-            20,
-            25,
-            3,
             1,
-            21,
-            3,
-            20,
-            2,
-            15,
-            3,
-            0,
             1,
-            14,
-            10,
-            26,
-            20,
-            18,
-            21,
-            19,
-            24,
-            11,
-            12,
-            18,
-            24,
-            13,
-            8,
-            6,
-            18,
-            27,
-            8,
-            26,
-            14,
-            7,
-            7,
-            27,
-            14,
-            7,
-            17,
             1,
-            15,
-            8,
-            10,
-            13,
-            27,
-            10,
-            10,
-            2,
-            12,
-            12,
-            16,
-            3,
-            14,
-            0,
-            11,
-            21,
-            10,
-            12,
-            24,
-            0,
-            24,
-            17,
-            25,
-            2,
-            19,
-            26,
-            17,
-            15,
-            8,
-            7,
-            6,
-            23,
-            22,
             1,
-            7,
-            15,
-            7,
-            25,
-            5,
-            20,
-            20,
-            15,
-            4,
-            18,
-            13,
-            21,
-            5,
-            19,
-            18,
             1,
-            6,
-            27,
-            14,
-            24,
-            3,
-            16,
-            3,
-            2,
-            27,
-            13,
-            11,
-            7,
-            23,
-            27,
             1,
-            5,
-            10,
-            21,
             1,
-            12,
-            24,
-            12,
-            20,
-            17,
-            6,
-            24,
-            12,
-            20,
-            8,
-            3,
-            22,
-            9,
-            14,
-            8,
-            12,
-            21,
-            23,
-            15,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            25,
+            25,
             14,
-            22,
             27,
-            22,
-            0,
-            4,
-            25,
-            6,
-            6,
-            13,
             5,
             12,
             1,
-            26,
-            27,
-            9,
-            19,
-            11,
-            4,
-            19,
             1,
-            10,
-            25,
-            12,
-            19,
-            12,
-            6,
-            11,
-            16,
-            13,
-            23,
-            2,
-            4,
-            18,
-            2,
             0,
-            5,
-            21,
-            17,
-            3,
-            22,
-            11,
-            19,
-            4,
-            10,
             0,
-            10,
-            13,
-            7,
-            7,
-            23,
-            12,
-            1,
-            3,
-            25,
-            17,
             0,
-            5,
-            6,
-            20,
-            9,
-            23,
-            17,
-            1,
-            21,
-            4,
-            24,
-            7,
-            6,
-            26,
-            11,
-            24,
-            23,
-            9,
-            8,
-            7,
-            7,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            16,
+            16,
             22,
-            8,
-            23,
-            0,
+            27,
             24,
-            25,
-            15,
+            21,
+            21,
+            21,
+            8,
             8,
-            14,
             20,
             2,
-            27,
-            10,
-            5,
-            7,
-            5,
+            2,
             22,
             19,
-            2,
-            20,
-            14,
-            22,
-            4,
-            21,
             24,
-            0,
-            5,
-            9,
-            12,
-            26,
-            1,
-            6,
-            4,
-            10,
-            23,
             24,
-            10,
             13,
-            5,
-            25,
-            18,
-            1,
-            5,
-            9,
-            19,
-            0,
-            24,
-            15,
-            9,
-            23,
+            10,
             4,
-            26,
-            27,
             14,
-            13,
-            7,
-            20,
             18,
-            24,
-            9,
-            4,
-            10,
-            0,
-            25,
-            13,
-            14,
-            26,
             16,
-            0,
-            27,
-            25,
-            20,
-            26,
-            18,
             16,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
             23,
-            1,
-            17,
             23,
-            27,
-            5,
-            17,
-            8,
-            10,
-            27,
-            9,
-            18,
-            2,
             23,
-            1,
-            20,
-            3,
             23,
-            27,
-            18,
-            10,
-            9,
-            15,
-            20,
-            8,
-            25,
-            10,
-            7,
-            22,
-            10,
-            10,
-            21,
-            1,
-            10,
-            14,
-            27,
-            16,
-            8,
-            4,
-            27,
-            15,
-            9,
-            10,
-            9,
-            5,
-            14,
-            26,
-            10,
-            4,
-            18,
-            6,
-            3,
-            8,
-            20,
-            12,
-            16,
             1,
-            26,
-            12,
-            9,
-            14,
-            7,
-            25,
-            5,
-            9,
-            19,
-            12,
             22,
-            15,
-            4,
-            21,
-            21,
-            12,
-            11,
-            1,
-            3,
-            16,
-            8,
-            10,
-            16,
-            26,
-            24,
-            15,
-            26,
-            12,
-            18,
-            15,
-            7,
-            12,
-            1,
-            9,
-            2,
-            6,
-            16,
-            18,
-            7,
-            10,
-            24,
-            7,
-            20,
-            16,
-            26,
-            10,
-            12,
-            17,
-            20,
-            15,
-            23,
-            2,
-            26,
-            16,
-            12,
-            18,
-            2,
-            14,
-            15,
-            4,
-            4,
-            25,
             22,
+            6,
+            6,
             2,
-            9,
-            5,
-            0,
             2,
-            13,
-            26,
-            14,
-            14,
-            5,
-            10,
             22,
-            15,
-            0,
-            13,
-            27,
-            9,
-            19,
-            16,
-            0,
             7,
-            21,
-            1,
-            18,
-            22,
-            8,
-            17,
-            6,
-            6,
-            21,
-            11,
-            0,
-            3,
-            13,
-            5,
-            1,
-            21,
-            3,
-            1,
-            27,
-            16,
-            9,
             7,
-            20,
-            15,
-            16,
-            0,
-            25,
-            0,
-            0,
-            0,
-            27,
-            13,
-            0,
-            11,
-            11,
-            22,
-            17,
-            5,
-            27,
-            15,
-            14,
-            26,
-            26,
-            13,
-            10,
-            8,
-            10,
-            20,
-            27,
-            16,
-            1,
-            5,
-            25,
-            14,
-            27,
-            17,
-            8,
             7,
-            24,
-            27,
-            24,
-            9,
-            27,
-            1,
-            5,
-            16,
-            6,
-            24,
-            2,
-            2,
-            11,
-            17,
-            3,
-            12,
-            20,
-            0,
-            22,
             7,
-            14,
-            11,
-            22,
-            18,
-            26,
-            6,
-            1,
-            14,
-            16,
-            18,
-            0,
-            23,
-            5,
-            22,
-            3,
-            18,
-            21,
-            26,
-            10,
-            16,
-            18,
-            14,
-            27,
-            16,
-            22,
-            22,
             7,
-            13,
-            27,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            2,
             15,
-            16,
             15,
-            14,
-            4,
-            6,
-            19,
-            24,
-            23,
-            6,
-            17,
-            6,
-            6,
-            16,
-            19,
-            10,
-            4,
-            12,
-            12,
-            5,
-            10,
-            13,
-            4,
-            8,
-            7,
-            1,
-            5,
-            17,
-            16,
             15,
-            14,
-            19,
-            8,
-            2,
             24,
             27,
-            21,
-            25,
-            27,
             24,
-            17,
-            15,
-            13,
-            3,
-            18,
-            6,
-            15,
-            11,
-            4,
-            7,
-            18,
-            3,
-            5,
-            10,
-            8,
             12,
-            15,
             12,
             19,
-            27,
-            16,
-            10,
-            12,
-            16,
-            24,
-            26,
-            26,
-            26,
-            7,
-            24,
-            17,
-            1,
-            11,
-            14,
-            18,
-            24,
-            5,
-            20,
-            13,
-            16,
-            12,
-            4,
-            10,
-            2,
-            21,
             19,
-            24,
-            24,
-            18,
-            6,
-            11,
-            5,
-            12,
-            9,
-            23,
-            1,
-            2,
-            1,
-            8,
-            0,
-            16,
-            9,
-            11,
-            15,
-            26,
-            1,
-            18,
-            16,
-            14,
-            9,
-            9,
-            4,
-            1,
-            9,
-            17,
-            1,
-            13,
-            11,
-            22,
-            26,
-            27,
             19,
-            7,
-            14,
-            10,
-            15,
-            24,
-            4,
-            15,
-            7,
-            15,
-            11,
-            12,
-            26,
-            20,
-            27,
-            22,
-            21,
-            17,
-            14,
-            16,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
             1,
-            21,
             13,
-            12,
-            6,
-            18,
-            22,
-            10,
-            20,
-            8,
-            6,
-            25,
-            24,
             19,
-            4,
-            8,
-            26,
-            22,
-            18,
-            8,
-            0,
-            18,
-            17,
-            16,
-            13,
-            21,
-            16,
-            22,
-            0,
-            0,
-            14,
-            10,
-            2,
-            12,
-            3,
-            27,
-            1,
-            18,
+            19,
             6,
-            26,
-            4,
-            20,
-            24,
-            5,
-            2,
-            21,
-            12,
-            0,
-            5,
             15,
-            20,
-            7,
-            13,
-            18,
-            3,
-            6,
-            23,
-            27,
-            3,
-            10,
-            16,
-            9,
             22,
             6,
-            6,
-            6,
             1,
-            23,
-            4,
-            25,
-            18,
             12,
-            0,
-            22,
-            0,
-            5,
-            7,
-            19,
-            18,
-            15,
-            18,
-            26,
-            16,
-            11,
-            24,
-            5,
-            19,
-            17,
-            21,
-            9,
-            26,
-            18,
-            26,
-            18,
-            2,
-            14,
-            3,
-            7,
-            14,
-            19,
-            21,
-            22,
-            8,
-            6,
-            19,
-            22,
-            14,
-            4,
-            20,
-            21,
-            2,
-            26,
-            20,
-            8,
-            18,
-            13,
-            13,
             12,
-            6,
+            25,
             19,
-            10,
-            1,
-            6,
-            1,
-            1,
-            26,
-            18,
-            1,
-            23,
-            7,
-            14,
-            15,
             19,
-            18,
-            13,
-            8,
-            16,
-            25,
-            9,
-            9,
             11,
-            24,
-            25,
-            14,
-            18,
+            11,
             18,
-            23,
-            13,
+            20,
+            27,
             15,
-            16,
-            26,
-            19,
-            19,
-            6,
-            23,
-            4,
-            12,
-            25,
-            22,
-            1,
             15,
+            11,
+            11,
+            11,
+            13,
             23,
-            3,
-            5,
-            2,
             17,
-            27,
-            9,
-            6,
-            10,
-            24,
-            5,
-            5,
-            19,
-            9,
-            1,
-            6,
-            2,
-            20,
-            11,
-            7,
-            23,
-            27,
-            0,
-            25,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            4,
             4,
-            3,
-            27,
             15,
-            6,
-            20,
-            26,
-            26,
-            0,
-            8,
-            3,
             1,
-            13,
-            19,
-            17,
-            17,
-            13,
-            25,
-            22,
+            1,
             0,
-            14,
             25,
-            2,
-            7,
-            0,
+            24,
             5,
-            11,
-            25,
-            25,
-            21,
-            17,
-            27,
-            3,
-            22,
-            3,
-            0,
-            4,
-            22,
-            26,
-            3,
+            5,
+            14,
+            14,
             15,
-            6,
             5,
-            21,
+            5,
             12,
+            12,
+            13,
+            13,
             21,
-            16,
-            18,
-            18,
-            14,
-            22,
-            6,
-            22,
-            5,
-            0,
-            26,
+            21,
+            4,
+            2,
+            19,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            23,
+            23,
+            1,
+            1,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
             8,
-            7,
-            17,
-            24,
-            9,
-            10,
-            1,
-            26,
-            10,
-            1,
-            10,
             8,
-            11,
-            9,
-            11,
-            19,
-            11,
-            27,
-            20,
-            20,
-            20,
-            21,
-            13,
-            5,
-            2,
-            22,
-            2,
-            16,
             8,
-            12,
-            0,
-            27,
-            12,
-            23,
-            13,
-            21,
-            5,
-            15,
-            4,
-            9,
-            22,
-            22,
-            23,
-            7,
-            25,
-            18,
-            11,
-            11,
-            10,
-            21,
-            12,
-            25,
             8,
-            19,
-            7,
-            2,
-            17,
-            19,
-            4,
             8,
-            27,
-            7,
-            24,
-            16,
-            26,
-            16,
-            4,
-            23,
-            17,
-            1,
-            26,
-            11,
-            19,
-            12,
-            12,
-            6,
-            22,
             8,
-            3,
-            20,
-            21,
-            11,
-            5,
-            12,
-            2,
-            25,
-            0,
-            6,
-            13,
-            4,
-            26,
-            16,
-            15,
-            27,
-            4,
-            24,
-            19,
-            5,
-            23,
             8,
-            10,
-            22,
-            23,
-            1,
-            14,
-            22,
-            22,
-            2,
-            10,
-            19,
-            2,
-            17,
-            3,
             8,
-            3,
-            17,
-            14,
             8,
-            27,
-            14,
-            26,
-            6,
-            23,
-            21,
-            27,
-            12,
             8,
-            11,
-            14,
-            12,
-            6,
-            18,
-            25,
-            24,
-            6,
-            25,
-            16,
-            13,
-            9,
-            22,
-            7,
-            24,
-            25,
-            18,
-            25,
-            25,
-            2,
-            26,
-            7,
-            25,
-            6,
-            16,
-            10,
-            5,
-            3,
-            14,
-            0,
-            5,
-            18,
-            4,
-            23,
-            17,
-            11,
-            21,
-            0,
-            20,
-            9,
-            1,
-            3,
-            7,
-            12,
-            21,
-            26,
-            2,
-            12,
-            14,
-            5,
-            11,
-            13,
-            9,
-            13,
-            21,
-            19,
-            19,
-            18,
-            4,
-            27,
-            20,
-            10,
             8,
-            6,
-            17,
-            10,
-            26,
             8,
-            22,
-            23,
-            18,
-            6,
-            11,
-            13,
-            1,
-            13,
-            21,
-            5,
-            7,
-            0,
-            16,
-            22,
-            25,
-            1,
-            9,
-            22,
-            11,
-            20,
-            25,
-            16,
-            15,
-            21,
-            16,
-            4,
-            22,
-            21,
-            20,
-            9,
-            15,
-            4,
-            6,
-            0,
-            26,
-            15,
-            12,
-            19,
-            17,
-            26,
-            17,
-            16,
-            21,
-            7,
-            2,
-            16,
-            27,
-            9,
-            18,
-            4,
-            14,
-            21,
-            4,
-            14,
-            17,
-            26,
-            2,
             8,
-            24,
             8,
-            9,
-            26,
-            0,
-            18,
-            17,
-            23,
-            12,
-            5,
-            24,
-            1,
-            17,
-            11,
-            19,
-            0,
-            27,
-            11,
-            20,
-            3,
-            15,
-            27,
             26,
-            4,
-            19,
-            18,
-            13,
-            27,
             1,
             1,
-            17,
-            24,
+            10,
             20,
-            17,
-            27,
-            9,
-            21,
-            11,
-            1,
-            5,
-            1,
-            18,
-            1,
-            11,
             20,
-            2,
-            2,
-            5,
-            15,
-            6,
             14,
-            8,
-            12,
-            16,
-            26,
-            2,
-            19,
-            23,
-            13,
-            7,
             3,
-            25,
-            25,
-            6,
-            1,
-            6,
-            25,
-            20,
-            0,
-            14,
-            14,
-            19,
-            9,
-            5,
-            22,
-            9,
-            5,
-            11,
-            23,
-            0,
-            25,
-            14,
-            14,
-            23,
-            1,
-            21,
-            23,
-            12,
-            23,
-            14,
-            16,
-            23,
-            5,
-            12,
-            17,
-            20,
-            11,
-            1,
-            1,
-            4,
-            7,
-            23,
-            9,
-            25,
-            0,
             3,
-            12,
-            10,
-            7,
-            10,
-            4,
-            10,
-            17,
-            2,
-            21,
-            8,
-            21,
-            1,
-            8,
-            18,
-            22,
-            8,
-            26,
-            7,
-            6,
-            2,
-            18,
-            10,
-            10,
-            11,
-            12,
-            4,
-            16,
             17,
             0,
-            7,
-            4,
-            27,
-            3,
-            1,
-            4,
-            8,
-            16,
+            0,
+            0,
+            9,
+            9,
             27,
-            13,
-            17,
             27,
-            19,
-            14,
-            2,
-            3,
-            24,
-            14,
-            15,
-            10,
-            16,
-            8,
-            19,
             21,
-            26,
-            5,
-            2,
-            1,
-            17,
             21,
-            7,
-            2,
-            3,
-            22,
             21,
-            20,
+            9,
+            9,
             3,
-            24,
-            19,
-            8,
-            10,
-            27,
-            18,
-            2,
-            7,
-            7,
-            19,
-            27,
-            25,
-            19,
-            2,
-            2,
+            6,
             10,
-            8,
-            13,
-            12,
             10,
-            15,
-            8,
-            15,
+            5,
+            5,
+            6,
+            6,
+            6,
+            21,
             21,
             26,
-            12,
-            27,
-            19,
-            12,
-            9,
-            6,
-            3,
-            1,
-            16,
-            5,
-            4,
-            18,
-            10,
-            20,
-            25,
-            10,
-            27,
-            3,
-            27,
             9,
-            13,
             24,
-            25,
-            13,
-            17,
-            13,
-            27,
-            11,
-            13,
-            27,
-            14,
-            13,
-            1,
-            1,
-            19,
-            17,
+            20,
+            20,
+            20,
+            8,
             26,
-            13,
             24,
+            15,
+            5,
             20,
+            21,
+            21,
+            21,
+            0,
+            18,
+            18,
+            9,
+            9,
+            4,
+            13,
             5,
-            8,
-            23,
-            3,
+            4,
             17,
-            16,
-            24,
-            18,
-            1,
-            6,
-            2,
-            2,
-            0,
-            25,
-            6,
-            20,
-            2,
+            5,
+            26,
             17,
+            10,
             27,
-            4,
+            15,
+            15,
+            24,
+            24,
+            15,
+            15,
+            21,
+            21,
+            21,
+            21,
             27,
-            19,
-            0,
-            8,
-            13,
-            19,
-            8,
             6,
+            18,
+            18,
+            26,
+            26,
+            15,
+            15,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
             3,
-            19,
-            12,
-            20,
             7,
             17,
+            17,
+            5,
+            5,
+            1,
+            11,
+            20,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
             25,
-            10,
-            19,
+            25,
+            7,
             19,
-            22,
-            4,
-            4,
-            18,
-            10,
+            13,
+            14,
             17,
-            2,
-            19,
-            20,
-            1,
-            25,
             17,
-            9,
-            11,
-            12,
             17,
-            19,
-            5,
-            7,
-            27,
-            6,
-            24,
-            16,
-            26,
-            27,
             17,
-            9,
-            0,
-            18,
-            9,
-            12,
-            0,
-            24,
-            26,
-            21,
             11,
-            3,
-            5,
-            7,
-            26,
-            25,
-            5,
-            21,
-            16,
-            12,
-            21,
-            13,
-            21,
-            0,
-            23,
-            13,
             12,
-            2,
-            22,
-            13,
             14,
+            7,
+            0,
             17,
-            25,
-            24,
-            5,
-            3,
+            2,
             26,
-            3,
-            20,
-            11,
-            5,
-            23,
-            3,
-            14,
+            26,
+            26,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
             6,
-            7,
             17,
-            11,
-            21,
-            1,
-            14,
-            1,
-            4,
-            24,
-            21,
-            16,
-            3,
             17,
-            0,
-            4,
-            1,
-            15,
-            26,
             6,
-            7,
-            10,
-            14,
-            22,
-            13,
-            26,
-            14,
-            20,
-            18,
+            6,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
             17,
+            27,
+            25,
+            2,
+            2,
+            2,
             11,
             11,
-            15,
-            11,
-            20,
-            8,
-            23,
-            27,
-            24,
-            1,
-            13,
+            6,
+            6,
+            22,
             8,
-            12,
-            5,
             8,
-            3,
-            12,
-            4,
-            24,
-            19,
-            22,
-            18,
-            23,
-            21,
-            7,
-            4,
-            22,
-            24,
-            22,
-            17,
-            20,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
             2,
-            19,
-            25,
-            8,
-            27,
-            9,
-            24,
             11,
-            24,
-            19,
-            10,
-            0,
-            0,
-            11,
-            6,
-            3,
-            25,
             13,
-            26,
-            25,
-            15,
-            11,
             13,
-            10,
-            27,
             13,
-            7,
-            19,
-            6,
-            1,
-            3,
-            6,
-            24,
-            2,
-            22,
-            23,
-            9,
-            10,
-            27,
-            16,
-            23,
-            0,
-            21,
-            7,
-            15,
-            23,
-            9,
-            18,
-            19,
-            17,
-            11,
-            0,
-            7,
-            4,
-            8,
-            10,
-            20,
-            6,
+            13,
             25,
-            11,
-            21,
-            21,
+            20,
             16,
-            18,
             27,
-            20,
             27,
+            27,
+            1,
+            1,
+            1,
             20,
-            18,
-            24,
-            13,
-            14,
             20,
+            14,
             10,
-            5,
-            21,
-            6,
-            12,
-            11,
-            23,
-            11,
-            27,
-            7,
-            0,
-            4,
-            4,
-            10,
-            15,
-            19,
             14,
-            2,
-            5,
-            4,
-            21,
-            11,
-            1,
-            27,
-            8,
-            7,
             16,
+            16,
+            6,
+            1,
+            1,
             19,
-            17,
-            18,
-            5,
-            17,
+            0,
+            0,
+            9,
+            9,
+            16,
+            16,
+            16,
+            8,
+            8,
             22,
-            18,
+            6,
+            6,
+            6,
+            6,
+            23,
             3,
-            9,
+            3,
+            10,
+            21,
+            21,
+            16,
+            8,
+            24,
             24,
             23,
-            10,
-            20,
-            22,
             23,
-            6,
+            24,
+            24,
+            1,
+            1,
+            20,
+        ],
+        "targets": [
+            10,
+            10,
+            10,
+            21,
+            3,
+            19,
+            19,
+            9,
+            8,
             8,
+            8,
+            11,
+            21,
             2,
-            25,
-            23,
-            15,
-            23,
-            15,
-            16,
             17,
+            25,
             19,
+            7,
             20,
-            27,
-            26,
-            20,
-            9,
-            23,
-            13,
-            18,
-            17,
-            27,
-            27,
             5,
+            25,
             16,
-            14,
-            0,
-            11,
-            3,
-            20,
-            0,
+            4,
             26,
+            16,
             25,
             25,
-            14,
-            18,
-            20,
+            15,
+            15,
+            11,
+            12,
+            12,
             12,
+            3,
+            3,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            21,
+            20,
+            20,
+            9,
             5,
             2,
-            4,
-            2,
+            12,
+            7,
+            7,
+            23,
+            23,
+            12,
+            21,
+            21,
+            27,
+            14,
+            23,
+            27,
+            1,
+            1,
             8,
-            16,
+            8,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            15,
             15,
-            0,
-            9,
-            13,
-            0,
-            22,
-            13,
-            4,
-            7,
-            17,
-            23,
-            10,
-            11,
-            6,
-            27,
-            16,
-            16,
-            0,
             15,
+            15,
+            15,
+            15,
+            15,
+            15,
+            3,
+            4,
             4,
             4,
-            7,
-            22,
-            1,
-            18,
-            14,
-            9,
-            10,
-            3,
-            18,
-            8,
-            8,
-            27,
-            9,
-            18,
-            16,
-            9,
-            26,
-            21,
-            22,
-            19,
-            25,
-            18,
-            14,
-            5,
-            9,
-            18,
             15,
-            18,
-            24,
-            9,
+            11,
             9,
             2,
-            13,
-            19,
-            21,
-            3,
-            18,
-            5,
-            27,
-            6,
-            8,
-            0,
-            8,
-            12,
-            23,
-            13,
-            18,
-            3,
-            19,
-            17,
-            10,
-            27,
-            22,
-            8,
-            23,
-            0,
-            1,
-            3,
-            18,
-            1,
-            22,
-            17,
-            8,
-            5,
-            22,
-            4,
-            2,
-            3,
-            7,
-            15,
-            25,
-            18,
-            20,
-            14,
-            5,
-            13,
-            17,
             14,
+            25,
+            16,
             11,
-            3,
-            6,
-            27,
-            13,
-            7,
             11,
-            24,
-            6,
-            17,
-            12,
-            9,
-            20,
-            6,
-            23,
-            17,
             11,
-            6,
-            18,
-            20,
             18,
+            15,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            5,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
             0,
-            22,
-            11,
-            17,
-            24,
-            7,
-            10,
-            1,
-            3,
             0,
-            6,
-            4,
-            10,
-            2,
-            25,
-            21,
-            1,
-            26,
-            18,
-            17,
-            6,
-            26,
-            20,
-            18,
-            7,
-            19,
-            14,
-            5,
-            22,
-            10,
-            20,
-            22,
-            27,
-            10,
             0,
-            4,
-            16,
-            10,
-            1,
-            21,
-            15,
-            14,
-            22,
-            26,
-            10,
-            23,
-            20,
-            9,
-            13,
-            27,
             0,
-            11,
-            26,
-            23,
-            21,
-            25,
-            12,
-            25,
-            1,
-            9,
-            18,
-            9,
-            11,
-            21,
-            16,
-            26,
-            21,
-            15,
-            17,
-            18,
-            6,
-            4,
-            17,
-            2,
-            6,
-            7,
-            6,
-            22,
-            27,
-            8,
             0,
-            7,
-            14,
-            20,
-            11,
-            25,
-            23,
-            10,
-            26,
-            4,
-            3,
-            6,
-            1,
-            2,
-            27,
-            23,
-            9,
-            5,
-            9,
-            5,
-            2,
-            15,
-            27,
-            10,
-            3,
-            17,
-            15,
-            6,
-            2,
-            11,
-            12,
-            10,
-            2,
-            21,
             0,
-            13,
-            1,
-            8,
-            27,
-            2,
-            20,
             0,
-            13,
-            14,
-            12,
-            3,
-            12,
-            10,
             0,
-            18,
-            15,
-            21,
             0,
-            9,
-            23,
-            11,
-            12,
-            17,
-            2,
-            19,
-            23,
-            13,
-            5,
-            18,
-            18,
-            1,
-            20,
-            8,
-            1,
-            8,
-            25,
-            7,
-            6,
-            14,
-            2,
-            5,
-            26,
-            10,
-            7,
-            14,
-            2,
             0,
-            12,
-            22,
-            15,
-            1,
-            3,
-            2,
-            15,
-            8,
-            5,
-            26,
-            10,
-            17,
-            25,
-            16,
-            13,
-            14,
-            4,
-            8,
-            27,
-            2,
-            16,
-            4,
-            21,
-            6,
-            9,
-            7,
-            17,
-            7,
-            7,
-            24,
-            17,
-            15,
-            17,
-            12,
-            6,
             0,
-            7,
-            19,
-            26,
-            21,
-            20,
-            26,
-            13,
-            14,
-            24,
-            3,
-            2,
-            11,
-            21,
-            13,
-            27,
-            3,
-            8,
-            24,
             0,
-            24,
-            19,
-            9,
-            2,
-            21,
-            12,
-            10,
-            12,
-            15,
-            14,
             0,
-            17,
             0,
-            25,
-            9,
-            14,
-            21,
-            24,
-            21,
-            3,
-            5,
-            20,
-            26,
-            19,
             0,
-            9,
-            12,
-            13,
-            5,
-            7,
-            11,
-            20,
-            7,
-            8,
-            18,
-            10,
-            6,
-            4,
-            6,
-            23,
-            24,
-            26,
-            18,
             0,
-            13,
-            17,
-            2,
-            3,
-            6,
-            18,
-            12,
-            8,
-            13,
-            17,
-            14,
-            26,
-            14,
-            18,
-            11,
-            22,
-            21,
-            15,
-            10,
-            23,
-            13,
-            21,
-            20,
-            1,
-            5,
-            3,
             0,
             0,
-            9,
-            7,
-            4,
-            11,
-            22,
-            23,
-            18,
-            26,
-            27,
-            5,
-            15,
-            23,
-            11,
-            23,
             0,
-            19,
-            19,
-            18,
-            21,
-            10,
-            9,
-            27,
-            5,
-            24,
-            12,
-            8,
-            25,
-            26,
-            18,
-            18,
-            19,
-            5,
-            21,
-            15,
-            3,
-            10,
-            12,
-            12,
-            10,
             0,
-            2,
-            12,
-            25,
-            22,
-            14,
-            7,
-            12,
-            7,
-            8,
-            9,
-            25,
             0,
-            16,
-            13,
-            22,
-            2,
-            15,
-            22,
-            17,
-            2,
-            9,
-            8,
-            7,
-            16,
-            20,
-            12,
-            26,
-            7,
-            8,
-            2,
-            20,
-            5,
-            7,
-            21,
-            19,
-            2,
-            11,
-            2,
-            27,
-            18,
-            4,
-            5,
-            14,
-            23,
-            20,
-            26,
-            16,
-            26,
-            10,
-            22,
-            20,
-            14,
-            15,
-            11,
-            12,
-            3,
-            13,
-            1,
-            1,
-            24,
-            26,
-            7,
-            6,
-            14,
-            24,
-            26,
-            24,
-            6,
-            20,
             0,
-            16,
-            26,
-            18,
-            22,
-            21,
-            12,
             0,
-            10,
-            5,
-            14,
-            18,
-            26,
-            23,
-            6,
-            12,
-            7,
-            24,
-            15,
-            16,
-            20,
-            9,
-            26,
-            2,
-            18,
             0,
-            6,
-            3,
-            9,
-            21,
-            10,
-            24,
-            13,
-            8,
-            5,
-            12,
-            2,
-            1,
-            20,
-            10,
-            24,
-            9,
-            25,
-            1,
             0,
-            13,
-            12,
-            5,
-            21,
-            17,
-            4,
-            10,
-            26,
-            17,
-            12,
-            19,
-            3,
-            16,
-            4,
-            15,
-            6,
-            22,
-            14,
-            10,
-            3,
-            10,
-            27,
-            6,
-            14,
-            18,
-            14,
-            6,
-            1,
-            11,
-            21,
-            4,
-            1,
-            10,
-            20,
-            5,
-            9,
-            26,
-            26,
-            3,
-            8,
-            16,
-            27,
-            5,
-            16,
-            19,
-            15,
-            11,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            0,
+            23,
+            23,
+            24,
+            24,
+            24,
+            0,
+            0,
             11,
-            5,
             6,
+            10,
+            24,
+            19,
+            27,
+            24,
+            16,
             9,
-            4,
-            12,
-            25,
-            12,
             22,
-            7,
-            3,
-            14,
-            13,
-            1,
-            18,
-            2,
-            2,
             0,
-            20,
-            3,
-            14,
-            13,
             0,
-            1,
-            21,
-            10,
-            15,
-            27,
-            17,
-            8,
-            23,
-            12,
-            11,
+            0,
+            0,
+            0,
+            0,
+            18,
+            18,
+            16,
             6,
-            27,
+            8,
             14,
-            3,
-            1,
-            2,
-            21,
-            2,
-            0,
+            25,
+            25,
+            25,
+            25,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
+            9,
             9,
-            10,
-            2,
-            4,
             9,
-            26,
-            24,
-            17,
-            23,
-            15,
-            16,
-            0,
-            23,
-            24,
             9,
             9,
-            8,
             9,
             9,
-            21,
-            18,
-            13,
             9,
-            24,
-            4,
-            14,
-            26,
-            11,
-            17,
-            12,
-            8,
-            26,
-            19,
-            25,
-            0,
-            13,
-            26,
-            22,
-            13,
-            16,
-            11,
-            16,
-            7,
-            17,
-            10,
-            11,
-            21,
             9,
-            0,
-            15,
             22,
-            21,
-            2,
+            22,
             15,
-            25,
-            26,
-            3,
-            16,
-            9,
-            14,
-            0,
             6,
-            9,
-            24,
-            13,
-            16,
-            0,
-            25,
-            18,
-            17,
-            17,
-            13,
-            27,
-            10,
-            13,
-            10,
-            0,
-            13,
-            0,
-            24,
-            10,
-            22,
-            3,
-            27,
-            17,
-            4,
-            4,
-            2,
-            4,
-            23,
-            22,
-            18,
-            23,
-            15,
-            1,
-            4,
-            18,
-            11,
-            10,
             6,
-            21,
-            12,
-            11,
-            1,
-            11,
-            5,
-            1,
-            4,
-            5,
-            1,
-            19,
-            9,
-            14,
-            1,
-            2,
-            8,
-            10,
-            22,
-            23,
-            20,
-            26,
-            3,
-            13,
-            26,
-            12,
-            2,
-            26,
-            9,
-            8,
-            19,
-            1,
-            17,
-            3,
-            0,
             6,
-            24,
-            25,
-            3,
-            20,
-            19,
-            19,
-            24,
-            26,
-            1,
-            21,
-            8,
-            0,
             6,
-            17,
-            24,
-            0,
-            23,
-            1,
-            5,
             6,
             6,
-            2,
-            27,
-            25,
-            26,
-            23,
-            4,
-            11,
-            3,
-            9,
-            8,
-            16,
-            26,
-            4,
-            21,
-            10,
-            10,
-            15,
-            22,
             6,
-            14,
-            5,
-            26,
-            22,
-            20,
-            2,
-            23,
-            24,
-            12,
-            5,
-            19,
-            15,
-            22,
-            27,
-            2,
-            17,
-            27,
-            8,
-            15,
-            25,
-            15,
-            19,
-            8,
-            24,
             6,
-            5,
-            17,
-            3,
-            5,
             6,
-            8,
-            8,
-            16,
             6,
-            5,
-            16,
-            20,
-            9,
-            17,
-            17,
-            3,
-            9,
-            18,
-            2,
-            4,
-            18,
-            2,
-            7,
-            7,
-            15,
-            10,
-            20,
-            4,
-            24,
-            20,
-            18,
-            14,
-            1,
-            8,
             6,
-            26,
             6,
-            11,
-            11,
-            24,
-            15,
-            14,
-            4,
-            3,
-            26,
-            7,
-            19,
-            11,
-            20,
-            5,
-            17,
-            25,
-            24,
-            24,
-            25,
-            3,
-            5,
-            10,
-            5,
-            25,
-            20,
-            17,
-            1,
-            16,
-            7,
-            1,
-            21,
-            13,
-            15,
-            14,
-            5,
-            0,
-            25,
-            4,
-            25,
-            24,
             6,
-            26,
-            17,
-            0,
-            22,
-            15,
-            25,
-            12,
-            9,
-            11,
-            13,
-            7,
-            26,
-            23,
-            8,
-            3,
-            27,
-            26,
-            8,
-            22,
-            15,
-            19,
-            25,
-            27,
-            21,
-            21,
-            13,
-            3,
-            9,
-            19,
-            27,
-            27,
-            12,
-            5,
-            5,
-            5,
-            19,
-            21,
-            23,
-            7,
-            7,
             6,
-            1,
-            3,
-            12,
-            2,
-            22,
-            27,
-            13,
-            22,
-            5,
-            1,
-            20,
             6,
-            8,
-            12,
-            5,
-            27,
             6,
-            7,
-            1,
-            0,
-            14,
-            0,
-            8,
-            21,
-            27,
-            19,
-            26,
-            22,
-            22,
-            11,
-            1,
-            0,
-            26,
-            24,
-            14,
-            11,
-            0,
-            4,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
+            6,
             19,
-            3,
-            7,
-            13,
-            23,
-            9,
-            26,
-            13,
             10,
-        ],
-        "targets": [
-            11,
-            2,
-            2,
             17,
-            27,
-            13,
-            7,
-            18,
-            0,
-            13,
-            18,
-            4,
-            22,
-            13,
-            0,
-            27,
-            24,
-            13,
-            16,
-            16,
-            24,
-            13,
-            19,
-            13,
-            8,
-            3,
-            12,
-            6,
-            6,
-            4,
-            24,
-            5,
-            26,
-            12,
-            18,
-            27,
-            12,
-            11,
-            18,
-            3,
-            1,
-            11,
-            0,
-            27,
-            2,
-            26,
-            11,
-            3,
-            8,
-            11,
             17,
-            26,
-            14,
-            13,
-            22,
-            11,
-            13,
-            25,
-            26,
-            24,
             11,
             4,
-            12,
             4,
-            7,
-            14,
-            21,
-            16,
-            8,
-            16,
-            18,
-            19,
-            0,
-            20,
-            22,
-            17,
-            11,
-            10,
-            5,
-            16,
-            24,
-            6,
-            12,
-            11,
-            14,
-            23,
-            27,
-            20,
-            24,
-            23,
-            22,
-            0,
-            15,
-            26,
-            5,
-            9,
-            22,
-            25,
-            23,
-            17,
-            5,
-            21,
-            19,
-            25,
-            9,
-            27,
-            19,
-            7,
-            24,
-            3,
-            27,
-            27,
-            10,
-            12,
-            15,
-            13,
             4,
-            23,
             4,
-            25,
-            19,
             4,
-            19,
             4,
-            7,
-            9,
-            19,
-            16,
-            7,
-            20,
-            21,
-            12,
-            21,
-            19,
-            20,
-            21,
-            2,
-            20,
-            9,
-            6,
-            27,
-            9,
-            22,
-            23,
-            9,
-            7,
-            11,
-            27,
-            22,
-            27,
-            10,
-            27,
-            5,
-            25,
-            27,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
+            4,
             25,
-            12,
-            9,
-            22,
-            26,
-            17,
-            17,
-            26,
             22,
+            4,
             10,
-            1,
-            15,
-            12,
-            17,
-            25,
-            2,
-            26,
-            20,
             10,
-            21,
-            17,
-            9,
-            2,
-            24,
-            13,
-            13,
-            21,
-            11,
-            23,
-            14,
-            8,
-            24,
-            18,
-            20,
-            9,
-            25,
-            11,
-            18,
-            21,
-            2,
-            13,
-            2,
-            7,
-            12,
-            0,
             10,
-            17,
-            12,
-            17,
-            20,
-            5,
-            25,
-            2,
-            15,
-            21,
-            16,
-            8,
-            27,
-            24,
-            11,
-            24,
-            1,
-            6,
-            9,
-            7,
-            2,
-            26,
-            8,
-            26,
-            12,
-            16,
-            21,
-            21,
-            2,
-            6,
-            18,
             4,
-            21,
-            5,
-            10,
-            1,
-            19,
-            13,
-            19,
-            12,
-            21,
-            9,
-            21,
             19,
+            17,
+            3,
+            23,
             23,
-            4,
-            16,
             14,
-            18,
-            26,
-            0,
-            4,
+            14,
+            14,
+            14,
+            8,
             19,
-            11,
-            6,
-            0,
-            21,
-            23,
-            13,
             19,
-            14,
-            15,
-            16,
             24,
-            10,
-            12,
-            14,
-            23,
-            2,
-            16,
-            22,
-            10,
-            17,
-            7,
-            5,
-            25,
-            16,
-            6,
-            25,
-            20,
-            2,
-            3,
-            13,
-            3,
-            6,
-            25,
-            1,
-            10,
-            0,
-            11,
-            2,
             24,
-            0,
-            11,
-            25,
-            6,
-            10,
-            12,
-            15,
-            20,
-            2,
-            4,
             24,
-            13,
-            13,
-            8,
-            12,
-            4,
             24,
-            14,
-            21,
-            19,
-            20,
-            14,
-            2,
-            15,
-            7,
-            17,
-            16,
             24,
-            16,
-            14,
-            0,
-            26,
-            4,
-            1,
-            27,
-            2,
-            1,
-            13,
             24,
-            25,
-            4,
-            11,
-            25,
             24,
-            18,
-            25,
-            15,
             24,
-            15,
-            19,
-            26,
-            17,
-            26,
-            26,
-            10,
-            19,
-            17,
-            8,
-            20,
-            6,
-            6,
-            22,
-            13,
-            22,
-            0,
-            10,
             24,
-            5,
-            19,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            24,
+            2,
             2,
             16,
-            6,
-            19,
-            15,
-            20,
-            20,
-            7,
-            17,
-            23,
-            14,
-            4,
-            23,
-            3,
-            26,
-            25,
-            14,
-            26,
+            12,
+            12,
             18,
-            2,
-            23,
-            19,
-            8,
+            6,
             21,
-            3,
-            26,
-            1,
-            10,
-            11,
-            13,
-            8,
-            18,
-            10,
-            22,
-            27,
-            17,
-            20,
             21,
-            2,
             12,
             2,
-            3,
-            26,
-            10,
             2,
-            6,
-            24,
-            24,
-            26,
-            13,
-            8,
-            18,
-            13,
-            24,
-            18,
-            11,
-            12,
-            20,
-            14,
-            14,
-            21,
-            19,
-            4,
-            24,
+            0,
+            9,
             9,
-            24,
-            1,
-            5,
-            21,
-            23,
             15,
-            4,
-            8,
-            7,
-            7,
-            19,
-            11,
+            1,
+            3,
+            3,
+            22,
+            12,
             7,
-            10,
-            6,
-            15,
-            10,
-            15,
+            22,
             22,
             15,
-            18,
-            6,
-            5,
-            19,
-            1,
-            21,
+            15,
             20,
             2,
-            18,
-            1,
-            8,
             2,
-            27,
-            7,
-            20,
-            17,
-            0,
-            19,
-            13,
-            15,
-            4,
-            26,
-            11,
-            12,
-            17,
-            23,
-            7,
-            15,
-            8,
-            16,
-            8,
-            12,
             2,
-            19,
-            10,
-            24,
-            17,
-            11,
-            4,
-            26,
-            14,
-            7,
-            0,
-            22,
-            26,
-            11,
-            17,
-            26,
-            19,
-            16,
-            9,
-            11,
-            19,
-            24,
-            1,
-            7,
-            15,
             2,
-            5,
-            16,
-            21,
-            27,
-            22,
             2,
-            8,
-            17,
-            7,
             2,
-            20,
-            8,
-            20,
-            21,
-            13,
-            0,
-            21,
-            11,
-            9,
-            18,
-            13,
-            18,
-            5,
-            13,
-            25,
-            19,
-            6,
-            27,
-            15,
-            12,
             2,
             2,
-            5,
-            21,
-            5,
-            0,
-            18,
-            19,
-            24,
-            7,
-            18,
-            23,
-            15,
-            13,
-            3,
-            4,
-            1,
-            13,
-            19,
-            17,
-            26,
-            11,
-            0,
-            16,
-            25,
-            24,
-            11,
-            8,
-            11,
-            26,
-            5,
-            5,
             2,
-            0,
-            25,
             2,
-            27,
-            15,
-            18,
-            5,
-            18,
-            1,
-            9,
-            6,
-            5,
-            13,
-            5,
-            1,
-            18,
-            18,
-            25,
-            14,
-            10,
-            18,
-            27,
-            23,
-            21,
-            24,
-            13,
-            0,
-            14,
             2,
-            25,
-            25,
-            12,
-            16,
-            20,
-            1,
-            3,
-            1,
-            8,
-            3,
-            20,
             2,
-            9,
-            3,
-            0,
-            0,
-            14,
-            1,
-            26,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            2,
+            20,
             20,
-            18,
-            21,
-            19,
-            24,
-            11,
-            12,
-            18,
-            24,
-            13,
-            8,
-            6,
-            12,
-            27,
-            1,
-            26,
             20,
-            7,
-            7,
-            27,
-            14,
-            7,
-            17,
-            1,
-            15,
-            8,
-            10,
-            3,
-            27,
-            10,
-            10,
-            2,
-            12,
-            12,
             16,
-            3,
-            14,
-            0,
-            11,
-            1,
-            5,
-            12,
-            24,
-            0,
-            24,
-            17,
-            13,
             2,
-            19,
-            26,
-            17,
-            15,
-            8,
+            22,
             7,
-            6,
-            23,
+            16,
+            16,
+            16,
+            13,
+            13,
+            13,
+            21,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
             22,
-            1,
-            7,
-            5,
-            7,
-            25,
-            5,
-            20,
-            20,
-            15,
-            4,
-            18,
-            13,
-            21,
-            5,
-            19,
-            5,
-            1,
-            6,
-            27,
-            14,
-            24,
-            1,
-            26,
-            26,
-            2,
-            27,
-            13,
-            11,
-            7,
-            23,
-            27,
             22,
-            6,
-            10,
-            24,
-            1,
-            12,
-            24,
-            25,
-            20,
-            17,
-            6,
-            24,
-            12,
-            20,
-            8,
-            3,
             22,
-            9,
-            14,
-            8,
-            12,
-            21,
-            23,
-            15,
-            14,
             22,
-            27,
             22,
-            0,
-            4,
-            25,
-            6,
-            15,
-            13,
-            5,
-            11,
-            1,
-            26,
-            27,
-            12,
-            11,
-            11,
-            4,
-            19,
-            25,
-            10,
-            25,
-            12,
-            9,
-            12,
-            6,
-            11,
-            15,
-            13,
             22,
-            2,
-            4,
-            18,
-            14,
-            0,
-            5,
-            21,
-            17,
-            3,
             22,
-            11,
-            19,
-            4,
-            10,
-            0,
-            10,
-            14,
-            7,
-            7,
-            23,
-            25,
-            6,
-            3,
-            25,
-            0,
-            0,
-            5,
-            6,
-            20,
-            9,
-            23,
-            17,
-            5,
-            21,
-            4,
-            24,
-            7,
-            6,
-            1,
-            11,
-            24,
-            23,
-            4,
-            8,
-            7,
-            7,
             22,
-            19,
-            3,
-            0,
-            21,
-            25,
-            15,
-            8,
-            14,
-            20,
-            2,
-            27,
-            10,
-            5,
-            7,
             22,
             22,
-            19,
-            2,
-            20,
-            14,
-            18,
-            4,
-            21,
-            24,
-            6,
-            5,
-            9,
-            12,
-            26,
-            1,
-            6,
-            4,
-            10,
-            23,
-            24,
-            10,
-            13,
-            23,
-            25,
-            18,
-            13,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            22,
+            17,
             5,
-            3,
-            19,
-            0,
-            24,
-            15,
-            9,
-            23,
-            4,
             26,
-            10,
-            14,
             13,
             7,
-            20,
+            17,
             18,
+            2,
+            1,
             24,
-            0,
-            4,
-            10,
-            0,
-            25,
-            13,
-            19,
-            26,
-            7,
-            24,
-            27,
-            25,
-            20,
-            10,
-            18,
+            21,
+            3,
+            8,
             16,
-            23,
-            1,
-            17,
-            23,
-            27,
+            16,
+            26,
+            14,
+            14,
             5,
-            17,
-            8,
-            10,
             27,
-            9,
-            18,
-            2,
-            23,
-            1,
+            26,
+            14,
+            14,
             14,
-            3,
-            23,
-            7,
-            18,
-            21,
-            9,
-            15,
-            7,
-            0,
-            25,
-            10,
-            7,
-            22,
-            10,
-            10,
-            21,
             1,
             1,
-            14,
-            27,
-            25,
-            16,
-            4,
-            27,
-            15,
-            9,
-            10,
-            9,
+            1,
+            1,
+            13,
+            13,
             5,
+            12,
             14,
-            26,
-            7,
-            4,
-            18,
             6,
-            3,
-            8,
-            5,
             12,
-            16,
-            1,
-            26,
             12,
             9,
-            14,
-            7,
-            25,
-            26,
             9,
+            9,
+            14,
             19,
+            12,
+            18,
+            15,
+            10,
+            27,
+            27,
             9,
-            22,
-            16,
-            4,
-            21,
-            21,
+            18,
+            18,
+            18,
+            18,
+            18,
+            5,
+            5,
+            26,
+            26,
+            26,
+            26,
+            13,
             12,
-            8,
-            1,
-            3,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            12,
+            2,
+            2,
+            13,
+            13,
+            6,
+            2,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
             16,
-            0,
-            10,
             16,
-            26,
+            16,
+            6,
+            6,
+            0,
+            0,
+            13,
             24,
-            21,
-            26,
+            24,
+            19,
+            12,
+            12,
+            12,
             12,
-            18,
-            15,
-            7,
             12,
-            1,
             9,
-            1,
-            6,
-            16,
-            18,
-            7,
-            10,
-            24,
-            7,
-            20,
-            16,
+            9,
+            9,
+            9,
             14,
-            10,
-            18,
-            27,
-            20,
-            15,
-            23,
-            1,
-            26,
-            16,
-            12,
-            18,
-            5,
             14,
-            16,
+            14,
+            2,
+            15,
+            15,
             4,
             4,
-            25,
+            4,
+            22,
+            22,
+            5,
+            22,
+            22,
             12,
-            2,
+            25,
+            25,
+            25,
+            25,
+            6,
+            19,
+            19,
             9,
+            9,
+            4,
+            4,
             5,
-            0,
-            2,
-            13,
+            6,
+            6,
+            6,
             26,
-            14,
-            14,
-            5,
-            10,
-            22,
-            15,
-            0,
-            13,
-            27,
-            9,
             19,
-            16,
-            0,
             7,
-            15,
-            16,
-            18,
-            22,
-            8,
-            17,
-            26,
-            6,
-            21,
             11,
-            0,
-            26,
+            8,
+            8,
+            20,
+            24,
+            3,
+            3,
             18,
             5,
-            1,
-            8,
             3,
-            1,
-            16,
-            16,
-            9,
-            7,
-            13,
-            4,
-            16,
             3,
-            25,
-            0,
+            3,
+            18,
+            18,
+            17,
+            17,
+            16,
+            5,
             0,
             0,
-            27,
-            13,
             0,
-            11,
-            11,
-            22,
-            17,
-            5,
+            19,
+            19,
+            19,
+            4,
             27,
-            3,
-            14,
             26,
             26,
-            13,
-            10,
-            8,
-            10,
-            20,
-            27,
-            2,
-            13,
-            5,
-            25,
-            14,
-            27,
-            17,
-            8,
-            7,
-            24,
-            27,
-            24,
-            9,
-            27,
-            1,
-            5,
-            16,
-            11,
-            24,
-            2,
-            27,
-            11,
-            17,
-            3,
-            12,
-            20,
-            0,
-            9,
-            7,
-            14,
-            11,
-            22,
-            20,
             26,
-            6,
+            26,
+            26,
+            1,
+            1,
+            1,
+            1,
             1,
             21,
-            16,
-            18,
-            12,
-            23,
-            23,
-            22,
-            3,
             25,
-            21,
-            15,
-            10,
-            16,
-            18,
-            15,
-            27,
-            22,
-            22,
-            22,
-            7,
-            13,
-            27,
-            15,
-            16,
-            15,
-            10,
-            4,
-            1,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            25,
+            19,
             19,
-            24,
-            23,
             17,
-            26,
+            17,
             6,
-            22,
+            6,
+            11,
+            11,
+            11,
+            11,
+            11,
+            11,
             9,
-            19,
-            8,
-            4,
-            12,
-            12,
-            5,
-            10,
-            13,
-            4,
-            8,
-            7,
-            17,
             2,
-            17,
-            16,
-            15,
-            14,
-            19,
-            8,
             2,
+            2,
+            3,
             8,
-            27,
-            23,
-            25,
-            27,
-            24,
             17,
-            15,
-            13,
-            2,
-            18,
             6,
-            12,
-            11,
             4,
-            8,
-            12,
-            3,
-            5,
+            13,
+            10,
             10,
+            27,
+            27,
+            4,
+            4,
+            7,
+            7,
+            7,
+            24,
+            24,
+            24,
             8,
-            12,
+            8,
+            8,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            20,
+            11,
             15,
-            3,
             1,
-            27,
-            16,
-            10,
-            12,
-            0,
-            24,
-            26,
-            26,
-            26,
-            7,
-            11,
-            17,
             1,
-            11,
-            14,
-            18,
-            24,
-            5,
-            20,
-            13,
-            16,
-            12,
-            4,
-            10,
-            22,
-            21,
-            19,
-            24,
-            13,
-            18,
-            6,
-            11,
-            5,
-            12,
-            9,
-            23,
             1,
-            24,
             1,
-            8,
-            0,
-            14,
-            17,
-            11,
-            15,
-            26,
             1,
-            22,
-            27,
-            14,
-            5,
-            9,
-            4,
             1,
-            9,
-            17,
             1,
-            13,
-            24,
-            22,
-            26,
-            26,
-            19,
-            7,
-            14,
-            10,
-            15,
-            24,
-            4,
-            15,
-            7,
-            0,
-            13,
-            12,
-            26,
-            20,
-            27,
-            11,
-            21,
-            7,
-            14,
-            16,
             1,
-            21,
-            23,
-            12,
-            6,
-            6,
-            22,
-            10,
-            26,
-            8,
-            6,
-            25,
-            24,
-            19,
-            4,
-            0,
-            26,
-            22,
-            16,
-            8,
-            0,
-            18,
-            17,
-            16,
-            13,
-            21,
-            8,
-            10,
-            0,
-            0,
-            14,
-            10,
-            2,
-            18,
-            3,
-            27,
             1,
-            10,
-            6,
-            26,
-            4,
-            20,
-            24,
-            5,
-            2,
-            11,
-            12,
-            0,
-            26,
-            15,
-            20,
-            7,
-            13,
-            18,
-            3,
-            6,
-            23,
-            27,
-            3,
-            10,
-            16,
-            9,
-            11,
-            6,
-            6,
-            6,
-            11,
-            23,
-            22,
-            25,
-            18,
-            12,
-            0,
-            3,
-            15,
-            5,
-            7,
-            25,
-            18,
-            18,
-            18,
-            26,
-            22,
-            2,
-            24,
-            5,
-            19,
-            17,
-            21,
-            9,
-            26,
-            18,
-            26,
-            18,
-            2,
-            14,
-            3,
-            7,
-            14,
-            14,
-            11,
-            22,
-            25,
-            6,
-            19,
-            22,
-            14,
-            4,
-            20,
-            21,
-            2,
-            26,
-            7,
-            8,
-            18,
-            6,
-            13,
-            12,
-            6,
-            19,
-            10,
             1,
-            6,
             1,
             1,
-            26,
-            18,
             1,
-            23,
-            7,
-            11,
-            27,
-            19,
-            18,
-            13,
-            0,
-            16,
-            25,
-            9,
-            9,
-            22,
-            24,
-            25,
-            14,
-            18,
-            18,
-            23,
-            13,
-            15,
-            16,
-            26,
-            9,
-            19,
-            6,
-            23,
-            4,
-            12,
-            18,
-            22,
             1,
-            15,
-            23,
-            3,
-            5,
-            2,
-            17,
-            27,
-            9,
-            6,
-            10,
-            24,
-            5,
-            5,
-            19,
-            8,
             1,
-            27,
-            2,
-            20,
-            11,
-            7,
-            23,
-            27,
-            0,
-            12,
-            4,
-            3,
             1,
-            4,
-            6,
-            20,
-            26,
-            26,
-            0,
-            8,
-            3,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            1,
+            12,
+            12,
             10,
-            24,
-            19,
-            21,
-            17,
-            13,
-            25,
-            22,
-            22,
-            14,
-            25,
-            2,
-            7,
-            0,
-            5,
+            15,
             11,
-            25,
-            25,
-            21,
-            17,
-            1,
-            3,
-            22,
-            3,
-            0,
-            4,
-            7,
-            26,
             3,
-            12,
-            6,
             24,
-            21,
             24,
-            21,
-            27,
-            18,
-            17,
-            14,
             22,
-            6,
             22,
-            5,
-            3,
-            26,
-            8,
-            7,
-            7,
-            24,
-            9,
-            18,
-            1,
-            26,
+            22,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
             10,
-            1,
             10,
-            8,
-            11,
-            9,
-            11,
-            19,
-            22,
-            6,
-            20,
-            18,
-            20,
-            19,
-            13,
-            5,
-            22,
-            19,
-            2,
-            16,
-            16,
-            12,
-            0,
-            27,
-            12,
             10,
-            13,
-            7,
-            5,
-            9,
-            4,
-            9,
-            9,
-            22,
-            23,
-            26,
-            4,
-            18,
-            11,
-            4,
             10,
-            21,
-            12,
-            25,
-            8,
-            19,
-            7,
-            2,
-            17,
-            0,
-            4,
-            1,
-            27,
-            7,
-            3,
-            16,
-            26,
-            16,
-            4,
-            23,
-            12,
-            24,
-            25,
-            11,
-            19,
-            12,
-            12,
-            6,
-            22,
-            8,
-            3,
-            20,
-            21,
-            11,
-            5,
-            12,
-            2,
-            25,
             10,
-            6,
-            13,
-            12,
-            26,
-            16,
-            3,
-            18,
-            4,
-            24,
-            19,
-            5,
-            23,
-            13,
-            2,
-            16,
-            16,
-            1,
-            14,
-            0,
-            22,
-            2,
             10,
-            19,
-            2,
-            17,
-            3,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            10,
+            27,
+            27,
             8,
-            3,
             17,
-            14,
+            13,
+            8,
             8,
-            1,
-            14,
-            26,
-            6,
-            23,
-            21,
-            27,
-            12,
             8,
-            11,
-            14,
-            12,
-            6,
-            18,
-            25,
-            24,
-            6,
-            23,
-            0,
             13,
-            9,
-            22,
-            7,
-            24,
-            25,
-            18,
-            25,
-            25,
-            2,
-            19,
-            9,
+            13,
             25,
-            12,
-            16,
-            10,
             5,
-            3,
-            8,
-            0,
             5,
-            18,
+            16,
+            14,
+            4,
             4,
-            23,
-            17,
-            11,
-            21,
             0,
-            20,
-            9,
-            1,
             8,
-            7,
-            12,
+            14,
             25,
-            26,
-            2,
-            1,
-            7,
-            5,
+            3,
             9,
-            13,
             9,
-            13,
-            21,
-            19,
-            19,
-            18,
-            4,
-            27,
-            20,
-            10,
-            8,
-            6,
-            7,
-            10,
             26,
-            8,
-            11,
-            17,
-            18,
-            11,
-            11,
-            2,
-            1,
-            13,
-            21,
-            5,
-            7,
-            0,
-            16,
-            22,
-            17,
-            20,
-            9,
-            22,
-            17,
-            20,
-            25,
-            16,
-            15,
-            27,
-            17,
-            4,
-            22,
-            21,
-            11,
-            0,
-            15,
-            4,
-            6,
-            3,
             26,
-            15,
-            12,
-            9,
-            17,
             26,
-            17,
-            16,
-            25,
-            5,
-            2,
-            16,
-            16,
-            9,
-            18,
-            4,
-            14,
-            13,
-            4,
-            14,
             26,
             26,
-            2,
-            8,
-            24,
-            8,
-            9,
             26,
-            0,
-            18,
-            17,
-            23,
-            12,
-            5,
-            24,
-            19,
-            17,
-            11,
-            12,
-            0,
-            27,
-            11,
             26,
-            3,
-            15,
-            27,
             26,
-            4,
-            19,
-            18,
-            13,
-            27,
-            1,
-            1,
-            17,
-            24,
-            20,
-            17,
-            27,
-            9,
-            21,
-            11,
-            20,
-            5,
-            1,
-            15,
-            1,
-            4,
-            20,
-            2,
-            2,
-            5,
-            15,
-            8,
-            14,
-            8,
-            12,
-            4,
-            11,
-            2,
-            19,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            26,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
+            23,
             23,
-            13,
-            7,
-            12,
-            25,
-            25,
-            6,
-            1,
-            6,
-            25,
-            20,
-            0,
-            24,
-            14,
-            27,
-            9,
-            5,
-            22,
-            9,
-            5,
-            16,
             23,
-            0,
-            25,
-            14,
-            14,
             23,
-            1,
-            21,
             23,
-            12,
             23,
-            14,
-            16,
-            9,
-            24,
-            8,
-            17,
-            20,
-            11,
-            1,
-            1,
-            4,
-            17,
             23,
-            9,
-            3,
-            12,
-            3,
-            12,
-            10,
-            7,
-            10,
-            4,
-            10,
-            17,
-            2,
-            21,
-            8,
-            21,
-            24,
-            8,
-            18,
-            22,
-            8,
-            26,
-            7,
-            6,
-            2,
-            18,
-            10,
-            10,
-            11,
-            6,
-            4,
-            16,
-            17,
-            0,
-            21,
-            4,
-            27,
-            3,
-            1,
-            4,
-            8,
-            16,
-            27,
-            13,
-            17,
-            27,
-            7,
-            6,
-            2,
-            3,
-            24,
-            14,
-            15,
-            10,
-            16,
-            8,
-            19,
-            21,
-            12,
-            5,
-            2,
-            1,
-            6,
-            1,
-            7,
-            2,
-            3,
-            22,
-            21,
-            20,
-            3,
-            14,
-            19,
-            8,
-            10,
-            27,
-            18,
-            24,
-            7,
-            27,
-            19,
-            27,
-            15,
-            19,
-            3,
-            2,
-            10,
-            0,
-            13,
             23,
-            10,
-            15,
-            8,
-            15,
-            21,
-            26,
-            12,
-            15,
-            3,
-            12,
-            9,
-            3,
-            3,
             23,
             16,
-            19,
-            4,
-            18,
-            6,
-            20,
-            25,
-            10,
-            27,
-            3,
-            27,
-            9,
-            13,
-            24,
-            25,
-            13,
-            17,
-            13,
-            27,
-            11,
-            13,
-            0,
-            14,
-            13,
-            1,
-            1,
-            19,
-            17,
-            26,
-            13,
-            24,
-            20,
-            5,
-            8,
-            10,
-            3,
-            13,
-            16,
-            5,
-            18,
-            1,
-            22,
-            2,
-            2,
-            0,
-            25,
             6,
-            20,
-            2,
-            17,
-            10,
-            24,
+            4,
             27,
-            19,
-            0,
-            8,
-            13,
-            19,
-            8,
-            6,
-            3,
-            19,
             12,
-            20,
-            7,
-            17,
-            25,
-            17,
-            19,
-            1,
-            9,
-            4,
-            4,
             12,
+            15,
+            15,
             10,
-            17,
-            14,
-            16,
-            20,
-            1,
-            25,
-            17,
-            5,
-            11,
-            12,
-            17,
-            19,
-            5,
             7,
-            27,
-            6,
-            18,
-            16,
-            26,
-            27,
-            17,
-            9,
-            0,
-            18,
-            9,
-            12,
-            0,
-            27,
-            26,
-            21,
-            11,
-            3,
-            5,
-            16,
-            26,
-            15,
-            5,
-            21,
-            16,
-            12,
-            13,
-            13,
-            21,
-            0,
-            23,
-            13,
-            6,
-            2,
-            4,
-            13,
-            14,
-            17,
-            8,
-            21,
-            11,
-            3,
-            4,
-            3,
-            20,
-            11,
-            5,
-            23,
-            3,
-            14,
-            6,
             7,
-            17,
-            0,
-            21,
-            11,
-            14,
-            1,
-            4,
-            22,
-            2,
-            16,
-            3,
-            17,
-            0,
-            4,
-            1,
-            15,
-            12,
-            6,
             7,
-            10,
-            19,
-            22,
-            13,
-            26,
-            14,
-            20,
-            18,
-            17,
-            17,
-            11,
-            15,
-            11,
-            20,
-            8,
             7,
-            16,
-            24,
-            1,
-            13,
-            8,
-            12,
-            5,
-            8,
-            25,
-            12,
-            4,
-            24,
-            19,
-            22,
-            18,
-            23,
-            21,
             7,
-            4,
-            22,
-            24,
-            22,
-            17,
-            20,
-            2,
-            19,
-            8,
-            8,
-            27,
-            9,
-            0,
-            11,
-            10,
-            19,
-            10,
-            0,
-            0,
-            11,
-            6,
-            3,
-            13,
-            13,
-            26,
-            12,
-            15,
-            13,
-            14,
-            10,
-            27,
-            13,
             7,
-            24,
-            6,
-            1,
-            3,
-            6,
-            24,
-            2,
-            22,
-            23,
-            9,
-            10,
-            27,
-            16,
-            23,
-            0,
-            21,
             7,
-            15,
-            20,
-            9,
-            18,
-            19,
-            17,
-            11,
-            0,
-            6,
-            4,
-            8,
-            18,
             7,
-            6,
-            25,
-            11,
-            21,
-            21,
-            16,
-            2,
-            27,
-            19,
-            17,
-            20,
-            18,
-            24,
-            15,
-            22,
-            20,
-            11,
-            5,
-            21,
-            21,
-            12,
-            11,
-            23,
-            11,
-            27,
             7,
-            0,
-            4,
-            4,
-            10,
-            15,
-            19,
-            14,
-            2,
-            5,
-            4,
-            21,
-            11,
-            1,
-            27,
-            8,
             7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            7,
+            4,
+            16,
             16,
-            19,
-            17,
-            18,
-            5,
-            17,
-            22,
-            18,
-            3,
-            9,
-            24,
             23,
-            10,
-            20,
-            22,
             0,
-            8,
-            8,
-            2,
-            25,
-            23,
-            15,
-            22,
-            15,
-            25,
-            17,
-            19,
-            20,
-            27,
-            26,
-            20,
             9,
-            23,
-            13,
-            20,
-            17,
-            27,
             27,
-            5,
-            16,
-            14,
-            13,
             11,
-            3,
-            20,
-            20,
-            24,
-            25,
-            25,
+            11,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
+            19,
             14,
-            18,
-            20,
-            12,
             5,
-            2,
-            4,
-            2,
-            8,
-            16,
-            15,
-            12,
-            10,
-            13,
-            0,
-            12,
-            13,
-            4,
-            7,
-            14,
-            23,
-            10,
-            11,
-            6,
-            27,
-            16,
-            16,
-            20,
-            15,
-            4,
-            4,
-            7,
-            22,
+            17,
+            17,
             1,
-            3,
-            14,
-            9,
-            7,
-            3,
-            18,
-            0,
-            8,
-            27,
-            9,
-            18,
-            21,
-            9,
-            26,
-            6,
-            22,
-            19,
             25,
-            18,
-            14,
-            5,
-            9,
-            18,
-            15,
-            18,
-            24,
-            9,
-            9,
+            7,
             2,
-            13,
-            19,
-            21,
-            3,
-            14,
-            5,
-            27,
-            6,
-            14,
-            0,
-            8,
-            12,
-            23,
-            13,
-            24,
-            3,
-            19,
-            24,
-            10,
-            27,
-            22,
-            14,
             23,
-            0,
             1,
-            3,
-            18,
-            5,
+            1,
+            1,
+            1,
+            1,
             22,
-            10,
-            8,
-            5,
             22,
-            4,
-            2,
-            3,
-            7,
-            15,
-            27,
-            18,
-            9,
-            14,
-            5,
-            13,
-            17,
+            24,
             14,
-            11,
+            0,
             22,
-            6,
             27,
-            13,
-            7,
-            11,
-            24,
-            15,
-            17,
-            12,
-            9,
-            20,
-            6,
-            23,
-            17,
-            15,
+            2,
+            2,
+            2,
             6,
-            18,
-            20,
-            25,
             0,
-            22,
-            11,
             17,
-            11,
-            7,
-            10,
-            1,
-            3,
-            0,
-            6,
-            4,
-            10,
-            2,
-            25,
             17,
-            1,
-            26,
-            18,
             17,
-            6,
-            26,
-            20,
-            18,
-            7,
-            19,
-            14,
-            5,
-            22,
-            10,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
+            17,
             22,
             22,
-            27,
-            10,
             0,
-            4,
             16,
-            10,
+            16,
             1,
-            21,
-            15,
-            14,
-            22,
-            26,
-            10,
-            23,
-            20,
-            9,
-            18,
             27,
-            0,
-            7,
-            26,
-            23,
-            21,
+            2,
+            24,
+            24,
+            6,
+            6,
             18,
-            25,
-            25,
             1,
-            9,
+            1,
+            24,
+            24,
+            18,
             18,
-            9,
-            11,
-            22,
-            16,
-            26,
-            21,
-            15,
-            7,
-            15,
-            6,
-            4,
             19,
-            2,
-            14,
+            19,
+            7,
+            20,
+            3,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
+            13,
             17,
-            6,
-            22,
-            27,
+            17,
+            20,
+            20,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
+            8,
             8,
-            18,
-            7,
-            14,
-            20,
-            11,
-            25,
-            23,
-            10,
-            26,
-            4,
-            3,
-            6,
-            1,
-            15,
-            27,
-            23,
-            9,
-            10,
-            9,
-            5,
             8,
-            15,
-            4,
-            10,
             3,
-            17,
-            15,
-            2,
-            4,
-            11,
-            12,
-            10,
-            26,
-            17,
             0,
-            13,
-            1,
-            8,
-            27,
-            2,
-            20,
             0,
-            13,
-            8,
-            1,
-            25,
-            17,
+            24,
+            19,
+            19,
+            24,
             10,
-            0,
             10,
+            8,
+            24,
+            24,
+            24,
+            26,
+            26,
+            12,
+            12,
+            26,
+            11,
+            11,
+            5,
+            5,
             15,
             21,
-            0,
-            9,
-            23,
-            11,
-            12,
-            17,
-            2,
             19,
-            23,
-            13,
-            5,
-            18,
-            18,
+            19,
+            0,
+            0,
+            15,
+            15,
+            15,
             1,
-            20,
-            8,
             1,
-            8,
-            25,
-            7,
-            6,
-            14,
-            2,
-            5,
-            26,
             10,
-            7,
-            14,
-            2,
-            11,
-            12,
+            17,
+            10,
+            26,
+            26,
+            26,
+            21,
+            21,
+            3,
+            19,
             22,
-            15,
-            1,
-            15,
-            24,
-            15,
+            22,
+            17,
+            17,
+            17,
             8,
             5,
-            26,
-            10,
-            17,
-            25,
-            16,
-            13,
-            14,
-            4,
+            5,
+            6,
+            6,
             8,
-            27,
-            1,
-            16,
-            4,
-            21,
-            23,
-            9,
-            7,
+            22,
             9,
-            6,
-            7,
+            18,
             24,
-            17,
             15,
-            17,
-            12,
-            6,
+            25,
             16,
-            7,
-            19,
-            26,
-            21,
-            20,
+            17,
             26,
-            13,
-            14,
-            2,
             1,
-            2,
-            11,
             5,
+            12,
+            12,
+            3,
+            3,
+            7,
+            7,
             13,
-            27,
+            13,
+            13,
+            14,
+            15,
+            15,
+            24,
+            24,
+            14,
+            14,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
+            3,
             3,
-            8,
-            24,
-            0,
-            24,
-            19,
-            9,
-            2,
-            21,
-            9,
-            10,
-            12,
-            15,
-            14,
-            17,
-            17,
-            0,
-            25,
-            14,
-            6,
-            21,
-            24,
-            21,
             3,
-            5,
-            19,
-            26,
-            19,
-            0,
-            9,
-            12,
-            14,
-            5,
-            7,
-            11,
             20,
-            7,
-            8,
-            18,
-            10,
-            11,
+            26,
+            26,
             6,
             17,
-            15,
-            24,
-            26,
+            19,
+            21,
+            21,
             18,
-            0,
-            13,
-            17,
-            2,
-            3,
-            6,
             18,
-            11,
-            8,
-            26,
-            11,
-            14,
-            26,
-            14,
             18,
-            11,
-            27,
-            4,
-            15,
-            10,
-            23,
-            13,
-            17,
-            20,
-            1,
-            26,
-            3,
-            1,
-            19,
-            6,
-            7,
-            3,
-            11,
-            22,
-            23,
             18,
-            26,
-            27,
-            5,
-            15,
-            23,
-            11,
-            5,
-            0,
-            19,
-            17,
             18,
-            21,
-            10,
-            9,
-            27,
-            5,
-            24,
-            12,
-            8,
-            9,
-            26,
             18,
             18,
-            21,
-            5,
-            15,
-            15,
-            10,
-            10,
-            12,
-            12,
-            10,
-            0,
-            23,
-            12,
-            25,
-            22,
-            14,
-            1,
-            12,
-            7,
-            14,
-            26,
-            25,
-            0,
-            16,
-            13,
-            22,
-            2,
-            15,
-            22,
-            17,
-            2,
-            16,
-            8,
-            7,
-            16,
-            20,
-            12,
-            26,
-            7,
-            8,
-            2,
-            17,
-            5,
-            7,
-            21,
-            19,
-            2,
-            1,
-            14,
-            27,
             18,
-            4,
-            5,
-            14,
-            23,
-            27,
-            26,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            18,
+            15,
+            15,
             16,
-            26,
-            19,
-            22,
-            25,
             0,
-            25,
+            23,
             11,
-            26,
-            3,
-            13,
-            1,
-            1,
-            24,
-            26,
             7,
-            6,
-            14,
-            24,
-            26,
-            24,
-            16,
-            26,
-            0,
-            16,
-            26,
-            18,
-            22,
-            21,
             7,
-            6,
+            7,
+            7,
             1,
-            5,
-            14,
-            18,
-            26,
-            19,
-            6,
-            12,
+            23,
             7,
-            24,
-            15,
-            16,
-            20,
-            9,
-            3,
-            19,
+            8,
             18,
-            0,
-            6,
-            3,
-            9,
-            21,
-            10,
-            24,
-            13,
+            27,
             8,
-            5,
             12,
-            2,
-            1,
-            20,
-            10,
-            24,
-            3,
-            25,
-            1,
-            11,
-            22,
             12,
-            5,
-            8,
-            21,
-            4,
-            10,
-            26,
-            17,
             12,
-            19,
-            3,
             16,
-            4,
-            15,
-            6,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            16,
+            23,
+            21,
+            21,
             22,
-            14,
-            3,
-            3,
-            10,
+            22,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
+            27,
             27,
-            6,
-            14,
-            18,
-            4,
-            6,
-            14,
-            11,
-            21,
-            4,
-            1,
-            10,
-            20,
-            5,
-            9,
-            26,
-            26,
-            3,
-            8,
-            15,
             27,
-            1,
-            16,
-            19,
-            15,
-            11,
-            2,
-            5,
-            6,
-            9,
-            22,
-            12,
-            25,
-            12,
-            22,
-            7,
-            10,
-            14,
-            13,
-            1,
-            18,
-            2,
-            19,
-            0,
-            20,
-            3,
-            14,
-            13,
-            0,
-            1,
-            21,
-            0,
-            15,
             27,
-            17,
-            8,
-            23,
-            14,
-            11,
-            6,
-            5,
-            26,
-            26,
-            1,
-            15,
-            21,
-            2,
-            0,
-            9,
-            19,
-            2,
             27,
-            6,
-            15,
-            24,
-            17,
-            23,
-            15,
-            16,
             0,
-            23,
-            24,
-            9,
-            9,
-            8,
-            9,
-            9,
-            12,
-            18,
-            13,
-            8,
-            24,
-            4,
-            14,
-            21,
-            11,
+            7,
             17,
-            12,
-            8,
-            5,
-            19,
-            25,
-            22,
+            1,
+            1,
+            1,
             13,
-            26,
-            22,
             13,
-            16,
-            11,
-            0,
-            7,
-            17,
-            10,
-            16,
-            21,
-            9,
-            0,
-            21,
-            22,
             26,
-            2,
-            15,
-            25,
             26,
             3,
             16,
-            9,
-            14,
-            0,
-            26,
-            9,
-            24,
-            13,
             16,
-            0,
-            25,
-            18,
-            17,
-            17,
-            13,
-            27,
-            10,
-            13,
-            10,
-            0,
-            13,
-            0,
             14,
-            6,
-            22,
-            3,
-            9,
-            15,
-            4,
-            16,
-            2,
-            4,
-            23,
-            22,
-            18,
-            23,
-            15,
-            1,
-            4,
-            18,
-            11,
-            24,
-            6,
-            27,
-            12,
-            11,
-            1,
-            11,
-            5,
-            1,
-            4,
-            5,
-            1,
-            5,
-            9,
-            8,
-            1,
-            2,
-            8,
-            10,
-            22,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
+            14,
             23,
-            20,
-            26,
-            3,
-            13,
-            26,
-            12,
-            2,
-            26,
-            9,
-            13,
-            8,
-            1,
-            17,
-            3,
             0,
-            8,
-            24,
-            25,
+            14,
+            14,
+            14,
+            14,
             3,
-            20,
-            19,
-            17,
-            4,
-            26,
-            1,
-            21,
-            8,
-            0,
-            7,
-            17,
-            24,
-            0,
-            23,
-            1,
-            5,
-            6,
-            6,
-            2,
             27,
-            25,
-            26,
-            23,
-            4,
-            11,
             3,
-            9,
-            8,
-            11,
-            26,
-            4,
-            21,
-            6,
             10,
-            15,
-            22,
-            6,
-            14,
+            10,
+            10,
             5,
-            26,
-            22,
-            20,
-            20,
+            5,
+            5,
+            11,
+            11,
             3,
-            24,
-            15,
             0,
-            19,
+            26,
             15,
-            22,
-            27,
-            2,
-            17,
-            22,
-            8,
-            2,
-            18,
             15,
-            19,
+            7,
+            25,
+            25,
             8,
-            12,
             6,
-            5,
-            17,
-            3,
-            5,
             6,
-            8,
             10,
-            16,
-            6,
-            5,
-            16,
-            20,
-            9,
-            17,
-            5,
-            3,
-            9,
-            18,
-            2,
-            4,
-            18,
-            5,
-            7,
-            7,
-            15,
             10,
-            20,
-            4,
-            24,
-            20,
+            22,
+            22,
             4,
-            13,
             1,
-            8,
-            6,
-            26,
-            6,
-            11,
-            11,
-            24,
-            4,
-            14,
-            4,
-            3,
-            26,
-            7,
+            1,
             19,
-            11,
-            6,
-            0,
             17,
-            25,
-            12,
-            24,
-            25,
-            3,
-            5,
-            15,
-            5,
-            25,
-            2,
             17,
+            17,
+            17,
+            7,
+            1,
             1,
-            16,
-            25,
-            25,
-            21,
-            13,
             15,
             25,
-            5,
-            0,
-            25,
-            4,
             25,
-            24,
-            6,
-            2,
-            17,
-            0,
             8,
             10,
-            25,
-            12,
-            9,
-            11,
-            13,
-            7,
-            26,
-            23,
-            8,
-            3,
-            1,
-            26,
-            8,
-            22,
-            15,
-            21,
-            25,
-            27,
-            21,
-            21,
-            13,
-            3,
-            9,
-            19,
-            12,
-            27,
-            12,
-            9,
-            5,
-            1,
-            19,
             21,
-            23,
-            20,
-            24,
-            6,
-            1,
-            3,
-            12,
-            2,
-            22,
-            27,
-            13,
-            22,
-            5,
-            1,
-            20,
-            6,
-            8,
-            12,
-            5,
-            27,
-            6,
-            1,
-            1,
-            0,
-            13,
-            22,
-            8,
             21,
-            27,
-            19,
-            26,
-            22,
-            22,
-            4,
-            1,
-            0,
-            26,
-            24,
-            14,
+            10,
+            10,
+            11,
+            11,
+            11,
             11,
-            0,
-            4,
-            19,
-            3,
-            7,
-            13,
-            23,
             9,
-            26,
-            13,
-            10,
         ],
         "regression_line": {
-            "coefficient": 0.7942363125434776,
-            "intercept": 2.8227418911402906,
+            "coefficient": 0.7942363125434777,
+            "intercept": 2.8227418911402893,
         },
     },
 }
@@ -0,0 +1,112 @@
+import pytest
+from pyspark.sql.types import (
+    DoubleType,
+    IntegerType,
+    StringType,
+    StructField,
+    StructType,
+)
+
+from utils.models import CsvReadMode, DatasetFormat
+from utils.spark import (
+    apply_schema_to_dataframe,
+    class_index_map,
+    corrupt_record_column,
+    count_corrupt_records,
+    index_classes,
+    read_dataset,
+)
+
+schema = StructType(
+    [
+        StructField("num", IntegerType()),
+        StructField("cat", StringType()),
+        StructField("missing", DoubleType()),
+    ]
+)
+
+
+def test_read_dataset_formats(spark_fixture, tmp_path):
+    dataframe = spark_fixture.createDataFrame(
+        [(1, "a", 0.5), (2, "b", 1.5)], ["num", "cat", "ignored"]
+    )
+    dataframe.write.csv(f"{tmp_path}/csv", header=True)
+    dataframe.write.parquet(f"{tmp_path}/parquet")
+    dataframe.write.orc(f"{tmp_path}/orc")
+
+    for dataset_format in DatasetFormat:
+        result = read_dataset(
+            spark_fixture, f"{tmp_path}/{dataset_format.value}", dataset_format, schema
+        )
+
+        assert result.columns == ["num", "cat"]
+        assert sorted((int(row["num"]), row["cat"]) for row in result.collect()) == [
+            (1, "a"),
+            (2, "b"),
+        ]
+
+
+def test_apply_schema_to_dataframe(spark_fixture):
+    dataframe = spark_fixture.createDataFrame(
+        [("ignored", "1", "a")], ["ignored", "num", "cat"]
+    )
+
+    result = apply_schema_to_dataframe(dataframe, schema)
+
+    assert result.columns == ["ignored", "num", "cat"]
+    assert result.schema["num"].dataType == IntegerType()
+    assert result.collect()[0]["num"] == 1
+
+
+def test_read_csv_permissive(spark_fixture, tmp_path):
+    # header order differs from the schema one
+    (tmp_path / "dataset.csv").write_text("cat,ignored,num\na,x,1\nb,y,not_a_number\n")
+
+    result = read_dataset(
+        spark_fixture,
+        f"{tmp_path}/dataset.csv",
+        DatasetFormat.CSV,
+        schema,
+        CsvReadMode.PERMISSIVE,
+    )
+
+    assert result.columns == ["num", "cat", corrupt_record_column]
+    assert result.schema["num"].dataType == IntegerType()
+    assert sorted(result.select("num", "cat").collect(), key=lambda r: r["cat"]) == [
+        (1, "a"),
+        (None, "b"),
+    ]
+    assert count_corrupt_records(result) == 1
+
+
+def test_read_csv_failfast(spark_fixture, tmp_path):
+    (tmp_path / "dataset.csv").write_text("num,cat\n1,a\nnot_a_number,b\n")
+
+    result = read_dataset(
+        spark_fixture,
+        f"{tmp_path}/dataset.csv",
+        DatasetFormat.CSV,
+        schema,
+        CsvReadMode.FAILFAST,
+    )
+
+    with pytest.raises(Exception):
+        result.collect()
+
+
+def test_index_classes(spark_fixture):
+    dataframe = spark_fixture.createDataFrame(
+        [("b", "a"), ("c", "b"), (None, "a"), ("a", "d")], ["prediction", "target"]
+    )
+
+    index_map = class_index_map(dataframe, ["prediction", "target"])
+    indexed = index_classes(
+        dataframe, ["prediction", "target"], {"a": 0.0, "b": 1.0, "c": 2.0}
+    )
+
+    assert index_map == {"a": 0.0, "b": 1.0, "c": 2.0, "d": 3.0}
+    assert [tuple(row) for row in indexed.collect()] == [
+        ("b", "a", 1.0, 0.0),
+        ("c", "b", 2.0, 1.0),
+    ]
+    assert indexed.columns[2:] == ["rbit_spark_prediction-idx", "rbit_spark_target-idx"]
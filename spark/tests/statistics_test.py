@@ -0,0 +1,33 @@
+import pytest
+
+from metrics.statistics import count_duplicate_rows
+from utils.models import DuplicateRowsMode
+
+
+@pytest.mark.parametrize("mode", list(DuplicateRowsMode))
+def test_count_duplicate_rows(spark_fixture, mode):
+    dataframe = spark_fixture.createDataFrame(
+        [
+            ("2024-01-01", "a", 1.0),
+            ("2024-01-02", "a", 1.0),
+            ("2024-01-03", "a", 1.0),
+            ("2024-01-04", "b", None),
+            ("2024-01-05", "b", None),
+            ("2024-01-06", None, 2.0),
+            ("2024-01-07", "c", float("nan")),
+            ("2024-01-08", "c", float("nan")),
+        ],
+        ["datetime", "cat", "num"],
+    )
+
+    assert count_duplicate_rows(dataframe, ["cat", "num"], 8, mode) == 4
+    # a null is not the same as a missing column
+    assert (
+        count_duplicate_rows(
+            spark_fixture.createDataFrame([("a", None), (None, "a")], ["x", "y"]),
+            ["x", "y"],
+            2,
+            mode,
+        )
+        == 0
+    )
@@ -0,0 +1,110 @@
+import datetime
+import shutil
+import uuid
+
+import orjson
+import pytest
+
+from streaming_job import main
+from utils.models import (
+    ColumnDefinition,
+    DataType,
+    FieldTypes,
+    Granularity,
+    ModelOut,
+    ModelType,
+    OutputType,
+    SupportedTypes,
+)
+
+
+@pytest.fixture()
+def model():
+    prediction = ColumnDefinition(
+        name="prediction", type=SupportedTypes.string, field_type=FieldTypes.categorical
+    )
+    yield ModelOut(
+        uuid=uuid.uuid4(),
+        name="model",
+        description="description",
+        model_type=ModelType.MULTI_CLASS,
+        data_type=DataType.TABULAR,
+        timestamp=ColumnDefinition(
+            name="datetime",
+            type=SupportedTypes.datetime,
+            field_type=FieldTypes.datetime,
+        ),
+        granularity=Granularity.HOUR,
+        outputs=OutputType(prediction=prediction, output=[prediction]),
+        target=ColumnDefinition(
+            name="target",
+            type=SupportedTypes.string,
+            field_type=FieldTypes.categorical,
+        ),
+        features=[
+            ColumnDefinition(
+                name="cat1",
+                type=SupportedTypes.string,
+                field_type=FieldTypes.categorical,
+            ),
+            ColumnDefinition(
+                name="cat2",
+                type=SupportedTypes.string,
+                field_type=FieldTypes.categorical,
+            ),
+            ColumnDefinition(
+                name="num1", type=SupportedTypes.float, field_type=FieldTypes.numerical
+            ),
+            ColumnDefinition(
+                name="num2", type=SupportedTypes.float, field_type=FieldTypes.numerical
+            ),
+        ],
+        frameworks="framework",
+        algorithm="algorithm",
+        created_at=str(datetime.datetime.now()),
+        updated_at=str(datetime.datetime.now()),
+    )
+
+
+def test_streaming_metrics_over_directory(
+    spark_fixture, test_data_dir, model, tmp_path, monkeypatch
+):
+    # the job configures S3 from the environment
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY", "AWS_REGION"):
+        monkeypatch.setenv(name, "test")
+    current_directory = tmp_path / "current"
+    current_directory.mkdir()
+    reference_path = tmp_path / "reference.csv"
+    shutil.copy(
+        f"{test_data_dir}/reference/multiclass/dataset_target_string.csv",
+        reference_path,
+    )
+    current_uuid = str(uuid.uuid4())
+    records = []
+
+    def run():
+        main(
+            spark_fixture,
+            model,
+            str(current_directory),
+            current_uuid,
+            str(reference_path),
+            "current_dataset_metrics",
+            str(tmp_path / "checkpoint"),
+            write_record=records.append,
+        )
+
+    for i in range(2):
+        shutil.copy(
+            f"{test_data_dir}/current/multiclass/dataset_target_string.csv",
+            current_directory / f"current_{i}.csv",
+        )
+        # the second run goes on from the checkpoint, with the new file only
+        run()
+        statistics = orjson.loads(records[-1]["STATISTICS"])
+        assert statistics["n_observations"] == 10 * (i + 1)
+        assert records[-1]["CURRENT_UUID"] == current_uuid
+
+    assert len(records) == 2
+    model_quality = orjson.loads(records[-1]["MODEL_QUALITY"])
+    assert model_quality["classes"] == ["HEALTHY", "ORPHAN", "UNHEALTHY", "UNKNOWN"]
@@ -5,6 +5,8 @@ const columns = [
     title: 'Name',
     key: 'name',
     dataIndex: 'name',
+    // categories over the top k are summed in the category without name
+    render: (name) => name ?? 'Other categories',
   },
   {
     title: 'Count',